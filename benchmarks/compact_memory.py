@@ -0,0 +1,87 @@
+"""Память на один объект Message: датакласс против компактного представления
+
+python -m benchmarks.compact_memory
+"""
+import copy
+import gc
+import tracemalloc
+
+from telegram.types.message import Message
+
+COUNT = 5000
+
+message_raw = {
+    '@type': 'message',
+    'id': 166121701376,
+    'sender_id': {'@type': 'messageSenderUser', 'user_id': 1394101816},
+    'chat_id': -1001236427904,
+    'is_outgoing': False,
+    'is_pinned': False,
+    'can_be_edited': False,
+    'can_be_forwarded': True,
+    'can_be_saved': True,
+    'can_be_deleted_only_for_self': False,
+    'can_be_deleted_for_all_users': False,
+    'can_get_statistics': False,
+    'can_get_message_thread': True,
+    'is_channel_post': False,
+    'contains_unread_mention': False,
+    'date': 1636692739,
+    'edit_date': 0,
+    'message_thread_id': 0,
+    'via_bot_user_id': 0,
+    'author_signature': '',
+    'media_album_id': '0',
+    'restriction_reason': '',
+    'content': {
+        '@type': 'messageText',
+        'text': {
+            '@type': 'formattedText',
+            'text': 'Hello, @telegram! https://telegram.org',
+            'entities': [
+                {
+                    '@type': 'textEntity',
+                    'offset': 7,
+                    'length': 9,
+                    'type': {'@type': 'textEntityTypeMention'},
+                },
+                {
+                    '@type': 'textEntity',
+                    'offset': 18,
+                    'length': 20,
+                    'type': {'@type': 'textEntityTypeUrl'},
+                },
+            ],
+        },
+    },
+}
+
+
+def measure(factory, count=COUNT):
+    """Средний прирост памяти на один созданный объект, в байтах"""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (current - start) // count
+
+
+def main():
+    results = {
+        'raw dict only': measure(lambda: copy.deepcopy(message_raw)),
+        'Message': measure(lambda: Message(copy.deepcopy(message_raw))),
+        'compact': measure(lambda: Message(copy.deepcopy(message_raw)).compact()),
+        'compact, drop_raw': measure(
+            lambda: Message(copy.deepcopy(message_raw)).compact(drop_raw=True)
+        ),
+    }
+    for name, size in results.items():
+        print(f'{name:<20} {size:>8} bytes/object')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,26 +1,129 @@
+import asyncio
+import itertools
 import os
-from typing import TYPE_CHECKING, List, Optional, Union
-
-from .types.message import ReactionType
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .batcher import MessageBatcher
+from .cache import AsyncTTLCache
+from .checkpoint import FileCheckpoint
+from .ratelimit import RequestScheduler, parse_retry_after
+from .storage import BASIC_GROUPS, CHATS, SUPERGROUPS, USERS
+from .tracker import SentMessage
+from .types.message import Message, ReactionType
 from .types.supergroup import SupergroupMembersFilter
 from .types.text import TextParseMode
+from .utils import Result, bounded_as_completed
 
 if TYPE_CHECKING:
     from .client import AsyncTelegram
 
+# обновление полной информации -> (метод, поле с id)
+FULL_INFO_UPDATES = {
+    'updateSupergroupFullInfo': ('getSupergroupFullInfo', 'supergroup_id'),
+    'updateBasicGroupFullInfo': ('getBasicGroupFullInfo', 'basic_group_id'),
+    'updateUserFullInfo': ('getUserFullInfo', 'user_id'),
+}
+
+# идемпотентные методы, одинаковые запросы которых объединяются
+SINGLEFLIGHT_METHODS = (
+    'getMe',
+    'getChat',
+    'getUser',
+    'getSupergroup',
+    'getBasicGroup',
+    'getUserFullInfo',
+    'getSupergroupFullInfo',
+    'getBasicGroupFullInfo',
+    'getMessage',
+    'searchPublicChat',
+)
+
 
 class BaseAPI:
-    """Базовый класс API хелпера для телеграм клиента"""
+    """Базовый класс API хелпера для телеграм клиента
+
+    Если передан scheduler, запросы отправляются через него
+    с учетом лимитов и повторами после ошибки 429
+
+    Одинаковые запросы методов из singleflight_methods, отправленные,
+    пока первый из них ждет ответа, не отправляются повторно:
+    все вызывающие получают один общий Result
+    """
 
-    def __init__(self, client: 'AsyncTelegram', timeout=30):
+    def __init__(
+        self,
+        client: 'AsyncTelegram',
+        timeout=30,
+        scheduler: Optional[RequestScheduler] = None,
+        singleflight_methods: Iterable[str] = (),
+    ):
         self.client = client
         self.timeout = timeout
+        self.scheduler = scheduler
+        self.singleflight_methods = frozenset(singleflight_methods)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
 
     def send_data(self, method, request_id=None, timeout=None, **kwargs):
         """Асинхронный вызов метода"""
         timeout = timeout or self.timeout
         kwargs['@type'] = method
-        return self.client.send_data(kwargs, request_id=request_id, timeout=timeout)
+        if request_id is None and method in self.singleflight_methods:
+            key = _request_key(kwargs)
+            if key is not None:
+                return self._send_shared(key, method, timeout, kwargs)
+
+        return self._send_data(method, request_id, timeout, kwargs)
+
+    def _send_data(self, method, request_id, timeout, kwargs):
+        if self.scheduler is None:
+            return self.client.send_data(kwargs, request_id=request_id, timeout=timeout)
+
+        attempts = itertools.count()
+
+        def send():
+            if next(attempts) == 0:
+                return self.client.send_data(
+                    kwargs, request_id=request_id, timeout=timeout
+                )
+            # повтор после 429 - новый запрос tdlib со своим request_id
+            data = {**kwargs, '@extra': dict(kwargs.get('@extra') or {})}
+            data['@extra'].pop('request_id', None)
+            return self.client.send_data(data, timeout=timeout)
+
+        return self.scheduler.send(method, kwargs.get('chat_id'), send)
+
+    async def _send_shared(self, key: Hashable, method, timeout, kwargs) -> Result:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._send_data(method, None, timeout, kwargs)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._discard_inflight(key, f))
+        else:
+            self.coalesced += 1
+
+        # отмена одного из ожидающих не должна отменять общий запрос
+        return await asyncio.shield(future)
+
+    def _discard_inflight(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
 
     def send_data_sync(self, method, request_id=None, **kwargs):
         """Синхронный вызов метода"""
@@ -142,7 +245,41 @@ class AuthAPI(BaseAPI):
 
 
 class API(BaseAPI):
-    """API хелпер для телеграм клиента"""
+    """API хелпер для телеграм клиента
+
+    full_info_ttl - время жизни ответов *_full_info в кеше клиента
+    по имени метода tdlib, например {'getSupergroupFullInfo': 60}.
+    Для методов без ttl кеш не используется
+
+    parse_text_cache_size - размер кеша результатов parse_text_entities
+
+    batch_window, batch_max_size - окно в секундах и максимальный размер
+    пачки для методов batch_*
+
+    singleflight_methods - методы, одинаковые одновременные запросы
+    которых отправляются в tdlib один раз
+    """
+
+    def __init__(
+        self,
+        client: 'AsyncTelegram',
+        timeout=30,
+        full_info_ttl: Optional[Dict[str, float]] = None,
+        full_info_cache_size: int = 1024,
+        parse_text_cache_size: int = 1024,
+        scheduler: Optional[RequestScheduler] = None,
+        batch_window: float = 0.05,
+        batch_max_size: int = 100,
+        singleflight_methods: Iterable[str] = SINGLEFLIGHT_METHODS,
+    ):
+        super().__init__(client, timeout, scheduler, singleflight_methods)
+        self.batcher = MessageBatcher(batch_window, batch_max_size)
+        self.parse_text_cache = AsyncTTLCache(None, parse_text_cache_size)
+        self.full_info_caches: Dict[str, AsyncTTLCache] = {
+            method: AsyncTTLCache(ttl, full_info_cache_size)
+            for method, ttl in (full_info_ttl or {}).items()
+            if ttl
+        }
 
     def get_me(self):
         """Запрашивает личные данные клиента"""
@@ -151,11 +288,10 @@ class API(BaseAPI):
         )
 
     def get_chat(self, chat_id: int):
-        """Запрашивает информацию о чате. Оффлайн метод"""
-        return self.send_data(
-            'getChat',
-            chat_id=chat_id,
-        )
+        """Запрашивает информацию о чате. Оффлайн метод.
+        Если чат есть в хранилище клиента, запрос в tdlib не отправляется
+        """
+        return self._get_stored_entity(CHATS, chat_id, 'getChat', chat_id=chat_id)
 
     def get_chats(
         self,
@@ -191,7 +327,7 @@ class API(BaseAPI):
         only_local: bool = False,
     ):
         """Запрашивает историю чата"""
-        self.send_data(
+        return self.send_data(
             'getChatHistory',
             chat_id=chat_id,
             from_message_id=from_message_id,
@@ -200,6 +336,86 @@ class API(BaseAPI):
             only_local=only_local,
         )
 
+    async def iter_chat_history(
+        self,
+        chat_id: int,
+        limit: Optional[int] = None,
+        from_message_id: int = 0,
+        min_date: Optional[int] = None,
+        only_local: bool = False,
+        page_size: int = 100,
+        raw: bool = False,
+    ) -> AsyncIterator[Union[Message, dict]]:
+        """Итерирует историю чата от новых сообщений к старым.
+
+        Страницы запрашиваются автоматически, следующая страница
+        запрашивается, пока обрабатывается текущая. История заканчивается,
+        когда tdlib дважды подряд не вернула новых сообщений с одного места.
+
+        :param limit: Максимальное количество сообщений, None - вся история
+        :param from_message_id: Сообщение, с которого начинается история.
+            0 - с последнего сообщения
+        :param min_date: Остановиться на сообщениях старше этой даты (unixtime)
+        :param page_size: Размер страницы, tdlib возвращает не больше 100
+        :param raw: Возвращать исходные словари вместо Message
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        page_size = min(page_size, 100)
+        if limit is not None:
+            page_size = min(page_size, limit)
+
+        async def fetch_page(message_id: int, is_next: bool = True) -> List[dict]:
+            result = await self.get_chat_history(
+                chat_id,
+                limit=page_size,
+                from_message_id=message_id,
+                only_local=only_local,
+            )
+            result.is_valid()
+            messages = result.update.get('messages') or []
+            if not is_next:
+                return messages
+            # последнее сообщение прошлой страницы возвращается снова
+            return [m for m in messages if m['id'] < message_id]
+
+        count = 0
+        offset = from_message_id
+        is_next = False
+        # offset, на котором tdlib уже вернула пустую страницу
+        empty_offset = None
+        page = asyncio.ensure_future(fetch_page(offset, is_next))
+        try:
+            while page is not None:
+                messages = await page
+                page = None
+                if not messages:
+                    # tdlib может вернуть пустую страницу, пока догружает
+                    # историю, поэтому конец - только вторая пустая подряд
+                    if empty_offset == offset:
+                        return
+                    empty_offset = offset
+                    page = asyncio.ensure_future(fetch_page(offset, is_next))
+                    continue
+
+                offset = messages[-1]['id']
+                is_next = True
+                if limit is None or count + len(messages) < limit:
+                    page = asyncio.ensure_future(fetch_page(offset))
+
+                for message in messages:
+                    if min_date is not None and message['date'] < min_date:
+                        return
+                    yield message if raw else Message(message)
+
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+        finally:
+            if page is not None:
+                page.cancel()
+
     def get_web_page_instant_view(self, url: str, force_full: bool = False):
         """Use this method to request instant preview of a webpage.
         Returns error with 404 if there is no preview for this webpage.
@@ -215,23 +431,29 @@ class API(BaseAPI):
         )
 
     def get_user(self, user_id: int):
-        """Запрос на получение подробной информации о пользователе. Оффлайн"""
-        return self.send_data(
-            'getUser',
-            user_id=user_id,
-        )
+        """Запрос на получение подробной информации о пользователе. Оффлайн.
+        Если пользователь есть в хранилище клиента, запрос в tdlib не отправляется
+        """
+        return self._get_stored_entity(USERS, user_id, 'getUser', user_id=user_id)
 
     def get_supergroup(self, supergroup_id: int):
-        """Запрос на получение информации о супергруппе. Оффлайн"""
-        return self.send_data(
+        """Запрос на получение информации о супергруппе. Оффлайн.
+        Если супергруппа есть в хранилище клиента, запрос в tdlib не отправляется
+        """
+        return self._get_stored_entity(
+            SUPERGROUPS,
+            supergroup_id,
             'getSupergroup',
             supergroup_id=supergroup_id,
         )
 
     def get_supergroup_full_info(self, supergroup_id: int):
-        """Запрос на получение полной информации о супергруппе. Кэшируется на 1 минуту"""
-        return self.send_data(
+        """Запрос на получение полной информации о супергруппе. Кэшируется на 1 минуту.
+        Ответ кешируется на стороне клиента, см. full_info_ttl
+        """
+        return self._get_full_info(
             'getSupergroupFullInfo',
+            supergroup_id,
             supergroup_id=supergroup_id,
         )
 
@@ -266,20 +488,155 @@ class API(BaseAPI):
             limit=limit,
         )
 
+    async def iter_supergroup_members(
+        self,
+        supergroup_id: int,
+        filter_type: SupergroupMembersFilter = SupergroupMembersFilter.RECENT,
+        query: str = '',
+        concurrency: int = 4,
+        window: int = 200,
+        retries: int = 2,
+        on_error: Optional[Callable[[int, Exception], Any]] = None,
+    ) -> AsyncIterator[dict]:
+        """Итерирует участников супергруппы (chatMember).
+
+        Количество участников берется из getSupergroupFullInfo, список делится
+        на окна по offset, одновременно запрашивается не больше concurrency
+        окон. Участники возвращаются по мере получения окон, без повторов.
+
+        Окно, запрос которого завершился ошибкой, повторяется до retries раз.
+        Если окно так и не получено, выгрузка остальных окон продолжается:
+        вызывается on_error(offset, exc), а без него после выгрузки
+        выбрасывается RuntimeError со списком пропущенных offset
+        """
+        result = await self.get_supergroup_full_info(supergroup_id)
+        result.is_valid()
+        total = result.update.get('member_count') or 0
+        window = min(window, 200)
+
+        async def fetch_window(offset: int) -> Tuple[int, List[dict]]:
+            for attempt in range(max(retries, 0) + 1):
+                try:
+                    window_result = await self.get_supergroup_members(
+                        supergroup_id,
+                        filter_type,
+                        offset=offset,
+                        limit=window,
+                        query=query,
+                    )
+                    window_result.is_valid()
+                except (RuntimeError, TimeoutError) as exc:
+                    if attempt >= retries:
+                        failed[offset] = exc
+                        return offset, []
+                    continue
+                return offset, window_result.update.get('members') or []
+
+        failed: Dict[int, Exception] = {}
+        seen = set()
+        next_offset = 0
+        pending = set()
+        try:
+            while True:
+                while next_offset < total and len(pending) < max(concurrency, 1):
+                    pending.add(asyncio.ensure_future(fetch_window(next_offset)))
+                    next_offset += window
+
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    offset, members = task.result()
+                    if offset in failed and on_error is not None:
+                        on_error(offset, failed.pop(offset))
+
+                    # пока шла выгрузка, участников могло стать больше
+                    if len(members) >= window and offset + window >= total:
+                        total = offset + 2 * window
+
+                    for member in members:
+                        key = _member_key(member)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        yield member
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if failed:
+            offsets = ', '.join(map(str, sorted(failed)))
+            raise RuntimeError(
+                f'supergroup members windows failed: {offsets}'
+            ) from failed[max(failed)]
+
     def get_basic_group(self, basic_group_id: int):
-        """Запрос на получение информации о базовой группе. Оффлайн метод"""
-        return self.send_data(
+        """Запрос на получение информации о базовой группе. Оффлайн метод.
+        Если группа есть в хранилище клиента, запрос в tdlib не отправляется
+        """
+        return self._get_stored_entity(
+            BASIC_GROUPS,
+            basic_group_id,
             'getBasicGroup',
             basic_group_id=basic_group_id,
         )
 
+    def _get_stored_entity(self, kind: str, entity_id: int, method: str, **kwargs):
+        """Результат из хранилища сущностей клиента или запрос в tdlib"""
+        store = self.client.store
+        entity = store.get(kind, entity_id) if store is not None else None
+        if entity is None:
+            return self.send_data(method, **kwargs)
+
+        kwargs['@type'] = method
+        return _stored_result(kwargs, entity.raw)
+
     def get_basic_group_full_info(self, basic_group_id: int):
-        """Запрос на получение полной информации о базовой группе"""
-        return self.send_data(
+        """Запрос на получение полной информации о базовой группе.
+        Ответ кешируется на стороне клиента, см. full_info_ttl
+        """
+        return self._get_full_info(
             'getBasicGroupFullInfo',
+            basic_group_id,
             basic_group_id=basic_group_id,
         )
 
+    def get_user_full_info(self, user_id: int):
+        """Запрос на получение полной информации о пользователе.
+        Ответ кешируется на стороне клиента, см. full_info_ttl
+        """
+        return self._get_full_info('getUserFullInfo', user_id, user_id=user_id)
+
+    def _get_full_info(self, method: str, entity_id: int, **kwargs):
+        cache = self.full_info_caches.get(method)
+        if cache is None:
+            return self.send_data(method, **kwargs)
+
+        return cache.get_or_load(
+            entity_id,
+            lambda: self.send_data(method, **kwargs),
+            cache_if=lambda result: result.ok_received,
+        )
+
+    @property
+    def full_info_update_types(self) -> List[str]:
+        """Обновления, которые сбрасывают включенные кеши *_full_info"""
+        return [
+            update_type
+            for update_type, (method, _) in FULL_INFO_UPDATES.items()
+            if method in self.full_info_caches
+        ]
+
+    def invalidate_full_info(self, update: dict) -> None:
+        """Сбрасывает кеш *_full_info по обновлению update*FullInfo"""
+        method, id_key = FULL_INFO_UPDATES[update['@type']]
+        cache = self.full_info_caches.get(method)
+        if cache is not None:
+            cache.invalidate(update[id_key])
+
     def get_message(self, message_id: int, chat_id: int):
         """Запрос на получение информации о сообщении"""
         return self.send_data(
@@ -370,30 +727,69 @@ class API(BaseAPI):
         from_background: bool = None,
         send_date: int = None,
         message_thread_id: int = 0,
+        track_delivery: bool = False,
     ):
         """Sends a message to a chat.
         The chat must be in the tdlib's database.
         If there is no chat in the DB, tdlib returns an error.
         Chat is being saved to the database when the client
         receives a message or when you call the `get_chats` method.
-        """
-        formatted_text = {'@type': 'formattedText', 'text': text}
 
-        if parse_mode is not None and parse_mode is not TextParseMode.NONE:
-            result = self.parse_text_entities(text, parse_mode)
-            result.is_valid()
-            formatted_text = result.update
-
-        input_message_content = {
-            '@type': 'inputMessageText',
-            'text': formatted_text,
-            'disable_web_page_preview': {
-                '@type': 'linkPreviewOptions',
-                'is_disabled': disable_web_page_preview,
-            },
-            'clear_draft': True,
+        With `track_delivery` returns a `SentMessage` instead of `Result`.
+        Awaiting it gives the `Result` with the final message
+        from `updateMessageSendSucceeded` or the error
+        from `updateMessageSendFailed`.
+        """
+        options = {
+            'reply_to_message_id': reply_to_message_id,
+            'disable_notification': disable_notification,
+            'from_background': from_background,
+            'send_date': send_date,
+            'message_thread_id': message_thread_id,
         }
 
+        if parse_mode is None or parse_mode is TextParseMode.NONE:
+            formatted_text = {'@type': 'formattedText', 'text': text}
+            sending = self.send_message_content(
+                chat_id,
+                _get_input_message_text(formatted_text, disable_web_page_preview),
+                **options,
+            )
+        else:
+
+            async def send_parsed_message():
+                content = await self.get_input_message_text(
+                    text, parse_mode, disable_web_page_preview
+                )
+                return await self.send_message_content(chat_id, content, **options)
+
+            sending = send_parsed_message()
+
+        if not track_delivery:
+            return sending
+
+        # трекер подписывается на обновления до отправки запроса
+        tracker = self.client.send_tracker
+
+        async def send_tracked_message() -> SentMessage:
+            return tracker.handle(await sending)
+
+        return send_tracked_message()
+
+    def send_message_content(
+        self,
+        chat_id: int,
+        input_message_content: dict,
+        reply_to_message_id: int = 0,
+        disable_notification: bool = None,
+        from_background: bool = None,
+        send_date: int = None,
+        message_thread_id: int = 0,
+    ):
+        """Отправляет сообщение с заранее собранным содержимым,
+        например inputMessageText из get_input_message_text.
+        Один словарь можно отправить в любое количество чатов
+        """
         return self.send_data(
             'sendMessage',
             chat_id=chat_id,
@@ -404,16 +800,59 @@ class API(BaseAPI):
                 'message_id': reply_to_message_id,
                 'quote': None,
             },
-            input_message_content=input_message_content,
             options=_get_send_message_options(
                 disable_notification,
                 from_background,
                 send_date,
             ),
+            input_message_content=input_message_content,
         )
 
+    async def get_input_message_text(
+        self,
+        text: str,
+        parse_mode: TextParseMode = None,
+        disable_web_page_preview: bool = True,
+    ) -> dict:
+        """Собирает inputMessageText для send_message_content.
+        Разметка разбирается через кеш get_formatted_text
+        """
+        if parse_mode is None or parse_mode is TextParseMode.NONE:
+            formatted_text = {'@type': 'formattedText', 'text': text}
+        else:
+            formatted_text = await self.get_formatted_text(text, parse_mode)
+        return _get_input_message_text(formatted_text, disable_web_page_preview)
+
     def parse_text_entities(self, text: str, parse_mode: TextParseMode):
-        """Синхронный оффлайн запрос на парсинг текста"""
+        """Синхронный оффлайн запрос на парсинг текста.
+        Успешные результаты кешируются по (text, parse_mode)
+        """
+        key = (text, TextParseMode(parse_mode))
+        result = self.parse_text_cache.get(key)
+        if result is None:
+            result = self._parse_text_entities(text, parse_mode)
+            if result.ok_received:
+                self.parse_text_cache.set(key, result)
+        return result
+
+    async def get_formatted_text(self, text: str, parse_mode: TextParseMode) -> dict:
+        """Возвращает formattedText для текста с разметкой.
+
+        Результат берется из кеша parse_text_entities, при промахе
+        синхронный запрос в tdlib выполняется вне потока event loop
+        """
+        loop = asyncio.get_running_loop()
+        result = await self.parse_text_cache.get_or_load(
+            (text, TextParseMode(parse_mode)),
+            lambda: loop.run_in_executor(
+                None, self._parse_text_entities, text, parse_mode
+            ),
+            cache_if=lambda parse_result: parse_result.ok_received,
+        )
+        result.is_valid()
+        return result.update
+
+    def _parse_text_entities(self, text: str, parse_mode: TextParseMode):
         return self.send_data_sync(
             'parseTextEntities',
             text=text,
@@ -467,6 +906,72 @@ class API(BaseAPI):
             remove_caption=remove_caption,
         )
 
+    def batch_view_messages(
+        self,
+        chat_id: int,
+        message_ids: List[int],
+        source: Optional[str] = None,
+        force_read: bool = False,
+    ):
+        """view_messages, объединенный с другими вызовами для того же чата.
+        Результат - общий для всей пачки
+        """
+        return self.batcher.add(
+            ('viewMessages', chat_id, source, force_read),
+            message_ids,
+            lambda ids: self.view_messages(chat_id, ids, source, force_read),
+        )
+
+    def batch_delete_messages(self, chat_id: int, message_ids: List[int]):
+        """delete_messages, объединенный с другими вызовами для того же чата.
+        Результат - общий для всей пачки
+        """
+        return self.batcher.add(
+            ('deleteMessages', chat_id),
+            message_ids,
+            lambda ids: self.delete_messages(chat_id, ids),
+        )
+
+    def batch_forward_messages(
+        self,
+        chat_id: int,
+        from_chat_id: int,
+        message_ids: List[int],
+        disable_notification: bool = None,
+        from_background: bool = None,
+        send_date: int = None,
+        message_thread_id: int = 0,
+        send_copy: bool = False,
+        remove_caption: bool = False,
+    ):
+        """forward_messages, объединенный с другими вызовами с теми же чатами
+        и параметрами. Сообщения пересылаются по возрастанию id.
+        Результат - общий для всей пачки
+        """
+        options = (
+            disable_notification,
+            from_background,
+            send_date,
+            message_thread_id,
+            send_copy,
+            remove_caption,
+        )
+        return self.batcher.add(
+            ('forwardMessages', chat_id, from_chat_id, options),
+            message_ids,
+            lambda ids: self.forward_messages(
+                chat_id,
+                from_chat_id,
+                ids,
+                disable_notification=disable_notification,
+                from_background=from_background,
+                send_date=send_date,
+                message_thread_id=message_thread_id,
+                send_copy=send_copy,
+                remove_caption=remove_caption,
+            ),
+        )
+
     def ban_chat_member(self, chat_id: int, user_id: int, banned_until_date: int = 0):
         """Запрос на бан участника чата
 
@@ -547,6 +1052,7 @@ class API(BaseAPI):
     def add_chat_members(self, chat_id: int, user_ids: List[int]):
         """Запрос на добавление пользователей в чат.
         Не более 20 пользователей за раз. Остальные игнорируются.
+        Для большего количества см. add_chat_members_bulk
         """
         return self.send_data(
             'addChatMembers',
@@ -554,6 +1060,71 @@ class API(BaseAPI):
             user_ids=user_ids,
         )
 
+    async def add_chat_members_bulk(
+        self,
+        chat_id: int,
+        user_ids: Iterable[int],
+        chunk_size: int = 20,
+        concurrency: int = 2,
+        checkpoint: Optional[FileCheckpoint] = None,
+        retry_individually: bool = True,
+    ) -> AsyncIterator[Tuple[int, Result]]:
+        """Добавляет в чат любое количество пользователей.
+
+        user_ids делятся на части по chunk_size (tdlib принимает не больше 20),
+        одновременно выполняется не больше concurrency запросов. Для каждого
+        пользователя возвращается (user_id, Result) по мере выполнения.
+        Исключения запроса (таймаут, переполненная таблица запросов)
+        возвращаются как Result с ошибкой.
+
+        :param checkpoint: Успешно добавленные пользователи записываются
+            в чекпоинт и пропускаются при повторном запуске. По завершении
+            файл чекпоинта закрывается
+        :param retry_individually: Если запрос на часть пользователей
+            завершился ошибкой, добавить их по одному через addChatMember,
+            чтобы получить результат для каждого
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1, got {chunk_size}')
+        chunk_size = min(chunk_size, 20)
+
+        async def add(method: Callable, user_ids: Any) -> Result:
+            # таймаут или переполненная таблица запросов не должны
+            # прерывать добавление остальных пользователей
+            try:
+                return await method(chat_id, user_ids)
+            except (RuntimeError, TimeoutError) as exc:
+                return _error_result({'chat_id': chat_id, 'user_ids': user_ids}, exc)
+
+        async def add_chunk(chunk: List[int]) -> List[Tuple[int, Result]]:
+            result = await add(self.add_chat_members, chunk)
+            if (
+                result.ok_received
+                or not retry_individually
+                or len(chunk) == 1
+                # по одному при ограничении частоты будет только хуже
+                or parse_retry_after(result) is not None
+            ):
+                return [(user_id, result) for user_id in chunk]
+
+            return [
+                (user_id, await add(self.add_chat_member, user_id)) for user_id in chunk
+            ]
+
+        if checkpoint is not None:
+            user_ids = (user_id for user_id in user_ids if user_id not in checkpoint)
+
+        chunks = (add_chunk(chunk) for chunk in _chunks(user_ids, chunk_size))
+        try:
+            async for results in bounded_as_completed(chunks, concurrency):
+                for user_id, result in results:
+                    if checkpoint is not None and result.ok_received:
+                        checkpoint.add(user_id)
+                    yield user_id, result
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
     def get_message_available_reactions(
         self, chat_id: int, message_id: int, row_size: int = 25
     ):
@@ -659,6 +1230,66 @@ class API(BaseAPI):
         )
 
 
+def _request_key(kwargs: dict) -> Optional[Hashable]:
+    """Ключ запроса по его параметрам. None, если параметры не хешируются"""
+    try:
+        return _freeze(kwargs)
+    except TypeError:
+        return None
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Делит итерируемый объект на списки по size элементов"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _member_key(member: dict) -> tuple:
+    """Ключ участника чата для удаления повторов"""
+    member_id = member.get('member_id') or {}
+    return (
+        member_id.get('@type'),
+        member_id.get('user_id') or member_id.get('chat_id'),
+    )
+
+
+def _error_result(data: dict, exc: Exception) -> Result:
+    """Result с ошибкой tdlib для исключения, возникшего при запросе"""
+    return Result(data, {'@type': 'error', 'code': 0, 'message': str(exc)})
+
+
+async def _stored_result(data: dict, update: dict) -> Result:
+    return Result(data, update)
+
+
+def _get_input_message_text(
+    formatted_text: dict, disable_web_page_preview: bool = True
+) -> dict:
+    """Собирает inputMessageText для отправки текстового сообщения"""
+    return {
+        '@type': 'inputMessageText',
+        'text': formatted_text,
+        'disable_web_page_preview': {
+            '@type': 'linkPreviewOptions',
+            'is_disabled': disable_web_page_preview,
+        },
+        'clear_draft': True,
+    }
+
+
 def _get_send_message_options(
     disable_notification: bool = None,
     from_background: bool = None,
@@ -0,0 +1,161 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from .utils import Result
+
+BatchSender = Callable[[List[int]], Awaitable[Result]]
+
+
+class _Batch:
+    __slots__ = ('send', 'message_ids', 'futures', 'timer')
+
+    def __init__(self, send: BatchSender) -> None:
+        self.send = send
+        self.message_ids: Dict[int, None] = {}
+        self.futures: List[asyncio.Future] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MessageBatcher:
+    """Объединяет запросы со списками сообщений в один запрос
+
+    Идентификаторы сообщений с одинаковым ключом (метод, чат и параметры
+    запроса) собираются в течение window секунд или до max_size штук,
+    затем отправляются одним запросом. Все вызывающие получают общий
+    результат этого запроса. Вызов, в котором больше max_size сообщений,
+    отправляется частями по max_size.
+    """
+
+    def __init__(self, window: float = 0.05, max_size: int = 100) -> None:
+        self.window = window
+        self.max_size = max_size
+        self._batches: Dict[Hashable, _Batch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.requests = 0
+        self.batched = 0
+
+    def pending(self) -> int:
+        """Количество сообщений, ожидающих отправки"""
+        return sum(len(batch.message_ids) for batch in self._batches.values())
+
+    async def add(
+        self, key: Hashable, message_ids: List[int], send: BatchSender
+    ) -> Result:
+        """Добавляет сообщения в пачку по ключу и ждет результат ее отправки.
+
+        send вызывается со списком идентификаторов всей пачки по возрастанию
+        """
+        if len(message_ids) >= self.max_size:
+            return await self._send_chunks(sorted(set(message_ids)), send)
+
+        batch = self._batches.get(key)
+        if batch is not None:
+            if len(batch.message_ids) + len(message_ids) > self.max_size:
+                self.flush(key)
+                batch = None
+
+        loop = asyncio.get_running_loop()
+        if batch is None:
+            batch = self._batches[key] = _Batch(send)
+            batch.timer = loop.call_later(self.window, self.flush, key)
+
+        batch.message_ids.update(dict.fromkeys(message_ids))
+        future = loop.create_future()
+        batch.futures.append(future)
+        self.batched += 1
+
+        if len(batch.message_ids) >= self.max_size:
+            self.flush(key)
+
+        return await future
+
+    async def _send_chunks(self, message_ids: List[int], send: BatchSender) -> Result:
+        """Отправляет сообщения частями по max_size.
+
+        Отправляются все части, даже если какая-то завершилась ошибкой.
+        Если ошибок нет, возвращается результат последней части, в котором
+        messages (ответ forwardMessages) собраны со всех частей. Иначе
+        возвращается первая ошибка, в поле errors которой перечислены
+        ошибки всех частей: {'message_ids': [...], 'error': {...}}.
+        Исключение поднимается, только если оно случилось во всех частях
+        """
+        results = []
+        for start in range(0, len(message_ids), self.max_size):
+            chunk = message_ids[start : start + self.max_size]
+            self.requests += 1
+            try:
+                result = await send(chunk)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                result = exc
+            results.append((chunk, result))
+
+        errors = [
+            (chunk, result)
+            for chunk, result in results
+            if not isinstance(result, Result) or not result.ok_received
+        ]
+        if all(isinstance(result, Exception) for _, result in results):
+            raise results[0][1]
+        if errors:
+            return _errors_result(errors)
+
+        messages = []
+        for _, result in results:
+            messages.extend(result.update.get('messages') or [])
+        if 'messages' in result.update:
+            update = dict(result.update, messages=messages, total_count=len(messages))
+            result = Result(result._data, update, result.id)
+        return result
+
+    def flush(self, key: Hashable) -> None:
+        """Отправляет пачку по ключу, не дожидаясь окончания окна"""
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+
+        batch.timer.cancel()
+        self.requests += 1
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def flush_all(self) -> None:
+        for key in list(self._batches):
+            self.flush(key)
+
+    async def _send(self, batch: _Batch) -> None:
+        try:
+            result = await batch.send(sorted(batch.message_ids))
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for future in batch.futures:
+            if not future.done():
+                future.set_result(result)
+
+
+def _errors_result(errors: List[Tuple[List[int], Any]]) -> Result:
+    """Первая ошибка частей со списком ошибок всех частей"""
+    updates = []
+    for chunk, result in errors:
+        if isinstance(result, Result):
+            update = result.update or {'@type': 'error', 'code': 0, 'message': ''}
+        else:
+            update = {'@type': 'error', 'code': 0, 'message': str(result)}
+        updates.append({'message_ids': chunk, 'error': update})
+
+    first = errors[0][1]
+    data = first._data if isinstance(first, Result) else {}
+    request_id = first.id if isinstance(first, Result) else None
+    update = dict(updates[0]['error'], errors=updates)
+    return Result(data, update, request_id)
@@ -0,0 +1,204 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+from .checkpoint import FileCheckpoint
+from .tracker import is_send_succeeded
+from .types.text import TextParseMode
+from .utils import bounded_as_completed
+
+if TYPE_CHECKING:
+    from .api import API
+
+SENT = 'sent'  # Сообщение отправлено
+FAILED = 'failed'  # tdlib не смогла отправить сообщение
+REJECTED = 'rejected'  # Запрос sendMessage завершился ошибкой или исключением
+PENDING = 'pending'  # Запрос принят, результат отправки не дождались
+
+
+@dataclass
+class BroadcastStats:
+    """
+    Метрики рассылки
+    """
+
+    total: int = 0  # Обработано получателей в этом запуске
+    skipped: int = 0  # Пропущено получателей из чекпоинта
+    sent: int = 0
+    failed: int = 0
+    rejected: int = 0
+    pending: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)  # Ошибки по тексту
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0
+        finished_at = self.finished_at
+        if finished_at is None:
+            finished_at = self.clock()
+        return finished_at - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Отправленных сообщений в секунду"""
+        elapsed = self.elapsed
+        return self.sent / elapsed if elapsed > 0 else 0
+
+    def add(self, status: str, error: Optional[str] = None) -> None:
+        self.total += 1
+        setattr(self, status, getattr(self, status) + 1)
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def asdict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'skipped': self.skipped,
+            'sent': self.sent,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'pending': self.pending,
+            'errors': dict(self.errors),
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+        }
+
+
+class Broadcast:
+    """Рассылка одного текстового сообщения по списку чатов
+
+    inputMessageText собирается один раз, затем один и тот же словарь
+    отправляется через API.send_message_content не больше чем в concurrency
+    чатов одновременно. Чат считается обработанным, когда tdlib сообщит
+    результат отправки обновлением updateMessageSendSucceeded или
+    updateMessageSendFailed, результат ждет client.send_tracker.
+
+    Если передан checkpoint, каждый принятый tdlib чат сразу записывается
+    в него как pending, а затем окончательным статусом, и при повторном
+    запуске такие чаты пропускаются, поэтому после падения рассылка
+    продолжится без повторной отправки. Отклоненные запросы не
+    записываются и повторяются при следующем запуске.
+    """
+
+    def __init__(
+        self,
+        api: 'API',
+        text: str,
+        parse_mode: TextParseMode = None,
+        disable_web_page_preview: bool = True,
+        disable_notification: bool = None,
+        concurrency: int = 10,
+        delivery_timeout: Optional[float] = 60,
+        checkpoint: Optional[FileCheckpoint] = None,
+    ) -> None:
+        self.api = api
+        self.text = text
+        self.parse_mode = parse_mode
+        self.disable_web_page_preview = disable_web_page_preview
+        self.disable_notification = disable_notification
+        self.concurrency = concurrency
+        self.delivery_timeout = delivery_timeout
+        self.checkpoint = checkpoint
+
+        self.stats = BroadcastStats()
+        self._content: Optional[Dict[Any, Any]] = None
+
+    async def prepare(self) -> Dict[Any, Any]:
+        """Собирает inputMessageText, разметка разбирается один раз"""
+        if self._content is None:
+            self._content = await self.api.get_input_message_text(
+                self.text, self.parse_mode, self.disable_web_page_preview
+            )
+        return self._content
+
+    async def run(self, chat_ids: Iterable[int]) -> BroadcastStats:
+        """Выполняет рассылку и возвращает метрики"""
+        async for _ in self.iter_run(chat_ids):
+            pass
+        return self.stats
+
+    async def iter_run(
+        self, chat_ids: Iterable[int]
+    ) -> AsyncIterator[Tuple[int, str, Dict[Any, Any]]]:
+        """Выполняет рассылку, возвращая (chat_id, статус, ответ tdlib)
+        по мере обработки чатов.
+
+        Ответ - окончательное сообщение, ошибка отправки, временное
+        сообщение, если результат не дождались, или ошибка запроса
+        """
+        await self.prepare()
+        self.stats.started_at = self.stats.clock()
+        self.stats.finished_at = None
+
+        sends = (self._send(chat_id) for chat_id in self._recipients(chat_ids))
+        try:
+            async for chat_id, status, update in bounded_as_completed(
+                sends, self.concurrency
+            ):
+                error = None
+                if status in (FAILED, REJECTED):
+                    error = _error_message(update)
+                self.stats.add(status, error)
+                if self.checkpoint is not None and status in (SENT, FAILED):
+                    self.checkpoint.add(chat_id, status)
+                yield chat_id, status, update
+        finally:
+            self.stats.finished_at = self.stats.clock()
+
+    def _recipients(self, chat_ids: Iterable[int]) -> Iterable[int]:
+        for chat_id in chat_ids:
+            if self.checkpoint is not None and chat_id in self.checkpoint:
+                self.stats.skipped += 1
+                continue
+            yield chat_id
+
+    async def _send(self, chat_id: int) -> Tuple[int, str, Dict[Any, Any]]:
+        # трекер подписывается на обновления до отправки запроса
+        tracker = self.api.client.send_tracker
+        try:
+            result = await self.api.send_message_content(
+                chat_id,
+                self._content,
+                disable_notification=self.disable_notification,
+            )
+        except (RuntimeError, TimeoutError) as exc:
+            # таймаут или переполненная таблица запросов не прерывают рассылку
+            return chat_id, REJECTED, {'@type': 'error', 'code': 0, 'message': str(exc)}
+
+        if not result.ok_received:
+            return chat_id, REJECTED, result.update or {}
+
+        # принятое сообщение не должно уйти повторно после перезапуска
+        if self.checkpoint is not None:
+            self.checkpoint.add(chat_id, PENDING)
+
+        try:
+            # при таймауте отслеживание сообщения прекращается
+            update = await tracker.wait(result.update, self.delivery_timeout)
+        except asyncio.TimeoutError:
+            return chat_id, PENDING, result.update
+
+        if is_send_succeeded(update):
+            return chat_id, SENT, update['message']
+        return chat_id, FAILED, update['error']
+
+
+def _error_message(update: Dict[Any, Any]) -> Optional[str]:
+    """Текст ошибки tdlib"""
+    if update.get('@type') == 'error':
+        return update.get('message')
+    return None
@@ -0,0 +1,122 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """LRU кеш со сроком жизни записей для асинхронных загрузчиков
+
+    Если запись уже загружается, остальные вызовы get_or_load с тем же
+    ключом ждут ту же загрузку, а не запускают свою. Загрузка выполняется
+    отдельной задачей, поэтому отмена одного из ожидающих не отменяет ее
+    для остальных. ttl=None - записи не устаревают, кеш ограничен только
+    max_size.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 60,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+
+        self._data: 'OrderedDict[Hashable, Tuple[Optional[float], Any]]' = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires, value = entry
+        if expires is not None and expires <= self._clock():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Удаляет запись. Результат текущей загрузки не будет сохранен"""
+        self._data.pop(key, None)
+        self._loading.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._loading.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'size': len(self._data),
+            'loading': len(self._loading),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        cache_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Возвращает значение из кеша или загружает его через loader.
+
+        cache_if - сохранять результат, только если функция вернула True
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        future = self._loading.get(key)
+        if future is not None:
+            self.hits += 1
+            return await asyncio.shield(future)
+
+        self.misses += 1
+        future = asyncio.ensure_future(loader())
+        self._loading[key] = future
+        future.add_done_callback(lambda f: self._loaded(key, f, cache_if))
+        return await asyncio.shield(future)
+
+    def _loaded(
+        self,
+        key: Hashable,
+        future: asyncio.Future,
+        cache_if: Optional[Callable[[Any], bool]],
+    ) -> None:
+        if self._loading.get(key) is not future:
+            # запись инвалидирована во время загрузки
+            return
+
+        del self._loading[key]
+        # exception() также помечает ошибку полученной, если ожидающих нет
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        value = future.result()
+        if cache_if is None or cache_if(value):
+            self.set(key, value)
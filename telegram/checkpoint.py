@@ -0,0 +1,92 @@
+import json
+import os
+from typing import Any, Dict, Hashable, Iterator, Optional
+
+
+class FileCheckpoint:
+    """Чекпоинт длительной операции в файле
+
+    Каждая обработанная запись дописывается в файл отдельной строкой JSON,
+    поэтому после падения процесса операцию можно продолжить с того же
+    места: при создании чекпоинта файл читается, и уже обработанные
+    ключи не обрабатываются повторно.
+
+    Ключ можно записать несколько раз, например сначала промежуточное,
+    а затем окончательное состояние. Действует последняя запись, а файл
+    с повторами сжимается при загрузке до одной строки на ключ.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._entries: Dict[Hashable, Any] = {}
+        self._file = None
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+
+        lines = 0
+        with open(self.path, encoding='utf-8') as file:
+            for line in file:
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # последняя строка могла не дописаться при падении
+                    continue
+                self._entries[_key(entry['key'])] = entry.get('value')
+
+        if lines > len(self._entries):
+            self.compact()
+
+    def compact(self) -> None:
+        """Перезаписывает файл, оставляя только последнюю запись каждого ключа.
+        Новый файл подменяет старый целиком, поэтому падение во время
+        сжатия не теряет записи
+        """
+        self.close()
+        path = f'{self.path}.tmp'
+        with open(path, 'w', encoding='utf-8') as file:
+            for key, value in self._entries.items():
+                file.write(json.dumps({'key': key, 'value': value}) + '\n')
+        os.replace(path, self.path)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._entries.get(key, default)
+
+    def add(self, key: Hashable, value: Optional[Any] = None) -> None:
+        """Отмечает ключ как обработанный и сразу пишет его в файл"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+        self._entries[key] = value
+        self._file.write(json.dumps({'key': key, 'value': value}) + '\n')
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'FileCheckpoint':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _key(value: Any) -> Hashable:
+    # json не различает кортежи и списки
+    if isinstance(value, list):
+        return tuple(_key(item) for item in value)
+    return value
@@ -1,21 +1,44 @@
 import asyncio
 import logging
 import signal
+import sys
 from collections import defaultdict
 from concurrent.futures.thread import ThreadPoolExecutor
 from dataclasses import dataclass
 from types import FrameType
-from typing import Any, Callable, DefaultDict, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from uuid import uuid4
 
 from . import VERSION
-from .api import API, AuthAPI
-from .tdjson import TDJson
+from .api import API, SINGLEFLIGHT_METHODS, AuthAPI
+from .codec import has_extra, sniff_request_id, sniff_type
+from .dispatcher import ShardedDispatcher, ShardKey
+from .pending import PendingRequests
+from .ratelimit import RequestScheduler
+from .storage import EntityStore
+from .tdjson import TDJson, TDJsonReceiver
+from .tracker import MessageSendTracker
 from .types.update import AuthorizationState, Update, UpdateAuthorizationState
 from .utils import Result
 
+if TYPE_CHECKING:
+    from .manager import ClientManager
+
 MESSAGE_HANDLER_TYPE: str = 'updateNewMessage'
 
+# for authorizationProcess @extra.request_id doesn't work
+SPECIAL_RESPONSE_TYPES = ('updateAuthorizationState',)
+
 
 @dataclass
 class Settings:
@@ -47,7 +70,29 @@ class Settings:
     last_name: str = ''  # Фамилия клиента - только для регистрации
     update_timeout: int = 30  # Время ожидания ответа от tdlib
     tdjson_workers: int = 3  # Количество воркеров, который слушают tdlib
+    tdjson_receive_thread: bool = False  # Слушать tdlib в отдельном потоке
+    tdjson_receive_batch_size: int = 100  # Макс. обновлений за одну передачу в loop
+    tdjson_receive_queue_size: int = 10  # Макс. пачек, ожидающих обработки в loop
+    json_codec: Optional[str] = None  # orjson, msgspec, ujson, json. None - авто
+    prefilter_updates: bool = True  # Не декодировать обновления, которые никто не ждет
+    max_pending_requests: int = 10000  # Лимит запросов, ожидающих ответа. 0 - нет
     handlers_workers: int = 3  # Количество воркеров, которые обрабатывают обновления
+    handlers_sharding: bool = False  # Обрабатывать обновления одного чата по порядку
+    handlers_shard_key: Optional[ShardKey] = None  # Ключ шардирования, иначе chat_id
+    use_entity_store: bool = False  # Хранить пользователей и чаты из обновлений
+    supergroup_full_info_ttl: float = 60  # Кеш getSupergroupFullInfo, сек. 0 - нет
+    basic_group_full_info_ttl: float = 60  # Кеш getBasicGroupFullInfo, сек. 0 - нет
+    user_full_info_ttl: float = 60  # Кеш getUserFullInfo, сек. 0 - нет
+    full_info_cache_size: int = 1024  # Макс. записей в каждом кеше *_full_info
+    parse_text_cache_size: int = 1024  # Макс. записей в кеше parse_text_entities
+    rate_limit_global: float = 0  # Макс. запросов в секунду. 0 - без ограничения
+    rate_limit_per_chat: float = 0  # Макс. запросов в секунду в один чат. 0 - нет
+    rate_limit_methods: Optional[Dict[str, float]] = None  # Лимиты по методам
+    flood_wait_retries: int = 0  # Повторов запроса после ошибки 429. 0 - нет
+    flood_wait_max: float = 60  # Не повторять, если просят ждать дольше, сек.
+    batch_window: float = 0.05  # Окно объединения запросов batch_*, сек.
+    batch_max_size: int = 100  # Макс. сообщений в одном запросе batch_*
+    singleflight_methods: Tuple[str, ...] = SINGLEFLIGHT_METHODS  # Объединять запросы
 
     def __post_init__(self):
 
@@ -55,12 +100,62 @@ class Settings:
             raise ValueError('You must provide bot_token or phone')
 
 
+class PreparedUpdate:
+    """Обновление в очереди обработчиков.
+
+    Датакласс обновления создается один раз при первом обращении
+    и используется всеми обработчиками этого обновления
+    """
+
+    __slots__ = ('raw', '_prepare', '_update')
+
+    def __init__(self, raw: Dict[Any, Any], prepare: Callable) -> None:
+        self.raw = raw
+        self._prepare = prepare
+        self._update = None
+
+    def get(self):
+        if self._update is None:
+            self._update = self._prepare(self.raw)
+        return self._update
+
+
 class AsyncTelegram:
-    """Асинхронный телеграм клиент"""
+    """Асинхронный телеграм клиент
 
-    def __init__(self, settings: Settings) -> None:
+    Если передан manager, клиент использует его event loop и общий
+    поток чтения tdlib, а library_path, tdlib_verbosity и json_codec
+    берутся из менеджера
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        manager: Optional['ClientManager'] = None,
+    ) -> None:
         self.settings = settings
-        self.api = API(self, settings.update_timeout)
+        self._manager = manager
+        self.api = API(
+            self,
+            settings.update_timeout,
+            full_info_ttl={
+                'getSupergroupFullInfo': settings.supergroup_full_info_ttl,
+                'getBasicGroupFullInfo': settings.basic_group_full_info_ttl,
+                'getUserFullInfo': settings.user_full_info_ttl,
+            },
+            full_info_cache_size=settings.full_info_cache_size,
+            parse_text_cache_size=settings.parse_text_cache_size,
+            scheduler=RequestScheduler(
+                global_rate=settings.rate_limit_global,
+                chat_rate=settings.rate_limit_per_chat,
+                method_rates=settings.rate_limit_methods,
+                max_retries=settings.flood_wait_retries,
+                max_retry_after=settings.flood_wait_max,
+            ),
+            batch_window=settings.batch_window,
+            batch_max_size=settings.batch_max_size,
+            singleflight_methods=settings.singleflight_methods,
+        )
         self.authorization = Authorization(self)
 
         self.logger = logging.getLogger(str(self))
@@ -68,24 +163,62 @@ class AsyncTelegram:
         self.is_enabled = False
         self.is_killing = False
 
-        self._updates: Dict[str, dict] = {}
         self._update_handlers: DefaultDict[str, List[Callable]] = defaultdict(list)
+        # (тип обновления, обработчик), которым нужен исходный словарь
+        self._raw_update_handlers: Set[Tuple[str, Callable]] = set()
+        self._update_listeners: DefaultDict[str, List[Callable]] = defaultdict(list)
+        self._decode_types: Set[str] = set()
 
-        self._tdjson = TDJson(
-            library_path=settings.library_path,
-            verbosity=settings.tdlib_verbosity,
-        )
+        self.store: Optional[EntityStore] = None
+        if settings.use_entity_store:
+            self.store = EntityStore()
+            self.store.attach(self)
+
+        self._send_tracker: Optional[MessageSendTracker] = None
 
-        self._loop = asyncio.new_event_loop()
-        self._loop.set_exception_handler(self._loop_exception_handler)
+        for update_type in self.api.full_info_update_types:
+            self.add_update_listener(update_type, self.api.invalidate_full_info)
+
+        if manager is not None:
+            self._tdjson = manager.create_tdjson()
+            self._loop = manager.loop
+        else:
+            self._tdjson = TDJson(
+                library_path=settings.library_path,
+                verbosity=settings.tdlib_verbosity,
+                codec=settings.json_codec,
+            )
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_exception_handler(self._loop_exception_handler)
         self._loop_tasks = []
 
+        self._pending_requests = PendingRequests(
+            self._loop,
+            max_size=settings.max_pending_requests,
+        )
+
+        # начиная с python 3.10 очередь привязывается к loop при первом
+        # использовании, а параметр loop удален
+        queue_kwargs = {'loop': self._loop} if sys.version_info < (3, 10) else {}
         self.handler_workers_queue = asyncio.Queue(
             self.settings.default_workers_queue_size,
-            loop=self._loop,
+            **queue_kwargs,
         )
 
+        self._dispatcher: Optional[ShardedDispatcher] = None
+        if settings.handlers_sharding:
+            self._dispatcher = ShardedDispatcher(
+                settings.handlers_workers,
+                maxsize=settings.default_workers_queue_size,
+                key=settings.handlers_shard_key,
+            )
+
         self._executor = ThreadPoolExecutor(max_workers=1)
+        self._receive_queue: Optional[asyncio.Queue] = None
+
+        if manager is not None:
+            manager.register(self)
+            return
 
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -101,13 +234,26 @@ class AsyncTelegram:
         self.stop(kill=True)
 
     def run(self):
+        self.start()
+        self.run_forever()
+
+    def start(self):
+        """Создает задачи воркеров, не запуская event loop"""
         self.logger.debug('running...')
         self.is_enabled = True
-        for _ in range(self.settings.tdjson_workers):
-            self.create_task(self._tdjson_worker())
-        for _ in range(self.settings.handlers_workers):
-            self.create_task(self._handlers_worker())
-        self.run_forever()
+        if self._manager is not None:
+            self._manager.start_client(self)
+        elif self.settings.tdjson_receive_thread:
+            self.create_task(self._tdjson_receiver_worker())
+        else:
+            for _ in range(self.settings.tdjson_workers):
+                self.create_task(self._tdjson_worker())
+        if self._dispatcher is not None:
+            for lane in range(self._dispatcher.lanes):
+                self.create_task(self._lane_worker(lane))
+        else:
+            for _ in range(self.settings.handlers_workers):
+                self.create_task(self._handlers_worker())
 
     def run_forever(self):
         try:
@@ -115,20 +261,29 @@ class AsyncTelegram:
             self._loop.run_forever()
         finally:
             self.logger.debug('cancel running forever')
-            self.cancel_tasks()
+            self.shutdown()
 
-            self._loop.run_until_complete(self.handler_workers_queue.join())
-            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+    def shutdown(self):
+        """Отменяет задачи клиента после остановки event loop"""
+        self.cancel_tasks()
 
-            if self.is_killing:
-                self._loop.close()
-                self._tdjson.stop()
+        self._loop.run_until_complete(self.handler_workers_queue.join())
+        if self._dispatcher is not None:
+            self._loop.run_until_complete(self._dispatcher.join())
+        self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+
+        if self.is_killing and self._manager is None:
+            self._loop.close()
+            self._tdjson.stop()
 
     def create_task(self, coro):
         self.logger.debug(f'created task: {coro.__name__}')
         task = self._loop.create_task(coro)
 
         def handler(t):
+            if not t.cancelled() and t.exception() is not None:
+                # упавший воркер останавливает только своего клиента
+                self.stop()
             t.result()
 
         task.add_done_callback(handler)
@@ -172,7 +327,11 @@ class AsyncTelegram:
             self.is_killing = True
 
         self.is_enabled = False
-        self._loop.stop()
+        if self._manager is not None and self._manager.is_running:
+            # общий loop продолжает работать для остальных клиентов
+            self._manager.detach(self)
+        else:
+            self._loop.stop()
 
     def kill(self):
         self.stop(kill=True)
@@ -182,11 +341,106 @@ class AsyncTelegram:
         loop = asyncio.get_running_loop()
 
         while self.is_enabled:
-            update = await loop.run_in_executor(self._executor, self._tdjson.receive)
+            update = await loop.run_in_executor(self._executor, self._receive)
 
             if update:
-                await self._update_async_result(update)
-                await self._run_handlers(update)
+                await self._process_update(update)
+
+    async def _tdjson_receiver_worker(self) -> None:
+        """Запускает поток, читающий tdlib, и обрабатывает пачки обновлений"""
+        if self._receive_queue is None:
+            self._receive_queue = asyncio.Queue(self.settings.tdjson_receive_queue_size)
+
+        receiver = TDJsonReceiver(
+            self._tdjson,
+            self._loop,
+            self._receive_queue.put,
+            batch_size=self.settings.tdjson_receive_batch_size,
+            update_filter=self._should_decode,
+        )
+        receiver.start()
+
+        try:
+            while self.is_enabled:
+                batch = await self._receive_queue.get()
+                for update in batch:
+                    await self._process_update(update)
+        finally:
+            receiver.stop()
+
+    def _receive(self) -> Optional[Dict[Any, Any]]:
+        raw = self._tdjson.receive_raw()
+        if raw is None or not self._should_decode(raw):
+            return None
+        return self._tdjson.decode(raw)
+
+    def _should_decode(self, raw: bytes) -> bool:
+        """Решает по сырым bytes, нужно ли декодировать обновление.
+
+        Обновление декодируется, если его ждет запрос из send_data,
+        на его тип зарегистрирован обработчик или тип добавлен
+        через add_decode_type. Вызывается из потока чтения tdlib.
+        """
+        if not self.settings.prefilter_updates:
+            return True
+
+        update_type = sniff_type(raw)
+        if (
+            update_type is None
+            or update_type in self._decode_types
+            or self._update_handlers.get(update_type)
+        ):
+            return True
+
+        if update_type in SPECIAL_RESPONSE_TYPES:
+            return update_type in self._pending_requests
+
+        request_id = sniff_request_id(raw)
+        if request_id is not None:
+            return request_id in self._pending_requests
+
+        return has_extra(raw)
+
+    def add_decode_type(self, update_type: str) -> None:
+        """Всегда декодировать обновления этого типа, даже без обработчиков"""
+        self._decode_types.add(update_type)
+
+    async def _process_update(self, update: Dict[Any, Any]) -> None:
+        await self._update_async_result(update)
+        self._notify_listeners(update)
+        await self._run_handlers(update)
+
+    def _notify_listeners(self, update: Dict[Any, Any]) -> None:
+        listeners = self._update_listeners.get(update.get('@type'))
+        if not listeners:
+            return
+
+        for listener in listeners:
+            try:
+                listener(update)
+            except Exception:
+                self.logger.exception(f'update listener failed: {listener}')
+
+    def add_update_listener(self, update_type: str, func: Callable) -> None:
+        """Добавляет слушателя обновлений указанного типа.
+
+        В отличие от обработчиков, слушатель - синхронная функция, которая
+        вызывается сразу после получения обновления, до очереди обработчиков,
+        и получает исходный словарь. Обновления этого типа всегда декодируются
+        """
+        if func not in self._update_listeners[update_type]:
+            self._update_listeners[update_type].append(func)
+        self.add_decode_type(update_type)
+
+    @property
+    def send_tracker(self) -> MessageSendTracker:
+        """Трекер результатов отправки сообщений.
+        Подписывается на обновления при первом обращении
+        """
+        if self._send_tracker is None:
+            self._send_tracker = MessageSendTracker()
+            self._send_tracker.attach(self)
+        return self._send_tracker
 
     def _prepare_update(self, update: dict):
         return Update(update)
@@ -197,25 +451,45 @@ class AsyncTelegram:
             handler, update = await self.handler_workers_queue.get()
 
             try:
-                update = self._prepare_update(update)
-                result = handler(update)
-                if asyncio.iscoroutine(result):
-                    await result
+                await self._call_handler(handler, update)
             finally:
                 self.handler_workers_queue.task_done()
 
-    async def _update_async_result(self, update: Dict[Any, Any]) -> None:
+    async def _lane_worker(self, lane: int) -> None:
+        """Обрабатывает одну полосу шардированного диспетчера по порядку"""
+        while self.is_enabled:
+            handlers, update = await self._dispatcher.get(lane)
+
+            try:
+                for handler in handlers:
+                    await self._call_handler(handler, update)
+            finally:
+                self._dispatcher.task_done(lane)
+
+    async def _call_handler(self, handler: Callable, update: PreparedUpdate) -> None:
+        update_type = update.raw.get('@type', 'unknown')
+        if (update_type, handler) in self._raw_update_handlers:
+            result = handler(update.raw)
+        else:
+            result = handler(update.get())
+        if asyncio.iscoroutine(result):
+            await result
+
+    def handler_queue_sizes(self) -> List[int]:
+        """Глубина очереди обработчиков, по каждой полосе при шардировании"""
+        if self._dispatcher is not None:
+            return self._dispatcher.lane_sizes()
+        return [self.handler_workers_queue.qsize()]
 
-        # for authorizationProcess @extra.request_id doesn't work
-        _special_types = ('updateAuthorizationState',)
+    async def _update_async_result(self, update: Dict[Any, Any]) -> None:
 
-        if update.get('@type') in _special_types:
+        if update.get('@type') in SPECIAL_RESPONSE_TYPES:
             request_id = update['@type']
         else:
             request_id = update.get('@extra', {}).get('request_id')
 
         if request_id:
-            self._updates[request_id] = update
+            self._pending_requests.resolve(request_id, update)
 
     async def send_data(
         self,
@@ -228,6 +502,7 @@ class AsyncTelegram:
         request_id = request_id or data['@extra'].get('request_id') or uuid4().hex
         data['@extra']['request_id'] = request_id
         self.logger.debug(f'send_data: {data}')
+        self._register_request(request_id, timeout)
         self._tdjson.send(data)
         update = await self._get_update(request_id, timeout=timeout)
         return Result(data, update, request_id=request_id)
@@ -241,37 +516,62 @@ class AsyncTelegram:
         update = self._tdjson.td_execute(data)
         return Result(data, update, request_id=request_id)
 
+    def _register_request(
+        self,
+        request_id: str,
+        timeout: Optional[float] = 30,
+    ) -> asyncio.Future:
+        """Регистрирует ожидание ответа на запрос с указанным request_id"""
+        return self._pending_requests.register(request_id, timeout)
+
+    def pending_requests_stats(self) -> Dict[str, int]:
+        """Размер таблицы запросов, ожидающих ответа, и счетчики"""
+        return self._pending_requests.stats()
+
     async def _get_update(
         self,
         request_id: Optional[str] = None,
         timeout: int = 30,
     ) -> Dict[Any, Any]:
-        loop = asyncio.get_running_loop()
-        timer = loop.time()
-        while self.is_enabled:
-            result = self._updates.pop(request_id, None)
-            if result is not None:
-                self.logger.debug(f'get_update: {request_id} {result}')
-                return result
-            await asyncio.sleep(0.1)
-
-            if loop.time() - timer > timeout:
-                raise TimeoutError(f'result not set {request_id}')
+        future = self._register_request(request_id, timeout)
+        result = await future
+        self.logger.debug(f'get_update: {request_id} {result}')
+        return result
 
     async def _run_handlers(self, update: Dict[Any, Any]) -> None:
         update_type: str = update.get('@type', 'unknown')
-        for handler in self._update_handlers[update_type]:
-            await self.handler_workers_queue.put((handler, update))
+        handlers = self._update_handlers.get(update_type)
+        if not handlers:
+            return
+
+        prepared = PreparedUpdate(update, self._prepare_update)
+        if self._dispatcher is not None:
+            await self._dispatcher.put(update, (tuple(handlers), prepared))
+            return
+
+        for handler in handlers:
+            await self.handler_workers_queue.put((handler, prepared))
 
-    def add_message_handler(self, func: Callable) -> None:
-        self.add_update_handler(MESSAGE_HANDLER_TYPE, func)
+    def add_message_handler(self, func: Callable, raw: bool = False) -> None:
+        self.add_update_handler(MESSAGE_HANDLER_TYPE, func, raw=raw)
 
-    def add_update_handler(self, handler_type: str, func: Callable) -> None:
+    def add_update_handler(
+        self, handler_type: str, func: Callable, raw: bool = False
+    ) -> None:
+        """Добавляет обработчик обновлений указанного типа.
+
+        Обработчики одного обновления получают один и тот же объект Update,
+        с raw=True обработчик получает исходный словарь без декодирования
+        """
         self.logger.debug(f'update handler added: {handler_type} {func.__name__}')
         if func not in self._update_handlers[handler_type]:
             self._update_handlers[handler_type].append(func)
+        if raw:
+            self._raw_update_handlers.add((handler_type, func))
 
     def clear_update_handler(self, handler_type: str) -> None:
+        for func in self._update_handlers[handler_type]:
+            self._raw_update_handlers.discard((handler_type, func))
         self._update_handlers[handler_type].clear()
 
     def login(self, timeout=10) -> bool:
@@ -0,0 +1,130 @@
+"""JSON кодеки для обмена данными с tdlib
+
+Кодек работает напрямую с bytes, которые принимает и возвращает libtdjson.
+Если установлен один из ускоренных пакетов (orjson, msgspec, ujson),
+get_codec() выбирает его автоматически, иначе используется стандартный json.
+"""
+import json
+import re
+from typing import Any, Dict, Optional, Type
+
+# tdlib всегда пишет @type первым полем, а @extra и @client_id - последними
+_TYPE_RE = re.compile(rb'\{\s*"@type"\s*:\s*"([^"]+)"')
+_REQUEST_ID_RE = re.compile(rb'"@extra"\s*:\s*\{[^{}]*?"request_id"\s*:\s*"([^"]*)"')
+_CLIENT_ID_RE = re.compile(rb'"@client_id"\s*:\s*(-?\d+)')
+
+
+class JSONCodec:
+    """Стандартный json"""
+
+    name: str = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """https://github.com/ijl/orjson"""
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+class MsgspecCodec(JSONCodec):
+    """https://github.com/jcrist/msgspec"""
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self.dumps = msgspec.json.Encoder().encode
+        self.loads = msgspec.json.Decoder().decode
+
+
+class UjsonCodec(JSONCodec):
+    """https://github.com/ultrajson/ultrajson"""
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+        self.loads = ujson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+# в порядке предпочтения при автоматическом выборе
+CODECS: Dict[str, Type[JSONCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    UjsonCodec.name: UjsonCodec,
+    JSONCodec.name: JSONCodec,
+}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Возвращает кодек по имени.
+
+    Если имя не указано, возвращает первый доступный кодек из CODECS.
+    """
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(f'Unknown json codec: {name}')
+        return CODECS[name]()
+
+    for codec_cls in CODECS.values():
+        try:
+            return codec_cls()
+        except ImportError:
+            continue
+
+    return JSONCodec()
+
+
+def sniff_type(data: bytes) -> Optional[str]:
+    """Возвращает @type из сырого JSON без полного декодирования"""
+    match = _TYPE_RE.match(data)
+    if match is None:
+        return None
+    return match.group(1).decode('utf-8')
+
+
+def has_extra(data: bytes) -> bool:
+    """Проверяет наличие поля @extra в сыром JSON"""
+    return data.rfind(b'"@extra"') != -1
+
+
+def sniff_request_id(data: bytes) -> Optional[str]:
+    """Возвращает @extra.request_id из сырого JSON без полного декодирования"""
+    position = data.rfind(b'"@extra"')
+    if position == -1:
+        return None
+
+    match = _REQUEST_ID_RE.match(data, position)
+    if match is None:
+        return None
+    return match.group(1).decode('utf-8')
+
+
+def sniff_client_id(data: bytes) -> Optional[int]:
+    """Возвращает @client_id из сырого JSON без полного декодирования"""
+    position = data.rfind(b'"@client_id"')
+    if position == -1:
+        return None
+
+    match = _CLIENT_ID_RE.match(data, position)
+    if match is None:
+        return None
+    return int(match.group(1))
@@ -0,0 +1,73 @@
+import asyncio
+import itertools
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+ShardKey = Callable[[Dict[Any, Any]], Optional[Hashable]]
+
+
+def chat_shard_key(update: Dict[Any, Any]) -> Optional[int]:
+    """Возвращает chat_id обновления, если он есть"""
+    chat_id = update.get('chat_id')
+
+    if chat_id is None and isinstance(update.get('message'), dict):
+        chat_id = update['message'].get('chat_id')
+
+    if chat_id is None and isinstance(update.get('chat'), dict):
+        chat_id = update['chat'].get('id')
+
+    return chat_id
+
+
+class ShardedDispatcher:
+    """Распределяет обновления по очередям-полосам по ключу
+
+    Ключ по умолчанию - chat_id. Обновления с одинаковым ключом всегда
+    попадают в одну полосу, которую обрабатывает один воркер, поэтому
+    обновления одного чата обрабатываются по порядку, а разные чаты -
+    параллельно. Обновления без ключа распределяются по кругу.
+    """
+
+    def __init__(
+        self,
+        lanes: int,
+        maxsize: int = 0,
+        key: Optional[ShardKey] = None,
+    ) -> None:
+        self.lanes = max(lanes, 1)
+        self.maxsize = maxsize
+        self._key = key or chat_shard_key
+        self._round_robin = itertools.count()
+        self._queues: Optional[List[asyncio.Queue]] = None
+
+    @property
+    def queues(self) -> List[asyncio.Queue]:
+        # очереди создаются внутри работающего event loop
+        if self._queues is None:
+            self._queues = [asyncio.Queue(self.maxsize) for _ in range(self.lanes)]
+        return self._queues
+
+    def lane(self, update: Dict[Any, Any]) -> int:
+        """Номер полосы для обновления"""
+        key = self._key(update)
+        if key is None:
+            return next(self._round_robin) % self.lanes
+        return hash(key) % self.lanes
+
+    async def put(self, update: Dict[Any, Any], item: Any) -> None:
+        await self.queues[self.lane(update)].put(item)
+
+    async def get(self, lane: int) -> Any:
+        return await self.queues[lane].get()
+
+    def task_done(self, lane: int) -> None:
+        self.queues[lane].task_done()
+
+    async def join(self) -> None:
+        for queue in self.queues:
+            await queue.join()
+
+    def lane_sizes(self) -> List[int]:
+        """Текущая глубина очереди каждой полосы"""
+        if self._queues is None:
+            return [0] * self.lanes
+        return [queue.qsize() for queue in self._queues]
@@ -0,0 +1,253 @@
+import asyncio
+import logging
+import signal
+from collections import deque
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from .client import AsyncTelegram, Settings
+from .codec import JSONCodec, get_codec, sniff_client_id
+from .tdjson import TDJson, TDJsonReceiver
+
+AUTHORIZATION_STATE = 'updateAuthorizationState'
+
+
+class ClientManager:
+    """Менеджер нескольких телеграм клиентов в одном процессе
+
+    libtdjson загружается один раз, каждый клиент получает свой client_id.
+    td_receive читается одним потоком, обновления распределяются
+    по клиентам по полю @client_id. Все клиенты работают в одном event loop.
+
+    Обновления клиента, который еще не запущен или уже остановлен,
+    копятся в очереди до backlog_size штук и передаются клиенту при start().
+    При переполнении отбрасываются самые старые обновления, кроме
+    updateAuthorizationState, без которых клиент не сможет авторизоваться.
+
+    Пример:
+        manager = ClientManager(library_path='./libtdjson.so')
+        tg1 = manager.create_client(settings1)
+        tg2 = manager.create_client(settings2)
+        tg1.login()
+        tg2.login()
+        manager.run()
+    """
+
+    def __init__(
+        self,
+        library_path: Optional[str] = None,
+        verbosity: int = 2,
+        receive_batch_size: int = 100,
+        receive_queue_size: int = 10,
+        codec: Union[None, str, JSONCodec] = None,
+        backlog_size: int = 10000,
+    ) -> None:
+        self.library_path = library_path
+        self.verbosity = verbosity
+        self.codec = codec if isinstance(codec, JSONCodec) else get_codec(codec)
+        self.receive_batch_size = receive_batch_size
+        self.receive_queue_size = receive_queue_size
+        self.backlog_size = backlog_size
+
+        self.logger = logging.getLogger(str(self))
+        self.is_running = False
+        self.is_killing = False
+
+        self._clients: Dict[int, AsyncTelegram] = {}
+        self._backlogs: Dict[int, Deque[Dict[Any, Any]]] = {}
+        self._replay_tasks: Dict[int, asyncio.Task] = {}
+
+        # не создает client_id, используется только для td_receive
+        self._tdjson = TDJson(
+            library_path=library_path,
+            verbosity=verbosity,
+            create_client=False,
+            codec=self.codec,
+        )
+
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_exception_handler(self._loop_exception_handler)
+
+        self._receive_task: Optional[asyncio.Task] = None
+        self._receive_queue: Optional[asyncio.Queue] = None
+
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+        signal.signal(signal.SIGABRT, self._signal_handler)
+
+    @property
+    def clients(self) -> List[AsyncTelegram]:
+        return list(self._clients.values())
+
+    def _loop_exception_handler(self, loop, context):
+        if isinstance(context.get('exception'), asyncio.exceptions.CancelledError):
+            return
+
+        self.logger.exception(context.get('message'))
+        if not self.is_running:
+            # loop работает только внутри блокирующего вызова клиента,
+            # например login, который иначе никогда не завершится
+            self.loop.stop()
+
+    def _signal_handler(self, signum: int, frame: FrameType) -> None:
+        self.logger.debug('stop signal received')
+        self.stop(kill=True)
+
+    def create_client(self, settings: Settings) -> AsyncTelegram:
+        """Создает клиента, работающего через этот менеджер"""
+        return AsyncTelegram(settings, manager=self)
+
+    def create_tdjson(self) -> TDJson:
+        """Создает новый client_id в общей библиотеке"""
+        return TDJson(
+            library_path=self.library_path,
+            verbosity=self.verbosity,
+            codec=self.codec,
+        )
+
+    def register(self, client: AsyncTelegram) -> None:
+        self._clients[client._tdjson.td_client_id] = client
+
+    def start_client(self, client: AsyncTelegram) -> None:
+        """Запускает чтение tdlib и передает клиенту накопленные обновления"""
+        self.start_receiving()
+
+        client_id = client._tdjson.td_client_id
+        task = self._replay_tasks.get(client_id)
+        if client_id in self._backlogs and (task is None or task.done()):
+            self._replay_tasks[client_id] = self.loop.create_task(
+                self._replay_backlog(client_id, client)
+            )
+
+    async def _replay_backlog(self, client_id: int, client: AsyncTelegram) -> None:
+        backlog = self._backlogs.get(client_id)
+        while backlog and client.is_enabled:
+            await client._process_update(backlog.popleft())
+
+        if not backlog:
+            # новые обновления снова идут клиенту напрямую
+            self._backlogs.pop(client_id, None)
+
+    def start_receiving(self) -> None:
+        """Запускает общий воркер чтения tdlib, если он еще не запущен"""
+        if self._receive_task is None or self._receive_task.done():
+            self._receive_task = self.loop.create_task(self._receiver_worker())
+
+    async def _receiver_worker(self) -> None:
+        if self._receive_queue is None:
+            self._receive_queue = asyncio.Queue(self.receive_queue_size)
+
+        receiver = TDJsonReceiver(
+            self._tdjson,
+            self.loop,
+            self._receive_queue.put,
+            batch_size=self.receive_batch_size,
+            update_filter=self._should_decode,
+        )
+        receiver.start()
+
+        try:
+            while True:
+                batch = await self._receive_queue.get()
+                for update in batch:
+                    await self._route_update(update)
+        finally:
+            receiver.stop()
+
+    def _should_decode(self, raw: bytes) -> bool:
+        client = self._clients.get(sniff_client_id(raw))
+        if client is None or client.is_killing:
+            return False
+        if not client.is_enabled:
+            # обработчики клиента еще не известны, поэтому копится все
+            return True
+        return client._should_decode(raw)
+
+    async def _route_update(self, update: Dict[Any, Any]) -> None:
+        client_id = update.get('@client_id')
+        client = self._clients.get(client_id)
+        if client is None or client.is_killing:
+            self.logger.debug('update skipped: %s', update.get('@type'))
+            return
+
+        backlog = self._backlogs.get(client_id)
+        if client.is_enabled and backlog is None:
+            await client._process_update(update)
+            return
+
+        if backlog is None:
+            backlog = self._backlogs[client_id] = deque()
+        # пока очередь не разобрана, порядок сохраняется через нее
+        backlog.append(update)
+        if len(backlog) > self.backlog_size:
+            self._drop_oldest(client_id, backlog)
+
+    def _drop_oldest(self, client_id: int, backlog: Deque[Dict[Any, Any]]) -> None:
+        for index, update in enumerate(backlog):
+            if update.get('@type') != AUTHORIZATION_STATE:
+                break
+        else:
+            index = 0
+
+        dropped = backlog[index]
+        del backlog[index]
+        self.logger.warning(
+            'client %s backlog is full (%s), update dropped: %s',
+            client_id,
+            self.backlog_size,
+            dropped.get('@type'),
+        )
+
+    def run(self) -> None:
+        """Запускает всех зарегистрированных клиентов в общем event loop"""
+        self.logger.debug('running...')
+        self.is_running = True
+        for client in self.clients:
+            client.start()
+
+        try:
+            self.loop.run_forever()
+        finally:
+            self.logger.debug('cancel running forever')
+            self.is_running = False
+            for client in self.clients:
+                client.is_enabled = False
+                client.shutdown()
+
+            if self.is_killing:
+                self._shutdown_receiving()
+                self.loop.close()
+
+    def _shutdown_receiving(self) -> None:
+        tasks = list(self._replay_tasks.values())
+        self._replay_tasks.clear()
+        if self._receive_task is not None:
+            tasks.append(self._receive_task)
+            self._receive_task = None
+
+        if not tasks:
+            return
+
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def detach(self, client: AsyncTelegram) -> None:
+        """Останавливает задачи одного клиента, не останавливая event loop.
+        Запросы клиента, ожидающие ответа, завершаются RuntimeError
+        """
+        for task in client._loop_tasks:
+            task.cancel()
+        client._pending_requests.fail_all(RuntimeError('client is detached'))
+
+        if not any(c.is_enabled for c in self.clients):
+            self.loop.stop()
+
+    def stop(self, kill: bool = False) -> None:
+        if kill:
+            self.is_killing = True
+
+        for client in self.clients:
+            client.is_enabled = False
+            client.is_killing = client.is_killing or kill
+        self.loop.stop()
@@ -0,0 +1,129 @@
+import asyncio
+import heapq
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class PendingRequests:
+    """Таблица запросов, ожидающих ответа от tdlib
+
+    Ответ принимается только для request_id, зарегистрированных через register.
+    Сроки ожидания хранятся в куче, просроченные запросы завершаются
+    TimeoutError одним таймером event loop, который всегда установлен
+    на ближайший срок.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        max_size: Optional[int] = None,
+    ) -> None:
+        self._loop = loop
+        self.max_size = max_size
+
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._deadlines: List[Tuple[float, int, str, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.resolved_count = 0
+        self.expired_count = 0
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._futures
+
+    def get(self, request_id: str) -> Optional[asyncio.Future]:
+        return self._futures.get(request_id)
+
+    def register(
+        self,
+        request_id: str,
+        timeout: Optional[float] = 30,
+    ) -> asyncio.Future:
+        """Возвращает future, в который будет установлен ответ на запрос"""
+        future = self._futures.get(request_id)
+        if future is not None:
+            return future
+
+        if self.max_size and len(self._futures) >= self.max_size:
+            raise RuntimeError(f'too many pending requests: {len(self._futures)}')
+
+        future = self._loop.create_future()
+        self._futures[request_id] = future
+        future.add_done_callback(lambda f: self._discard(request_id, f))
+
+        if timeout is not None:
+            deadline = self._loop.time() + timeout
+            heapq.heappush(
+                self._deadlines, (deadline, next(self._counter), request_id, future)
+            )
+            if self._deadlines[0][3] is future:
+                self._schedule()
+
+        return future
+
+    def resolve(self, request_id: str, update: Dict[Any, Any]) -> bool:
+        """Устанавливает ответ. Возвращает False, если запрос никто не ждет"""
+        future = self._futures.pop(request_id, None)
+        if future is None or future.done():
+            return False
+
+        future.set_result(update)
+        self.resolved_count += 1
+        return True
+
+    def fail_all(self, exc: BaseException) -> int:
+        """Завершает все ожидающие запросы ошибкой exc.
+        Возвращает количество завершенных запросов
+        """
+        futures = list(self._futures.values())
+        self._futures.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(exc)
+
+        self._deadlines.clear()
+        self._schedule()
+        return len(futures)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'pending': len(self._futures),
+            'deadlines': len(self._deadlines),
+            'resolved': self.resolved_count,
+            'expired': self.expired_count,
+        }
+
+    def _discard(self, request_id: str, future: asyncio.Future) -> None:
+        if self._futures.get(request_id) is future:
+            del self._futures[request_id]
+
+        # завершенные запросы остаются в куче до своего срока,
+        # поэтому куча периодически пересобирается
+        if len(self._deadlines) > 2 * len(self._futures) + 64:
+            self._deadlines = [d for d in self._deadlines if not d[3].done()]
+            heapq.heapify(self._deadlines)
+            self._schedule()
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._deadlines:
+            self._timer = self._loop.call_at(self._deadlines[0][0], self._expire)
+
+    def _expire(self) -> None:
+        self._timer = None
+        now = self._loop.time()
+
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, request_id, future = heapq.heappop(self._deadlines)
+            if not future.done():
+                future.set_exception(TimeoutError(f'result not set {request_id}'))
+                self.expired_count += 1
+
+        self._schedule()
@@ -0,0 +1,204 @@
+"""Ограничение частоты исходящих запросов
+
+Перед отправкой запрос берет токен из общего бакета, бакета чата (по chat_id
+запроса) и бакета метода. Если tdlib ответил ошибкой 429
+"Too Many Requests: retry after N", полоса запроса (чат, а если его нет -
+метод) блокируется на N секунд, и запрос повторяется после паузы.
+"""
+import asyncio
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from .utils import Result
+
+_RETRY_AFTER_RE = re.compile(r'retry after (\d+)|FLOOD_WAIT_(\d+)', re.IGNORECASE)
+
+
+def parse_retry_after(result: Result) -> Optional[int]:
+    """Возвращает паузу в секундах из ошибки 429, иначе None"""
+    update = result.update
+    if not result.error_received or not update:
+        return None
+
+    match = _RETRY_AFTER_RE.search(update.get('message') or '')
+    if match is None:
+        if update.get('code') == 429:
+            return 1
+        return None
+    return int(match.group(1) or match.group(2))
+
+
+class TokenBucket:
+    """Бакет токенов: rate токенов в секунду, не больше capacity.
+
+    rate=None - без ограничения, бакет можно только заблокировать
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+    ) -> None:
+        self.rate = rate or None
+        self.capacity = capacity or max(rate or 1, 1)
+        self.tokens = self.capacity
+        self.updated: Optional[float] = None
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if self.updated is not None and self.rate is not None:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """Сколько секунд ждать до свободного токена"""
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        if self.rate is None:
+            return 0.0
+
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now: float) -> None:
+        if self.rate is not None:
+            self._refill(now)
+            self.tokens -= 1
+
+    def block(self, until: float) -> None:
+        self.blocked_until = max(self.blocked_until, until)
+
+    def is_idle(self, now: float) -> bool:
+        """Бакет полон и не заблокирован - его можно удалить"""
+        if self.blocked_until > now:
+            return False
+        if self.rate is None:
+            return True
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+class RequestScheduler:
+    """Планировщик исходящих запросов с бакетами токенов
+
+    global_rate - запросов в секунду на весь клиент,
+    chat_rate - запросов в секунду в один чат,
+    method_rates - запросов в секунду по имени метода tdlib,
+    max_retries - сколько раз повторять запрос после ошибки 429.
+    По умолчанию 0: ошибка возвращается вызывающему без повтора,
+    max_retry_after - не повторять, если tdlib просит ждать дольше
+    """
+
+    # при превышении бакеты чатов без ограничений удаляются
+    max_chat_buckets = 10000
+
+    def __init__(
+        self,
+        global_rate: Optional[float] = None,
+        chat_rate: Optional[float] = None,
+        method_rates: Optional[Dict[str, float]] = None,
+        max_retries: int = 0,
+        max_retry_after: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.chat_rate = chat_rate
+        self.method_rates = method_rates or {}
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self._clock = clock
+
+        self._global = TokenBucket(global_rate)
+        self._chats: Dict[Hashable, TokenBucket] = {}
+        self._methods: Dict[str, TokenBucket] = {}
+
+        self.waited = 0.0
+        self.retries = 0
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        return {
+            'waited': self.waited,
+            'retries': self.retries,
+            'chat_buckets': len(self._chats),
+            'blocked_chats': sum(
+                1 for bucket in self._chats.values() if bucket.blocked_until > now
+            ),
+        }
+
+    def _chat_bucket(self, chat_id: Hashable) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= self.max_chat_buckets:
+                self._prune()
+            bucket = self._chats[chat_id] = TokenBucket(self.chat_rate)
+        return bucket
+
+    def _method_bucket(self, method: str) -> TokenBucket:
+        bucket = self._methods.get(method)
+        if bucket is None:
+            bucket = self._methods[method] = TokenBucket(self.method_rates.get(method))
+        return bucket
+
+    def _prune(self) -> None:
+        now = self._clock()
+        for chat_id in [k for k, b in self._chats.items() if b.is_idle(now)]:
+            del self._chats[chat_id]
+
+    def _buckets(self, method: str, chat_id: Optional[Hashable]) -> List[TokenBucket]:
+        buckets = [self._global, self._method_bucket(method)]
+        if chat_id:
+            buckets.append(self._chat_bucket(chat_id))
+        return buckets
+
+    async def acquire(self, method: str, chat_id: Optional[Hashable] = None) -> None:
+        """Ждет, пока во всех бакетах запроса будет свободный токен"""
+        buckets = self._buckets(method, chat_id)
+
+        while True:
+            now = self._clock()
+            delay = max(bucket.delay(now) for bucket in buckets)
+            if delay <= 0:
+                for bucket in buckets:
+                    bucket.consume(now)
+                return
+
+            self.waited += delay
+            await asyncio.sleep(delay)
+
+    def park(self, method: str, chat_id: Optional[Hashable], seconds: float) -> None:
+        """Блокирует полосу запроса: чат, а без chat_id - метод"""
+        until = self._clock() + seconds
+        if chat_id:
+            self._chat_bucket(chat_id).block(until)
+        else:
+            self._method_bucket(method).block(until)
+
+    async def send(
+        self,
+        method: str,
+        chat_id: Optional[Hashable],
+        send: Callable[[], Awaitable[Result]],
+    ) -> Result:
+        """Отправляет запрос с учетом лимитов и повторяет его после 429.
+        send вызывается на каждую попытку и должен отправлять новый запрос
+        """
+        attempt = 0
+        while True:
+            await self.acquire(method, chat_id)
+            result = await send()
+
+            retry_after = parse_retry_after(result)
+            if retry_after is None:
+                return result
+
+            self.park(method, chat_id, retry_after)
+            if attempt >= self.max_retries or retry_after > self.max_retry_after:
+                return result
+
+            attempt += 1
+            self.retries += 1
@@ -0,0 +1,190 @@
+"""Хранилище сущностей клиента
+
+Пользователи, чаты, супергруппы и базовые группы приходят от tdlib
+полными обновлениями (updateUser, updateNewChat, ...) и частичными
+(updateUserStatus, updateChatTitle, ...). Хранилище держит один объект
+на каждый id: полное обновление переинициализирует существующий объект,
+частичное - обновляет его raw и перекодирует только изменившиеся поля.
+"""
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+
+from .types.base import RawDataclass
+from .types.basicgroup import BasicGroup
+from .types.chat import Chat
+from .types.supergroup import Supergroup
+from .types.user import User
+
+if TYPE_CHECKING:
+    from .client import AsyncTelegram
+
+USERS = 'users'
+CHATS = 'chats'
+SUPERGROUPS = 'supergroups'
+BASIC_GROUPS = 'basic_groups'
+
+ENTITY_CLASSES: Dict[str, Type[RawDataclass]] = {
+    USERS: User,
+    CHATS: Chat,
+    SUPERGROUPS: Supergroup,
+    BASIC_GROUPS: BasicGroup,
+}
+
+# тип объекта tdlib (ответ на getUser, getChat, ...) -> хранилище
+OBJECT_TYPES: Dict[str, str] = {
+    'user': USERS,
+    'chat': CHATS,
+    'supergroup': SUPERGROUPS,
+    'basicGroup': BASIC_GROUPS,
+}
+
+# обновление с полным объектом -> (хранилище, поле с объектом)
+FULL_UPDATES: Dict[str, Tuple[str, str]] = {
+    'updateUser': (USERS, 'user'),
+    'updateNewChat': (CHATS, 'chat'),
+    'updateSupergroup': (SUPERGROUPS, 'supergroup'),
+    'updateBasicGroup': (BASIC_GROUPS, 'basic_group'),
+}
+
+# обновление с частью полей объекта -> (хранилище, поле с id)
+PARTIAL_UPDATES: Dict[str, Tuple[str, str]] = {
+    'updateUserStatus': (USERS, 'user_id'),
+    **{
+        update_type: (CHATS, 'chat_id')
+        for update_type in (
+            'updateChatTitle',
+            'updateChatPhoto',
+            'updateChatAccentColors',
+            'updateChatPermissions',
+            'updateChatLastMessage',
+            'updateChatReadInbox',
+            'updateChatReadOutbox',
+            'updateChatActionBar',
+            'updateChatAvailableReactions',
+            'updateChatDraftMessage',
+            'updateChatEmojiStatus',
+            'updateChatMessageSender',
+            'updateChatMessageAutoDeleteTime',
+            'updateChatNotificationSettings',
+            'updateChatPendingJoinRequests',
+            'updateChatReplyMarkup',
+            'updateChatBackground',
+            'updateChatTheme',
+            'updateChatUnreadMentionCount',
+            'updateChatUnreadReactionCount',
+            'updateChatVideoChat',
+            'updateChatDefaultDisableNotification',
+            'updateChatHasProtectedContent',
+            'updateChatIsTranslatable',
+            'updateChatIsMarkedAsUnread',
+            'updateChatViewAsTopics',
+            'updateChatBlockList',
+            'updateChatHasScheduledMessages',
+        )
+    },
+}
+
+CHAT_POSITION_UPDATE = 'updateChatPosition'
+
+# служебные поля ответа tdlib, не относящиеся к объекту
+_RESPONSE_KEYS = ('@extra', '@client_id')
+_SERVICE_KEYS = ('@type', *_RESPONSE_KEYS)
+
+
+class EntityStore:
+    """Хранилище пользователей, чатов, супергрупп и базовых групп"""
+
+    def __init__(self) -> None:
+        self._entities: Dict[str, Dict[int, RawDataclass]] = {
+            kind: {} for kind in ENTITY_CLASSES
+        }
+
+    @property
+    def update_types(self) -> Tuple[str, ...]:
+        """Типы обновлений, которыми наполняется хранилище"""
+        return (
+            *OBJECT_TYPES,
+            *FULL_UPDATES,
+            *PARTIAL_UPDATES,
+            CHAT_POSITION_UPDATE,
+        )
+
+    def attach(self, client: 'AsyncTelegram') -> None:
+        """Подписывает хранилище на обновления клиента"""
+        for update_type in self.update_types:
+            client.add_update_listener(update_type, self.process_update)
+
+    def get(self, kind: str, entity_id: int) -> Optional[RawDataclass]:
+        return self._entities[kind].get(entity_id)
+
+    def get_user(self, user_id: int) -> Optional[User]:
+        return self._entities[USERS].get(user_id)
+
+    def get_chat(self, chat_id: int) -> Optional[Chat]:
+        return self._entities[CHATS].get(chat_id)
+
+    def get_supergroup(self, supergroup_id: int) -> Optional[Supergroup]:
+        return self._entities[SUPERGROUPS].get(supergroup_id)
+
+    def get_basic_group(self, basic_group_id: int) -> Optional[BasicGroup]:
+        return self._entities[BASIC_GROUPS].get(basic_group_id)
+
+    def stats(self) -> Dict[str, int]:
+        return {kind: len(entities) for kind, entities in self._entities.items()}
+
+    def put(self, kind: str, raw: Dict[Any, Any]) -> RawDataclass:
+        """Сохраняет полный объект. Существующий объект обновляется на месте"""
+        raw = {key: value for key, value in raw.items() if key not in _RESPONSE_KEYS}
+
+        entity = self._entities[kind].get(raw['id'])
+        if entity is None:
+            entity = ENTITY_CLASSES[kind](raw)
+            self._entities[kind][entity.id] = entity
+        else:
+            entity.replace_raw(raw)
+        return entity
+
+    def merge(
+        self, kind: str, entity_id: int, values: Dict[Any, Any]
+    ) -> Optional[RawDataclass]:
+        """Обновляет часть полей объекта, если он есть в хранилище"""
+        entity = self._entities[kind].get(entity_id)
+        if entity is not None:
+            entity.merge_raw(values)
+        return entity
+
+    def process_update(self, update: Dict[Any, Any]) -> None:
+        update_type = update.get('@type')
+
+        if update_type in OBJECT_TYPES:
+            self.put(OBJECT_TYPES[update_type], update)
+
+        elif update_type in FULL_UPDATES:
+            kind, key = FULL_UPDATES[update_type]
+            self.put(kind, update[key])
+
+        elif update_type in PARTIAL_UPDATES:
+            kind, id_key = PARTIAL_UPDATES[update_type]
+            values = {
+                key: value
+                for key, value in update.items()
+                if key != id_key and key not in _SERVICE_KEYS
+            }
+            self.merge(kind, update[id_key], values)
+
+        elif update_type == CHAT_POSITION_UPDATE:
+            self._update_chat_position(update['chat_id'], update['position'])
+
+    def _update_chat_position(self, chat_id: int, position: Dict[Any, Any]) -> None:
+        """Заменяет позицию чата в том же списке, нулевой order ее удаляет"""
+        chat = self._entities[CHATS].get(chat_id)
+        if chat is None:
+            return
+
+        positions = [
+            item
+            for item in chat.raw.get('positions', [])
+            if item.get('list') != position.get('list')
+        ]
+        if str(position.get('order', 0)) != '0':
+            positions.append(position)
+        chat.merge_raw({'positions': positions})
@@ -1,10 +1,14 @@
-import json
+import asyncio
+import concurrent.futures
 import logging
+import threading
 from ctypes import CDLL, CFUNCTYPE, c_char_p, c_double, c_int, c_void_p
-from typing import Any, Dict, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 import pkg_resources
 
+from .codec import JSONCodec, get_codec
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,41 +18,79 @@ def _get_tdjson_lib_path() -> str:
     return pkg_resources.resource_filename('telegram', f'lib/{lib_name}')
 
 
+_libraries: Dict[str, CDLL] = {}
+
+
+def _load_library(library_path: str) -> CDLL:
+    """Загружает libtdjson один раз на процесс и описывает сигнатуры функций"""
+    library = _libraries.get(library_path)
+    if library is not None:
+        return library
+
+    library = CDLL(library_path)
+
+    library.td_create_client_id.restype = c_int
+    library.td_create_client_id.argtypes = []
+
+    library.td_receive.restype = c_char_p
+    library.td_receive.argtypes = [c_double]
+
+    library.td_send.restype = None
+    library.td_send.argtypes = [c_int, c_char_p]
+
+    library.td_execute.restype = c_char_p
+    library.td_execute.argtypes = [c_char_p]
+
+    library.td_json_client_destroy.restype = None
+    library.td_json_client_destroy.argtypes = [c_void_p]
+
+    _libraries[library_path] = library
+    return library
+
+
 class TDJson:
-    def __init__(self, library_path: Optional[str] = None, verbosity: int = 2) -> None:
+    """Обертка над libtdjson для одного client_id.
+
+    Библиотека загружается один раз на процесс, поэтому несколько
+    экземпляров TDJson разделяют её и td_receive, который возвращает
+    обновления всех клиентов с полем @client_id.
+    Экземпляр с create_client=False не создает client_id и
+    используется только для чтения td_receive и td_execute.
+    codec - имя JSON кодека или его экземпляр, по умолчанию выбирается
+    самый быстрый из установленных.
+    """
+
+    def __init__(
+        self,
+        library_path: Optional[str] = None,
+        verbosity: int = 2,
+        create_client: bool = True,
+        codec: Union[None, str, JSONCodec] = None,
+    ) -> None:
         if library_path is None:
             library_path = _get_tdjson_lib_path()
 
-        self._build_client(library_path, verbosity)
+        if not isinstance(codec, JSONCodec):
+            codec = get_codec(codec)
+        self.codec = codec
+
+        self.td_client_id: Optional[int] = None
+        self._build_client(library_path, verbosity, create_client)
 
     def __del__(self) -> None:
         self.stop()
 
-    def _build_client(self, library_path: str, verbosity: int) -> None:
-        self._tdjson = CDLL(library_path)
+    def _build_client(
+        self, library_path: str, verbosity: int, create_client: bool = True
+    ) -> None:
+        self._tdjson = _load_library(library_path)
 
         # load TDLib functions from shared library
         self._td_create_client_id = self._tdjson.td_create_client_id
-        self._td_create_client_id.restype = c_int
-        self._td_create_client_id.argtypes = []
-
-        self.td_client_id = self._td_create_client_id()
-
         self._td_receive = self._tdjson.td_receive
-        self._td_receive.restype = c_char_p
-        self._td_receive.argtypes = [c_double]
-
         self._td_send = self._tdjson.td_send
-        self._td_send.restype = None
-        self._td_send.argtypes = [c_int, c_char_p]
-
         self._td_execute = self._tdjson.td_execute
-        self._td_execute.restype = c_char_p
-        self._td_execute.argtypes = [c_char_p]
-
         self._td_json_client_destroy = self._tdjson.td_json_client_destroy
-        self._td_json_client_destroy.restype = None
-        self._td_json_client_destroy.argtypes = [c_void_p]
 
         # Segmentation fault (core dumped)
         # log_message_callback_type = CFUNCTYPE(None, c_int, c_char_p)
@@ -79,34 +121,140 @@ class TDJson:
             )
         )
 
+        if not create_client:
+            return
+
+        self.td_client_id = self._td_create_client_id()
+
         # start the client by sending a request to it
         self.send({'@type': 'getOption', 'name': 'version'})
 
     def send(self, query: Dict[Any, Any]) -> None:
-        dumped_query = json.dumps(query).encode('utf-8')
+        dumped_query = self.codec.dumps(query)
         self._td_send(self.td_client_id, dumped_query)
 
-    def receive(self) -> Union[None, Dict[Any, Any]]:
-        result_str = self._td_receive(1.0)
+    def receive(self, timeout: float = 1.0) -> Union[None, Dict[Any, Any]]:
+        result_str = self._td_receive(timeout)
 
         if result_str:
-            result: Dict[Any, Any] = json.loads(result_str.decode('utf-8'))
+            result: Dict[Any, Any] = self.codec.loads(result_str)
             return result
 
         return None
 
+    def receive_raw(self, timeout: float = 1.0) -> Optional[bytes]:
+        """Возвращает обновление без декодирования JSON"""
+        return self._td_receive(timeout) or None
+
+    def decode(self, result_str: bytes) -> Dict[Any, Any]:
+        return self.codec.loads(result_str)
+
     def td_execute(self, query: Dict[Any, Any]) -> Union[Dict[Any, Any], Any]:
-        dumped_query = json.dumps(query).encode('utf-8')
+        dumped_query = self.codec.dumps(query)
         result_str = self._td_execute(dumped_query)
 
         if result_str:
-            result: Dict[Any, Any] = json.loads(result_str.decode('utf-8'))
+            result: Dict[Any, Any] = self.codec.loads(result_str)
             return result
 
         return None
 
     def stop(self) -> None:
+        if getattr(self, 'td_client_id', None) is None:
+            return
+
         if hasattr(self, '_tdjson') and hasattr(
             self._tdjson, '_td_json_client_destroy'
         ):
             self._td_json_client_destroy(self.td_client_id)
+
+
+class TDJsonReceiver(threading.Thread):
+    """Поток, который непрерывно читает td_receive и передает
+    накопленные обновления в event loop пачками.
+
+    callback - корутина, которая принимает пачку обновлений, например
+    asyncio.Queue.put ограниченной очереди. Поток ждет ее завершения перед
+    следующим чтением, поэтому медленная обработка в loop притормаживает
+    чтение tdlib, а не копит обновления в памяти.
+
+    update_filter получает сырые bytes обновления и решает, нужно ли его
+    декодировать. Отброшенные обновления не декодируются и не передаются в loop.
+    Обновление, на котором упал update_filter или декодирование, пропускается.
+    """
+
+    def __init__(
+        self,
+        tdjson: TDJson,
+        loop: asyncio.AbstractEventLoop,
+        callback: Callable[[List[Dict[Any, Any]]], Awaitable[Any]],
+        batch_size: int = 100,
+        timeout: float = 1.0,
+        update_filter: Optional[Callable[[bytes], bool]] = None,
+    ) -> None:
+        super().__init__(name='tdjson-receiver', daemon=True)
+        self._tdjson = tdjson
+        self._loop = loop
+        self._callback = callback
+        self._batch_size = max(batch_size, 1)
+        self._timeout = timeout
+        self._update_filter = update_filter
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            raw = self._tdjson.receive_raw(self._timeout)
+
+            batch = []
+            # забираем все, что уже готово, не дожидаясь новых обновлений
+            while raw is not None:
+                update = self._decode(raw)
+                if update is not None:
+                    batch.append(update)
+                if len(batch) >= self._batch_size:
+                    break
+                raw = self._tdjson.receive_raw(0)
+
+            if batch and not self._put(batch):
+                break
+
+    def _decode(self, raw: bytes) -> Optional[Dict[Any, Any]]:
+        try:
+            if self._update_filter is not None and not self._update_filter(raw):
+                return None
+            return self._tdjson.decode(raw)
+        except Exception:
+            logger.exception('Failed to decode update: %r', raw)
+            return None
+
+    def _put(self, batch: List[Dict[Any, Any]]) -> bool:
+        """Передает пачку в loop и ждет, пока loop ее примет.
+        False, если loop закрыт или поток остановлен
+        """
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._callback(batch), self._loop)
+        except RuntimeError:
+            logger.debug('event loop is closed, receiver stopped')
+            return False
+
+        while True:
+            try:
+                future.result(self._timeout)
+                return True
+            except concurrent.futures.TimeoutError:
+                if self._stop_event.is_set():
+                    future.cancel()
+                    return False
+            except concurrent.futures.CancelledError:
+                return False
+            except Exception:
+                logger.exception('Failed to pass updates to event loop')
+                return True
+
+    def stop(self) -> None:
+        """Останавливает поток и ждет его завершения не дольше таймаута
+        td_receive, чтобы новый поток не читал tdlib одновременно со старым
+        """
+        self._stop_event.set()
+        if self.is_alive() and self is not threading.current_thread():
+            self.join(self._timeout)
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from .utils import Result
+
+if TYPE_CHECKING:
+    from .client import AsyncTelegram
+
+SEND_SUCCEEDED = 'updateMessageSendSucceeded'
+SEND_FAILED = 'updateMessageSendFailed'
+
+MessageKey = Tuple[int, int]
+
+
+class MessageSendTracker:
+    """Отслеживает доставку отправленных сообщений
+
+    sendMessage возвращает сообщение с временным id, а результат отправки
+    приходит позже обновлением updateMessageSendSucceeded или
+    updateMessageSendFailed с old_message_id. Трекер связывает их по
+    (chat_id, old_message_id). Обновления, пришедшие раньше, чем сообщение
+    начали отслеживать, хранятся в буфере не дольше early_ttl секунд
+    и не больше max_early штук: результаты сообщений, которые никто
+    не отслеживает, в памяти не копятся.
+    """
+
+    def __init__(
+        self,
+        max_early: int = 10000,
+        early_ttl: float = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_early = max_early
+        self.early_ttl = early_ttl
+        self._clock = clock
+        self._futures: Dict[MessageKey, asyncio.Future] = {}
+        # ключ -> (срок хранения, обновление), по возрастанию срока
+        self._early: 'OrderedDict[MessageKey, Tuple[float, Dict[Any, Any]]]' = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def attach(self, client: 'AsyncTelegram') -> None:
+        """Подписывает трекер на обновления результатов отправки клиента"""
+        for update_type in (SEND_SUCCEEDED, SEND_FAILED):
+            client.add_update_listener(update_type, self.process_update)
+
+    def track(self, chat_id: int, message_id: int) -> asyncio.Future:
+        """Future, в который будет установлено обновление с результатом"""
+        key = (chat_id, message_id)
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self._expire_early()
+        early = self._early.pop(key, None)
+        if early is not None:
+            future.set_result(early[1])
+            return future
+
+        self._futures[key] = future
+        future.add_done_callback(lambda f: self._discard(key, f))
+        return future
+
+    async def wait(
+        self, message: Dict[Any, Any], timeout: Optional[float] = None
+    ) -> Dict[Any, Any]:
+        """Ждет результат отправки сообщения из ответа sendMessage.
+
+        Если сообщение уже отправлено, возвращает его без ожидания
+        """
+        if message.get('sending_state') is None:
+            return {'@type': SEND_SUCCEEDED, 'message': message}
+
+        future = self.track(message['chat_id'], message['id'])
+        return await asyncio.wait_for(future, timeout)
+
+    def handle(self, result: Result) -> 'SentMessage':
+        """Оборачивает ответ sendMessage в SentMessage.
+        Отслеживание начинается сразу, до ожидания результата
+        """
+        message = result.update
+        future = None
+        if result.ok_received and message.get('sending_state') is not None:
+            future = self.track(message['chat_id'], message['id'])
+        return SentMessage(result, future)
+
+    def process_update(self, update: Dict[Any, Any]) -> None:
+        key = (update['message']['chat_id'], update['old_message_id'])
+        future = self._futures.pop(key, None)
+        if future is not None:
+            if not future.done():
+                future.set_result(update)
+            return
+
+        now = self._clock()
+        self._early[key] = (now + self.early_ttl, update)
+        self._early.move_to_end(key)
+        self._expire_early(now)
+        while len(self._early) > self.max_early:
+            self._early.popitem(last=False)
+
+    def _expire_early(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = self._clock()
+        while self._early:
+            key, (deadline, _) = next(iter(self._early.items()))
+            if deadline > now:
+                break
+            del self._early[key]
+
+    def _discard(self, key: MessageKey, future: asyncio.Future) -> None:
+        if self._futures.get(key) is future:
+            del self._futures[key]
+
+
+class SentMessage:
+    """Отправленное сообщение, результат отправки которого может быть
+    еще неизвестен.
+
+    result - ответ sendMessage с временным сообщением. await или wait()
+    возвращает Result с окончательным сообщением после
+    updateMessageSendSucceeded или с ошибкой после updateMessageSendFailed
+    """
+
+    def __init__(self, result: Result, future: Optional[asyncio.Future]) -> None:
+        self.result = result
+        self.future = future
+
+    @property
+    def message(self) -> Optional[Dict[Any, Any]]:
+        """Временное сообщение из ответа sendMessage"""
+        return self.result.update if self.result.ok_received else None
+
+    def done(self) -> bool:
+        return self.future is None or self.future.done()
+
+    async def wait(self, timeout: Optional[float] = None) -> Result:
+        """Ждет результат отправки. При таймауте ожидание можно повторить"""
+        if self.future is None:
+            return self.result
+
+        update = await asyncio.wait_for(asyncio.shield(self.future), timeout)
+        if is_send_succeeded(update):
+            return Result(self.result._data, update['message'], self.result.id)
+        return Result(self.result._data, update['error'], self.result.id)
+
+    def cancel(self) -> None:
+        """Прекращает отслеживание результата отправки"""
+        if self.future is not None:
+            self.future.cancel()
+
+    def __await__(self):
+        return self.wait().__await__()
+
+
+def is_send_succeeded(update: Dict[Any, Any]) -> bool:
+    return update.get('@type') == SEND_SUCCEEDED
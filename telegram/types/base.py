@@ -1,7 +1,8 @@
 import json
-from dataclasses import asdict, dataclass, field, fields
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Callable, Dict, Type
+from functools import lru_cache
+from typing import Callable, ClassVar, Dict, Optional, Tuple, Type
 
 
 def default_getter(value):
@@ -22,11 +23,27 @@ class RawDataclass:
     автоматическим определением
 
     Метод .as_json возвращает текстовое представление объекта в формате JSON
+
+    Метод .to_bytes сериализует декодированные поля в JSON через быстрый кодек
+
+    Для каждого дочернего класса один раз составляется план декодирования -
+    кортеж (атрибут, конвертер, вложенный ли объект), который затем
+    применяется к каждому экземпляру без разбора полей датакласса
+
+    Если у класса lazy = True, вложенные RawDataclass и ObjectBuilder поля
+    декодируются из raw только при первом обращении к атрибуту.
+    Режим включается для отдельного класса (Chat.lazy = True)
+    или для всех сразу (RawDataclass.lazy = True)
     """
 
     raw: dict = field(repr=False)
     class_type: str = field(default='RawDataclass')
 
+    lazy: ClassVar[bool] = False
+    _decode_plan: ClassVar[Optional[Tuple[Tuple[str, Callable, bool], ...]]] = None
+    _field_names: ClassVar[Optional[Tuple[str, ...]]] = None
+    _lazy_fields_installed: ClassVar[bool] = False
+
     def __post_init__(self):
         self.class_type = self.__class__.__name__
         if self.raw is None:
@@ -34,22 +51,52 @@ class RawDataclass:
 
         self._assign_raw()
 
-        keys = self.raw.keys()
-        keys = list(keys)
-        for key in keys:
-            if hasattr(self, key) and getattr(self, key, None) is None:
-                key_field = self.__dataclass_fields__.get(key)
-
-                if key_field:
-                    if 'getter' in key_field.metadata:
-                        value_type = key_field.metadata['getter']
-                    else:
-                        value_type = key_field.type
+        raw = self.raw
+        values = self.__dict__
+        lazy = self.lazy and self._install_lazy_fields()
+        for key, converter, nested in self._get_decode_plan():
+            if key in raw and values[key] is None:
+                if lazy and nested:
+                    # значение вычислит _LazyField при первом обращении
+                    del values[key]
                 else:
-                    value_type = default_getter
+                    values[key] = converter(raw[key])
+
+    @classmethod
+    def _get_decode_plan(cls) -> Tuple[Tuple[str, Callable, bool], ...]:
+        plan = cls.__dict__.get('_decode_plan')
+        if plan is None:
+            plan = cls._compile_decode_plan()
+            cls._decode_plan = plan
+        return plan
+
+    @classmethod
+    def _compile_decode_plan(cls) -> Tuple[Tuple[str, Callable, bool], ...]:
+        """Составляет план декодирования по полям датакласса"""
+        plan = []
+        for cls_field in fields(cls):
+            if cls_field.name in _BASE_FIELDS:
+                continue
+
+            converter = cls_field.metadata.get('getter', cls_field.type)
+            nested = isinstance(converter, ObjectBuilder) or (
+                isinstance(converter, type) and issubclass(converter, RawDataclass)
+            )
+            plan.append((cls_field.name, converter, nested))
 
-                value = value_type(self.raw[key])
-                setattr(self, key, value)
+        return tuple(plan)
+
+    @classmethod
+    def _install_lazy_fields(cls) -> bool:
+        """Устанавливает _LazyField на вложенные поля при первом создании
+        объекта в lazy режиме. Без lazy режима классы остаются без дескрипторов
+        """
+        if not cls.__dict__.get('_lazy_fields_installed'):
+            for key, converter, nested in cls._get_decode_plan():
+                if nested:
+                    setattr(cls, key, _LazyField(key, converter))
+            cls._lazy_fields_installed = True
+        return True
 
     def _assign_raw(self):
         pass
@@ -60,6 +107,42 @@ class RawDataclass:
         if value:
             setattr(self, key, field_cls(value))
 
+    def merge_raw(self, values: dict):
+        """Обновляет raw значениями из values и заново декодирует
+        только изменившиеся поля. Объект остается тем же
+        """
+        self.raw.update(values)
+
+        instance_values = self.__dict__
+        dataclass_fields = self.__dataclass_fields__
+        for key in values:
+            if key in dataclass_fields and key not in _BASE_FIELDS:
+                instance_values[key] = None
+
+        self._decode_values(values)
+
+    def replace_raw(self, raw: dict):
+        """Заменяет raw целиком и заново декодирует все поля.
+        Объект остается тем же
+        """
+        instance_values = self.__dict__
+        for key in self._get_field_names():
+            if key not in _BASE_FIELDS:
+                instance_values[key] = None
+
+        self.raw = raw
+        self._decode_values(raw)
+
+    def _decode_values(self, values: dict):
+        """Декодирует из values поля, которые еще не установлены"""
+        self._assign_raw()
+
+        instance_values = self.__dict__
+        for key, converter, nested in self._get_decode_plan():
+            value = values.get(key)
+            if value is not None and instance_values[key] is None:
+                instance_values[key] = converter(value)
+
     def to_json(self):
         """Сериализация исходного словаря в JSON формат"""
         return json.dumps(self.raw, ensure_ascii=False)
@@ -70,8 +153,97 @@ class RawDataclass:
         data_dict = json.loads(data)
         return cls(data_dict)
 
-    def asdict(self):
-        return asdict(self, dict_factory=dict_factory)
+    def asdict(self, include_raw: bool = True, nested_raw: bool = True):
+        """Словарь со значениями всех полей объекта.
+
+        В отличие от dataclasses.asdict, поля обходятся по закешированному
+        списку, а raw не копируется и передается ссылкой.
+        include_raw - добавить raw самого объекта,
+        nested_raw - добавить raw вложенных объектов
+        """
+        return _asdict(self, include_raw, nested_raw)
+
+    def to_bytes(
+        self,
+        include_raw: bool = False,
+        nested_raw: bool = False,
+        codec: Optional[str] = None,
+    ) -> bytes:
+        """Сериализация декодированных полей в JSON сразу в bytes.
+
+        codec - имя кодека из telegram.codec.CODECS,
+        по умолчанию выбирается самый быстрый из установленных
+        """
+        return _get_codec(codec).dumps(self.asdict(include_raw, nested_raw))
+
+    @classmethod
+    def _get_field_names(cls) -> Tuple[str, ...]:
+        names = cls.__dict__.get('_field_names')
+        if names is None:
+            names = tuple(cls_field.name for cls_field in fields(cls))
+            cls._field_names = names
+        return names
+
+    def compact(self, drop_raw: bool = False):
+        """Компактная копия объекта со __slots__, см. telegram.types.compact"""
+        from telegram.types.compact import to_compact
+
+        return to_compact(self, drop_raw=drop_raw)
+
+
+_BASE_FIELDS = ('raw', 'class_type')
+
+
+def _asdict(obj: RawDataclass, include_raw: bool, nested_raw: bool) -> dict:
+    result = {}
+    for name in obj._get_field_names():
+        if name == 'raw':
+            if include_raw:
+                result[name] = obj.raw
+        else:
+            result[name] = _asdict_value(getattr(obj, name), nested_raw)
+    return result
+
+
+def _asdict_value(value, nested_raw: bool):
+    if isinstance(value, RawDataclass):
+        return _asdict(value, nested_raw, nested_raw)
+    if isinstance(value, Enum):
+        return str(value)
+    if isinstance(value, list):
+        return [_asdict_value(item, nested_raw) for item in value]
+    if isinstance(value, dict):
+        return {key: _asdict_value(item, nested_raw) for key, item in value.items()}
+    return value
+
+
+@lru_cache(maxsize=None)
+def _get_codec(name: Optional[str] = None):
+    from telegram.codec import get_codec
+
+    return get_codec(name)
+
+
+class _LazyField:
+    """Вложенное поле, которое декодируется из raw при первом обращении.
+
+    Значение кэшируется в __dict__ экземпляра, поэтому дескриптор
+    вызывается только один раз
+    """
+
+    __slots__ = ('name', 'converter')
+
+    def __init__(self, name: str, converter: Callable) -> None:
+        self.name = name
+        self.converter = converter
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return None
+
+        value = self.converter(instance.raw[self.name])
+        instance.__dict__[self.name] = value
+        return value
 
 
 class ObjectBuilder:
@@ -87,44 +259,109 @@ class ObjectBuilder:
         )
 
 
+@dataclass()
+class TDObject(RawDataclass):
+    """
+    Базовый класс типов, сгенерированных из td_api.tl
+
+    Вместо общего плана декодирования у каждого класса есть
+    сгенерированный метод ._decode, который построчно переносит
+    значения из raw в атрибуты. Метод .from_raw создает объект
+    без вызова __init__ датакласса
+    """
+
+    def __post_init__(self):
+        self.class_type = self.__class__.__name__
+        if self.raw is not None:
+            self._decode(self.raw)
+
+    @classmethod
+    def from_raw(cls, raw: dict):
+        instance = cls.__new__(cls)
+        instance.raw = raw
+        instance.class_type = cls.__name__
+        instance._decode(raw)
+        return instance
+
+    def merge_raw(self, values: dict):
+        """Обновляет raw значениями из values и заново декодирует объект.
+        Типы полей сгенерированных классов заданы строками, поэтому
+        вместо плана декодирования используется ._decode
+        """
+        self.raw.update(values)
+        self._decode(self.raw)
+
+    def replace_raw(self, raw: dict):
+        self.raw = raw
+        self._decode(raw)
+
+    def _decode(self, raw: dict):
+        pass
+
+
+class TDObjectBuilder(ObjectBuilder):
+    """Билдер сгенерированных типов, создает объекты через from_raw"""
+
+    def __call__(self, object_dict, *args, **kwargs):
+        cls = self.mapping.get(object_dict[self.key])
+        if cls is None:
+            return self.default(object_dict, *args, **kwargs)
+        return cls.from_raw(object_dict)
+
+
 def build_variables(cls: Type[RawDataclass], base=None):
     """Пробегается по всему дереву вложенных объектов и
     возвращает список из возможных переменных для доступа к значению
     через f-strings
 
     например {message.chat.last_message.sender.id}
+
+    Дерево обходится один раз для каждого класса, затем используется
+    закешированный список путей относительно base
     """
-    variables = []
     base = base or cls.__name__.lower()
+    return [base + suffix for suffix in _build_suffixes(cls)]
+
+
+def build_variables_for_object_builder(cls_field, base):
+    """Пробегается по ObjectBuilder.mapping и объединяет всевозможные поля"""
+    return [base + suffix for suffix in _build_builder_suffixes(cls_field.type)]
+
+
+@lru_cache(maxsize=None)
+def _build_suffixes(cls: Type[RawDataclass]) -> Tuple[str, ...]:
+    suffixes = []
 
     for cls_field in fields(cls):
         if not cls_field.repr:
             continue
 
-        variable = f'{base}.{cls_field.name}'
-        _variables = [variable]
+        suffix = f'.{cls_field.name}'
 
         if isinstance(cls_field.type, ObjectBuilder):
-            _variables = build_variables_for_object_builder(cls_field, variable)
+            suffixes.extend(
+                suffix + child for child in _build_builder_suffixes(cls_field.type)
+            )
 
         elif isinstance(cls_field.type, type) and issubclass(
             cls_field.type, RawDataclass
         ):
-            _variables = build_variables(cls_field.type, variable)
+            suffixes.extend(suffix + child for child in _build_suffixes(cls_field.type))
 
-        variables.extend(_variables)
+        else:
+            suffixes.append(suffix)
 
-    return variables
+    return tuple(suffixes)
 
 
-def build_variables_for_object_builder(cls_field, base):
-    """Пробегается по ObjectBuilder.mapping и объединяет всевозможные поля"""
-    return list(
-        {
-            var
-            for child_cls in cls_field.type.mapping.values()
-            for var in build_variables(child_cls, base)
-        }
+@lru_cache(maxsize=None)
+def _build_builder_suffixes(builder: ObjectBuilder) -> Tuple[str, ...]:
+    return tuple(
+        dict.fromkeys(
+            suffix
+            for child_cls in builder.mapping.values()
+            for suffix in _build_suffixes(child_cls)
+        )
     )
 
 
@@ -0,0 +1,96 @@
+"""Компактное представление объектов telegram.types
+
+Для каждого класса RawDataclass один раз генерируется класс со __slots__
+и теми же полями. Экземпляры такого класса не имеют __dict__ и могут
+не хранить raw, поэтому подходят для хранения большого количества объектов
+"""
+from dataclasses import fields
+from enum import Enum
+from typing import Any, Dict, Tuple, Type
+
+from telegram.types.base import RawDataclass
+
+
+class CompactObject:
+    """Базовый класс компактных объектов"""
+
+    __slots__ = ()
+
+    source: Type[RawDataclass] = RawDataclass
+    field_names: Tuple[str, ...] = ()
+
+    def __repr__(self) -> str:
+        values = ', '.join(
+            f'{name}={getattr(self, name)!r}'
+            for name in self.field_names
+            if name != 'raw'
+        )
+        return f'{self.__class__.__name__}({values})'
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.field_names
+        )
+
+    def asdict(self) -> Dict[str, Any]:
+        result = {}
+        for name in self.field_names:
+            value = getattr(self, name)
+            if isinstance(value, CompactObject):
+                value = value.asdict()
+            elif isinstance(value, list):
+                value = [
+                    v.asdict() if isinstance(v, CompactObject) else v for v in value
+                ]
+            elif isinstance(value, Enum):
+                value = str(value)
+            result[name] = value
+        return result
+
+
+_compact_classes: Dict[Type[RawDataclass], Type[CompactObject]] = {}
+
+
+def compact_class(cls: Type[RawDataclass]) -> Type[CompactObject]:
+    """Возвращает класс со __slots__ для cls, создает его при первом вызове"""
+    compact_cls = _compact_classes.get(cls)
+    if compact_cls is not None:
+        return compact_cls
+
+    field_names = tuple(cls_field.name for cls_field in fields(cls))
+    compact_cls = type(
+        f'Compact{cls.__name__}',
+        (CompactObject,),
+        {
+            '__slots__': field_names,
+            '__module__': cls.__module__,
+            'source': cls,
+            'field_names': field_names,
+        },
+    )
+    _compact_classes[cls] = compact_cls
+    return compact_cls
+
+
+def to_compact(value: Any, drop_raw: bool = False) -> Any:
+    """Рекурсивно переводит RawDataclass объекты в компактные.
+
+    drop_raw - не сохранять исходный словарь raw
+    """
+    if isinstance(value, RawDataclass):
+        compact_cls = compact_class(value.__class__)
+        instance = compact_cls.__new__(compact_cls)
+        for name in compact_cls.field_names:
+            if name == 'raw':
+                field_value = None if drop_raw else value.raw
+            else:
+                field_value = to_compact(getattr(value, name), drop_raw)
+            setattr(instance, name, field_value)
+        return instance
+
+    if isinstance(value, list):
+        return [to_compact(item, drop_raw) for item in value]
+
+    return value
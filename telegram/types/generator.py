@@ -0,0 +1,276 @@
+"""Генератор типов tdlib из схемы td_api.tl
+
+Для каждого конструктора схемы создается датакласс TDObject с построчным
+методом ._decode, для каждого абстрактного класса (//@class) - билдер
+TDObjectBuilder с маппингом всех его конструкторов.
+
+python -m telegram.types.generator [td_api.tl] [telegram/types/td_api.py]
+
+Сгенерированные типы подключаются явно: клиент по-прежнему собирает
+обновления через UpdateBuilder из telegram.types.update. Чтобы обработчики
+получали типы td_api, нужно переопределить AsyncTelegram._prepare_update:
+
+    class Telegram(AsyncTelegram):
+        def _prepare_update(self, update: dict):
+            return td_api.Update(update)
+"""
+import re
+import sys
+import textwrap
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_SCHEMA = Path(__file__).parents[2] / 'td_api.tl'
+DEFAULT_OUTPUT = Path(__file__).parent / 'td_api.py'
+
+# типы, которые описаны в начале схемы и не являются объектами
+BUILTIN_TYPES = {
+    'double': 'float',
+    'string': 'str',
+    'int32': 'int',
+    'int53': 'int',
+    'int64': 'int',
+    'bytes': 'str',
+    'Bool': 'bool',
+}
+
+# int64 передается строкой, double может прийти целым числом
+CONVERTERS = {
+    'int64': 'int',
+    'double': 'float',
+}
+
+_CONSTRUCTOR_RE = re.compile(r'^(\w+)((?:\s+\w+:[\w<>]+)*)\s*=\s*(\w+);$')
+_VECTOR_RE = re.compile(r'^vector<(.+)>$')
+_TAG_RE = re.compile(r'@(\w+)\s+')
+
+
+@dataclass
+class TLField:
+    name: str
+    type: str
+
+
+@dataclass
+class TLConstructor:
+    name: str
+    result: str
+    fields: List[TLField] = field(default_factory=list)
+    description: str = ''
+
+    @property
+    def class_name(self) -> str:
+        return self.name[0].upper() + self.name[1:]
+
+
+@dataclass
+class TLClass:
+    name: str
+    description: str = ''
+    constructors: List[TLConstructor] = field(default_factory=list)
+
+
+@dataclass
+class TLSchema:
+    constructors: Dict[str, TLConstructor] = field(default_factory=dict)
+    classes: Dict[str, TLClass] = field(default_factory=dict)
+    # конструктор для типов с единственным конструктором, например User -> user
+    single: Dict[str, TLConstructor] = field(default_factory=dict)
+
+
+def _parse_tags(comment: str) -> Dict[str, str]:
+    """Разбирает строку вида '@class Name @description Text'"""
+    parts = _TAG_RE.split(' ' + comment.strip() + ' ')
+    return {parts[i]: parts[i + 1].strip() for i in range(1, len(parts) - 1, 2)}
+
+
+def parse_schema(text: str) -> TLSchema:
+    """Разбирает типы схемы td_api.tl (до секции ---functions---)"""
+    schema = TLSchema()
+    comment = ''
+
+    for line in text.split('---functions---')[0].splitlines():
+        line = line.strip()
+
+        if line.startswith('//-'):
+            comment += ' ' + line[3:]
+            continue
+
+        if line.startswith('//@'):
+            comment += ' ' + line[2:]
+            continue
+
+        if not line or line.startswith('//'):
+            if comment and '@class' in comment:
+                tags = _parse_tags(comment)
+                schema.classes[tags['class']] = TLClass(
+                    tags['class'], tags.get('description', '')
+                )
+                comment = ''
+            continue
+
+        match = _CONSTRUCTOR_RE.match(line)
+        tags = _parse_tags(comment)
+        comment = ''
+        if match is None:
+            continue
+
+        name, args, result = match.groups()
+        if result in BUILTIN_TYPES or result.lower() in BUILTIN_TYPES:
+            continue
+
+        constructor = TLConstructor(
+            name=name,
+            result=result,
+            fields=[TLField(*arg.split(':', 1)) for arg in args.split()],
+            description=tags.get('description', ''),
+        )
+        schema.constructors[name] = constructor
+
+        if result in schema.classes:
+            schema.classes[result].constructors.append(constructor)
+        else:
+            schema.single[result] = constructor
+
+    return schema
+
+
+class Generator:
+    """Собирает исходный код модуля td_api.py по разобранной схеме"""
+
+    def __init__(self, schema: TLSchema) -> None:
+        self.schema = schema
+
+    def annotation(self, tl_type: str) -> str:
+        if tl_type in BUILTIN_TYPES:
+            return BUILTIN_TYPES[tl_type]
+
+        match = _VECTOR_RE.match(tl_type)
+        if match:
+            return f'List[{self.annotation(match.group(1))}]'
+
+        if tl_type in self.schema.classes:
+            return 'TDObject'
+
+        return self.class_name(tl_type)
+
+    def class_name(self, tl_type: str) -> str:
+        if tl_type in self.schema.single:
+            return self.schema.single[tl_type].class_name
+        return tl_type[0].upper() + tl_type[1:]
+
+    def converter(self, tl_type: str, var: str, depth: int = 0) -> Optional[str]:
+        """Выражение для преобразования значения var, None - без преобразования"""
+        if tl_type in BUILTIN_TYPES:
+            converter = CONVERTERS.get(tl_type)
+            return f'{converter}({var})' if converter else None
+
+        match = _VECTOR_RE.match(tl_type)
+        if match:
+            item = f'item{depth}'
+            inner = self.converter(match.group(1), item, depth + 1)
+            if inner is None:
+                return None
+            return f'[{inner} for {item} in {var}]'
+
+        if tl_type in self.schema.classes:
+            return f'{tl_type}({var})'
+
+        return f'{self.class_name(tl_type)}.from_raw({var})'
+
+    def docstring(self, description: str, indent: str = '    ') -> List[str]:
+        description = description.replace('\\', '\\\\').replace('"""', "'''")
+        description = description or 'No description'
+        if description.endswith('"'):
+            description = description[:-1] + '\\"'
+        lines = textwrap.wrap(description, 88 - len(indent) - 6)
+        if len(lines) == 1:
+            return [f'{indent}"""{lines[0]}"""']
+        return (
+            [f'{indent}"""'] + [f'{indent}{line}' for line in lines] + [f'{indent}"""']
+        )
+
+    def render_constructor(self, constructor: TLConstructor) -> List[str]:
+        lines = ['', '', '@dataclass', f'class {constructor.class_name}(TDObject):']
+        lines += self.docstring(constructor.description)
+
+        if constructor.fields:
+            lines.append('')
+        for tl_field in constructor.fields:
+            annotation = self.annotation(tl_field.type)
+            lines.append(f'    {tl_field.name}: {annotation} = None')
+
+        decode = []
+        for tl_field in constructor.fields:
+            converter = self.converter(tl_field.type, 'value')
+            if converter is None:
+                decode.append(
+                    f"        self.{tl_field.name} = raw.get('{tl_field.name}')"
+                )
+                continue
+
+            decode += [
+                f"        value = raw.get('{tl_field.name}')",
+                '        if value is not None:',
+                f'            value = {converter}',
+                f'        self.{tl_field.name} = value',
+            ]
+
+        if decode:
+            lines += ['', '    def _decode(self, raw: dict):'] + decode
+
+        return lines
+
+    def render_class(self, tl_class: TLClass) -> List[str]:
+        lines = ['', '', f'class {tl_class.name}Builder(TDObjectBuilder):']
+        lines += self.docstring(tl_class.description)
+        lines += ['', '    mapping = {']
+        lines += [
+            f"        '{constructor.name}': {constructor.class_name},"
+            for constructor in tl_class.constructors
+        ]
+        lines += ['    }', '', '', f'{tl_class.name} = {tl_class.name}Builder()']
+        return lines
+
+    def render(self) -> str:
+        lines = [
+            '# Generated by telegram.types.generator from td_api.tl. Do not edit.',
+            '# flake8: noqa',
+            '# pylint: skip-file',
+            'from __future__ import annotations',
+            '',
+            'from dataclasses import dataclass',
+            'from typing import List',
+            '',
+            'from telegram.types.base import TDObject, TDObjectBuilder',
+        ]
+
+        for constructor in self.schema.constructors.values():
+            lines += self.render_constructor(constructor)
+
+        for tl_class in self.schema.classes.values():
+            lines += self.render_class(tl_class)
+
+        lines += ['', '', 'CONSTRUCTORS = {']
+        lines += [
+            f"    '{constructor.name}': {constructor.class_name},"
+            for constructor in self.schema.constructors.values()
+        ]
+        lines += ['}', '']
+        return '\n'.join(lines)
+
+
+def generate(schema_path: Path = DEFAULT_SCHEMA) -> str:
+    schema = parse_schema(Path(schema_path).read_text(encoding='utf-8'))
+    return Generator(schema).render()
+
+
+def main(argv: List[str]) -> None:
+    schema_path = Path(argv[1]) if len(argv) > 1 else DEFAULT_SCHEMA
+    output_path = Path(argv[2]) if len(argv) > 2 else DEFAULT_OUTPUT
+    output_path.write_text(generate(schema_path), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -4,6 +4,7 @@ from typing import Union
 
 from telegram.types.base import RawDataclass
 from telegram.types.message_content import MessageContent
+from telegram.types.sender import MessageSender, MessageSenderType
 
 __all__ = (
     'MessageSenderType',
@@ -14,13 +15,6 @@ __all__ = (
 )
 
 
-class MessageSenderType(str, Enum):
-    """Тип отправителя"""
-
-    CHAT = 'messageSenderChat'
-    USER = 'messageSenderUser'
-
-
 class ReactionType(str, Enum):
     """ReactionType"""
 
@@ -36,21 +30,6 @@ class ReactionType(str, Enum):
         return data
 
 
-@dataclass
-class MessageSender(RawDataclass):
-    """Отправитель сообщения"""
-
-    type: MessageSenderType = None
-    id: int = None
-
-    def _assign_raw(self):
-        self.type = MessageSenderType(self.raw['@type'])
-        if self.type == MessageSenderType.USER:
-            self.id = self.raw['user_id']
-        else:
-            self.id = self.raw['chat_id']
-
-
 @dataclass
 class MessageOrigin(RawDataclass):
     """Источник сообщения"""
@@ -0,0 +1,24329 @@
+# Generated by telegram.types.generator from td_api.tl. Do not edit.
+# flake8: noqa
+# pylint: skip-file
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+from telegram.types.base import TDObject, TDObjectBuilder
+
+
+@dataclass
+class Error(TDObject):
+    """
+    An object of this type can be returned on every function call, in case of an
+    error
+    """
+
+    code: int = None
+    message: str = None
+
+    def _decode(self, raw: dict):
+        self.code = raw.get('code')
+        self.message = raw.get('message')
+
+
+@dataclass
+class Ok(TDObject):
+    """
+    An object of this type is returned on a successful function call for certain
+    functions
+    """
+
+
+@dataclass
+class AuthenticationCodeTypeTelegramMessage(TDObject):
+    """
+    An authentication code is delivered via a private Telegram message, which can
+    be viewed from another active session
+    """
+
+    length: int = None
+
+    def _decode(self, raw: dict):
+        self.length = raw.get('length')
+
+
+@dataclass
+class AuthenticationCodeTypeSms(TDObject):
+    """
+    An authentication code is delivered via an SMS message to the specified phone
+    number; applications may not receive this type of code
+    """
+
+    length: int = None
+
+    def _decode(self, raw: dict):
+        self.length = raw.get('length')
+
+
+@dataclass
+class AuthenticationCodeTypeCall(TDObject):
+    """
+    An authentication code is delivered via a phone call to the specified phone
+    number
+    """
+
+    length: int = None
+
+    def _decode(self, raw: dict):
+        self.length = raw.get('length')
+
+
+@dataclass
+class AuthenticationCodeTypeFlashCall(TDObject):
+    """
+    An authentication code is delivered by an immediately canceled call to the
+    specified phone number. The phone number that calls is the code that must be
+    entered automatically
+    """
+
+    pattern: str = None
+
+    def _decode(self, raw: dict):
+        self.pattern = raw.get('pattern')
+
+
+@dataclass
+class AuthenticationCodeTypeMissedCall(TDObject):
+    """
+    An authentication code is delivered by an immediately canceled call to the
+    specified phone number. The last digits of the phone number that calls are the
+    code that must be entered manually by the user
+    """
+
+    phone_number_prefix: str = None
+    length: int = None
+
+    def _decode(self, raw: dict):
+        self.phone_number_prefix = raw.get('phone_number_prefix')
+        self.length = raw.get('length')
+
+
+@dataclass
+class AuthenticationCodeTypeFragment(TDObject):
+    """
+    An authentication code is delivered to https://fragment.com. The user must be
+    logged in there via a wallet owning the phone number's NFT
+    """
+
+    url: str = None
+    length: int = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.length = raw.get('length')
+
+
+@dataclass
+class AuthenticationCodeTypeFirebaseAndroid(TDObject):
+    """
+    An authentication code is delivered via Firebase Authentication to the
+    official Android application
+    """
+
+    nonce: str = None
+    length: int = None
+
+    def _decode(self, raw: dict):
+        self.nonce = raw.get('nonce')
+        self.length = raw.get('length')
+
+
+@dataclass
+class AuthenticationCodeTypeFirebaseIos(TDObject):
+    """
+    An authentication code is delivered via Firebase Authentication to the
+    official iOS application
+    """
+
+    receipt: str = None
+    push_timeout: int = None
+    length: int = None
+
+    def _decode(self, raw: dict):
+        self.receipt = raw.get('receipt')
+        self.push_timeout = raw.get('push_timeout')
+        self.length = raw.get('length')
+
+
+@dataclass
+class AuthenticationCodeInfo(TDObject):
+    """Information about the authentication code that was sent"""
+
+    phone_number: str = None
+    type: TDObject = None
+    next_type: TDObject = None
+    timeout: int = None
+
+    def _decode(self, raw: dict):
+        self.phone_number = raw.get('phone_number')
+        value = raw.get('type')
+        if value is not None:
+            value = AuthenticationCodeType(value)
+        self.type = value
+        value = raw.get('next_type')
+        if value is not None:
+            value = AuthenticationCodeType(value)
+        self.next_type = value
+        self.timeout = raw.get('timeout')
+
+
+@dataclass
+class EmailAddressAuthenticationCodeInfo(TDObject):
+    """Information about the email address authentication code that was sent"""
+
+    email_address_pattern: str = None
+    length: int = None
+
+    def _decode(self, raw: dict):
+        self.email_address_pattern = raw.get('email_address_pattern')
+        self.length = raw.get('length')
+
+
+@dataclass
+class EmailAddressAuthenticationCode(TDObject):
+    """An authentication code delivered to a user's email address"""
+
+    code: str = None
+
+    def _decode(self, raw: dict):
+        self.code = raw.get('code')
+
+
+@dataclass
+class EmailAddressAuthenticationAppleId(TDObject):
+    """An authentication token received through Apple ID"""
+
+    token: str = None
+
+    def _decode(self, raw: dict):
+        self.token = raw.get('token')
+
+
+@dataclass
+class EmailAddressAuthenticationGoogleId(TDObject):
+    """An authentication token received through Google ID"""
+
+    token: str = None
+
+    def _decode(self, raw: dict):
+        self.token = raw.get('token')
+
+
+@dataclass
+class EmailAddressResetStateAvailable(TDObject):
+    """
+    Email address can be reset after the given period. Call
+    resetAuthenticationEmailAddress to reset it and allow the user to authorize
+    with a code sent to the user's phone number
+    """
+
+    wait_period: int = None
+
+    def _decode(self, raw: dict):
+        self.wait_period = raw.get('wait_period')
+
+
+@dataclass
+class EmailAddressResetStatePending(TDObject):
+    """
+    Email address reset has already been requested. Call
+    resetAuthenticationEmailAddress to check whether immediate reset is possible
+    """
+
+    reset_in: int = None
+
+    def _decode(self, raw: dict):
+        self.reset_in = raw.get('reset_in')
+
+
+@dataclass
+class TextEntity(TDObject):
+    """Represents a part of the text that needs to be formatted in some unusual way"""
+
+    offset: int = None
+    length: int = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.offset = raw.get('offset')
+        self.length = raw.get('length')
+        value = raw.get('type')
+        if value is not None:
+            value = TextEntityType(value)
+        self.type = value
+
+
+@dataclass
+class TextEntities(TDObject):
+    """Contains a list of text entities"""
+
+    entities: List[TextEntity] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('entities')
+        if value is not None:
+            value = [TextEntity.from_raw(item0) for item0 in value]
+        self.entities = value
+
+
+@dataclass
+class FormattedText(TDObject):
+    """A text with some entities"""
+
+    text: str = None
+    entities: List[TextEntity] = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        value = raw.get('entities')
+        if value is not None:
+            value = [TextEntity.from_raw(item0) for item0 in value]
+        self.entities = value
+
+
+@dataclass
+class TermsOfService(TDObject):
+    """Contains Telegram terms of service"""
+
+    text: FormattedText = None
+    min_user_age: int = None
+    show_popup: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.text = value
+        self.min_user_age = raw.get('min_user_age')
+        self.show_popup = raw.get('show_popup')
+
+
+@dataclass
+class AuthorizationStateWaitTdlibParameters(TDObject):
+    """Initialization parameters are needed. Call setTdlibParameters to provide them"""
+
+
+@dataclass
+class AuthorizationStateWaitPhoneNumber(TDObject):
+    """
+    TDLib needs the user's phone number to authorize. Call
+    setAuthenticationPhoneNumber to provide the phone number, or use
+    requestQrCodeAuthentication or checkAuthenticationBotToken for other
+    authentication options
+    """
+
+
+@dataclass
+class AuthorizationStateWaitEmailAddress(TDObject):
+    """
+    TDLib needs the user's email address to authorize. Call
+    setAuthenticationEmailAddress to provide the email address, or directly call
+    checkAuthenticationEmailCode with Apple ID/Google ID token if allowed
+    """
+
+    allow_apple_id: bool = None
+    allow_google_id: bool = None
+
+    def _decode(self, raw: dict):
+        self.allow_apple_id = raw.get('allow_apple_id')
+        self.allow_google_id = raw.get('allow_google_id')
+
+
+@dataclass
+class AuthorizationStateWaitEmailCode(TDObject):
+    """
+    TDLib needs the user's authentication code sent to an email address to
+    authorize. Call checkAuthenticationEmailCode to provide the code
+    """
+
+    allow_apple_id: bool = None
+    allow_google_id: bool = None
+    code_info: EmailAddressAuthenticationCodeInfo = None
+    email_address_reset_state: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.allow_apple_id = raw.get('allow_apple_id')
+        self.allow_google_id = raw.get('allow_google_id')
+        value = raw.get('code_info')
+        if value is not None:
+            value = EmailAddressAuthenticationCodeInfo.from_raw(value)
+        self.code_info = value
+        value = raw.get('email_address_reset_state')
+        if value is not None:
+            value = EmailAddressResetState(value)
+        self.email_address_reset_state = value
+
+
+@dataclass
+class AuthorizationStateWaitCode(TDObject):
+    """
+    TDLib needs the user's authentication code to authorize. Call
+    checkAuthenticationCode to check the code
+    """
+
+    code_info: AuthenticationCodeInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('code_info')
+        if value is not None:
+            value = AuthenticationCodeInfo.from_raw(value)
+        self.code_info = value
+
+
+@dataclass
+class AuthorizationStateWaitOtherDeviceConfirmation(TDObject):
+    """
+    The user needs to confirm authorization on another logged in device by
+    scanning a QR code with the provided link
+    """
+
+    link: str = None
+
+    def _decode(self, raw: dict):
+        self.link = raw.get('link')
+
+
+@dataclass
+class AuthorizationStateWaitRegistration(TDObject):
+    """
+    The user is unregistered and need to accept terms of service and enter their
+    first name and last name to finish registration. Call registerUser to accept
+    the terms of service and provide the data
+    """
+
+    terms_of_service: TermsOfService = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('terms_of_service')
+        if value is not None:
+            value = TermsOfService.from_raw(value)
+        self.terms_of_service = value
+
+
+@dataclass
+class AuthorizationStateWaitPassword(TDObject):
+    """
+    The user has been authorized, but needs to enter a 2-step verification
+    password to start using the application. Call checkAuthenticationPassword to
+    provide the password, or requestAuthenticationPasswordRecovery to recover the
+    password, or deleteAccount to delete the account after a week
+    """
+
+    password_hint: str = None
+    has_recovery_email_address: bool = None
+    has_passport_data: bool = None
+    recovery_email_address_pattern: str = None
+
+    def _decode(self, raw: dict):
+        self.password_hint = raw.get('password_hint')
+        self.has_recovery_email_address = raw.get('has_recovery_email_address')
+        self.has_passport_data = raw.get('has_passport_data')
+        self.recovery_email_address_pattern = raw.get('recovery_email_address_pattern')
+
+
+@dataclass
+class AuthorizationStateReady(TDObject):
+    """
+    The user has been successfully authorized. TDLib is now ready to answer
+    general requests
+    """
+
+
+@dataclass
+class AuthorizationStateLoggingOut(TDObject):
+    """The user is currently logging out"""
+
+
+@dataclass
+class AuthorizationStateClosing(TDObject):
+    """
+    TDLib is closing, all subsequent queries will be answered with the error 500.
+    Note that closing TDLib can take a while. All resources will be freed only
+    after authorizationStateClosed has been received
+    """
+
+
+@dataclass
+class AuthorizationStateClosed(TDObject):
+    """
+    TDLib client is in its final state. All databases are closed and all resources
+    are released. No other updates will be received after this. All queries will
+    be responded to with error code 500. To continue working, one must create a
+    new instance of the TDLib client
+    """
+
+
+@dataclass
+class PasswordState(TDObject):
+    """Represents the current state of 2-step verification"""
+
+    has_password: bool = None
+    password_hint: str = None
+    has_recovery_email_address: bool = None
+    has_passport_data: bool = None
+    recovery_email_address_code_info: EmailAddressAuthenticationCodeInfo = None
+    login_email_address_pattern: str = None
+    pending_reset_date: int = None
+
+    def _decode(self, raw: dict):
+        self.has_password = raw.get('has_password')
+        self.password_hint = raw.get('password_hint')
+        self.has_recovery_email_address = raw.get('has_recovery_email_address')
+        self.has_passport_data = raw.get('has_passport_data')
+        value = raw.get('recovery_email_address_code_info')
+        if value is not None:
+            value = EmailAddressAuthenticationCodeInfo.from_raw(value)
+        self.recovery_email_address_code_info = value
+        self.login_email_address_pattern = raw.get('login_email_address_pattern')
+        self.pending_reset_date = raw.get('pending_reset_date')
+
+
+@dataclass
+class RecoveryEmailAddress(TDObject):
+    """Contains information about the current recovery email address"""
+
+    recovery_email_address: str = None
+
+    def _decode(self, raw: dict):
+        self.recovery_email_address = raw.get('recovery_email_address')
+
+
+@dataclass
+class TemporaryPasswordState(TDObject):
+    """
+    Returns information about the availability of a temporary password, which can
+    be used for payments
+    """
+
+    has_password: bool = None
+    valid_for: int = None
+
+    def _decode(self, raw: dict):
+        self.has_password = raw.get('has_password')
+        self.valid_for = raw.get('valid_for')
+
+
+@dataclass
+class LocalFile(TDObject):
+    """Represents a local file"""
+
+    path: str = None
+    can_be_downloaded: bool = None
+    can_be_deleted: bool = None
+    is_downloading_active: bool = None
+    is_downloading_completed: bool = None
+    download_offset: int = None
+    downloaded_prefix_size: int = None
+    downloaded_size: int = None
+
+    def _decode(self, raw: dict):
+        self.path = raw.get('path')
+        self.can_be_downloaded = raw.get('can_be_downloaded')
+        self.can_be_deleted = raw.get('can_be_deleted')
+        self.is_downloading_active = raw.get('is_downloading_active')
+        self.is_downloading_completed = raw.get('is_downloading_completed')
+        self.download_offset = raw.get('download_offset')
+        self.downloaded_prefix_size = raw.get('downloaded_prefix_size')
+        self.downloaded_size = raw.get('downloaded_size')
+
+
+@dataclass
+class RemoteFile(TDObject):
+    """Represents a remote file"""
+
+    id: str = None
+    unique_id: str = None
+    is_uploading_active: bool = None
+    is_uploading_completed: bool = None
+    uploaded_size: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.unique_id = raw.get('unique_id')
+        self.is_uploading_active = raw.get('is_uploading_active')
+        self.is_uploading_completed = raw.get('is_uploading_completed')
+        self.uploaded_size = raw.get('uploaded_size')
+
+
+@dataclass
+class File(TDObject):
+    """Represents a file"""
+
+    id: int = None
+    size: int = None
+    expected_size: int = None
+    local: LocalFile = None
+    remote: RemoteFile = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.size = raw.get('size')
+        self.expected_size = raw.get('expected_size')
+        value = raw.get('local')
+        if value is not None:
+            value = LocalFile.from_raw(value)
+        self.local = value
+        value = raw.get('remote')
+        if value is not None:
+            value = RemoteFile.from_raw(value)
+        self.remote = value
+
+
+@dataclass
+class InputFileId(TDObject):
+    """A file defined by its unique identifier"""
+
+    id: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+
+
+@dataclass
+class InputFileRemote(TDObject):
+    """
+    A file defined by its remote identifier. The remote identifier is guaranteed
+    to be usable only if the corresponding file is still accessible to the user
+    and known to TDLib. For example, if the file is from a message, then the
+    message must be not deleted and accessible to the user. If the file database
+    is disabled, then the corresponding object with the file must be preloaded by
+    the application
+    """
+
+    id: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+
+
+@dataclass
+class InputFileLocal(TDObject):
+    """A file defined by a local path"""
+
+    path: str = None
+
+    def _decode(self, raw: dict):
+        self.path = raw.get('path')
+
+
+@dataclass
+class InputFileGenerated(TDObject):
+    """A file generated by the application"""
+
+    original_path: str = None
+    conversion: str = None
+    expected_size: int = None
+
+    def _decode(self, raw: dict):
+        self.original_path = raw.get('original_path')
+        self.conversion = raw.get('conversion')
+        self.expected_size = raw.get('expected_size')
+
+
+@dataclass
+class PhotoSize(TDObject):
+    """Describes an image in JPEG format"""
+
+    type: str = None
+    photo: File = None
+    width: int = None
+    height: int = None
+    progressive_sizes: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.type = raw.get('type')
+        value = raw.get('photo')
+        if value is not None:
+            value = File.from_raw(value)
+        self.photo = value
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.progressive_sizes = raw.get('progressive_sizes')
+
+
+@dataclass
+class Minithumbnail(TDObject):
+    """Thumbnail image of a very poor quality and low resolution"""
+
+    width: int = None
+    height: int = None
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.data = raw.get('data')
+
+
+@dataclass
+class ThumbnailFormatJpeg(TDObject):
+    """The thumbnail is in JPEG format"""
+
+
+@dataclass
+class ThumbnailFormatGif(TDObject):
+    """
+    The thumbnail is in static GIF format. It will be used only for some bot
+    inline query results
+    """
+
+
+@dataclass
+class ThumbnailFormatMpeg4(TDObject):
+    """
+    The thumbnail is in MPEG4 format. It will be used only for some animations and
+    videos
+    """
+
+
+@dataclass
+class ThumbnailFormatPng(TDObject):
+    """The thumbnail is in PNG format. It will be used only for background patterns"""
+
+
+@dataclass
+class ThumbnailFormatTgs(TDObject):
+    """The thumbnail is in TGS format. It will be used only for TGS sticker sets"""
+
+
+@dataclass
+class ThumbnailFormatWebm(TDObject):
+    """The thumbnail is in WEBM format. It will be used only for WEBM sticker sets"""
+
+
+@dataclass
+class ThumbnailFormatWebp(TDObject):
+    """The thumbnail is in WEBP format. It will be used only for some stickers"""
+
+
+@dataclass
+class Thumbnail(TDObject):
+    """Represents a thumbnail"""
+
+    format: TDObject = None
+    width: int = None
+    height: int = None
+    file: File = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('format')
+        if value is not None:
+            value = ThumbnailFormat(value)
+        self.format = value
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        value = raw.get('file')
+        if value is not None:
+            value = File.from_raw(value)
+        self.file = value
+
+
+@dataclass
+class MaskPointForehead(TDObject):
+    """The mask is placed relatively to the forehead"""
+
+
+@dataclass
+class MaskPointEyes(TDObject):
+    """The mask is placed relatively to the eyes"""
+
+
+@dataclass
+class MaskPointMouth(TDObject):
+    """The mask is placed relatively to the mouth"""
+
+
+@dataclass
+class MaskPointChin(TDObject):
+    """The mask is placed relatively to the chin"""
+
+
+@dataclass
+class MaskPosition(TDObject):
+    """Position on a photo where a mask is placed"""
+
+    point: TDObject = None
+    x_shift: float = None
+    y_shift: float = None
+    scale: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('point')
+        if value is not None:
+            value = MaskPoint(value)
+        self.point = value
+        value = raw.get('x_shift')
+        if value is not None:
+            value = float(value)
+        self.x_shift = value
+        value = raw.get('y_shift')
+        if value is not None:
+            value = float(value)
+        self.y_shift = value
+        value = raw.get('scale')
+        if value is not None:
+            value = float(value)
+        self.scale = value
+
+
+@dataclass
+class StickerFormatWebp(TDObject):
+    """The sticker is an image in WEBP format"""
+
+
+@dataclass
+class StickerFormatTgs(TDObject):
+    """The sticker is an animation in TGS format"""
+
+
+@dataclass
+class StickerFormatWebm(TDObject):
+    """The sticker is a video in WEBM format"""
+
+
+@dataclass
+class StickerTypeRegular(TDObject):
+    """The sticker is a regular sticker"""
+
+
+@dataclass
+class StickerTypeMask(TDObject):
+    """The sticker is a mask in WEBP format to be placed on photos or videos"""
+
+
+@dataclass
+class StickerTypeCustomEmoji(TDObject):
+    """The sticker is a custom emoji to be used inside message text and caption"""
+
+
+@dataclass
+class StickerFullTypeRegular(TDObject):
+    """The sticker is a regular sticker"""
+
+    premium_animation: File = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('premium_animation')
+        if value is not None:
+            value = File.from_raw(value)
+        self.premium_animation = value
+
+
+@dataclass
+class StickerFullTypeMask(TDObject):
+    """The sticker is a mask in WEBP format to be placed on photos or videos"""
+
+    mask_position: MaskPosition = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('mask_position')
+        if value is not None:
+            value = MaskPosition.from_raw(value)
+        self.mask_position = value
+
+
+@dataclass
+class StickerFullTypeCustomEmoji(TDObject):
+    """
+    The sticker is a custom emoji to be used inside message text and caption.
+    Currently, only Telegram Premium users can use custom emoji
+    """
+
+    custom_emoji_id: int = None
+    needs_repainting: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.custom_emoji_id = value
+        self.needs_repainting = raw.get('needs_repainting')
+
+
+@dataclass
+class ClosedVectorPath(TDObject):
+    """
+    Represents a closed vector path. The path begins at the end point of the last
+    command
+    """
+
+    commands: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('commands')
+        if value is not None:
+            value = [VectorPathCommand(item0) for item0 in value]
+        self.commands = value
+
+
+@dataclass
+class PollOption(TDObject):
+    """Describes one answer option of a poll"""
+
+    text: str = None
+    voter_count: int = None
+    vote_percentage: int = None
+    is_chosen: bool = None
+    is_being_chosen: bool = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        self.voter_count = raw.get('voter_count')
+        self.vote_percentage = raw.get('vote_percentage')
+        self.is_chosen = raw.get('is_chosen')
+        self.is_being_chosen = raw.get('is_being_chosen')
+
+
+@dataclass
+class PollTypeRegular(TDObject):
+    """A regular poll"""
+
+    allow_multiple_answers: bool = None
+
+    def _decode(self, raw: dict):
+        self.allow_multiple_answers = raw.get('allow_multiple_answers')
+
+
+@dataclass
+class PollTypeQuiz(TDObject):
+    """
+    A poll in quiz mode, which has exactly one correct answer option and can be
+    answered only once
+    """
+
+    correct_option_id: int = None
+    explanation: FormattedText = None
+
+    def _decode(self, raw: dict):
+        self.correct_option_id = raw.get('correct_option_id')
+        value = raw.get('explanation')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.explanation = value
+
+
+@dataclass
+class Animation(TDObject):
+    """
+    Describes an animation file. The animation must be encoded in GIF or MPEG4
+    format
+    """
+
+    duration: int = None
+    width: int = None
+    height: int = None
+    file_name: str = None
+    mime_type: str = None
+    has_stickers: bool = None
+    minithumbnail: Minithumbnail = None
+    thumbnail: Thumbnail = None
+    animation: File = None
+
+    def _decode(self, raw: dict):
+        self.duration = raw.get('duration')
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.file_name = raw.get('file_name')
+        self.mime_type = raw.get('mime_type')
+        self.has_stickers = raw.get('has_stickers')
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+        value = raw.get('animation')
+        if value is not None:
+            value = File.from_raw(value)
+        self.animation = value
+
+
+@dataclass
+class Audio(TDObject):
+    """Describes an audio file. Audio is usually in MP3 or M4A format"""
+
+    duration: int = None
+    title: str = None
+    performer: str = None
+    file_name: str = None
+    mime_type: str = None
+    album_cover_minithumbnail: Minithumbnail = None
+    album_cover_thumbnail: Thumbnail = None
+    external_album_covers: List[Thumbnail] = None
+    audio: File = None
+
+    def _decode(self, raw: dict):
+        self.duration = raw.get('duration')
+        self.title = raw.get('title')
+        self.performer = raw.get('performer')
+        self.file_name = raw.get('file_name')
+        self.mime_type = raw.get('mime_type')
+        value = raw.get('album_cover_minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.album_cover_minithumbnail = value
+        value = raw.get('album_cover_thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.album_cover_thumbnail = value
+        value = raw.get('external_album_covers')
+        if value is not None:
+            value = [Thumbnail.from_raw(item0) for item0 in value]
+        self.external_album_covers = value
+        value = raw.get('audio')
+        if value is not None:
+            value = File.from_raw(value)
+        self.audio = value
+
+
+@dataclass
+class Document(TDObject):
+    """Describes a document of any type"""
+
+    file_name: str = None
+    mime_type: str = None
+    minithumbnail: Minithumbnail = None
+    thumbnail: Thumbnail = None
+    document: File = None
+
+    def _decode(self, raw: dict):
+        self.file_name = raw.get('file_name')
+        self.mime_type = raw.get('mime_type')
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+        value = raw.get('document')
+        if value is not None:
+            value = File.from_raw(value)
+        self.document = value
+
+
+@dataclass
+class Photo(TDObject):
+    """Describes a photo"""
+
+    has_stickers: bool = None
+    minithumbnail: Minithumbnail = None
+    sizes: List[PhotoSize] = None
+
+    def _decode(self, raw: dict):
+        self.has_stickers = raw.get('has_stickers')
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        value = raw.get('sizes')
+        if value is not None:
+            value = [PhotoSize.from_raw(item0) for item0 in value]
+        self.sizes = value
+
+
+@dataclass
+class Sticker(TDObject):
+    """Describes a sticker"""
+
+    id: int = None
+    set_id: int = None
+    width: int = None
+    height: int = None
+    emoji: str = None
+    format: TDObject = None
+    full_type: TDObject = None
+    outline: List[ClosedVectorPath] = None
+    thumbnail: Thumbnail = None
+    sticker: File = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        value = raw.get('set_id')
+        if value is not None:
+            value = int(value)
+        self.set_id = value
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.emoji = raw.get('emoji')
+        value = raw.get('format')
+        if value is not None:
+            value = StickerFormat(value)
+        self.format = value
+        value = raw.get('full_type')
+        if value is not None:
+            value = StickerFullType(value)
+        self.full_type = value
+        value = raw.get('outline')
+        if value is not None:
+            value = [ClosedVectorPath.from_raw(item0) for item0 in value]
+        self.outline = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+        value = raw.get('sticker')
+        if value is not None:
+            value = File.from_raw(value)
+        self.sticker = value
+
+
+@dataclass
+class Video(TDObject):
+    """Describes a video file"""
+
+    duration: int = None
+    width: int = None
+    height: int = None
+    file_name: str = None
+    mime_type: str = None
+    has_stickers: bool = None
+    supports_streaming: bool = None
+    minithumbnail: Minithumbnail = None
+    thumbnail: Thumbnail = None
+    video: File = None
+
+    def _decode(self, raw: dict):
+        self.duration = raw.get('duration')
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.file_name = raw.get('file_name')
+        self.mime_type = raw.get('mime_type')
+        self.has_stickers = raw.get('has_stickers')
+        self.supports_streaming = raw.get('supports_streaming')
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+        value = raw.get('video')
+        if value is not None:
+            value = File.from_raw(value)
+        self.video = value
+
+
+@dataclass
+class VideoNote(TDObject):
+    """
+    Describes a video note. The video must be equal in width and height, cropped
+    to a circle, and stored in MPEG4 format
+    """
+
+    duration: int = None
+    waveform: str = None
+    length: int = None
+    minithumbnail: Minithumbnail = None
+    thumbnail: Thumbnail = None
+    speech_recognition_result: TDObject = None
+    video: File = None
+
+    def _decode(self, raw: dict):
+        self.duration = raw.get('duration')
+        self.waveform = raw.get('waveform')
+        self.length = raw.get('length')
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+        value = raw.get('speech_recognition_result')
+        if value is not None:
+            value = SpeechRecognitionResult(value)
+        self.speech_recognition_result = value
+        value = raw.get('video')
+        if value is not None:
+            value = File.from_raw(value)
+        self.video = value
+
+
+@dataclass
+class VoiceNote(TDObject):
+    """
+    Describes a voice note. The voice note must be encoded with the Opus codec,
+    and stored inside an OGG container. Voice notes can have only a single audio
+    channel
+    """
+
+    duration: int = None
+    waveform: str = None
+    mime_type: str = None
+    speech_recognition_result: TDObject = None
+    voice: File = None
+
+    def _decode(self, raw: dict):
+        self.duration = raw.get('duration')
+        self.waveform = raw.get('waveform')
+        self.mime_type = raw.get('mime_type')
+        value = raw.get('speech_recognition_result')
+        if value is not None:
+            value = SpeechRecognitionResult(value)
+        self.speech_recognition_result = value
+        value = raw.get('voice')
+        if value is not None:
+            value = File.from_raw(value)
+        self.voice = value
+
+
+@dataclass
+class AnimatedEmoji(TDObject):
+    """Describes an animated or custom representation of an emoji"""
+
+    sticker: Sticker = None
+    sticker_width: int = None
+    sticker_height: int = None
+    fitzpatrick_type: int = None
+    sound: File = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+        self.sticker_width = raw.get('sticker_width')
+        self.sticker_height = raw.get('sticker_height')
+        self.fitzpatrick_type = raw.get('fitzpatrick_type')
+        value = raw.get('sound')
+        if value is not None:
+            value = File.from_raw(value)
+        self.sound = value
+
+
+@dataclass
+class Contact(TDObject):
+    """Describes a user contact"""
+
+    phone_number: str = None
+    first_name: str = None
+    last_name: str = None
+    vcard: str = None
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.phone_number = raw.get('phone_number')
+        self.first_name = raw.get('first_name')
+        self.last_name = raw.get('last_name')
+        self.vcard = raw.get('vcard')
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class Location(TDObject):
+    """Describes a location on planet Earth"""
+
+    latitude: float = None
+    longitude: float = None
+    horizontal_accuracy: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('latitude')
+        if value is not None:
+            value = float(value)
+        self.latitude = value
+        value = raw.get('longitude')
+        if value is not None:
+            value = float(value)
+        self.longitude = value
+        value = raw.get('horizontal_accuracy')
+        if value is not None:
+            value = float(value)
+        self.horizontal_accuracy = value
+
+
+@dataclass
+class Venue(TDObject):
+    """Describes a venue"""
+
+    location: Location = None
+    title: str = None
+    address: str = None
+    provider: str = None
+    id: str = None
+    type: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+        self.title = raw.get('title')
+        self.address = raw.get('address')
+        self.provider = raw.get('provider')
+        self.id = raw.get('id')
+        self.type = raw.get('type')
+
+
+@dataclass
+class Game(TDObject):
+    """
+    Describes a game. Use getInternalLink with internalLinkTypeGame to share the
+    game
+    """
+
+    id: int = None
+    short_name: str = None
+    title: str = None
+    text: FormattedText = None
+    description: str = None
+    photo: Photo = None
+    animation: Animation = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.short_name = raw.get('short_name')
+        self.title = raw.get('title')
+        value = raw.get('text')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.text = value
+        self.description = raw.get('description')
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+
+
+@dataclass
+class WebApp(TDObject):
+    """
+    Describes a Web App. Use getInternalLink with internalLinkTypeWebApp to share
+    the Web App
+    """
+
+    short_name: str = None
+    title: str = None
+    description: str = None
+    photo: Photo = None
+    animation: Animation = None
+
+    def _decode(self, raw: dict):
+        self.short_name = raw.get('short_name')
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+
+
+@dataclass
+class Poll(TDObject):
+    """Describes a poll"""
+
+    id: int = None
+    question: str = None
+    options: List[PollOption] = None
+    total_voter_count: int = None
+    recent_voter_ids: List[TDObject] = None
+    is_anonymous: bool = None
+    type: TDObject = None
+    open_period: int = None
+    close_date: int = None
+    is_closed: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.question = raw.get('question')
+        value = raw.get('options')
+        if value is not None:
+            value = [PollOption.from_raw(item0) for item0 in value]
+        self.options = value
+        self.total_voter_count = raw.get('total_voter_count')
+        value = raw.get('recent_voter_ids')
+        if value is not None:
+            value = [MessageSender(item0) for item0 in value]
+        self.recent_voter_ids = value
+        self.is_anonymous = raw.get('is_anonymous')
+        value = raw.get('type')
+        if value is not None:
+            value = PollType(value)
+        self.type = value
+        self.open_period = raw.get('open_period')
+        self.close_date = raw.get('close_date')
+        self.is_closed = raw.get('is_closed')
+
+
+@dataclass
+class Background(TDObject):
+    """Describes a chat background"""
+
+    id: int = None
+    is_default: bool = None
+    is_dark: bool = None
+    name: str = None
+    document: Document = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.is_default = raw.get('is_default')
+        self.is_dark = raw.get('is_dark')
+        self.name = raw.get('name')
+        value = raw.get('document')
+        if value is not None:
+            value = Document.from_raw(value)
+        self.document = value
+        value = raw.get('type')
+        if value is not None:
+            value = BackgroundType(value)
+        self.type = value
+
+
+@dataclass
+class Backgrounds(TDObject):
+    """Contains a list of backgrounds"""
+
+    backgrounds: List[Background] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('backgrounds')
+        if value is not None:
+            value = [Background.from_raw(item0) for item0 in value]
+        self.backgrounds = value
+
+
+@dataclass
+class ChatBackground(TDObject):
+    """Describes a background set for a specific chat"""
+
+    background: Background = None
+    dark_theme_dimming: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('background')
+        if value is not None:
+            value = Background.from_raw(value)
+        self.background = value
+        self.dark_theme_dimming = raw.get('dark_theme_dimming')
+
+
+@dataclass
+class ProfilePhoto(TDObject):
+    """Describes a user profile photo"""
+
+    id: int = None
+    small: File = None
+    big: File = None
+    minithumbnail: Minithumbnail = None
+    has_animation: bool = None
+    is_personal: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        value = raw.get('small')
+        if value is not None:
+            value = File.from_raw(value)
+        self.small = value
+        value = raw.get('big')
+        if value is not None:
+            value = File.from_raw(value)
+        self.big = value
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        self.has_animation = raw.get('has_animation')
+        self.is_personal = raw.get('is_personal')
+
+
+@dataclass
+class ChatPhotoInfo(TDObject):
+    """Contains basic information about the photo of a chat"""
+
+    small: File = None
+    big: File = None
+    minithumbnail: Minithumbnail = None
+    has_animation: bool = None
+    is_personal: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('small')
+        if value is not None:
+            value = File.from_raw(value)
+        self.small = value
+        value = raw.get('big')
+        if value is not None:
+            value = File.from_raw(value)
+        self.big = value
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        self.has_animation = raw.get('has_animation')
+        self.is_personal = raw.get('is_personal')
+
+
+@dataclass
+class UserTypeRegular(TDObject):
+    """A regular user"""
+
+
+@dataclass
+class UserTypeDeleted(TDObject):
+    """
+    A deleted user or deleted bot. No information on the user besides the user
+    identifier is available. It is not possible to perform any active actions on
+    this type of user
+    """
+
+
+@dataclass
+class UserTypeBot(TDObject):
+    """A bot (see https://core.telegram.org/bots)"""
+
+    can_be_edited: bool = None
+    can_join_groups: bool = None
+    can_read_all_group_messages: bool = None
+    is_inline: bool = None
+    inline_query_placeholder: str = None
+    need_location: bool = None
+    can_be_added_to_attachment_menu: bool = None
+
+    def _decode(self, raw: dict):
+        self.can_be_edited = raw.get('can_be_edited')
+        self.can_join_groups = raw.get('can_join_groups')
+        self.can_read_all_group_messages = raw.get('can_read_all_group_messages')
+        self.is_inline = raw.get('is_inline')
+        self.inline_query_placeholder = raw.get('inline_query_placeholder')
+        self.need_location = raw.get('need_location')
+        self.can_be_added_to_attachment_menu = raw.get('can_be_added_to_attachment_menu')
+
+
+@dataclass
+class UserTypeUnknown(TDObject):
+    """
+    No information on the user besides the user identifier is available, yet this
+    user has not been deleted. This object is extremely rare and must be handled
+    like a deleted user. It is not possible to perform any actions on users of
+    this type
+    """
+
+
+@dataclass
+class BotCommand(TDObject):
+    """Represents a command supported by a bot"""
+
+    command: str = None
+    description: str = None
+
+    def _decode(self, raw: dict):
+        self.command = raw.get('command')
+        self.description = raw.get('description')
+
+
+@dataclass
+class BotCommands(TDObject):
+    """Contains a list of bot commands"""
+
+    bot_user_id: int = None
+    commands: List[BotCommand] = None
+
+    def _decode(self, raw: dict):
+        self.bot_user_id = raw.get('bot_user_id')
+        value = raw.get('commands')
+        if value is not None:
+            value = [BotCommand.from_raw(item0) for item0 in value]
+        self.commands = value
+
+
+@dataclass
+class BotMenuButton(TDObject):
+    """Describes a button to be shown instead of bot commands menu button"""
+
+    text: str = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        self.url = raw.get('url')
+
+
+@dataclass
+class ChatLocation(TDObject):
+    """Represents a location to which a chat is connected"""
+
+    location: Location = None
+    address: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+        self.address = raw.get('address')
+
+
+@dataclass
+class BusinessAwayMessageScheduleAlways(TDObject):
+    """Send away messages always"""
+
+
+@dataclass
+class BusinessAwayMessageScheduleOutsideOfOpeningHours(TDObject):
+    """Send away messages outside of the business opening hours"""
+
+
+@dataclass
+class BusinessAwayMessageScheduleCustom(TDObject):
+    """Send away messages only in the specified time span"""
+
+    start_date: int = None
+    end_date: int = None
+
+    def _decode(self, raw: dict):
+        self.start_date = raw.get('start_date')
+        self.end_date = raw.get('end_date')
+
+
+@dataclass
+class BusinessLocation(TDObject):
+    """Represents a location of a business"""
+
+    location: Location = None
+    address: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+        self.address = raw.get('address')
+
+
+@dataclass
+class BusinessRecipients(TDObject):
+    """Describes private chats chosen for automatic interaction with a business"""
+
+    chat_ids: List[int] = None
+    select_existing_chats: bool = None
+    select_new_chats: bool = None
+    select_contacts: bool = None
+    select_non_contacts: bool = None
+    exclude_selected: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_ids = raw.get('chat_ids')
+        self.select_existing_chats = raw.get('select_existing_chats')
+        self.select_new_chats = raw.get('select_new_chats')
+        self.select_contacts = raw.get('select_contacts')
+        self.select_non_contacts = raw.get('select_non_contacts')
+        self.exclude_selected = raw.get('exclude_selected')
+
+
+@dataclass
+class BusinessAwayMessageSettings(TDObject):
+    """
+    Describes settings for messages that are automatically sent by a Telegram
+    Business account when it is away
+    """
+
+    shortcut_id: int = None
+    recipients: BusinessRecipients = None
+    schedule: TDObject = None
+    offline_only: bool = None
+
+    def _decode(self, raw: dict):
+        self.shortcut_id = raw.get('shortcut_id')
+        value = raw.get('recipients')
+        if value is not None:
+            value = BusinessRecipients.from_raw(value)
+        self.recipients = value
+        value = raw.get('schedule')
+        if value is not None:
+            value = BusinessAwayMessageSchedule(value)
+        self.schedule = value
+        self.offline_only = raw.get('offline_only')
+
+
+@dataclass
+class BusinessGreetingMessageSettings(TDObject):
+    """
+    Describes settings for greeting messages that are automatically sent by a
+    Telegram Business account as response to incoming messages in an inactive
+    private chat
+    """
+
+    shortcut_id: int = None
+    recipients: BusinessRecipients = None
+    inactivity_days: int = None
+
+    def _decode(self, raw: dict):
+        self.shortcut_id = raw.get('shortcut_id')
+        value = raw.get('recipients')
+        if value is not None:
+            value = BusinessRecipients.from_raw(value)
+        self.recipients = value
+        self.inactivity_days = raw.get('inactivity_days')
+
+
+@dataclass
+class BusinessConnectedBot(TDObject):
+    """Describes a bot connected to a business account"""
+
+    bot_user_id: int = None
+    recipients: BusinessRecipients = None
+    can_reply: bool = None
+
+    def _decode(self, raw: dict):
+        self.bot_user_id = raw.get('bot_user_id')
+        value = raw.get('recipients')
+        if value is not None:
+            value = BusinessRecipients.from_raw(value)
+        self.recipients = value
+        self.can_reply = raw.get('can_reply')
+
+
+@dataclass
+class BusinessOpeningHoursInterval(TDObject):
+    """Describes an interval of time when the business is open"""
+
+    start_minute: int = None
+    end_minute: int = None
+
+    def _decode(self, raw: dict):
+        self.start_minute = raw.get('start_minute')
+        self.end_minute = raw.get('end_minute')
+
+
+@dataclass
+class BusinessOpeningHours(TDObject):
+    """Describes opening hours of a business"""
+
+    time_zone_id: str = None
+    opening_hours: List[BusinessOpeningHoursInterval] = None
+
+    def _decode(self, raw: dict):
+        self.time_zone_id = raw.get('time_zone_id')
+        value = raw.get('opening_hours')
+        if value is not None:
+            value = [BusinessOpeningHoursInterval.from_raw(item0) for item0 in value]
+        self.opening_hours = value
+
+
+@dataclass
+class BusinessInfo(TDObject):
+    """Contains information about a Telegram Business account"""
+
+    location: BusinessLocation = None
+    opening_hours: BusinessOpeningHours = None
+    greeting_message_settings: BusinessGreetingMessageSettings = None
+    away_message_settings: BusinessAwayMessageSettings = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = BusinessLocation.from_raw(value)
+        self.location = value
+        value = raw.get('opening_hours')
+        if value is not None:
+            value = BusinessOpeningHours.from_raw(value)
+        self.opening_hours = value
+        value = raw.get('greeting_message_settings')
+        if value is not None:
+            value = BusinessGreetingMessageSettings.from_raw(value)
+        self.greeting_message_settings = value
+        value = raw.get('away_message_settings')
+        if value is not None:
+            value = BusinessAwayMessageSettings.from_raw(value)
+        self.away_message_settings = value
+
+
+@dataclass
+class ChatPhotoStickerTypeRegularOrMask(TDObject):
+    """Information about the sticker, which was used to create the chat photo"""
+
+    sticker_set_id: int = None
+    sticker_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker_set_id')
+        if value is not None:
+            value = int(value)
+        self.sticker_set_id = value
+        value = raw.get('sticker_id')
+        if value is not None:
+            value = int(value)
+        self.sticker_id = value
+
+
+@dataclass
+class ChatPhotoStickerTypeCustomEmoji(TDObject):
+    """Information about the custom emoji, which was used to create the chat photo"""
+
+    custom_emoji_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.custom_emoji_id = value
+
+
+@dataclass
+class ChatPhotoSticker(TDObject):
+    """
+    Information about the sticker, which was used to create the chat photo. The
+    sticker is shown at the center of the photo and occupies at most 67% of it
+    """
+
+    type: TDObject = None
+    background_fill: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = ChatPhotoStickerType(value)
+        self.type = value
+        value = raw.get('background_fill')
+        if value is not None:
+            value = BackgroundFill(value)
+        self.background_fill = value
+
+
+@dataclass
+class AnimatedChatPhoto(TDObject):
+    """Animated variant of a chat photo in MPEG4 format"""
+
+    length: int = None
+    file: File = None
+    main_frame_timestamp: float = None
+
+    def _decode(self, raw: dict):
+        self.length = raw.get('length')
+        value = raw.get('file')
+        if value is not None:
+            value = File.from_raw(value)
+        self.file = value
+        value = raw.get('main_frame_timestamp')
+        if value is not None:
+            value = float(value)
+        self.main_frame_timestamp = value
+
+
+@dataclass
+class ChatPhoto(TDObject):
+    """Describes a chat or user profile photo"""
+
+    id: int = None
+    added_date: int = None
+    minithumbnail: Minithumbnail = None
+    sizes: List[PhotoSize] = None
+    animation: AnimatedChatPhoto = None
+    small_animation: AnimatedChatPhoto = None
+    sticker: ChatPhotoSticker = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.added_date = raw.get('added_date')
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        value = raw.get('sizes')
+        if value is not None:
+            value = [PhotoSize.from_raw(item0) for item0 in value]
+        self.sizes = value
+        value = raw.get('animation')
+        if value is not None:
+            value = AnimatedChatPhoto.from_raw(value)
+        self.animation = value
+        value = raw.get('small_animation')
+        if value is not None:
+            value = AnimatedChatPhoto.from_raw(value)
+        self.small_animation = value
+        value = raw.get('sticker')
+        if value is not None:
+            value = ChatPhotoSticker.from_raw(value)
+        self.sticker = value
+
+
+@dataclass
+class ChatPhotos(TDObject):
+    """Contains a list of chat or user profile photos"""
+
+    total_count: int = None
+    photos: List[ChatPhoto] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('photos')
+        if value is not None:
+            value = [ChatPhoto.from_raw(item0) for item0 in value]
+        self.photos = value
+
+
+@dataclass
+class InputChatPhotoPrevious(TDObject):
+    """A previously used profile photo of the current user"""
+
+    chat_photo_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat_photo_id')
+        if value is not None:
+            value = int(value)
+        self.chat_photo_id = value
+
+
+@dataclass
+class InputChatPhotoStatic(TDObject):
+    """A static photo in JPEG format"""
+
+    photo: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = InputFile(value)
+        self.photo = value
+
+
+@dataclass
+class InputChatPhotoAnimation(TDObject):
+    """
+    An animation in MPEG4 format; must be square, at most 10 seconds long, have
+    width between 160 and 1280 and be at most 2MB in size
+    """
+
+    animation: TDObject = None
+    main_frame_timestamp: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('animation')
+        if value is not None:
+            value = InputFile(value)
+        self.animation = value
+        value = raw.get('main_frame_timestamp')
+        if value is not None:
+            value = float(value)
+        self.main_frame_timestamp = value
+
+
+@dataclass
+class InputChatPhotoSticker(TDObject):
+    """A sticker on a custom background"""
+
+    sticker: ChatPhotoSticker = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker')
+        if value is not None:
+            value = ChatPhotoSticker.from_raw(value)
+        self.sticker = value
+
+
+@dataclass
+class ChatPermissions(TDObject):
+    """Describes actions that a user is allowed to take in a chat"""
+
+    can_send_basic_messages: bool = None
+    can_send_audios: bool = None
+    can_send_documents: bool = None
+    can_send_photos: bool = None
+    can_send_videos: bool = None
+    can_send_video_notes: bool = None
+    can_send_voice_notes: bool = None
+    can_send_polls: bool = None
+    can_send_other_messages: bool = None
+    can_add_web_page_previews: bool = None
+    can_change_info: bool = None
+    can_invite_users: bool = None
+    can_pin_messages: bool = None
+    can_create_topics: bool = None
+
+    def _decode(self, raw: dict):
+        self.can_send_basic_messages = raw.get('can_send_basic_messages')
+        self.can_send_audios = raw.get('can_send_audios')
+        self.can_send_documents = raw.get('can_send_documents')
+        self.can_send_photos = raw.get('can_send_photos')
+        self.can_send_videos = raw.get('can_send_videos')
+        self.can_send_video_notes = raw.get('can_send_video_notes')
+        self.can_send_voice_notes = raw.get('can_send_voice_notes')
+        self.can_send_polls = raw.get('can_send_polls')
+        self.can_send_other_messages = raw.get('can_send_other_messages')
+        self.can_add_web_page_previews = raw.get('can_add_web_page_previews')
+        self.can_change_info = raw.get('can_change_info')
+        self.can_invite_users = raw.get('can_invite_users')
+        self.can_pin_messages = raw.get('can_pin_messages')
+        self.can_create_topics = raw.get('can_create_topics')
+
+
+@dataclass
+class ChatAdministratorRights(TDObject):
+    """Describes rights of the administrator"""
+
+    can_manage_chat: bool = None
+    can_change_info: bool = None
+    can_post_messages: bool = None
+    can_edit_messages: bool = None
+    can_delete_messages: bool = None
+    can_invite_users: bool = None
+    can_restrict_members: bool = None
+    can_pin_messages: bool = None
+    can_manage_topics: bool = None
+    can_promote_members: bool = None
+    can_manage_video_chats: bool = None
+    can_post_stories: bool = None
+    can_edit_stories: bool = None
+    can_delete_stories: bool = None
+    is_anonymous: bool = None
+
+    def _decode(self, raw: dict):
+        self.can_manage_chat = raw.get('can_manage_chat')
+        self.can_change_info = raw.get('can_change_info')
+        self.can_post_messages = raw.get('can_post_messages')
+        self.can_edit_messages = raw.get('can_edit_messages')
+        self.can_delete_messages = raw.get('can_delete_messages')
+        self.can_invite_users = raw.get('can_invite_users')
+        self.can_restrict_members = raw.get('can_restrict_members')
+        self.can_pin_messages = raw.get('can_pin_messages')
+        self.can_manage_topics = raw.get('can_manage_topics')
+        self.can_promote_members = raw.get('can_promote_members')
+        self.can_manage_video_chats = raw.get('can_manage_video_chats')
+        self.can_post_stories = raw.get('can_post_stories')
+        self.can_edit_stories = raw.get('can_edit_stories')
+        self.can_delete_stories = raw.get('can_delete_stories')
+        self.is_anonymous = raw.get('is_anonymous')
+
+
+@dataclass
+class PremiumPaymentOption(TDObject):
+    """Describes an option for buying Telegram Premium to a user"""
+
+    currency: str = None
+    amount: int = None
+    discount_percentage: int = None
+    month_count: int = None
+    store_product_id: str = None
+    payment_link: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+        self.discount_percentage = raw.get('discount_percentage')
+        self.month_count = raw.get('month_count')
+        self.store_product_id = raw.get('store_product_id')
+        value = raw.get('payment_link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.payment_link = value
+
+
+@dataclass
+class PremiumStatePaymentOption(TDObject):
+    """Describes an option for buying or upgrading Telegram Premium for self"""
+
+    payment_option: PremiumPaymentOption = None
+    is_current: bool = None
+    is_upgrade: bool = None
+    last_transaction_id: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('payment_option')
+        if value is not None:
+            value = PremiumPaymentOption.from_raw(value)
+        self.payment_option = value
+        self.is_current = raw.get('is_current')
+        self.is_upgrade = raw.get('is_upgrade')
+        self.last_transaction_id = raw.get('last_transaction_id')
+
+
+@dataclass
+class PremiumGiftCodePaymentOption(TDObject):
+    """Describes an option for creating Telegram Premium gift codes"""
+
+    currency: str = None
+    amount: int = None
+    user_count: int = None
+    month_count: int = None
+    store_product_id: str = None
+    store_product_quantity: int = None
+
+    def _decode(self, raw: dict):
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+        self.user_count = raw.get('user_count')
+        self.month_count = raw.get('month_count')
+        self.store_product_id = raw.get('store_product_id')
+        self.store_product_quantity = raw.get('store_product_quantity')
+
+
+@dataclass
+class PremiumGiftCodePaymentOptions(TDObject):
+    """Contains a list of options for creating Telegram Premium gift codes"""
+
+    options: List[PremiumGiftCodePaymentOption] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('options')
+        if value is not None:
+            value = [PremiumGiftCodePaymentOption.from_raw(item0) for item0 in value]
+        self.options = value
+
+
+@dataclass
+class PremiumGiftCodeInfo(TDObject):
+    """Contains information about a Telegram Premium gift code"""
+
+    creator_id: TDObject = None
+    creation_date: int = None
+    is_from_giveaway: bool = None
+    giveaway_message_id: int = None
+    month_count: int = None
+    user_id: int = None
+    use_date: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('creator_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.creator_id = value
+        self.creation_date = raw.get('creation_date')
+        self.is_from_giveaway = raw.get('is_from_giveaway')
+        self.giveaway_message_id = raw.get('giveaway_message_id')
+        self.month_count = raw.get('month_count')
+        self.user_id = raw.get('user_id')
+        self.use_date = raw.get('use_date')
+
+
+@dataclass
+class PremiumGiveawayParticipantStatusEligible(TDObject):
+    """The user is eligible for the giveaway"""
+
+
+@dataclass
+class PremiumGiveawayParticipantStatusParticipating(TDObject):
+    """The user participates in the giveaway"""
+
+
+@dataclass
+class PremiumGiveawayParticipantStatusAlreadyWasMember(TDObject):
+    """
+    The user can't participate in the giveaway, because they have already been
+    member of the chat
+    """
+
+    joined_chat_date: int = None
+
+    def _decode(self, raw: dict):
+        self.joined_chat_date = raw.get('joined_chat_date')
+
+
+@dataclass
+class PremiumGiveawayParticipantStatusAdministrator(TDObject):
+    """
+    The user can't participate in the giveaway, because they are an administrator
+    in one of the chats that created the giveaway
+    """
+
+    chat_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+
+
+@dataclass
+class PremiumGiveawayParticipantStatusDisallowedCountry(TDObject):
+    """
+    The user can't participate in the giveaway, because they phone number is from
+    a disallowed country
+    """
+
+    user_country_code: str = None
+
+    def _decode(self, raw: dict):
+        self.user_country_code = raw.get('user_country_code')
+
+
+@dataclass
+class PremiumGiveawayInfoOngoing(TDObject):
+    """Describes an ongoing giveaway"""
+
+    creation_date: int = None
+    status: TDObject = None
+    is_ended: bool = None
+
+    def _decode(self, raw: dict):
+        self.creation_date = raw.get('creation_date')
+        value = raw.get('status')
+        if value is not None:
+            value = PremiumGiveawayParticipantStatus(value)
+        self.status = value
+        self.is_ended = raw.get('is_ended')
+
+
+@dataclass
+class PremiumGiveawayInfoCompleted(TDObject):
+    """Describes a completed giveaway"""
+
+    creation_date: int = None
+    actual_winners_selection_date: int = None
+    was_refunded: bool = None
+    winner_count: int = None
+    activation_count: int = None
+    gift_code: str = None
+
+    def _decode(self, raw: dict):
+        self.creation_date = raw.get('creation_date')
+        self.actual_winners_selection_date = raw.get('actual_winners_selection_date')
+        self.was_refunded = raw.get('was_refunded')
+        self.winner_count = raw.get('winner_count')
+        self.activation_count = raw.get('activation_count')
+        self.gift_code = raw.get('gift_code')
+
+
+@dataclass
+class AccentColor(TDObject):
+    """
+    Contains information about supported accent color for user/chat name,
+    background of empty chat photo, replies to messages and link previews
+    """
+
+    id: int = None
+    built_in_accent_color_id: int = None
+    light_theme_colors: List[int] = None
+    dark_theme_colors: List[int] = None
+    min_channel_chat_boost_level: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.built_in_accent_color_id = raw.get('built_in_accent_color_id')
+        self.light_theme_colors = raw.get('light_theme_colors')
+        self.dark_theme_colors = raw.get('dark_theme_colors')
+        self.min_channel_chat_boost_level = raw.get('min_channel_chat_boost_level')
+
+
+@dataclass
+class ProfileAccentColors(TDObject):
+    """
+    Contains information about supported accent colors for user profile photo
+    background in RGB format
+    """
+
+    palette_colors: List[int] = None
+    background_colors: List[int] = None
+    story_colors: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.palette_colors = raw.get('palette_colors')
+        self.background_colors = raw.get('background_colors')
+        self.story_colors = raw.get('story_colors')
+
+
+@dataclass
+class ProfileAccentColor(TDObject):
+    """
+    Contains information about supported accent color for user profile photo
+    background
+    """
+
+    id: int = None
+    light_theme_colors: ProfileAccentColors = None
+    dark_theme_colors: ProfileAccentColors = None
+    min_supergroup_chat_boost_level: int = None
+    min_channel_chat_boost_level: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('light_theme_colors')
+        if value is not None:
+            value = ProfileAccentColors.from_raw(value)
+        self.light_theme_colors = value
+        value = raw.get('dark_theme_colors')
+        if value is not None:
+            value = ProfileAccentColors.from_raw(value)
+        self.dark_theme_colors = value
+        self.min_supergroup_chat_boost_level = raw.get('min_supergroup_chat_boost_level')
+        self.min_channel_chat_boost_level = raw.get('min_channel_chat_boost_level')
+
+
+@dataclass
+class EmojiStatus(TDObject):
+    """Describes a custom emoji to be shown instead of the Telegram Premium badge"""
+
+    custom_emoji_id: int = None
+    expiration_date: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.custom_emoji_id = value
+        self.expiration_date = raw.get('expiration_date')
+
+
+@dataclass
+class EmojiStatuses(TDObject):
+    """Contains a list of custom emoji identifiers for emoji statuses"""
+
+    custom_emoji_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('custom_emoji_ids')
+        if value is not None:
+            value = [int(item0) for item0 in value]
+        self.custom_emoji_ids = value
+
+
+@dataclass
+class Usernames(TDObject):
+    """Describes usernames assigned to a user, a supergroup, or a channel"""
+
+    active_usernames: List[str] = None
+    disabled_usernames: List[str] = None
+    editable_username: str = None
+
+    def _decode(self, raw: dict):
+        self.active_usernames = raw.get('active_usernames')
+        self.disabled_usernames = raw.get('disabled_usernames')
+        self.editable_username = raw.get('editable_username')
+
+
+@dataclass
+class User(TDObject):
+    """Represents a user"""
+
+    id: int = None
+    first_name: str = None
+    last_name: str = None
+    usernames: Usernames = None
+    phone_number: str = None
+    status: TDObject = None
+    profile_photo: ProfilePhoto = None
+    accent_color_id: int = None
+    background_custom_emoji_id: int = None
+    profile_accent_color_id: int = None
+    profile_background_custom_emoji_id: int = None
+    emoji_status: EmojiStatus = None
+    is_contact: bool = None
+    is_mutual_contact: bool = None
+    is_close_friend: bool = None
+    is_verified: bool = None
+    is_premium: bool = None
+    is_support: bool = None
+    restriction_reason: str = None
+    is_scam: bool = None
+    is_fake: bool = None
+    has_active_stories: bool = None
+    has_unread_active_stories: bool = None
+    restricts_new_chats: bool = None
+    have_access: bool = None
+    type: TDObject = None
+    language_code: str = None
+    added_to_attachment_menu: bool = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.first_name = raw.get('first_name')
+        self.last_name = raw.get('last_name')
+        value = raw.get('usernames')
+        if value is not None:
+            value = Usernames.from_raw(value)
+        self.usernames = value
+        self.phone_number = raw.get('phone_number')
+        value = raw.get('status')
+        if value is not None:
+            value = UserStatus(value)
+        self.status = value
+        value = raw.get('profile_photo')
+        if value is not None:
+            value = ProfilePhoto.from_raw(value)
+        self.profile_photo = value
+        self.accent_color_id = raw.get('accent_color_id')
+        value = raw.get('background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.background_custom_emoji_id = value
+        self.profile_accent_color_id = raw.get('profile_accent_color_id')
+        value = raw.get('profile_background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.profile_background_custom_emoji_id = value
+        value = raw.get('emoji_status')
+        if value is not None:
+            value = EmojiStatus.from_raw(value)
+        self.emoji_status = value
+        self.is_contact = raw.get('is_contact')
+        self.is_mutual_contact = raw.get('is_mutual_contact')
+        self.is_close_friend = raw.get('is_close_friend')
+        self.is_verified = raw.get('is_verified')
+        self.is_premium = raw.get('is_premium')
+        self.is_support = raw.get('is_support')
+        self.restriction_reason = raw.get('restriction_reason')
+        self.is_scam = raw.get('is_scam')
+        self.is_fake = raw.get('is_fake')
+        self.has_active_stories = raw.get('has_active_stories')
+        self.has_unread_active_stories = raw.get('has_unread_active_stories')
+        self.restricts_new_chats = raw.get('restricts_new_chats')
+        self.have_access = raw.get('have_access')
+        value = raw.get('type')
+        if value is not None:
+            value = UserType(value)
+        self.type = value
+        self.language_code = raw.get('language_code')
+        self.added_to_attachment_menu = raw.get('added_to_attachment_menu')
+
+
+@dataclass
+class BotInfo(TDObject):
+    """Contains information about a bot"""
+
+    short_description: str = None
+    description: str = None
+    photo: Photo = None
+    animation: Animation = None
+    menu_button: BotMenuButton = None
+    commands: List[BotCommand] = None
+    default_group_administrator_rights: ChatAdministratorRights = None
+    default_channel_administrator_rights: ChatAdministratorRights = None
+    edit_commands_link: TDObject = None
+    edit_description_link: TDObject = None
+    edit_description_media_link: TDObject = None
+    edit_settings_link: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.short_description = raw.get('short_description')
+        self.description = raw.get('description')
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+        value = raw.get('menu_button')
+        if value is not None:
+            value = BotMenuButton.from_raw(value)
+        self.menu_button = value
+        value = raw.get('commands')
+        if value is not None:
+            value = [BotCommand.from_raw(item0) for item0 in value]
+        self.commands = value
+        value = raw.get('default_group_administrator_rights')
+        if value is not None:
+            value = ChatAdministratorRights.from_raw(value)
+        self.default_group_administrator_rights = value
+        value = raw.get('default_channel_administrator_rights')
+        if value is not None:
+            value = ChatAdministratorRights.from_raw(value)
+        self.default_channel_administrator_rights = value
+        value = raw.get('edit_commands_link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.edit_commands_link = value
+        value = raw.get('edit_description_link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.edit_description_link = value
+        value = raw.get('edit_description_media_link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.edit_description_media_link = value
+        value = raw.get('edit_settings_link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.edit_settings_link = value
+
+
+@dataclass
+class UserFullInfo(TDObject):
+    """Contains full information about a user"""
+
+    personal_photo: ChatPhoto = None
+    photo: ChatPhoto = None
+    public_photo: ChatPhoto = None
+    block_list: TDObject = None
+    can_be_called: bool = None
+    supports_video_calls: bool = None
+    has_private_calls: bool = None
+    has_private_forwards: bool = None
+    has_restricted_voice_and_video_note_messages: bool = None
+    has_pinned_stories: bool = None
+    need_phone_number_privacy_exception: bool = None
+    set_chat_background: bool = None
+    bio: FormattedText = None
+    premium_gift_options: List[PremiumPaymentOption] = None
+    group_in_common_count: int = None
+    business_info: BusinessInfo = None
+    bot_info: BotInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('personal_photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.personal_photo = value
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.photo = value
+        value = raw.get('public_photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.public_photo = value
+        value = raw.get('block_list')
+        if value is not None:
+            value = BlockList(value)
+        self.block_list = value
+        self.can_be_called = raw.get('can_be_called')
+        self.supports_video_calls = raw.get('supports_video_calls')
+        self.has_private_calls = raw.get('has_private_calls')
+        self.has_private_forwards = raw.get('has_private_forwards')
+        self.has_restricted_voice_and_video_note_messages = raw.get('has_restricted_voice_and_video_note_messages')
+        self.has_pinned_stories = raw.get('has_pinned_stories')
+        self.need_phone_number_privacy_exception = raw.get('need_phone_number_privacy_exception')
+        self.set_chat_background = raw.get('set_chat_background')
+        value = raw.get('bio')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.bio = value
+        value = raw.get('premium_gift_options')
+        if value is not None:
+            value = [PremiumPaymentOption.from_raw(item0) for item0 in value]
+        self.premium_gift_options = value
+        self.group_in_common_count = raw.get('group_in_common_count')
+        value = raw.get('business_info')
+        if value is not None:
+            value = BusinessInfo.from_raw(value)
+        self.business_info = value
+        value = raw.get('bot_info')
+        if value is not None:
+            value = BotInfo.from_raw(value)
+        self.bot_info = value
+
+
+@dataclass
+class Users(TDObject):
+    """Represents a list of users"""
+
+    total_count: int = None
+    user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        self.user_ids = raw.get('user_ids')
+
+
+@dataclass
+class ChatAdministrator(TDObject):
+    """Contains information about a chat administrator"""
+
+    user_id: int = None
+    custom_title: str = None
+    is_owner: bool = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.custom_title = raw.get('custom_title')
+        self.is_owner = raw.get('is_owner')
+
+
+@dataclass
+class ChatAdministrators(TDObject):
+    """Represents a list of chat administrators"""
+
+    administrators: List[ChatAdministrator] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('administrators')
+        if value is not None:
+            value = [ChatAdministrator.from_raw(item0) for item0 in value]
+        self.administrators = value
+
+
+@dataclass
+class ChatMemberStatusCreator(TDObject):
+    """The user is the owner of the chat and has all the administrator privileges"""
+
+    custom_title: str = None
+    is_anonymous: bool = None
+    is_member: bool = None
+
+    def _decode(self, raw: dict):
+        self.custom_title = raw.get('custom_title')
+        self.is_anonymous = raw.get('is_anonymous')
+        self.is_member = raw.get('is_member')
+
+
+@dataclass
+class ChatMemberStatusAdministrator(TDObject):
+    """
+    The user is a member of the chat and has some additional privileges. In basic
+    groups, administrators can edit and delete messages sent by others, add new
+    members, ban unprivileged members, and manage video chats. In supergroups and
+    channels, there are more detailed options for administrator privileges
+    """
+
+    custom_title: str = None
+    can_be_edited: bool = None
+    rights: ChatAdministratorRights = None
+
+    def _decode(self, raw: dict):
+        self.custom_title = raw.get('custom_title')
+        self.can_be_edited = raw.get('can_be_edited')
+        value = raw.get('rights')
+        if value is not None:
+            value = ChatAdministratorRights.from_raw(value)
+        self.rights = value
+
+
+@dataclass
+class ChatMemberStatusMember(TDObject):
+    """
+    The user is a member of the chat, without any additional privileges or
+    restrictions
+    """
+
+
+@dataclass
+class ChatMemberStatusRestricted(TDObject):
+    """
+    The user is under certain restrictions in the chat. Not supported in basic
+    groups and channels
+    """
+
+    is_member: bool = None
+    restricted_until_date: int = None
+    permissions: ChatPermissions = None
+
+    def _decode(self, raw: dict):
+        self.is_member = raw.get('is_member')
+        self.restricted_until_date = raw.get('restricted_until_date')
+        value = raw.get('permissions')
+        if value is not None:
+            value = ChatPermissions.from_raw(value)
+        self.permissions = value
+
+
+@dataclass
+class ChatMemberStatusLeft(TDObject):
+    """The user or the chat is not a chat member"""
+
+
+@dataclass
+class ChatMemberStatusBanned(TDObject):
+    """
+    The user or the chat was banned (and hence is not a member of the chat).
+    Implies the user can't return to the chat, view messages, or be used as a
+    participant identifier to join a video chat of the chat
+    """
+
+    banned_until_date: int = None
+
+    def _decode(self, raw: dict):
+        self.banned_until_date = raw.get('banned_until_date')
+
+
+@dataclass
+class ChatMember(TDObject):
+    """Describes a user or a chat as a member of another chat"""
+
+    member_id: TDObject = None
+    inviter_user_id: int = None
+    joined_chat_date: int = None
+    status: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('member_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.member_id = value
+        self.inviter_user_id = raw.get('inviter_user_id')
+        self.joined_chat_date = raw.get('joined_chat_date')
+        value = raw.get('status')
+        if value is not None:
+            value = ChatMemberStatus(value)
+        self.status = value
+
+
+@dataclass
+class ChatMembers(TDObject):
+    """Contains a list of chat members"""
+
+    total_count: int = None
+    members: List[ChatMember] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('members')
+        if value is not None:
+            value = [ChatMember.from_raw(item0) for item0 in value]
+        self.members = value
+
+
+@dataclass
+class ChatMembersFilterContacts(TDObject):
+    """Returns contacts of the user"""
+
+
+@dataclass
+class ChatMembersFilterAdministrators(TDObject):
+    """Returns the owner and administrators"""
+
+
+@dataclass
+class ChatMembersFilterMembers(TDObject):
+    """Returns all chat members, including restricted chat members"""
+
+
+@dataclass
+class ChatMembersFilterMention(TDObject):
+    """Returns users which can be mentioned in the chat"""
+
+    message_thread_id: int = None
+
+    def _decode(self, raw: dict):
+        self.message_thread_id = raw.get('message_thread_id')
+
+
+@dataclass
+class ChatMembersFilterRestricted(TDObject):
+    """
+    Returns users under certain restrictions in the chat; can be used only by
+    administrators in a supergroup
+    """
+
+
+@dataclass
+class ChatMembersFilterBanned(TDObject):
+    """
+    Returns users banned from the chat; can be used only by administrators in a
+    supergroup or in a channel
+    """
+
+
+@dataclass
+class ChatMembersFilterBots(TDObject):
+    """Returns bot members of the chat"""
+
+
+@dataclass
+class SupergroupMembersFilterRecent(TDObject):
+    """Returns recently active users in reverse chronological order"""
+
+
+@dataclass
+class SupergroupMembersFilterContacts(TDObject):
+    """Returns contacts of the user, which are members of the supergroup or channel"""
+
+    query: str = None
+
+    def _decode(self, raw: dict):
+        self.query = raw.get('query')
+
+
+@dataclass
+class SupergroupMembersFilterAdministrators(TDObject):
+    """Returns the owner and administrators"""
+
+
+@dataclass
+class SupergroupMembersFilterSearch(TDObject):
+    """Used to search for supergroup or channel members via a (string) query"""
+
+    query: str = None
+
+    def _decode(self, raw: dict):
+        self.query = raw.get('query')
+
+
+@dataclass
+class SupergroupMembersFilterRestricted(TDObject):
+    """Returns restricted supergroup members; can be used only by administrators"""
+
+    query: str = None
+
+    def _decode(self, raw: dict):
+        self.query = raw.get('query')
+
+
+@dataclass
+class SupergroupMembersFilterBanned(TDObject):
+    """
+    Returns users banned from the supergroup or channel; can be used only by
+    administrators
+    """
+
+    query: str = None
+
+    def _decode(self, raw: dict):
+        self.query = raw.get('query')
+
+
+@dataclass
+class SupergroupMembersFilterMention(TDObject):
+    """Returns users which can be mentioned in the supergroup"""
+
+    query: str = None
+    message_thread_id: int = None
+
+    def _decode(self, raw: dict):
+        self.query = raw.get('query')
+        self.message_thread_id = raw.get('message_thread_id')
+
+
+@dataclass
+class SupergroupMembersFilterBots(TDObject):
+    """Returns bot members of the supergroup or channel"""
+
+
+@dataclass
+class ChatInviteLink(TDObject):
+    """Contains a chat invite link"""
+
+    invite_link: str = None
+    name: str = None
+    creator_user_id: int = None
+    date: int = None
+    edit_date: int = None
+    expiration_date: int = None
+    member_limit: int = None
+    member_count: int = None
+    pending_join_request_count: int = None
+    creates_join_request: bool = None
+    is_primary: bool = None
+    is_revoked: bool = None
+
+    def _decode(self, raw: dict):
+        self.invite_link = raw.get('invite_link')
+        self.name = raw.get('name')
+        self.creator_user_id = raw.get('creator_user_id')
+        self.date = raw.get('date')
+        self.edit_date = raw.get('edit_date')
+        self.expiration_date = raw.get('expiration_date')
+        self.member_limit = raw.get('member_limit')
+        self.member_count = raw.get('member_count')
+        self.pending_join_request_count = raw.get('pending_join_request_count')
+        self.creates_join_request = raw.get('creates_join_request')
+        self.is_primary = raw.get('is_primary')
+        self.is_revoked = raw.get('is_revoked')
+
+
+@dataclass
+class ChatInviteLinks(TDObject):
+    """Contains a list of chat invite links"""
+
+    total_count: int = None
+    invite_links: List[ChatInviteLink] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('invite_links')
+        if value is not None:
+            value = [ChatInviteLink.from_raw(item0) for item0 in value]
+        self.invite_links = value
+
+
+@dataclass
+class ChatInviteLinkCount(TDObject):
+    """
+    Describes a chat administrator with a number of active and revoked chat invite
+    links
+    """
+
+    user_id: int = None
+    invite_link_count: int = None
+    revoked_invite_link_count: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.invite_link_count = raw.get('invite_link_count')
+        self.revoked_invite_link_count = raw.get('revoked_invite_link_count')
+
+
+@dataclass
+class ChatInviteLinkCounts(TDObject):
+    """Contains a list of chat invite link counts"""
+
+    invite_link_counts: List[ChatInviteLinkCount] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('invite_link_counts')
+        if value is not None:
+            value = [ChatInviteLinkCount.from_raw(item0) for item0 in value]
+        self.invite_link_counts = value
+
+
+@dataclass
+class ChatInviteLinkMember(TDObject):
+    """Describes a chat member joined a chat via an invite link"""
+
+    user_id: int = None
+    joined_chat_date: int = None
+    via_chat_folder_invite_link: bool = None
+    approver_user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.joined_chat_date = raw.get('joined_chat_date')
+        self.via_chat_folder_invite_link = raw.get('via_chat_folder_invite_link')
+        self.approver_user_id = raw.get('approver_user_id')
+
+
+@dataclass
+class ChatInviteLinkMembers(TDObject):
+    """Contains a list of chat members joined a chat via an invite link"""
+
+    total_count: int = None
+    members: List[ChatInviteLinkMember] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('members')
+        if value is not None:
+            value = [ChatInviteLinkMember.from_raw(item0) for item0 in value]
+        self.members = value
+
+
+@dataclass
+class InviteLinkChatTypeBasicGroup(TDObject):
+    """The link is an invite link for a basic group"""
+
+
+@dataclass
+class InviteLinkChatTypeSupergroup(TDObject):
+    """The link is an invite link for a supergroup"""
+
+
+@dataclass
+class InviteLinkChatTypeChannel(TDObject):
+    """The link is an invite link for a channel"""
+
+
+@dataclass
+class ChatInviteLinkInfo(TDObject):
+    """Contains information about a chat invite link"""
+
+    chat_id: int = None
+    accessible_for: int = None
+    type: TDObject = None
+    title: str = None
+    photo: ChatPhotoInfo = None
+    accent_color_id: int = None
+    description: str = None
+    member_count: int = None
+    member_user_ids: List[int] = None
+    creates_join_request: bool = None
+    is_public: bool = None
+    is_verified: bool = None
+    is_scam: bool = None
+    is_fake: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.accessible_for = raw.get('accessible_for')
+        value = raw.get('type')
+        if value is not None:
+            value = InviteLinkChatType(value)
+        self.type = value
+        self.title = raw.get('title')
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhotoInfo.from_raw(value)
+        self.photo = value
+        self.accent_color_id = raw.get('accent_color_id')
+        self.description = raw.get('description')
+        self.member_count = raw.get('member_count')
+        self.member_user_ids = raw.get('member_user_ids')
+        self.creates_join_request = raw.get('creates_join_request')
+        self.is_public = raw.get('is_public')
+        self.is_verified = raw.get('is_verified')
+        self.is_scam = raw.get('is_scam')
+        self.is_fake = raw.get('is_fake')
+
+
+@dataclass
+class ChatJoinRequest(TDObject):
+    """Describes a user that sent a join request and waits for administrator approval"""
+
+    user_id: int = None
+    date: int = None
+    bio: str = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.date = raw.get('date')
+        self.bio = raw.get('bio')
+
+
+@dataclass
+class ChatJoinRequests(TDObject):
+    """Contains a list of requests to join a chat"""
+
+    total_count: int = None
+    requests: List[ChatJoinRequest] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('requests')
+        if value is not None:
+            value = [ChatJoinRequest.from_raw(item0) for item0 in value]
+        self.requests = value
+
+
+@dataclass
+class ChatJoinRequestsInfo(TDObject):
+    """Contains information about pending join requests for a chat"""
+
+    total_count: int = None
+    user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        self.user_ids = raw.get('user_ids')
+
+
+@dataclass
+class BasicGroup(TDObject):
+    """
+    Represents a basic group of 0-200 users (must be upgraded to a supergroup to
+    accommodate more than 200 users)
+    """
+
+    id: int = None
+    member_count: int = None
+    status: TDObject = None
+    is_active: bool = None
+    upgraded_to_supergroup_id: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.member_count = raw.get('member_count')
+        value = raw.get('status')
+        if value is not None:
+            value = ChatMemberStatus(value)
+        self.status = value
+        self.is_active = raw.get('is_active')
+        self.upgraded_to_supergroup_id = raw.get('upgraded_to_supergroup_id')
+
+
+@dataclass
+class BasicGroupFullInfo(TDObject):
+    """Contains full information about a basic group"""
+
+    photo: ChatPhoto = None
+    description: str = None
+    creator_user_id: int = None
+    members: List[ChatMember] = None
+    can_hide_members: bool = None
+    can_toggle_aggressive_anti_spam: bool = None
+    invite_link: ChatInviteLink = None
+    bot_commands: List[BotCommands] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.photo = value
+        self.description = raw.get('description')
+        self.creator_user_id = raw.get('creator_user_id')
+        value = raw.get('members')
+        if value is not None:
+            value = [ChatMember.from_raw(item0) for item0 in value]
+        self.members = value
+        self.can_hide_members = raw.get('can_hide_members')
+        self.can_toggle_aggressive_anti_spam = raw.get('can_toggle_aggressive_anti_spam')
+        value = raw.get('invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.invite_link = value
+        value = raw.get('bot_commands')
+        if value is not None:
+            value = [BotCommands.from_raw(item0) for item0 in value]
+        self.bot_commands = value
+
+
+@dataclass
+class Supergroup(TDObject):
+    """
+    Represents a supergroup or channel with zero or more members (subscribers in
+    the case of channels). From the point of view of the system, a channel is a
+    special kind of a supergroup: only administrators can post and see the list of
+    members, and posts from all administrators use the name and photo of the
+    channel instead of individual names and profile photos. Unlike supergroups,
+    channels can have an unlimited number of subscribers
+    """
+
+    id: int = None
+    usernames: Usernames = None
+    date: int = None
+    status: TDObject = None
+    member_count: int = None
+    boost_level: int = None
+    has_linked_chat: bool = None
+    has_location: bool = None
+    sign_messages: bool = None
+    join_to_send_messages: bool = None
+    join_by_request: bool = None
+    is_slow_mode_enabled: bool = None
+    is_channel: bool = None
+    is_broadcast_group: bool = None
+    is_forum: bool = None
+    is_verified: bool = None
+    restriction_reason: str = None
+    is_scam: bool = None
+    is_fake: bool = None
+    has_active_stories: bool = None
+    has_unread_active_stories: bool = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('usernames')
+        if value is not None:
+            value = Usernames.from_raw(value)
+        self.usernames = value
+        self.date = raw.get('date')
+        value = raw.get('status')
+        if value is not None:
+            value = ChatMemberStatus(value)
+        self.status = value
+        self.member_count = raw.get('member_count')
+        self.boost_level = raw.get('boost_level')
+        self.has_linked_chat = raw.get('has_linked_chat')
+        self.has_location = raw.get('has_location')
+        self.sign_messages = raw.get('sign_messages')
+        self.join_to_send_messages = raw.get('join_to_send_messages')
+        self.join_by_request = raw.get('join_by_request')
+        self.is_slow_mode_enabled = raw.get('is_slow_mode_enabled')
+        self.is_channel = raw.get('is_channel')
+        self.is_broadcast_group = raw.get('is_broadcast_group')
+        self.is_forum = raw.get('is_forum')
+        self.is_verified = raw.get('is_verified')
+        self.restriction_reason = raw.get('restriction_reason')
+        self.is_scam = raw.get('is_scam')
+        self.is_fake = raw.get('is_fake')
+        self.has_active_stories = raw.get('has_active_stories')
+        self.has_unread_active_stories = raw.get('has_unread_active_stories')
+
+
+@dataclass
+class SupergroupFullInfo(TDObject):
+    """Contains full information about a supergroup or channel"""
+
+    photo: ChatPhoto = None
+    description: str = None
+    member_count: int = None
+    administrator_count: int = None
+    restricted_count: int = None
+    banned_count: int = None
+    linked_chat_id: int = None
+    slow_mode_delay: int = None
+    slow_mode_delay_expires_in: float = None
+    can_get_members: bool = None
+    has_hidden_members: bool = None
+    can_hide_members: bool = None
+    can_set_sticker_set: bool = None
+    can_set_location: bool = None
+    can_get_statistics: bool = None
+    can_toggle_aggressive_anti_spam: bool = None
+    is_all_history_available: bool = None
+    has_aggressive_anti_spam_enabled: bool = None
+    has_pinned_stories: bool = None
+    my_boost_count: int = None
+    unrestrict_boost_count: int = None
+    sticker_set_id: int = None
+    custom_emoji_sticker_set_id: int = None
+    location: ChatLocation = None
+    invite_link: ChatInviteLink = None
+    bot_commands: List[BotCommands] = None
+    upgraded_from_basic_group_id: int = None
+    upgraded_from_max_message_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.photo = value
+        self.description = raw.get('description')
+        self.member_count = raw.get('member_count')
+        self.administrator_count = raw.get('administrator_count')
+        self.restricted_count = raw.get('restricted_count')
+        self.banned_count = raw.get('banned_count')
+        self.linked_chat_id = raw.get('linked_chat_id')
+        self.slow_mode_delay = raw.get('slow_mode_delay')
+        value = raw.get('slow_mode_delay_expires_in')
+        if value is not None:
+            value = float(value)
+        self.slow_mode_delay_expires_in = value
+        self.can_get_members = raw.get('can_get_members')
+        self.has_hidden_members = raw.get('has_hidden_members')
+        self.can_hide_members = raw.get('can_hide_members')
+        self.can_set_sticker_set = raw.get('can_set_sticker_set')
+        self.can_set_location = raw.get('can_set_location')
+        self.can_get_statistics = raw.get('can_get_statistics')
+        self.can_toggle_aggressive_anti_spam = raw.get('can_toggle_aggressive_anti_spam')
+        self.is_all_history_available = raw.get('is_all_history_available')
+        self.has_aggressive_anti_spam_enabled = raw.get('has_aggressive_anti_spam_enabled')
+        self.has_pinned_stories = raw.get('has_pinned_stories')
+        self.my_boost_count = raw.get('my_boost_count')
+        self.unrestrict_boost_count = raw.get('unrestrict_boost_count')
+        value = raw.get('sticker_set_id')
+        if value is not None:
+            value = int(value)
+        self.sticker_set_id = value
+        value = raw.get('custom_emoji_sticker_set_id')
+        if value is not None:
+            value = int(value)
+        self.custom_emoji_sticker_set_id = value
+        value = raw.get('location')
+        if value is not None:
+            value = ChatLocation.from_raw(value)
+        self.location = value
+        value = raw.get('invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.invite_link = value
+        value = raw.get('bot_commands')
+        if value is not None:
+            value = [BotCommands.from_raw(item0) for item0 in value]
+        self.bot_commands = value
+        self.upgraded_from_basic_group_id = raw.get('upgraded_from_basic_group_id')
+        self.upgraded_from_max_message_id = raw.get('upgraded_from_max_message_id')
+
+
+@dataclass
+class SecretChatStatePending(TDObject):
+    """The secret chat is not yet created; waiting for the other user to get online"""
+
+
+@dataclass
+class SecretChatStateReady(TDObject):
+    """The secret chat is ready to use"""
+
+
+@dataclass
+class SecretChatStateClosed(TDObject):
+    """The secret chat is closed"""
+
+
+@dataclass
+class SecretChat(TDObject):
+    """Represents a secret chat"""
+
+    id: int = None
+    user_id: int = None
+    state: TDObject = None
+    is_outbound: bool = None
+    key_hash: str = None
+    layer: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.user_id = raw.get('user_id')
+        value = raw.get('state')
+        if value is not None:
+            value = SecretChatState(value)
+        self.state = value
+        self.is_outbound = raw.get('is_outbound')
+        self.key_hash = raw.get('key_hash')
+        self.layer = raw.get('layer')
+
+
+@dataclass
+class MessageSenderUser(TDObject):
+    """The message was sent by a known user"""
+
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class MessageSenderChat(TDObject):
+    """The message was sent on behalf of a chat"""
+
+    chat_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+
+
+@dataclass
+class MessageSenders(TDObject):
+    """Represents a list of message senders"""
+
+    total_count: int = None
+    senders: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('senders')
+        if value is not None:
+            value = [MessageSender(item0) for item0 in value]
+        self.senders = value
+
+
+@dataclass
+class ChatMessageSender(TDObject):
+    """Represents a message sender, which can be used to send messages in a chat"""
+
+    sender: TDObject = None
+    needs_premium: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sender')
+        if value is not None:
+            value = MessageSender(value)
+        self.sender = value
+        self.needs_premium = raw.get('needs_premium')
+
+
+@dataclass
+class ChatMessageSenders(TDObject):
+    """
+    Represents a list of message senders, which can be used to send messages in a
+    chat
+    """
+
+    senders: List[ChatMessageSender] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('senders')
+        if value is not None:
+            value = [ChatMessageSender.from_raw(item0) for item0 in value]
+        self.senders = value
+
+
+@dataclass
+class MessageReadDateRead(TDObject):
+    """Contains read date of the message"""
+
+    read_date: int = None
+
+    def _decode(self, raw: dict):
+        self.read_date = raw.get('read_date')
+
+
+@dataclass
+class MessageReadDateUnread(TDObject):
+    """The message is unread yet"""
+
+
+@dataclass
+class MessageReadDateTooOld(TDObject):
+    """The message is too old to get read date"""
+
+
+@dataclass
+class MessageReadDateUserPrivacyRestricted(TDObject):
+    """The read date is unknown due to privacy settings of the other user"""
+
+
+@dataclass
+class MessageReadDateMyPrivacyRestricted(TDObject):
+    """
+    The read date is unknown due to privacy settings of the current user, but will
+    be known if the user subscribes to Telegram Premium
+    """
+
+
+@dataclass
+class MessageViewer(TDObject):
+    """Represents a viewer of a message"""
+
+    user_id: int = None
+    view_date: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.view_date = raw.get('view_date')
+
+
+@dataclass
+class MessageViewers(TDObject):
+    """Represents a list of message viewers"""
+
+    viewers: List[MessageViewer] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('viewers')
+        if value is not None:
+            value = [MessageViewer.from_raw(item0) for item0 in value]
+        self.viewers = value
+
+
+@dataclass
+class MessageOriginUser(TDObject):
+    """The message was originally sent by a known user"""
+
+    sender_user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.sender_user_id = raw.get('sender_user_id')
+
+
+@dataclass
+class MessageOriginHiddenUser(TDObject):
+    """
+    The message was originally sent by a user, which is hidden by their privacy
+    settings
+    """
+
+    sender_name: str = None
+
+    def _decode(self, raw: dict):
+        self.sender_name = raw.get('sender_name')
+
+
+@dataclass
+class MessageOriginChat(TDObject):
+    """The message was originally sent on behalf of a chat"""
+
+    sender_chat_id: int = None
+    author_signature: str = None
+
+    def _decode(self, raw: dict):
+        self.sender_chat_id = raw.get('sender_chat_id')
+        self.author_signature = raw.get('author_signature')
+
+
+@dataclass
+class MessageOriginChannel(TDObject):
+    """The message was originally a post in a channel"""
+
+    chat_id: int = None
+    message_id: int = None
+    author_signature: str = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        self.author_signature = raw.get('author_signature')
+
+
+@dataclass
+class ForwardSource(TDObject):
+    """
+    Contains information about the last message from which a new message was
+    forwarded last time
+    """
+
+    chat_id: int = None
+    message_id: int = None
+    sender_id: TDObject = None
+    sender_name: str = None
+    date: int = None
+    is_outgoing: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.sender_id = value
+        self.sender_name = raw.get('sender_name')
+        self.date = raw.get('date')
+        self.is_outgoing = raw.get('is_outgoing')
+
+
+@dataclass
+class ReactionTypeEmoji(TDObject):
+    """A reaction with an emoji"""
+
+    emoji: str = None
+
+    def _decode(self, raw: dict):
+        self.emoji = raw.get('emoji')
+
+
+@dataclass
+class ReactionTypeCustomEmoji(TDObject):
+    """A reaction with a custom emoji"""
+
+    custom_emoji_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.custom_emoji_id = value
+
+
+@dataclass
+class MessageForwardInfo(TDObject):
+    """Contains information about a forwarded message"""
+
+    origin: TDObject = None
+    date: int = None
+    source: ForwardSource = None
+    public_service_announcement_type: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('origin')
+        if value is not None:
+            value = MessageOrigin(value)
+        self.origin = value
+        self.date = raw.get('date')
+        value = raw.get('source')
+        if value is not None:
+            value = ForwardSource.from_raw(value)
+        self.source = value
+        self.public_service_announcement_type = raw.get('public_service_announcement_type')
+
+
+@dataclass
+class MessageImportInfo(TDObject):
+    """Contains information about a message created with importMessages"""
+
+    sender_name: str = None
+    date: int = None
+
+    def _decode(self, raw: dict):
+        self.sender_name = raw.get('sender_name')
+        self.date = raw.get('date')
+
+
+@dataclass
+class MessageReplyInfo(TDObject):
+    """Contains information about replies to a message"""
+
+    reply_count: int = None
+    recent_replier_ids: List[TDObject] = None
+    last_read_inbox_message_id: int = None
+    last_read_outbox_message_id: int = None
+    last_message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.reply_count = raw.get('reply_count')
+        value = raw.get('recent_replier_ids')
+        if value is not None:
+            value = [MessageSender(item0) for item0 in value]
+        self.recent_replier_ids = value
+        self.last_read_inbox_message_id = raw.get('last_read_inbox_message_id')
+        self.last_read_outbox_message_id = raw.get('last_read_outbox_message_id')
+        self.last_message_id = raw.get('last_message_id')
+
+
+@dataclass
+class MessageReaction(TDObject):
+    """Contains information about a reaction to a message"""
+
+    type: TDObject = None
+    total_count: int = None
+    is_chosen: bool = None
+    used_sender_id: TDObject = None
+    recent_sender_ids: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = ReactionType(value)
+        self.type = value
+        self.total_count = raw.get('total_count')
+        self.is_chosen = raw.get('is_chosen')
+        value = raw.get('used_sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.used_sender_id = value
+        value = raw.get('recent_sender_ids')
+        if value is not None:
+            value = [MessageSender(item0) for item0 in value]
+        self.recent_sender_ids = value
+
+
+@dataclass
+class MessageReactions(TDObject):
+    """Contains a list of reactions added to a message"""
+
+    reactions: List[MessageReaction] = None
+    are_tags: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('reactions')
+        if value is not None:
+            value = [MessageReaction.from_raw(item0) for item0 in value]
+        self.reactions = value
+        self.are_tags = raw.get('are_tags')
+
+
+@dataclass
+class MessageInteractionInfo(TDObject):
+    """Contains information about interactions with a message"""
+
+    view_count: int = None
+    forward_count: int = None
+    reply_info: MessageReplyInfo = None
+    reactions: MessageReactions = None
+
+    def _decode(self, raw: dict):
+        self.view_count = raw.get('view_count')
+        self.forward_count = raw.get('forward_count')
+        value = raw.get('reply_info')
+        if value is not None:
+            value = MessageReplyInfo.from_raw(value)
+        self.reply_info = value
+        value = raw.get('reactions')
+        if value is not None:
+            value = MessageReactions.from_raw(value)
+        self.reactions = value
+
+
+@dataclass
+class UnreadReaction(TDObject):
+    """Contains information about an unread reaction to a message"""
+
+    type: TDObject = None
+    sender_id: TDObject = None
+    is_big: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = ReactionType(value)
+        self.type = value
+        value = raw.get('sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.sender_id = value
+        self.is_big = raw.get('is_big')
+
+
+@dataclass
+class MessageSendingStatePending(TDObject):
+    """The message is being sent now, but has not yet been delivered to the server"""
+
+    sending_id: int = None
+
+    def _decode(self, raw: dict):
+        self.sending_id = raw.get('sending_id')
+
+
+@dataclass
+class MessageSendingStateFailed(TDObject):
+    """The message failed to be sent"""
+
+    error: Error = None
+    can_retry: bool = None
+    need_another_sender: bool = None
+    need_another_reply_quote: bool = None
+    need_drop_reply: bool = None
+    retry_after: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('error')
+        if value is not None:
+            value = Error.from_raw(value)
+        self.error = value
+        self.can_retry = raw.get('can_retry')
+        self.need_another_sender = raw.get('need_another_sender')
+        self.need_another_reply_quote = raw.get('need_another_reply_quote')
+        self.need_drop_reply = raw.get('need_drop_reply')
+        value = raw.get('retry_after')
+        if value is not None:
+            value = float(value)
+        self.retry_after = value
+
+
+@dataclass
+class TextQuote(TDObject):
+    """Describes manually or automatically chosen quote from another message"""
+
+    text: FormattedText = None
+    position: int = None
+    is_manual: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.text = value
+        self.position = raw.get('position')
+        self.is_manual = raw.get('is_manual')
+
+
+@dataclass
+class InputTextQuote(TDObject):
+    """Describes manually chosen quote from another message"""
+
+    text: FormattedText = None
+    position: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.text = value
+        self.position = raw.get('position')
+
+
+@dataclass
+class MessageReplyToMessage(TDObject):
+    """Describes a message replied by a given message"""
+
+    chat_id: int = None
+    message_id: int = None
+    quote: TextQuote = None
+    origin: TDObject = None
+    origin_send_date: int = None
+    content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('quote')
+        if value is not None:
+            value = TextQuote.from_raw(value)
+        self.quote = value
+        value = raw.get('origin')
+        if value is not None:
+            value = MessageOrigin(value)
+        self.origin = value
+        self.origin_send_date = raw.get('origin_send_date')
+        value = raw.get('content')
+        if value is not None:
+            value = MessageContent(value)
+        self.content = value
+
+
+@dataclass
+class MessageReplyToStory(TDObject):
+    """Describes a story replied by a given message"""
+
+    story_sender_chat_id: int = None
+    story_id: int = None
+
+    def _decode(self, raw: dict):
+        self.story_sender_chat_id = raw.get('story_sender_chat_id')
+        self.story_id = raw.get('story_id')
+
+
+@dataclass
+class InputMessageReplyToMessage(TDObject):
+    """Describes a message to be replied"""
+
+    chat_id: int = None
+    message_id: int = None
+    quote: InputTextQuote = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('quote')
+        if value is not None:
+            value = InputTextQuote.from_raw(value)
+        self.quote = value
+
+
+@dataclass
+class InputMessageReplyToStory(TDObject):
+    """Describes a story to be replied"""
+
+    story_sender_chat_id: int = None
+    story_id: int = None
+
+    def _decode(self, raw: dict):
+        self.story_sender_chat_id = raw.get('story_sender_chat_id')
+        self.story_id = raw.get('story_id')
+
+
+@dataclass
+class Message(TDObject):
+    """Describes a message"""
+
+    id: int = None
+    sender_id: TDObject = None
+    chat_id: int = None
+    sending_state: TDObject = None
+    scheduling_state: TDObject = None
+    is_outgoing: bool = None
+    is_pinned: bool = None
+    can_be_edited: bool = None
+    can_be_forwarded: bool = None
+    can_be_replied_in_another_chat: bool = None
+    can_be_saved: bool = None
+    can_be_deleted_only_for_self: bool = None
+    can_be_deleted_for_all_users: bool = None
+    can_get_added_reactions: bool = None
+    can_get_statistics: bool = None
+    can_get_message_thread: bool = None
+    can_get_read_date: bool = None
+    can_get_viewers: bool = None
+    can_get_media_timestamp_links: bool = None
+    can_report_reactions: bool = None
+    has_timestamped_media: bool = None
+    is_channel_post: bool = None
+    is_topic_message: bool = None
+    contains_unread_mention: bool = None
+    date: int = None
+    edit_date: int = None
+    forward_info: MessageForwardInfo = None
+    import_info: MessageImportInfo = None
+    interaction_info: MessageInteractionInfo = None
+    unread_reactions: List[UnreadReaction] = None
+    reply_to: TDObject = None
+    message_thread_id: int = None
+    saved_messages_topic_id: int = None
+    self_destruct_type: TDObject = None
+    self_destruct_in: float = None
+    auto_delete_in: float = None
+    via_bot_user_id: int = None
+    sender_boost_count: int = None
+    author_signature: str = None
+    media_album_id: int = None
+    restriction_reason: str = None
+    content: TDObject = None
+    reply_markup: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.sender_id = value
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('sending_state')
+        if value is not None:
+            value = MessageSendingState(value)
+        self.sending_state = value
+        value = raw.get('scheduling_state')
+        if value is not None:
+            value = MessageSchedulingState(value)
+        self.scheduling_state = value
+        self.is_outgoing = raw.get('is_outgoing')
+        self.is_pinned = raw.get('is_pinned')
+        self.can_be_edited = raw.get('can_be_edited')
+        self.can_be_forwarded = raw.get('can_be_forwarded')
+        self.can_be_replied_in_another_chat = raw.get('can_be_replied_in_another_chat')
+        self.can_be_saved = raw.get('can_be_saved')
+        self.can_be_deleted_only_for_self = raw.get('can_be_deleted_only_for_self')
+        self.can_be_deleted_for_all_users = raw.get('can_be_deleted_for_all_users')
+        self.can_get_added_reactions = raw.get('can_get_added_reactions')
+        self.can_get_statistics = raw.get('can_get_statistics')
+        self.can_get_message_thread = raw.get('can_get_message_thread')
+        self.can_get_read_date = raw.get('can_get_read_date')
+        self.can_get_viewers = raw.get('can_get_viewers')
+        self.can_get_media_timestamp_links = raw.get('can_get_media_timestamp_links')
+        self.can_report_reactions = raw.get('can_report_reactions')
+        self.has_timestamped_media = raw.get('has_timestamped_media')
+        self.is_channel_post = raw.get('is_channel_post')
+        self.is_topic_message = raw.get('is_topic_message')
+        self.contains_unread_mention = raw.get('contains_unread_mention')
+        self.date = raw.get('date')
+        self.edit_date = raw.get('edit_date')
+        value = raw.get('forward_info')
+        if value is not None:
+            value = MessageForwardInfo.from_raw(value)
+        self.forward_info = value
+        value = raw.get('import_info')
+        if value is not None:
+            value = MessageImportInfo.from_raw(value)
+        self.import_info = value
+        value = raw.get('interaction_info')
+        if value is not None:
+            value = MessageInteractionInfo.from_raw(value)
+        self.interaction_info = value
+        value = raw.get('unread_reactions')
+        if value is not None:
+            value = [UnreadReaction.from_raw(item0) for item0 in value]
+        self.unread_reactions = value
+        value = raw.get('reply_to')
+        if value is not None:
+            value = MessageReplyTo(value)
+        self.reply_to = value
+        self.message_thread_id = raw.get('message_thread_id')
+        self.saved_messages_topic_id = raw.get('saved_messages_topic_id')
+        value = raw.get('self_destruct_type')
+        if value is not None:
+            value = MessageSelfDestructType(value)
+        self.self_destruct_type = value
+        value = raw.get('self_destruct_in')
+        if value is not None:
+            value = float(value)
+        self.self_destruct_in = value
+        value = raw.get('auto_delete_in')
+        if value is not None:
+            value = float(value)
+        self.auto_delete_in = value
+        self.via_bot_user_id = raw.get('via_bot_user_id')
+        self.sender_boost_count = raw.get('sender_boost_count')
+        self.author_signature = raw.get('author_signature')
+        value = raw.get('media_album_id')
+        if value is not None:
+            value = int(value)
+        self.media_album_id = value
+        self.restriction_reason = raw.get('restriction_reason')
+        value = raw.get('content')
+        if value is not None:
+            value = MessageContent(value)
+        self.content = value
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+
+
+@dataclass
+class Messages(TDObject):
+    """Contains a list of messages"""
+
+    total_count: int = None
+    messages: List[Message] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('messages')
+        if value is not None:
+            value = [Message.from_raw(item0) for item0 in value]
+        self.messages = value
+
+
+@dataclass
+class FoundMessages(TDObject):
+    """Contains a list of messages found by a search"""
+
+    total_count: int = None
+    messages: List[Message] = None
+    next_offset: str = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('messages')
+        if value is not None:
+            value = [Message.from_raw(item0) for item0 in value]
+        self.messages = value
+        self.next_offset = raw.get('next_offset')
+
+
+@dataclass
+class FoundChatMessages(TDObject):
+    """Contains a list of messages found by a search in a given chat"""
+
+    total_count: int = None
+    messages: List[Message] = None
+    next_from_message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('messages')
+        if value is not None:
+            value = [Message.from_raw(item0) for item0 in value]
+        self.messages = value
+        self.next_from_message_id = raw.get('next_from_message_id')
+
+
+@dataclass
+class MessagePosition(TDObject):
+    """Contains information about a message in a specific position"""
+
+    position: int = None
+    message_id: int = None
+    date: int = None
+
+    def _decode(self, raw: dict):
+        self.position = raw.get('position')
+        self.message_id = raw.get('message_id')
+        self.date = raw.get('date')
+
+
+@dataclass
+class MessagePositions(TDObject):
+    """Contains a list of message positions"""
+
+    total_count: int = None
+    positions: List[MessagePosition] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('positions')
+        if value is not None:
+            value = [MessagePosition.from_raw(item0) for item0 in value]
+        self.positions = value
+
+
+@dataclass
+class MessageCalendarDay(TDObject):
+    """Contains information about found messages sent on a specific day"""
+
+    total_count: int = None
+    message: Message = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+
+
+@dataclass
+class MessageCalendar(TDObject):
+    """
+    Contains information about found messages, split by days according to the
+    option "utc_time_offset\"
+    """
+
+    total_count: int = None
+    days: List[MessageCalendarDay] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('days')
+        if value is not None:
+            value = [MessageCalendarDay.from_raw(item0) for item0 in value]
+        self.days = value
+
+
+@dataclass
+class MessageSourceChatHistory(TDObject):
+    """The message is from a chat history"""
+
+
+@dataclass
+class MessageSourceMessageThreadHistory(TDObject):
+    """The message is from a message thread history"""
+
+
+@dataclass
+class MessageSourceForumTopicHistory(TDObject):
+    """The message is from a forum topic history"""
+
+
+@dataclass
+class MessageSourceHistoryPreview(TDObject):
+    """The message is from chat, message thread or forum topic history preview"""
+
+
+@dataclass
+class MessageSourceChatList(TDObject):
+    """The message is from a chat list or a forum topic list"""
+
+
+@dataclass
+class MessageSourceSearch(TDObject):
+    """
+    The message is from search results, including file downloads, local file list,
+    outgoing document messages, calendar
+    """
+
+
+@dataclass
+class MessageSourceChatEventLog(TDObject):
+    """The message is from a chat event log"""
+
+
+@dataclass
+class MessageSourceNotification(TDObject):
+    """The message is from a notification"""
+
+
+@dataclass
+class MessageSourceScreenshot(TDObject):
+    """
+    The message was screenshotted; the source must be used only if the message
+    content was visible during the screenshot
+    """
+
+
+@dataclass
+class MessageSourceOther(TDObject):
+    """The message is from some other source"""
+
+
+@dataclass
+class MessageSponsorTypeBot(TDObject):
+    """The sponsor is a bot"""
+
+    bot_user_id: int = None
+    link: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.bot_user_id = raw.get('bot_user_id')
+        value = raw.get('link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.link = value
+
+
+@dataclass
+class MessageSponsorTypeWebApp(TDObject):
+    """The sponsor is a web app"""
+
+    web_app_title: str = None
+    link: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.web_app_title = raw.get('web_app_title')
+        value = raw.get('link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.link = value
+
+
+@dataclass
+class MessageSponsorTypePublicChannel(TDObject):
+    """The sponsor is a public channel chat"""
+
+    chat_id: int = None
+    link: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.link = value
+
+
+@dataclass
+class MessageSponsorTypePrivateChannel(TDObject):
+    """The sponsor is a private channel chat"""
+
+    title: str = None
+    invite_link: str = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        self.invite_link = raw.get('invite_link')
+
+
+@dataclass
+class MessageSponsorTypeWebsite(TDObject):
+    """The sponsor is a website"""
+
+    url: str = None
+    name: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.name = raw.get('name')
+
+
+@dataclass
+class MessageSponsor(TDObject):
+    """Information about the sponsor of a message"""
+
+    type: TDObject = None
+    photo: ChatPhotoInfo = None
+    info: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = MessageSponsorType(value)
+        self.type = value
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhotoInfo.from_raw(value)
+        self.photo = value
+        self.info = raw.get('info')
+
+
+@dataclass
+class SponsoredMessage(TDObject):
+    """Describes a sponsored message"""
+
+    message_id: int = None
+    is_recommended: bool = None
+    content: TDObject = None
+    sponsor: MessageSponsor = None
+    button_text: str = None
+    additional_info: str = None
+
+    def _decode(self, raw: dict):
+        self.message_id = raw.get('message_id')
+        self.is_recommended = raw.get('is_recommended')
+        value = raw.get('content')
+        if value is not None:
+            value = MessageContent(value)
+        self.content = value
+        value = raw.get('sponsor')
+        if value is not None:
+            value = MessageSponsor.from_raw(value)
+        self.sponsor = value
+        self.button_text = raw.get('button_text')
+        self.additional_info = raw.get('additional_info')
+
+
+@dataclass
+class SponsoredMessages(TDObject):
+    """Contains a list of sponsored messages"""
+
+    messages: List[SponsoredMessage] = None
+    messages_between: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('messages')
+        if value is not None:
+            value = [SponsoredMessage.from_raw(item0) for item0 in value]
+        self.messages = value
+        self.messages_between = raw.get('messages_between')
+
+
+@dataclass
+class FileDownload(TDObject):
+    """Describes a file added to file download list"""
+
+    file_id: int = None
+    message: Message = None
+    add_date: int = None
+    complete_date: int = None
+    is_paused: bool = None
+
+    def _decode(self, raw: dict):
+        self.file_id = raw.get('file_id')
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+        self.add_date = raw.get('add_date')
+        self.complete_date = raw.get('complete_date')
+        self.is_paused = raw.get('is_paused')
+
+
+@dataclass
+class DownloadedFileCounts(TDObject):
+    """Contains number of being downloaded and recently downloaded files found"""
+
+    active_count: int = None
+    paused_count: int = None
+    completed_count: int = None
+
+    def _decode(self, raw: dict):
+        self.active_count = raw.get('active_count')
+        self.paused_count = raw.get('paused_count')
+        self.completed_count = raw.get('completed_count')
+
+
+@dataclass
+class FoundFileDownloads(TDObject):
+    """Contains a list of downloaded files, found by a search"""
+
+    total_counts: DownloadedFileCounts = None
+    files: List[FileDownload] = None
+    next_offset: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('total_counts')
+        if value is not None:
+            value = DownloadedFileCounts.from_raw(value)
+        self.total_counts = value
+        value = raw.get('files')
+        if value is not None:
+            value = [FileDownload.from_raw(item0) for item0 in value]
+        self.files = value
+        self.next_offset = raw.get('next_offset')
+
+
+@dataclass
+class NotificationSettingsScopePrivateChats(TDObject):
+    """
+    Notification settings applied to all private and secret chats when the
+    corresponding chat setting has a default value
+    """
+
+
+@dataclass
+class NotificationSettingsScopeGroupChats(TDObject):
+    """
+    Notification settings applied to all basic group and supergroup chats when the
+    corresponding chat setting has a default value
+    """
+
+
+@dataclass
+class NotificationSettingsScopeChannelChats(TDObject):
+    """
+    Notification settings applied to all channel chats when the corresponding chat
+    setting has a default value
+    """
+
+
+@dataclass
+class ChatNotificationSettings(TDObject):
+    """Contains information about notification settings for a chat or a forum topic"""
+
+    use_default_mute_for: bool = None
+    mute_for: int = None
+    use_default_sound: bool = None
+    sound_id: int = None
+    use_default_show_preview: bool = None
+    show_preview: bool = None
+    use_default_mute_stories: bool = None
+    mute_stories: bool = None
+    use_default_story_sound: bool = None
+    story_sound_id: int = None
+    use_default_show_story_sender: bool = None
+    show_story_sender: bool = None
+    use_default_disable_pinned_message_notifications: bool = None
+    disable_pinned_message_notifications: bool = None
+    use_default_disable_mention_notifications: bool = None
+    disable_mention_notifications: bool = None
+
+    def _decode(self, raw: dict):
+        self.use_default_mute_for = raw.get('use_default_mute_for')
+        self.mute_for = raw.get('mute_for')
+        self.use_default_sound = raw.get('use_default_sound')
+        value = raw.get('sound_id')
+        if value is not None:
+            value = int(value)
+        self.sound_id = value
+        self.use_default_show_preview = raw.get('use_default_show_preview')
+        self.show_preview = raw.get('show_preview')
+        self.use_default_mute_stories = raw.get('use_default_mute_stories')
+        self.mute_stories = raw.get('mute_stories')
+        self.use_default_story_sound = raw.get('use_default_story_sound')
+        value = raw.get('story_sound_id')
+        if value is not None:
+            value = int(value)
+        self.story_sound_id = value
+        self.use_default_show_story_sender = raw.get('use_default_show_story_sender')
+        self.show_story_sender = raw.get('show_story_sender')
+        self.use_default_disable_pinned_message_notifications = raw.get('use_default_disable_pinned_message_notifications')
+        self.disable_pinned_message_notifications = raw.get('disable_pinned_message_notifications')
+        self.use_default_disable_mention_notifications = raw.get('use_default_disable_mention_notifications')
+        self.disable_mention_notifications = raw.get('disable_mention_notifications')
+
+
+@dataclass
+class ScopeNotificationSettings(TDObject):
+    """Contains information about notification settings for several chats"""
+
+    mute_for: int = None
+    sound_id: int = None
+    show_preview: bool = None
+    use_default_mute_stories: bool = None
+    mute_stories: bool = None
+    story_sound_id: int = None
+    show_story_sender: bool = None
+    disable_pinned_message_notifications: bool = None
+    disable_mention_notifications: bool = None
+
+    def _decode(self, raw: dict):
+        self.mute_for = raw.get('mute_for')
+        value = raw.get('sound_id')
+        if value is not None:
+            value = int(value)
+        self.sound_id = value
+        self.show_preview = raw.get('show_preview')
+        self.use_default_mute_stories = raw.get('use_default_mute_stories')
+        self.mute_stories = raw.get('mute_stories')
+        value = raw.get('story_sound_id')
+        if value is not None:
+            value = int(value)
+        self.story_sound_id = value
+        self.show_story_sender = raw.get('show_story_sender')
+        self.disable_pinned_message_notifications = raw.get('disable_pinned_message_notifications')
+        self.disable_mention_notifications = raw.get('disable_mention_notifications')
+
+
+@dataclass
+class DraftMessage(TDObject):
+    """Contains information about a message draft"""
+
+    reply_to: TDObject = None
+    date: int = None
+    input_message_text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('reply_to')
+        if value is not None:
+            value = InputMessageReplyTo(value)
+        self.reply_to = value
+        self.date = raw.get('date')
+        value = raw.get('input_message_text')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_text = value
+
+
+@dataclass
+class ChatTypePrivate(TDObject):
+    """An ordinary chat with a user"""
+
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class ChatTypeBasicGroup(TDObject):
+    """A basic group (a chat with 0-200 other users)"""
+
+    basic_group_id: int = None
+
+    def _decode(self, raw: dict):
+        self.basic_group_id = raw.get('basic_group_id')
+
+
+@dataclass
+class ChatTypeSupergroup(TDObject):
+    """A supergroup or channel (with unlimited members)"""
+
+    supergroup_id: int = None
+    is_channel: bool = None
+
+    def _decode(self, raw: dict):
+        self.supergroup_id = raw.get('supergroup_id')
+        self.is_channel = raw.get('is_channel')
+
+
+@dataclass
+class ChatTypeSecret(TDObject):
+    """A secret chat with a user"""
+
+    secret_chat_id: int = None
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.secret_chat_id = raw.get('secret_chat_id')
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class ChatFolderIcon(TDObject):
+    """Represents an icon for a chat folder"""
+
+    name: str = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+
+
+@dataclass
+class ChatFolder(TDObject):
+    """Represents a folder for user chats"""
+
+    title: str = None
+    icon: ChatFolderIcon = None
+    color_id: int = None
+    is_shareable: bool = None
+    pinned_chat_ids: List[int] = None
+    included_chat_ids: List[int] = None
+    excluded_chat_ids: List[int] = None
+    exclude_muted: bool = None
+    exclude_read: bool = None
+    exclude_archived: bool = None
+    include_contacts: bool = None
+    include_non_contacts: bool = None
+    include_bots: bool = None
+    include_groups: bool = None
+    include_channels: bool = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        value = raw.get('icon')
+        if value is not None:
+            value = ChatFolderIcon.from_raw(value)
+        self.icon = value
+        self.color_id = raw.get('color_id')
+        self.is_shareable = raw.get('is_shareable')
+        self.pinned_chat_ids = raw.get('pinned_chat_ids')
+        self.included_chat_ids = raw.get('included_chat_ids')
+        self.excluded_chat_ids = raw.get('excluded_chat_ids')
+        self.exclude_muted = raw.get('exclude_muted')
+        self.exclude_read = raw.get('exclude_read')
+        self.exclude_archived = raw.get('exclude_archived')
+        self.include_contacts = raw.get('include_contacts')
+        self.include_non_contacts = raw.get('include_non_contacts')
+        self.include_bots = raw.get('include_bots')
+        self.include_groups = raw.get('include_groups')
+        self.include_channels = raw.get('include_channels')
+
+
+@dataclass
+class ChatFolderInfo(TDObject):
+    """Contains basic information about a chat folder"""
+
+    id: int = None
+    title: str = None
+    icon: ChatFolderIcon = None
+    color_id: int = None
+    is_shareable: bool = None
+    has_my_invite_links: bool = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        value = raw.get('icon')
+        if value is not None:
+            value = ChatFolderIcon.from_raw(value)
+        self.icon = value
+        self.color_id = raw.get('color_id')
+        self.is_shareable = raw.get('is_shareable')
+        self.has_my_invite_links = raw.get('has_my_invite_links')
+
+
+@dataclass
+class ChatFolderInviteLink(TDObject):
+    """Contains a chat folder invite link"""
+
+    invite_link: str = None
+    name: str = None
+    chat_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.invite_link = raw.get('invite_link')
+        self.name = raw.get('name')
+        self.chat_ids = raw.get('chat_ids')
+
+
+@dataclass
+class ChatFolderInviteLinks(TDObject):
+    """Represents a list of chat folder invite links"""
+
+    invite_links: List[ChatFolderInviteLink] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('invite_links')
+        if value is not None:
+            value = [ChatFolderInviteLink.from_raw(item0) for item0 in value]
+        self.invite_links = value
+
+
+@dataclass
+class ChatFolderInviteLinkInfo(TDObject):
+    """Contains information about an invite link to a chat folder"""
+
+    chat_folder_info: ChatFolderInfo = None
+    missing_chat_ids: List[int] = None
+    added_chat_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat_folder_info')
+        if value is not None:
+            value = ChatFolderInfo.from_raw(value)
+        self.chat_folder_info = value
+        self.missing_chat_ids = raw.get('missing_chat_ids')
+        self.added_chat_ids = raw.get('added_chat_ids')
+
+
+@dataclass
+class RecommendedChatFolder(TDObject):
+    """Describes a recommended chat folder"""
+
+    folder: ChatFolder = None
+    description: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('folder')
+        if value is not None:
+            value = ChatFolder.from_raw(value)
+        self.folder = value
+        self.description = raw.get('description')
+
+
+@dataclass
+class RecommendedChatFolders(TDObject):
+    """Contains a list of recommended chat folders"""
+
+    chat_folders: List[RecommendedChatFolder] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat_folders')
+        if value is not None:
+            value = [RecommendedChatFolder.from_raw(item0) for item0 in value]
+        self.chat_folders = value
+
+
+@dataclass
+class ArchiveChatListSettings(TDObject):
+    """
+    Contains settings for automatic moving of chats to and from the Archive chat
+    lists
+    """
+
+    archive_and_mute_new_chats_from_unknown_users: bool = None
+    keep_unmuted_chats_archived: bool = None
+    keep_chats_from_folders_archived: bool = None
+
+    def _decode(self, raw: dict):
+        self.archive_and_mute_new_chats_from_unknown_users = raw.get('archive_and_mute_new_chats_from_unknown_users')
+        self.keep_unmuted_chats_archived = raw.get('keep_unmuted_chats_archived')
+        self.keep_chats_from_folders_archived = raw.get('keep_chats_from_folders_archived')
+
+
+@dataclass
+class ChatListMain(TDObject):
+    """A main list of chats"""
+
+
+@dataclass
+class ChatListArchive(TDObject):
+    """
+    A list of chats usually located at the top of the main chat list. Unmuted
+    chats are automatically moved from the Archive to the Main chat list when a
+    new message arrives
+    """
+
+
+@dataclass
+class ChatListFolder(TDObject):
+    """A list of chats added to a chat folder"""
+
+    chat_folder_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_folder_id = raw.get('chat_folder_id')
+
+
+@dataclass
+class ChatLists(TDObject):
+    """Contains a list of chat lists"""
+
+    chat_lists: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat_lists')
+        if value is not None:
+            value = [ChatList(item0) for item0 in value]
+        self.chat_lists = value
+
+
+@dataclass
+class ChatSourceMtprotoProxy(TDObject):
+    """The chat is sponsored by the user's MTProxy server"""
+
+
+@dataclass
+class ChatSourcePublicServiceAnnouncement(TDObject):
+    """The chat contains a public service announcement"""
+
+    type: str = None
+    text: str = None
+
+    def _decode(self, raw: dict):
+        self.type = raw.get('type')
+        self.text = raw.get('text')
+
+
+@dataclass
+class ChatPosition(TDObject):
+    """Describes a position of a chat in a chat list"""
+
+    list: TDObject = None
+    order: int = None
+    is_pinned: bool = None
+    source: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('list')
+        if value is not None:
+            value = ChatList(value)
+        self.list = value
+        value = raw.get('order')
+        if value is not None:
+            value = int(value)
+        self.order = value
+        self.is_pinned = raw.get('is_pinned')
+        value = raw.get('source')
+        if value is not None:
+            value = ChatSource(value)
+        self.source = value
+
+
+@dataclass
+class ChatAvailableReactionsAll(TDObject):
+    """All reactions are available in the chat"""
+
+
+@dataclass
+class ChatAvailableReactionsSome(TDObject):
+    """Only specific reactions are available in the chat"""
+
+    reactions: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('reactions')
+        if value is not None:
+            value = [ReactionType(item0) for item0 in value]
+        self.reactions = value
+
+
+@dataclass
+class SavedMessagesTag(TDObject):
+    """Represents a tag used in Saved Messages or a Saved Messages topic"""
+
+    tag: TDObject = None
+    label: str = None
+    count: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('tag')
+        if value is not None:
+            value = ReactionType(value)
+        self.tag = value
+        self.label = raw.get('label')
+        self.count = raw.get('count')
+
+
+@dataclass
+class SavedMessagesTags(TDObject):
+    """Contains a list of tags used in Saved Messages"""
+
+    tags: List[SavedMessagesTag] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('tags')
+        if value is not None:
+            value = [SavedMessagesTag.from_raw(item0) for item0 in value]
+        self.tags = value
+
+
+@dataclass
+class VideoChat(TDObject):
+    """Describes a video chat"""
+
+    group_call_id: int = None
+    has_participants: bool = None
+    default_participant_id: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.group_call_id = raw.get('group_call_id')
+        self.has_participants = raw.get('has_participants')
+        value = raw.get('default_participant_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.default_participant_id = value
+
+
+@dataclass
+class Chat(TDObject):
+    """A chat. (Can be a private chat, basic group, supergroup, or secret chat)"""
+
+    id: int = None
+    type: TDObject = None
+    title: str = None
+    photo: ChatPhotoInfo = None
+    accent_color_id: int = None
+    background_custom_emoji_id: int = None
+    profile_accent_color_id: int = None
+    profile_background_custom_emoji_id: int = None
+    permissions: ChatPermissions = None
+    last_message: Message = None
+    positions: List[ChatPosition] = None
+    chat_lists: List[TDObject] = None
+    message_sender_id: TDObject = None
+    block_list: TDObject = None
+    has_protected_content: bool = None
+    is_translatable: bool = None
+    is_marked_as_unread: bool = None
+    view_as_topics: bool = None
+    has_scheduled_messages: bool = None
+    can_be_deleted_only_for_self: bool = None
+    can_be_deleted_for_all_users: bool = None
+    can_be_reported: bool = None
+    default_disable_notification: bool = None
+    unread_count: int = None
+    last_read_inbox_message_id: int = None
+    last_read_outbox_message_id: int = None
+    unread_mention_count: int = None
+    unread_reaction_count: int = None
+    notification_settings: ChatNotificationSettings = None
+    available_reactions: TDObject = None
+    message_auto_delete_time: int = None
+    emoji_status: EmojiStatus = None
+    background: ChatBackground = None
+    theme_name: str = None
+    action_bar: TDObject = None
+    video_chat: VideoChat = None
+    pending_join_requests: ChatJoinRequestsInfo = None
+    reply_markup_message_id: int = None
+    draft_message: DraftMessage = None
+    client_data: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('type')
+        if value is not None:
+            value = ChatType(value)
+        self.type = value
+        self.title = raw.get('title')
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhotoInfo.from_raw(value)
+        self.photo = value
+        self.accent_color_id = raw.get('accent_color_id')
+        value = raw.get('background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.background_custom_emoji_id = value
+        self.profile_accent_color_id = raw.get('profile_accent_color_id')
+        value = raw.get('profile_background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.profile_background_custom_emoji_id = value
+        value = raw.get('permissions')
+        if value is not None:
+            value = ChatPermissions.from_raw(value)
+        self.permissions = value
+        value = raw.get('last_message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.last_message = value
+        value = raw.get('positions')
+        if value is not None:
+            value = [ChatPosition.from_raw(item0) for item0 in value]
+        self.positions = value
+        value = raw.get('chat_lists')
+        if value is not None:
+            value = [ChatList(item0) for item0 in value]
+        self.chat_lists = value
+        value = raw.get('message_sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.message_sender_id = value
+        value = raw.get('block_list')
+        if value is not None:
+            value = BlockList(value)
+        self.block_list = value
+        self.has_protected_content = raw.get('has_protected_content')
+        self.is_translatable = raw.get('is_translatable')
+        self.is_marked_as_unread = raw.get('is_marked_as_unread')
+        self.view_as_topics = raw.get('view_as_topics')
+        self.has_scheduled_messages = raw.get('has_scheduled_messages')
+        self.can_be_deleted_only_for_self = raw.get('can_be_deleted_only_for_self')
+        self.can_be_deleted_for_all_users = raw.get('can_be_deleted_for_all_users')
+        self.can_be_reported = raw.get('can_be_reported')
+        self.default_disable_notification = raw.get('default_disable_notification')
+        self.unread_count = raw.get('unread_count')
+        self.last_read_inbox_message_id = raw.get('last_read_inbox_message_id')
+        self.last_read_outbox_message_id = raw.get('last_read_outbox_message_id')
+        self.unread_mention_count = raw.get('unread_mention_count')
+        self.unread_reaction_count = raw.get('unread_reaction_count')
+        value = raw.get('notification_settings')
+        if value is not None:
+            value = ChatNotificationSettings.from_raw(value)
+        self.notification_settings = value
+        value = raw.get('available_reactions')
+        if value is not None:
+            value = ChatAvailableReactions(value)
+        self.available_reactions = value
+        self.message_auto_delete_time = raw.get('message_auto_delete_time')
+        value = raw.get('emoji_status')
+        if value is not None:
+            value = EmojiStatus.from_raw(value)
+        self.emoji_status = value
+        value = raw.get('background')
+        if value is not None:
+            value = ChatBackground.from_raw(value)
+        self.background = value
+        self.theme_name = raw.get('theme_name')
+        value = raw.get('action_bar')
+        if value is not None:
+            value = ChatActionBar(value)
+        self.action_bar = value
+        value = raw.get('video_chat')
+        if value is not None:
+            value = VideoChat.from_raw(value)
+        self.video_chat = value
+        value = raw.get('pending_join_requests')
+        if value is not None:
+            value = ChatJoinRequestsInfo.from_raw(value)
+        self.pending_join_requests = value
+        self.reply_markup_message_id = raw.get('reply_markup_message_id')
+        value = raw.get('draft_message')
+        if value is not None:
+            value = DraftMessage.from_raw(value)
+        self.draft_message = value
+        self.client_data = raw.get('client_data')
+
+
+@dataclass
+class Chats(TDObject):
+    """Represents a list of chats"""
+
+    total_count: int = None
+    chat_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        self.chat_ids = raw.get('chat_ids')
+
+
+@dataclass
+class ChatNearby(TDObject):
+    """Describes a chat located nearby"""
+
+    chat_id: int = None
+    distance: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.distance = raw.get('distance')
+
+
+@dataclass
+class ChatsNearby(TDObject):
+    """Represents a list of chats located nearby"""
+
+    users_nearby: List[ChatNearby] = None
+    supergroups_nearby: List[ChatNearby] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('users_nearby')
+        if value is not None:
+            value = [ChatNearby.from_raw(item0) for item0 in value]
+        self.users_nearby = value
+        value = raw.get('supergroups_nearby')
+        if value is not None:
+            value = [ChatNearby.from_raw(item0) for item0 in value]
+        self.supergroups_nearby = value
+
+
+@dataclass
+class PublicChatTypeHasUsername(TDObject):
+    """The chat is public, because it has an active username"""
+
+
+@dataclass
+class PublicChatTypeIsLocationBased(TDObject):
+    """The chat is public, because it is a location-based supergroup"""
+
+
+@dataclass
+class ChatActionBarReportSpam(TDObject):
+    """
+    The chat can be reported as spam using the method reportChat with the reason
+    reportReasonSpam. If the chat is a private chat with a user with an emoji
+    status, then a notice about emoji status usage must be shown
+    """
+
+    can_unarchive: bool = None
+
+    def _decode(self, raw: dict):
+        self.can_unarchive = raw.get('can_unarchive')
+
+
+@dataclass
+class ChatActionBarReportUnrelatedLocation(TDObject):
+    """
+    The chat is a location-based supergroup, which can be reported as having
+    unrelated location using the method reportChat with the reason
+    reportReasonUnrelatedLocation
+    """
+
+
+@dataclass
+class ChatActionBarInviteMembers(TDObject):
+    """The chat is a recently created group chat to which new members can be invited"""
+
+
+@dataclass
+class ChatActionBarReportAddBlock(TDObject):
+    """
+    The chat is a private or secret chat, which can be reported using the method
+    reportChat, or the other user can be blocked using the method
+    setMessageSenderBlockList, or the other user can be added to the contact list
+    using the method addContact. If the chat is a private chat with a user with an
+    emoji status, then a notice about emoji status usage must be shown
+    """
+
+    can_unarchive: bool = None
+    distance: int = None
+
+    def _decode(self, raw: dict):
+        self.can_unarchive = raw.get('can_unarchive')
+        self.distance = raw.get('distance')
+
+
+@dataclass
+class ChatActionBarAddContact(TDObject):
+    """
+    The chat is a private or secret chat and the other user can be added to the
+    contact list using the method addContact
+    """
+
+
+@dataclass
+class ChatActionBarSharePhoneNumber(TDObject):
+    """
+    The chat is a private or secret chat with a mutual contact and the user's
+    phone number can be shared with the other user using the method
+    sharePhoneNumber
+    """
+
+
+@dataclass
+class ChatActionBarJoinRequest(TDObject):
+    """
+    The chat is a private chat with an administrator of a chat to which the user
+    sent join request
+    """
+
+    title: str = None
+    is_channel: bool = None
+    request_date: int = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        self.is_channel = raw.get('is_channel')
+        self.request_date = raw.get('request_date')
+
+
+@dataclass
+class KeyboardButtonTypeText(TDObject):
+    """A simple button, with text that must be sent when the button is pressed"""
+
+
+@dataclass
+class KeyboardButtonTypeRequestPhoneNumber(TDObject):
+    """
+    A button that sends the user's phone number when pressed; available only in
+    private chats
+    """
+
+
+@dataclass
+class KeyboardButtonTypeRequestLocation(TDObject):
+    """
+    A button that sends the user's location when pressed; available only in
+    private chats
+    """
+
+
+@dataclass
+class KeyboardButtonTypeRequestPoll(TDObject):
+    """
+    A button that allows the user to create and send a poll when pressed;
+    available only in private chats
+    """
+
+    force_regular: bool = None
+    force_quiz: bool = None
+
+    def _decode(self, raw: dict):
+        self.force_regular = raw.get('force_regular')
+        self.force_quiz = raw.get('force_quiz')
+
+
+@dataclass
+class KeyboardButtonTypeRequestUsers(TDObject):
+    """
+    A button that requests users to be shared by the current user; available only
+    in private chats. Use the method shareUsersWithBot to complete the request
+    """
+
+    id: int = None
+    restrict_user_is_bot: bool = None
+    user_is_bot: bool = None
+    restrict_user_is_premium: bool = None
+    user_is_premium: bool = None
+    max_quantity: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.restrict_user_is_bot = raw.get('restrict_user_is_bot')
+        self.user_is_bot = raw.get('user_is_bot')
+        self.restrict_user_is_premium = raw.get('restrict_user_is_premium')
+        self.user_is_premium = raw.get('user_is_premium')
+        self.max_quantity = raw.get('max_quantity')
+
+
+@dataclass
+class KeyboardButtonTypeRequestChat(TDObject):
+    """
+    A button that requests a chat to be shared by the current user; available only
+    in private chats. Use the method shareChatWithBot to complete the request
+    """
+
+    id: int = None
+    chat_is_channel: bool = None
+    restrict_chat_is_forum: bool = None
+    chat_is_forum: bool = None
+    restrict_chat_has_username: bool = None
+    chat_has_username: bool = None
+    chat_is_created: bool = None
+    user_administrator_rights: ChatAdministratorRights = None
+    bot_administrator_rights: ChatAdministratorRights = None
+    bot_is_member: bool = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.chat_is_channel = raw.get('chat_is_channel')
+        self.restrict_chat_is_forum = raw.get('restrict_chat_is_forum')
+        self.chat_is_forum = raw.get('chat_is_forum')
+        self.restrict_chat_has_username = raw.get('restrict_chat_has_username')
+        self.chat_has_username = raw.get('chat_has_username')
+        self.chat_is_created = raw.get('chat_is_created')
+        value = raw.get('user_administrator_rights')
+        if value is not None:
+            value = ChatAdministratorRights.from_raw(value)
+        self.user_administrator_rights = value
+        value = raw.get('bot_administrator_rights')
+        if value is not None:
+            value = ChatAdministratorRights.from_raw(value)
+        self.bot_administrator_rights = value
+        self.bot_is_member = raw.get('bot_is_member')
+
+
+@dataclass
+class KeyboardButtonTypeWebApp(TDObject):
+    """A button that opens a Web App by calling getWebAppUrl"""
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class KeyboardButton(TDObject):
+    """Represents a single button in a bot keyboard"""
+
+    text: str = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        value = raw.get('type')
+        if value is not None:
+            value = KeyboardButtonType(value)
+        self.type = value
+
+
+@dataclass
+class InlineKeyboardButtonTypeUrl(TDObject):
+    """A button that opens a specified URL"""
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class InlineKeyboardButtonTypeLoginUrl(TDObject):
+    """
+    A button that opens a specified URL and automatically authorize the current
+    user by calling getLoginUrlInfo
+    """
+
+    url: str = None
+    id: int = None
+    forward_text: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.id = raw.get('id')
+        self.forward_text = raw.get('forward_text')
+
+
+@dataclass
+class InlineKeyboardButtonTypeWebApp(TDObject):
+    """A button that opens a Web App by calling openWebApp"""
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class InlineKeyboardButtonTypeCallback(TDObject):
+    """A button that sends a callback query to a bot"""
+
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.data = raw.get('data')
+
+
+@dataclass
+class InlineKeyboardButtonTypeCallbackWithPassword(TDObject):
+    """
+    A button that asks for the 2-step verification password of the current user
+    and then sends a callback query to a bot
+    """
+
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.data = raw.get('data')
+
+
+@dataclass
+class InlineKeyboardButtonTypeCallbackGame(TDObject):
+    """
+    A button with a game that sends a callback query to a bot. This button must be
+    in the first column and row of the keyboard and can be attached only to a
+    message with content of the type messageGame
+    """
+
+
+@dataclass
+class InlineKeyboardButtonTypeSwitchInline(TDObject):
+    """
+    A button that forces an inline query to the bot to be inserted in the input
+    field
+    """
+
+    query: str = None
+    target_chat: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.query = raw.get('query')
+        value = raw.get('target_chat')
+        if value is not None:
+            value = TargetChat(value)
+        self.target_chat = value
+
+
+@dataclass
+class InlineKeyboardButtonTypeBuy(TDObject):
+    """
+    A button to buy something. This button must be in the first column and row of
+    the keyboard and can be attached only to a message with content of the type
+    messageInvoice
+    """
+
+
+@dataclass
+class InlineKeyboardButtonTypeUser(TDObject):
+    """
+    A button with a user reference to be handled in the same way as
+    textEntityTypeMentionName entities
+    """
+
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class InlineKeyboardButton(TDObject):
+    """Represents a single button in an inline keyboard"""
+
+    text: str = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        value = raw.get('type')
+        if value is not None:
+            value = InlineKeyboardButtonType(value)
+        self.type = value
+
+
+@dataclass
+class ReplyMarkupRemoveKeyboard(TDObject):
+    """
+    Instructs application to remove the keyboard once this message has been
+    received. This kind of keyboard can't be received in an incoming message;
+    instead, updateChatReplyMarkup with message_id == 0 will be sent
+    """
+
+    is_personal: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_personal = raw.get('is_personal')
+
+
+@dataclass
+class ReplyMarkupForceReply(TDObject):
+    """Instructs application to force a reply to this message"""
+
+    is_personal: bool = None
+    input_field_placeholder: str = None
+
+    def _decode(self, raw: dict):
+        self.is_personal = raw.get('is_personal')
+        self.input_field_placeholder = raw.get('input_field_placeholder')
+
+
+@dataclass
+class ReplyMarkupShowKeyboard(TDObject):
+    """Contains a custom keyboard layout to quickly reply to bots"""
+
+    rows: List[List[KeyboardButton]] = None
+    is_persistent: bool = None
+    resize_keyboard: bool = None
+    one_time: bool = None
+    is_personal: bool = None
+    input_field_placeholder: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('rows')
+        if value is not None:
+            value = [[KeyboardButton.from_raw(item1) for item1 in item0] for item0 in value]
+        self.rows = value
+        self.is_persistent = raw.get('is_persistent')
+        self.resize_keyboard = raw.get('resize_keyboard')
+        self.one_time = raw.get('one_time')
+        self.is_personal = raw.get('is_personal')
+        self.input_field_placeholder = raw.get('input_field_placeholder')
+
+
+@dataclass
+class ReplyMarkupInlineKeyboard(TDObject):
+    """Contains an inline keyboard layout"""
+
+    rows: List[List[InlineKeyboardButton]] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('rows')
+        if value is not None:
+            value = [[InlineKeyboardButton.from_raw(item1) for item1 in item0] for item0 in value]
+        self.rows = value
+
+
+@dataclass
+class LoginUrlInfoOpen(TDObject):
+    """An HTTP URL needs to be open"""
+
+    url: str = None
+    skip_confirmation: bool = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.skip_confirmation = raw.get('skip_confirmation')
+
+
+@dataclass
+class LoginUrlInfoRequestConfirmation(TDObject):
+    """An authorization confirmation dialog needs to be shown to the user"""
+
+    url: str = None
+    domain: str = None
+    bot_user_id: int = None
+    request_write_access: bool = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.domain = raw.get('domain')
+        self.bot_user_id = raw.get('bot_user_id')
+        self.request_write_access = raw.get('request_write_access')
+
+
+@dataclass
+class FoundWebApp(TDObject):
+    """Contains information about a Web App found by its short name"""
+
+    web_app: WebApp = None
+    request_write_access: bool = None
+    skip_confirmation: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('web_app')
+        if value is not None:
+            value = WebApp.from_raw(value)
+        self.web_app = value
+        self.request_write_access = raw.get('request_write_access')
+        self.skip_confirmation = raw.get('skip_confirmation')
+
+
+@dataclass
+class WebAppInfo(TDObject):
+    """Contains information about a Web App"""
+
+    launch_id: int = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('launch_id')
+        if value is not None:
+            value = int(value)
+        self.launch_id = value
+        self.url = raw.get('url')
+
+
+@dataclass
+class MessageThreadInfo(TDObject):
+    """Contains information about a message thread"""
+
+    chat_id: int = None
+    message_thread_id: int = None
+    reply_info: MessageReplyInfo = None
+    unread_message_count: int = None
+    messages: List[Message] = None
+    draft_message: DraftMessage = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_thread_id = raw.get('message_thread_id')
+        value = raw.get('reply_info')
+        if value is not None:
+            value = MessageReplyInfo.from_raw(value)
+        self.reply_info = value
+        self.unread_message_count = raw.get('unread_message_count')
+        value = raw.get('messages')
+        if value is not None:
+            value = [Message.from_raw(item0) for item0 in value]
+        self.messages = value
+        value = raw.get('draft_message')
+        if value is not None:
+            value = DraftMessage.from_raw(value)
+        self.draft_message = value
+
+
+@dataclass
+class SavedMessagesTopicTypeMyNotes(TDObject):
+    """
+    Topic containing messages sent by the current user of forwarded from an
+    unknown chat
+    """
+
+
+@dataclass
+class SavedMessagesTopicTypeAuthorHidden(TDObject):
+    """Topic containing messages forwarded from a user with hidden privacy"""
+
+
+@dataclass
+class SavedMessagesTopicTypeSavedFromChat(TDObject):
+    """Topic containing messages forwarded from a specific chat"""
+
+    chat_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+
+
+@dataclass
+class SavedMessagesTopic(TDObject):
+    """Contains information about a Saved Messages topic"""
+
+    id: int = None
+    type: TDObject = None
+    is_pinned: bool = None
+    order: int = None
+    last_message: Message = None
+    draft_message: DraftMessage = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('type')
+        if value is not None:
+            value = SavedMessagesTopicType(value)
+        self.type = value
+        self.is_pinned = raw.get('is_pinned')
+        value = raw.get('order')
+        if value is not None:
+            value = int(value)
+        self.order = value
+        value = raw.get('last_message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.last_message = value
+        value = raw.get('draft_message')
+        if value is not None:
+            value = DraftMessage.from_raw(value)
+        self.draft_message = value
+
+
+@dataclass
+class ForumTopicIcon(TDObject):
+    """Describes a forum topic icon"""
+
+    color: int = None
+    custom_emoji_id: int = None
+
+    def _decode(self, raw: dict):
+        self.color = raw.get('color')
+        value = raw.get('custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.custom_emoji_id = value
+
+
+@dataclass
+class ForumTopicInfo(TDObject):
+    """Contains basic information about a forum topic"""
+
+    message_thread_id: int = None
+    name: str = None
+    icon: ForumTopicIcon = None
+    creation_date: int = None
+    creator_id: TDObject = None
+    is_general: bool = None
+    is_outgoing: bool = None
+    is_closed: bool = None
+    is_hidden: bool = None
+
+    def _decode(self, raw: dict):
+        self.message_thread_id = raw.get('message_thread_id')
+        self.name = raw.get('name')
+        value = raw.get('icon')
+        if value is not None:
+            value = ForumTopicIcon.from_raw(value)
+        self.icon = value
+        self.creation_date = raw.get('creation_date')
+        value = raw.get('creator_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.creator_id = value
+        self.is_general = raw.get('is_general')
+        self.is_outgoing = raw.get('is_outgoing')
+        self.is_closed = raw.get('is_closed')
+        self.is_hidden = raw.get('is_hidden')
+
+
+@dataclass
+class ForumTopic(TDObject):
+    """Describes a forum topic"""
+
+    info: ForumTopicInfo = None
+    last_message: Message = None
+    is_pinned: bool = None
+    unread_count: int = None
+    last_read_inbox_message_id: int = None
+    last_read_outbox_message_id: int = None
+    unread_mention_count: int = None
+    unread_reaction_count: int = None
+    notification_settings: ChatNotificationSettings = None
+    draft_message: DraftMessage = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.info = value
+        value = raw.get('last_message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.last_message = value
+        self.is_pinned = raw.get('is_pinned')
+        self.unread_count = raw.get('unread_count')
+        self.last_read_inbox_message_id = raw.get('last_read_inbox_message_id')
+        self.last_read_outbox_message_id = raw.get('last_read_outbox_message_id')
+        self.unread_mention_count = raw.get('unread_mention_count')
+        self.unread_reaction_count = raw.get('unread_reaction_count')
+        value = raw.get('notification_settings')
+        if value is not None:
+            value = ChatNotificationSettings.from_raw(value)
+        self.notification_settings = value
+        value = raw.get('draft_message')
+        if value is not None:
+            value = DraftMessage.from_raw(value)
+        self.draft_message = value
+
+
+@dataclass
+class ForumTopics(TDObject):
+    """Describes a list of forum topics"""
+
+    total_count: int = None
+    topics: List[ForumTopic] = None
+    next_offset_date: int = None
+    next_offset_message_id: int = None
+    next_offset_message_thread_id: int = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('topics')
+        if value is not None:
+            value = [ForumTopic.from_raw(item0) for item0 in value]
+        self.topics = value
+        self.next_offset_date = raw.get('next_offset_date')
+        self.next_offset_message_id = raw.get('next_offset_message_id')
+        self.next_offset_message_thread_id = raw.get('next_offset_message_thread_id')
+
+
+@dataclass
+class LinkPreviewOptions(TDObject):
+    """Options to be used for generation of a link preview"""
+
+    is_disabled: bool = None
+    url: str = None
+    force_small_media: bool = None
+    force_large_media: bool = None
+    show_above_text: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_disabled = raw.get('is_disabled')
+        self.url = raw.get('url')
+        self.force_small_media = raw.get('force_small_media')
+        self.force_large_media = raw.get('force_large_media')
+        self.show_above_text = raw.get('show_above_text')
+
+
+@dataclass
+class RichTextPlain(TDObject):
+    """A plain text"""
+
+    text: str = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+
+
+@dataclass
+class RichTextBold(TDObject):
+    """A bold rich text"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class RichTextItalic(TDObject):
+    """An italicized rich text"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class RichTextUnderline(TDObject):
+    """An underlined rich text"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class RichTextStrikethrough(TDObject):
+    """A strikethrough rich text"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class RichTextFixed(TDObject):
+    """A fixed-width rich text"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class RichTextUrl(TDObject):
+    """A rich text URL link"""
+
+    text: TDObject = None
+    url: str = None
+    is_cached: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        self.url = raw.get('url')
+        self.is_cached = raw.get('is_cached')
+
+
+@dataclass
+class RichTextEmailAddress(TDObject):
+    """A rich text email link"""
+
+    text: TDObject = None
+    email_address: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        self.email_address = raw.get('email_address')
+
+
+@dataclass
+class RichTextSubscript(TDObject):
+    """A subscript rich text"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class RichTextSuperscript(TDObject):
+    """A superscript rich text"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class RichTextMarked(TDObject):
+    """A marked rich text"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class RichTextPhoneNumber(TDObject):
+    """A rich text phone number"""
+
+    text: TDObject = None
+    phone_number: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        self.phone_number = raw.get('phone_number')
+
+
+@dataclass
+class RichTextIcon(TDObject):
+    """A small image inside the text"""
+
+    document: Document = None
+    width: int = None
+    height: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('document')
+        if value is not None:
+            value = Document.from_raw(value)
+        self.document = value
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+
+
+@dataclass
+class RichTextReference(TDObject):
+    """A reference to a richTexts object on the same web page"""
+
+    text: TDObject = None
+    anchor_name: str = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        self.anchor_name = raw.get('anchor_name')
+        self.url = raw.get('url')
+
+
+@dataclass
+class RichTextAnchor(TDObject):
+    """An anchor"""
+
+    name: str = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+
+
+@dataclass
+class RichTextAnchorLink(TDObject):
+    """A link to an anchor on the same web page"""
+
+    text: TDObject = None
+    anchor_name: str = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        self.anchor_name = raw.get('anchor_name')
+        self.url = raw.get('url')
+
+
+@dataclass
+class RichTexts(TDObject):
+    """A concatenation of rich texts"""
+
+    texts: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('texts')
+        if value is not None:
+            value = [RichText(item0) for item0 in value]
+        self.texts = value
+
+
+@dataclass
+class PageBlockCaption(TDObject):
+    """
+    Contains a caption of an instant view web page block, consisting of a text and
+    a trailing credit
+    """
+
+    text: TDObject = None
+    credit: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        value = raw.get('credit')
+        if value is not None:
+            value = RichText(value)
+        self.credit = value
+
+
+@dataclass
+class PageBlockListItem(TDObject):
+    """Describes an item of a list page block"""
+
+    label: str = None
+    page_blocks: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        self.label = raw.get('label')
+        value = raw.get('page_blocks')
+        if value is not None:
+            value = [PageBlock(item0) for item0 in value]
+        self.page_blocks = value
+
+
+@dataclass
+class PageBlockHorizontalAlignmentLeft(TDObject):
+    """The content must be left-aligned"""
+
+
+@dataclass
+class PageBlockHorizontalAlignmentCenter(TDObject):
+    """The content must be center-aligned"""
+
+
+@dataclass
+class PageBlockHorizontalAlignmentRight(TDObject):
+    """The content must be right-aligned"""
+
+
+@dataclass
+class PageBlockVerticalAlignmentTop(TDObject):
+    """The content must be top-aligned"""
+
+
+@dataclass
+class PageBlockVerticalAlignmentMiddle(TDObject):
+    """The content must be middle-aligned"""
+
+
+@dataclass
+class PageBlockVerticalAlignmentBottom(TDObject):
+    """The content must be bottom-aligned"""
+
+
+@dataclass
+class PageBlockTableCell(TDObject):
+    """Represents a cell of a table"""
+
+    text: TDObject = None
+    is_header: bool = None
+    colspan: int = None
+    rowspan: int = None
+    align: TDObject = None
+    valign: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        self.is_header = raw.get('is_header')
+        self.colspan = raw.get('colspan')
+        self.rowspan = raw.get('rowspan')
+        value = raw.get('align')
+        if value is not None:
+            value = PageBlockHorizontalAlignment(value)
+        self.align = value
+        value = raw.get('valign')
+        if value is not None:
+            value = PageBlockVerticalAlignment(value)
+        self.valign = value
+
+
+@dataclass
+class PageBlockRelatedArticle(TDObject):
+    """Contains information about a related article"""
+
+    url: str = None
+    title: str = None
+    description: str = None
+    photo: Photo = None
+    author: str = None
+    publish_date: int = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        self.author = raw.get('author')
+        self.publish_date = raw.get('publish_date')
+
+
+@dataclass
+class PageBlockTitle(TDObject):
+    """The title of a page"""
+
+    title: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('title')
+        if value is not None:
+            value = RichText(value)
+        self.title = value
+
+
+@dataclass
+class PageBlockSubtitle(TDObject):
+    """The subtitle of a page"""
+
+    subtitle: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('subtitle')
+        if value is not None:
+            value = RichText(value)
+        self.subtitle = value
+
+
+@dataclass
+class PageBlockAuthorDate(TDObject):
+    """The author and publishing date of a page"""
+
+    author: TDObject = None
+    publish_date: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('author')
+        if value is not None:
+            value = RichText(value)
+        self.author = value
+        self.publish_date = raw.get('publish_date')
+
+
+@dataclass
+class PageBlockHeader(TDObject):
+    """A header"""
+
+    header: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('header')
+        if value is not None:
+            value = RichText(value)
+        self.header = value
+
+
+@dataclass
+class PageBlockSubheader(TDObject):
+    """A subheader"""
+
+    subheader: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('subheader')
+        if value is not None:
+            value = RichText(value)
+        self.subheader = value
+
+
+@dataclass
+class PageBlockKicker(TDObject):
+    """A kicker"""
+
+    kicker: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('kicker')
+        if value is not None:
+            value = RichText(value)
+        self.kicker = value
+
+
+@dataclass
+class PageBlockParagraph(TDObject):
+    """A text paragraph"""
+
+    text: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+
+
+@dataclass
+class PageBlockPreformatted(TDObject):
+    """A preformatted text paragraph"""
+
+    text: TDObject = None
+    language: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        self.language = raw.get('language')
+
+
+@dataclass
+class PageBlockFooter(TDObject):
+    """The footer of a page"""
+
+    footer: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('footer')
+        if value is not None:
+            value = RichText(value)
+        self.footer = value
+
+
+@dataclass
+class PageBlockDivider(TDObject):
+    """An empty block separating a page"""
+
+
+@dataclass
+class PageBlockAnchor(TDObject):
+    """
+    An invisible anchor on a page, which can be used in a URL to open the page
+    from the specified anchor
+    """
+
+    name: str = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+
+
+@dataclass
+class PageBlockList(TDObject):
+    """A list of data blocks"""
+
+    items: List[PageBlockListItem] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('items')
+        if value is not None:
+            value = [PageBlockListItem.from_raw(item0) for item0 in value]
+        self.items = value
+
+
+@dataclass
+class PageBlockBlockQuote(TDObject):
+    """A block quote"""
+
+    text: TDObject = None
+    credit: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        value = raw.get('credit')
+        if value is not None:
+            value = RichText(value)
+        self.credit = value
+
+
+@dataclass
+class PageBlockPullQuote(TDObject):
+    """A pull quote"""
+
+    text: TDObject = None
+    credit: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = RichText(value)
+        self.text = value
+        value = raw.get('credit')
+        if value is not None:
+            value = RichText(value)
+        self.credit = value
+
+
+@dataclass
+class PageBlockAnimation(TDObject):
+    """An animation"""
+
+    animation: Animation = None
+    caption: PageBlockCaption = None
+    need_autoplay: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+        self.need_autoplay = raw.get('need_autoplay')
+
+
+@dataclass
+class PageBlockAudio(TDObject):
+    """An audio file"""
+
+    audio: Audio = None
+    caption: PageBlockCaption = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('audio')
+        if value is not None:
+            value = Audio.from_raw(value)
+        self.audio = value
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class PageBlockPhoto(TDObject):
+    """A photo"""
+
+    photo: Photo = None
+    caption: PageBlockCaption = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+        self.url = raw.get('url')
+
+
+@dataclass
+class PageBlockVideo(TDObject):
+    """A video"""
+
+    video: Video = None
+    caption: PageBlockCaption = None
+    need_autoplay: bool = None
+    is_looped: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video')
+        if value is not None:
+            value = Video.from_raw(value)
+        self.video = value
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+        self.need_autoplay = raw.get('need_autoplay')
+        self.is_looped = raw.get('is_looped')
+
+
+@dataclass
+class PageBlockVoiceNote(TDObject):
+    """A voice note"""
+
+    voice_note: VoiceNote = None
+    caption: PageBlockCaption = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('voice_note')
+        if value is not None:
+            value = VoiceNote.from_raw(value)
+        self.voice_note = value
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class PageBlockCover(TDObject):
+    """A page cover"""
+
+    cover: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('cover')
+        if value is not None:
+            value = PageBlock(value)
+        self.cover = value
+
+
+@dataclass
+class PageBlockEmbedded(TDObject):
+    """An embedded web page"""
+
+    url: str = None
+    html: str = None
+    poster_photo: Photo = None
+    width: int = None
+    height: int = None
+    caption: PageBlockCaption = None
+    is_full_width: bool = None
+    allow_scrolling: bool = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.html = raw.get('html')
+        value = raw.get('poster_photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.poster_photo = value
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+        self.is_full_width = raw.get('is_full_width')
+        self.allow_scrolling = raw.get('allow_scrolling')
+
+
+@dataclass
+class PageBlockEmbeddedPost(TDObject):
+    """An embedded post"""
+
+    url: str = None
+    author: str = None
+    author_photo: Photo = None
+    date: int = None
+    page_blocks: List[TDObject] = None
+    caption: PageBlockCaption = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.author = raw.get('author')
+        value = raw.get('author_photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.author_photo = value
+        self.date = raw.get('date')
+        value = raw.get('page_blocks')
+        if value is not None:
+            value = [PageBlock(item0) for item0 in value]
+        self.page_blocks = value
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class PageBlockCollage(TDObject):
+    """A collage"""
+
+    page_blocks: List[TDObject] = None
+    caption: PageBlockCaption = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('page_blocks')
+        if value is not None:
+            value = [PageBlock(item0) for item0 in value]
+        self.page_blocks = value
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class PageBlockSlideshow(TDObject):
+    """A slideshow"""
+
+    page_blocks: List[TDObject] = None
+    caption: PageBlockCaption = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('page_blocks')
+        if value is not None:
+            value = [PageBlock(item0) for item0 in value]
+        self.page_blocks = value
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class PageBlockChatLink(TDObject):
+    """A link to a chat"""
+
+    title: str = None
+    photo: ChatPhotoInfo = None
+    accent_color_id: int = None
+    username: str = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhotoInfo.from_raw(value)
+        self.photo = value
+        self.accent_color_id = raw.get('accent_color_id')
+        self.username = raw.get('username')
+
+
+@dataclass
+class PageBlockTable(TDObject):
+    """A table"""
+
+    caption: TDObject = None
+    cells: List[List[PageBlockTableCell]] = None
+    is_bordered: bool = None
+    is_striped: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('caption')
+        if value is not None:
+            value = RichText(value)
+        self.caption = value
+        value = raw.get('cells')
+        if value is not None:
+            value = [[PageBlockTableCell.from_raw(item1) for item1 in item0] for item0 in value]
+        self.cells = value
+        self.is_bordered = raw.get('is_bordered')
+        self.is_striped = raw.get('is_striped')
+
+
+@dataclass
+class PageBlockDetails(TDObject):
+    """A collapsible block"""
+
+    header: TDObject = None
+    page_blocks: List[TDObject] = None
+    is_open: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('header')
+        if value is not None:
+            value = RichText(value)
+        self.header = value
+        value = raw.get('page_blocks')
+        if value is not None:
+            value = [PageBlock(item0) for item0 in value]
+        self.page_blocks = value
+        self.is_open = raw.get('is_open')
+
+
+@dataclass
+class PageBlockRelatedArticles(TDObject):
+    """Related articles"""
+
+    header: TDObject = None
+    articles: List[PageBlockRelatedArticle] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('header')
+        if value is not None:
+            value = RichText(value)
+        self.header = value
+        value = raw.get('articles')
+        if value is not None:
+            value = [PageBlockRelatedArticle.from_raw(item0) for item0 in value]
+        self.articles = value
+
+
+@dataclass
+class PageBlockMap(TDObject):
+    """A map"""
+
+    location: Location = None
+    zoom: int = None
+    width: int = None
+    height: int = None
+    caption: PageBlockCaption = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+        self.zoom = raw.get('zoom')
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        value = raw.get('caption')
+        if value is not None:
+            value = PageBlockCaption.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class WebPageInstantView(TDObject):
+    """Describes an instant view page for a web page"""
+
+    page_blocks: List[TDObject] = None
+    view_count: int = None
+    version: int = None
+    is_rtl: bool = None
+    is_full: bool = None
+    feedback_link: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('page_blocks')
+        if value is not None:
+            value = [PageBlock(item0) for item0 in value]
+        self.page_blocks = value
+        self.view_count = raw.get('view_count')
+        self.version = raw.get('version')
+        self.is_rtl = raw.get('is_rtl')
+        self.is_full = raw.get('is_full')
+        value = raw.get('feedback_link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.feedback_link = value
+
+
+@dataclass
+class WebPage(TDObject):
+    """Describes a link preview"""
+
+    url: str = None
+    display_url: str = None
+    type: str = None
+    site_name: str = None
+    title: str = None
+    description: FormattedText = None
+    photo: Photo = None
+    embed_url: str = None
+    embed_type: str = None
+    embed_width: int = None
+    embed_height: int = None
+    duration: int = None
+    author: str = None
+    has_large_media: bool = None
+    show_large_media: bool = None
+    skip_confirmation: bool = None
+    show_above_text: bool = None
+    animation: Animation = None
+    audio: Audio = None
+    document: Document = None
+    sticker: Sticker = None
+    video: Video = None
+    video_note: VideoNote = None
+    voice_note: VoiceNote = None
+    story_sender_chat_id: int = None
+    story_id: int = None
+    instant_view_version: int = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.display_url = raw.get('display_url')
+        self.type = raw.get('type')
+        self.site_name = raw.get('site_name')
+        self.title = raw.get('title')
+        value = raw.get('description')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.description = value
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        self.embed_url = raw.get('embed_url')
+        self.embed_type = raw.get('embed_type')
+        self.embed_width = raw.get('embed_width')
+        self.embed_height = raw.get('embed_height')
+        self.duration = raw.get('duration')
+        self.author = raw.get('author')
+        self.has_large_media = raw.get('has_large_media')
+        self.show_large_media = raw.get('show_large_media')
+        self.skip_confirmation = raw.get('skip_confirmation')
+        self.show_above_text = raw.get('show_above_text')
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+        value = raw.get('audio')
+        if value is not None:
+            value = Audio.from_raw(value)
+        self.audio = value
+        value = raw.get('document')
+        if value is not None:
+            value = Document.from_raw(value)
+        self.document = value
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+        value = raw.get('video')
+        if value is not None:
+            value = Video.from_raw(value)
+        self.video = value
+        value = raw.get('video_note')
+        if value is not None:
+            value = VideoNote.from_raw(value)
+        self.video_note = value
+        value = raw.get('voice_note')
+        if value is not None:
+            value = VoiceNote.from_raw(value)
+        self.voice_note = value
+        self.story_sender_chat_id = raw.get('story_sender_chat_id')
+        self.story_id = raw.get('story_id')
+        self.instant_view_version = raw.get('instant_view_version')
+
+
+@dataclass
+class CountryInfo(TDObject):
+    """Contains information about a country"""
+
+    country_code: str = None
+    name: str = None
+    english_name: str = None
+    is_hidden: bool = None
+    calling_codes: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.country_code = raw.get('country_code')
+        self.name = raw.get('name')
+        self.english_name = raw.get('english_name')
+        self.is_hidden = raw.get('is_hidden')
+        self.calling_codes = raw.get('calling_codes')
+
+
+@dataclass
+class Countries(TDObject):
+    """Contains information about countries"""
+
+    countries: List[CountryInfo] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('countries')
+        if value is not None:
+            value = [CountryInfo.from_raw(item0) for item0 in value]
+        self.countries = value
+
+
+@dataclass
+class PhoneNumberInfo(TDObject):
+    """Contains information about a phone number"""
+
+    country: CountryInfo = None
+    country_calling_code: str = None
+    formatted_phone_number: str = None
+    is_anonymous: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('country')
+        if value is not None:
+            value = CountryInfo.from_raw(value)
+        self.country = value
+        self.country_calling_code = raw.get('country_calling_code')
+        self.formatted_phone_number = raw.get('formatted_phone_number')
+        self.is_anonymous = raw.get('is_anonymous')
+
+
+@dataclass
+class BankCardActionOpenUrl(TDObject):
+    """Describes an action associated with a bank card number"""
+
+    text: str = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        self.url = raw.get('url')
+
+
+@dataclass
+class BankCardInfo(TDObject):
+    """Information about a bank card"""
+
+    title: str = None
+    actions: List[BankCardActionOpenUrl] = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        value = raw.get('actions')
+        if value is not None:
+            value = [BankCardActionOpenUrl.from_raw(item0) for item0 in value]
+        self.actions = value
+
+
+@dataclass
+class Address(TDObject):
+    """Describes an address"""
+
+    country_code: str = None
+    state: str = None
+    city: str = None
+    street_line1: str = None
+    street_line2: str = None
+    postal_code: str = None
+
+    def _decode(self, raw: dict):
+        self.country_code = raw.get('country_code')
+        self.state = raw.get('state')
+        self.city = raw.get('city')
+        self.street_line1 = raw.get('street_line1')
+        self.street_line2 = raw.get('street_line2')
+        self.postal_code = raw.get('postal_code')
+
+
+@dataclass
+class ThemeParameters(TDObject):
+    """Contains parameters of the application theme"""
+
+    background_color: int = None
+    secondary_background_color: int = None
+    header_background_color: int = None
+    section_background_color: int = None
+    text_color: int = None
+    accent_text_color: int = None
+    section_header_text_color: int = None
+    subtitle_text_color: int = None
+    destructive_text_color: int = None
+    hint_color: int = None
+    link_color: int = None
+    button_color: int = None
+    button_text_color: int = None
+
+    def _decode(self, raw: dict):
+        self.background_color = raw.get('background_color')
+        self.secondary_background_color = raw.get('secondary_background_color')
+        self.header_background_color = raw.get('header_background_color')
+        self.section_background_color = raw.get('section_background_color')
+        self.text_color = raw.get('text_color')
+        self.accent_text_color = raw.get('accent_text_color')
+        self.section_header_text_color = raw.get('section_header_text_color')
+        self.subtitle_text_color = raw.get('subtitle_text_color')
+        self.destructive_text_color = raw.get('destructive_text_color')
+        self.hint_color = raw.get('hint_color')
+        self.link_color = raw.get('link_color')
+        self.button_color = raw.get('button_color')
+        self.button_text_color = raw.get('button_text_color')
+
+
+@dataclass
+class LabeledPricePart(TDObject):
+    """Portion of the price of a product (e.g., "delivery cost", "tax amount")"""
+
+    label: str = None
+    amount: int = None
+
+    def _decode(self, raw: dict):
+        self.label = raw.get('label')
+        self.amount = raw.get('amount')
+
+
+@dataclass
+class Invoice(TDObject):
+    """Product invoice"""
+
+    currency: str = None
+    price_parts: List[LabeledPricePart] = None
+    max_tip_amount: int = None
+    suggested_tip_amounts: List[int] = None
+    recurring_payment_terms_of_service_url: str = None
+    terms_of_service_url: str = None
+    is_test: bool = None
+    need_name: bool = None
+    need_phone_number: bool = None
+    need_email_address: bool = None
+    need_shipping_address: bool = None
+    send_phone_number_to_provider: bool = None
+    send_email_address_to_provider: bool = None
+    is_flexible: bool = None
+
+    def _decode(self, raw: dict):
+        self.currency = raw.get('currency')
+        value = raw.get('price_parts')
+        if value is not None:
+            value = [LabeledPricePart.from_raw(item0) for item0 in value]
+        self.price_parts = value
+        self.max_tip_amount = raw.get('max_tip_amount')
+        self.suggested_tip_amounts = raw.get('suggested_tip_amounts')
+        self.recurring_payment_terms_of_service_url = raw.get('recurring_payment_terms_of_service_url')
+        self.terms_of_service_url = raw.get('terms_of_service_url')
+        self.is_test = raw.get('is_test')
+        self.need_name = raw.get('need_name')
+        self.need_phone_number = raw.get('need_phone_number')
+        self.need_email_address = raw.get('need_email_address')
+        self.need_shipping_address = raw.get('need_shipping_address')
+        self.send_phone_number_to_provider = raw.get('send_phone_number_to_provider')
+        self.send_email_address_to_provider = raw.get('send_email_address_to_provider')
+        self.is_flexible = raw.get('is_flexible')
+
+
+@dataclass
+class OrderInfo(TDObject):
+    """Order information"""
+
+    name: str = None
+    phone_number: str = None
+    email_address: str = None
+    shipping_address: Address = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+        self.phone_number = raw.get('phone_number')
+        self.email_address = raw.get('email_address')
+        value = raw.get('shipping_address')
+        if value is not None:
+            value = Address.from_raw(value)
+        self.shipping_address = value
+
+
+@dataclass
+class ShippingOption(TDObject):
+    """One shipping option"""
+
+    id: str = None
+    title: str = None
+    price_parts: List[LabeledPricePart] = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        value = raw.get('price_parts')
+        if value is not None:
+            value = [LabeledPricePart.from_raw(item0) for item0 in value]
+        self.price_parts = value
+
+
+@dataclass
+class SavedCredentials(TDObject):
+    """Contains information about saved payment credentials"""
+
+    id: str = None
+    title: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+
+
+@dataclass
+class InputCredentialsSaved(TDObject):
+    """
+    Applies if a user chooses some previously saved payment credentials. To use
+    their previously saved credentials, the user must have a valid temporary
+    password
+    """
+
+    saved_credentials_id: str = None
+
+    def _decode(self, raw: dict):
+        self.saved_credentials_id = raw.get('saved_credentials_id')
+
+
+@dataclass
+class InputCredentialsNew(TDObject):
+    """Applies if a user enters new credentials on a payment provider website"""
+
+    data: str = None
+    allow_save: bool = None
+
+    def _decode(self, raw: dict):
+        self.data = raw.get('data')
+        self.allow_save = raw.get('allow_save')
+
+
+@dataclass
+class InputCredentialsApplePay(TDObject):
+    """Applies if a user enters new credentials using Apple Pay"""
+
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.data = raw.get('data')
+
+
+@dataclass
+class InputCredentialsGooglePay(TDObject):
+    """Applies if a user enters new credentials using Google Pay"""
+
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.data = raw.get('data')
+
+
+@dataclass
+class PaymentProviderSmartGlocal(TDObject):
+    """Smart Glocal payment provider"""
+
+    public_token: str = None
+    tokenize_url: str = None
+
+    def _decode(self, raw: dict):
+        self.public_token = raw.get('public_token')
+        self.tokenize_url = raw.get('tokenize_url')
+
+
+@dataclass
+class PaymentProviderStripe(TDObject):
+    """Stripe payment provider"""
+
+    publishable_key: str = None
+    need_country: bool = None
+    need_postal_code: bool = None
+    need_cardholder_name: bool = None
+
+    def _decode(self, raw: dict):
+        self.publishable_key = raw.get('publishable_key')
+        self.need_country = raw.get('need_country')
+        self.need_postal_code = raw.get('need_postal_code')
+        self.need_cardholder_name = raw.get('need_cardholder_name')
+
+
+@dataclass
+class PaymentProviderOther(TDObject):
+    """Some other payment provider, for which a web payment form must be shown"""
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class PaymentOption(TDObject):
+    """Describes an additional payment option"""
+
+    title: str = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        self.url = raw.get('url')
+
+
+@dataclass
+class PaymentForm(TDObject):
+    """Contains information about an invoice payment form"""
+
+    id: int = None
+    invoice: Invoice = None
+    seller_bot_user_id: int = None
+    payment_provider_user_id: int = None
+    payment_provider: TDObject = None
+    additional_payment_options: List[PaymentOption] = None
+    saved_order_info: OrderInfo = None
+    saved_credentials: List[SavedCredentials] = None
+    can_save_credentials: bool = None
+    need_password: bool = None
+    product_title: str = None
+    product_description: FormattedText = None
+    product_photo: Photo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        value = raw.get('invoice')
+        if value is not None:
+            value = Invoice.from_raw(value)
+        self.invoice = value
+        self.seller_bot_user_id = raw.get('seller_bot_user_id')
+        self.payment_provider_user_id = raw.get('payment_provider_user_id')
+        value = raw.get('payment_provider')
+        if value is not None:
+            value = PaymentProvider(value)
+        self.payment_provider = value
+        value = raw.get('additional_payment_options')
+        if value is not None:
+            value = [PaymentOption.from_raw(item0) for item0 in value]
+        self.additional_payment_options = value
+        value = raw.get('saved_order_info')
+        if value is not None:
+            value = OrderInfo.from_raw(value)
+        self.saved_order_info = value
+        value = raw.get('saved_credentials')
+        if value is not None:
+            value = [SavedCredentials.from_raw(item0) for item0 in value]
+        self.saved_credentials = value
+        self.can_save_credentials = raw.get('can_save_credentials')
+        self.need_password = raw.get('need_password')
+        self.product_title = raw.get('product_title')
+        value = raw.get('product_description')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.product_description = value
+        value = raw.get('product_photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.product_photo = value
+
+
+@dataclass
+class ValidatedOrderInfo(TDObject):
+    """
+    Contains a temporary identifier of validated order information, which is
+    stored for one hour, and the available shipping options
+    """
+
+    order_info_id: str = None
+    shipping_options: List[ShippingOption] = None
+
+    def _decode(self, raw: dict):
+        self.order_info_id = raw.get('order_info_id')
+        value = raw.get('shipping_options')
+        if value is not None:
+            value = [ShippingOption.from_raw(item0) for item0 in value]
+        self.shipping_options = value
+
+
+@dataclass
+class PaymentResult(TDObject):
+    """Contains the result of a payment request"""
+
+    success: bool = None
+    verification_url: str = None
+
+    def _decode(self, raw: dict):
+        self.success = raw.get('success')
+        self.verification_url = raw.get('verification_url')
+
+
+@dataclass
+class PaymentReceipt(TDObject):
+    """Contains information about a successful payment"""
+
+    title: str = None
+    description: FormattedText = None
+    photo: Photo = None
+    date: int = None
+    seller_bot_user_id: int = None
+    payment_provider_user_id: int = None
+    invoice: Invoice = None
+    order_info: OrderInfo = None
+    shipping_option: ShippingOption = None
+    credentials_title: str = None
+    tip_amount: int = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        value = raw.get('description')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.description = value
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        self.date = raw.get('date')
+        self.seller_bot_user_id = raw.get('seller_bot_user_id')
+        self.payment_provider_user_id = raw.get('payment_provider_user_id')
+        value = raw.get('invoice')
+        if value is not None:
+            value = Invoice.from_raw(value)
+        self.invoice = value
+        value = raw.get('order_info')
+        if value is not None:
+            value = OrderInfo.from_raw(value)
+        self.order_info = value
+        value = raw.get('shipping_option')
+        if value is not None:
+            value = ShippingOption.from_raw(value)
+        self.shipping_option = value
+        self.credentials_title = raw.get('credentials_title')
+        self.tip_amount = raw.get('tip_amount')
+
+
+@dataclass
+class InputInvoiceMessage(TDObject):
+    """An invoice from a message of the type messageInvoice"""
+
+    chat_id: int = None
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class InputInvoiceName(TDObject):
+    """An invoice from a link of the type internalLinkTypeInvoice"""
+
+    name: str = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+
+
+@dataclass
+class InputInvoiceTelegram(TDObject):
+    """
+    An invoice for a payment toward Telegram; must not be used in the in-store
+    apps
+    """
+
+    purpose: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('purpose')
+        if value is not None:
+            value = TelegramPaymentPurpose(value)
+        self.purpose = value
+
+
+@dataclass
+class MessageExtendedMediaPreview(TDObject):
+    """The media is hidden until the invoice is paid"""
+
+    width: int = None
+    height: int = None
+    duration: int = None
+    minithumbnail: Minithumbnail = None
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.duration = raw.get('duration')
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class MessageExtendedMediaPhoto(TDObject):
+    """The media is a photo"""
+
+    photo: Photo = None
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class MessageExtendedMediaVideo(TDObject):
+    """The media is a video"""
+
+    video: Video = None
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video')
+        if value is not None:
+            value = Video.from_raw(value)
+        self.video = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class MessageExtendedMediaUnsupported(TDObject):
+    """The media is unsupported"""
+
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class PremiumGiveawayParameters(TDObject):
+    """Describes parameters of a Telegram Premium giveaway"""
+
+    boosted_chat_id: int = None
+    additional_chat_ids: List[int] = None
+    winners_selection_date: int = None
+    only_new_members: bool = None
+    has_public_winners: bool = None
+    country_codes: List[str] = None
+    prize_description: str = None
+
+    def _decode(self, raw: dict):
+        self.boosted_chat_id = raw.get('boosted_chat_id')
+        self.additional_chat_ids = raw.get('additional_chat_ids')
+        self.winners_selection_date = raw.get('winners_selection_date')
+        self.only_new_members = raw.get('only_new_members')
+        self.has_public_winners = raw.get('has_public_winners')
+        self.country_codes = raw.get('country_codes')
+        self.prize_description = raw.get('prize_description')
+
+
+@dataclass
+class DatedFile(TDObject):
+    """File with the date it was uploaded"""
+
+    file: File = None
+    date: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('file')
+        if value is not None:
+            value = File.from_raw(value)
+        self.file = value
+        self.date = raw.get('date')
+
+
+@dataclass
+class PassportElementTypePersonalDetails(TDObject):
+    """A Telegram Passport element containing the user's personal details"""
+
+
+@dataclass
+class PassportElementTypePassport(TDObject):
+    """A Telegram Passport element containing the user's passport"""
+
+
+@dataclass
+class PassportElementTypeDriverLicense(TDObject):
+    """A Telegram Passport element containing the user's driver license"""
+
+
+@dataclass
+class PassportElementTypeIdentityCard(TDObject):
+    """A Telegram Passport element containing the user's identity card"""
+
+
+@dataclass
+class PassportElementTypeInternalPassport(TDObject):
+    """A Telegram Passport element containing the user's internal passport"""
+
+
+@dataclass
+class PassportElementTypeAddress(TDObject):
+    """A Telegram Passport element containing the user's address"""
+
+
+@dataclass
+class PassportElementTypeUtilityBill(TDObject):
+    """A Telegram Passport element containing the user's utility bill"""
+
+
+@dataclass
+class PassportElementTypeBankStatement(TDObject):
+    """A Telegram Passport element containing the user's bank statement"""
+
+
+@dataclass
+class PassportElementTypeRentalAgreement(TDObject):
+    """A Telegram Passport element containing the user's rental agreement"""
+
+
+@dataclass
+class PassportElementTypePassportRegistration(TDObject):
+    """
+    A Telegram Passport element containing the registration page of the user's
+    passport
+    """
+
+
+@dataclass
+class PassportElementTypeTemporaryRegistration(TDObject):
+    """A Telegram Passport element containing the user's temporary registration"""
+
+
+@dataclass
+class PassportElementTypePhoneNumber(TDObject):
+    """A Telegram Passport element containing the user's phone number"""
+
+
+@dataclass
+class PassportElementTypeEmailAddress(TDObject):
+    """A Telegram Passport element containing the user's email address"""
+
+
+@dataclass
+class Date(TDObject):
+    """Represents a date according to the Gregorian calendar"""
+
+    day: int = None
+    month: int = None
+    year: int = None
+
+    def _decode(self, raw: dict):
+        self.day = raw.get('day')
+        self.month = raw.get('month')
+        self.year = raw.get('year')
+
+
+@dataclass
+class PersonalDetails(TDObject):
+    """Contains the user's personal details"""
+
+    first_name: str = None
+    middle_name: str = None
+    last_name: str = None
+    native_first_name: str = None
+    native_middle_name: str = None
+    native_last_name: str = None
+    birthdate: Date = None
+    gender: str = None
+    country_code: str = None
+    residence_country_code: str = None
+
+    def _decode(self, raw: dict):
+        self.first_name = raw.get('first_name')
+        self.middle_name = raw.get('middle_name')
+        self.last_name = raw.get('last_name')
+        self.native_first_name = raw.get('native_first_name')
+        self.native_middle_name = raw.get('native_middle_name')
+        self.native_last_name = raw.get('native_last_name')
+        value = raw.get('birthdate')
+        if value is not None:
+            value = Date.from_raw(value)
+        self.birthdate = value
+        self.gender = raw.get('gender')
+        self.country_code = raw.get('country_code')
+        self.residence_country_code = raw.get('residence_country_code')
+
+
+@dataclass
+class IdentityDocument(TDObject):
+    """An identity document"""
+
+    number: str = None
+    expiration_date: Date = None
+    front_side: DatedFile = None
+    reverse_side: DatedFile = None
+    selfie: DatedFile = None
+    translation: List[DatedFile] = None
+
+    def _decode(self, raw: dict):
+        self.number = raw.get('number')
+        value = raw.get('expiration_date')
+        if value is not None:
+            value = Date.from_raw(value)
+        self.expiration_date = value
+        value = raw.get('front_side')
+        if value is not None:
+            value = DatedFile.from_raw(value)
+        self.front_side = value
+        value = raw.get('reverse_side')
+        if value is not None:
+            value = DatedFile.from_raw(value)
+        self.reverse_side = value
+        value = raw.get('selfie')
+        if value is not None:
+            value = DatedFile.from_raw(value)
+        self.selfie = value
+        value = raw.get('translation')
+        if value is not None:
+            value = [DatedFile.from_raw(item0) for item0 in value]
+        self.translation = value
+
+
+@dataclass
+class InputIdentityDocument(TDObject):
+    """An identity document to be saved to Telegram Passport"""
+
+    number: str = None
+    expiration_date: Date = None
+    front_side: TDObject = None
+    reverse_side: TDObject = None
+    selfie: TDObject = None
+    translation: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        self.number = raw.get('number')
+        value = raw.get('expiration_date')
+        if value is not None:
+            value = Date.from_raw(value)
+        self.expiration_date = value
+        value = raw.get('front_side')
+        if value is not None:
+            value = InputFile(value)
+        self.front_side = value
+        value = raw.get('reverse_side')
+        if value is not None:
+            value = InputFile(value)
+        self.reverse_side = value
+        value = raw.get('selfie')
+        if value is not None:
+            value = InputFile(value)
+        self.selfie = value
+        value = raw.get('translation')
+        if value is not None:
+            value = [InputFile(item0) for item0 in value]
+        self.translation = value
+
+
+@dataclass
+class PersonalDocument(TDObject):
+    """A personal document, containing some information about a user"""
+
+    files: List[DatedFile] = None
+    translation: List[DatedFile] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('files')
+        if value is not None:
+            value = [DatedFile.from_raw(item0) for item0 in value]
+        self.files = value
+        value = raw.get('translation')
+        if value is not None:
+            value = [DatedFile.from_raw(item0) for item0 in value]
+        self.translation = value
+
+
+@dataclass
+class InputPersonalDocument(TDObject):
+    """A personal document to be saved to Telegram Passport"""
+
+    files: List[TDObject] = None
+    translation: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('files')
+        if value is not None:
+            value = [InputFile(item0) for item0 in value]
+        self.files = value
+        value = raw.get('translation')
+        if value is not None:
+            value = [InputFile(item0) for item0 in value]
+        self.translation = value
+
+
+@dataclass
+class PassportElementPersonalDetails(TDObject):
+    """A Telegram Passport element containing the user's personal details"""
+
+    personal_details: PersonalDetails = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('personal_details')
+        if value is not None:
+            value = PersonalDetails.from_raw(value)
+        self.personal_details = value
+
+
+@dataclass
+class PassportElementPassport(TDObject):
+    """A Telegram Passport element containing the user's passport"""
+
+    passport: IdentityDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('passport')
+        if value is not None:
+            value = IdentityDocument.from_raw(value)
+        self.passport = value
+
+
+@dataclass
+class PassportElementDriverLicense(TDObject):
+    """A Telegram Passport element containing the user's driver license"""
+
+    driver_license: IdentityDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('driver_license')
+        if value is not None:
+            value = IdentityDocument.from_raw(value)
+        self.driver_license = value
+
+
+@dataclass
+class PassportElementIdentityCard(TDObject):
+    """A Telegram Passport element containing the user's identity card"""
+
+    identity_card: IdentityDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('identity_card')
+        if value is not None:
+            value = IdentityDocument.from_raw(value)
+        self.identity_card = value
+
+
+@dataclass
+class PassportElementInternalPassport(TDObject):
+    """A Telegram Passport element containing the user's internal passport"""
+
+    internal_passport: IdentityDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('internal_passport')
+        if value is not None:
+            value = IdentityDocument.from_raw(value)
+        self.internal_passport = value
+
+
+@dataclass
+class PassportElementAddress(TDObject):
+    """A Telegram Passport element containing the user's address"""
+
+    address: Address = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('address')
+        if value is not None:
+            value = Address.from_raw(value)
+        self.address = value
+
+
+@dataclass
+class PassportElementUtilityBill(TDObject):
+    """A Telegram Passport element containing the user's utility bill"""
+
+    utility_bill: PersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('utility_bill')
+        if value is not None:
+            value = PersonalDocument.from_raw(value)
+        self.utility_bill = value
+
+
+@dataclass
+class PassportElementBankStatement(TDObject):
+    """A Telegram Passport element containing the user's bank statement"""
+
+    bank_statement: PersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('bank_statement')
+        if value is not None:
+            value = PersonalDocument.from_raw(value)
+        self.bank_statement = value
+
+
+@dataclass
+class PassportElementRentalAgreement(TDObject):
+    """A Telegram Passport element containing the user's rental agreement"""
+
+    rental_agreement: PersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('rental_agreement')
+        if value is not None:
+            value = PersonalDocument.from_raw(value)
+        self.rental_agreement = value
+
+
+@dataclass
+class PassportElementPassportRegistration(TDObject):
+    """A Telegram Passport element containing the user's passport registration pages"""
+
+    passport_registration: PersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('passport_registration')
+        if value is not None:
+            value = PersonalDocument.from_raw(value)
+        self.passport_registration = value
+
+
+@dataclass
+class PassportElementTemporaryRegistration(TDObject):
+    """A Telegram Passport element containing the user's temporary registration"""
+
+    temporary_registration: PersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('temporary_registration')
+        if value is not None:
+            value = PersonalDocument.from_raw(value)
+        self.temporary_registration = value
+
+
+@dataclass
+class PassportElementPhoneNumber(TDObject):
+    """A Telegram Passport element containing the user's phone number"""
+
+    phone_number: str = None
+
+    def _decode(self, raw: dict):
+        self.phone_number = raw.get('phone_number')
+
+
+@dataclass
+class PassportElementEmailAddress(TDObject):
+    """A Telegram Passport element containing the user's email address"""
+
+    email_address: str = None
+
+    def _decode(self, raw: dict):
+        self.email_address = raw.get('email_address')
+
+
+@dataclass
+class InputPassportElementPersonalDetails(TDObject):
+    """A Telegram Passport element to be saved containing the user's personal details"""
+
+    personal_details: PersonalDetails = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('personal_details')
+        if value is not None:
+            value = PersonalDetails.from_raw(value)
+        self.personal_details = value
+
+
+@dataclass
+class InputPassportElementPassport(TDObject):
+    """A Telegram Passport element to be saved containing the user's passport"""
+
+    passport: InputIdentityDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('passport')
+        if value is not None:
+            value = InputIdentityDocument.from_raw(value)
+        self.passport = value
+
+
+@dataclass
+class InputPassportElementDriverLicense(TDObject):
+    """A Telegram Passport element to be saved containing the user's driver license"""
+
+    driver_license: InputIdentityDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('driver_license')
+        if value is not None:
+            value = InputIdentityDocument.from_raw(value)
+        self.driver_license = value
+
+
+@dataclass
+class InputPassportElementIdentityCard(TDObject):
+    """A Telegram Passport element to be saved containing the user's identity card"""
+
+    identity_card: InputIdentityDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('identity_card')
+        if value is not None:
+            value = InputIdentityDocument.from_raw(value)
+        self.identity_card = value
+
+
+@dataclass
+class InputPassportElementInternalPassport(TDObject):
+    """
+    A Telegram Passport element to be saved containing the user's internal
+    passport
+    """
+
+    internal_passport: InputIdentityDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('internal_passport')
+        if value is not None:
+            value = InputIdentityDocument.from_raw(value)
+        self.internal_passport = value
+
+
+@dataclass
+class InputPassportElementAddress(TDObject):
+    """A Telegram Passport element to be saved containing the user's address"""
+
+    address: Address = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('address')
+        if value is not None:
+            value = Address.from_raw(value)
+        self.address = value
+
+
+@dataclass
+class InputPassportElementUtilityBill(TDObject):
+    """A Telegram Passport element to be saved containing the user's utility bill"""
+
+    utility_bill: InputPersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('utility_bill')
+        if value is not None:
+            value = InputPersonalDocument.from_raw(value)
+        self.utility_bill = value
+
+
+@dataclass
+class InputPassportElementBankStatement(TDObject):
+    """A Telegram Passport element to be saved containing the user's bank statement"""
+
+    bank_statement: InputPersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('bank_statement')
+        if value is not None:
+            value = InputPersonalDocument.from_raw(value)
+        self.bank_statement = value
+
+
+@dataclass
+class InputPassportElementRentalAgreement(TDObject):
+    """A Telegram Passport element to be saved containing the user's rental agreement"""
+
+    rental_agreement: InputPersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('rental_agreement')
+        if value is not None:
+            value = InputPersonalDocument.from_raw(value)
+        self.rental_agreement = value
+
+
+@dataclass
+class InputPassportElementPassportRegistration(TDObject):
+    """
+    A Telegram Passport element to be saved containing the user's passport
+    registration
+    """
+
+    passport_registration: InputPersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('passport_registration')
+        if value is not None:
+            value = InputPersonalDocument.from_raw(value)
+        self.passport_registration = value
+
+
+@dataclass
+class InputPassportElementTemporaryRegistration(TDObject):
+    """
+    A Telegram Passport element to be saved containing the user's temporary
+    registration
+    """
+
+    temporary_registration: InputPersonalDocument = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('temporary_registration')
+        if value is not None:
+            value = InputPersonalDocument.from_raw(value)
+        self.temporary_registration = value
+
+
+@dataclass
+class InputPassportElementPhoneNumber(TDObject):
+    """A Telegram Passport element to be saved containing the user's phone number"""
+
+    phone_number: str = None
+
+    def _decode(self, raw: dict):
+        self.phone_number = raw.get('phone_number')
+
+
+@dataclass
+class InputPassportElementEmailAddress(TDObject):
+    """A Telegram Passport element to be saved containing the user's email address"""
+
+    email_address: str = None
+
+    def _decode(self, raw: dict):
+        self.email_address = raw.get('email_address')
+
+
+@dataclass
+class PassportElements(TDObject):
+    """Contains information about saved Telegram Passport elements"""
+
+    elements: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('elements')
+        if value is not None:
+            value = [PassportElement(item0) for item0 in value]
+        self.elements = value
+
+
+@dataclass
+class PassportElementErrorSourceUnspecified(TDObject):
+    """
+    The element contains an error in an unspecified place. The error will be
+    considered resolved when new data is added
+    """
+
+
+@dataclass
+class PassportElementErrorSourceDataField(TDObject):
+    """
+    One of the data fields contains an error. The error will be considered
+    resolved when the value of the field changes
+    """
+
+    field_name: str = None
+
+    def _decode(self, raw: dict):
+        self.field_name = raw.get('field_name')
+
+
+@dataclass
+class PassportElementErrorSourceFrontSide(TDObject):
+    """
+    The front side of the document contains an error. The error will be considered
+    resolved when the file with the front side changes
+    """
+
+
+@dataclass
+class PassportElementErrorSourceReverseSide(TDObject):
+    """
+    The reverse side of the document contains an error. The error will be
+    considered resolved when the file with the reverse side changes
+    """
+
+
+@dataclass
+class PassportElementErrorSourceSelfie(TDObject):
+    """
+    The selfie with the document contains an error. The error will be considered
+    resolved when the file with the selfie changes
+    """
+
+
+@dataclass
+class PassportElementErrorSourceTranslationFile(TDObject):
+    """
+    One of files with the translation of the document contains an error. The error
+    will be considered resolved when the file changes
+    """
+
+    file_index: int = None
+
+    def _decode(self, raw: dict):
+        self.file_index = raw.get('file_index')
+
+
+@dataclass
+class PassportElementErrorSourceTranslationFiles(TDObject):
+    """
+    The translation of the document contains an error. The error will be
+    considered resolved when the list of translation files changes
+    """
+
+
+@dataclass
+class PassportElementErrorSourceFile(TDObject):
+    """
+    The file contains an error. The error will be considered resolved when the
+    file changes
+    """
+
+    file_index: int = None
+
+    def _decode(self, raw: dict):
+        self.file_index = raw.get('file_index')
+
+
+@dataclass
+class PassportElementErrorSourceFiles(TDObject):
+    """
+    The list of attached files contains an error. The error will be considered
+    resolved when the list of files changes
+    """
+
+
+@dataclass
+class PassportElementError(TDObject):
+    """Contains the description of an error in a Telegram Passport element"""
+
+    type: TDObject = None
+    message: str = None
+    source: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = PassportElementType(value)
+        self.type = value
+        self.message = raw.get('message')
+        value = raw.get('source')
+        if value is not None:
+            value = PassportElementErrorSource(value)
+        self.source = value
+
+
+@dataclass
+class PassportSuitableElement(TDObject):
+    """
+    Contains information about a Telegram Passport element that was requested by a
+    service
+    """
+
+    type: TDObject = None
+    is_selfie_required: bool = None
+    is_translation_required: bool = None
+    is_native_name_required: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = PassportElementType(value)
+        self.type = value
+        self.is_selfie_required = raw.get('is_selfie_required')
+        self.is_translation_required = raw.get('is_translation_required')
+        self.is_native_name_required = raw.get('is_native_name_required')
+
+
+@dataclass
+class PassportRequiredElement(TDObject):
+    """
+    Contains a description of the required Telegram Passport element that was
+    requested by a service
+    """
+
+    suitable_elements: List[PassportSuitableElement] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('suitable_elements')
+        if value is not None:
+            value = [PassportSuitableElement.from_raw(item0) for item0 in value]
+        self.suitable_elements = value
+
+
+@dataclass
+class PassportAuthorizationForm(TDObject):
+    """
+    Contains information about a Telegram Passport authorization form that was
+    requested
+    """
+
+    id: int = None
+    required_elements: List[PassportRequiredElement] = None
+    privacy_policy_url: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('required_elements')
+        if value is not None:
+            value = [PassportRequiredElement.from_raw(item0) for item0 in value]
+        self.required_elements = value
+        self.privacy_policy_url = raw.get('privacy_policy_url')
+
+
+@dataclass
+class PassportElementsWithErrors(TDObject):
+    """
+    Contains information about a Telegram Passport elements and corresponding
+    errors
+    """
+
+    elements: List[TDObject] = None
+    errors: List[PassportElementError] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('elements')
+        if value is not None:
+            value = [PassportElement(item0) for item0 in value]
+        self.elements = value
+        value = raw.get('errors')
+        if value is not None:
+            value = [PassportElementError.from_raw(item0) for item0 in value]
+        self.errors = value
+
+
+@dataclass
+class EncryptedCredentials(TDObject):
+    """Contains encrypted Telegram Passport data credentials"""
+
+    data: str = None
+    hash: str = None
+    secret: str = None
+
+    def _decode(self, raw: dict):
+        self.data = raw.get('data')
+        self.hash = raw.get('hash')
+        self.secret = raw.get('secret')
+
+
+@dataclass
+class EncryptedPassportElement(TDObject):
+    """
+    Contains information about an encrypted Telegram Passport element; for bots
+    only
+    """
+
+    type: TDObject = None
+    data: str = None
+    front_side: DatedFile = None
+    reverse_side: DatedFile = None
+    selfie: DatedFile = None
+    translation: List[DatedFile] = None
+    files: List[DatedFile] = None
+    value: str = None
+    hash: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = PassportElementType(value)
+        self.type = value
+        self.data = raw.get('data')
+        value = raw.get('front_side')
+        if value is not None:
+            value = DatedFile.from_raw(value)
+        self.front_side = value
+        value = raw.get('reverse_side')
+        if value is not None:
+            value = DatedFile.from_raw(value)
+        self.reverse_side = value
+        value = raw.get('selfie')
+        if value is not None:
+            value = DatedFile.from_raw(value)
+        self.selfie = value
+        value = raw.get('translation')
+        if value is not None:
+            value = [DatedFile.from_raw(item0) for item0 in value]
+        self.translation = value
+        value = raw.get('files')
+        if value is not None:
+            value = [DatedFile.from_raw(item0) for item0 in value]
+        self.files = value
+        self.value = raw.get('value')
+        self.hash = raw.get('hash')
+
+
+@dataclass
+class InputPassportElementErrorSourceUnspecified(TDObject):
+    """
+    The element contains an error in an unspecified place. The error will be
+    considered resolved when new data is added
+    """
+
+    element_hash: str = None
+
+    def _decode(self, raw: dict):
+        self.element_hash = raw.get('element_hash')
+
+
+@dataclass
+class InputPassportElementErrorSourceDataField(TDObject):
+    """
+    A data field contains an error. The error is considered resolved when the
+    field's value changes
+    """
+
+    field_name: str = None
+    data_hash: str = None
+
+    def _decode(self, raw: dict):
+        self.field_name = raw.get('field_name')
+        self.data_hash = raw.get('data_hash')
+
+
+@dataclass
+class InputPassportElementErrorSourceFrontSide(TDObject):
+    """
+    The front side of the document contains an error. The error is considered
+    resolved when the file with the front side of the document changes
+    """
+
+    file_hash: str = None
+
+    def _decode(self, raw: dict):
+        self.file_hash = raw.get('file_hash')
+
+
+@dataclass
+class InputPassportElementErrorSourceReverseSide(TDObject):
+    """
+    The reverse side of the document contains an error. The error is considered
+    resolved when the file with the reverse side of the document changes
+    """
+
+    file_hash: str = None
+
+    def _decode(self, raw: dict):
+        self.file_hash = raw.get('file_hash')
+
+
+@dataclass
+class InputPassportElementErrorSourceSelfie(TDObject):
+    """
+    The selfie contains an error. The error is considered resolved when the file
+    with the selfie changes
+    """
+
+    file_hash: str = None
+
+    def _decode(self, raw: dict):
+        self.file_hash = raw.get('file_hash')
+
+
+@dataclass
+class InputPassportElementErrorSourceTranslationFile(TDObject):
+    """
+    One of the files containing the translation of the document contains an error.
+    The error is considered resolved when the file with the translation changes
+    """
+
+    file_hash: str = None
+
+    def _decode(self, raw: dict):
+        self.file_hash = raw.get('file_hash')
+
+
+@dataclass
+class InputPassportElementErrorSourceTranslationFiles(TDObject):
+    """
+    The translation of the document contains an error. The error is considered
+    resolved when the list of files changes
+    """
+
+    file_hashes: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.file_hashes = raw.get('file_hashes')
+
+
+@dataclass
+class InputPassportElementErrorSourceFile(TDObject):
+    """
+    The file contains an error. The error is considered resolved when the file
+    changes
+    """
+
+    file_hash: str = None
+
+    def _decode(self, raw: dict):
+        self.file_hash = raw.get('file_hash')
+
+
+@dataclass
+class InputPassportElementErrorSourceFiles(TDObject):
+    """
+    The list of attached files contains an error. The error is considered resolved
+    when the file list changes
+    """
+
+    file_hashes: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.file_hashes = raw.get('file_hashes')
+
+
+@dataclass
+class InputPassportElementError(TDObject):
+    """
+    Contains the description of an error in a Telegram Passport element; for bots
+    only
+    """
+
+    type: TDObject = None
+    message: str = None
+    source: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = PassportElementType(value)
+        self.type = value
+        self.message = raw.get('message')
+        value = raw.get('source')
+        if value is not None:
+            value = InputPassportElementErrorSource(value)
+        self.source = value
+
+
+@dataclass
+class MessageText(TDObject):
+    """A text message"""
+
+    text: FormattedText = None
+    web_page: WebPage = None
+    link_preview_options: LinkPreviewOptions = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.text = value
+        value = raw.get('web_page')
+        if value is not None:
+            value = WebPage.from_raw(value)
+        self.web_page = value
+        value = raw.get('link_preview_options')
+        if value is not None:
+            value = LinkPreviewOptions.from_raw(value)
+        self.link_preview_options = value
+
+
+@dataclass
+class MessageAnimation(TDObject):
+    """An animation message (GIF-style)."""
+
+    animation: Animation = None
+    caption: FormattedText = None
+    has_spoiler: bool = None
+    is_secret: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+        self.has_spoiler = raw.get('has_spoiler')
+        self.is_secret = raw.get('is_secret')
+
+
+@dataclass
+class MessageAudio(TDObject):
+    """An audio message"""
+
+    audio: Audio = None
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('audio')
+        if value is not None:
+            value = Audio.from_raw(value)
+        self.audio = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class MessageDocument(TDObject):
+    """A document message (general file)"""
+
+    document: Document = None
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('document')
+        if value is not None:
+            value = Document.from_raw(value)
+        self.document = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class MessagePhoto(TDObject):
+    """A photo message"""
+
+    photo: Photo = None
+    caption: FormattedText = None
+    has_spoiler: bool = None
+    is_secret: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+        self.has_spoiler = raw.get('has_spoiler')
+        self.is_secret = raw.get('is_secret')
+
+
+@dataclass
+class MessageSticker(TDObject):
+    """A sticker message"""
+
+    sticker: Sticker = None
+    is_premium: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+        self.is_premium = raw.get('is_premium')
+
+
+@dataclass
+class MessageVideo(TDObject):
+    """A video message"""
+
+    video: Video = None
+    caption: FormattedText = None
+    has_spoiler: bool = None
+    is_secret: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video')
+        if value is not None:
+            value = Video.from_raw(value)
+        self.video = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+        self.has_spoiler = raw.get('has_spoiler')
+        self.is_secret = raw.get('is_secret')
+
+
+@dataclass
+class MessageVideoNote(TDObject):
+    """A video note message"""
+
+    video_note: VideoNote = None
+    is_viewed: bool = None
+    is_secret: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video_note')
+        if value is not None:
+            value = VideoNote.from_raw(value)
+        self.video_note = value
+        self.is_viewed = raw.get('is_viewed')
+        self.is_secret = raw.get('is_secret')
+
+
+@dataclass
+class MessageVoiceNote(TDObject):
+    """A voice note message"""
+
+    voice_note: VoiceNote = None
+    caption: FormattedText = None
+    is_listened: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('voice_note')
+        if value is not None:
+            value = VoiceNote.from_raw(value)
+        self.voice_note = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+        self.is_listened = raw.get('is_listened')
+
+
+@dataclass
+class MessageExpiredPhoto(TDObject):
+    """A self-destructed photo message"""
+
+
+@dataclass
+class MessageExpiredVideo(TDObject):
+    """A self-destructed video message"""
+
+
+@dataclass
+class MessageExpiredVideoNote(TDObject):
+    """A self-destructed video note message"""
+
+
+@dataclass
+class MessageExpiredVoiceNote(TDObject):
+    """A self-destructed voice note message"""
+
+
+@dataclass
+class MessageLocation(TDObject):
+    """A message with a location"""
+
+    location: Location = None
+    live_period: int = None
+    expires_in: int = None
+    heading: int = None
+    proximity_alert_radius: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+        self.live_period = raw.get('live_period')
+        self.expires_in = raw.get('expires_in')
+        self.heading = raw.get('heading')
+        self.proximity_alert_radius = raw.get('proximity_alert_radius')
+
+
+@dataclass
+class MessageVenue(TDObject):
+    """A message with information about a venue"""
+
+    venue: Venue = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('venue')
+        if value is not None:
+            value = Venue.from_raw(value)
+        self.venue = value
+
+
+@dataclass
+class MessageContact(TDObject):
+    """A message with a user contact"""
+
+    contact: Contact = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('contact')
+        if value is not None:
+            value = Contact.from_raw(value)
+        self.contact = value
+
+
+@dataclass
+class MessageAnimatedEmoji(TDObject):
+    """A message with an animated emoji"""
+
+    animated_emoji: AnimatedEmoji = None
+    emoji: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('animated_emoji')
+        if value is not None:
+            value = AnimatedEmoji.from_raw(value)
+        self.animated_emoji = value
+        self.emoji = raw.get('emoji')
+
+
+@dataclass
+class MessageDice(TDObject):
+    """A dice message. The dice value is randomly generated by the server"""
+
+    initial_state: TDObject = None
+    final_state: TDObject = None
+    emoji: str = None
+    value: int = None
+    success_animation_frame_number: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('initial_state')
+        if value is not None:
+            value = DiceStickers(value)
+        self.initial_state = value
+        value = raw.get('final_state')
+        if value is not None:
+            value = DiceStickers(value)
+        self.final_state = value
+        self.emoji = raw.get('emoji')
+        self.value = raw.get('value')
+        self.success_animation_frame_number = raw.get('success_animation_frame_number')
+
+
+@dataclass
+class MessageGame(TDObject):
+    """A message with a game"""
+
+    game: Game = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('game')
+        if value is not None:
+            value = Game.from_raw(value)
+        self.game = value
+
+
+@dataclass
+class MessagePoll(TDObject):
+    """A message with a poll"""
+
+    poll: Poll = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('poll')
+        if value is not None:
+            value = Poll.from_raw(value)
+        self.poll = value
+
+
+@dataclass
+class MessageStory(TDObject):
+    """A message with a forwarded story"""
+
+    story_sender_chat_id: int = None
+    story_id: int = None
+    via_mention: bool = None
+
+    def _decode(self, raw: dict):
+        self.story_sender_chat_id = raw.get('story_sender_chat_id')
+        self.story_id = raw.get('story_id')
+        self.via_mention = raw.get('via_mention')
+
+
+@dataclass
+class MessageInvoice(TDObject):
+    """
+    A message with an invoice from a bot. Use getInternalLink with
+    internalLinkTypeBotStart to share the invoice
+    """
+
+    title: str = None
+    description: FormattedText = None
+    photo: Photo = None
+    currency: str = None
+    total_amount: int = None
+    start_parameter: str = None
+    is_test: bool = None
+    need_shipping_address: bool = None
+    receipt_message_id: int = None
+    extended_media: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        value = raw.get('description')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.description = value
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        self.currency = raw.get('currency')
+        self.total_amount = raw.get('total_amount')
+        self.start_parameter = raw.get('start_parameter')
+        self.is_test = raw.get('is_test')
+        self.need_shipping_address = raw.get('need_shipping_address')
+        self.receipt_message_id = raw.get('receipt_message_id')
+        value = raw.get('extended_media')
+        if value is not None:
+            value = MessageExtendedMedia(value)
+        self.extended_media = value
+
+
+@dataclass
+class MessageCall(TDObject):
+    """A message with information about an ended call"""
+
+    is_video: bool = None
+    discard_reason: TDObject = None
+    duration: int = None
+
+    def _decode(self, raw: dict):
+        self.is_video = raw.get('is_video')
+        value = raw.get('discard_reason')
+        if value is not None:
+            value = CallDiscardReason(value)
+        self.discard_reason = value
+        self.duration = raw.get('duration')
+
+
+@dataclass
+class MessageVideoChatScheduled(TDObject):
+    """A new video chat was scheduled"""
+
+    group_call_id: int = None
+    start_date: int = None
+
+    def _decode(self, raw: dict):
+        self.group_call_id = raw.get('group_call_id')
+        self.start_date = raw.get('start_date')
+
+
+@dataclass
+class MessageVideoChatStarted(TDObject):
+    """A newly created video chat"""
+
+    group_call_id: int = None
+
+    def _decode(self, raw: dict):
+        self.group_call_id = raw.get('group_call_id')
+
+
+@dataclass
+class MessageVideoChatEnded(TDObject):
+    """A message with information about an ended video chat"""
+
+    duration: int = None
+
+    def _decode(self, raw: dict):
+        self.duration = raw.get('duration')
+
+
+@dataclass
+class MessageInviteVideoChatParticipants(TDObject):
+    """A message with information about an invite to a video chat"""
+
+    group_call_id: int = None
+    user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.group_call_id = raw.get('group_call_id')
+        self.user_ids = raw.get('user_ids')
+
+
+@dataclass
+class MessageBasicGroupChatCreate(TDObject):
+    """A newly created basic group"""
+
+    title: str = None
+    member_user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        self.member_user_ids = raw.get('member_user_ids')
+
+
+@dataclass
+class MessageSupergroupChatCreate(TDObject):
+    """A newly created supergroup or channel"""
+
+    title: str = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+
+
+@dataclass
+class MessageChatChangeTitle(TDObject):
+    """An updated chat title"""
+
+    title: str = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+
+
+@dataclass
+class MessageChatChangePhoto(TDObject):
+    """An updated chat photo"""
+
+    photo: ChatPhoto = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.photo = value
+
+
+@dataclass
+class MessageChatDeletePhoto(TDObject):
+    """A deleted chat photo"""
+
+
+@dataclass
+class MessageChatAddMembers(TDObject):
+    """New chat members were added"""
+
+    member_user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.member_user_ids = raw.get('member_user_ids')
+
+
+@dataclass
+class MessageChatJoinByLink(TDObject):
+    """A new member joined the chat via an invite link"""
+
+
+@dataclass
+class MessageChatJoinByRequest(TDObject):
+    """A new member was accepted to the chat by an administrator"""
+
+
+@dataclass
+class MessageChatDeleteMember(TDObject):
+    """A chat member was deleted"""
+
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class MessageChatUpgradeTo(TDObject):
+    """A basic group was upgraded to a supergroup and was deactivated as the result"""
+
+    supergroup_id: int = None
+
+    def _decode(self, raw: dict):
+        self.supergroup_id = raw.get('supergroup_id')
+
+
+@dataclass
+class MessageChatUpgradeFrom(TDObject):
+    """A supergroup has been created from a basic group"""
+
+    title: str = None
+    basic_group_id: int = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        self.basic_group_id = raw.get('basic_group_id')
+
+
+@dataclass
+class MessagePinMessage(TDObject):
+    """A message has been pinned"""
+
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class MessageScreenshotTaken(TDObject):
+    """A screenshot of a message in the chat has been taken"""
+
+
+@dataclass
+class MessageChatSetBackground(TDObject):
+    """A new background was set in the chat"""
+
+    old_background_message_id: int = None
+    background: ChatBackground = None
+    only_for_self: bool = None
+
+    def _decode(self, raw: dict):
+        self.old_background_message_id = raw.get('old_background_message_id')
+        value = raw.get('background')
+        if value is not None:
+            value = ChatBackground.from_raw(value)
+        self.background = value
+        self.only_for_self = raw.get('only_for_self')
+
+
+@dataclass
+class MessageChatSetTheme(TDObject):
+    """A theme in the chat has been changed"""
+
+    theme_name: str = None
+
+    def _decode(self, raw: dict):
+        self.theme_name = raw.get('theme_name')
+
+
+@dataclass
+class MessageChatSetMessageAutoDeleteTime(TDObject):
+    """
+    The auto-delete or self-destruct timer for messages in the chat has been
+    changed
+    """
+
+    message_auto_delete_time: int = None
+    from_user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.message_auto_delete_time = raw.get('message_auto_delete_time')
+        self.from_user_id = raw.get('from_user_id')
+
+
+@dataclass
+class MessageChatBoost(TDObject):
+    """The chat was boosted by the sender of the message"""
+
+    boost_count: int = None
+
+    def _decode(self, raw: dict):
+        self.boost_count = raw.get('boost_count')
+
+
+@dataclass
+class MessageForumTopicCreated(TDObject):
+    """A forum topic has been created"""
+
+    name: str = None
+    icon: ForumTopicIcon = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+        value = raw.get('icon')
+        if value is not None:
+            value = ForumTopicIcon.from_raw(value)
+        self.icon = value
+
+
+@dataclass
+class MessageForumTopicEdited(TDObject):
+    """A forum topic has been edited"""
+
+    name: str = None
+    edit_icon_custom_emoji_id: bool = None
+    icon_custom_emoji_id: int = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+        self.edit_icon_custom_emoji_id = raw.get('edit_icon_custom_emoji_id')
+        value = raw.get('icon_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.icon_custom_emoji_id = value
+
+
+@dataclass
+class MessageForumTopicIsClosedToggled(TDObject):
+    """A forum topic has been closed or opened"""
+
+    is_closed: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_closed = raw.get('is_closed')
+
+
+@dataclass
+class MessageForumTopicIsHiddenToggled(TDObject):
+    """A General forum topic has been hidden or unhidden"""
+
+    is_hidden: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_hidden = raw.get('is_hidden')
+
+
+@dataclass
+class MessageSuggestProfilePhoto(TDObject):
+    """A profile photo was suggested to a user in a private chat"""
+
+    photo: ChatPhoto = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.photo = value
+
+
+@dataclass
+class MessageCustomServiceAction(TDObject):
+    """A non-standard action has happened in the chat"""
+
+    text: str = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+
+
+@dataclass
+class MessageGameScore(TDObject):
+    """A new high score was achieved in a game"""
+
+    game_message_id: int = None
+    game_id: int = None
+    score: int = None
+
+    def _decode(self, raw: dict):
+        self.game_message_id = raw.get('game_message_id')
+        value = raw.get('game_id')
+        if value is not None:
+            value = int(value)
+        self.game_id = value
+        self.score = raw.get('score')
+
+
+@dataclass
+class MessagePaymentSuccessful(TDObject):
+    """A payment has been completed"""
+
+    invoice_chat_id: int = None
+    invoice_message_id: int = None
+    currency: str = None
+    total_amount: int = None
+    is_recurring: bool = None
+    is_first_recurring: bool = None
+    invoice_name: str = None
+
+    def _decode(self, raw: dict):
+        self.invoice_chat_id = raw.get('invoice_chat_id')
+        self.invoice_message_id = raw.get('invoice_message_id')
+        self.currency = raw.get('currency')
+        self.total_amount = raw.get('total_amount')
+        self.is_recurring = raw.get('is_recurring')
+        self.is_first_recurring = raw.get('is_first_recurring')
+        self.invoice_name = raw.get('invoice_name')
+
+
+@dataclass
+class MessagePaymentSuccessfulBot(TDObject):
+    """A payment has been completed; for bots only"""
+
+    currency: str = None
+    total_amount: int = None
+    is_recurring: bool = None
+    is_first_recurring: bool = None
+    invoice_payload: str = None
+    shipping_option_id: str = None
+    order_info: OrderInfo = None
+    telegram_payment_charge_id: str = None
+    provider_payment_charge_id: str = None
+
+    def _decode(self, raw: dict):
+        self.currency = raw.get('currency')
+        self.total_amount = raw.get('total_amount')
+        self.is_recurring = raw.get('is_recurring')
+        self.is_first_recurring = raw.get('is_first_recurring')
+        self.invoice_payload = raw.get('invoice_payload')
+        self.shipping_option_id = raw.get('shipping_option_id')
+        value = raw.get('order_info')
+        if value is not None:
+            value = OrderInfo.from_raw(value)
+        self.order_info = value
+        self.telegram_payment_charge_id = raw.get('telegram_payment_charge_id')
+        self.provider_payment_charge_id = raw.get('provider_payment_charge_id')
+
+
+@dataclass
+class MessageGiftedPremium(TDObject):
+    """Telegram Premium was gifted to the user"""
+
+    gifter_user_id: int = None
+    currency: str = None
+    amount: int = None
+    cryptocurrency: str = None
+    cryptocurrency_amount: int = None
+    month_count: int = None
+    sticker: Sticker = None
+
+    def _decode(self, raw: dict):
+        self.gifter_user_id = raw.get('gifter_user_id')
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+        self.cryptocurrency = raw.get('cryptocurrency')
+        value = raw.get('cryptocurrency_amount')
+        if value is not None:
+            value = int(value)
+        self.cryptocurrency_amount = value
+        self.month_count = raw.get('month_count')
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+
+
+@dataclass
+class MessagePremiumGiftCode(TDObject):
+    """A Telegram Premium gift code was created for the user"""
+
+    creator_id: TDObject = None
+    is_from_giveaway: bool = None
+    is_unclaimed: bool = None
+    currency: str = None
+    amount: int = None
+    cryptocurrency: str = None
+    cryptocurrency_amount: int = None
+    month_count: int = None
+    sticker: Sticker = None
+    code: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('creator_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.creator_id = value
+        self.is_from_giveaway = raw.get('is_from_giveaway')
+        self.is_unclaimed = raw.get('is_unclaimed')
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+        self.cryptocurrency = raw.get('cryptocurrency')
+        value = raw.get('cryptocurrency_amount')
+        if value is not None:
+            value = int(value)
+        self.cryptocurrency_amount = value
+        self.month_count = raw.get('month_count')
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+        self.code = raw.get('code')
+
+
+@dataclass
+class MessagePremiumGiveawayCreated(TDObject):
+    """A Telegram Premium giveaway was created for the chat"""
+
+
+@dataclass
+class MessagePremiumGiveaway(TDObject):
+    """A Telegram Premium giveaway"""
+
+    parameters: PremiumGiveawayParameters = None
+    winner_count: int = None
+    month_count: int = None
+    sticker: Sticker = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('parameters')
+        if value is not None:
+            value = PremiumGiveawayParameters.from_raw(value)
+        self.parameters = value
+        self.winner_count = raw.get('winner_count')
+        self.month_count = raw.get('month_count')
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+
+
+@dataclass
+class MessagePremiumGiveawayCompleted(TDObject):
+    """
+    A Telegram Premium giveaway without public winners has been completed for the
+    chat
+    """
+
+    giveaway_message_id: int = None
+    winner_count: int = None
+    unclaimed_prize_count: int = None
+
+    def _decode(self, raw: dict):
+        self.giveaway_message_id = raw.get('giveaway_message_id')
+        self.winner_count = raw.get('winner_count')
+        self.unclaimed_prize_count = raw.get('unclaimed_prize_count')
+
+
+@dataclass
+class MessagePremiumGiveawayWinners(TDObject):
+    """
+    A Telegram Premium giveaway with public winners has been completed for the
+    chat
+    """
+
+    boosted_chat_id: int = None
+    giveaway_message_id: int = None
+    additional_chat_count: int = None
+    actual_winners_selection_date: int = None
+    only_new_members: bool = None
+    was_refunded: bool = None
+    month_count: int = None
+    prize_description: str = None
+    winner_count: int = None
+    winner_user_ids: List[int] = None
+    unclaimed_prize_count: int = None
+
+    def _decode(self, raw: dict):
+        self.boosted_chat_id = raw.get('boosted_chat_id')
+        self.giveaway_message_id = raw.get('giveaway_message_id')
+        self.additional_chat_count = raw.get('additional_chat_count')
+        self.actual_winners_selection_date = raw.get('actual_winners_selection_date')
+        self.only_new_members = raw.get('only_new_members')
+        self.was_refunded = raw.get('was_refunded')
+        self.month_count = raw.get('month_count')
+        self.prize_description = raw.get('prize_description')
+        self.winner_count = raw.get('winner_count')
+        self.winner_user_ids = raw.get('winner_user_ids')
+        self.unclaimed_prize_count = raw.get('unclaimed_prize_count')
+
+
+@dataclass
+class MessageContactRegistered(TDObject):
+    """A contact has registered with Telegram"""
+
+
+@dataclass
+class MessageUsersShared(TDObject):
+    """The current user shared users, which were requested by the bot"""
+
+    user_ids: List[int] = None
+    button_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_ids = raw.get('user_ids')
+        self.button_id = raw.get('button_id')
+
+
+@dataclass
+class MessageChatShared(TDObject):
+    """The current user shared a chat, which was requested by the bot"""
+
+    chat_id: int = None
+    button_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.button_id = raw.get('button_id')
+
+
+@dataclass
+class MessageBotWriteAccessAllowed(TDObject):
+    """The user allowed the bot to send messages"""
+
+    reason: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('reason')
+        if value is not None:
+            value = BotWriteAccessAllowReason(value)
+        self.reason = value
+
+
+@dataclass
+class MessageWebAppDataSent(TDObject):
+    """Data from a Web App has been sent to a bot"""
+
+    button_text: str = None
+
+    def _decode(self, raw: dict):
+        self.button_text = raw.get('button_text')
+
+
+@dataclass
+class MessageWebAppDataReceived(TDObject):
+    """Data from a Web App has been received; for bots only"""
+
+    button_text: str = None
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.button_text = raw.get('button_text')
+        self.data = raw.get('data')
+
+
+@dataclass
+class MessagePassportDataSent(TDObject):
+    """Telegram Passport data has been sent to a bot"""
+
+    types: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('types')
+        if value is not None:
+            value = [PassportElementType(item0) for item0 in value]
+        self.types = value
+
+
+@dataclass
+class MessagePassportDataReceived(TDObject):
+    """Telegram Passport data has been received; for bots only"""
+
+    elements: List[EncryptedPassportElement] = None
+    credentials: EncryptedCredentials = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('elements')
+        if value is not None:
+            value = [EncryptedPassportElement.from_raw(item0) for item0 in value]
+        self.elements = value
+        value = raw.get('credentials')
+        if value is not None:
+            value = EncryptedCredentials.from_raw(value)
+        self.credentials = value
+
+
+@dataclass
+class MessageProximityAlertTriggered(TDObject):
+    """A user in the chat came within proximity alert range"""
+
+    traveler_id: TDObject = None
+    watcher_id: TDObject = None
+    distance: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('traveler_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.traveler_id = value
+        value = raw.get('watcher_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.watcher_id = value
+        self.distance = raw.get('distance')
+
+
+@dataclass
+class MessageUnsupported(TDObject):
+    """A message content that is not supported in the current TDLib version"""
+
+
+@dataclass
+class TextEntityTypeMention(TDObject):
+    """A mention of a user, a supergroup, or a channel by their username"""
+
+
+@dataclass
+class TextEntityTypeHashtag(TDObject):
+    """A hashtag text, beginning with "#\""""
+
+
+@dataclass
+class TextEntityTypeCashtag(TDObject):
+    """
+    A cashtag text, beginning with "$" and consisting of capital English letters
+    (e.g., "$USD")
+    """
+
+
+@dataclass
+class TextEntityTypeBotCommand(TDObject):
+    """A bot command, beginning with "/\""""
+
+
+@dataclass
+class TextEntityTypeUrl(TDObject):
+    """An HTTP URL"""
+
+
+@dataclass
+class TextEntityTypeEmailAddress(TDObject):
+    """An email address"""
+
+
+@dataclass
+class TextEntityTypePhoneNumber(TDObject):
+    """A phone number"""
+
+
+@dataclass
+class TextEntityTypeBankCardNumber(TDObject):
+    """
+    A bank card number. The getBankCardInfo method can be used to get information
+    about the bank card
+    """
+
+
+@dataclass
+class TextEntityTypeBold(TDObject):
+    """A bold text"""
+
+
+@dataclass
+class TextEntityTypeItalic(TDObject):
+    """An italic text"""
+
+
+@dataclass
+class TextEntityTypeUnderline(TDObject):
+    """An underlined text"""
+
+
+@dataclass
+class TextEntityTypeStrikethrough(TDObject):
+    """A strikethrough text"""
+
+
+@dataclass
+class TextEntityTypeSpoiler(TDObject):
+    """A spoiler text"""
+
+
+@dataclass
+class TextEntityTypeCode(TDObject):
+    """Text that must be formatted as if inside a code HTML tag"""
+
+
+@dataclass
+class TextEntityTypePre(TDObject):
+    """Text that must be formatted as if inside a pre HTML tag"""
+
+
+@dataclass
+class TextEntityTypePreCode(TDObject):
+    """Text that must be formatted as if inside pre, and code HTML tags"""
+
+    language: str = None
+
+    def _decode(self, raw: dict):
+        self.language = raw.get('language')
+
+
+@dataclass
+class TextEntityTypeBlockQuote(TDObject):
+    """Text that must be formatted as if inside a blockquote HTML tag"""
+
+
+@dataclass
+class TextEntityTypeTextUrl(TDObject):
+    """A text description shown instead of a raw URL"""
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class TextEntityTypeMentionName(TDObject):
+    """
+    A text shows instead of a raw mention of the user (e.g., when the user has no
+    username)
+    """
+
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class TextEntityTypeCustomEmoji(TDObject):
+    """
+    A custom emoji. The text behind a custom emoji must be an emoji. Only premium
+    users can use premium custom emoji
+    """
+
+    custom_emoji_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.custom_emoji_id = value
+
+
+@dataclass
+class TextEntityTypeMediaTimestamp(TDObject):
+    """A media timestamp"""
+
+    media_timestamp: int = None
+
+    def _decode(self, raw: dict):
+        self.media_timestamp = raw.get('media_timestamp')
+
+
+@dataclass
+class InputThumbnail(TDObject):
+    """
+    A thumbnail to be sent along with a file; must be in JPEG or WEBP format for
+    stickers, and less than 200 KB in size
+    """
+
+    thumbnail: TDObject = None
+    width: int = None
+    height: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = InputFile(value)
+        self.thumbnail = value
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+
+
+@dataclass
+class MessageSchedulingStateSendAtDate(TDObject):
+    """The message will be sent at the specified date"""
+
+    send_date: int = None
+
+    def _decode(self, raw: dict):
+        self.send_date = raw.get('send_date')
+
+
+@dataclass
+class MessageSchedulingStateSendWhenOnline(TDObject):
+    """
+    The message will be sent when the other user is online. Applicable to private
+    chats only and when the exact online status of the other user is known
+    """
+
+
+@dataclass
+class MessageSelfDestructTypeTimer(TDObject):
+    """
+    The message will be self-destructed in the specified time after its content
+    was opened
+    """
+
+    self_destruct_time: int = None
+
+    def _decode(self, raw: dict):
+        self.self_destruct_time = raw.get('self_destruct_time')
+
+
+@dataclass
+class MessageSelfDestructTypeImmediately(TDObject):
+    """The message can be opened only once and will be self-destructed once closed"""
+
+
+@dataclass
+class MessageSendOptions(TDObject):
+    """Options to be used when a message is sent"""
+
+    disable_notification: bool = None
+    from_background: bool = None
+    protect_content: bool = None
+    update_order_of_installed_sticker_sets: bool = None
+    scheduling_state: TDObject = None
+    sending_id: int = None
+    only_preview: bool = None
+
+    def _decode(self, raw: dict):
+        self.disable_notification = raw.get('disable_notification')
+        self.from_background = raw.get('from_background')
+        self.protect_content = raw.get('protect_content')
+        self.update_order_of_installed_sticker_sets = raw.get('update_order_of_installed_sticker_sets')
+        value = raw.get('scheduling_state')
+        if value is not None:
+            value = MessageSchedulingState(value)
+        self.scheduling_state = value
+        self.sending_id = raw.get('sending_id')
+        self.only_preview = raw.get('only_preview')
+
+
+@dataclass
+class MessageCopyOptions(TDObject):
+    """
+    Options to be used when a message content is copied without reference to the
+    original sender. Service messages, messages with messageInvoice,
+    messagePremiumGiveaway, or messagePremiumGiveawayWinners content can't be
+    copied
+    """
+
+    send_copy: bool = None
+    replace_caption: bool = None
+    new_caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        self.send_copy = raw.get('send_copy')
+        self.replace_caption = raw.get('replace_caption')
+        value = raw.get('new_caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.new_caption = value
+
+
+@dataclass
+class InputMessageText(TDObject):
+    """A text message"""
+
+    text: FormattedText = None
+    link_preview_options: LinkPreviewOptions = None
+    clear_draft: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.text = value
+        value = raw.get('link_preview_options')
+        if value is not None:
+            value = LinkPreviewOptions.from_raw(value)
+        self.link_preview_options = value
+        self.clear_draft = raw.get('clear_draft')
+
+
+@dataclass
+class InputMessageAnimation(TDObject):
+    """An animation message (GIF-style)."""
+
+    animation: TDObject = None
+    thumbnail: InputThumbnail = None
+    added_sticker_file_ids: List[int] = None
+    duration: int = None
+    width: int = None
+    height: int = None
+    caption: FormattedText = None
+    has_spoiler: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('animation')
+        if value is not None:
+            value = InputFile(value)
+        self.animation = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = InputThumbnail.from_raw(value)
+        self.thumbnail = value
+        self.added_sticker_file_ids = raw.get('added_sticker_file_ids')
+        self.duration = raw.get('duration')
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+        self.has_spoiler = raw.get('has_spoiler')
+
+
+@dataclass
+class InputMessageAudio(TDObject):
+    """An audio message"""
+
+    audio: TDObject = None
+    album_cover_thumbnail: InputThumbnail = None
+    duration: int = None
+    title: str = None
+    performer: str = None
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('audio')
+        if value is not None:
+            value = InputFile(value)
+        self.audio = value
+        value = raw.get('album_cover_thumbnail')
+        if value is not None:
+            value = InputThumbnail.from_raw(value)
+        self.album_cover_thumbnail = value
+        self.duration = raw.get('duration')
+        self.title = raw.get('title')
+        self.performer = raw.get('performer')
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class InputMessageDocument(TDObject):
+    """A document message (general file)"""
+
+    document: TDObject = None
+    thumbnail: InputThumbnail = None
+    disable_content_type_detection: bool = None
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('document')
+        if value is not None:
+            value = InputFile(value)
+        self.document = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = InputThumbnail.from_raw(value)
+        self.thumbnail = value
+        self.disable_content_type_detection = raw.get('disable_content_type_detection')
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class InputMessagePhoto(TDObject):
+    """A photo message"""
+
+    photo: TDObject = None
+    thumbnail: InputThumbnail = None
+    added_sticker_file_ids: List[int] = None
+    width: int = None
+    height: int = None
+    caption: FormattedText = None
+    self_destruct_type: TDObject = None
+    has_spoiler: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = InputFile(value)
+        self.photo = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = InputThumbnail.from_raw(value)
+        self.thumbnail = value
+        self.added_sticker_file_ids = raw.get('added_sticker_file_ids')
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+        value = raw.get('self_destruct_type')
+        if value is not None:
+            value = MessageSelfDestructType(value)
+        self.self_destruct_type = value
+        self.has_spoiler = raw.get('has_spoiler')
+
+
+@dataclass
+class InputMessageSticker(TDObject):
+    """A sticker message"""
+
+    sticker: TDObject = None
+    thumbnail: InputThumbnail = None
+    width: int = None
+    height: int = None
+    emoji: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker')
+        if value is not None:
+            value = InputFile(value)
+        self.sticker = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = InputThumbnail.from_raw(value)
+        self.thumbnail = value
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.emoji = raw.get('emoji')
+
+
+@dataclass
+class InputMessageVideo(TDObject):
+    """A video message"""
+
+    video: TDObject = None
+    thumbnail: InputThumbnail = None
+    added_sticker_file_ids: List[int] = None
+    duration: int = None
+    width: int = None
+    height: int = None
+    supports_streaming: bool = None
+    caption: FormattedText = None
+    self_destruct_type: TDObject = None
+    has_spoiler: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video')
+        if value is not None:
+            value = InputFile(value)
+        self.video = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = InputThumbnail.from_raw(value)
+        self.thumbnail = value
+        self.added_sticker_file_ids = raw.get('added_sticker_file_ids')
+        self.duration = raw.get('duration')
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.supports_streaming = raw.get('supports_streaming')
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+        value = raw.get('self_destruct_type')
+        if value is not None:
+            value = MessageSelfDestructType(value)
+        self.self_destruct_type = value
+        self.has_spoiler = raw.get('has_spoiler')
+
+
+@dataclass
+class InputMessageVideoNote(TDObject):
+    """A video note message"""
+
+    video_note: TDObject = None
+    thumbnail: InputThumbnail = None
+    duration: int = None
+    length: int = None
+    self_destruct_type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video_note')
+        if value is not None:
+            value = InputFile(value)
+        self.video_note = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = InputThumbnail.from_raw(value)
+        self.thumbnail = value
+        self.duration = raw.get('duration')
+        self.length = raw.get('length')
+        value = raw.get('self_destruct_type')
+        if value is not None:
+            value = MessageSelfDestructType(value)
+        self.self_destruct_type = value
+
+
+@dataclass
+class InputMessageVoiceNote(TDObject):
+    """A voice note message"""
+
+    voice_note: TDObject = None
+    duration: int = None
+    waveform: str = None
+    caption: FormattedText = None
+    self_destruct_type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('voice_note')
+        if value is not None:
+            value = InputFile(value)
+        self.voice_note = value
+        self.duration = raw.get('duration')
+        self.waveform = raw.get('waveform')
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+        value = raw.get('self_destruct_type')
+        if value is not None:
+            value = MessageSelfDestructType(value)
+        self.self_destruct_type = value
+
+
+@dataclass
+class InputMessageLocation(TDObject):
+    """A message with a location"""
+
+    location: Location = None
+    live_period: int = None
+    heading: int = None
+    proximity_alert_radius: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+        self.live_period = raw.get('live_period')
+        self.heading = raw.get('heading')
+        self.proximity_alert_radius = raw.get('proximity_alert_radius')
+
+
+@dataclass
+class InputMessageVenue(TDObject):
+    """A message with information about a venue"""
+
+    venue: Venue = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('venue')
+        if value is not None:
+            value = Venue.from_raw(value)
+        self.venue = value
+
+
+@dataclass
+class InputMessageContact(TDObject):
+    """A message containing a user contact"""
+
+    contact: Contact = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('contact')
+        if value is not None:
+            value = Contact.from_raw(value)
+        self.contact = value
+
+
+@dataclass
+class InputMessageDice(TDObject):
+    """A dice message"""
+
+    emoji: str = None
+    clear_draft: bool = None
+
+    def _decode(self, raw: dict):
+        self.emoji = raw.get('emoji')
+        self.clear_draft = raw.get('clear_draft')
+
+
+@dataclass
+class InputMessageGame(TDObject):
+    """A message with a game; not supported for channels or secret chats"""
+
+    bot_user_id: int = None
+    game_short_name: str = None
+
+    def _decode(self, raw: dict):
+        self.bot_user_id = raw.get('bot_user_id')
+        self.game_short_name = raw.get('game_short_name')
+
+
+@dataclass
+class InputMessageInvoice(TDObject):
+    """A message with an invoice; can be used only by bots"""
+
+    invoice: Invoice = None
+    title: str = None
+    description: str = None
+    photo_url: str = None
+    photo_size: int = None
+    photo_width: int = None
+    photo_height: int = None
+    payload: str = None
+    provider_token: str = None
+    provider_data: str = None
+    start_parameter: str = None
+    extended_media_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('invoice')
+        if value is not None:
+            value = Invoice.from_raw(value)
+        self.invoice = value
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+        self.photo_url = raw.get('photo_url')
+        self.photo_size = raw.get('photo_size')
+        self.photo_width = raw.get('photo_width')
+        self.photo_height = raw.get('photo_height')
+        self.payload = raw.get('payload')
+        self.provider_token = raw.get('provider_token')
+        self.provider_data = raw.get('provider_data')
+        self.start_parameter = raw.get('start_parameter')
+        value = raw.get('extended_media_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.extended_media_content = value
+
+
+@dataclass
+class InputMessagePoll(TDObject):
+    """
+    A message with a poll. Polls can't be sent to secret chats. Polls can be sent
+    only to a private chat with a bot
+    """
+
+    question: str = None
+    options: List[str] = None
+    is_anonymous: bool = None
+    type: TDObject = None
+    open_period: int = None
+    close_date: int = None
+    is_closed: bool = None
+
+    def _decode(self, raw: dict):
+        self.question = raw.get('question')
+        self.options = raw.get('options')
+        self.is_anonymous = raw.get('is_anonymous')
+        value = raw.get('type')
+        if value is not None:
+            value = PollType(value)
+        self.type = value
+        self.open_period = raw.get('open_period')
+        self.close_date = raw.get('close_date')
+        self.is_closed = raw.get('is_closed')
+
+
+@dataclass
+class InputMessageStory(TDObject):
+    """
+    A message with a forwarded story. Stories can't be sent to secret chats. A
+    story can be forwarded only if story.can_be_forwarded
+    """
+
+    story_sender_chat_id: int = None
+    story_id: int = None
+
+    def _decode(self, raw: dict):
+        self.story_sender_chat_id = raw.get('story_sender_chat_id')
+        self.story_id = raw.get('story_id')
+
+
+@dataclass
+class InputMessageForwarded(TDObject):
+    """A forwarded message"""
+
+    from_chat_id: int = None
+    message_id: int = None
+    in_game_share: bool = None
+    copy_options: MessageCopyOptions = None
+
+    def _decode(self, raw: dict):
+        self.from_chat_id = raw.get('from_chat_id')
+        self.message_id = raw.get('message_id')
+        self.in_game_share = raw.get('in_game_share')
+        value = raw.get('copy_options')
+        if value is not None:
+            value = MessageCopyOptions.from_raw(value)
+        self.copy_options = value
+
+
+@dataclass
+class SearchMessagesFilterEmpty(TDObject):
+    """Returns all found messages, no filter is applied"""
+
+
+@dataclass
+class SearchMessagesFilterAnimation(TDObject):
+    """Returns only animation messages"""
+
+
+@dataclass
+class SearchMessagesFilterAudio(TDObject):
+    """Returns only audio messages"""
+
+
+@dataclass
+class SearchMessagesFilterDocument(TDObject):
+    """Returns only document messages"""
+
+
+@dataclass
+class SearchMessagesFilterPhoto(TDObject):
+    """Returns only photo messages"""
+
+
+@dataclass
+class SearchMessagesFilterVideo(TDObject):
+    """Returns only video messages"""
+
+
+@dataclass
+class SearchMessagesFilterVoiceNote(TDObject):
+    """Returns only voice note messages"""
+
+
+@dataclass
+class SearchMessagesFilterPhotoAndVideo(TDObject):
+    """Returns only photo and video messages"""
+
+
+@dataclass
+class SearchMessagesFilterUrl(TDObject):
+    """Returns only messages containing URLs"""
+
+
+@dataclass
+class SearchMessagesFilterChatPhoto(TDObject):
+    """Returns only messages containing chat photos"""
+
+
+@dataclass
+class SearchMessagesFilterVideoNote(TDObject):
+    """Returns only video note messages"""
+
+
+@dataclass
+class SearchMessagesFilterVoiceAndVideoNote(TDObject):
+    """Returns only voice and video note messages"""
+
+
+@dataclass
+class SearchMessagesFilterMention(TDObject):
+    """
+    Returns only messages with mentions of the current user, or messages that are
+    replies to their messages
+    """
+
+
+@dataclass
+class SearchMessagesFilterUnreadMention(TDObject):
+    """
+    Returns only messages with unread mentions of the current user, or messages
+    that are replies to their messages. When using this filter the results can't
+    be additionally filtered by a query, a message thread or by the sending user
+    """
+
+
+@dataclass
+class SearchMessagesFilterUnreadReaction(TDObject):
+    """
+    Returns only messages with unread reactions for the current user. When using
+    this filter the results can't be additionally filtered by a query, a message
+    thread or by the sending user
+    """
+
+
+@dataclass
+class SearchMessagesFilterFailedToSend(TDObject):
+    """
+    Returns only failed to send messages. This filter can be used only if the
+    message database is used
+    """
+
+
+@dataclass
+class SearchMessagesFilterPinned(TDObject):
+    """Returns only pinned messages"""
+
+
+@dataclass
+class ChatActionTyping(TDObject):
+    """The user is typing a message"""
+
+
+@dataclass
+class ChatActionRecordingVideo(TDObject):
+    """The user is recording a video"""
+
+
+@dataclass
+class ChatActionUploadingVideo(TDObject):
+    """The user is uploading a video"""
+
+    progress: int = None
+
+    def _decode(self, raw: dict):
+        self.progress = raw.get('progress')
+
+
+@dataclass
+class ChatActionRecordingVoiceNote(TDObject):
+    """The user is recording a voice note"""
+
+
+@dataclass
+class ChatActionUploadingVoiceNote(TDObject):
+    """The user is uploading a voice note"""
+
+    progress: int = None
+
+    def _decode(self, raw: dict):
+        self.progress = raw.get('progress')
+
+
+@dataclass
+class ChatActionUploadingPhoto(TDObject):
+    """The user is uploading a photo"""
+
+    progress: int = None
+
+    def _decode(self, raw: dict):
+        self.progress = raw.get('progress')
+
+
+@dataclass
+class ChatActionUploadingDocument(TDObject):
+    """The user is uploading a document"""
+
+    progress: int = None
+
+    def _decode(self, raw: dict):
+        self.progress = raw.get('progress')
+
+
+@dataclass
+class ChatActionChoosingSticker(TDObject):
+    """The user is picking a sticker to send"""
+
+
+@dataclass
+class ChatActionChoosingLocation(TDObject):
+    """The user is picking a location or venue to send"""
+
+
+@dataclass
+class ChatActionChoosingContact(TDObject):
+    """The user is picking a contact to send"""
+
+
+@dataclass
+class ChatActionStartPlayingGame(TDObject):
+    """The user has started to play a game"""
+
+
+@dataclass
+class ChatActionRecordingVideoNote(TDObject):
+    """The user is recording a video note"""
+
+
+@dataclass
+class ChatActionUploadingVideoNote(TDObject):
+    """The user is uploading a video note"""
+
+    progress: int = None
+
+    def _decode(self, raw: dict):
+        self.progress = raw.get('progress')
+
+
+@dataclass
+class ChatActionWatchingAnimations(TDObject):
+    """
+    The user is watching animations sent by the other party by clicking on an
+    animated emoji
+    """
+
+    emoji: str = None
+
+    def _decode(self, raw: dict):
+        self.emoji = raw.get('emoji')
+
+
+@dataclass
+class ChatActionCancel(TDObject):
+    """The user has canceled the previous action"""
+
+
+@dataclass
+class UserStatusEmpty(TDObject):
+    """The user's status has never been changed"""
+
+
+@dataclass
+class UserStatusOnline(TDObject):
+    """The user is online"""
+
+    expires: int = None
+
+    def _decode(self, raw: dict):
+        self.expires = raw.get('expires')
+
+
+@dataclass
+class UserStatusOffline(TDObject):
+    """The user is offline"""
+
+    was_online: int = None
+
+    def _decode(self, raw: dict):
+        self.was_online = raw.get('was_online')
+
+
+@dataclass
+class UserStatusRecently(TDObject):
+    """The user was online recently"""
+
+    by_my_privacy_settings: bool = None
+
+    def _decode(self, raw: dict):
+        self.by_my_privacy_settings = raw.get('by_my_privacy_settings')
+
+
+@dataclass
+class UserStatusLastWeek(TDObject):
+    """The user is offline, but was online last week"""
+
+    by_my_privacy_settings: bool = None
+
+    def _decode(self, raw: dict):
+        self.by_my_privacy_settings = raw.get('by_my_privacy_settings')
+
+
+@dataclass
+class UserStatusLastMonth(TDObject):
+    """The user is offline, but was online last month"""
+
+    by_my_privacy_settings: bool = None
+
+    def _decode(self, raw: dict):
+        self.by_my_privacy_settings = raw.get('by_my_privacy_settings')
+
+
+@dataclass
+class EmojiKeyword(TDObject):
+    """Represents an emoji with its keyword"""
+
+    emoji: str = None
+    keyword: str = None
+
+    def _decode(self, raw: dict):
+        self.emoji = raw.get('emoji')
+        self.keyword = raw.get('keyword')
+
+
+@dataclass
+class EmojiKeywords(TDObject):
+    """Represents a list of emoji with their keywords"""
+
+    emoji_keywords: List[EmojiKeyword] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('emoji_keywords')
+        if value is not None:
+            value = [EmojiKeyword.from_raw(item0) for item0 in value]
+        self.emoji_keywords = value
+
+
+@dataclass
+class Stickers(TDObject):
+    """Represents a list of stickers"""
+
+    stickers: List[Sticker] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('stickers')
+        if value is not None:
+            value = [Sticker.from_raw(item0) for item0 in value]
+        self.stickers = value
+
+
+@dataclass
+class Emojis(TDObject):
+    """Represents a list of emoji"""
+
+    emojis: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.emojis = raw.get('emojis')
+
+
+@dataclass
+class StickerSet(TDObject):
+    """Represents a sticker set"""
+
+    id: int = None
+    title: str = None
+    name: str = None
+    thumbnail: Thumbnail = None
+    thumbnail_outline: List[ClosedVectorPath] = None
+    is_installed: bool = None
+    is_archived: bool = None
+    is_official: bool = None
+    sticker_format: TDObject = None
+    sticker_type: TDObject = None
+    needs_repainting: bool = None
+    is_allowed_as_chat_emoji_status: bool = None
+    is_viewed: bool = None
+    stickers: List[Sticker] = None
+    emojis: List[Emojis] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.title = raw.get('title')
+        self.name = raw.get('name')
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+        value = raw.get('thumbnail_outline')
+        if value is not None:
+            value = [ClosedVectorPath.from_raw(item0) for item0 in value]
+        self.thumbnail_outline = value
+        self.is_installed = raw.get('is_installed')
+        self.is_archived = raw.get('is_archived')
+        self.is_official = raw.get('is_official')
+        value = raw.get('sticker_format')
+        if value is not None:
+            value = StickerFormat(value)
+        self.sticker_format = value
+        value = raw.get('sticker_type')
+        if value is not None:
+            value = StickerType(value)
+        self.sticker_type = value
+        self.needs_repainting = raw.get('needs_repainting')
+        self.is_allowed_as_chat_emoji_status = raw.get('is_allowed_as_chat_emoji_status')
+        self.is_viewed = raw.get('is_viewed')
+        value = raw.get('stickers')
+        if value is not None:
+            value = [Sticker.from_raw(item0) for item0 in value]
+        self.stickers = value
+        value = raw.get('emojis')
+        if value is not None:
+            value = [Emojis.from_raw(item0) for item0 in value]
+        self.emojis = value
+
+
+@dataclass
+class StickerSetInfo(TDObject):
+    """Represents short information about a sticker set"""
+
+    id: int = None
+    title: str = None
+    name: str = None
+    thumbnail: Thumbnail = None
+    thumbnail_outline: List[ClosedVectorPath] = None
+    is_installed: bool = None
+    is_archived: bool = None
+    is_official: bool = None
+    sticker_format: TDObject = None
+    sticker_type: TDObject = None
+    needs_repainting: bool = None
+    is_allowed_as_chat_emoji_status: bool = None
+    is_viewed: bool = None
+    size: int = None
+    covers: List[Sticker] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.title = raw.get('title')
+        self.name = raw.get('name')
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+        value = raw.get('thumbnail_outline')
+        if value is not None:
+            value = [ClosedVectorPath.from_raw(item0) for item0 in value]
+        self.thumbnail_outline = value
+        self.is_installed = raw.get('is_installed')
+        self.is_archived = raw.get('is_archived')
+        self.is_official = raw.get('is_official')
+        value = raw.get('sticker_format')
+        if value is not None:
+            value = StickerFormat(value)
+        self.sticker_format = value
+        value = raw.get('sticker_type')
+        if value is not None:
+            value = StickerType(value)
+        self.sticker_type = value
+        self.needs_repainting = raw.get('needs_repainting')
+        self.is_allowed_as_chat_emoji_status = raw.get('is_allowed_as_chat_emoji_status')
+        self.is_viewed = raw.get('is_viewed')
+        self.size = raw.get('size')
+        value = raw.get('covers')
+        if value is not None:
+            value = [Sticker.from_raw(item0) for item0 in value]
+        self.covers = value
+
+
+@dataclass
+class StickerSets(TDObject):
+    """Represents a list of sticker sets"""
+
+    total_count: int = None
+    sets: List[StickerSetInfo] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('sets')
+        if value is not None:
+            value = [StickerSetInfo.from_raw(item0) for item0 in value]
+        self.sets = value
+
+
+@dataclass
+class TrendingStickerSets(TDObject):
+    """Represents a list of trending sticker sets"""
+
+    total_count: int = None
+    sets: List[StickerSetInfo] = None
+    is_premium: bool = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('sets')
+        if value is not None:
+            value = [StickerSetInfo.from_raw(item0) for item0 in value]
+        self.sets = value
+        self.is_premium = raw.get('is_premium')
+
+
+@dataclass
+class EmojiCategory(TDObject):
+    """
+    Contains a list of similar emoji to search for in getStickers and
+    searchStickers
+    """
+
+    name: str = None
+    icon: Sticker = None
+    emojis: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+        value = raw.get('icon')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.icon = value
+        self.emojis = raw.get('emojis')
+
+
+@dataclass
+class EmojiCategories(TDObject):
+    """Represents a list of emoji categories"""
+
+    categories: List[EmojiCategory] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('categories')
+        if value is not None:
+            value = [EmojiCategory.from_raw(item0) for item0 in value]
+        self.categories = value
+
+
+@dataclass
+class EmojiCategoryTypeDefault(TDObject):
+    """The category must be used by default"""
+
+
+@dataclass
+class EmojiCategoryTypeEmojiStatus(TDObject):
+    """The category must be used for emoji status selection"""
+
+
+@dataclass
+class EmojiCategoryTypeChatPhoto(TDObject):
+    """The category must be used for chat photo emoji selection"""
+
+
+@dataclass
+class StoryAreaPosition(TDObject):
+    """Describes position of a clickable rectangle area on a story media"""
+
+    x_percentage: float = None
+    y_percentage: float = None
+    width_percentage: float = None
+    height_percentage: float = None
+    rotation_angle: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('x_percentage')
+        if value is not None:
+            value = float(value)
+        self.x_percentage = value
+        value = raw.get('y_percentage')
+        if value is not None:
+            value = float(value)
+        self.y_percentage = value
+        value = raw.get('width_percentage')
+        if value is not None:
+            value = float(value)
+        self.width_percentage = value
+        value = raw.get('height_percentage')
+        if value is not None:
+            value = float(value)
+        self.height_percentage = value
+        value = raw.get('rotation_angle')
+        if value is not None:
+            value = float(value)
+        self.rotation_angle = value
+
+
+@dataclass
+class StoryAreaTypeLocation(TDObject):
+    """An area pointing to a location"""
+
+    location: Location = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+
+
+@dataclass
+class StoryAreaTypeVenue(TDObject):
+    """An area pointing to a venue"""
+
+    venue: Venue = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('venue')
+        if value is not None:
+            value = Venue.from_raw(value)
+        self.venue = value
+
+
+@dataclass
+class StoryAreaTypeSuggestedReaction(TDObject):
+    """
+    An area pointing to a suggested reaction. App needs to show a clickable
+    reaction on the area and call setStoryReaction when the are is clicked
+    """
+
+    reaction_type: TDObject = None
+    total_count: int = None
+    is_dark: bool = None
+    is_flipped: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('reaction_type')
+        if value is not None:
+            value = ReactionType(value)
+        self.reaction_type = value
+        self.total_count = raw.get('total_count')
+        self.is_dark = raw.get('is_dark')
+        self.is_flipped = raw.get('is_flipped')
+
+
+@dataclass
+class StoryAreaTypeMessage(TDObject):
+    """An area pointing to a message"""
+
+    chat_id: int = None
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class StoryArea(TDObject):
+    """Describes a clickable rectangle area on a story media"""
+
+    position: StoryAreaPosition = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('position')
+        if value is not None:
+            value = StoryAreaPosition.from_raw(value)
+        self.position = value
+        value = raw.get('type')
+        if value is not None:
+            value = StoryAreaType(value)
+        self.type = value
+
+
+@dataclass
+class InputStoryAreaTypeLocation(TDObject):
+    """An area pointing to a location"""
+
+    location: Location = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+
+
+@dataclass
+class InputStoryAreaTypeFoundVenue(TDObject):
+    """
+    An area pointing to a venue found by the bot
+    getOption("venue_search_bot_username")
+    """
+
+    query_id: int = None
+    result_id: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('query_id')
+        if value is not None:
+            value = int(value)
+        self.query_id = value
+        self.result_id = raw.get('result_id')
+
+
+@dataclass
+class InputStoryAreaTypePreviousVenue(TDObject):
+    """An area pointing to a venue already added to the story"""
+
+    venue_provider: str = None
+    venue_id: str = None
+
+    def _decode(self, raw: dict):
+        self.venue_provider = raw.get('venue_provider')
+        self.venue_id = raw.get('venue_id')
+
+
+@dataclass
+class InputStoryAreaTypeSuggestedReaction(TDObject):
+    """An area pointing to a suggested reaction"""
+
+    reaction_type: TDObject = None
+    is_dark: bool = None
+    is_flipped: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('reaction_type')
+        if value is not None:
+            value = ReactionType(value)
+        self.reaction_type = value
+        self.is_dark = raw.get('is_dark')
+        self.is_flipped = raw.get('is_flipped')
+
+
+@dataclass
+class InputStoryAreaTypeMessage(TDObject):
+    """An area pointing to a message"""
+
+    chat_id: int = None
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class InputStoryArea(TDObject):
+    """Describes a clickable rectangle area on a story media to be added"""
+
+    position: StoryAreaPosition = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('position')
+        if value is not None:
+            value = StoryAreaPosition.from_raw(value)
+        self.position = value
+        value = raw.get('type')
+        if value is not None:
+            value = InputStoryAreaType(value)
+        self.type = value
+
+
+@dataclass
+class InputStoryAreas(TDObject):
+    """Contains a list of story areas to be added"""
+
+    areas: List[InputStoryArea] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('areas')
+        if value is not None:
+            value = [InputStoryArea.from_raw(item0) for item0 in value]
+        self.areas = value
+
+
+@dataclass
+class StoryVideo(TDObject):
+    """Describes a video file sent in a story"""
+
+    duration: float = None
+    width: int = None
+    height: int = None
+    has_stickers: bool = None
+    is_animation: bool = None
+    minithumbnail: Minithumbnail = None
+    thumbnail: Thumbnail = None
+    preload_prefix_size: int = None
+    video: File = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('duration')
+        if value is not None:
+            value = float(value)
+        self.duration = value
+        self.width = raw.get('width')
+        self.height = raw.get('height')
+        self.has_stickers = raw.get('has_stickers')
+        self.is_animation = raw.get('is_animation')
+        value = raw.get('minithumbnail')
+        if value is not None:
+            value = Minithumbnail.from_raw(value)
+        self.minithumbnail = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+        self.preload_prefix_size = raw.get('preload_prefix_size')
+        value = raw.get('video')
+        if value is not None:
+            value = File.from_raw(value)
+        self.video = value
+
+
+@dataclass
+class StoryContentPhoto(TDObject):
+    """A photo story"""
+
+    photo: Photo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+
+
+@dataclass
+class StoryContentVideo(TDObject):
+    """A video story"""
+
+    video: StoryVideo = None
+    alternative_video: StoryVideo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video')
+        if value is not None:
+            value = StoryVideo.from_raw(value)
+        self.video = value
+        value = raw.get('alternative_video')
+        if value is not None:
+            value = StoryVideo.from_raw(value)
+        self.alternative_video = value
+
+
+@dataclass
+class StoryContentUnsupported(TDObject):
+    """A story content that is not supported in the current TDLib version"""
+
+
+@dataclass
+class InputStoryContentPhoto(TDObject):
+    """A photo story"""
+
+    photo: TDObject = None
+    added_sticker_file_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = InputFile(value)
+        self.photo = value
+        self.added_sticker_file_ids = raw.get('added_sticker_file_ids')
+
+
+@dataclass
+class InputStoryContentVideo(TDObject):
+    """A video story"""
+
+    video: TDObject = None
+    added_sticker_file_ids: List[int] = None
+    duration: float = None
+    is_animation: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video')
+        if value is not None:
+            value = InputFile(value)
+        self.video = value
+        self.added_sticker_file_ids = raw.get('added_sticker_file_ids')
+        value = raw.get('duration')
+        if value is not None:
+            value = float(value)
+        self.duration = value
+        self.is_animation = raw.get('is_animation')
+
+
+@dataclass
+class StoryListMain(TDObject):
+    """The list of stories, shown in the main chat list and folder chat lists"""
+
+
+@dataclass
+class StoryListArchive(TDObject):
+    """The list of stories, shown in the Arvhive chat list"""
+
+
+@dataclass
+class StoryOriginPublicStory(TDObject):
+    """The original story was a public story with known sender"""
+
+    chat_id: int = None
+    story_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.story_id = raw.get('story_id')
+
+
+@dataclass
+class StoryOriginHiddenUser(TDObject):
+    """The original story was sent by an unknown user"""
+
+    sender_name: str = None
+
+    def _decode(self, raw: dict):
+        self.sender_name = raw.get('sender_name')
+
+
+@dataclass
+class StoryRepostInfo(TDObject):
+    """Contains information about original story that was reposted"""
+
+    origin: TDObject = None
+    is_content_modified: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('origin')
+        if value is not None:
+            value = StoryOrigin(value)
+        self.origin = value
+        self.is_content_modified = raw.get('is_content_modified')
+
+
+@dataclass
+class StoryInteractionInfo(TDObject):
+    """Contains information about interactions with a story"""
+
+    view_count: int = None
+    forward_count: int = None
+    reaction_count: int = None
+    recent_viewer_user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.view_count = raw.get('view_count')
+        self.forward_count = raw.get('forward_count')
+        self.reaction_count = raw.get('reaction_count')
+        self.recent_viewer_user_ids = raw.get('recent_viewer_user_ids')
+
+
+@dataclass
+class Story(TDObject):
+    """Represents a story"""
+
+    id: int = None
+    sender_chat_id: int = None
+    sender_id: TDObject = None
+    date: int = None
+    is_being_sent: bool = None
+    is_being_edited: bool = None
+    is_edited: bool = None
+    is_pinned: bool = None
+    is_visible_only_for_self: bool = None
+    can_be_deleted: bool = None
+    can_be_edited: bool = None
+    can_be_forwarded: bool = None
+    can_be_replied: bool = None
+    can_toggle_is_pinned: bool = None
+    can_get_statistics: bool = None
+    can_get_interactions: bool = None
+    has_expired_viewers: bool = None
+    repost_info: StoryRepostInfo = None
+    interaction_info: StoryInteractionInfo = None
+    chosen_reaction_type: TDObject = None
+    privacy_settings: TDObject = None
+    content: TDObject = None
+    areas: List[StoryArea] = None
+    caption: FormattedText = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.sender_chat_id = raw.get('sender_chat_id')
+        value = raw.get('sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.sender_id = value
+        self.date = raw.get('date')
+        self.is_being_sent = raw.get('is_being_sent')
+        self.is_being_edited = raw.get('is_being_edited')
+        self.is_edited = raw.get('is_edited')
+        self.is_pinned = raw.get('is_pinned')
+        self.is_visible_only_for_self = raw.get('is_visible_only_for_self')
+        self.can_be_deleted = raw.get('can_be_deleted')
+        self.can_be_edited = raw.get('can_be_edited')
+        self.can_be_forwarded = raw.get('can_be_forwarded')
+        self.can_be_replied = raw.get('can_be_replied')
+        self.can_toggle_is_pinned = raw.get('can_toggle_is_pinned')
+        self.can_get_statistics = raw.get('can_get_statistics')
+        self.can_get_interactions = raw.get('can_get_interactions')
+        self.has_expired_viewers = raw.get('has_expired_viewers')
+        value = raw.get('repost_info')
+        if value is not None:
+            value = StoryRepostInfo.from_raw(value)
+        self.repost_info = value
+        value = raw.get('interaction_info')
+        if value is not None:
+            value = StoryInteractionInfo.from_raw(value)
+        self.interaction_info = value
+        value = raw.get('chosen_reaction_type')
+        if value is not None:
+            value = ReactionType(value)
+        self.chosen_reaction_type = value
+        value = raw.get('privacy_settings')
+        if value is not None:
+            value = StoryPrivacySettings(value)
+        self.privacy_settings = value
+        value = raw.get('content')
+        if value is not None:
+            value = StoryContent(value)
+        self.content = value
+        value = raw.get('areas')
+        if value is not None:
+            value = [StoryArea.from_raw(item0) for item0 in value]
+        self.areas = value
+        value = raw.get('caption')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.caption = value
+
+
+@dataclass
+class Stories(TDObject):
+    """Represents a list of stories"""
+
+    total_count: int = None
+    stories: List[Story] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('stories')
+        if value is not None:
+            value = [Story.from_raw(item0) for item0 in value]
+        self.stories = value
+
+
+@dataclass
+class StoryFullId(TDObject):
+    """Contains identifier of a story along with identifier of its sender"""
+
+    sender_chat_id: int = None
+    story_id: int = None
+
+    def _decode(self, raw: dict):
+        self.sender_chat_id = raw.get('sender_chat_id')
+        self.story_id = raw.get('story_id')
+
+
+@dataclass
+class StoryInfo(TDObject):
+    """Contains basic information about a story"""
+
+    story_id: int = None
+    date: int = None
+    is_for_close_friends: bool = None
+
+    def _decode(self, raw: dict):
+        self.story_id = raw.get('story_id')
+        self.date = raw.get('date')
+        self.is_for_close_friends = raw.get('is_for_close_friends')
+
+
+@dataclass
+class ChatActiveStories(TDObject):
+    """Describes active stories posted by a chat"""
+
+    chat_id: int = None
+    list: TDObject = None
+    order: int = None
+    max_read_story_id: int = None
+    stories: List[StoryInfo] = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('list')
+        if value is not None:
+            value = StoryList(value)
+        self.list = value
+        self.order = raw.get('order')
+        self.max_read_story_id = raw.get('max_read_story_id')
+        value = raw.get('stories')
+        if value is not None:
+            value = [StoryInfo.from_raw(item0) for item0 in value]
+        self.stories = value
+
+
+@dataclass
+class StoryInteractionTypeView(TDObject):
+    """A view of the story"""
+
+    chosen_reaction_type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chosen_reaction_type')
+        if value is not None:
+            value = ReactionType(value)
+        self.chosen_reaction_type = value
+
+
+@dataclass
+class StoryInteractionTypeForward(TDObject):
+    """A forward of the story as a message"""
+
+    message: Message = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+
+
+@dataclass
+class StoryInteractionTypeRepost(TDObject):
+    """A repost of the story as a story"""
+
+    story: Story = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('story')
+        if value is not None:
+            value = Story.from_raw(value)
+        self.story = value
+
+
+@dataclass
+class StoryInteraction(TDObject):
+    """Represents interaction with a story"""
+
+    actor_id: TDObject = None
+    interaction_date: int = None
+    block_list: TDObject = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('actor_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.actor_id = value
+        self.interaction_date = raw.get('interaction_date')
+        value = raw.get('block_list')
+        if value is not None:
+            value = BlockList(value)
+        self.block_list = value
+        value = raw.get('type')
+        if value is not None:
+            value = StoryInteractionType(value)
+        self.type = value
+
+
+@dataclass
+class StoryInteractions(TDObject):
+    """Represents a list of interactions with a story"""
+
+    total_count: int = None
+    total_forward_count: int = None
+    total_reaction_count: int = None
+    interactions: List[StoryInteraction] = None
+    next_offset: str = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        self.total_forward_count = raw.get('total_forward_count')
+        self.total_reaction_count = raw.get('total_reaction_count')
+        value = raw.get('interactions')
+        if value is not None:
+            value = [StoryInteraction.from_raw(item0) for item0 in value]
+        self.interactions = value
+        self.next_offset = raw.get('next_offset')
+
+
+@dataclass
+class QuickReplyMessage(TDObject):
+    """Describes a message that can be used for quick reply"""
+
+    id: int = None
+    sending_state: TDObject = None
+    can_be_edited: bool = None
+    reply_to_message_id: int = None
+    via_bot_user_id: int = None
+    media_album_id: int = None
+    content: TDObject = None
+    reply_markup: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('sending_state')
+        if value is not None:
+            value = MessageSendingState(value)
+        self.sending_state = value
+        self.can_be_edited = raw.get('can_be_edited')
+        self.reply_to_message_id = raw.get('reply_to_message_id')
+        self.via_bot_user_id = raw.get('via_bot_user_id')
+        value = raw.get('media_album_id')
+        if value is not None:
+            value = int(value)
+        self.media_album_id = value
+        value = raw.get('content')
+        if value is not None:
+            value = MessageContent(value)
+        self.content = value
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+
+
+@dataclass
+class QuickReplyShortcut(TDObject):
+    """Describes a shortcut that can be used for a quick reply"""
+
+    id: int = None
+    name: str = None
+    first_message: QuickReplyMessage = None
+    message_count: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.name = raw.get('name')
+        value = raw.get('first_message')
+        if value is not None:
+            value = QuickReplyMessage.from_raw(value)
+        self.first_message = value
+        self.message_count = raw.get('message_count')
+
+
+@dataclass
+class PublicForwardMessage(TDObject):
+    """Contains a public forward as a message"""
+
+    message: Message = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+
+
+@dataclass
+class PublicForwardStory(TDObject):
+    """Contains a public repost to a story"""
+
+    story: Story = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('story')
+        if value is not None:
+            value = Story.from_raw(value)
+        self.story = value
+
+
+@dataclass
+class PublicForwards(TDObject):
+    """
+    Represents a list of public forwards and reposts as a story of a message or a
+    story
+    """
+
+    total_count: int = None
+    forwards: List[TDObject] = None
+    next_offset: str = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('forwards')
+        if value is not None:
+            value = [PublicForward(item0) for item0 in value]
+        self.forwards = value
+        self.next_offset = raw.get('next_offset')
+
+
+@dataclass
+class ChatBoostLevelFeatures(TDObject):
+    """Contains a list of features available on a specific chat boost level"""
+
+    level: int = None
+    story_per_day_count: int = None
+    custom_emoji_reaction_count: int = None
+    title_color_count: int = None
+    profile_accent_color_count: int = None
+    can_set_profile_background_custom_emoji: bool = None
+    accent_color_count: int = None
+    can_set_background_custom_emoji: bool = None
+    can_set_emoji_status: bool = None
+    chat_theme_background_count: int = None
+    can_set_custom_background: bool = None
+    can_set_custom_emoji_sticker_set: bool = None
+    can_recognize_speech: bool = None
+
+    def _decode(self, raw: dict):
+        self.level = raw.get('level')
+        self.story_per_day_count = raw.get('story_per_day_count')
+        self.custom_emoji_reaction_count = raw.get('custom_emoji_reaction_count')
+        self.title_color_count = raw.get('title_color_count')
+        self.profile_accent_color_count = raw.get('profile_accent_color_count')
+        self.can_set_profile_background_custom_emoji = raw.get('can_set_profile_background_custom_emoji')
+        self.accent_color_count = raw.get('accent_color_count')
+        self.can_set_background_custom_emoji = raw.get('can_set_background_custom_emoji')
+        self.can_set_emoji_status = raw.get('can_set_emoji_status')
+        self.chat_theme_background_count = raw.get('chat_theme_background_count')
+        self.can_set_custom_background = raw.get('can_set_custom_background')
+        self.can_set_custom_emoji_sticker_set = raw.get('can_set_custom_emoji_sticker_set')
+        self.can_recognize_speech = raw.get('can_recognize_speech')
+
+
+@dataclass
+class ChatBoostFeatures(TDObject):
+    """Contains a list of features available on the first chat boost levels"""
+
+    features: List[ChatBoostLevelFeatures] = None
+    min_profile_background_custom_emoji_boost_level: int = None
+    min_background_custom_emoji_boost_level: int = None
+    min_emoji_status_boost_level: int = None
+    min_chat_theme_background_boost_level: int = None
+    min_custom_background_boost_level: int = None
+    min_custom_emoji_sticker_set_boost_level: int = None
+    min_speech_recognition_boost_level: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('features')
+        if value is not None:
+            value = [ChatBoostLevelFeatures.from_raw(item0) for item0 in value]
+        self.features = value
+        self.min_profile_background_custom_emoji_boost_level = raw.get('min_profile_background_custom_emoji_boost_level')
+        self.min_background_custom_emoji_boost_level = raw.get('min_background_custom_emoji_boost_level')
+        self.min_emoji_status_boost_level = raw.get('min_emoji_status_boost_level')
+        self.min_chat_theme_background_boost_level = raw.get('min_chat_theme_background_boost_level')
+        self.min_custom_background_boost_level = raw.get('min_custom_background_boost_level')
+        self.min_custom_emoji_sticker_set_boost_level = raw.get('min_custom_emoji_sticker_set_boost_level')
+        self.min_speech_recognition_boost_level = raw.get('min_speech_recognition_boost_level')
+
+
+@dataclass
+class ChatBoostSourceGiftCode(TDObject):
+    """The chat created a Telegram Premium gift code for a user"""
+
+    user_id: int = None
+    gift_code: str = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.gift_code = raw.get('gift_code')
+
+
+@dataclass
+class ChatBoostSourceGiveaway(TDObject):
+    """The chat created a Telegram Premium giveaway"""
+
+    user_id: int = None
+    gift_code: str = None
+    giveaway_message_id: int = None
+    is_unclaimed: bool = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.gift_code = raw.get('gift_code')
+        self.giveaway_message_id = raw.get('giveaway_message_id')
+        self.is_unclaimed = raw.get('is_unclaimed')
+
+
+@dataclass
+class ChatBoostSourcePremium(TDObject):
+    """
+    A user with Telegram Premium subscription or gifted Telegram Premium boosted
+    the chat
+    """
+
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class PrepaidPremiumGiveaway(TDObject):
+    """Describes a prepaid Telegram Premium giveaway"""
+
+    id: int = None
+    winner_count: int = None
+    month_count: int = None
+    payment_date: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.winner_count = raw.get('winner_count')
+        self.month_count = raw.get('month_count')
+        self.payment_date = raw.get('payment_date')
+
+
+@dataclass
+class ChatBoostStatus(TDObject):
+    """Describes current boost status of a chat"""
+
+    boost_url: str = None
+    applied_slot_ids: List[int] = None
+    level: int = None
+    gift_code_boost_count: int = None
+    boost_count: int = None
+    current_level_boost_count: int = None
+    next_level_boost_count: int = None
+    premium_member_count: int = None
+    premium_member_percentage: float = None
+    prepaid_giveaways: List[PrepaidPremiumGiveaway] = None
+
+    def _decode(self, raw: dict):
+        self.boost_url = raw.get('boost_url')
+        self.applied_slot_ids = raw.get('applied_slot_ids')
+        self.level = raw.get('level')
+        self.gift_code_boost_count = raw.get('gift_code_boost_count')
+        self.boost_count = raw.get('boost_count')
+        self.current_level_boost_count = raw.get('current_level_boost_count')
+        self.next_level_boost_count = raw.get('next_level_boost_count')
+        self.premium_member_count = raw.get('premium_member_count')
+        value = raw.get('premium_member_percentage')
+        if value is not None:
+            value = float(value)
+        self.premium_member_percentage = value
+        value = raw.get('prepaid_giveaways')
+        if value is not None:
+            value = [PrepaidPremiumGiveaway.from_raw(item0) for item0 in value]
+        self.prepaid_giveaways = value
+
+
+@dataclass
+class ChatBoost(TDObject):
+    """Describes a boost applied to a chat"""
+
+    id: str = None
+    count: int = None
+    source: TDObject = None
+    start_date: int = None
+    expiration_date: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.count = raw.get('count')
+        value = raw.get('source')
+        if value is not None:
+            value = ChatBoostSource(value)
+        self.source = value
+        self.start_date = raw.get('start_date')
+        self.expiration_date = raw.get('expiration_date')
+
+
+@dataclass
+class FoundChatBoosts(TDObject):
+    """Contains a list of boosts applied to a chat"""
+
+    total_count: int = None
+    boosts: List[ChatBoost] = None
+    next_offset: str = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('boosts')
+        if value is not None:
+            value = [ChatBoost.from_raw(item0) for item0 in value]
+        self.boosts = value
+        self.next_offset = raw.get('next_offset')
+
+
+@dataclass
+class ChatBoostSlot(TDObject):
+    """Describes a slot for chat boost"""
+
+    slot_id: int = None
+    currently_boosted_chat_id: int = None
+    start_date: int = None
+    expiration_date: int = None
+    cooldown_until_date: int = None
+
+    def _decode(self, raw: dict):
+        self.slot_id = raw.get('slot_id')
+        self.currently_boosted_chat_id = raw.get('currently_boosted_chat_id')
+        self.start_date = raw.get('start_date')
+        self.expiration_date = raw.get('expiration_date')
+        self.cooldown_until_date = raw.get('cooldown_until_date')
+
+
+@dataclass
+class ChatBoostSlots(TDObject):
+    """Contains a list of chat boost slots"""
+
+    slots: List[ChatBoostSlot] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('slots')
+        if value is not None:
+            value = [ChatBoostSlot.from_raw(item0) for item0 in value]
+        self.slots = value
+
+
+@dataclass
+class CallDiscardReasonEmpty(TDObject):
+    """The call wasn't discarded, or the reason is unknown"""
+
+
+@dataclass
+class CallDiscardReasonMissed(TDObject):
+    """
+    The call was ended before the conversation started. It was canceled by the
+    caller or missed by the other party
+    """
+
+
+@dataclass
+class CallDiscardReasonDeclined(TDObject):
+    """
+    The call was ended before the conversation started. It was declined by the
+    other party
+    """
+
+
+@dataclass
+class CallDiscardReasonDisconnected(TDObject):
+    """The call was ended during the conversation because the users were disconnected"""
+
+
+@dataclass
+class CallDiscardReasonHungUp(TDObject):
+    """The call was ended because one of the parties hung up"""
+
+
+@dataclass
+class CallProtocol(TDObject):
+    """Specifies the supported call protocols"""
+
+    udp_p2p: bool = None
+    udp_reflector: bool = None
+    min_layer: int = None
+    max_layer: int = None
+    library_versions: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.udp_p2p = raw.get('udp_p2p')
+        self.udp_reflector = raw.get('udp_reflector')
+        self.min_layer = raw.get('min_layer')
+        self.max_layer = raw.get('max_layer')
+        self.library_versions = raw.get('library_versions')
+
+
+@dataclass
+class CallServerTypeTelegramReflector(TDObject):
+    """A Telegram call reflector"""
+
+    peer_tag: str = None
+    is_tcp: bool = None
+
+    def _decode(self, raw: dict):
+        self.peer_tag = raw.get('peer_tag')
+        self.is_tcp = raw.get('is_tcp')
+
+
+@dataclass
+class CallServerTypeWebrtc(TDObject):
+    """A WebRTC server"""
+
+    username: str = None
+    password: str = None
+    supports_turn: bool = None
+    supports_stun: bool = None
+
+    def _decode(self, raw: dict):
+        self.username = raw.get('username')
+        self.password = raw.get('password')
+        self.supports_turn = raw.get('supports_turn')
+        self.supports_stun = raw.get('supports_stun')
+
+
+@dataclass
+class CallServer(TDObject):
+    """Describes a server for relaying call data"""
+
+    id: int = None
+    ip_address: str = None
+    ipv6_address: str = None
+    port: int = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.ip_address = raw.get('ip_address')
+        self.ipv6_address = raw.get('ipv6_address')
+        self.port = raw.get('port')
+        value = raw.get('type')
+        if value is not None:
+            value = CallServerType(value)
+        self.type = value
+
+
+@dataclass
+class CallId(TDObject):
+    """Contains the call identifier"""
+
+    id: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+
+
+@dataclass
+class GroupCallId(TDObject):
+    """Contains the group call identifier"""
+
+    id: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+
+
+@dataclass
+class CallStatePending(TDObject):
+    """The call is pending, waiting to be accepted by a user"""
+
+    is_created: bool = None
+    is_received: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_created = raw.get('is_created')
+        self.is_received = raw.get('is_received')
+
+
+@dataclass
+class CallStateExchangingKeys(TDObject):
+    """The call has been answered and encryption keys are being exchanged"""
+
+
+@dataclass
+class CallStateReady(TDObject):
+    """The call is ready to use"""
+
+    protocol: CallProtocol = None
+    servers: List[CallServer] = None
+    config: str = None
+    encryption_key: str = None
+    emojis: List[str] = None
+    allow_p2p: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('protocol')
+        if value is not None:
+            value = CallProtocol.from_raw(value)
+        self.protocol = value
+        value = raw.get('servers')
+        if value is not None:
+            value = [CallServer.from_raw(item0) for item0 in value]
+        self.servers = value
+        self.config = raw.get('config')
+        self.encryption_key = raw.get('encryption_key')
+        self.emojis = raw.get('emojis')
+        self.allow_p2p = raw.get('allow_p2p')
+
+
+@dataclass
+class CallStateHangingUp(TDObject):
+    """The call is hanging up after discardCall has been called"""
+
+
+@dataclass
+class CallStateDiscarded(TDObject):
+    """The call has ended successfully"""
+
+    reason: TDObject = None
+    need_rating: bool = None
+    need_debug_information: bool = None
+    need_log: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('reason')
+        if value is not None:
+            value = CallDiscardReason(value)
+        self.reason = value
+        self.need_rating = raw.get('need_rating')
+        self.need_debug_information = raw.get('need_debug_information')
+        self.need_log = raw.get('need_log')
+
+
+@dataclass
+class CallStateError(TDObject):
+    """The call has ended with an error"""
+
+    error: Error = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('error')
+        if value is not None:
+            value = Error.from_raw(value)
+        self.error = value
+
+
+@dataclass
+class GroupCallVideoQualityThumbnail(TDObject):
+    """The worst available video quality"""
+
+
+@dataclass
+class GroupCallVideoQualityMedium(TDObject):
+    """The medium video quality"""
+
+
+@dataclass
+class GroupCallVideoQualityFull(TDObject):
+    """The best available video quality"""
+
+
+@dataclass
+class GroupCallStream(TDObject):
+    """Describes an available stream in a group call"""
+
+    channel_id: int = None
+    scale: int = None
+    time_offset: int = None
+
+    def _decode(self, raw: dict):
+        self.channel_id = raw.get('channel_id')
+        self.scale = raw.get('scale')
+        self.time_offset = raw.get('time_offset')
+
+
+@dataclass
+class GroupCallStreams(TDObject):
+    """Represents a list of group call streams"""
+
+    streams: List[GroupCallStream] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('streams')
+        if value is not None:
+            value = [GroupCallStream.from_raw(item0) for item0 in value]
+        self.streams = value
+
+
+@dataclass
+class RtmpUrl(TDObject):
+    """Represents an RTMP URL"""
+
+    url: str = None
+    stream_key: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.stream_key = raw.get('stream_key')
+
+
+@dataclass
+class GroupCallRecentSpeaker(TDObject):
+    """Describes a recently speaking participant in a group call"""
+
+    participant_id: TDObject = None
+    is_speaking: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('participant_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.participant_id = value
+        self.is_speaking = raw.get('is_speaking')
+
+
+@dataclass
+class GroupCall(TDObject):
+    """Describes a group call"""
+
+    id: int = None
+    title: str = None
+    scheduled_start_date: int = None
+    enabled_start_notification: bool = None
+    is_active: bool = None
+    is_rtmp_stream: bool = None
+    is_joined: bool = None
+    need_rejoin: bool = None
+    can_be_managed: bool = None
+    participant_count: int = None
+    has_hidden_listeners: bool = None
+    loaded_all_participants: bool = None
+    recent_speakers: List[GroupCallRecentSpeaker] = None
+    is_my_video_enabled: bool = None
+    is_my_video_paused: bool = None
+    can_enable_video: bool = None
+    mute_new_participants: bool = None
+    can_toggle_mute_new_participants: bool = None
+    record_duration: int = None
+    is_video_recorded: bool = None
+    duration: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        self.scheduled_start_date = raw.get('scheduled_start_date')
+        self.enabled_start_notification = raw.get('enabled_start_notification')
+        self.is_active = raw.get('is_active')
+        self.is_rtmp_stream = raw.get('is_rtmp_stream')
+        self.is_joined = raw.get('is_joined')
+        self.need_rejoin = raw.get('need_rejoin')
+        self.can_be_managed = raw.get('can_be_managed')
+        self.participant_count = raw.get('participant_count')
+        self.has_hidden_listeners = raw.get('has_hidden_listeners')
+        self.loaded_all_participants = raw.get('loaded_all_participants')
+        value = raw.get('recent_speakers')
+        if value is not None:
+            value = [GroupCallRecentSpeaker.from_raw(item0) for item0 in value]
+        self.recent_speakers = value
+        self.is_my_video_enabled = raw.get('is_my_video_enabled')
+        self.is_my_video_paused = raw.get('is_my_video_paused')
+        self.can_enable_video = raw.get('can_enable_video')
+        self.mute_new_participants = raw.get('mute_new_participants')
+        self.can_toggle_mute_new_participants = raw.get('can_toggle_mute_new_participants')
+        self.record_duration = raw.get('record_duration')
+        self.is_video_recorded = raw.get('is_video_recorded')
+        self.duration = raw.get('duration')
+
+
+@dataclass
+class GroupCallVideoSourceGroup(TDObject):
+    """Describes a group of video synchronization source identifiers"""
+
+    semantics: str = None
+    source_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.semantics = raw.get('semantics')
+        self.source_ids = raw.get('source_ids')
+
+
+@dataclass
+class GroupCallParticipantVideoInfo(TDObject):
+    """Contains information about a group call participant's video channel"""
+
+    source_groups: List[GroupCallVideoSourceGroup] = None
+    endpoint_id: str = None
+    is_paused: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('source_groups')
+        if value is not None:
+            value = [GroupCallVideoSourceGroup.from_raw(item0) for item0 in value]
+        self.source_groups = value
+        self.endpoint_id = raw.get('endpoint_id')
+        self.is_paused = raw.get('is_paused')
+
+
+@dataclass
+class GroupCallParticipant(TDObject):
+    """Represents a group call participant"""
+
+    participant_id: TDObject = None
+    audio_source_id: int = None
+    screen_sharing_audio_source_id: int = None
+    video_info: GroupCallParticipantVideoInfo = None
+    screen_sharing_video_info: GroupCallParticipantVideoInfo = None
+    bio: str = None
+    is_current_user: bool = None
+    is_speaking: bool = None
+    is_hand_raised: bool = None
+    can_be_muted_for_all_users: bool = None
+    can_be_unmuted_for_all_users: bool = None
+    can_be_muted_for_current_user: bool = None
+    can_be_unmuted_for_current_user: bool = None
+    is_muted_for_all_users: bool = None
+    is_muted_for_current_user: bool = None
+    can_unmute_self: bool = None
+    volume_level: int = None
+    order: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('participant_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.participant_id = value
+        self.audio_source_id = raw.get('audio_source_id')
+        self.screen_sharing_audio_source_id = raw.get('screen_sharing_audio_source_id')
+        value = raw.get('video_info')
+        if value is not None:
+            value = GroupCallParticipantVideoInfo.from_raw(value)
+        self.video_info = value
+        value = raw.get('screen_sharing_video_info')
+        if value is not None:
+            value = GroupCallParticipantVideoInfo.from_raw(value)
+        self.screen_sharing_video_info = value
+        self.bio = raw.get('bio')
+        self.is_current_user = raw.get('is_current_user')
+        self.is_speaking = raw.get('is_speaking')
+        self.is_hand_raised = raw.get('is_hand_raised')
+        self.can_be_muted_for_all_users = raw.get('can_be_muted_for_all_users')
+        self.can_be_unmuted_for_all_users = raw.get('can_be_unmuted_for_all_users')
+        self.can_be_muted_for_current_user = raw.get('can_be_muted_for_current_user')
+        self.can_be_unmuted_for_current_user = raw.get('can_be_unmuted_for_current_user')
+        self.is_muted_for_all_users = raw.get('is_muted_for_all_users')
+        self.is_muted_for_current_user = raw.get('is_muted_for_current_user')
+        self.can_unmute_self = raw.get('can_unmute_self')
+        self.volume_level = raw.get('volume_level')
+        self.order = raw.get('order')
+
+
+@dataclass
+class CallProblemEcho(TDObject):
+    """The user heard their own voice"""
+
+
+@dataclass
+class CallProblemNoise(TDObject):
+    """The user heard background noise"""
+
+
+@dataclass
+class CallProblemInterruptions(TDObject):
+    """The other side kept disappearing"""
+
+
+@dataclass
+class CallProblemDistortedSpeech(TDObject):
+    """The speech was distorted"""
+
+
+@dataclass
+class CallProblemSilentLocal(TDObject):
+    """The user couldn't hear the other side"""
+
+
+@dataclass
+class CallProblemSilentRemote(TDObject):
+    """The other side couldn't hear the user"""
+
+
+@dataclass
+class CallProblemDropped(TDObject):
+    """The call ended unexpectedly"""
+
+
+@dataclass
+class CallProblemDistortedVideo(TDObject):
+    """The video was distorted"""
+
+
+@dataclass
+class CallProblemPixelatedVideo(TDObject):
+    """The video was pixelated"""
+
+
+@dataclass
+class Call(TDObject):
+    """Describes a call"""
+
+    id: int = None
+    user_id: int = None
+    is_outgoing: bool = None
+    is_video: bool = None
+    state: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.user_id = raw.get('user_id')
+        self.is_outgoing = raw.get('is_outgoing')
+        self.is_video = raw.get('is_video')
+        value = raw.get('state')
+        if value is not None:
+            value = CallState(value)
+        self.state = value
+
+
+@dataclass
+class FirebaseAuthenticationSettingsAndroid(TDObject):
+    """Settings for Firebase Authentication in the official Android application"""
+
+
+@dataclass
+class FirebaseAuthenticationSettingsIos(TDObject):
+    """Settings for Firebase Authentication in the official iOS application"""
+
+    device_token: str = None
+    is_app_sandbox: bool = None
+
+    def _decode(self, raw: dict):
+        self.device_token = raw.get('device_token')
+        self.is_app_sandbox = raw.get('is_app_sandbox')
+
+
+@dataclass
+class PhoneNumberAuthenticationSettings(TDObject):
+    """Contains settings for the authentication of the user's phone number"""
+
+    allow_flash_call: bool = None
+    allow_missed_call: bool = None
+    is_current_phone_number: bool = None
+    allow_sms_retriever_api: bool = None
+    firebase_authentication_settings: TDObject = None
+    authentication_tokens: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.allow_flash_call = raw.get('allow_flash_call')
+        self.allow_missed_call = raw.get('allow_missed_call')
+        self.is_current_phone_number = raw.get('is_current_phone_number')
+        self.allow_sms_retriever_api = raw.get('allow_sms_retriever_api')
+        value = raw.get('firebase_authentication_settings')
+        if value is not None:
+            value = FirebaseAuthenticationSettings(value)
+        self.firebase_authentication_settings = value
+        self.authentication_tokens = raw.get('authentication_tokens')
+
+
+@dataclass
+class AddedReaction(TDObject):
+    """Represents a reaction applied to a message"""
+
+    type: TDObject = None
+    sender_id: TDObject = None
+    is_outgoing: bool = None
+    date: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = ReactionType(value)
+        self.type = value
+        value = raw.get('sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.sender_id = value
+        self.is_outgoing = raw.get('is_outgoing')
+        self.date = raw.get('date')
+
+
+@dataclass
+class AddedReactions(TDObject):
+    """Represents a list of reactions added to a message"""
+
+    total_count: int = None
+    reactions: List[AddedReaction] = None
+    next_offset: str = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        value = raw.get('reactions')
+        if value is not None:
+            value = [AddedReaction.from_raw(item0) for item0 in value]
+        self.reactions = value
+        self.next_offset = raw.get('next_offset')
+
+
+@dataclass
+class AvailableReaction(TDObject):
+    """Represents an available reaction"""
+
+    type: TDObject = None
+    needs_premium: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = ReactionType(value)
+        self.type = value
+        self.needs_premium = raw.get('needs_premium')
+
+
+@dataclass
+class AvailableReactions(TDObject):
+    """Represents a list of reactions that can be added to a message"""
+
+    top_reactions: List[AvailableReaction] = None
+    recent_reactions: List[AvailableReaction] = None
+    popular_reactions: List[AvailableReaction] = None
+    allow_custom_emoji: bool = None
+    are_tags: bool = None
+    unavailability_reason: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('top_reactions')
+        if value is not None:
+            value = [AvailableReaction.from_raw(item0) for item0 in value]
+        self.top_reactions = value
+        value = raw.get('recent_reactions')
+        if value is not None:
+            value = [AvailableReaction.from_raw(item0) for item0 in value]
+        self.recent_reactions = value
+        value = raw.get('popular_reactions')
+        if value is not None:
+            value = [AvailableReaction.from_raw(item0) for item0 in value]
+        self.popular_reactions = value
+        self.allow_custom_emoji = raw.get('allow_custom_emoji')
+        self.are_tags = raw.get('are_tags')
+        value = raw.get('unavailability_reason')
+        if value is not None:
+            value = ReactionUnavailabilityReason(value)
+        self.unavailability_reason = value
+
+
+@dataclass
+class EmojiReaction(TDObject):
+    """Contains information about an emoji reaction"""
+
+    emoji: str = None
+    title: str = None
+    is_active: bool = None
+    static_icon: Sticker = None
+    appear_animation: Sticker = None
+    select_animation: Sticker = None
+    activate_animation: Sticker = None
+    effect_animation: Sticker = None
+    around_animation: Sticker = None
+    center_animation: Sticker = None
+
+    def _decode(self, raw: dict):
+        self.emoji = raw.get('emoji')
+        self.title = raw.get('title')
+        self.is_active = raw.get('is_active')
+        value = raw.get('static_icon')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.static_icon = value
+        value = raw.get('appear_animation')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.appear_animation = value
+        value = raw.get('select_animation')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.select_animation = value
+        value = raw.get('activate_animation')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.activate_animation = value
+        value = raw.get('effect_animation')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.effect_animation = value
+        value = raw.get('around_animation')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.around_animation = value
+        value = raw.get('center_animation')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.center_animation = value
+
+
+@dataclass
+class ReactionUnavailabilityReasonAnonymousAdministrator(TDObject):
+    """
+    The user is an anonymous administrator in the supergroup, but isn't a creator
+    of it, so they can't vote on behalf of the supergroup
+    """
+
+
+@dataclass
+class ReactionUnavailabilityReasonGuest(TDObject):
+    """
+    The user isn't a member of the supergroup and can't send messages and
+    reactions there without joining
+    """
+
+
+@dataclass
+class Animations(TDObject):
+    """Represents a list of animations"""
+
+    animations: List[Animation] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('animations')
+        if value is not None:
+            value = [Animation.from_raw(item0) for item0 in value]
+        self.animations = value
+
+
+@dataclass
+class DiceStickersRegular(TDObject):
+    """A regular animated sticker"""
+
+    sticker: Sticker = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+
+
+@dataclass
+class DiceStickersSlotMachine(TDObject):
+    """Animated stickers to be combined into a slot machine"""
+
+    background: Sticker = None
+    lever: Sticker = None
+    left_reel: Sticker = None
+    center_reel: Sticker = None
+    right_reel: Sticker = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('background')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.background = value
+        value = raw.get('lever')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.lever = value
+        value = raw.get('left_reel')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.left_reel = value
+        value = raw.get('center_reel')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.center_reel = value
+        value = raw.get('right_reel')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.right_reel = value
+
+
+@dataclass
+class ImportedContacts(TDObject):
+    """Represents the result of an importContacts request"""
+
+    user_ids: List[int] = None
+    importer_count: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.user_ids = raw.get('user_ids')
+        self.importer_count = raw.get('importer_count')
+
+
+@dataclass
+class SpeechRecognitionResultPending(TDObject):
+    """The speech recognition is ongoing"""
+
+    partial_text: str = None
+
+    def _decode(self, raw: dict):
+        self.partial_text = raw.get('partial_text')
+
+
+@dataclass
+class SpeechRecognitionResultText(TDObject):
+    """The speech recognition successfully finished"""
+
+    text: str = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+
+
+@dataclass
+class SpeechRecognitionResultError(TDObject):
+    """The speech recognition failed"""
+
+    error: Error = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('error')
+        if value is not None:
+            value = Error.from_raw(value)
+        self.error = value
+
+
+@dataclass
+class AttachmentMenuBotColor(TDObject):
+    """Describes a color to highlight a bot added to attachment menu"""
+
+    light_color: int = None
+    dark_color: int = None
+
+    def _decode(self, raw: dict):
+        self.light_color = raw.get('light_color')
+        self.dark_color = raw.get('dark_color')
+
+
+@dataclass
+class AttachmentMenuBot(TDObject):
+    """Represents a bot, which can be added to attachment or side menu"""
+
+    bot_user_id: int = None
+    supports_self_chat: bool = None
+    supports_user_chats: bool = None
+    supports_bot_chats: bool = None
+    supports_group_chats: bool = None
+    supports_channel_chats: bool = None
+    request_write_access: bool = None
+    is_added: bool = None
+    show_in_attachment_menu: bool = None
+    show_in_side_menu: bool = None
+    show_disclaimer_in_side_menu: bool = None
+    name: str = None
+    name_color: AttachmentMenuBotColor = None
+    default_icon: File = None
+    ios_static_icon: File = None
+    ios_animated_icon: File = None
+    ios_side_menu_icon: File = None
+    android_icon: File = None
+    android_side_menu_icon: File = None
+    macos_icon: File = None
+    macos_side_menu_icon: File = None
+    icon_color: AttachmentMenuBotColor = None
+    web_app_placeholder: File = None
+
+    def _decode(self, raw: dict):
+        self.bot_user_id = raw.get('bot_user_id')
+        self.supports_self_chat = raw.get('supports_self_chat')
+        self.supports_user_chats = raw.get('supports_user_chats')
+        self.supports_bot_chats = raw.get('supports_bot_chats')
+        self.supports_group_chats = raw.get('supports_group_chats')
+        self.supports_channel_chats = raw.get('supports_channel_chats')
+        self.request_write_access = raw.get('request_write_access')
+        self.is_added = raw.get('is_added')
+        self.show_in_attachment_menu = raw.get('show_in_attachment_menu')
+        self.show_in_side_menu = raw.get('show_in_side_menu')
+        self.show_disclaimer_in_side_menu = raw.get('show_disclaimer_in_side_menu')
+        self.name = raw.get('name')
+        value = raw.get('name_color')
+        if value is not None:
+            value = AttachmentMenuBotColor.from_raw(value)
+        self.name_color = value
+        value = raw.get('default_icon')
+        if value is not None:
+            value = File.from_raw(value)
+        self.default_icon = value
+        value = raw.get('ios_static_icon')
+        if value is not None:
+            value = File.from_raw(value)
+        self.ios_static_icon = value
+        value = raw.get('ios_animated_icon')
+        if value is not None:
+            value = File.from_raw(value)
+        self.ios_animated_icon = value
+        value = raw.get('ios_side_menu_icon')
+        if value is not None:
+            value = File.from_raw(value)
+        self.ios_side_menu_icon = value
+        value = raw.get('android_icon')
+        if value is not None:
+            value = File.from_raw(value)
+        self.android_icon = value
+        value = raw.get('android_side_menu_icon')
+        if value is not None:
+            value = File.from_raw(value)
+        self.android_side_menu_icon = value
+        value = raw.get('macos_icon')
+        if value is not None:
+            value = File.from_raw(value)
+        self.macos_icon = value
+        value = raw.get('macos_side_menu_icon')
+        if value is not None:
+            value = File.from_raw(value)
+        self.macos_side_menu_icon = value
+        value = raw.get('icon_color')
+        if value is not None:
+            value = AttachmentMenuBotColor.from_raw(value)
+        self.icon_color = value
+        value = raw.get('web_app_placeholder')
+        if value is not None:
+            value = File.from_raw(value)
+        self.web_app_placeholder = value
+
+
+@dataclass
+class SentWebAppMessage(TDObject):
+    """Information about the message sent by answerWebAppQuery"""
+
+    inline_message_id: str = None
+
+    def _decode(self, raw: dict):
+        self.inline_message_id = raw.get('inline_message_id')
+
+
+@dataclass
+class BotWriteAccessAllowReasonConnectedWebsite(TDObject):
+    """The user connected a website by logging in using Telegram Login Widget on it"""
+
+    domain_name: str = None
+
+    def _decode(self, raw: dict):
+        self.domain_name = raw.get('domain_name')
+
+
+@dataclass
+class BotWriteAccessAllowReasonAddedToAttachmentMenu(TDObject):
+    """
+    The user added the bot to attachment or side menu using
+    toggleBotIsAddedToAttachmentMenu
+    """
+
+
+@dataclass
+class BotWriteAccessAllowReasonLaunchedWebApp(TDObject):
+    """The user launched a Web App using getWebAppLinkUrl"""
+
+    web_app: WebApp = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('web_app')
+        if value is not None:
+            value = WebApp.from_raw(value)
+        self.web_app = value
+
+
+@dataclass
+class BotWriteAccessAllowReasonAcceptedRequest(TDObject):
+    """The user accepted bot's request to send messages with allowBotToSendMessages"""
+
+
+@dataclass
+class HttpUrl(TDObject):
+    """Contains an HTTP URL"""
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class UserLink(TDObject):
+    """Contains an HTTPS URL, which can be used to get information about a user"""
+
+    url: str = None
+    expires_in: int = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.expires_in = raw.get('expires_in')
+
+
+@dataclass
+class InputInlineQueryResultAnimation(TDObject):
+    """
+    Represents a link to an animated GIF or an animated (i.e., without sound)
+    H.264/MPEG-4 AVC video
+    """
+
+    id: str = None
+    title: str = None
+    thumbnail_url: str = None
+    thumbnail_mime_type: str = None
+    video_url: str = None
+    video_mime_type: str = None
+    video_duration: int = None
+    video_width: int = None
+    video_height: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.thumbnail_mime_type = raw.get('thumbnail_mime_type')
+        self.video_url = raw.get('video_url')
+        self.video_mime_type = raw.get('video_mime_type')
+        self.video_duration = raw.get('video_duration')
+        self.video_width = raw.get('video_width')
+        self.video_height = raw.get('video_height')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultArticle(TDObject):
+    """Represents a link to an article or web page"""
+
+    id: str = None
+    url: str = None
+    hide_url: bool = None
+    title: str = None
+    description: str = None
+    thumbnail_url: str = None
+    thumbnail_width: int = None
+    thumbnail_height: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.url = raw.get('url')
+        self.hide_url = raw.get('hide_url')
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.thumbnail_width = raw.get('thumbnail_width')
+        self.thumbnail_height = raw.get('thumbnail_height')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultAudio(TDObject):
+    """Represents a link to an MP3 audio file"""
+
+    id: str = None
+    title: str = None
+    performer: str = None
+    audio_url: str = None
+    audio_duration: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        self.performer = raw.get('performer')
+        self.audio_url = raw.get('audio_url')
+        self.audio_duration = raw.get('audio_duration')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultContact(TDObject):
+    """Represents a user contact"""
+
+    id: str = None
+    contact: Contact = None
+    thumbnail_url: str = None
+    thumbnail_width: int = None
+    thumbnail_height: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('contact')
+        if value is not None:
+            value = Contact.from_raw(value)
+        self.contact = value
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.thumbnail_width = raw.get('thumbnail_width')
+        self.thumbnail_height = raw.get('thumbnail_height')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultDocument(TDObject):
+    """Represents a link to a file"""
+
+    id: str = None
+    title: str = None
+    description: str = None
+    document_url: str = None
+    mime_type: str = None
+    thumbnail_url: str = None
+    thumbnail_width: int = None
+    thumbnail_height: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+        self.document_url = raw.get('document_url')
+        self.mime_type = raw.get('mime_type')
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.thumbnail_width = raw.get('thumbnail_width')
+        self.thumbnail_height = raw.get('thumbnail_height')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultGame(TDObject):
+    """Represents a game"""
+
+    id: str = None
+    game_short_name: str = None
+    reply_markup: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.game_short_name = raw.get('game_short_name')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+
+
+@dataclass
+class InputInlineQueryResultLocation(TDObject):
+    """Represents a point on the map"""
+
+    id: str = None
+    location: Location = None
+    live_period: int = None
+    title: str = None
+    thumbnail_url: str = None
+    thumbnail_width: int = None
+    thumbnail_height: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+        self.live_period = raw.get('live_period')
+        self.title = raw.get('title')
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.thumbnail_width = raw.get('thumbnail_width')
+        self.thumbnail_height = raw.get('thumbnail_height')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultPhoto(TDObject):
+    """Represents link to a JPEG image"""
+
+    id: str = None
+    title: str = None
+    description: str = None
+    thumbnail_url: str = None
+    photo_url: str = None
+    photo_width: int = None
+    photo_height: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.photo_url = raw.get('photo_url')
+        self.photo_width = raw.get('photo_width')
+        self.photo_height = raw.get('photo_height')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultSticker(TDObject):
+    """Represents a link to a WEBP, TGS, or WEBM sticker"""
+
+    id: str = None
+    thumbnail_url: str = None
+    sticker_url: str = None
+    sticker_width: int = None
+    sticker_height: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.sticker_url = raw.get('sticker_url')
+        self.sticker_width = raw.get('sticker_width')
+        self.sticker_height = raw.get('sticker_height')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultVenue(TDObject):
+    """Represents information about a venue"""
+
+    id: str = None
+    venue: Venue = None
+    thumbnail_url: str = None
+    thumbnail_width: int = None
+    thumbnail_height: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('venue')
+        if value is not None:
+            value = Venue.from_raw(value)
+        self.venue = value
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.thumbnail_width = raw.get('thumbnail_width')
+        self.thumbnail_height = raw.get('thumbnail_height')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultVideo(TDObject):
+    """
+    Represents a link to a page containing an embedded video player or a video
+    file
+    """
+
+    id: str = None
+    title: str = None
+    description: str = None
+    thumbnail_url: str = None
+    video_url: str = None
+    mime_type: str = None
+    video_width: int = None
+    video_height: int = None
+    video_duration: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+        self.thumbnail_url = raw.get('thumbnail_url')
+        self.video_url = raw.get('video_url')
+        self.mime_type = raw.get('mime_type')
+        self.video_width = raw.get('video_width')
+        self.video_height = raw.get('video_height')
+        self.video_duration = raw.get('video_duration')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InputInlineQueryResultVoiceNote(TDObject):
+    """
+    Represents a link to an opus-encoded audio file within an OGG container,
+    single channel audio
+    """
+
+    id: str = None
+    title: str = None
+    voice_note_url: str = None
+    voice_note_duration: int = None
+    reply_markup: TDObject = None
+    input_message_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.title = raw.get('title')
+        self.voice_note_url = raw.get('voice_note_url')
+        self.voice_note_duration = raw.get('voice_note_duration')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+        value = raw.get('input_message_content')
+        if value is not None:
+            value = InputMessageContent(value)
+        self.input_message_content = value
+
+
+@dataclass
+class InlineQueryResultArticle(TDObject):
+    """Represents a link to an article or web page"""
+
+    id: str = None
+    url: str = None
+    hide_url: bool = None
+    title: str = None
+    description: str = None
+    thumbnail: Thumbnail = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.url = raw.get('url')
+        self.hide_url = raw.get('hide_url')
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+
+
+@dataclass
+class InlineQueryResultContact(TDObject):
+    """Represents a user contact"""
+
+    id: str = None
+    contact: Contact = None
+    thumbnail: Thumbnail = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('contact')
+        if value is not None:
+            value = Contact.from_raw(value)
+        self.contact = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+
+
+@dataclass
+class InlineQueryResultLocation(TDObject):
+    """Represents a point on the map"""
+
+    id: str = None
+    location: Location = None
+    title: str = None
+    thumbnail: Thumbnail = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.location = value
+        self.title = raw.get('title')
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+
+
+@dataclass
+class InlineQueryResultVenue(TDObject):
+    """Represents information about a venue"""
+
+    id: str = None
+    venue: Venue = None
+    thumbnail: Thumbnail = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('venue')
+        if value is not None:
+            value = Venue.from_raw(value)
+        self.venue = value
+        value = raw.get('thumbnail')
+        if value is not None:
+            value = Thumbnail.from_raw(value)
+        self.thumbnail = value
+
+
+@dataclass
+class InlineQueryResultGame(TDObject):
+    """Represents information about a game"""
+
+    id: str = None
+    game: Game = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('game')
+        if value is not None:
+            value = Game.from_raw(value)
+        self.game = value
+
+
+@dataclass
+class InlineQueryResultAnimation(TDObject):
+    """Represents an animation file"""
+
+    id: str = None
+    animation: Animation = None
+    title: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+        self.title = raw.get('title')
+
+
+@dataclass
+class InlineQueryResultAudio(TDObject):
+    """Represents an audio file"""
+
+    id: str = None
+    audio: Audio = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('audio')
+        if value is not None:
+            value = Audio.from_raw(value)
+        self.audio = value
+
+
+@dataclass
+class InlineQueryResultDocument(TDObject):
+    """Represents a document"""
+
+    id: str = None
+    document: Document = None
+    title: str = None
+    description: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('document')
+        if value is not None:
+            value = Document.from_raw(value)
+        self.document = value
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+
+
+@dataclass
+class InlineQueryResultPhoto(TDObject):
+    """Represents a photo"""
+
+    id: str = None
+    photo: Photo = None
+    title: str = None
+    description: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+
+
+@dataclass
+class InlineQueryResultSticker(TDObject):
+    """Represents a sticker"""
+
+    id: str = None
+    sticker: Sticker = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+
+
+@dataclass
+class InlineQueryResultVideo(TDObject):
+    """Represents a video"""
+
+    id: str = None
+    video: Video = None
+    title: str = None
+    description: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('video')
+        if value is not None:
+            value = Video.from_raw(value)
+        self.video = value
+        self.title = raw.get('title')
+        self.description = raw.get('description')
+
+
+@dataclass
+class InlineQueryResultVoiceNote(TDObject):
+    """Represents a voice note"""
+
+    id: str = None
+    voice_note: VoiceNote = None
+    title: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('voice_note')
+        if value is not None:
+            value = VoiceNote.from_raw(value)
+        self.voice_note = value
+        self.title = raw.get('title')
+
+
+@dataclass
+class InlineQueryResultsButtonTypeStartBot(TDObject):
+    """
+    Describes the button that opens a private chat with the bot and sends a start
+    message to the bot with the given parameter
+    """
+
+    parameter: str = None
+
+    def _decode(self, raw: dict):
+        self.parameter = raw.get('parameter')
+
+
+@dataclass
+class InlineQueryResultsButtonTypeWebApp(TDObject):
+    """Describes the button that opens a Web App by calling getWebAppUrl"""
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class InlineQueryResultsButton(TDObject):
+    """Represents a button to be shown above inline query results"""
+
+    text: str = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        value = raw.get('type')
+        if value is not None:
+            value = InlineQueryResultsButtonType(value)
+        self.type = value
+
+
+@dataclass
+class InlineQueryResults(TDObject):
+    """
+    Represents the results of the inline query. Use sendInlineQueryResultMessage
+    to send the result of the query
+    """
+
+    inline_query_id: int = None
+    button: InlineQueryResultsButton = None
+    results: List[TDObject] = None
+    next_offset: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('inline_query_id')
+        if value is not None:
+            value = int(value)
+        self.inline_query_id = value
+        value = raw.get('button')
+        if value is not None:
+            value = InlineQueryResultsButton.from_raw(value)
+        self.button = value
+        value = raw.get('results')
+        if value is not None:
+            value = [InlineQueryResult(item0) for item0 in value]
+        self.results = value
+        self.next_offset = raw.get('next_offset')
+
+
+@dataclass
+class CallbackQueryPayloadData(TDObject):
+    """The payload for a general callback button"""
+
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.data = raw.get('data')
+
+
+@dataclass
+class CallbackQueryPayloadDataWithPassword(TDObject):
+    """The payload for a callback button requiring password"""
+
+    password: str = None
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.password = raw.get('password')
+        self.data = raw.get('data')
+
+
+@dataclass
+class CallbackQueryPayloadGame(TDObject):
+    """The payload for a game callback button"""
+
+    game_short_name: str = None
+
+    def _decode(self, raw: dict):
+        self.game_short_name = raw.get('game_short_name')
+
+
+@dataclass
+class CallbackQueryAnswer(TDObject):
+    """Contains a bot's answer to a callback query"""
+
+    text: str = None
+    show_alert: bool = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        self.show_alert = raw.get('show_alert')
+        self.url = raw.get('url')
+
+
+@dataclass
+class CustomRequestResult(TDObject):
+    """Contains the result of a custom request"""
+
+    result: str = None
+
+    def _decode(self, raw: dict):
+        self.result = raw.get('result')
+
+
+@dataclass
+class GameHighScore(TDObject):
+    """Contains one row of the game high score table"""
+
+    position: int = None
+    user_id: int = None
+    score: int = None
+
+    def _decode(self, raw: dict):
+        self.position = raw.get('position')
+        self.user_id = raw.get('user_id')
+        self.score = raw.get('score')
+
+
+@dataclass
+class GameHighScores(TDObject):
+    """Contains a list of game high scores"""
+
+    scores: List[GameHighScore] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('scores')
+        if value is not None:
+            value = [GameHighScore.from_raw(item0) for item0 in value]
+        self.scores = value
+
+
+@dataclass
+class ChatEventMessageEdited(TDObject):
+    """A message was edited"""
+
+    old_message: Message = None
+    new_message: Message = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.old_message = value
+        value = raw.get('new_message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.new_message = value
+
+
+@dataclass
+class ChatEventMessageDeleted(TDObject):
+    """A message was deleted"""
+
+    message: Message = None
+    can_report_anti_spam_false_positive: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+        self.can_report_anti_spam_false_positive = raw.get('can_report_anti_spam_false_positive')
+
+
+@dataclass
+class ChatEventMessagePinned(TDObject):
+    """A message was pinned"""
+
+    message: Message = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+
+
+@dataclass
+class ChatEventMessageUnpinned(TDObject):
+    """A message was unpinned"""
+
+    message: Message = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+
+
+@dataclass
+class ChatEventPollStopped(TDObject):
+    """A poll in a message was stopped"""
+
+    message: Message = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+
+
+@dataclass
+class ChatEventMemberJoined(TDObject):
+    """A new member joined the chat"""
+
+
+@dataclass
+class ChatEventMemberJoinedByInviteLink(TDObject):
+    """A new member joined the chat via an invite link"""
+
+    invite_link: ChatInviteLink = None
+    via_chat_folder_invite_link: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.invite_link = value
+        self.via_chat_folder_invite_link = raw.get('via_chat_folder_invite_link')
+
+
+@dataclass
+class ChatEventMemberJoinedByRequest(TDObject):
+    """A new member was accepted to the chat by an administrator"""
+
+    approver_user_id: int = None
+    invite_link: ChatInviteLink = None
+
+    def _decode(self, raw: dict):
+        self.approver_user_id = raw.get('approver_user_id')
+        value = raw.get('invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.invite_link = value
+
+
+@dataclass
+class ChatEventMemberInvited(TDObject):
+    """A new chat member was invited"""
+
+    user_id: int = None
+    status: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        value = raw.get('status')
+        if value is not None:
+            value = ChatMemberStatus(value)
+        self.status = value
+
+
+@dataclass
+class ChatEventMemberLeft(TDObject):
+    """A member left the chat"""
+
+
+@dataclass
+class ChatEventMemberPromoted(TDObject):
+    """
+    A chat member has gained/lost administrator status, or the list of their
+    administrator privileges has changed
+    """
+
+    user_id: int = None
+    old_status: TDObject = None
+    new_status: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        value = raw.get('old_status')
+        if value is not None:
+            value = ChatMemberStatus(value)
+        self.old_status = value
+        value = raw.get('new_status')
+        if value is not None:
+            value = ChatMemberStatus(value)
+        self.new_status = value
+
+
+@dataclass
+class ChatEventMemberRestricted(TDObject):
+    """
+    A chat member was restricted/unrestricted or banned/unbanned, or the list of
+    their restrictions has changed
+    """
+
+    member_id: TDObject = None
+    old_status: TDObject = None
+    new_status: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('member_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.member_id = value
+        value = raw.get('old_status')
+        if value is not None:
+            value = ChatMemberStatus(value)
+        self.old_status = value
+        value = raw.get('new_status')
+        if value is not None:
+            value = ChatMemberStatus(value)
+        self.new_status = value
+
+
+@dataclass
+class ChatEventAvailableReactionsChanged(TDObject):
+    """The chat available reactions were changed"""
+
+    old_available_reactions: TDObject = None
+    new_available_reactions: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_available_reactions')
+        if value is not None:
+            value = ChatAvailableReactions(value)
+        self.old_available_reactions = value
+        value = raw.get('new_available_reactions')
+        if value is not None:
+            value = ChatAvailableReactions(value)
+        self.new_available_reactions = value
+
+
+@dataclass
+class ChatEventBackgroundChanged(TDObject):
+    """The chat background was changed"""
+
+    old_background: ChatBackground = None
+    new_background: ChatBackground = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_background')
+        if value is not None:
+            value = ChatBackground.from_raw(value)
+        self.old_background = value
+        value = raw.get('new_background')
+        if value is not None:
+            value = ChatBackground.from_raw(value)
+        self.new_background = value
+
+
+@dataclass
+class ChatEventDescriptionChanged(TDObject):
+    """The chat description was changed"""
+
+    old_description: str = None
+    new_description: str = None
+
+    def _decode(self, raw: dict):
+        self.old_description = raw.get('old_description')
+        self.new_description = raw.get('new_description')
+
+
+@dataclass
+class ChatEventEmojiStatusChanged(TDObject):
+    """The chat emoji status was changed"""
+
+    old_emoji_status: EmojiStatus = None
+    new_emoji_status: EmojiStatus = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_emoji_status')
+        if value is not None:
+            value = EmojiStatus.from_raw(value)
+        self.old_emoji_status = value
+        value = raw.get('new_emoji_status')
+        if value is not None:
+            value = EmojiStatus.from_raw(value)
+        self.new_emoji_status = value
+
+
+@dataclass
+class ChatEventLinkedChatChanged(TDObject):
+    """The linked chat of a supergroup was changed"""
+
+    old_linked_chat_id: int = None
+    new_linked_chat_id: int = None
+
+    def _decode(self, raw: dict):
+        self.old_linked_chat_id = raw.get('old_linked_chat_id')
+        self.new_linked_chat_id = raw.get('new_linked_chat_id')
+
+
+@dataclass
+class ChatEventLocationChanged(TDObject):
+    """The supergroup location was changed"""
+
+    old_location: ChatLocation = None
+    new_location: ChatLocation = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_location')
+        if value is not None:
+            value = ChatLocation.from_raw(value)
+        self.old_location = value
+        value = raw.get('new_location')
+        if value is not None:
+            value = ChatLocation.from_raw(value)
+        self.new_location = value
+
+
+@dataclass
+class ChatEventMessageAutoDeleteTimeChanged(TDObject):
+    """The message auto-delete timer was changed"""
+
+    old_message_auto_delete_time: int = None
+    new_message_auto_delete_time: int = None
+
+    def _decode(self, raw: dict):
+        self.old_message_auto_delete_time = raw.get('old_message_auto_delete_time')
+        self.new_message_auto_delete_time = raw.get('new_message_auto_delete_time')
+
+
+@dataclass
+class ChatEventPermissionsChanged(TDObject):
+    """The chat permissions were changed"""
+
+    old_permissions: ChatPermissions = None
+    new_permissions: ChatPermissions = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_permissions')
+        if value is not None:
+            value = ChatPermissions.from_raw(value)
+        self.old_permissions = value
+        value = raw.get('new_permissions')
+        if value is not None:
+            value = ChatPermissions.from_raw(value)
+        self.new_permissions = value
+
+
+@dataclass
+class ChatEventPhotoChanged(TDObject):
+    """The chat photo was changed"""
+
+    old_photo: ChatPhoto = None
+    new_photo: ChatPhoto = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.old_photo = value
+        value = raw.get('new_photo')
+        if value is not None:
+            value = ChatPhoto.from_raw(value)
+        self.new_photo = value
+
+
+@dataclass
+class ChatEventSlowModeDelayChanged(TDObject):
+    """The slow_mode_delay setting of a supergroup was changed"""
+
+    old_slow_mode_delay: int = None
+    new_slow_mode_delay: int = None
+
+    def _decode(self, raw: dict):
+        self.old_slow_mode_delay = raw.get('old_slow_mode_delay')
+        self.new_slow_mode_delay = raw.get('new_slow_mode_delay')
+
+
+@dataclass
+class ChatEventStickerSetChanged(TDObject):
+    """The supergroup sticker set was changed"""
+
+    old_sticker_set_id: int = None
+    new_sticker_set_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_sticker_set_id')
+        if value is not None:
+            value = int(value)
+        self.old_sticker_set_id = value
+        value = raw.get('new_sticker_set_id')
+        if value is not None:
+            value = int(value)
+        self.new_sticker_set_id = value
+
+
+@dataclass
+class ChatEventCustomEmojiStickerSetChanged(TDObject):
+    """The supergroup sticker set with allowed custom emoji was changed"""
+
+    old_sticker_set_id: int = None
+    new_sticker_set_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_sticker_set_id')
+        if value is not None:
+            value = int(value)
+        self.old_sticker_set_id = value
+        value = raw.get('new_sticker_set_id')
+        if value is not None:
+            value = int(value)
+        self.new_sticker_set_id = value
+
+
+@dataclass
+class ChatEventTitleChanged(TDObject):
+    """The chat title was changed"""
+
+    old_title: str = None
+    new_title: str = None
+
+    def _decode(self, raw: dict):
+        self.old_title = raw.get('old_title')
+        self.new_title = raw.get('new_title')
+
+
+@dataclass
+class ChatEventUsernameChanged(TDObject):
+    """The chat editable username was changed"""
+
+    old_username: str = None
+    new_username: str = None
+
+    def _decode(self, raw: dict):
+        self.old_username = raw.get('old_username')
+        self.new_username = raw.get('new_username')
+
+
+@dataclass
+class ChatEventActiveUsernamesChanged(TDObject):
+    """The chat active usernames were changed"""
+
+    old_usernames: List[str] = None
+    new_usernames: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.old_usernames = raw.get('old_usernames')
+        self.new_usernames = raw.get('new_usernames')
+
+
+@dataclass
+class ChatEventAccentColorChanged(TDObject):
+    """The chat accent color or background custom emoji were changed"""
+
+    old_accent_color_id: int = None
+    old_background_custom_emoji_id: int = None
+    new_accent_color_id: int = None
+    new_background_custom_emoji_id: int = None
+
+    def _decode(self, raw: dict):
+        self.old_accent_color_id = raw.get('old_accent_color_id')
+        value = raw.get('old_background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.old_background_custom_emoji_id = value
+        self.new_accent_color_id = raw.get('new_accent_color_id')
+        value = raw.get('new_background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.new_background_custom_emoji_id = value
+
+
+@dataclass
+class ChatEventProfileAccentColorChanged(TDObject):
+    """
+    The chat's profile accent color or profile background custom emoji were
+    changed
+    """
+
+    old_profile_accent_color_id: int = None
+    old_profile_background_custom_emoji_id: int = None
+    new_profile_accent_color_id: int = None
+    new_profile_background_custom_emoji_id: int = None
+
+    def _decode(self, raw: dict):
+        self.old_profile_accent_color_id = raw.get('old_profile_accent_color_id')
+        value = raw.get('old_profile_background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.old_profile_background_custom_emoji_id = value
+        self.new_profile_accent_color_id = raw.get('new_profile_accent_color_id')
+        value = raw.get('new_profile_background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.new_profile_background_custom_emoji_id = value
+
+
+@dataclass
+class ChatEventHasProtectedContentToggled(TDObject):
+    """The has_protected_content setting of a channel was toggled"""
+
+    has_protected_content: bool = None
+
+    def _decode(self, raw: dict):
+        self.has_protected_content = raw.get('has_protected_content')
+
+
+@dataclass
+class ChatEventInvitesToggled(TDObject):
+    """The can_invite_users permission of a supergroup chat was toggled"""
+
+    can_invite_users: bool = None
+
+    def _decode(self, raw: dict):
+        self.can_invite_users = raw.get('can_invite_users')
+
+
+@dataclass
+class ChatEventIsAllHistoryAvailableToggled(TDObject):
+    """The is_all_history_available setting of a supergroup was toggled"""
+
+    is_all_history_available: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_all_history_available = raw.get('is_all_history_available')
+
+
+@dataclass
+class ChatEventHasAggressiveAntiSpamEnabledToggled(TDObject):
+    """The has_aggressive_anti_spam_enabled setting of a supergroup was toggled"""
+
+    has_aggressive_anti_spam_enabled: bool = None
+
+    def _decode(self, raw: dict):
+        self.has_aggressive_anti_spam_enabled = raw.get('has_aggressive_anti_spam_enabled')
+
+
+@dataclass
+class ChatEventSignMessagesToggled(TDObject):
+    """The sign_messages setting of a channel was toggled"""
+
+    sign_messages: bool = None
+
+    def _decode(self, raw: dict):
+        self.sign_messages = raw.get('sign_messages')
+
+
+@dataclass
+class ChatEventInviteLinkEdited(TDObject):
+    """A chat invite link was edited"""
+
+    old_invite_link: ChatInviteLink = None
+    new_invite_link: ChatInviteLink = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.old_invite_link = value
+        value = raw.get('new_invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.new_invite_link = value
+
+
+@dataclass
+class ChatEventInviteLinkRevoked(TDObject):
+    """A chat invite link was revoked"""
+
+    invite_link: ChatInviteLink = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.invite_link = value
+
+
+@dataclass
+class ChatEventInviteLinkDeleted(TDObject):
+    """A revoked chat invite link was deleted"""
+
+    invite_link: ChatInviteLink = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.invite_link = value
+
+
+@dataclass
+class ChatEventVideoChatCreated(TDObject):
+    """A video chat was created"""
+
+    group_call_id: int = None
+
+    def _decode(self, raw: dict):
+        self.group_call_id = raw.get('group_call_id')
+
+
+@dataclass
+class ChatEventVideoChatEnded(TDObject):
+    """A video chat was ended"""
+
+    group_call_id: int = None
+
+    def _decode(self, raw: dict):
+        self.group_call_id = raw.get('group_call_id')
+
+
+@dataclass
+class ChatEventVideoChatMuteNewParticipantsToggled(TDObject):
+    """The mute_new_participants setting of a video chat was toggled"""
+
+    mute_new_participants: bool = None
+
+    def _decode(self, raw: dict):
+        self.mute_new_participants = raw.get('mute_new_participants')
+
+
+@dataclass
+class ChatEventVideoChatParticipantIsMutedToggled(TDObject):
+    """A video chat participant was muted or unmuted"""
+
+    participant_id: TDObject = None
+    is_muted: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('participant_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.participant_id = value
+        self.is_muted = raw.get('is_muted')
+
+
+@dataclass
+class ChatEventVideoChatParticipantVolumeLevelChanged(TDObject):
+    """A video chat participant volume level was changed"""
+
+    participant_id: TDObject = None
+    volume_level: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('participant_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.participant_id = value
+        self.volume_level = raw.get('volume_level')
+
+
+@dataclass
+class ChatEventIsForumToggled(TDObject):
+    """The is_forum setting of a channel was toggled"""
+
+    is_forum: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_forum = raw.get('is_forum')
+
+
+@dataclass
+class ChatEventForumTopicCreated(TDObject):
+    """A new forum topic was created"""
+
+    topic_info: ForumTopicInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('topic_info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.topic_info = value
+
+
+@dataclass
+class ChatEventForumTopicEdited(TDObject):
+    """A forum topic was edited"""
+
+    old_topic_info: ForumTopicInfo = None
+    new_topic_info: ForumTopicInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_topic_info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.old_topic_info = value
+        value = raw.get('new_topic_info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.new_topic_info = value
+
+
+@dataclass
+class ChatEventForumTopicToggleIsClosed(TDObject):
+    """A forum topic was closed or reopened"""
+
+    topic_info: ForumTopicInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('topic_info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.topic_info = value
+
+
+@dataclass
+class ChatEventForumTopicToggleIsHidden(TDObject):
+    """The General forum topic was hidden or unhidden"""
+
+    topic_info: ForumTopicInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('topic_info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.topic_info = value
+
+
+@dataclass
+class ChatEventForumTopicDeleted(TDObject):
+    """A forum topic was deleted"""
+
+    topic_info: ForumTopicInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('topic_info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.topic_info = value
+
+
+@dataclass
+class ChatEventForumTopicPinned(TDObject):
+    """A pinned forum topic was changed"""
+
+    old_topic_info: ForumTopicInfo = None
+    new_topic_info: ForumTopicInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('old_topic_info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.old_topic_info = value
+        value = raw.get('new_topic_info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.new_topic_info = value
+
+
+@dataclass
+class ChatEvent(TDObject):
+    """Represents a chat event"""
+
+    id: int = None
+    date: int = None
+    member_id: TDObject = None
+    action: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.date = raw.get('date')
+        value = raw.get('member_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.member_id = value
+        value = raw.get('action')
+        if value is not None:
+            value = ChatEventAction(value)
+        self.action = value
+
+
+@dataclass
+class ChatEvents(TDObject):
+    """Contains a list of chat events"""
+
+    events: List[ChatEvent] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('events')
+        if value is not None:
+            value = [ChatEvent.from_raw(item0) for item0 in value]
+        self.events = value
+
+
+@dataclass
+class ChatEventLogFilters(TDObject):
+    """Represents a set of filters used to obtain a chat event log"""
+
+    message_edits: bool = None
+    message_deletions: bool = None
+    message_pins: bool = None
+    member_joins: bool = None
+    member_leaves: bool = None
+    member_invites: bool = None
+    member_promotions: bool = None
+    member_restrictions: bool = None
+    info_changes: bool = None
+    setting_changes: bool = None
+    invite_link_changes: bool = None
+    video_chat_changes: bool = None
+    forum_changes: bool = None
+
+    def _decode(self, raw: dict):
+        self.message_edits = raw.get('message_edits')
+        self.message_deletions = raw.get('message_deletions')
+        self.message_pins = raw.get('message_pins')
+        self.member_joins = raw.get('member_joins')
+        self.member_leaves = raw.get('member_leaves')
+        self.member_invites = raw.get('member_invites')
+        self.member_promotions = raw.get('member_promotions')
+        self.member_restrictions = raw.get('member_restrictions')
+        self.info_changes = raw.get('info_changes')
+        self.setting_changes = raw.get('setting_changes')
+        self.invite_link_changes = raw.get('invite_link_changes')
+        self.video_chat_changes = raw.get('video_chat_changes')
+        self.forum_changes = raw.get('forum_changes')
+
+
+@dataclass
+class LanguagePackStringValueOrdinary(TDObject):
+    """An ordinary language pack string"""
+
+    value: str = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class LanguagePackStringValuePluralized(TDObject):
+    """
+    A language pack string which has different forms based on the number of some
+    object it mentions. See https://www.unicode.org/cldr/charts/latest/supplementa
+    l/language_plural_rules.html for more information
+    """
+
+    zero_value: str = None
+    one_value: str = None
+    two_value: str = None
+    few_value: str = None
+    many_value: str = None
+    other_value: str = None
+
+    def _decode(self, raw: dict):
+        self.zero_value = raw.get('zero_value')
+        self.one_value = raw.get('one_value')
+        self.two_value = raw.get('two_value')
+        self.few_value = raw.get('few_value')
+        self.many_value = raw.get('many_value')
+        self.other_value = raw.get('other_value')
+
+
+@dataclass
+class LanguagePackStringValueDeleted(TDObject):
+    """
+    A deleted language pack string, the value must be taken from the built-in
+    English language pack
+    """
+
+
+@dataclass
+class LanguagePackString(TDObject):
+    """Represents one language pack string"""
+
+    key: str = None
+    value: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.key = raw.get('key')
+        value = raw.get('value')
+        if value is not None:
+            value = LanguagePackStringValue(value)
+        self.value = value
+
+
+@dataclass
+class LanguagePackStrings(TDObject):
+    """Contains a list of language pack strings"""
+
+    strings: List[LanguagePackString] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('strings')
+        if value is not None:
+            value = [LanguagePackString.from_raw(item0) for item0 in value]
+        self.strings = value
+
+
+@dataclass
+class LanguagePackInfo(TDObject):
+    """Contains information about a language pack"""
+
+    id: str = None
+    base_language_pack_id: str = None
+    name: str = None
+    native_name: str = None
+    plural_code: str = None
+    is_official: bool = None
+    is_rtl: bool = None
+    is_beta: bool = None
+    is_installed: bool = None
+    total_string_count: int = None
+    translated_string_count: int = None
+    local_string_count: int = None
+    translation_url: str = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.base_language_pack_id = raw.get('base_language_pack_id')
+        self.name = raw.get('name')
+        self.native_name = raw.get('native_name')
+        self.plural_code = raw.get('plural_code')
+        self.is_official = raw.get('is_official')
+        self.is_rtl = raw.get('is_rtl')
+        self.is_beta = raw.get('is_beta')
+        self.is_installed = raw.get('is_installed')
+        self.total_string_count = raw.get('total_string_count')
+        self.translated_string_count = raw.get('translated_string_count')
+        self.local_string_count = raw.get('local_string_count')
+        self.translation_url = raw.get('translation_url')
+
+
+@dataclass
+class LocalizationTargetInfo(TDObject):
+    """Contains information about the current localization target"""
+
+    language_packs: List[LanguagePackInfo] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('language_packs')
+        if value is not None:
+            value = [LanguagePackInfo.from_raw(item0) for item0 in value]
+        self.language_packs = value
+
+
+@dataclass
+class PremiumLimitTypeSupergroupCount(TDObject):
+    """The maximum number of joined supergroups and channels"""
+
+
+@dataclass
+class PremiumLimitTypePinnedChatCount(TDObject):
+    """The maximum number of pinned chats in the main chat list"""
+
+
+@dataclass
+class PremiumLimitTypeCreatedPublicChatCount(TDObject):
+    """The maximum number of created public chats"""
+
+
+@dataclass
+class PremiumLimitTypeSavedAnimationCount(TDObject):
+    """The maximum number of saved animations"""
+
+
+@dataclass
+class PremiumLimitTypeFavoriteStickerCount(TDObject):
+    """The maximum number of favorite stickers"""
+
+
+@dataclass
+class PremiumLimitTypeChatFolderCount(TDObject):
+    """The maximum number of chat folders"""
+
+
+@dataclass
+class PremiumLimitTypeChatFolderChosenChatCount(TDObject):
+    """
+    The maximum number of pinned and always included, or always excluded chats in
+    a chat folder
+    """
+
+
+@dataclass
+class PremiumLimitTypePinnedArchivedChatCount(TDObject):
+    """The maximum number of pinned chats in the archive chat list"""
+
+
+@dataclass
+class PremiumLimitTypePinnedSavedMessagesTopicCount(TDObject):
+    """The maximum number of pinned Saved Messages topics"""
+
+
+@dataclass
+class PremiumLimitTypeCaptionLength(TDObject):
+    """The maximum length of sent media caption"""
+
+
+@dataclass
+class PremiumLimitTypeBioLength(TDObject):
+    """The maximum length of the user's bio"""
+
+
+@dataclass
+class PremiumLimitTypeChatFolderInviteLinkCount(TDObject):
+    """The maximum number of invite links for a chat folder"""
+
+
+@dataclass
+class PremiumLimitTypeShareableChatFolderCount(TDObject):
+    """The maximum number of added shareable chat folders"""
+
+
+@dataclass
+class PremiumLimitTypeActiveStoryCount(TDObject):
+    """The maximum number of active stories"""
+
+
+@dataclass
+class PremiumLimitTypeWeeklySentStoryCount(TDObject):
+    """The maximum number of stories sent per week"""
+
+
+@dataclass
+class PremiumLimitTypeMonthlySentStoryCount(TDObject):
+    """The maximum number of stories sent per month"""
+
+
+@dataclass
+class PremiumLimitTypeStoryCaptionLength(TDObject):
+    """The maximum length of captions of sent stories"""
+
+
+@dataclass
+class PremiumLimitTypeStorySuggestedReactionAreaCount(TDObject):
+    """The maximum number of suggested reaction areas on a story"""
+
+
+@dataclass
+class PremiumLimitTypeSimilarChatCount(TDObject):
+    """The maximum number of received similar chats"""
+
+
+@dataclass
+class PremiumFeatureIncreasedLimits(TDObject):
+    """Increased limits"""
+
+
+@dataclass
+class PremiumFeatureIncreasedUploadFileSize(TDObject):
+    """Increased maximum upload file size"""
+
+
+@dataclass
+class PremiumFeatureImprovedDownloadSpeed(TDObject):
+    """Improved download speed"""
+
+
+@dataclass
+class PremiumFeatureVoiceRecognition(TDObject):
+    """The ability to convert voice notes to text"""
+
+
+@dataclass
+class PremiumFeatureDisabledAds(TDObject):
+    """Disabled ads"""
+
+
+@dataclass
+class PremiumFeatureUniqueReactions(TDObject):
+    """Allowed to use more reactions"""
+
+
+@dataclass
+class PremiumFeatureUniqueStickers(TDObject):
+    """Allowed to use premium stickers with unique effects"""
+
+
+@dataclass
+class PremiumFeatureCustomEmoji(TDObject):
+    """Allowed to use custom emoji stickers in message texts and captions"""
+
+
+@dataclass
+class PremiumFeatureAdvancedChatManagement(TDObject):
+    """
+    Ability to change position of the main chat list, archive and mute all new
+    chats from non-contacts, and completely disable notifications about the user's
+    contacts joined Telegram
+    """
+
+
+@dataclass
+class PremiumFeatureProfileBadge(TDObject):
+    """A badge in the user's profile"""
+
+
+@dataclass
+class PremiumFeatureEmojiStatus(TDObject):
+    """An emoji status shown along with the user's name"""
+
+
+@dataclass
+class PremiumFeatureAnimatedProfilePhoto(TDObject):
+    """Profile photo animation on message and chat screens"""
+
+
+@dataclass
+class PremiumFeatureForumTopicIcon(TDObject):
+    """The ability to set a custom emoji as a forum topic icon"""
+
+
+@dataclass
+class PremiumFeatureAppIcons(TDObject):
+    """Allowed to set a premium application icons"""
+
+
+@dataclass
+class PremiumFeatureRealTimeChatTranslation(TDObject):
+    """Allowed to translate chat messages real-time"""
+
+
+@dataclass
+class PremiumFeatureUpgradedStories(TDObject):
+    """Allowed to use many additional features for stories"""
+
+
+@dataclass
+class PremiumFeatureChatBoost(TDObject):
+    """The ability to boost chats"""
+
+
+@dataclass
+class PremiumFeatureAccentColor(TDObject):
+    """The ability to choose accent color for replies and user profile"""
+
+
+@dataclass
+class PremiumFeatureBackgroundForBoth(TDObject):
+    """The ability to set private chat background for both users"""
+
+
+@dataclass
+class PremiumFeatureSavedMessagesTags(TDObject):
+    """The ability to use tags in Saved Messages"""
+
+
+@dataclass
+class PremiumFeatureMessagePrivacy(TDObject):
+    """
+    The ability to disallow incoming voice and video note messages in private
+    chats using setUserPrivacySettingRules with
+    userPrivacySettingAllowPrivateVoiceAndVideoNoteMessages and to restrict
+    incoming messages from non-contacts using setNewChatPrivacySettings
+    """
+
+
+@dataclass
+class PremiumFeatureLastSeenTimes(TDObject):
+    """
+    The ability to view last seen and read times of other users even they can't
+    view last seen or read time for the current user
+    """
+
+
+@dataclass
+class PremiumStoryFeaturePriorityOrder(TDObject):
+    """
+    Stories of the current user are displayed before stories of non-Premium
+    contacts, supergroups, and channels
+    """
+
+
+@dataclass
+class PremiumStoryFeatureStealthMode(TDObject):
+    """The ability to hide the fact that the user viewed other's stories"""
+
+
+@dataclass
+class PremiumStoryFeaturePermanentViewsHistory(TDObject):
+    """The ability to check who opened the current user's stories after they expire"""
+
+
+@dataclass
+class PremiumStoryFeatureCustomExpirationDuration(TDObject):
+    """The ability to set custom expiration duration for stories"""
+
+
+@dataclass
+class PremiumStoryFeatureSaveStories(TDObject):
+    """The ability to save other's unprotected stories"""
+
+
+@dataclass
+class PremiumStoryFeatureLinksAndFormatting(TDObject):
+    """The ability to use links and formatting in story caption"""
+
+
+@dataclass
+class PremiumStoryFeatureVideoQuality(TDObject):
+    """The ability to choose better quality for viewed stories"""
+
+
+@dataclass
+class PremiumLimit(TDObject):
+    """Contains information about a limit, increased for Premium users"""
+
+    type: TDObject = None
+    default_value: int = None
+    premium_value: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('type')
+        if value is not None:
+            value = PremiumLimitType(value)
+        self.type = value
+        self.default_value = raw.get('default_value')
+        self.premium_value = raw.get('premium_value')
+
+
+@dataclass
+class PremiumFeatures(TDObject):
+    """Contains information about features, available to Premium users"""
+
+    features: List[TDObject] = None
+    limits: List[PremiumLimit] = None
+    payment_link: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('features')
+        if value is not None:
+            value = [PremiumFeature(item0) for item0 in value]
+        self.features = value
+        value = raw.get('limits')
+        if value is not None:
+            value = [PremiumLimit.from_raw(item0) for item0 in value]
+        self.limits = value
+        value = raw.get('payment_link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.payment_link = value
+
+
+@dataclass
+class PremiumSourceLimitExceeded(TDObject):
+    """A limit was exceeded"""
+
+    limit_type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('limit_type')
+        if value is not None:
+            value = PremiumLimitType(value)
+        self.limit_type = value
+
+
+@dataclass
+class PremiumSourceFeature(TDObject):
+    """A user tried to use a Premium feature"""
+
+    feature: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('feature')
+        if value is not None:
+            value = PremiumFeature(value)
+        self.feature = value
+
+
+@dataclass
+class PremiumSourceStoryFeature(TDObject):
+    """A user tried to use a Premium story feature"""
+
+    feature: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('feature')
+        if value is not None:
+            value = PremiumStoryFeature(value)
+        self.feature = value
+
+
+@dataclass
+class PremiumSourceLink(TDObject):
+    """A user opened an internal link of the type internalLinkTypePremiumFeatures"""
+
+    referrer: str = None
+
+    def _decode(self, raw: dict):
+        self.referrer = raw.get('referrer')
+
+
+@dataclass
+class PremiumSourceSettings(TDObject):
+    """A user opened the Premium features screen from settings"""
+
+
+@dataclass
+class PremiumFeaturePromotionAnimation(TDObject):
+    """Describes a promotion animation for a Premium feature"""
+
+    feature: TDObject = None
+    animation: Animation = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('feature')
+        if value is not None:
+            value = PremiumFeature(value)
+        self.feature = value
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+
+
+@dataclass
+class PremiumState(TDObject):
+    """
+    Contains state of Telegram Premium subscription and promotion videos for
+    Premium features
+    """
+
+    state: FormattedText = None
+    payment_options: List[PremiumStatePaymentOption] = None
+    animations: List[PremiumFeaturePromotionAnimation] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('state')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.state = value
+        value = raw.get('payment_options')
+        if value is not None:
+            value = [PremiumStatePaymentOption.from_raw(item0) for item0 in value]
+        self.payment_options = value
+        value = raw.get('animations')
+        if value is not None:
+            value = [PremiumFeaturePromotionAnimation.from_raw(item0) for item0 in value]
+        self.animations = value
+
+
+@dataclass
+class StorePaymentPurposePremiumSubscription(TDObject):
+    """The user subscribing to Telegram Premium"""
+
+    is_restore: bool = None
+    is_upgrade: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_restore = raw.get('is_restore')
+        self.is_upgrade = raw.get('is_upgrade')
+
+
+@dataclass
+class StorePaymentPurposeGiftedPremium(TDObject):
+    """The user gifting Telegram Premium to another user"""
+
+    user_id: int = None
+    currency: str = None
+    amount: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+
+
+@dataclass
+class StorePaymentPurposePremiumGiftCodes(TDObject):
+    """The user creating Telegram Premium gift codes for other users"""
+
+    boosted_chat_id: int = None
+    currency: str = None
+    amount: int = None
+    user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.boosted_chat_id = raw.get('boosted_chat_id')
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+        self.user_ids = raw.get('user_ids')
+
+
+@dataclass
+class StorePaymentPurposePremiumGiveaway(TDObject):
+    """The user creating a Telegram Premium giveaway"""
+
+    parameters: PremiumGiveawayParameters = None
+    currency: str = None
+    amount: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('parameters')
+        if value is not None:
+            value = PremiumGiveawayParameters.from_raw(value)
+        self.parameters = value
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+
+
+@dataclass
+class TelegramPaymentPurposePremiumGiftCodes(TDObject):
+    """The user creating Telegram Premium gift codes for other users"""
+
+    boosted_chat_id: int = None
+    currency: str = None
+    amount: int = None
+    user_ids: List[int] = None
+    month_count: int = None
+
+    def _decode(self, raw: dict):
+        self.boosted_chat_id = raw.get('boosted_chat_id')
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+        self.user_ids = raw.get('user_ids')
+        self.month_count = raw.get('month_count')
+
+
+@dataclass
+class TelegramPaymentPurposePremiumGiveaway(TDObject):
+    """The user creating a Telegram Premium giveaway"""
+
+    parameters: PremiumGiveawayParameters = None
+    currency: str = None
+    amount: int = None
+    winner_count: int = None
+    month_count: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('parameters')
+        if value is not None:
+            value = PremiumGiveawayParameters.from_raw(value)
+        self.parameters = value
+        self.currency = raw.get('currency')
+        self.amount = raw.get('amount')
+        self.winner_count = raw.get('winner_count')
+        self.month_count = raw.get('month_count')
+
+
+@dataclass
+class DeviceTokenFirebaseCloudMessaging(TDObject):
+    """A token for Firebase Cloud Messaging"""
+
+    token: str = None
+    encrypt: bool = None
+
+    def _decode(self, raw: dict):
+        self.token = raw.get('token')
+        self.encrypt = raw.get('encrypt')
+
+
+@dataclass
+class DeviceTokenApplePush(TDObject):
+    """A token for Apple Push Notification service"""
+
+    device_token: str = None
+    is_app_sandbox: bool = None
+
+    def _decode(self, raw: dict):
+        self.device_token = raw.get('device_token')
+        self.is_app_sandbox = raw.get('is_app_sandbox')
+
+
+@dataclass
+class DeviceTokenApplePushVoIP(TDObject):
+    """A token for Apple Push Notification service VoIP notifications"""
+
+    device_token: str = None
+    is_app_sandbox: bool = None
+    encrypt: bool = None
+
+    def _decode(self, raw: dict):
+        self.device_token = raw.get('device_token')
+        self.is_app_sandbox = raw.get('is_app_sandbox')
+        self.encrypt = raw.get('encrypt')
+
+
+@dataclass
+class DeviceTokenWindowsPush(TDObject):
+    """A token for Windows Push Notification Services"""
+
+    access_token: str = None
+
+    def _decode(self, raw: dict):
+        self.access_token = raw.get('access_token')
+
+
+@dataclass
+class DeviceTokenMicrosoftPush(TDObject):
+    """A token for Microsoft Push Notification Service"""
+
+    channel_uri: str = None
+
+    def _decode(self, raw: dict):
+        self.channel_uri = raw.get('channel_uri')
+
+
+@dataclass
+class DeviceTokenMicrosoftPushVoIP(TDObject):
+    """A token for Microsoft Push Notification Service VoIP channel"""
+
+    channel_uri: str = None
+
+    def _decode(self, raw: dict):
+        self.channel_uri = raw.get('channel_uri')
+
+
+@dataclass
+class DeviceTokenWebPush(TDObject):
+    """A token for web Push API"""
+
+    endpoint: str = None
+    p256dh_base64url: str = None
+    auth_base64url: str = None
+
+    def _decode(self, raw: dict):
+        self.endpoint = raw.get('endpoint')
+        self.p256dh_base64url = raw.get('p256dh_base64url')
+        self.auth_base64url = raw.get('auth_base64url')
+
+
+@dataclass
+class DeviceTokenSimplePush(TDObject):
+    """A token for Simple Push API for Firefox OS"""
+
+    endpoint: str = None
+
+    def _decode(self, raw: dict):
+        self.endpoint = raw.get('endpoint')
+
+
+@dataclass
+class DeviceTokenUbuntuPush(TDObject):
+    """A token for Ubuntu Push Client service"""
+
+    token: str = None
+
+    def _decode(self, raw: dict):
+        self.token = raw.get('token')
+
+
+@dataclass
+class DeviceTokenBlackBerryPush(TDObject):
+    """A token for BlackBerry Push Service"""
+
+    token: str = None
+
+    def _decode(self, raw: dict):
+        self.token = raw.get('token')
+
+
+@dataclass
+class DeviceTokenTizenPush(TDObject):
+    """A token for Tizen Push Service"""
+
+    reg_id: str = None
+
+    def _decode(self, raw: dict):
+        self.reg_id = raw.get('reg_id')
+
+
+@dataclass
+class DeviceTokenHuaweiPush(TDObject):
+    """A token for HUAWEI Push Service"""
+
+    token: str = None
+    encrypt: bool = None
+
+    def _decode(self, raw: dict):
+        self.token = raw.get('token')
+        self.encrypt = raw.get('encrypt')
+
+
+@dataclass
+class PushReceiverId(TDObject):
+    """
+    Contains a globally unique push receiver identifier, which can be used to
+    identify which account has received a push notification
+    """
+
+    id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+
+
+@dataclass
+class BackgroundFillSolid(TDObject):
+    """Describes a solid fill of a background"""
+
+    color: int = None
+
+    def _decode(self, raw: dict):
+        self.color = raw.get('color')
+
+
+@dataclass
+class BackgroundFillGradient(TDObject):
+    """Describes a gradient fill of a background"""
+
+    top_color: int = None
+    bottom_color: int = None
+    rotation_angle: int = None
+
+    def _decode(self, raw: dict):
+        self.top_color = raw.get('top_color')
+        self.bottom_color = raw.get('bottom_color')
+        self.rotation_angle = raw.get('rotation_angle')
+
+
+@dataclass
+class BackgroundFillFreeformGradient(TDObject):
+    """Describes a freeform gradient fill of a background"""
+
+    colors: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.colors = raw.get('colors')
+
+
+@dataclass
+class BackgroundTypeWallpaper(TDObject):
+    """A wallpaper in JPEG format"""
+
+    is_blurred: bool = None
+    is_moving: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_blurred = raw.get('is_blurred')
+        self.is_moving = raw.get('is_moving')
+
+
+@dataclass
+class BackgroundTypePattern(TDObject):
+    """
+    A PNG or TGV (gzipped subset of SVG with MIME type
+    "application/x-tgwallpattern") pattern to be combined with the background fill
+    chosen by the user
+    """
+
+    fill: TDObject = None
+    intensity: int = None
+    is_inverted: bool = None
+    is_moving: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('fill')
+        if value is not None:
+            value = BackgroundFill(value)
+        self.fill = value
+        self.intensity = raw.get('intensity')
+        self.is_inverted = raw.get('is_inverted')
+        self.is_moving = raw.get('is_moving')
+
+
+@dataclass
+class BackgroundTypeFill(TDObject):
+    """A filled background"""
+
+    fill: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('fill')
+        if value is not None:
+            value = BackgroundFill(value)
+        self.fill = value
+
+
+@dataclass
+class BackgroundTypeChatTheme(TDObject):
+    """
+    A background from a chat theme; can be used only as a chat background in
+    channels
+    """
+
+    theme_name: str = None
+
+    def _decode(self, raw: dict):
+        self.theme_name = raw.get('theme_name')
+
+
+@dataclass
+class InputBackgroundLocal(TDObject):
+    """A background from a local file"""
+
+    background: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('background')
+        if value is not None:
+            value = InputFile(value)
+        self.background = value
+
+
+@dataclass
+class InputBackgroundRemote(TDObject):
+    """A background from the server"""
+
+    background_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('background_id')
+        if value is not None:
+            value = int(value)
+        self.background_id = value
+
+
+@dataclass
+class InputBackgroundPrevious(TDObject):
+    """A background previously set in the chat; for chat backgrounds only"""
+
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class ThemeSettings(TDObject):
+    """Describes theme settings"""
+
+    accent_color: int = None
+    background: Background = None
+    outgoing_message_fill: TDObject = None
+    animate_outgoing_message_fill: bool = None
+    outgoing_message_accent_color: int = None
+
+    def _decode(self, raw: dict):
+        self.accent_color = raw.get('accent_color')
+        value = raw.get('background')
+        if value is not None:
+            value = Background.from_raw(value)
+        self.background = value
+        value = raw.get('outgoing_message_fill')
+        if value is not None:
+            value = BackgroundFill(value)
+        self.outgoing_message_fill = value
+        self.animate_outgoing_message_fill = raw.get('animate_outgoing_message_fill')
+        self.outgoing_message_accent_color = raw.get('outgoing_message_accent_color')
+
+
+@dataclass
+class ChatTheme(TDObject):
+    """Describes a chat theme"""
+
+    name: str = None
+    light_settings: ThemeSettings = None
+    dark_settings: ThemeSettings = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+        value = raw.get('light_settings')
+        if value is not None:
+            value = ThemeSettings.from_raw(value)
+        self.light_settings = value
+        value = raw.get('dark_settings')
+        if value is not None:
+            value = ThemeSettings.from_raw(value)
+        self.dark_settings = value
+
+
+@dataclass
+class TimeZone(TDObject):
+    """Describes a time zone"""
+
+    id: str = None
+    name: str = None
+    utc_time_offset: int = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.name = raw.get('name')
+        self.utc_time_offset = raw.get('utc_time_offset')
+
+
+@dataclass
+class TimeZones(TDObject):
+    """Contains a list of time zones"""
+
+    time_zones: List[TimeZone] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('time_zones')
+        if value is not None:
+            value = [TimeZone.from_raw(item0) for item0 in value]
+        self.time_zones = value
+
+
+@dataclass
+class Hashtags(TDObject):
+    """Contains a list of hashtags"""
+
+    hashtags: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.hashtags = raw.get('hashtags')
+
+
+@dataclass
+class CanSendStoryResultOk(TDObject):
+    """A story can be sent"""
+
+
+@dataclass
+class CanSendStoryResultPremiumNeeded(TDObject):
+    """The user must subscribe to Telegram Premium to be able to post stories"""
+
+
+@dataclass
+class CanSendStoryResultBoostNeeded(TDObject):
+    """
+    The chat must be boosted first by Telegram Premium subscribers to post more
+    stories. Call getChatBoostStatus to get current boost status of the chat
+    """
+
+
+@dataclass
+class CanSendStoryResultActiveStoryLimitExceeded(TDObject):
+    """
+    The limit for the number of active stories exceeded. The user can buy Telegram
+    Premium, delete an active story, or wait for the oldest story to expire
+    """
+
+
+@dataclass
+class CanSendStoryResultWeeklyLimitExceeded(TDObject):
+    """
+    The weekly limit for the number of posted stories exceeded. The user needs to
+    buy Telegram Premium or wait specified time
+    """
+
+    retry_after: int = None
+
+    def _decode(self, raw: dict):
+        self.retry_after = raw.get('retry_after')
+
+
+@dataclass
+class CanSendStoryResultMonthlyLimitExceeded(TDObject):
+    """
+    The monthly limit for the number of posted stories exceeded. The user needs to
+    buy Telegram Premium or wait specified time
+    """
+
+    retry_after: int = None
+
+    def _decode(self, raw: dict):
+        self.retry_after = raw.get('retry_after')
+
+
+@dataclass
+class CanTransferOwnershipResultOk(TDObject):
+    """The session can be used"""
+
+
+@dataclass
+class CanTransferOwnershipResultPasswordNeeded(TDObject):
+    """The 2-step verification needs to be enabled first"""
+
+
+@dataclass
+class CanTransferOwnershipResultPasswordTooFresh(TDObject):
+    """The 2-step verification was enabled recently, user needs to wait"""
+
+    retry_after: int = None
+
+    def _decode(self, raw: dict):
+        self.retry_after = raw.get('retry_after')
+
+
+@dataclass
+class CanTransferOwnershipResultSessionTooFresh(TDObject):
+    """The session was created recently, user needs to wait"""
+
+    retry_after: int = None
+
+    def _decode(self, raw: dict):
+        self.retry_after = raw.get('retry_after')
+
+
+@dataclass
+class CheckChatUsernameResultOk(TDObject):
+    """The username can be set"""
+
+
+@dataclass
+class CheckChatUsernameResultUsernameInvalid(TDObject):
+    """The username is invalid"""
+
+
+@dataclass
+class CheckChatUsernameResultUsernameOccupied(TDObject):
+    """The username is occupied"""
+
+
+@dataclass
+class CheckChatUsernameResultUsernamePurchasable(TDObject):
+    """The username can be purchased at fragment.com"""
+
+
+@dataclass
+class CheckChatUsernameResultPublicChatsTooMany(TDObject):
+    """
+    The user has too many chats with username, one of them must be made private
+    first
+    """
+
+
+@dataclass
+class CheckChatUsernameResultPublicGroupsUnavailable(TDObject):
+    """The user can't be a member of a public supergroup"""
+
+
+@dataclass
+class CheckStickerSetNameResultOk(TDObject):
+    """The name can be set"""
+
+
+@dataclass
+class CheckStickerSetNameResultNameInvalid(TDObject):
+    """The name is invalid"""
+
+
+@dataclass
+class CheckStickerSetNameResultNameOccupied(TDObject):
+    """The name is occupied"""
+
+
+@dataclass
+class ResetPasswordResultOk(TDObject):
+    """The password was reset"""
+
+
+@dataclass
+class ResetPasswordResultPending(TDObject):
+    """The password reset request is pending"""
+
+    pending_reset_date: int = None
+
+    def _decode(self, raw: dict):
+        self.pending_reset_date = raw.get('pending_reset_date')
+
+
+@dataclass
+class ResetPasswordResultDeclined(TDObject):
+    """The password reset request was declined"""
+
+    retry_date: int = None
+
+    def _decode(self, raw: dict):
+        self.retry_date = raw.get('retry_date')
+
+
+@dataclass
+class MessageFileTypePrivate(TDObject):
+    """The messages were exported from a private chat"""
+
+    name: str = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+
+
+@dataclass
+class MessageFileTypeGroup(TDObject):
+    """The messages were exported from a group chat"""
+
+    title: str = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+
+
+@dataclass
+class MessageFileTypeUnknown(TDObject):
+    """The messages were exported from a chat of unknown type"""
+
+
+@dataclass
+class PushMessageContentHidden(TDObject):
+    """A general message with hidden content"""
+
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentAnimation(TDObject):
+    """An animation message (GIF-style)."""
+
+    animation: Animation = None
+    caption: str = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('animation')
+        if value is not None:
+            value = Animation.from_raw(value)
+        self.animation = value
+        self.caption = raw.get('caption')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentAudio(TDObject):
+    """An audio message"""
+
+    audio: Audio = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('audio')
+        if value is not None:
+            value = Audio.from_raw(value)
+        self.audio = value
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentContact(TDObject):
+    """A message with a user contact"""
+
+    name: str = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentContactRegistered(TDObject):
+    """A contact has registered with Telegram"""
+
+
+@dataclass
+class PushMessageContentDocument(TDObject):
+    """A document message (a general file)"""
+
+    document: Document = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('document')
+        if value is not None:
+            value = Document.from_raw(value)
+        self.document = value
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentGame(TDObject):
+    """A message with a game"""
+
+    title: str = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentGameScore(TDObject):
+    """A new high score was achieved in a game"""
+
+    title: str = None
+    score: int = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+        self.score = raw.get('score')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentInvoice(TDObject):
+    """A message with an invoice from a bot"""
+
+    price: str = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.price = raw.get('price')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentLocation(TDObject):
+    """A message with a location"""
+
+    is_live: bool = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_live = raw.get('is_live')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentPhoto(TDObject):
+    """A photo message"""
+
+    photo: Photo = None
+    caption: str = None
+    is_secret: bool = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('photo')
+        if value is not None:
+            value = Photo.from_raw(value)
+        self.photo = value
+        self.caption = raw.get('caption')
+        self.is_secret = raw.get('is_secret')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentPoll(TDObject):
+    """A message with a poll"""
+
+    question: str = None
+    is_regular: bool = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.question = raw.get('question')
+        self.is_regular = raw.get('is_regular')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentPremiumGiftCode(TDObject):
+    """A message with a Telegram Premium gift code created for the user"""
+
+    month_count: int = None
+
+    def _decode(self, raw: dict):
+        self.month_count = raw.get('month_count')
+
+
+@dataclass
+class PushMessageContentPremiumGiveaway(TDObject):
+    """A message with a Telegram Premium giveaway"""
+
+    winner_count: int = None
+    month_count: int = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.winner_count = raw.get('winner_count')
+        self.month_count = raw.get('month_count')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentScreenshotTaken(TDObject):
+    """A screenshot of a message in the chat has been taken"""
+
+
+@dataclass
+class PushMessageContentSticker(TDObject):
+    """A message with a sticker"""
+
+    sticker: Sticker = None
+    emoji: str = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+        self.emoji = raw.get('emoji')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentStory(TDObject):
+    """A message with a story"""
+
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentText(TDObject):
+    """A text message"""
+
+    text: str = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentVideo(TDObject):
+    """A video message"""
+
+    video: Video = None
+    caption: str = None
+    is_secret: bool = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video')
+        if value is not None:
+            value = Video.from_raw(value)
+        self.video = value
+        self.caption = raw.get('caption')
+        self.is_secret = raw.get('is_secret')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentVideoNote(TDObject):
+    """A video note message"""
+
+    video_note: VideoNote = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('video_note')
+        if value is not None:
+            value = VideoNote.from_raw(value)
+        self.video_note = value
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentVoiceNote(TDObject):
+    """A voice note message"""
+
+    voice_note: VoiceNote = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('voice_note')
+        if value is not None:
+            value = VoiceNote.from_raw(value)
+        self.voice_note = value
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class PushMessageContentBasicGroupChatCreate(TDObject):
+    """A newly created basic group"""
+
+
+@dataclass
+class PushMessageContentChatAddMembers(TDObject):
+    """New chat members were invited to a group"""
+
+    member_name: str = None
+    is_current_user: bool = None
+    is_returned: bool = None
+
+    def _decode(self, raw: dict):
+        self.member_name = raw.get('member_name')
+        self.is_current_user = raw.get('is_current_user')
+        self.is_returned = raw.get('is_returned')
+
+
+@dataclass
+class PushMessageContentChatChangePhoto(TDObject):
+    """A chat photo was edited"""
+
+
+@dataclass
+class PushMessageContentChatChangeTitle(TDObject):
+    """A chat title was edited"""
+
+    title: str = None
+
+    def _decode(self, raw: dict):
+        self.title = raw.get('title')
+
+
+@dataclass
+class PushMessageContentChatSetBackground(TDObject):
+    """A chat background was edited"""
+
+    is_same: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_same = raw.get('is_same')
+
+
+@dataclass
+class PushMessageContentChatSetTheme(TDObject):
+    """A chat theme was edited"""
+
+    theme_name: str = None
+
+    def _decode(self, raw: dict):
+        self.theme_name = raw.get('theme_name')
+
+
+@dataclass
+class PushMessageContentChatDeleteMember(TDObject):
+    """A chat member was deleted"""
+
+    member_name: str = None
+    is_current_user: bool = None
+    is_left: bool = None
+
+    def _decode(self, raw: dict):
+        self.member_name = raw.get('member_name')
+        self.is_current_user = raw.get('is_current_user')
+        self.is_left = raw.get('is_left')
+
+
+@dataclass
+class PushMessageContentChatJoinByLink(TDObject):
+    """A new member joined the chat via an invite link"""
+
+
+@dataclass
+class PushMessageContentChatJoinByRequest(TDObject):
+    """A new member was accepted to the chat by an administrator"""
+
+
+@dataclass
+class PushMessageContentRecurringPayment(TDObject):
+    """A new recurring payment was made by the current user"""
+
+    amount: str = None
+
+    def _decode(self, raw: dict):
+        self.amount = raw.get('amount')
+
+
+@dataclass
+class PushMessageContentSuggestProfilePhoto(TDObject):
+    """A profile photo was suggested to the user"""
+
+
+@dataclass
+class PushMessageContentMessageForwards(TDObject):
+    """A forwarded messages"""
+
+    total_count: int = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+
+
+@dataclass
+class PushMessageContentMediaAlbum(TDObject):
+    """A media album"""
+
+    total_count: int = None
+    has_photos: bool = None
+    has_videos: bool = None
+    has_audios: bool = None
+    has_documents: bool = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        self.has_photos = raw.get('has_photos')
+        self.has_videos = raw.get('has_videos')
+        self.has_audios = raw.get('has_audios')
+        self.has_documents = raw.get('has_documents')
+
+
+@dataclass
+class NotificationTypeNewMessage(TDObject):
+    """New message was received"""
+
+    message: Message = None
+    show_preview: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+        self.show_preview = raw.get('show_preview')
+
+
+@dataclass
+class NotificationTypeNewSecretChat(TDObject):
+    """New secret chat was created"""
+
+
+@dataclass
+class NotificationTypeNewCall(TDObject):
+    """New call was received"""
+
+    call_id: int = None
+
+    def _decode(self, raw: dict):
+        self.call_id = raw.get('call_id')
+
+
+@dataclass
+class NotificationTypeNewPushMessage(TDObject):
+    """New message was received through a push notification"""
+
+    message_id: int = None
+    sender_id: TDObject = None
+    sender_name: str = None
+    is_outgoing: bool = None
+    content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.message_id = raw.get('message_id')
+        value = raw.get('sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.sender_id = value
+        self.sender_name = raw.get('sender_name')
+        self.is_outgoing = raw.get('is_outgoing')
+        value = raw.get('content')
+        if value is not None:
+            value = PushMessageContent(value)
+        self.content = value
+
+
+@dataclass
+class NotificationGroupTypeMessages(TDObject):
+    """
+    A group containing notifications of type notificationTypeNewMessage and
+    notificationTypeNewPushMessage with ordinary unread messages
+    """
+
+
+@dataclass
+class NotificationGroupTypeMentions(TDObject):
+    """
+    A group containing notifications of type notificationTypeNewMessage and
+    notificationTypeNewPushMessage with unread mentions of the current user,
+    replies to their messages, or a pinned message
+    """
+
+
+@dataclass
+class NotificationGroupTypeSecretChat(TDObject):
+    """A group containing a notification of type notificationTypeNewSecretChat"""
+
+
+@dataclass
+class NotificationGroupTypeCalls(TDObject):
+    """A group containing notifications of type notificationTypeNewCall"""
+
+
+@dataclass
+class NotificationSound(TDObject):
+    """Describes a notification sound in MP3 format"""
+
+    id: int = None
+    duration: int = None
+    date: int = None
+    title: str = None
+    data: str = None
+    sound: File = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.duration = raw.get('duration')
+        self.date = raw.get('date')
+        self.title = raw.get('title')
+        self.data = raw.get('data')
+        value = raw.get('sound')
+        if value is not None:
+            value = File.from_raw(value)
+        self.sound = value
+
+
+@dataclass
+class NotificationSounds(TDObject):
+    """Contains a list of notification sounds"""
+
+    notification_sounds: List[NotificationSound] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('notification_sounds')
+        if value is not None:
+            value = [NotificationSound.from_raw(item0) for item0 in value]
+        self.notification_sounds = value
+
+
+@dataclass
+class Notification(TDObject):
+    """Contains information about a notification"""
+
+    id: int = None
+    date: int = None
+    is_silent: bool = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.date = raw.get('date')
+        self.is_silent = raw.get('is_silent')
+        value = raw.get('type')
+        if value is not None:
+            value = NotificationType(value)
+        self.type = value
+
+
+@dataclass
+class NotificationGroup(TDObject):
+    """Describes a group of notifications"""
+
+    id: int = None
+    type: TDObject = None
+    chat_id: int = None
+    total_count: int = None
+    notifications: List[Notification] = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        value = raw.get('type')
+        if value is not None:
+            value = NotificationGroupType(value)
+        self.type = value
+        self.chat_id = raw.get('chat_id')
+        self.total_count = raw.get('total_count')
+        value = raw.get('notifications')
+        if value is not None:
+            value = [Notification.from_raw(item0) for item0 in value]
+        self.notifications = value
+
+
+@dataclass
+class OptionValueBoolean(TDObject):
+    """Represents a boolean option"""
+
+    value: bool = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class OptionValueEmpty(TDObject):
+    """Represents an unknown option or an option which has a default value"""
+
+
+@dataclass
+class OptionValueInteger(TDObject):
+    """Represents an integer option"""
+
+    value: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('value')
+        if value is not None:
+            value = int(value)
+        self.value = value
+
+
+@dataclass
+class OptionValueString(TDObject):
+    """Represents a string option"""
+
+    value: str = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class JsonObjectMember(TDObject):
+    """Represents one member of a JSON object"""
+
+    key: str = None
+    value: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.key = raw.get('key')
+        value = raw.get('value')
+        if value is not None:
+            value = JsonValue(value)
+        self.value = value
+
+
+@dataclass
+class JsonValueNull(TDObject):
+    """Represents a null JSON value"""
+
+
+@dataclass
+class JsonValueBoolean(TDObject):
+    """Represents a boolean JSON value"""
+
+    value: bool = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class JsonValueNumber(TDObject):
+    """Represents a numeric JSON value"""
+
+    value: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('value')
+        if value is not None:
+            value = float(value)
+        self.value = value
+
+
+@dataclass
+class JsonValueString(TDObject):
+    """Represents a string JSON value"""
+
+    value: str = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class JsonValueArray(TDObject):
+    """Represents a JSON array"""
+
+    values: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('values')
+        if value is not None:
+            value = [JsonValue(item0) for item0 in value]
+        self.values = value
+
+
+@dataclass
+class JsonValueObject(TDObject):
+    """Represents a JSON object"""
+
+    members: List[JsonObjectMember] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('members')
+        if value is not None:
+            value = [JsonObjectMember.from_raw(item0) for item0 in value]
+        self.members = value
+
+
+@dataclass
+class StoryPrivacySettingsEveryone(TDObject):
+    """The story can be viewed by everyone"""
+
+    except_user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.except_user_ids = raw.get('except_user_ids')
+
+
+@dataclass
+class StoryPrivacySettingsContacts(TDObject):
+    """The story can be viewed by all contacts except chosen users"""
+
+    except_user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.except_user_ids = raw.get('except_user_ids')
+
+
+@dataclass
+class StoryPrivacySettingsCloseFriends(TDObject):
+    """The story can be viewed by all close friends"""
+
+
+@dataclass
+class StoryPrivacySettingsSelectedUsers(TDObject):
+    """The story can be viewed by certain specified users"""
+
+    user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.user_ids = raw.get('user_ids')
+
+
+@dataclass
+class UserPrivacySettingRuleAllowAll(TDObject):
+    """A rule to allow all users to do something"""
+
+
+@dataclass
+class UserPrivacySettingRuleAllowContacts(TDObject):
+    """A rule to allow all contacts of the user to do something"""
+
+
+@dataclass
+class UserPrivacySettingRuleAllowUsers(TDObject):
+    """A rule to allow certain specified users to do something"""
+
+    user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.user_ids = raw.get('user_ids')
+
+
+@dataclass
+class UserPrivacySettingRuleAllowChatMembers(TDObject):
+    """
+    A rule to allow all members of certain specified basic groups and supergroups
+    to doing something
+    """
+
+    chat_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.chat_ids = raw.get('chat_ids')
+
+
+@dataclass
+class UserPrivacySettingRuleRestrictAll(TDObject):
+    """A rule to restrict all users from doing something"""
+
+
+@dataclass
+class UserPrivacySettingRuleRestrictContacts(TDObject):
+    """A rule to restrict all contacts of the user from doing something"""
+
+
+@dataclass
+class UserPrivacySettingRuleRestrictUsers(TDObject):
+    """A rule to restrict all specified users from doing something"""
+
+    user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.user_ids = raw.get('user_ids')
+
+
+@dataclass
+class UserPrivacySettingRuleRestrictChatMembers(TDObject):
+    """
+    A rule to restrict all members of specified basic groups and supergroups from
+    doing something
+    """
+
+    chat_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.chat_ids = raw.get('chat_ids')
+
+
+@dataclass
+class UserPrivacySettingRules(TDObject):
+    """
+    A list of privacy rules. Rules are matched in the specified order. The first
+    matched rule defines the privacy setting for a given user. If no rule matches,
+    the action is not allowed
+    """
+
+    rules: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('rules')
+        if value is not None:
+            value = [UserPrivacySettingRule(item0) for item0 in value]
+        self.rules = value
+
+
+@dataclass
+class UserPrivacySettingShowStatus(TDObject):
+    """A privacy setting for managing whether the user's online status is visible"""
+
+
+@dataclass
+class UserPrivacySettingShowProfilePhoto(TDObject):
+    """A privacy setting for managing whether the user's profile photo is visible"""
+
+
+@dataclass
+class UserPrivacySettingShowLinkInForwardedMessages(TDObject):
+    """
+    A privacy setting for managing whether a link to the user's account is
+    included in forwarded messages
+    """
+
+
+@dataclass
+class UserPrivacySettingShowPhoneNumber(TDObject):
+    """A privacy setting for managing whether the user's phone number is visible"""
+
+
+@dataclass
+class UserPrivacySettingShowBio(TDObject):
+    """A privacy setting for managing whether the user's bio is visible"""
+
+
+@dataclass
+class UserPrivacySettingAllowChatInvites(TDObject):
+    """A privacy setting for managing whether the user can be invited to chats"""
+
+
+@dataclass
+class UserPrivacySettingAllowCalls(TDObject):
+    """A privacy setting for managing whether the user can be called"""
+
+
+@dataclass
+class UserPrivacySettingAllowPeerToPeerCalls(TDObject):
+    """
+    A privacy setting for managing whether peer-to-peer connections can be used
+    for calls
+    """
+
+
+@dataclass
+class UserPrivacySettingAllowFindingByPhoneNumber(TDObject):
+    """
+    A privacy setting for managing whether the user can be found by their phone
+    number. Checked only if the phone number is not known to the other user. Can
+    be set only to "Allow contacts" or "Allow all\"
+    """
+
+
+@dataclass
+class UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages(TDObject):
+    """
+    A privacy setting for managing whether the user can receive voice and video
+    messages in private chats; for Telegram Premium users only
+    """
+
+
+@dataclass
+class ReadDatePrivacySettings(TDObject):
+    """
+    Contains privacy settings for message read date in private chats. Read dates
+    are always shown to the users that can see online status of the current user
+    regardless of this setting
+    """
+
+    show_read_date: bool = None
+
+    def _decode(self, raw: dict):
+        self.show_read_date = raw.get('show_read_date')
+
+
+@dataclass
+class NewChatPrivacySettings(TDObject):
+    """Contains privacy settings for new chats with non-contacts"""
+
+    allow_new_chats_from_unknown_users: bool = None
+
+    def _decode(self, raw: dict):
+        self.allow_new_chats_from_unknown_users = raw.get('allow_new_chats_from_unknown_users')
+
+
+@dataclass
+class CanSendMessageToUserResultOk(TDObject):
+    """The user can be messaged"""
+
+
+@dataclass
+class CanSendMessageToUserResultUserIsDeleted(TDObject):
+    """The user can't be messaged, because they are deleted or unknown"""
+
+
+@dataclass
+class CanSendMessageToUserResultUserRestrictsNewChats(TDObject):
+    """The user can't be messaged, because they restrict new chats with non-contacts"""
+
+
+@dataclass
+class AccountTtl(TDObject):
+    """
+    Contains information about the period of inactivity after which the current
+    user's account will automatically be deleted
+    """
+
+    days: int = None
+
+    def _decode(self, raw: dict):
+        self.days = raw.get('days')
+
+
+@dataclass
+class MessageAutoDeleteTime(TDObject):
+    """Contains default auto-delete timer setting for new chats"""
+
+    time: int = None
+
+    def _decode(self, raw: dict):
+        self.time = raw.get('time')
+
+
+@dataclass
+class SessionTypeAndroid(TDObject):
+    """The session is running on an Android device"""
+
+
+@dataclass
+class SessionTypeApple(TDObject):
+    """The session is running on a generic Apple device"""
+
+
+@dataclass
+class SessionTypeBrave(TDObject):
+    """The session is running on the Brave browser"""
+
+
+@dataclass
+class SessionTypeChrome(TDObject):
+    """The session is running on the Chrome browser"""
+
+
+@dataclass
+class SessionTypeEdge(TDObject):
+    """The session is running on the Edge browser"""
+
+
+@dataclass
+class SessionTypeFirefox(TDObject):
+    """The session is running on the Firefox browser"""
+
+
+@dataclass
+class SessionTypeIpad(TDObject):
+    """The session is running on an iPad device"""
+
+
+@dataclass
+class SessionTypeIphone(TDObject):
+    """The session is running on an iPhone device"""
+
+
+@dataclass
+class SessionTypeLinux(TDObject):
+    """The session is running on a Linux device"""
+
+
+@dataclass
+class SessionTypeMac(TDObject):
+    """The session is running on a Mac device"""
+
+
+@dataclass
+class SessionTypeOpera(TDObject):
+    """The session is running on the Opera browser"""
+
+
+@dataclass
+class SessionTypeSafari(TDObject):
+    """The session is running on the Safari browser"""
+
+
+@dataclass
+class SessionTypeUbuntu(TDObject):
+    """The session is running on an Ubuntu device"""
+
+
+@dataclass
+class SessionTypeUnknown(TDObject):
+    """The session is running on an unknown type of device"""
+
+
+@dataclass
+class SessionTypeVivaldi(TDObject):
+    """The session is running on the Vivaldi browser"""
+
+
+@dataclass
+class SessionTypeWindows(TDObject):
+    """The session is running on a Windows device"""
+
+
+@dataclass
+class SessionTypeXbox(TDObject):
+    """The session is running on an Xbox console"""
+
+
+@dataclass
+class Session(TDObject):
+    """
+    Contains information about one session in a Telegram application used by the
+    current user. Sessions must be shown to the user in the returned order
+    """
+
+    id: int = None
+    is_current: bool = None
+    is_password_pending: bool = None
+    is_unconfirmed: bool = None
+    can_accept_secret_chats: bool = None
+    can_accept_calls: bool = None
+    type: TDObject = None
+    api_id: int = None
+    application_name: str = None
+    application_version: str = None
+    is_official_application: bool = None
+    device_model: str = None
+    platform: str = None
+    system_version: str = None
+    log_in_date: int = None
+    last_active_date: int = None
+    ip_address: str = None
+    location: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.is_current = raw.get('is_current')
+        self.is_password_pending = raw.get('is_password_pending')
+        self.is_unconfirmed = raw.get('is_unconfirmed')
+        self.can_accept_secret_chats = raw.get('can_accept_secret_chats')
+        self.can_accept_calls = raw.get('can_accept_calls')
+        value = raw.get('type')
+        if value is not None:
+            value = SessionType(value)
+        self.type = value
+        self.api_id = raw.get('api_id')
+        self.application_name = raw.get('application_name')
+        self.application_version = raw.get('application_version')
+        self.is_official_application = raw.get('is_official_application')
+        self.device_model = raw.get('device_model')
+        self.platform = raw.get('platform')
+        self.system_version = raw.get('system_version')
+        self.log_in_date = raw.get('log_in_date')
+        self.last_active_date = raw.get('last_active_date')
+        self.ip_address = raw.get('ip_address')
+        self.location = raw.get('location')
+
+
+@dataclass
+class Sessions(TDObject):
+    """Contains a list of sessions"""
+
+    sessions: List[Session] = None
+    inactive_session_ttl_days: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sessions')
+        if value is not None:
+            value = [Session.from_raw(item0) for item0 in value]
+        self.sessions = value
+        self.inactive_session_ttl_days = raw.get('inactive_session_ttl_days')
+
+
+@dataclass
+class UnconfirmedSession(TDObject):
+    """Contains information about an unconfirmed session"""
+
+    id: int = None
+    log_in_date: int = None
+    device_model: str = None
+    location: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.log_in_date = raw.get('log_in_date')
+        self.device_model = raw.get('device_model')
+        self.location = raw.get('location')
+
+
+@dataclass
+class ConnectedWebsite(TDObject):
+    """
+    Contains information about one website the current user is logged in with
+    Telegram
+    """
+
+    id: int = None
+    domain_name: str = None
+    bot_user_id: int = None
+    browser: str = None
+    platform: str = None
+    log_in_date: int = None
+    last_active_date: int = None
+    ip_address: str = None
+    location: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.domain_name = raw.get('domain_name')
+        self.bot_user_id = raw.get('bot_user_id')
+        self.browser = raw.get('browser')
+        self.platform = raw.get('platform')
+        self.log_in_date = raw.get('log_in_date')
+        self.last_active_date = raw.get('last_active_date')
+        self.ip_address = raw.get('ip_address')
+        self.location = raw.get('location')
+
+
+@dataclass
+class ConnectedWebsites(TDObject):
+    """Contains a list of websites the current user is logged in with Telegram"""
+
+    websites: List[ConnectedWebsite] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('websites')
+        if value is not None:
+            value = [ConnectedWebsite.from_raw(item0) for item0 in value]
+        self.websites = value
+
+
+@dataclass
+class ReportReasonSpam(TDObject):
+    """The chat contains spam messages"""
+
+
+@dataclass
+class ReportReasonViolence(TDObject):
+    """The chat promotes violence"""
+
+
+@dataclass
+class ReportReasonPornography(TDObject):
+    """The chat contains pornographic messages"""
+
+
+@dataclass
+class ReportReasonChildAbuse(TDObject):
+    """The chat has child abuse related content"""
+
+
+@dataclass
+class ReportReasonCopyright(TDObject):
+    """The chat contains copyrighted content"""
+
+
+@dataclass
+class ReportReasonUnrelatedLocation(TDObject):
+    """The location-based chat is unrelated to its stated location"""
+
+
+@dataclass
+class ReportReasonFake(TDObject):
+    """The chat represents a fake account"""
+
+
+@dataclass
+class ReportReasonIllegalDrugs(TDObject):
+    """The chat has illegal drugs related content"""
+
+
+@dataclass
+class ReportReasonPersonalDetails(TDObject):
+    """The chat contains messages with personal details"""
+
+
+@dataclass
+class ReportReasonCustom(TDObject):
+    """A custom reason provided by the user"""
+
+
+@dataclass
+class TargetChatCurrent(TDObject):
+    """The currently opened chat needs to be kept"""
+
+
+@dataclass
+class TargetChatChosen(TDObject):
+    """The chat needs to be chosen by the user among chats of the specified types"""
+
+    allow_user_chats: bool = None
+    allow_bot_chats: bool = None
+    allow_group_chats: bool = None
+    allow_channel_chats: bool = None
+
+    def _decode(self, raw: dict):
+        self.allow_user_chats = raw.get('allow_user_chats')
+        self.allow_bot_chats = raw.get('allow_bot_chats')
+        self.allow_group_chats = raw.get('allow_group_chats')
+        self.allow_channel_chats = raw.get('allow_channel_chats')
+
+
+@dataclass
+class TargetChatInternalLink(TDObject):
+    """The chat needs to be open with the provided internal link"""
+
+    link: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('link')
+        if value is not None:
+            value = InternalLinkType(value)
+        self.link = value
+
+
+@dataclass
+class InternalLinkTypeActiveSessions(TDObject):
+    """
+    The link is a link to the Devices section of the application. Use
+    getActiveSessions to get the list of active sessions and show them to the user
+    """
+
+
+@dataclass
+class InternalLinkTypeAttachmentMenuBot(TDObject):
+    """
+    The link is a link to an attachment menu bot to be opened in the specified or
+    a chosen chat. Process given target_chat to open the chat. Then, call
+    searchPublicChat with the given bot username, check that the user is a bot and
+    can be added to attachment menu. Then, use getAttachmentMenuBot to receive
+    information about the bot. If the bot isn't added to attachment menu, then
+    show a disclaimer about Mini Apps being a third-party apps, ask the user to
+    accept their Terms of service and confirm adding the bot to side and
+    attachment menu. If the user accept the terms and confirms adding, then use
+    toggleBotIsAddedToAttachmentMenu to add the bot. If the attachment menu bot
+    can't be used in the opened chat, show an error to the user. If the bot is
+    added to attachment menu and can be used in the chat, then use openWebApp with
+    the given URL
+    """
+
+    target_chat: TDObject = None
+    bot_username: str = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('target_chat')
+        if value is not None:
+            value = TargetChat(value)
+        self.target_chat = value
+        self.bot_username = raw.get('bot_username')
+        self.url = raw.get('url')
+
+
+@dataclass
+class InternalLinkTypeAuthenticationCode(TDObject):
+    """
+    The link contains an authentication code. Call checkAuthenticationCode with
+    the code if the current authorization state is authorizationStateWaitCode
+    """
+
+    code: str = None
+
+    def _decode(self, raw: dict):
+        self.code = raw.get('code')
+
+
+@dataclass
+class InternalLinkTypeBackground(TDObject):
+    """
+    The link is a link to a background. Call searchBackground with the given
+    background name to process the link If background is found and the user wants
+    to apply it, then call setDefaultBackground
+    """
+
+    background_name: str = None
+
+    def _decode(self, raw: dict):
+        self.background_name = raw.get('background_name')
+
+
+@dataclass
+class InternalLinkTypeBotAddToChannel(TDObject):
+    """
+    The link is a link to a Telegram bot, which is supposed to be added to a
+    channel chat as an administrator. Call searchPublicChat with the given bot
+    username and check that the user is a bot, ask the current user to select a
+    channel chat to add the bot to as an administrator. Then, call getChatMember
+    to receive the current bot rights in the chat and if the bot already is an
+    administrator, check that the current user can edit its administrator rights
+    and combine received rights with the requested administrator rights. Then,
+    show confirmation box to the user, and call setChatMemberStatus with the
+    chosen chat and confirmed rights
+    """
+
+    bot_username: str = None
+    administrator_rights: ChatAdministratorRights = None
+
+    def _decode(self, raw: dict):
+        self.bot_username = raw.get('bot_username')
+        value = raw.get('administrator_rights')
+        if value is not None:
+            value = ChatAdministratorRights.from_raw(value)
+        self.administrator_rights = value
+
+
+@dataclass
+class InternalLinkTypeBotStart(TDObject):
+    """
+    The link is a link to a chat with a Telegram bot. Call searchPublicChat with
+    the given bot username, check that the user is a bot, show START button in the
+    chat with the bot, and then call sendBotStartMessage with the given start
+    parameter after the button is pressed
+    """
+
+    bot_username: str = None
+    start_parameter: str = None
+    autostart: bool = None
+
+    def _decode(self, raw: dict):
+        self.bot_username = raw.get('bot_username')
+        self.start_parameter = raw.get('start_parameter')
+        self.autostart = raw.get('autostart')
+
+
+@dataclass
+class InternalLinkTypeBotStartInGroup(TDObject):
+    """
+    The link is a link to a Telegram bot, which is supposed to be added to a group
+    chat. Call searchPublicChat with the given bot username, check that the user
+    is a bot and can be added to groups, ask the current user to select a basic
+    group or a supergroup chat to add the bot to, taking into account that bots
+    can be added to a public supergroup only by administrators of the supergroup.
+    If administrator rights are provided by the link, call getChatMember to
+    receive the current bot rights in the chat and if the bot already is an
+    administrator, check that the current user can edit its administrator rights,
+    combine received rights with the requested administrator rights, show
+    confirmation box to the user, and call setChatMemberStatus with the chosen
+    chat and confirmed administrator rights. Before call to setChatMemberStatus it
+    may be required to upgrade the chosen basic group chat to a supergroup chat.
+    Then, if start_parameter isn't empty, call sendBotStartMessage with the given
+    start parameter and the chosen chat; otherwise, just send /start message with
+    bot's username added to the chat.
+    """
+
+    bot_username: str = None
+    start_parameter: str = None
+    administrator_rights: ChatAdministratorRights = None
+
+    def _decode(self, raw: dict):
+        self.bot_username = raw.get('bot_username')
+        self.start_parameter = raw.get('start_parameter')
+        value = raw.get('administrator_rights')
+        if value is not None:
+            value = ChatAdministratorRights.from_raw(value)
+        self.administrator_rights = value
+
+
+@dataclass
+class InternalLinkTypeChangePhoneNumber(TDObject):
+    """The link is a link to the change phone number section of the app"""
+
+
+@dataclass
+class InternalLinkTypeChatBoost(TDObject):
+    """
+    The link is a link to boost a Telegram chat. Call getChatBoostLinkInfo with
+    the given URL to process the link. If the chat is found, then call
+    getChatBoostStatus and getAvailableChatBoostSlots to get the current boost
+    status and check whether the chat can be boosted. If the user wants to boost
+    the chat and the chat can be boosted, then call boostChat
+    """
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class InternalLinkTypeChatFolderInvite(TDObject):
+    """
+    The link is an invite link to a chat folder. Call checkChatFolderInviteLink
+    with the given invite link to process the link. If the link is valid and the
+    user wants to join the chat folder, then call addChatFolderByInviteLink
+    """
+
+    invite_link: str = None
+
+    def _decode(self, raw: dict):
+        self.invite_link = raw.get('invite_link')
+
+
+@dataclass
+class InternalLinkTypeChatFolderSettings(TDObject):
+    """The link is a link to the folder section of the app settings"""
+
+
+@dataclass
+class InternalLinkTypeChatInvite(TDObject):
+    """
+    The link is a chat invite link. Call checkChatInviteLink with the given invite
+    link to process the link. If the link is valid and the user wants to join the
+    chat, then call joinChatByInviteLink
+    """
+
+    invite_link: str = None
+
+    def _decode(self, raw: dict):
+        self.invite_link = raw.get('invite_link')
+
+
+@dataclass
+class InternalLinkTypeDefaultMessageAutoDeleteTimerSettings(TDObject):
+    """
+    The link is a link to the default message auto-delete timer settings section
+    of the app settings
+    """
+
+
+@dataclass
+class InternalLinkTypeEditProfileSettings(TDObject):
+    """The link is a link to the edit profile section of the app settings"""
+
+
+@dataclass
+class InternalLinkTypeGame(TDObject):
+    """
+    The link is a link to a game. Call searchPublicChat with the given bot
+    username, check that the user is a bot, ask the current user to select a chat
+    to send the game, and then call sendMessage with inputMessageGame
+    """
+
+    bot_username: str = None
+    game_short_name: str = None
+
+    def _decode(self, raw: dict):
+        self.bot_username = raw.get('bot_username')
+        self.game_short_name = raw.get('game_short_name')
+
+
+@dataclass
+class InternalLinkTypeInstantView(TDObject):
+    """
+    The link must be opened in an Instant View. Call getWebPageInstantView with
+    the given URL to process the link. If Instant View is found, then show it,
+    otherwise, open the fallback URL in an external browser
+    """
+
+    url: str = None
+    fallback_url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        self.fallback_url = raw.get('fallback_url')
+
+
+@dataclass
+class InternalLinkTypeInvoice(TDObject):
+    """
+    The link is a link to an invoice. Call getPaymentForm with the given invoice
+    name to process the link
+    """
+
+    invoice_name: str = None
+
+    def _decode(self, raw: dict):
+        self.invoice_name = raw.get('invoice_name')
+
+
+@dataclass
+class InternalLinkTypeLanguagePack(TDObject):
+    """
+    The link is a link to a language pack. Call getLanguagePackInfo with the given
+    language pack identifier to process the link. If the language pack is found
+    and the user wants to apply it, then call setOption for the option
+    "language_pack_id\"
+    """
+
+    language_pack_id: str = None
+
+    def _decode(self, raw: dict):
+        self.language_pack_id = raw.get('language_pack_id')
+
+
+@dataclass
+class InternalLinkTypeLanguageSettings(TDObject):
+    """The link is a link to the language section of the app settings"""
+
+
+@dataclass
+class InternalLinkTypeMessage(TDObject):
+    """
+    The link is a link to a Telegram message or a forum topic. Call
+    getMessageLinkInfo with the given URL to process the link, and then open
+    received forum topic or chat and show the message there
+    """
+
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+
+
+@dataclass
+class InternalLinkTypeMessageDraft(TDObject):
+    """
+    The link contains a message draft text. A share screen needs to be shown to
+    the user, then the chosen chat must be opened and the text is added to the
+    input field
+    """
+
+    text: FormattedText = None
+    contains_link: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.text = value
+        self.contains_link = raw.get('contains_link')
+
+
+@dataclass
+class InternalLinkTypePassportDataRequest(TDObject):
+    """
+    The link contains a request of Telegram passport data. Call
+    getPassportAuthorizationForm with the given parameters to process the link if
+    the link was received from outside of the application; otherwise, ignore it
+    """
+
+    bot_user_id: int = None
+    scope: str = None
+    public_key: str = None
+    nonce: str = None
+    callback_url: str = None
+
+    def _decode(self, raw: dict):
+        self.bot_user_id = raw.get('bot_user_id')
+        self.scope = raw.get('scope')
+        self.public_key = raw.get('public_key')
+        self.nonce = raw.get('nonce')
+        self.callback_url = raw.get('callback_url')
+
+
+@dataclass
+class InternalLinkTypePhoneNumberConfirmation(TDObject):
+    """
+    The link can be used to confirm ownership of a phone number to prevent account
+    deletion. Call sendPhoneNumberConfirmationCode with the given hash and phone
+    number to process the link. If succeeded, call
+    checkPhoneNumberConfirmationCode to check entered by the user code, or
+    resendPhoneNumberConfirmationCode to resend it
+    """
+
+    hash: str = None
+    phone_number: str = None
+
+    def _decode(self, raw: dict):
+        self.hash = raw.get('hash')
+        self.phone_number = raw.get('phone_number')
+
+
+@dataclass
+class InternalLinkTypePremiumFeatures(TDObject):
+    """
+    The link is a link to the Premium features screen of the application from
+    which the user can subscribe to Telegram Premium. Call getPremiumFeatures with
+    the given referrer to process the link
+    """
+
+    referrer: str = None
+
+    def _decode(self, raw: dict):
+        self.referrer = raw.get('referrer')
+
+
+@dataclass
+class InternalLinkTypePremiumGift(TDObject):
+    """
+    The link is a link to the screen for gifting Telegram Premium subscriptions to
+    friends via inputInvoiceTelegram payments or in-store purchases
+    """
+
+    referrer: str = None
+
+    def _decode(self, raw: dict):
+        self.referrer = raw.get('referrer')
+
+
+@dataclass
+class InternalLinkTypePremiumGiftCode(TDObject):
+    """
+    The link is a link with a Telegram Premium gift code. Call
+    checkPremiumGiftCode with the given code to process the link. If the code is
+    valid and the user wants to apply it, then call applyPremiumGiftCode
+    """
+
+    code: str = None
+
+    def _decode(self, raw: dict):
+        self.code = raw.get('code')
+
+
+@dataclass
+class InternalLinkTypePrivacyAndSecuritySettings(TDObject):
+    """The link is a link to the privacy and security section of the app settings"""
+
+
+@dataclass
+class InternalLinkTypeProxy(TDObject):
+    """
+    The link is a link to a proxy. Call addProxy with the given parameters to
+    process the link and add the proxy
+    """
+
+    server: str = None
+    port: int = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.server = raw.get('server')
+        self.port = raw.get('port')
+        value = raw.get('type')
+        if value is not None:
+            value = ProxyType(value)
+        self.type = value
+
+
+@dataclass
+class InternalLinkTypePublicChat(TDObject):
+    """
+    The link is a link to a chat by its username. Call searchPublicChat with the
+    given chat username to process the link If the chat is found, open its profile
+    information screen or the chat itself
+    """
+
+    chat_username: str = None
+
+    def _decode(self, raw: dict):
+        self.chat_username = raw.get('chat_username')
+
+
+@dataclass
+class InternalLinkTypeQrCodeAuthentication(TDObject):
+    """
+    The link can be used to login the current user on another device, but it must
+    be scanned from QR-code using in-app camera. An alert similar to "This code
+    can be used to allow someone to log in to your Telegram account. To confirm
+    Telegram login, please go to Settings > Devices > Scan QR and scan the code"
+    needs to be shown
+    """
+
+
+@dataclass
+class InternalLinkTypeRestorePurchases(TDObject):
+    """
+    The link forces restore of App Store purchases when opened. For official iOS
+    application only
+    """
+
+
+@dataclass
+class InternalLinkTypeSettings(TDObject):
+    """The link is a link to application settings"""
+
+
+@dataclass
+class InternalLinkTypeSideMenuBot(TDObject):
+    """
+    The link is a link to a bot, which can be installed to the side menu. Call
+    searchPublicChat with the given bot username, check that the user is a bot and
+    can be added to attachment menu. Then, use getAttachmentMenuBot to receive
+    information about the bot. If the bot isn't added to side menu, then show a
+    disclaimer about Mini Apps being a third-party apps, ask the user to accept
+    their Terms of service and confirm adding the bot to side and attachment menu.
+    If the user accept the terms and confirms adding, then use
+    toggleBotIsAddedToAttachmentMenu to add the bot. If the bot is added to side
+    menu, then use getWebAppUrl with the given URL and open the returned URL as a
+    Web App
+    """
+
+    bot_username: str = None
+    url: str = None
+
+    def _decode(self, raw: dict):
+        self.bot_username = raw.get('bot_username')
+        self.url = raw.get('url')
+
+
+@dataclass
+class InternalLinkTypeStickerSet(TDObject):
+    """
+    The link is a link to a sticker set. Call searchStickerSet with the given
+    sticker set name to process the link and show the sticker set. If the sticker
+    set is found and the user wants to add it, then call changeStickerSet
+    """
+
+    sticker_set_name: str = None
+    expect_custom_emoji: bool = None
+
+    def _decode(self, raw: dict):
+        self.sticker_set_name = raw.get('sticker_set_name')
+        self.expect_custom_emoji = raw.get('expect_custom_emoji')
+
+
+@dataclass
+class InternalLinkTypeStory(TDObject):
+    """
+    The link is a link to a story. Call searchPublicChat with the given sender
+    username, then call getStory with the received chat identifier and the given
+    story identifier, then show the story if received
+    """
+
+    story_sender_username: str = None
+    story_id: int = None
+
+    def _decode(self, raw: dict):
+        self.story_sender_username = raw.get('story_sender_username')
+        self.story_id = raw.get('story_id')
+
+
+@dataclass
+class InternalLinkTypeTheme(TDObject):
+    """The link is a link to a theme. TDLib has no theme support yet"""
+
+    theme_name: str = None
+
+    def _decode(self, raw: dict):
+        self.theme_name = raw.get('theme_name')
+
+
+@dataclass
+class InternalLinkTypeThemeSettings(TDObject):
+    """The link is a link to the theme section of the app settings"""
+
+
+@dataclass
+class InternalLinkTypeUnknownDeepLink(TDObject):
+    """The link is an unknown tg: link. Call getDeepLinkInfo to process the link"""
+
+    link: str = None
+
+    def _decode(self, raw: dict):
+        self.link = raw.get('link')
+
+
+@dataclass
+class InternalLinkTypeUnsupportedProxy(TDObject):
+    """The link is a link to an unsupported proxy. An alert can be shown to the user"""
+
+
+@dataclass
+class InternalLinkTypeUserPhoneNumber(TDObject):
+    """
+    The link is a link to a user by its phone number. Call searchUserByPhoneNumber
+    with the given phone number to process the link. If the user is found, then
+    call createPrivateChat and open the chat
+    """
+
+    phone_number: str = None
+
+    def _decode(self, raw: dict):
+        self.phone_number = raw.get('phone_number')
+
+
+@dataclass
+class InternalLinkTypeUserToken(TDObject):
+    """
+    The link is a link to a user by a temporary token. Call searchUserByToken with
+    the given token to process the link. If the user is found, then call
+    createPrivateChat and open the chat
+    """
+
+    token: str = None
+
+    def _decode(self, raw: dict):
+        self.token = raw.get('token')
+
+
+@dataclass
+class InternalLinkTypeVideoChat(TDObject):
+    """
+    The link is a link to a video chat. Call searchPublicChat with the given chat
+    username, and then joinGroupCall with the given invite hash to process the
+    link
+    """
+
+    chat_username: str = None
+    invite_hash: str = None
+    is_live_stream: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_username = raw.get('chat_username')
+        self.invite_hash = raw.get('invite_hash')
+        self.is_live_stream = raw.get('is_live_stream')
+
+
+@dataclass
+class InternalLinkTypeWebApp(TDObject):
+    """
+    The link is a link to a Web App. Call searchPublicChat with the given bot
+    username, check that the user is a bot, then call searchWebApp with the
+    received bot and the given web_app_short_name. Process received foundWebApp by
+    showing a confirmation dialog if needed. If the bot can be added to attachment
+    or side menu, but isn't added yet, then show a disclaimer about Mini Apps
+    being a third-party apps instead of the dialog and ask the user to accept
+    their Terms of service. If the user accept the terms and confirms adding, then
+    use toggleBotIsAddedToAttachmentMenu to add the bot. Then, call
+    getWebAppLinkUrl and open the returned URL as a Web App
+    """
+
+    bot_username: str = None
+    web_app_short_name: str = None
+    start_parameter: str = None
+
+    def _decode(self, raw: dict):
+        self.bot_username = raw.get('bot_username')
+        self.web_app_short_name = raw.get('web_app_short_name')
+        self.start_parameter = raw.get('start_parameter')
+
+
+@dataclass
+class MessageLink(TDObject):
+    """
+    Contains an HTTPS link to a message in a supergroup or channel, or a forum
+    topic
+    """
+
+    link: str = None
+    is_public: bool = None
+
+    def _decode(self, raw: dict):
+        self.link = raw.get('link')
+        self.is_public = raw.get('is_public')
+
+
+@dataclass
+class MessageLinkInfo(TDObject):
+    """Contains information about a link to a message or a forum topic in a chat"""
+
+    is_public: bool = None
+    chat_id: int = None
+    message_thread_id: int = None
+    message: Message = None
+    media_timestamp: int = None
+    for_album: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_public = raw.get('is_public')
+        self.chat_id = raw.get('chat_id')
+        self.message_thread_id = raw.get('message_thread_id')
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+        self.media_timestamp = raw.get('media_timestamp')
+        self.for_album = raw.get('for_album')
+
+
+@dataclass
+class ChatBoostLink(TDObject):
+    """Contains an HTTPS link to boost a chat"""
+
+    link: str = None
+    is_public: bool = None
+
+    def _decode(self, raw: dict):
+        self.link = raw.get('link')
+        self.is_public = raw.get('is_public')
+
+
+@dataclass
+class ChatBoostLinkInfo(TDObject):
+    """Contains information about a link to boost a chat"""
+
+    is_public: bool = None
+    chat_id: int = None
+
+    def _decode(self, raw: dict):
+        self.is_public = raw.get('is_public')
+        self.chat_id = raw.get('chat_id')
+
+
+@dataclass
+class BlockListMain(TDObject):
+    """
+    The main block list that disallows writing messages to the current user,
+    receiving their status and photo, viewing of stories, and some other actions
+    """
+
+
+@dataclass
+class BlockListStories(TDObject):
+    """The block list that disallows viewing of stories of the current user"""
+
+
+@dataclass
+class FilePart(TDObject):
+    """Contains a part of a file"""
+
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.data = raw.get('data')
+
+
+@dataclass
+class FileTypeNone(TDObject):
+    """The data is not a file"""
+
+
+@dataclass
+class FileTypeAnimation(TDObject):
+    """The file is an animation"""
+
+
+@dataclass
+class FileTypeAudio(TDObject):
+    """The file is an audio file"""
+
+
+@dataclass
+class FileTypeDocument(TDObject):
+    """The file is a document"""
+
+
+@dataclass
+class FileTypeNotificationSound(TDObject):
+    """The file is a notification sound"""
+
+
+@dataclass
+class FileTypePhoto(TDObject):
+    """The file is a photo"""
+
+
+@dataclass
+class FileTypePhotoStory(TDObject):
+    """The file is a photo published as a story"""
+
+
+@dataclass
+class FileTypeProfilePhoto(TDObject):
+    """The file is a profile photo"""
+
+
+@dataclass
+class FileTypeSecret(TDObject):
+    """The file was sent to a secret chat (the file type is not known to the server)"""
+
+
+@dataclass
+class FileTypeSecretThumbnail(TDObject):
+    """The file is a thumbnail of a file from a secret chat"""
+
+
+@dataclass
+class FileTypeSecure(TDObject):
+    """
+    The file is a file from Secure storage used for storing Telegram Passport
+    files
+    """
+
+
+@dataclass
+class FileTypeSticker(TDObject):
+    """The file is a sticker"""
+
+
+@dataclass
+class FileTypeThumbnail(TDObject):
+    """The file is a thumbnail of another file"""
+
+
+@dataclass
+class FileTypeUnknown(TDObject):
+    """The file type is not yet known"""
+
+
+@dataclass
+class FileTypeVideo(TDObject):
+    """The file is a video"""
+
+
+@dataclass
+class FileTypeVideoNote(TDObject):
+    """The file is a video note"""
+
+
+@dataclass
+class FileTypeVideoStory(TDObject):
+    """The file is a video published as a story"""
+
+
+@dataclass
+class FileTypeVoiceNote(TDObject):
+    """The file is a voice note"""
+
+
+@dataclass
+class FileTypeWallpaper(TDObject):
+    """The file is a wallpaper or a background pattern"""
+
+
+@dataclass
+class StorageStatisticsByFileType(TDObject):
+    """Contains the storage usage statistics for a specific file type"""
+
+    file_type: TDObject = None
+    size: int = None
+    count: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('file_type')
+        if value is not None:
+            value = FileType(value)
+        self.file_type = value
+        self.size = raw.get('size')
+        self.count = raw.get('count')
+
+
+@dataclass
+class StorageStatisticsByChat(TDObject):
+    """Contains the storage usage statistics for a specific chat"""
+
+    chat_id: int = None
+    size: int = None
+    count: int = None
+    by_file_type: List[StorageStatisticsByFileType] = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.size = raw.get('size')
+        self.count = raw.get('count')
+        value = raw.get('by_file_type')
+        if value is not None:
+            value = [StorageStatisticsByFileType.from_raw(item0) for item0 in value]
+        self.by_file_type = value
+
+
+@dataclass
+class StorageStatistics(TDObject):
+    """Contains the exact storage usage statistics split by chats and file type"""
+
+    size: int = None
+    count: int = None
+    by_chat: List[StorageStatisticsByChat] = None
+
+    def _decode(self, raw: dict):
+        self.size = raw.get('size')
+        self.count = raw.get('count')
+        value = raw.get('by_chat')
+        if value is not None:
+            value = [StorageStatisticsByChat.from_raw(item0) for item0 in value]
+        self.by_chat = value
+
+
+@dataclass
+class StorageStatisticsFast(TDObject):
+    """
+    Contains approximate storage usage statistics, excluding files of unknown file
+    type
+    """
+
+    files_size: int = None
+    file_count: int = None
+    database_size: int = None
+    language_pack_database_size: int = None
+    log_size: int = None
+
+    def _decode(self, raw: dict):
+        self.files_size = raw.get('files_size')
+        self.file_count = raw.get('file_count')
+        self.database_size = raw.get('database_size')
+        self.language_pack_database_size = raw.get('language_pack_database_size')
+        self.log_size = raw.get('log_size')
+
+
+@dataclass
+class DatabaseStatistics(TDObject):
+    """Contains database statistics"""
+
+    statistics: str = None
+
+    def _decode(self, raw: dict):
+        self.statistics = raw.get('statistics')
+
+
+@dataclass
+class NetworkTypeNone(TDObject):
+    """The network is not available"""
+
+
+@dataclass
+class NetworkTypeMobile(TDObject):
+    """A mobile network"""
+
+
+@dataclass
+class NetworkTypeMobileRoaming(TDObject):
+    """A mobile roaming network"""
+
+
+@dataclass
+class NetworkTypeWiFi(TDObject):
+    """A Wi-Fi network"""
+
+
+@dataclass
+class NetworkTypeOther(TDObject):
+    """A different network type (e.g., Ethernet network)"""
+
+
+@dataclass
+class NetworkStatisticsEntryFile(TDObject):
+    """
+    Contains information about the total amount of data that was used to send and
+    receive files
+    """
+
+    file_type: TDObject = None
+    network_type: TDObject = None
+    sent_bytes: int = None
+    received_bytes: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('file_type')
+        if value is not None:
+            value = FileType(value)
+        self.file_type = value
+        value = raw.get('network_type')
+        if value is not None:
+            value = NetworkType(value)
+        self.network_type = value
+        self.sent_bytes = raw.get('sent_bytes')
+        self.received_bytes = raw.get('received_bytes')
+
+
+@dataclass
+class NetworkStatisticsEntryCall(TDObject):
+    """Contains information about the total amount of data that was used for calls"""
+
+    network_type: TDObject = None
+    sent_bytes: int = None
+    received_bytes: int = None
+    duration: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('network_type')
+        if value is not None:
+            value = NetworkType(value)
+        self.network_type = value
+        self.sent_bytes = raw.get('sent_bytes')
+        self.received_bytes = raw.get('received_bytes')
+        value = raw.get('duration')
+        if value is not None:
+            value = float(value)
+        self.duration = value
+
+
+@dataclass
+class NetworkStatistics(TDObject):
+    """A full list of available network statistic entries"""
+
+    since_date: int = None
+    entries: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        self.since_date = raw.get('since_date')
+        value = raw.get('entries')
+        if value is not None:
+            value = [NetworkStatisticsEntry(item0) for item0 in value]
+        self.entries = value
+
+
+@dataclass
+class AutoDownloadSettings(TDObject):
+    """Contains auto-download settings"""
+
+    is_auto_download_enabled: bool = None
+    max_photo_file_size: int = None
+    max_video_file_size: int = None
+    max_other_file_size: int = None
+    video_upload_bitrate: int = None
+    preload_large_videos: bool = None
+    preload_next_audio: bool = None
+    preload_stories: bool = None
+    use_less_data_for_calls: bool = None
+
+    def _decode(self, raw: dict):
+        self.is_auto_download_enabled = raw.get('is_auto_download_enabled')
+        self.max_photo_file_size = raw.get('max_photo_file_size')
+        self.max_video_file_size = raw.get('max_video_file_size')
+        self.max_other_file_size = raw.get('max_other_file_size')
+        self.video_upload_bitrate = raw.get('video_upload_bitrate')
+        self.preload_large_videos = raw.get('preload_large_videos')
+        self.preload_next_audio = raw.get('preload_next_audio')
+        self.preload_stories = raw.get('preload_stories')
+        self.use_less_data_for_calls = raw.get('use_less_data_for_calls')
+
+
+@dataclass
+class AutoDownloadSettingsPresets(TDObject):
+    """Contains auto-download settings presets for the current user"""
+
+    low: AutoDownloadSettings = None
+    medium: AutoDownloadSettings = None
+    high: AutoDownloadSettings = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('low')
+        if value is not None:
+            value = AutoDownloadSettings.from_raw(value)
+        self.low = value
+        value = raw.get('medium')
+        if value is not None:
+            value = AutoDownloadSettings.from_raw(value)
+        self.medium = value
+        value = raw.get('high')
+        if value is not None:
+            value = AutoDownloadSettings.from_raw(value)
+        self.high = value
+
+
+@dataclass
+class AutosaveSettingsScopePrivateChats(TDObject):
+    """Autosave settings applied to all private chats without chat-specific settings"""
+
+
+@dataclass
+class AutosaveSettingsScopeGroupChats(TDObject):
+    """
+    Autosave settings applied to all basic group and supergroup chats without
+    chat-specific settings
+    """
+
+
+@dataclass
+class AutosaveSettingsScopeChannelChats(TDObject):
+    """Autosave settings applied to all channel chats without chat-specific settings"""
+
+
+@dataclass
+class AutosaveSettingsScopeChat(TDObject):
+    """Autosave settings applied to a chat"""
+
+    chat_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+
+
+@dataclass
+class ScopeAutosaveSettings(TDObject):
+    """Contains autosave settings for an autosave settings scope"""
+
+    autosave_photos: bool = None
+    autosave_videos: bool = None
+    max_video_file_size: int = None
+
+    def _decode(self, raw: dict):
+        self.autosave_photos = raw.get('autosave_photos')
+        self.autosave_videos = raw.get('autosave_videos')
+        self.max_video_file_size = raw.get('max_video_file_size')
+
+
+@dataclass
+class AutosaveSettingsException(TDObject):
+    """
+    Contains autosave settings for a chat, which overrides default settings for
+    the corresponding scope
+    """
+
+    chat_id: int = None
+    settings: ScopeAutosaveSettings = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('settings')
+        if value is not None:
+            value = ScopeAutosaveSettings.from_raw(value)
+        self.settings = value
+
+
+@dataclass
+class AutosaveSettings(TDObject):
+    """Describes autosave settings"""
+
+    private_chat_settings: ScopeAutosaveSettings = None
+    group_settings: ScopeAutosaveSettings = None
+    channel_settings: ScopeAutosaveSettings = None
+    exceptions: List[AutosaveSettingsException] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('private_chat_settings')
+        if value is not None:
+            value = ScopeAutosaveSettings.from_raw(value)
+        self.private_chat_settings = value
+        value = raw.get('group_settings')
+        if value is not None:
+            value = ScopeAutosaveSettings.from_raw(value)
+        self.group_settings = value
+        value = raw.get('channel_settings')
+        if value is not None:
+            value = ScopeAutosaveSettings.from_raw(value)
+        self.channel_settings = value
+        value = raw.get('exceptions')
+        if value is not None:
+            value = [AutosaveSettingsException.from_raw(item0) for item0 in value]
+        self.exceptions = value
+
+
+@dataclass
+class ConnectionStateWaitingForNetwork(TDObject):
+    """
+    Waiting for the network to become available. Use setNetworkType to change the
+    available network type
+    """
+
+
+@dataclass
+class ConnectionStateConnectingToProxy(TDObject):
+    """Establishing a connection with a proxy server"""
+
+
+@dataclass
+class ConnectionStateConnecting(TDObject):
+    """Establishing a connection to the Telegram servers"""
+
+
+@dataclass
+class ConnectionStateUpdating(TDObject):
+    """Downloading data supposed to be received while the application was offline"""
+
+
+@dataclass
+class ConnectionStateReady(TDObject):
+    """There is a working connection to the Telegram servers"""
+
+
+@dataclass
+class TopChatCategoryUsers(TDObject):
+    """A category containing frequently used private chats with non-bot users"""
+
+
+@dataclass
+class TopChatCategoryBots(TDObject):
+    """A category containing frequently used private chats with bot users"""
+
+
+@dataclass
+class TopChatCategoryGroups(TDObject):
+    """A category containing frequently used basic groups and supergroups"""
+
+
+@dataclass
+class TopChatCategoryChannels(TDObject):
+    """A category containing frequently used channels"""
+
+
+@dataclass
+class TopChatCategoryInlineBots(TDObject):
+    """
+    A category containing frequently used chats with inline bots sorted by their
+    usage in inline mode
+    """
+
+
+@dataclass
+class TopChatCategoryCalls(TDObject):
+    """A category containing frequently used chats used for calls"""
+
+
+@dataclass
+class TopChatCategoryForwardChats(TDObject):
+    """A category containing frequently used chats used to forward messages"""
+
+
+@dataclass
+class FoundPosition(TDObject):
+    """Contains 0-based match position"""
+
+    position: int = None
+
+    def _decode(self, raw: dict):
+        self.position = raw.get('position')
+
+
+@dataclass
+class FoundPositions(TDObject):
+    """Contains 0-based positions of matched objects"""
+
+    total_count: int = None
+    positions: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.total_count = raw.get('total_count')
+        self.positions = raw.get('positions')
+
+
+@dataclass
+class TMeUrlTypeUser(TDObject):
+    """A URL linking to a user"""
+
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class TMeUrlTypeSupergroup(TDObject):
+    """A URL linking to a public supergroup or channel"""
+
+    supergroup_id: int = None
+
+    def _decode(self, raw: dict):
+        self.supergroup_id = raw.get('supergroup_id')
+
+
+@dataclass
+class TMeUrlTypeChatInvite(TDObject):
+    """A chat invite link"""
+
+    info: ChatInviteLinkInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('info')
+        if value is not None:
+            value = ChatInviteLinkInfo.from_raw(value)
+        self.info = value
+
+
+@dataclass
+class TMeUrlTypeStickerSet(TDObject):
+    """A URL linking to a sticker set"""
+
+    sticker_set_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker_set_id')
+        if value is not None:
+            value = int(value)
+        self.sticker_set_id = value
+
+
+@dataclass
+class TMeUrl(TDObject):
+    """Represents a URL linking to an internal Telegram entity"""
+
+    url: str = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.url = raw.get('url')
+        value = raw.get('type')
+        if value is not None:
+            value = TMeUrlType(value)
+        self.type = value
+
+
+@dataclass
+class TMeUrls(TDObject):
+    """Contains a list of t.me URLs"""
+
+    urls: List[TMeUrl] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('urls')
+        if value is not None:
+            value = [TMeUrl.from_raw(item0) for item0 in value]
+        self.urls = value
+
+
+@dataclass
+class SuggestedActionEnableArchiveAndMuteNewChats(TDObject):
+    """
+    Suggests the user to enable archive_and_mute_new_chats_from_unknown_users
+    setting in archiveChatListSettings
+    """
+
+
+@dataclass
+class SuggestedActionCheckPassword(TDObject):
+    """
+    Suggests the user to check whether they still remember their 2-step
+    verification password
+    """
+
+
+@dataclass
+class SuggestedActionCheckPhoneNumber(TDObject):
+    """
+    Suggests the user to check whether authorization phone number is correct and
+    change the phone number if it is inaccessible
+    """
+
+
+@dataclass
+class SuggestedActionViewChecksHint(TDObject):
+    """
+    Suggests the user to view a hint about the meaning of one and two check marks
+    on sent messages
+    """
+
+
+@dataclass
+class SuggestedActionConvertToBroadcastGroup(TDObject):
+    """Suggests the user to convert specified supergroup to a broadcast group"""
+
+    supergroup_id: int = None
+
+    def _decode(self, raw: dict):
+        self.supergroup_id = raw.get('supergroup_id')
+
+
+@dataclass
+class SuggestedActionSetPassword(TDObject):
+    """
+    Suggests the user to set a 2-step verification password to be able to log in
+    again
+    """
+
+    authorization_delay: int = None
+
+    def _decode(self, raw: dict):
+        self.authorization_delay = raw.get('authorization_delay')
+
+
+@dataclass
+class SuggestedActionUpgradePremium(TDObject):
+    """
+    Suggests the user to upgrade the Premium subscription from monthly payments to
+    annual payments
+    """
+
+
+@dataclass
+class SuggestedActionRestorePremium(TDObject):
+    """Suggests the user to restore a recently expired Premium subscription"""
+
+
+@dataclass
+class SuggestedActionSubscribeToAnnualPremium(TDObject):
+    """
+    Suggests the user to subscribe to the Premium subscription with annual
+    payments
+    """
+
+
+@dataclass
+class SuggestedActionGiftPremiumForChristmas(TDObject):
+    """Suggests the user to gift Telegram Premium to friends for Christmas"""
+
+
+@dataclass
+class Count(TDObject):
+    """Contains a counter"""
+
+    count: int = None
+
+    def _decode(self, raw: dict):
+        self.count = raw.get('count')
+
+
+@dataclass
+class Text(TDObject):
+    """Contains some text"""
+
+    text: str = None
+
+    def _decode(self, raw: dict):
+        self.text = raw.get('text')
+
+
+@dataclass
+class Seconds(TDObject):
+    """Contains a value representing a number of seconds"""
+
+    seconds: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('seconds')
+        if value is not None:
+            value = float(value)
+        self.seconds = value
+
+
+@dataclass
+class FileDownloadedPrefixSize(TDObject):
+    """Contains size of downloaded prefix of a file"""
+
+    size: int = None
+
+    def _decode(self, raw: dict):
+        self.size = raw.get('size')
+
+
+@dataclass
+class DeepLinkInfo(TDObject):
+    """Contains information about a tg: deep link"""
+
+    text: FormattedText = None
+    need_update_application: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('text')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.text = value
+        self.need_update_application = raw.get('need_update_application')
+
+
+@dataclass
+class TextParseModeMarkdown(TDObject):
+    """The text uses Markdown-style formatting"""
+
+    version: int = None
+
+    def _decode(self, raw: dict):
+        self.version = raw.get('version')
+
+
+@dataclass
+class TextParseModeHTML(TDObject):
+    """
+    The text uses HTML-style formatting. The same as Telegram Bot API "HTML" parse
+    mode
+    """
+
+
+@dataclass
+class ProxyTypeSocks5(TDObject):
+    """A SOCKS5 proxy server"""
+
+    username: str = None
+    password: str = None
+
+    def _decode(self, raw: dict):
+        self.username = raw.get('username')
+        self.password = raw.get('password')
+
+
+@dataclass
+class ProxyTypeHttp(TDObject):
+    """A HTTP transparent proxy server"""
+
+    username: str = None
+    password: str = None
+    http_only: bool = None
+
+    def _decode(self, raw: dict):
+        self.username = raw.get('username')
+        self.password = raw.get('password')
+        self.http_only = raw.get('http_only')
+
+
+@dataclass
+class ProxyTypeMtproto(TDObject):
+    """An MTProto proxy server"""
+
+    secret: str = None
+
+    def _decode(self, raw: dict):
+        self.secret = raw.get('secret')
+
+
+@dataclass
+class Proxy(TDObject):
+    """Contains information about a proxy server"""
+
+    id: int = None
+    server: str = None
+    port: int = None
+    last_used_date: int = None
+    is_enabled: bool = None
+    type: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.id = raw.get('id')
+        self.server = raw.get('server')
+        self.port = raw.get('port')
+        self.last_used_date = raw.get('last_used_date')
+        self.is_enabled = raw.get('is_enabled')
+        value = raw.get('type')
+        if value is not None:
+            value = ProxyType(value)
+        self.type = value
+
+
+@dataclass
+class Proxies(TDObject):
+    """Represents a list of proxy servers"""
+
+    proxies: List[Proxy] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('proxies')
+        if value is not None:
+            value = [Proxy.from_raw(item0) for item0 in value]
+        self.proxies = value
+
+
+@dataclass
+class InputSticker(TDObject):
+    """A sticker to be added to a sticker set"""
+
+    sticker: TDObject = None
+    emojis: str = None
+    mask_position: MaskPosition = None
+    keywords: List[str] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker')
+        if value is not None:
+            value = InputFile(value)
+        self.sticker = value
+        self.emojis = raw.get('emojis')
+        value = raw.get('mask_position')
+        if value is not None:
+            value = MaskPosition.from_raw(value)
+        self.mask_position = value
+        self.keywords = raw.get('keywords')
+
+
+@dataclass
+class DateRange(TDObject):
+    """Represents a date range"""
+
+    start_date: int = None
+    end_date: int = None
+
+    def _decode(self, raw: dict):
+        self.start_date = raw.get('start_date')
+        self.end_date = raw.get('end_date')
+
+
+@dataclass
+class StatisticalValue(TDObject):
+    """A value with information about its recent changes"""
+
+    value: float = None
+    previous_value: float = None
+    growth_rate_percentage: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('value')
+        if value is not None:
+            value = float(value)
+        self.value = value
+        value = raw.get('previous_value')
+        if value is not None:
+            value = float(value)
+        self.previous_value = value
+        value = raw.get('growth_rate_percentage')
+        if value is not None:
+            value = float(value)
+        self.growth_rate_percentage = value
+
+
+@dataclass
+class StatisticalGraphData(TDObject):
+    """A graph data"""
+
+    json_data: str = None
+    zoom_token: str = None
+
+    def _decode(self, raw: dict):
+        self.json_data = raw.get('json_data')
+        self.zoom_token = raw.get('zoom_token')
+
+
+@dataclass
+class StatisticalGraphAsync(TDObject):
+    """The graph data to be asynchronously loaded through getStatisticalGraph"""
+
+    token: str = None
+
+    def _decode(self, raw: dict):
+        self.token = raw.get('token')
+
+
+@dataclass
+class StatisticalGraphError(TDObject):
+    """An error message to be shown to the user instead of the graph"""
+
+    error_message: str = None
+
+    def _decode(self, raw: dict):
+        self.error_message = raw.get('error_message')
+
+
+@dataclass
+class ChatStatisticsObjectTypeMessage(TDObject):
+    """Describes a message sent in the chat"""
+
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class ChatStatisticsObjectTypeStory(TDObject):
+    """Describes a story sent by the chat"""
+
+    story_id: int = None
+
+    def _decode(self, raw: dict):
+        self.story_id = raw.get('story_id')
+
+
+@dataclass
+class ChatStatisticsInteractionInfo(TDObject):
+    """
+    Contains statistics about interactions with a message sent in the chat or a
+    story sent by the chat
+    """
+
+    object_type: TDObject = None
+    view_count: int = None
+    forward_count: int = None
+    reaction_count: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('object_type')
+        if value is not None:
+            value = ChatStatisticsObjectType(value)
+        self.object_type = value
+        self.view_count = raw.get('view_count')
+        self.forward_count = raw.get('forward_count')
+        self.reaction_count = raw.get('reaction_count')
+
+
+@dataclass
+class ChatStatisticsMessageSenderInfo(TDObject):
+    """Contains statistics about messages sent by a user"""
+
+    user_id: int = None
+    sent_message_count: int = None
+    average_character_count: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.sent_message_count = raw.get('sent_message_count')
+        self.average_character_count = raw.get('average_character_count')
+
+
+@dataclass
+class ChatStatisticsAdministratorActionsInfo(TDObject):
+    """Contains statistics about administrator actions done by a user"""
+
+    user_id: int = None
+    deleted_message_count: int = None
+    banned_user_count: int = None
+    restricted_user_count: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.deleted_message_count = raw.get('deleted_message_count')
+        self.banned_user_count = raw.get('banned_user_count')
+        self.restricted_user_count = raw.get('restricted_user_count')
+
+
+@dataclass
+class ChatStatisticsInviterInfo(TDObject):
+    """Contains statistics about number of new members invited by a user"""
+
+    user_id: int = None
+    added_member_count: int = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        self.added_member_count = raw.get('added_member_count')
+
+
+@dataclass
+class ChatStatisticsSupergroup(TDObject):
+    """A detailed statistics about a supergroup chat"""
+
+    period: DateRange = None
+    member_count: StatisticalValue = None
+    message_count: StatisticalValue = None
+    viewer_count: StatisticalValue = None
+    sender_count: StatisticalValue = None
+    member_count_graph: TDObject = None
+    join_graph: TDObject = None
+    join_by_source_graph: TDObject = None
+    language_graph: TDObject = None
+    message_content_graph: TDObject = None
+    action_graph: TDObject = None
+    day_graph: TDObject = None
+    week_graph: TDObject = None
+    top_senders: List[ChatStatisticsMessageSenderInfo] = None
+    top_administrators: List[ChatStatisticsAdministratorActionsInfo] = None
+    top_inviters: List[ChatStatisticsInviterInfo] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('period')
+        if value is not None:
+            value = DateRange.from_raw(value)
+        self.period = value
+        value = raw.get('member_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.member_count = value
+        value = raw.get('message_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.message_count = value
+        value = raw.get('viewer_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.viewer_count = value
+        value = raw.get('sender_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.sender_count = value
+        value = raw.get('member_count_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.member_count_graph = value
+        value = raw.get('join_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.join_graph = value
+        value = raw.get('join_by_source_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.join_by_source_graph = value
+        value = raw.get('language_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.language_graph = value
+        value = raw.get('message_content_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.message_content_graph = value
+        value = raw.get('action_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.action_graph = value
+        value = raw.get('day_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.day_graph = value
+        value = raw.get('week_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.week_graph = value
+        value = raw.get('top_senders')
+        if value is not None:
+            value = [ChatStatisticsMessageSenderInfo.from_raw(item0) for item0 in value]
+        self.top_senders = value
+        value = raw.get('top_administrators')
+        if value is not None:
+            value = [ChatStatisticsAdministratorActionsInfo.from_raw(item0) for item0 in value]
+        self.top_administrators = value
+        value = raw.get('top_inviters')
+        if value is not None:
+            value = [ChatStatisticsInviterInfo.from_raw(item0) for item0 in value]
+        self.top_inviters = value
+
+
+@dataclass
+class ChatStatisticsChannel(TDObject):
+    """A detailed statistics about a channel chat"""
+
+    period: DateRange = None
+    member_count: StatisticalValue = None
+    mean_message_view_count: StatisticalValue = None
+    mean_message_share_count: StatisticalValue = None
+    mean_message_reaction_count: StatisticalValue = None
+    mean_story_view_count: StatisticalValue = None
+    mean_story_share_count: StatisticalValue = None
+    mean_story_reaction_count: StatisticalValue = None
+    enabled_notifications_percentage: float = None
+    member_count_graph: TDObject = None
+    join_graph: TDObject = None
+    mute_graph: TDObject = None
+    view_count_by_hour_graph: TDObject = None
+    view_count_by_source_graph: TDObject = None
+    join_by_source_graph: TDObject = None
+    language_graph: TDObject = None
+    message_interaction_graph: TDObject = None
+    message_reaction_graph: TDObject = None
+    story_interaction_graph: TDObject = None
+    story_reaction_graph: TDObject = None
+    instant_view_interaction_graph: TDObject = None
+    recent_interactions: List[ChatStatisticsInteractionInfo] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('period')
+        if value is not None:
+            value = DateRange.from_raw(value)
+        self.period = value
+        value = raw.get('member_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.member_count = value
+        value = raw.get('mean_message_view_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.mean_message_view_count = value
+        value = raw.get('mean_message_share_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.mean_message_share_count = value
+        value = raw.get('mean_message_reaction_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.mean_message_reaction_count = value
+        value = raw.get('mean_story_view_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.mean_story_view_count = value
+        value = raw.get('mean_story_share_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.mean_story_share_count = value
+        value = raw.get('mean_story_reaction_count')
+        if value is not None:
+            value = StatisticalValue.from_raw(value)
+        self.mean_story_reaction_count = value
+        value = raw.get('enabled_notifications_percentage')
+        if value is not None:
+            value = float(value)
+        self.enabled_notifications_percentage = value
+        value = raw.get('member_count_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.member_count_graph = value
+        value = raw.get('join_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.join_graph = value
+        value = raw.get('mute_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.mute_graph = value
+        value = raw.get('view_count_by_hour_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.view_count_by_hour_graph = value
+        value = raw.get('view_count_by_source_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.view_count_by_source_graph = value
+        value = raw.get('join_by_source_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.join_by_source_graph = value
+        value = raw.get('language_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.language_graph = value
+        value = raw.get('message_interaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.message_interaction_graph = value
+        value = raw.get('message_reaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.message_reaction_graph = value
+        value = raw.get('story_interaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.story_interaction_graph = value
+        value = raw.get('story_reaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.story_reaction_graph = value
+        value = raw.get('instant_view_interaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.instant_view_interaction_graph = value
+        value = raw.get('recent_interactions')
+        if value is not None:
+            value = [ChatStatisticsInteractionInfo.from_raw(item0) for item0 in value]
+        self.recent_interactions = value
+
+
+@dataclass
+class MessageStatistics(TDObject):
+    """A detailed statistics about a message"""
+
+    message_interaction_graph: TDObject = None
+    message_reaction_graph: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message_interaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.message_interaction_graph = value
+        value = raw.get('message_reaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.message_reaction_graph = value
+
+
+@dataclass
+class StoryStatistics(TDObject):
+    """A detailed statistics about a story"""
+
+    story_interaction_graph: TDObject = None
+    story_reaction_graph: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('story_interaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.story_interaction_graph = value
+        value = raw.get('story_reaction_graph')
+        if value is not None:
+            value = StatisticalGraph(value)
+        self.story_reaction_graph = value
+
+
+@dataclass
+class Point(TDObject):
+    """A point on a Cartesian plane"""
+
+    x: float = None
+    y: float = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('x')
+        if value is not None:
+            value = float(value)
+        self.x = value
+        value = raw.get('y')
+        if value is not None:
+            value = float(value)
+        self.y = value
+
+
+@dataclass
+class VectorPathCommandLine(TDObject):
+    """A straight line to a given point"""
+
+    end_point: Point = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('end_point')
+        if value is not None:
+            value = Point.from_raw(value)
+        self.end_point = value
+
+
+@dataclass
+class VectorPathCommandCubicBezierCurve(TDObject):
+    """A cubic Bézier curve to a given point"""
+
+    start_control_point: Point = None
+    end_control_point: Point = None
+    end_point: Point = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('start_control_point')
+        if value is not None:
+            value = Point.from_raw(value)
+        self.start_control_point = value
+        value = raw.get('end_control_point')
+        if value is not None:
+            value = Point.from_raw(value)
+        self.end_control_point = value
+        value = raw.get('end_point')
+        if value is not None:
+            value = Point.from_raw(value)
+        self.end_point = value
+
+
+@dataclass
+class BotCommandScopeDefault(TDObject):
+    """A scope covering all users"""
+
+
+@dataclass
+class BotCommandScopeAllPrivateChats(TDObject):
+    """A scope covering all private chats"""
+
+
+@dataclass
+class BotCommandScopeAllGroupChats(TDObject):
+    """A scope covering all group and supergroup chats"""
+
+
+@dataclass
+class BotCommandScopeAllChatAdministrators(TDObject):
+    """A scope covering all group and supergroup chat administrators"""
+
+
+@dataclass
+class BotCommandScopeChat(TDObject):
+    """A scope covering all members of a chat"""
+
+    chat_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+
+
+@dataclass
+class BotCommandScopeChatAdministrators(TDObject):
+    """A scope covering all administrators of a chat"""
+
+    chat_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+
+
+@dataclass
+class BotCommandScopeChatMember(TDObject):
+    """A scope covering a member of a chat"""
+
+    chat_id: int = None
+    user_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.user_id = raw.get('user_id')
+
+
+@dataclass
+class UpdateAuthorizationState(TDObject):
+    """The user authorization state has changed"""
+
+    authorization_state: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('authorization_state')
+        if value is not None:
+            value = AuthorizationState(value)
+        self.authorization_state = value
+
+
+@dataclass
+class UpdateNewMessage(TDObject):
+    """A new message was received; can also be an outgoing message"""
+
+    message: Message = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+
+
+@dataclass
+class UpdateMessageSendAcknowledged(TDObject):
+    """
+    A request to send a message has reached the Telegram server. This doesn't mean
+    that the message will be sent successfully. This update is sent only if the
+    option "use_quick_ack" is set to true. This update may be sent multiple times
+    for the same message
+    """
+
+    chat_id: int = None
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class UpdateMessageSendSucceeded(TDObject):
+    """A message has been successfully sent"""
+
+    message: Message = None
+    old_message_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+        self.old_message_id = raw.get('old_message_id')
+
+
+@dataclass
+class UpdateMessageSendFailed(TDObject):
+    """
+    A message failed to send. Be aware that some messages being sent can be
+    irrecoverably deleted, in which case updateDeleteMessages will be received
+    instead of this update
+    """
+
+    message: Message = None
+    old_message_id: int = None
+    error: Error = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.message = value
+        self.old_message_id = raw.get('old_message_id')
+        value = raw.get('error')
+        if value is not None:
+            value = Error.from_raw(value)
+        self.error = value
+
+
+@dataclass
+class UpdateMessageContent(TDObject):
+    """The message content has changed"""
+
+    chat_id: int = None
+    message_id: int = None
+    new_content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('new_content')
+        if value is not None:
+            value = MessageContent(value)
+        self.new_content = value
+
+
+@dataclass
+class UpdateMessageEdited(TDObject):
+    """
+    A message was edited. Changes in the message content will come in a separate
+    updateMessageContent
+    """
+
+    chat_id: int = None
+    message_id: int = None
+    edit_date: int = None
+    reply_markup: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        self.edit_date = raw.get('edit_date')
+        value = raw.get('reply_markup')
+        if value is not None:
+            value = ReplyMarkup(value)
+        self.reply_markup = value
+
+
+@dataclass
+class UpdateMessageIsPinned(TDObject):
+    """The message pinned state was changed"""
+
+    chat_id: int = None
+    message_id: int = None
+    is_pinned: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        self.is_pinned = raw.get('is_pinned')
+
+
+@dataclass
+class UpdateMessageInteractionInfo(TDObject):
+    """The information about interactions with a message has changed"""
+
+    chat_id: int = None
+    message_id: int = None
+    interaction_info: MessageInteractionInfo = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('interaction_info')
+        if value is not None:
+            value = MessageInteractionInfo.from_raw(value)
+        self.interaction_info = value
+
+
+@dataclass
+class UpdateMessageContentOpened(TDObject):
+    """
+    The message content was opened. Updates voice note messages to "listened",
+    video note messages to "viewed" and starts the self-destruct timer
+    """
+
+    chat_id: int = None
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class UpdateMessageMentionRead(TDObject):
+    """A message with an unread mention was read"""
+
+    chat_id: int = None
+    message_id: int = None
+    unread_mention_count: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        self.unread_mention_count = raw.get('unread_mention_count')
+
+
+@dataclass
+class UpdateMessageUnreadReactions(TDObject):
+    """The list of unread reactions added to a message was changed"""
+
+    chat_id: int = None
+    message_id: int = None
+    unread_reactions: List[UnreadReaction] = None
+    unread_reaction_count: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('unread_reactions')
+        if value is not None:
+            value = [UnreadReaction.from_raw(item0) for item0 in value]
+        self.unread_reactions = value
+        self.unread_reaction_count = raw.get('unread_reaction_count')
+
+
+@dataclass
+class UpdateMessageLiveLocationViewed(TDObject):
+    """
+    A message with a live location was viewed. When the update is received, the
+    application is supposed to update the live location
+    """
+
+    chat_id: int = None
+    message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+
+
+@dataclass
+class UpdateNewChat(TDObject):
+    """
+    A new chat has been loaded/created. This update is guaranteed to come before
+    the chat identifier is returned to the application. The chat field changes
+    will be reported through separate updates
+    """
+
+    chat: Chat = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat')
+        if value is not None:
+            value = Chat.from_raw(value)
+        self.chat = value
+
+
+@dataclass
+class UpdateChatTitle(TDObject):
+    """The title of a chat was changed"""
+
+    chat_id: int = None
+    title: str = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.title = raw.get('title')
+
+
+@dataclass
+class UpdateChatPhoto(TDObject):
+    """A chat photo was changed"""
+
+    chat_id: int = None
+    photo: ChatPhotoInfo = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('photo')
+        if value is not None:
+            value = ChatPhotoInfo.from_raw(value)
+        self.photo = value
+
+
+@dataclass
+class UpdateChatAccentColors(TDObject):
+    """Chat accent colors have changed"""
+
+    chat_id: int = None
+    accent_color_id: int = None
+    background_custom_emoji_id: int = None
+    profile_accent_color_id: int = None
+    profile_background_custom_emoji_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.accent_color_id = raw.get('accent_color_id')
+        value = raw.get('background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.background_custom_emoji_id = value
+        self.profile_accent_color_id = raw.get('profile_accent_color_id')
+        value = raw.get('profile_background_custom_emoji_id')
+        if value is not None:
+            value = int(value)
+        self.profile_background_custom_emoji_id = value
+
+
+@dataclass
+class UpdateChatPermissions(TDObject):
+    """Chat permissions were changed"""
+
+    chat_id: int = None
+    permissions: ChatPermissions = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('permissions')
+        if value is not None:
+            value = ChatPermissions.from_raw(value)
+        self.permissions = value
+
+
+@dataclass
+class UpdateChatLastMessage(TDObject):
+    """The last message of a chat was changed"""
+
+    chat_id: int = None
+    last_message: Message = None
+    positions: List[ChatPosition] = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('last_message')
+        if value is not None:
+            value = Message.from_raw(value)
+        self.last_message = value
+        value = raw.get('positions')
+        if value is not None:
+            value = [ChatPosition.from_raw(item0) for item0 in value]
+        self.positions = value
+
+
+@dataclass
+class UpdateChatPosition(TDObject):
+    """
+    The position of a chat in a chat list has changed. An updateChatLastMessage or
+    updateChatDraftMessage update might be sent instead of the update
+    """
+
+    chat_id: int = None
+    position: ChatPosition = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('position')
+        if value is not None:
+            value = ChatPosition.from_raw(value)
+        self.position = value
+
+
+@dataclass
+class UpdateChatAddedToList(TDObject):
+    """A chat was added to a chat list"""
+
+    chat_id: int = None
+    chat_list: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('chat_list')
+        if value is not None:
+            value = ChatList(value)
+        self.chat_list = value
+
+
+@dataclass
+class UpdateChatRemovedFromList(TDObject):
+    """A chat was removed from a chat list"""
+
+    chat_id: int = None
+    chat_list: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('chat_list')
+        if value is not None:
+            value = ChatList(value)
+        self.chat_list = value
+
+
+@dataclass
+class UpdateChatReadInbox(TDObject):
+    """Incoming messages were read or the number of unread messages has been changed"""
+
+    chat_id: int = None
+    last_read_inbox_message_id: int = None
+    unread_count: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.last_read_inbox_message_id = raw.get('last_read_inbox_message_id')
+        self.unread_count = raw.get('unread_count')
+
+
+@dataclass
+class UpdateChatReadOutbox(TDObject):
+    """Outgoing messages were read"""
+
+    chat_id: int = None
+    last_read_outbox_message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.last_read_outbox_message_id = raw.get('last_read_outbox_message_id')
+
+
+@dataclass
+class UpdateChatActionBar(TDObject):
+    """The chat action bar was changed"""
+
+    chat_id: int = None
+    action_bar: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('action_bar')
+        if value is not None:
+            value = ChatActionBar(value)
+        self.action_bar = value
+
+
+@dataclass
+class UpdateChatAvailableReactions(TDObject):
+    """The chat available reactions were changed"""
+
+    chat_id: int = None
+    available_reactions: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('available_reactions')
+        if value is not None:
+            value = ChatAvailableReactions(value)
+        self.available_reactions = value
+
+
+@dataclass
+class UpdateChatDraftMessage(TDObject):
+    """
+    A chat draft has changed. Be aware that the update may come in the currently
+    opened chat but with old content of the draft. If the user has changed the
+    content of the draft, this update mustn't be applied
+    """
+
+    chat_id: int = None
+    draft_message: DraftMessage = None
+    positions: List[ChatPosition] = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('draft_message')
+        if value is not None:
+            value = DraftMessage.from_raw(value)
+        self.draft_message = value
+        value = raw.get('positions')
+        if value is not None:
+            value = [ChatPosition.from_raw(item0) for item0 in value]
+        self.positions = value
+
+
+@dataclass
+class UpdateChatEmojiStatus(TDObject):
+    """Chat emoji status has changed"""
+
+    chat_id: int = None
+    emoji_status: EmojiStatus = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('emoji_status')
+        if value is not None:
+            value = EmojiStatus.from_raw(value)
+        self.emoji_status = value
+
+
+@dataclass
+class UpdateChatMessageSender(TDObject):
+    """The message sender that is selected to send messages in a chat has changed"""
+
+    chat_id: int = None
+    message_sender_id: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('message_sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.message_sender_id = value
+
+
+@dataclass
+class UpdateChatMessageAutoDeleteTime(TDObject):
+    """The message auto-delete or self-destruct timer setting for a chat was changed"""
+
+    chat_id: int = None
+    message_auto_delete_time: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_auto_delete_time = raw.get('message_auto_delete_time')
+
+
+@dataclass
+class UpdateChatNotificationSettings(TDObject):
+    """Notification settings for a chat were changed"""
+
+    chat_id: int = None
+    notification_settings: ChatNotificationSettings = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('notification_settings')
+        if value is not None:
+            value = ChatNotificationSettings.from_raw(value)
+        self.notification_settings = value
+
+
+@dataclass
+class UpdateChatPendingJoinRequests(TDObject):
+    """The chat pending join requests were changed"""
+
+    chat_id: int = None
+    pending_join_requests: ChatJoinRequestsInfo = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('pending_join_requests')
+        if value is not None:
+            value = ChatJoinRequestsInfo.from_raw(value)
+        self.pending_join_requests = value
+
+
+@dataclass
+class UpdateChatReplyMarkup(TDObject):
+    """
+    The default chat reply markup was changed. Can occur because new messages with
+    reply markup were received or because an old reply markup was hidden by the
+    user
+    """
+
+    chat_id: int = None
+    reply_markup_message_id: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.reply_markup_message_id = raw.get('reply_markup_message_id')
+
+
+@dataclass
+class UpdateChatBackground(TDObject):
+    """The chat background was changed"""
+
+    chat_id: int = None
+    background: ChatBackground = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('background')
+        if value is not None:
+            value = ChatBackground.from_raw(value)
+        self.background = value
+
+
+@dataclass
+class UpdateChatTheme(TDObject):
+    """The chat theme was changed"""
+
+    chat_id: int = None
+    theme_name: str = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.theme_name = raw.get('theme_name')
+
+
+@dataclass
+class UpdateChatUnreadMentionCount(TDObject):
+    """The chat unread_mention_count has changed"""
+
+    chat_id: int = None
+    unread_mention_count: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.unread_mention_count = raw.get('unread_mention_count')
+
+
+@dataclass
+class UpdateChatUnreadReactionCount(TDObject):
+    """The chat unread_reaction_count has changed"""
+
+    chat_id: int = None
+    unread_reaction_count: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.unread_reaction_count = raw.get('unread_reaction_count')
+
+
+@dataclass
+class UpdateChatVideoChat(TDObject):
+    """A chat video chat state has changed"""
+
+    chat_id: int = None
+    video_chat: VideoChat = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('video_chat')
+        if value is not None:
+            value = VideoChat.from_raw(value)
+        self.video_chat = value
+
+
+@dataclass
+class UpdateChatDefaultDisableNotification(TDObject):
+    """
+    The value of the default disable_notification parameter, used when a message
+    is sent to the chat, was changed
+    """
+
+    chat_id: int = None
+    default_disable_notification: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.default_disable_notification = raw.get('default_disable_notification')
+
+
+@dataclass
+class UpdateChatHasProtectedContent(TDObject):
+    """A chat content was allowed or restricted for saving"""
+
+    chat_id: int = None
+    has_protected_content: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.has_protected_content = raw.get('has_protected_content')
+
+
+@dataclass
+class UpdateChatIsTranslatable(TDObject):
+    """Translation of chat messages was enabled or disabled"""
+
+    chat_id: int = None
+    is_translatable: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.is_translatable = raw.get('is_translatable')
+
+
+@dataclass
+class UpdateChatIsMarkedAsUnread(TDObject):
+    """A chat was marked as unread or was read"""
+
+    chat_id: int = None
+    is_marked_as_unread: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.is_marked_as_unread = raw.get('is_marked_as_unread')
+
+
+@dataclass
+class UpdateChatViewAsTopics(TDObject):
+    """A chat default appearance has changed"""
+
+    chat_id: int = None
+    view_as_topics: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.view_as_topics = raw.get('view_as_topics')
+
+
+@dataclass
+class UpdateChatBlockList(TDObject):
+    """A chat was blocked or unblocked"""
+
+    chat_id: int = None
+    block_list: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('block_list')
+        if value is not None:
+            value = BlockList(value)
+        self.block_list = value
+
+
+@dataclass
+class UpdateChatHasScheduledMessages(TDObject):
+    """A chat's has_scheduled_messages field has changed"""
+
+    chat_id: int = None
+    has_scheduled_messages: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.has_scheduled_messages = raw.get('has_scheduled_messages')
+
+
+@dataclass
+class UpdateChatFolders(TDObject):
+    """The list of chat folders or a chat folder has changed"""
+
+    chat_folders: List[ChatFolderInfo] = None
+    main_chat_list_position: int = None
+    are_tags_enabled: bool = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat_folders')
+        if value is not None:
+            value = [ChatFolderInfo.from_raw(item0) for item0 in value]
+        self.chat_folders = value
+        self.main_chat_list_position = raw.get('main_chat_list_position')
+        self.are_tags_enabled = raw.get('are_tags_enabled')
+
+
+@dataclass
+class UpdateChatOnlineMemberCount(TDObject):
+    """
+    The number of online group members has changed. This update with non-zero
+    number of online group members is sent only for currently opened chats. There
+    is no guarantee that it is sent just after the number of online users has
+    changed
+    """
+
+    chat_id: int = None
+    online_member_count: int = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.online_member_count = raw.get('online_member_count')
+
+
+@dataclass
+class UpdateSavedMessagesTopic(TDObject):
+    """
+    Basic information about a Saved Messages topic has changed. This update is
+    guaranteed to come before the topic identifier is returned to the application
+    """
+
+    topic: SavedMessagesTopic = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('topic')
+        if value is not None:
+            value = SavedMessagesTopic.from_raw(value)
+        self.topic = value
+
+
+@dataclass
+class UpdateSavedMessagesTopicCount(TDObject):
+    """Number of Saved Messages topics has changed"""
+
+    topic_count: int = None
+
+    def _decode(self, raw: dict):
+        self.topic_count = raw.get('topic_count')
+
+
+@dataclass
+class UpdateQuickReplyShortcut(TDObject):
+    """
+    Basic information about a quick reply shortcut has changed. This update is
+    guaranteed to come before the quick shortcut name is returned to the
+    application
+    """
+
+    shortcut: QuickReplyShortcut = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('shortcut')
+        if value is not None:
+            value = QuickReplyShortcut.from_raw(value)
+        self.shortcut = value
+
+
+@dataclass
+class UpdateQuickReplyShortcutDeleted(TDObject):
+    """A quick reply shortcut and all its messages were deleted"""
+
+    shortcut_id: int = None
+
+    def _decode(self, raw: dict):
+        self.shortcut_id = raw.get('shortcut_id')
+
+
+@dataclass
+class UpdateQuickReplyShortcuts(TDObject):
+    """The list of quick reply shortcuts has changed"""
+
+    shortcut_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.shortcut_ids = raw.get('shortcut_ids')
+
+
+@dataclass
+class UpdateQuickReplyShortcutMessages(TDObject):
+    """The list of quick reply shortcut messages has changed"""
+
+    shortcut_id: int = None
+    messages: List[QuickReplyMessage] = None
+
+    def _decode(self, raw: dict):
+        self.shortcut_id = raw.get('shortcut_id')
+        value = raw.get('messages')
+        if value is not None:
+            value = [QuickReplyMessage.from_raw(item0) for item0 in value]
+        self.messages = value
+
+
+@dataclass
+class UpdateForumTopicInfo(TDObject):
+    """Basic information about a topic in a forum chat was changed"""
+
+    chat_id: int = None
+    info: ForumTopicInfo = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('info')
+        if value is not None:
+            value = ForumTopicInfo.from_raw(value)
+        self.info = value
+
+
+@dataclass
+class UpdateScopeNotificationSettings(TDObject):
+    """Notification settings for some type of chats were updated"""
+
+    scope: TDObject = None
+    notification_settings: ScopeNotificationSettings = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('scope')
+        if value is not None:
+            value = NotificationSettingsScope(value)
+        self.scope = value
+        value = raw.get('notification_settings')
+        if value is not None:
+            value = ScopeNotificationSettings.from_raw(value)
+        self.notification_settings = value
+
+
+@dataclass
+class UpdateNotification(TDObject):
+    """A notification was changed"""
+
+    notification_group_id: int = None
+    notification: Notification = None
+
+    def _decode(self, raw: dict):
+        self.notification_group_id = raw.get('notification_group_id')
+        value = raw.get('notification')
+        if value is not None:
+            value = Notification.from_raw(value)
+        self.notification = value
+
+
+@dataclass
+class UpdateNotificationGroup(TDObject):
+    """A list of active notifications in a notification group has changed"""
+
+    notification_group_id: int = None
+    type: TDObject = None
+    chat_id: int = None
+    notification_settings_chat_id: int = None
+    notification_sound_id: int = None
+    total_count: int = None
+    added_notifications: List[Notification] = None
+    removed_notification_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.notification_group_id = raw.get('notification_group_id')
+        value = raw.get('type')
+        if value is not None:
+            value = NotificationGroupType(value)
+        self.type = value
+        self.chat_id = raw.get('chat_id')
+        self.notification_settings_chat_id = raw.get('notification_settings_chat_id')
+        value = raw.get('notification_sound_id')
+        if value is not None:
+            value = int(value)
+        self.notification_sound_id = value
+        self.total_count = raw.get('total_count')
+        value = raw.get('added_notifications')
+        if value is not None:
+            value = [Notification.from_raw(item0) for item0 in value]
+        self.added_notifications = value
+        self.removed_notification_ids = raw.get('removed_notification_ids')
+
+
+@dataclass
+class UpdateActiveNotifications(TDObject):
+    """
+    Contains active notifications that were shown on previous application
+    launches. This update is sent only if the message database is used. In that
+    case it comes once before any updateNotification and updateNotificationGroup
+    update
+    """
+
+    groups: List[NotificationGroup] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('groups')
+        if value is not None:
+            value = [NotificationGroup.from_raw(item0) for item0 in value]
+        self.groups = value
+
+
+@dataclass
+class UpdateHavePendingNotifications(TDObject):
+    """
+    Describes whether there are some pending notification updates. Can be used to
+    prevent application from killing, while there are some pending notifications
+    """
+
+    have_delayed_notifications: bool = None
+    have_unreceived_notifications: bool = None
+
+    def _decode(self, raw: dict):
+        self.have_delayed_notifications = raw.get('have_delayed_notifications')
+        self.have_unreceived_notifications = raw.get('have_unreceived_notifications')
+
+
+@dataclass
+class UpdateDeleteMessages(TDObject):
+    """Some messages were deleted"""
+
+    chat_id: int = None
+    message_ids: List[int] = None
+    is_permanent: bool = None
+    from_cache: bool = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_ids = raw.get('message_ids')
+        self.is_permanent = raw.get('is_permanent')
+        self.from_cache = raw.get('from_cache')
+
+
+@dataclass
+class UpdateChatAction(TDObject):
+    """A message sender activity in the chat has changed"""
+
+    chat_id: int = None
+    message_thread_id: int = None
+    sender_id: TDObject = None
+    action: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_thread_id = raw.get('message_thread_id')
+        value = raw.get('sender_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.sender_id = value
+        value = raw.get('action')
+        if value is not None:
+            value = ChatAction(value)
+        self.action = value
+
+
+@dataclass
+class UpdateUserStatus(TDObject):
+    """The user went online or offline"""
+
+    user_id: int = None
+    status: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        value = raw.get('status')
+        if value is not None:
+            value = UserStatus(value)
+        self.status = value
+
+
+@dataclass
+class UpdateUser(TDObject):
+    """
+    Some data of a user has changed. This update is guaranteed to come before the
+    user identifier is returned to the application
+    """
+
+    user: User = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('user')
+        if value is not None:
+            value = User.from_raw(value)
+        self.user = value
+
+
+@dataclass
+class UpdateBasicGroup(TDObject):
+    """
+    Some data of a basic group has changed. This update is guaranteed to come
+    before the basic group identifier is returned to the application
+    """
+
+    basic_group: BasicGroup = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('basic_group')
+        if value is not None:
+            value = BasicGroup.from_raw(value)
+        self.basic_group = value
+
+
+@dataclass
+class UpdateSupergroup(TDObject):
+    """
+    Some data of a supergroup or a channel has changed. This update is guaranteed
+    to come before the supergroup identifier is returned to the application
+    """
+
+    supergroup: Supergroup = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('supergroup')
+        if value is not None:
+            value = Supergroup.from_raw(value)
+        self.supergroup = value
+
+
+@dataclass
+class UpdateSecretChat(TDObject):
+    """
+    Some data of a secret chat has changed. This update is guaranteed to come
+    before the secret chat identifier is returned to the application
+    """
+
+    secret_chat: SecretChat = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('secret_chat')
+        if value is not None:
+            value = SecretChat.from_raw(value)
+        self.secret_chat = value
+
+
+@dataclass
+class UpdateUserFullInfo(TDObject):
+    """Some data in userFullInfo has been changed"""
+
+    user_id: int = None
+    user_full_info: UserFullInfo = None
+
+    def _decode(self, raw: dict):
+        self.user_id = raw.get('user_id')
+        value = raw.get('user_full_info')
+        if value is not None:
+            value = UserFullInfo.from_raw(value)
+        self.user_full_info = value
+
+
+@dataclass
+class UpdateBasicGroupFullInfo(TDObject):
+    """Some data in basicGroupFullInfo has been changed"""
+
+    basic_group_id: int = None
+    basic_group_full_info: BasicGroupFullInfo = None
+
+    def _decode(self, raw: dict):
+        self.basic_group_id = raw.get('basic_group_id')
+        value = raw.get('basic_group_full_info')
+        if value is not None:
+            value = BasicGroupFullInfo.from_raw(value)
+        self.basic_group_full_info = value
+
+
+@dataclass
+class UpdateSupergroupFullInfo(TDObject):
+    """Some data in supergroupFullInfo has been changed"""
+
+    supergroup_id: int = None
+    supergroup_full_info: SupergroupFullInfo = None
+
+    def _decode(self, raw: dict):
+        self.supergroup_id = raw.get('supergroup_id')
+        value = raw.get('supergroup_full_info')
+        if value is not None:
+            value = SupergroupFullInfo.from_raw(value)
+        self.supergroup_full_info = value
+
+
+@dataclass
+class UpdateServiceNotification(TDObject):
+    """
+    A service notification from the server was received. Upon receiving this the
+    application must show a popup with the content of the notification
+    """
+
+    type: str = None
+    content: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.type = raw.get('type')
+        value = raw.get('content')
+        if value is not None:
+            value = MessageContent(value)
+        self.content = value
+
+
+@dataclass
+class UpdateFile(TDObject):
+    """Information about a file was updated"""
+
+    file: File = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('file')
+        if value is not None:
+            value = File.from_raw(value)
+        self.file = value
+
+
+@dataclass
+class UpdateFileGenerationStart(TDObject):
+    """The file generation process needs to be started by the application"""
+
+    generation_id: int = None
+    original_path: str = None
+    destination_path: str = None
+    conversion: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('generation_id')
+        if value is not None:
+            value = int(value)
+        self.generation_id = value
+        self.original_path = raw.get('original_path')
+        self.destination_path = raw.get('destination_path')
+        self.conversion = raw.get('conversion')
+
+
+@dataclass
+class UpdateFileGenerationStop(TDObject):
+    """File generation is no longer needed"""
+
+    generation_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('generation_id')
+        if value is not None:
+            value = int(value)
+        self.generation_id = value
+
+
+@dataclass
+class UpdateFileDownloads(TDObject):
+    """The state of the file download list has changed"""
+
+    total_size: int = None
+    total_count: int = None
+    downloaded_size: int = None
+
+    def _decode(self, raw: dict):
+        self.total_size = raw.get('total_size')
+        self.total_count = raw.get('total_count')
+        self.downloaded_size = raw.get('downloaded_size')
+
+
+@dataclass
+class UpdateFileAddedToDownloads(TDObject):
+    """
+    A file was added to the file download list. This update is sent only after
+    file download list is loaded for the first time
+    """
+
+    file_download: FileDownload = None
+    counts: DownloadedFileCounts = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('file_download')
+        if value is not None:
+            value = FileDownload.from_raw(value)
+        self.file_download = value
+        value = raw.get('counts')
+        if value is not None:
+            value = DownloadedFileCounts.from_raw(value)
+        self.counts = value
+
+
+@dataclass
+class UpdateFileDownload(TDObject):
+    """
+    A file download was changed. This update is sent only after file download list
+    is loaded for the first time
+    """
+
+    file_id: int = None
+    complete_date: int = None
+    is_paused: bool = None
+    counts: DownloadedFileCounts = None
+
+    def _decode(self, raw: dict):
+        self.file_id = raw.get('file_id')
+        self.complete_date = raw.get('complete_date')
+        self.is_paused = raw.get('is_paused')
+        value = raw.get('counts')
+        if value is not None:
+            value = DownloadedFileCounts.from_raw(value)
+        self.counts = value
+
+
+@dataclass
+class UpdateFileRemovedFromDownloads(TDObject):
+    """
+    A file was removed from the file download list. This update is sent only after
+    file download list is loaded for the first time
+    """
+
+    file_id: int = None
+    counts: DownloadedFileCounts = None
+
+    def _decode(self, raw: dict):
+        self.file_id = raw.get('file_id')
+        value = raw.get('counts')
+        if value is not None:
+            value = DownloadedFileCounts.from_raw(value)
+        self.counts = value
+
+
+@dataclass
+class UpdateCall(TDObject):
+    """New call was created or information about a call was updated"""
+
+    call: Call = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('call')
+        if value is not None:
+            value = Call.from_raw(value)
+        self.call = value
+
+
+@dataclass
+class UpdateGroupCall(TDObject):
+    """Information about a group call was updated"""
+
+    group_call: GroupCall = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('group_call')
+        if value is not None:
+            value = GroupCall.from_raw(value)
+        self.group_call = value
+
+
+@dataclass
+class UpdateGroupCallParticipant(TDObject):
+    """
+    Information about a group call participant was changed. The updates are sent
+    only after the group call is received through getGroupCall and only if the
+    call is joined or being joined
+    """
+
+    group_call_id: int = None
+    participant: GroupCallParticipant = None
+
+    def _decode(self, raw: dict):
+        self.group_call_id = raw.get('group_call_id')
+        value = raw.get('participant')
+        if value is not None:
+            value = GroupCallParticipant.from_raw(value)
+        self.participant = value
+
+
+@dataclass
+class UpdateNewCallSignalingData(TDObject):
+    """New call signaling data arrived"""
+
+    call_id: int = None
+    data: str = None
+
+    def _decode(self, raw: dict):
+        self.call_id = raw.get('call_id')
+        self.data = raw.get('data')
+
+
+@dataclass
+class UpdateUserPrivacySettingRules(TDObject):
+    """Some privacy setting rules have been changed"""
+
+    setting: TDObject = None
+    rules: UserPrivacySettingRules = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('setting')
+        if value is not None:
+            value = UserPrivacySetting(value)
+        self.setting = value
+        value = raw.get('rules')
+        if value is not None:
+            value = UserPrivacySettingRules.from_raw(value)
+        self.rules = value
+
+
+@dataclass
+class UpdateUnreadMessageCount(TDObject):
+    """
+    Number of unread messages in a chat list has changed. This update is sent only
+    if the message database is used
+    """
+
+    chat_list: TDObject = None
+    unread_count: int = None
+    unread_unmuted_count: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat_list')
+        if value is not None:
+            value = ChatList(value)
+        self.chat_list = value
+        self.unread_count = raw.get('unread_count')
+        self.unread_unmuted_count = raw.get('unread_unmuted_count')
+
+
+@dataclass
+class UpdateUnreadChatCount(TDObject):
+    """
+    Number of unread chats, i.e. with unread messages or marked as unread, has
+    changed. This update is sent only if the message database is used
+    """
+
+    chat_list: TDObject = None
+    total_count: int = None
+    unread_count: int = None
+    unread_unmuted_count: int = None
+    marked_as_unread_count: int = None
+    marked_as_unread_unmuted_count: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat_list')
+        if value is not None:
+            value = ChatList(value)
+        self.chat_list = value
+        self.total_count = raw.get('total_count')
+        self.unread_count = raw.get('unread_count')
+        self.unread_unmuted_count = raw.get('unread_unmuted_count')
+        self.marked_as_unread_count = raw.get('marked_as_unread_count')
+        self.marked_as_unread_unmuted_count = raw.get('marked_as_unread_unmuted_count')
+
+
+@dataclass
+class UpdateStory(TDObject):
+    """A story was changed"""
+
+    story: Story = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('story')
+        if value is not None:
+            value = Story.from_raw(value)
+        self.story = value
+
+
+@dataclass
+class UpdateStoryDeleted(TDObject):
+    """A story became inaccessible"""
+
+    story_sender_chat_id: int = None
+    story_id: int = None
+
+    def _decode(self, raw: dict):
+        self.story_sender_chat_id = raw.get('story_sender_chat_id')
+        self.story_id = raw.get('story_id')
+
+
+@dataclass
+class UpdateStorySendSucceeded(TDObject):
+    """A story has been successfully sent"""
+
+    story: Story = None
+    old_story_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('story')
+        if value is not None:
+            value = Story.from_raw(value)
+        self.story = value
+        self.old_story_id = raw.get('old_story_id')
+
+
+@dataclass
+class UpdateStorySendFailed(TDObject):
+    """
+    A story failed to send. If the story sending is canceled, then
+    updateStoryDeleted will be received instead of this update
+    """
+
+    story: Story = None
+    error: Error = None
+    error_type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('story')
+        if value is not None:
+            value = Story.from_raw(value)
+        self.story = value
+        value = raw.get('error')
+        if value is not None:
+            value = Error.from_raw(value)
+        self.error = value
+        value = raw.get('error_type')
+        if value is not None:
+            value = CanSendStoryResult(value)
+        self.error_type = value
+
+
+@dataclass
+class UpdateChatActiveStories(TDObject):
+    """The list of active stories posted by a specific chat has changed"""
+
+    active_stories: ChatActiveStories = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('active_stories')
+        if value is not None:
+            value = ChatActiveStories.from_raw(value)
+        self.active_stories = value
+
+
+@dataclass
+class UpdateStoryListChatCount(TDObject):
+    """Number of chats in a story list has changed"""
+
+    story_list: TDObject = None
+    chat_count: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('story_list')
+        if value is not None:
+            value = StoryList(value)
+        self.story_list = value
+        self.chat_count = raw.get('chat_count')
+
+
+@dataclass
+class UpdateStoryStealthMode(TDObject):
+    """Story stealth mode settings have changed"""
+
+    active_until_date: int = None
+    cooldown_until_date: int = None
+
+    def _decode(self, raw: dict):
+        self.active_until_date = raw.get('active_until_date')
+        self.cooldown_until_date = raw.get('cooldown_until_date')
+
+
+@dataclass
+class UpdateOption(TDObject):
+    """An option changed its value"""
+
+    name: str = None
+    value: TDObject = None
+
+    def _decode(self, raw: dict):
+        self.name = raw.get('name')
+        value = raw.get('value')
+        if value is not None:
+            value = OptionValue(value)
+        self.value = value
+
+
+@dataclass
+class UpdateStickerSet(TDObject):
+    """A sticker set has changed"""
+
+    sticker_set: StickerSet = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker_set')
+        if value is not None:
+            value = StickerSet.from_raw(value)
+        self.sticker_set = value
+
+
+@dataclass
+class UpdateInstalledStickerSets(TDObject):
+    """The list of installed sticker sets was updated"""
+
+    sticker_type: TDObject = None
+    sticker_set_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker_type')
+        if value is not None:
+            value = StickerType(value)
+        self.sticker_type = value
+        value = raw.get('sticker_set_ids')
+        if value is not None:
+            value = [int(item0) for item0 in value]
+        self.sticker_set_ids = value
+
+
+@dataclass
+class UpdateTrendingStickerSets(TDObject):
+    """The list of trending sticker sets was updated or some of them were viewed"""
+
+    sticker_type: TDObject = None
+    sticker_sets: TrendingStickerSets = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('sticker_type')
+        if value is not None:
+            value = StickerType(value)
+        self.sticker_type = value
+        value = raw.get('sticker_sets')
+        if value is not None:
+            value = TrendingStickerSets.from_raw(value)
+        self.sticker_sets = value
+
+
+@dataclass
+class UpdateRecentStickers(TDObject):
+    """The list of recently used stickers was updated"""
+
+    is_attached: bool = None
+    sticker_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.is_attached = raw.get('is_attached')
+        self.sticker_ids = raw.get('sticker_ids')
+
+
+@dataclass
+class UpdateFavoriteStickers(TDObject):
+    """The list of favorite stickers was updated"""
+
+    sticker_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.sticker_ids = raw.get('sticker_ids')
+
+
+@dataclass
+class UpdateSavedAnimations(TDObject):
+    """The list of saved animations was updated"""
+
+    animation_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.animation_ids = raw.get('animation_ids')
+
+
+@dataclass
+class UpdateSavedNotificationSounds(TDObject):
+    """
+    The list of saved notification sounds was updated. This update may not be sent
+    until information about a notification sound was requested for the first time
+    """
+
+    notification_sound_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('notification_sound_ids')
+        if value is not None:
+            value = [int(item0) for item0 in value]
+        self.notification_sound_ids = value
+
+
+@dataclass
+class UpdateDefaultBackground(TDObject):
+    """The default background has changed"""
+
+    for_dark_theme: bool = None
+    background: Background = None
+
+    def _decode(self, raw: dict):
+        self.for_dark_theme = raw.get('for_dark_theme')
+        value = raw.get('background')
+        if value is not None:
+            value = Background.from_raw(value)
+        self.background = value
+
+
+@dataclass
+class UpdateChatThemes(TDObject):
+    """The list of available chat themes has changed"""
+
+    chat_themes: List[ChatTheme] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('chat_themes')
+        if value is not None:
+            value = [ChatTheme.from_raw(item0) for item0 in value]
+        self.chat_themes = value
+
+
+@dataclass
+class UpdateAccentColors(TDObject):
+    """The list of supported accent colors has changed"""
+
+    colors: List[AccentColor] = None
+    available_accent_color_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('colors')
+        if value is not None:
+            value = [AccentColor.from_raw(item0) for item0 in value]
+        self.colors = value
+        self.available_accent_color_ids = raw.get('available_accent_color_ids')
+
+
+@dataclass
+class UpdateProfileAccentColors(TDObject):
+    """The list of supported accent colors for user profiles has changed"""
+
+    colors: List[ProfileAccentColor] = None
+    available_accent_color_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('colors')
+        if value is not None:
+            value = [ProfileAccentColor.from_raw(item0) for item0 in value]
+        self.colors = value
+        self.available_accent_color_ids = raw.get('available_accent_color_ids')
+
+
+@dataclass
+class UpdateLanguagePackStrings(TDObject):
+    """Some language pack strings have been updated"""
+
+    localization_target: str = None
+    language_pack_id: str = None
+    strings: List[LanguagePackString] = None
+
+    def _decode(self, raw: dict):
+        self.localization_target = raw.get('localization_target')
+        self.language_pack_id = raw.get('language_pack_id')
+        value = raw.get('strings')
+        if value is not None:
+            value = [LanguagePackString.from_raw(item0) for item0 in value]
+        self.strings = value
+
+
+@dataclass
+class UpdateConnectionState(TDObject):
+    """
+    The connection state has changed. This update must be used only to show a
+    human-readable description of the connection state
+    """
+
+    state: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('state')
+        if value is not None:
+            value = ConnectionState(value)
+        self.state = value
+
+
+@dataclass
+class UpdateTermsOfService(TDObject):
+    """
+    New terms of service must be accepted by the user. If the terms of service are
+    declined, then the deleteAccount method must be called with the reason
+    "Decline ToS update\"
+    """
+
+    terms_of_service_id: str = None
+    terms_of_service: TermsOfService = None
+
+    def _decode(self, raw: dict):
+        self.terms_of_service_id = raw.get('terms_of_service_id')
+        value = raw.get('terms_of_service')
+        if value is not None:
+            value = TermsOfService.from_raw(value)
+        self.terms_of_service = value
+
+
+@dataclass
+class UpdateUsersNearby(TDObject):
+    """
+    The list of users nearby has changed. The update is guaranteed to be sent only
+    60 seconds after a successful searchChatsNearby request
+    """
+
+    users_nearby: List[ChatNearby] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('users_nearby')
+        if value is not None:
+            value = [ChatNearby.from_raw(item0) for item0 in value]
+        self.users_nearby = value
+
+
+@dataclass
+class UpdateUnconfirmedSession(TDObject):
+    """The first unconfirmed session has changed"""
+
+    session: UnconfirmedSession = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('session')
+        if value is not None:
+            value = UnconfirmedSession.from_raw(value)
+        self.session = value
+
+
+@dataclass
+class UpdateAttachmentMenuBots(TDObject):
+    """The list of bots added to attachment or side menu has changed"""
+
+    bots: List[AttachmentMenuBot] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('bots')
+        if value is not None:
+            value = [AttachmentMenuBot.from_raw(item0) for item0 in value]
+        self.bots = value
+
+
+@dataclass
+class UpdateWebAppMessageSent(TDObject):
+    """A message was sent by an opened Web App, so the Web App needs to be closed"""
+
+    web_app_launch_id: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('web_app_launch_id')
+        if value is not None:
+            value = int(value)
+        self.web_app_launch_id = value
+
+
+@dataclass
+class UpdateActiveEmojiReactions(TDObject):
+    """The list of active emoji reactions has changed"""
+
+    emojis: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.emojis = raw.get('emojis')
+
+
+@dataclass
+class UpdateDefaultReactionType(TDObject):
+    """The type of default reaction has changed"""
+
+    reaction_type: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('reaction_type')
+        if value is not None:
+            value = ReactionType(value)
+        self.reaction_type = value
+
+
+@dataclass
+class UpdateSavedMessagesTags(TDObject):
+    """Tags used in Saved Messages or a Saved Messages topic have changed"""
+
+    saved_messages_topic_id: int = None
+    tags: SavedMessagesTags = None
+
+    def _decode(self, raw: dict):
+        self.saved_messages_topic_id = raw.get('saved_messages_topic_id')
+        value = raw.get('tags')
+        if value is not None:
+            value = SavedMessagesTags.from_raw(value)
+        self.tags = value
+
+
+@dataclass
+class UpdateSpeechRecognitionTrial(TDObject):
+    """
+    The parameters of speech recognition without Telegram Premium subscription has
+    changed
+    """
+
+    max_media_duration: int = None
+    weekly_count: int = None
+    left_count: int = None
+    next_reset_date: int = None
+
+    def _decode(self, raw: dict):
+        self.max_media_duration = raw.get('max_media_duration')
+        self.weekly_count = raw.get('weekly_count')
+        self.left_count = raw.get('left_count')
+        self.next_reset_date = raw.get('next_reset_date')
+
+
+@dataclass
+class UpdateDiceEmojis(TDObject):
+    """The list of supported dice emojis has changed"""
+
+    emojis: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.emojis = raw.get('emojis')
+
+
+@dataclass
+class UpdateAnimatedEmojiMessageClicked(TDObject):
+    """
+    Some animated emoji message was clicked and a big animated sticker must be
+    played if the message is visible on the screen. chatActionWatchingAnimations
+    with the text of the message needs to be sent if the sticker is played
+    """
+
+    chat_id: int = None
+    message_id: int = None
+    sticker: Sticker = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('sticker')
+        if value is not None:
+            value = Sticker.from_raw(value)
+        self.sticker = value
+
+
+@dataclass
+class UpdateAnimationSearchParameters(TDObject):
+    """
+    The parameters of animation search through
+    getOption("animation_search_bot_username") bot has changed
+    """
+
+    provider: str = None
+    emojis: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.provider = raw.get('provider')
+        self.emojis = raw.get('emojis')
+
+
+@dataclass
+class UpdateSuggestedActions(TDObject):
+    """The list of suggested to the user actions has changed"""
+
+    added_actions: List[TDObject] = None
+    removed_actions: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('added_actions')
+        if value is not None:
+            value = [SuggestedAction(item0) for item0 in value]
+        self.added_actions = value
+        value = raw.get('removed_actions')
+        if value is not None:
+            value = [SuggestedAction(item0) for item0 in value]
+        self.removed_actions = value
+
+
+@dataclass
+class UpdateAddChatMembersPrivacyForbidden(TDObject):
+    """
+    Adding users to a chat has failed because of their privacy settings. An invite
+    link can be shared with the users if appropriate
+    """
+
+    chat_id: int = None
+    user_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.user_ids = raw.get('user_ids')
+
+
+@dataclass
+class UpdateAutosaveSettings(TDObject):
+    """Autosave settings for some type of chats were updated"""
+
+    scope: TDObject = None
+    settings: ScopeAutosaveSettings = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('scope')
+        if value is not None:
+            value = AutosaveSettingsScope(value)
+        self.scope = value
+        value = raw.get('settings')
+        if value is not None:
+            value = ScopeAutosaveSettings.from_raw(value)
+        self.settings = value
+
+
+@dataclass
+class UpdateNewInlineQuery(TDObject):
+    """A new incoming inline query; for bots only"""
+
+    id: int = None
+    sender_user_id: int = None
+    user_location: Location = None
+    chat_type: TDObject = None
+    query: str = None
+    offset: str = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.sender_user_id = raw.get('sender_user_id')
+        value = raw.get('user_location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.user_location = value
+        value = raw.get('chat_type')
+        if value is not None:
+            value = ChatType(value)
+        self.chat_type = value
+        self.query = raw.get('query')
+        self.offset = raw.get('offset')
+
+
+@dataclass
+class UpdateNewChosenInlineResult(TDObject):
+    """The user has chosen a result of an inline query; for bots only"""
+
+    sender_user_id: int = None
+    user_location: Location = None
+    query: str = None
+    result_id: str = None
+    inline_message_id: str = None
+
+    def _decode(self, raw: dict):
+        self.sender_user_id = raw.get('sender_user_id')
+        value = raw.get('user_location')
+        if value is not None:
+            value = Location.from_raw(value)
+        self.user_location = value
+        self.query = raw.get('query')
+        self.result_id = raw.get('result_id')
+        self.inline_message_id = raw.get('inline_message_id')
+
+
+@dataclass
+class UpdateNewCallbackQuery(TDObject):
+    """A new incoming callback query; for bots only"""
+
+    id: int = None
+    sender_user_id: int = None
+    chat_id: int = None
+    message_id: int = None
+    chat_instance: int = None
+    payload: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.sender_user_id = raw.get('sender_user_id')
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('chat_instance')
+        if value is not None:
+            value = int(value)
+        self.chat_instance = value
+        value = raw.get('payload')
+        if value is not None:
+            value = CallbackQueryPayload(value)
+        self.payload = value
+
+
+@dataclass
+class UpdateNewInlineCallbackQuery(TDObject):
+    """A new incoming callback query from a message sent via a bot; for bots only"""
+
+    id: int = None
+    sender_user_id: int = None
+    inline_message_id: str = None
+    chat_instance: int = None
+    payload: TDObject = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.sender_user_id = raw.get('sender_user_id')
+        self.inline_message_id = raw.get('inline_message_id')
+        value = raw.get('chat_instance')
+        if value is not None:
+            value = int(value)
+        self.chat_instance = value
+        value = raw.get('payload')
+        if value is not None:
+            value = CallbackQueryPayload(value)
+        self.payload = value
+
+
+@dataclass
+class UpdateNewShippingQuery(TDObject):
+    """
+    A new incoming shipping query; for bots only. Only for invoices with flexible
+    price
+    """
+
+    id: int = None
+    sender_user_id: int = None
+    invoice_payload: str = None
+    shipping_address: Address = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.sender_user_id = raw.get('sender_user_id')
+        self.invoice_payload = raw.get('invoice_payload')
+        value = raw.get('shipping_address')
+        if value is not None:
+            value = Address.from_raw(value)
+        self.shipping_address = value
+
+
+@dataclass
+class UpdateNewPreCheckoutQuery(TDObject):
+    """
+    A new incoming pre-checkout query; for bots only. Contains full information
+    about a checkout
+    """
+
+    id: int = None
+    sender_user_id: int = None
+    currency: str = None
+    total_amount: int = None
+    invoice_payload: str = None
+    shipping_option_id: str = None
+    order_info: OrderInfo = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.sender_user_id = raw.get('sender_user_id')
+        self.currency = raw.get('currency')
+        self.total_amount = raw.get('total_amount')
+        self.invoice_payload = raw.get('invoice_payload')
+        self.shipping_option_id = raw.get('shipping_option_id')
+        value = raw.get('order_info')
+        if value is not None:
+            value = OrderInfo.from_raw(value)
+        self.order_info = value
+
+
+@dataclass
+class UpdateNewCustomEvent(TDObject):
+    """A new incoming event; for bots only"""
+
+    event: str = None
+
+    def _decode(self, raw: dict):
+        self.event = raw.get('event')
+
+
+@dataclass
+class UpdateNewCustomQuery(TDObject):
+    """A new incoming query; for bots only"""
+
+    id: int = None
+    data: str = None
+    timeout: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('id')
+        if value is not None:
+            value = int(value)
+        self.id = value
+        self.data = raw.get('data')
+        self.timeout = raw.get('timeout')
+
+
+@dataclass
+class UpdatePoll(TDObject):
+    """A poll was updated; for bots only"""
+
+    poll: Poll = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('poll')
+        if value is not None:
+            value = Poll.from_raw(value)
+        self.poll = value
+
+
+@dataclass
+class UpdatePollAnswer(TDObject):
+    """A user changed the answer to a poll; for bots only"""
+
+    poll_id: int = None
+    voter_id: TDObject = None
+    option_ids: List[int] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('poll_id')
+        if value is not None:
+            value = int(value)
+        self.poll_id = value
+        value = raw.get('voter_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.voter_id = value
+        self.option_ids = raw.get('option_ids')
+
+
+@dataclass
+class UpdateChatMember(TDObject):
+    """User rights changed in a chat; for bots only"""
+
+    chat_id: int = None
+    actor_user_id: int = None
+    date: int = None
+    invite_link: ChatInviteLink = None
+    via_chat_folder_invite_link: bool = None
+    old_chat_member: ChatMember = None
+    new_chat_member: ChatMember = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.actor_user_id = raw.get('actor_user_id')
+        self.date = raw.get('date')
+        value = raw.get('invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.invite_link = value
+        self.via_chat_folder_invite_link = raw.get('via_chat_folder_invite_link')
+        value = raw.get('old_chat_member')
+        if value is not None:
+            value = ChatMember.from_raw(value)
+        self.old_chat_member = value
+        value = raw.get('new_chat_member')
+        if value is not None:
+            value = ChatMember.from_raw(value)
+        self.new_chat_member = value
+
+
+@dataclass
+class UpdateNewChatJoinRequest(TDObject):
+    """A user sent a join request to a chat; for bots only"""
+
+    chat_id: int = None
+    request: ChatJoinRequest = None
+    user_chat_id: int = None
+    invite_link: ChatInviteLink = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('request')
+        if value is not None:
+            value = ChatJoinRequest.from_raw(value)
+        self.request = value
+        self.user_chat_id = raw.get('user_chat_id')
+        value = raw.get('invite_link')
+        if value is not None:
+            value = ChatInviteLink.from_raw(value)
+        self.invite_link = value
+
+
+@dataclass
+class UpdateChatBoost(TDObject):
+    """A chat boost has changed; for bots only"""
+
+    chat_id: int = None
+    boost: ChatBoost = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        value = raw.get('boost')
+        if value is not None:
+            value = ChatBoost.from_raw(value)
+        self.boost = value
+
+
+@dataclass
+class UpdateMessageReaction(TDObject):
+    """User changed its reactions on a message with public reactions; for bots only"""
+
+    chat_id: int = None
+    message_id: int = None
+    actor_id: TDObject = None
+    date: int = None
+    old_reaction_types: List[TDObject] = None
+    new_reaction_types: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        value = raw.get('actor_id')
+        if value is not None:
+            value = MessageSender(value)
+        self.actor_id = value
+        self.date = raw.get('date')
+        value = raw.get('old_reaction_types')
+        if value is not None:
+            value = [ReactionType(item0) for item0 in value]
+        self.old_reaction_types = value
+        value = raw.get('new_reaction_types')
+        if value is not None:
+            value = [ReactionType(item0) for item0 in value]
+        self.new_reaction_types = value
+
+
+@dataclass
+class UpdateMessageReactions(TDObject):
+    """
+    Reactions added to a message with anonymous reactions have changed; for bots
+    only
+    """
+
+    chat_id: int = None
+    message_id: int = None
+    date: int = None
+    reactions: List[MessageReaction] = None
+
+    def _decode(self, raw: dict):
+        self.chat_id = raw.get('chat_id')
+        self.message_id = raw.get('message_id')
+        self.date = raw.get('date')
+        value = raw.get('reactions')
+        if value is not None:
+            value = [MessageReaction.from_raw(item0) for item0 in value]
+        self.reactions = value
+
+
+@dataclass
+class Updates(TDObject):
+    """Contains a list of updates"""
+
+    updates: List[TDObject] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('updates')
+        if value is not None:
+            value = [Update(item0) for item0 in value]
+        self.updates = value
+
+
+@dataclass
+class LogStreamDefault(TDObject):
+    """The log is written to stderr or an OS specific log"""
+
+
+@dataclass
+class LogStreamFile(TDObject):
+    """The log is written to a file"""
+
+    path: str = None
+    max_file_size: int = None
+    redirect_stderr: bool = None
+
+    def _decode(self, raw: dict):
+        self.path = raw.get('path')
+        self.max_file_size = raw.get('max_file_size')
+        self.redirect_stderr = raw.get('redirect_stderr')
+
+
+@dataclass
+class LogStreamEmpty(TDObject):
+    """The log is written nowhere"""
+
+
+@dataclass
+class LogVerbosityLevel(TDObject):
+    """Contains a TDLib internal log verbosity level"""
+
+    verbosity_level: int = None
+
+    def _decode(self, raw: dict):
+        self.verbosity_level = raw.get('verbosity_level')
+
+
+@dataclass
+class LogTags(TDObject):
+    """Contains a list of available TDLib internal log tags"""
+
+    tags: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.tags = raw.get('tags')
+
+
+@dataclass
+class UserSupportInfo(TDObject):
+    """Contains custom information about the user"""
+
+    message: FormattedText = None
+    author: str = None
+    date: int = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('message')
+        if value is not None:
+            value = FormattedText.from_raw(value)
+        self.message = value
+        self.author = raw.get('author')
+        self.date = raw.get('date')
+
+
+@dataclass
+class TestInt(TDObject):
+    """A simple object containing a number; for testing only"""
+
+    value: int = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class TestString(TDObject):
+    """A simple object containing a string; for testing only"""
+
+    value: str = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class TestBytes(TDObject):
+    """A simple object containing a sequence of bytes; for testing only"""
+
+    value: str = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class TestVectorInt(TDObject):
+    """A simple object containing a vector of numbers; for testing only"""
+
+    value: List[int] = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class TestVectorIntObject(TDObject):
+    """
+    A simple object containing a vector of objects that hold a number; for testing
+    only
+    """
+
+    value: List[TestInt] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('value')
+        if value is not None:
+            value = [TestInt.from_raw(item0) for item0 in value]
+        self.value = value
+
+
+@dataclass
+class TestVectorString(TDObject):
+    """A simple object containing a vector of strings; for testing only"""
+
+    value: List[str] = None
+
+    def _decode(self, raw: dict):
+        self.value = raw.get('value')
+
+
+@dataclass
+class TestVectorStringObject(TDObject):
+    """
+    A simple object containing a vector of objects that hold a string; for testing
+    only
+    """
+
+    value: List[TestString] = None
+
+    def _decode(self, raw: dict):
+        value = raw.get('value')
+        if value is not None:
+            value = [TestString.from_raw(item0) for item0 in value]
+        self.value = value
+
+
+class AuthenticationCodeTypeBuilder(TDObjectBuilder):
+    """
+    Provides information about the method by which an authentication code is
+    delivered to the user
+    """
+
+    mapping = {
+        'authenticationCodeTypeTelegramMessage': AuthenticationCodeTypeTelegramMessage,
+        'authenticationCodeTypeSms': AuthenticationCodeTypeSms,
+        'authenticationCodeTypeCall': AuthenticationCodeTypeCall,
+        'authenticationCodeTypeFlashCall': AuthenticationCodeTypeFlashCall,
+        'authenticationCodeTypeMissedCall': AuthenticationCodeTypeMissedCall,
+        'authenticationCodeTypeFragment': AuthenticationCodeTypeFragment,
+        'authenticationCodeTypeFirebaseAndroid': AuthenticationCodeTypeFirebaseAndroid,
+        'authenticationCodeTypeFirebaseIos': AuthenticationCodeTypeFirebaseIos,
+    }
+
+
+AuthenticationCodeType = AuthenticationCodeTypeBuilder()
+
+
+class EmailAddressAuthenticationBuilder(TDObjectBuilder):
+    """Contains authentication data for a email address"""
+
+    mapping = {
+        'emailAddressAuthenticationCode': EmailAddressAuthenticationCode,
+        'emailAddressAuthenticationAppleId': EmailAddressAuthenticationAppleId,
+        'emailAddressAuthenticationGoogleId': EmailAddressAuthenticationGoogleId,
+    }
+
+
+EmailAddressAuthentication = EmailAddressAuthenticationBuilder()
+
+
+class EmailAddressResetStateBuilder(TDObjectBuilder):
+    """Describes reset state of a email address"""
+
+    mapping = {
+        'emailAddressResetStateAvailable': EmailAddressResetStateAvailable,
+        'emailAddressResetStatePending': EmailAddressResetStatePending,
+    }
+
+
+EmailAddressResetState = EmailAddressResetStateBuilder()
+
+
+class AuthorizationStateBuilder(TDObjectBuilder):
+    """Represents the current authorization state of the TDLib client"""
+
+    mapping = {
+        'authorizationStateWaitTdlibParameters': AuthorizationStateWaitTdlibParameters,
+        'authorizationStateWaitPhoneNumber': AuthorizationStateWaitPhoneNumber,
+        'authorizationStateWaitEmailAddress': AuthorizationStateWaitEmailAddress,
+        'authorizationStateWaitEmailCode': AuthorizationStateWaitEmailCode,
+        'authorizationStateWaitCode': AuthorizationStateWaitCode,
+        'authorizationStateWaitOtherDeviceConfirmation': AuthorizationStateWaitOtherDeviceConfirmation,
+        'authorizationStateWaitRegistration': AuthorizationStateWaitRegistration,
+        'authorizationStateWaitPassword': AuthorizationStateWaitPassword,
+        'authorizationStateReady': AuthorizationStateReady,
+        'authorizationStateLoggingOut': AuthorizationStateLoggingOut,
+        'authorizationStateClosing': AuthorizationStateClosing,
+        'authorizationStateClosed': AuthorizationStateClosed,
+    }
+
+
+AuthorizationState = AuthorizationStateBuilder()
+
+
+class InputFileBuilder(TDObjectBuilder):
+    """Points to a file"""
+
+    mapping = {
+        'inputFileId': InputFileId,
+        'inputFileRemote': InputFileRemote,
+        'inputFileLocal': InputFileLocal,
+        'inputFileGenerated': InputFileGenerated,
+    }
+
+
+InputFile = InputFileBuilder()
+
+
+class ThumbnailFormatBuilder(TDObjectBuilder):
+    """Describes format of a thumbnail"""
+
+    mapping = {
+        'thumbnailFormatJpeg': ThumbnailFormatJpeg,
+        'thumbnailFormatGif': ThumbnailFormatGif,
+        'thumbnailFormatMpeg4': ThumbnailFormatMpeg4,
+        'thumbnailFormatPng': ThumbnailFormatPng,
+        'thumbnailFormatTgs': ThumbnailFormatTgs,
+        'thumbnailFormatWebm': ThumbnailFormatWebm,
+        'thumbnailFormatWebp': ThumbnailFormatWebp,
+    }
+
+
+ThumbnailFormat = ThumbnailFormatBuilder()
+
+
+class MaskPointBuilder(TDObjectBuilder):
+    """Part of the face, relative to which a mask is placed"""
+
+    mapping = {
+        'maskPointForehead': MaskPointForehead,
+        'maskPointEyes': MaskPointEyes,
+        'maskPointMouth': MaskPointMouth,
+        'maskPointChin': MaskPointChin,
+    }
+
+
+MaskPoint = MaskPointBuilder()
+
+
+class StickerFormatBuilder(TDObjectBuilder):
+    """Describes format of a sticker"""
+
+    mapping = {
+        'stickerFormatWebp': StickerFormatWebp,
+        'stickerFormatTgs': StickerFormatTgs,
+        'stickerFormatWebm': StickerFormatWebm,
+    }
+
+
+StickerFormat = StickerFormatBuilder()
+
+
+class StickerTypeBuilder(TDObjectBuilder):
+    """Describes type of a sticker"""
+
+    mapping = {
+        'stickerTypeRegular': StickerTypeRegular,
+        'stickerTypeMask': StickerTypeMask,
+        'stickerTypeCustomEmoji': StickerTypeCustomEmoji,
+    }
+
+
+StickerType = StickerTypeBuilder()
+
+
+class StickerFullTypeBuilder(TDObjectBuilder):
+    """Contains full information about sticker type"""
+
+    mapping = {
+        'stickerFullTypeRegular': StickerFullTypeRegular,
+        'stickerFullTypeMask': StickerFullTypeMask,
+        'stickerFullTypeCustomEmoji': StickerFullTypeCustomEmoji,
+    }
+
+
+StickerFullType = StickerFullTypeBuilder()
+
+
+class PollTypeBuilder(TDObjectBuilder):
+    """Describes the type of a poll"""
+
+    mapping = {
+        'pollTypeRegular': PollTypeRegular,
+        'pollTypeQuiz': PollTypeQuiz,
+    }
+
+
+PollType = PollTypeBuilder()
+
+
+class UserTypeBuilder(TDObjectBuilder):
+    """
+    Represents the type of a user. The following types are possible: regular
+    users, deleted users and bots
+    """
+
+    mapping = {
+        'userTypeRegular': UserTypeRegular,
+        'userTypeDeleted': UserTypeDeleted,
+        'userTypeBot': UserTypeBot,
+        'userTypeUnknown': UserTypeUnknown,
+    }
+
+
+UserType = UserTypeBuilder()
+
+
+class BusinessAwayMessageScheduleBuilder(TDObjectBuilder):
+    """
+    Describes conditions for sending of away messages by a Telegram Business
+    account
+    """
+
+    mapping = {
+        'businessAwayMessageScheduleAlways': BusinessAwayMessageScheduleAlways,
+        'businessAwayMessageScheduleOutsideOfOpeningHours': BusinessAwayMessageScheduleOutsideOfOpeningHours,
+        'businessAwayMessageScheduleCustom': BusinessAwayMessageScheduleCustom,
+    }
+
+
+BusinessAwayMessageSchedule = BusinessAwayMessageScheduleBuilder()
+
+
+class ChatPhotoStickerTypeBuilder(TDObjectBuilder):
+    """Describes type of a sticker, which was used to create a chat photo"""
+
+    mapping = {
+        'chatPhotoStickerTypeRegularOrMask': ChatPhotoStickerTypeRegularOrMask,
+        'chatPhotoStickerTypeCustomEmoji': ChatPhotoStickerTypeCustomEmoji,
+    }
+
+
+ChatPhotoStickerType = ChatPhotoStickerTypeBuilder()
+
+
+class InputChatPhotoBuilder(TDObjectBuilder):
+    """Describes a photo to be set as a user profile or chat photo"""
+
+    mapping = {
+        'inputChatPhotoPrevious': InputChatPhotoPrevious,
+        'inputChatPhotoStatic': InputChatPhotoStatic,
+        'inputChatPhotoAnimation': InputChatPhotoAnimation,
+        'inputChatPhotoSticker': InputChatPhotoSticker,
+    }
+
+
+InputChatPhoto = InputChatPhotoBuilder()
+
+
+class PremiumGiveawayParticipantStatusBuilder(TDObjectBuilder):
+    """Contains information about status of a user in a Telegram Premium giveaway"""
+
+    mapping = {
+        'premiumGiveawayParticipantStatusEligible': PremiumGiveawayParticipantStatusEligible,
+        'premiumGiveawayParticipantStatusParticipating': PremiumGiveawayParticipantStatusParticipating,
+        'premiumGiveawayParticipantStatusAlreadyWasMember': PremiumGiveawayParticipantStatusAlreadyWasMember,
+        'premiumGiveawayParticipantStatusAdministrator': PremiumGiveawayParticipantStatusAdministrator,
+        'premiumGiveawayParticipantStatusDisallowedCountry': PremiumGiveawayParticipantStatusDisallowedCountry,
+    }
+
+
+PremiumGiveawayParticipantStatus = PremiumGiveawayParticipantStatusBuilder()
+
+
+class PremiumGiveawayInfoBuilder(TDObjectBuilder):
+    """Contains information about Telegram Premium giveaway"""
+
+    mapping = {
+        'premiumGiveawayInfoOngoing': PremiumGiveawayInfoOngoing,
+        'premiumGiveawayInfoCompleted': PremiumGiveawayInfoCompleted,
+    }
+
+
+PremiumGiveawayInfo = PremiumGiveawayInfoBuilder()
+
+
+class ChatMemberStatusBuilder(TDObjectBuilder):
+    """Provides information about the status of a member in a chat"""
+
+    mapping = {
+        'chatMemberStatusCreator': ChatMemberStatusCreator,
+        'chatMemberStatusAdministrator': ChatMemberStatusAdministrator,
+        'chatMemberStatusMember': ChatMemberStatusMember,
+        'chatMemberStatusRestricted': ChatMemberStatusRestricted,
+        'chatMemberStatusLeft': ChatMemberStatusLeft,
+        'chatMemberStatusBanned': ChatMemberStatusBanned,
+    }
+
+
+ChatMemberStatus = ChatMemberStatusBuilder()
+
+
+class ChatMembersFilterBuilder(TDObjectBuilder):
+    """Specifies the kind of chat members to return in searchChatMembers"""
+
+    mapping = {
+        'chatMembersFilterContacts': ChatMembersFilterContacts,
+        'chatMembersFilterAdministrators': ChatMembersFilterAdministrators,
+        'chatMembersFilterMembers': ChatMembersFilterMembers,
+        'chatMembersFilterMention': ChatMembersFilterMention,
+        'chatMembersFilterRestricted': ChatMembersFilterRestricted,
+        'chatMembersFilterBanned': ChatMembersFilterBanned,
+        'chatMembersFilterBots': ChatMembersFilterBots,
+    }
+
+
+ChatMembersFilter = ChatMembersFilterBuilder()
+
+
+class SupergroupMembersFilterBuilder(TDObjectBuilder):
+    """Specifies the kind of chat members to return in getSupergroupMembers"""
+
+    mapping = {
+        'supergroupMembersFilterRecent': SupergroupMembersFilterRecent,
+        'supergroupMembersFilterContacts': SupergroupMembersFilterContacts,
+        'supergroupMembersFilterAdministrators': SupergroupMembersFilterAdministrators,
+        'supergroupMembersFilterSearch': SupergroupMembersFilterSearch,
+        'supergroupMembersFilterRestricted': SupergroupMembersFilterRestricted,
+        'supergroupMembersFilterBanned': SupergroupMembersFilterBanned,
+        'supergroupMembersFilterMention': SupergroupMembersFilterMention,
+        'supergroupMembersFilterBots': SupergroupMembersFilterBots,
+    }
+
+
+SupergroupMembersFilter = SupergroupMembersFilterBuilder()
+
+
+class InviteLinkChatTypeBuilder(TDObjectBuilder):
+    """Describes the type of a chat to which points an invite link"""
+
+    mapping = {
+        'inviteLinkChatTypeBasicGroup': InviteLinkChatTypeBasicGroup,
+        'inviteLinkChatTypeSupergroup': InviteLinkChatTypeSupergroup,
+        'inviteLinkChatTypeChannel': InviteLinkChatTypeChannel,
+    }
+
+
+InviteLinkChatType = InviteLinkChatTypeBuilder()
+
+
+class SecretChatStateBuilder(TDObjectBuilder):
+    """Describes the current secret chat state"""
+
+    mapping = {
+        'secretChatStatePending': SecretChatStatePending,
+        'secretChatStateReady': SecretChatStateReady,
+        'secretChatStateClosed': SecretChatStateClosed,
+    }
+
+
+SecretChatState = SecretChatStateBuilder()
+
+
+class MessageSenderBuilder(TDObjectBuilder):
+    """Contains information about the sender of a message"""
+
+    mapping = {
+        'messageSenderUser': MessageSenderUser,
+        'messageSenderChat': MessageSenderChat,
+    }
+
+
+MessageSender = MessageSenderBuilder()
+
+
+class MessageReadDateBuilder(TDObjectBuilder):
+    """Describes read date of a recent outgoing message in a private chat"""
+
+    mapping = {
+        'messageReadDateRead': MessageReadDateRead,
+        'messageReadDateUnread': MessageReadDateUnread,
+        'messageReadDateTooOld': MessageReadDateTooOld,
+        'messageReadDateUserPrivacyRestricted': MessageReadDateUserPrivacyRestricted,
+        'messageReadDateMyPrivacyRestricted': MessageReadDateMyPrivacyRestricted,
+    }
+
+
+MessageReadDate = MessageReadDateBuilder()
+
+
+class MessageOriginBuilder(TDObjectBuilder):
+    """Contains information about the origin of a message"""
+
+    mapping = {
+        'messageOriginUser': MessageOriginUser,
+        'messageOriginHiddenUser': MessageOriginHiddenUser,
+        'messageOriginChat': MessageOriginChat,
+        'messageOriginChannel': MessageOriginChannel,
+    }
+
+
+MessageOrigin = MessageOriginBuilder()
+
+
+class ReactionTypeBuilder(TDObjectBuilder):
+    """Describes type of message reaction"""
+
+    mapping = {
+        'reactionTypeEmoji': ReactionTypeEmoji,
+        'reactionTypeCustomEmoji': ReactionTypeCustomEmoji,
+    }
+
+
+ReactionType = ReactionTypeBuilder()
+
+
+class MessageSendingStateBuilder(TDObjectBuilder):
+    """Contains information about the sending state of the message"""
+
+    mapping = {
+        'messageSendingStatePending': MessageSendingStatePending,
+        'messageSendingStateFailed': MessageSendingStateFailed,
+    }
+
+
+MessageSendingState = MessageSendingStateBuilder()
+
+
+class MessageReplyToBuilder(TDObjectBuilder):
+    """Contains information about the message or the story a message is replying to"""
+
+    mapping = {
+        'messageReplyToMessage': MessageReplyToMessage,
+        'messageReplyToStory': MessageReplyToStory,
+    }
+
+
+MessageReplyTo = MessageReplyToBuilder()
+
+
+class InputMessageReplyToBuilder(TDObjectBuilder):
+    """Contains information about the message or the story to be replied"""
+
+    mapping = {
+        'inputMessageReplyToMessage': InputMessageReplyToMessage,
+        'inputMessageReplyToStory': InputMessageReplyToStory,
+    }
+
+
+InputMessageReplyTo = InputMessageReplyToBuilder()
+
+
+class MessageSourceBuilder(TDObjectBuilder):
+    """Describes source of a message"""
+
+    mapping = {
+        'messageSourceChatHistory': MessageSourceChatHistory,
+        'messageSourceMessageThreadHistory': MessageSourceMessageThreadHistory,
+        'messageSourceForumTopicHistory': MessageSourceForumTopicHistory,
+        'messageSourceHistoryPreview': MessageSourceHistoryPreview,
+        'messageSourceChatList': MessageSourceChatList,
+        'messageSourceSearch': MessageSourceSearch,
+        'messageSourceChatEventLog': MessageSourceChatEventLog,
+        'messageSourceNotification': MessageSourceNotification,
+        'messageSourceScreenshot': MessageSourceScreenshot,
+        'messageSourceOther': MessageSourceOther,
+    }
+
+
+MessageSource = MessageSourceBuilder()
+
+
+class MessageSponsorTypeBuilder(TDObjectBuilder):
+    """Describes type of a message sponsor"""
+
+    mapping = {
+        'messageSponsorTypeBot': MessageSponsorTypeBot,
+        'messageSponsorTypeWebApp': MessageSponsorTypeWebApp,
+        'messageSponsorTypePublicChannel': MessageSponsorTypePublicChannel,
+        'messageSponsorTypePrivateChannel': MessageSponsorTypePrivateChannel,
+        'messageSponsorTypeWebsite': MessageSponsorTypeWebsite,
+    }
+
+
+MessageSponsorType = MessageSponsorTypeBuilder()
+
+
+class NotificationSettingsScopeBuilder(TDObjectBuilder):
+    """Describes the types of chats to which notification settings are relevant"""
+
+    mapping = {
+        'notificationSettingsScopePrivateChats': NotificationSettingsScopePrivateChats,
+        'notificationSettingsScopeGroupChats': NotificationSettingsScopeGroupChats,
+        'notificationSettingsScopeChannelChats': NotificationSettingsScopeChannelChats,
+    }
+
+
+NotificationSettingsScope = NotificationSettingsScopeBuilder()
+
+
+class ChatTypeBuilder(TDObjectBuilder):
+    """Describes the type of a chat"""
+
+    mapping = {
+        'chatTypePrivate': ChatTypePrivate,
+        'chatTypeBasicGroup': ChatTypeBasicGroup,
+        'chatTypeSupergroup': ChatTypeSupergroup,
+        'chatTypeSecret': ChatTypeSecret,
+    }
+
+
+ChatType = ChatTypeBuilder()
+
+
+class ChatListBuilder(TDObjectBuilder):
+    """Describes a list of chats"""
+
+    mapping = {
+        'chatListMain': ChatListMain,
+        'chatListArchive': ChatListArchive,
+        'chatListFolder': ChatListFolder,
+    }
+
+
+ChatList = ChatListBuilder()
+
+
+class ChatSourceBuilder(TDObjectBuilder):
+    """Describes a reason why an external chat is shown in a chat list"""
+
+    mapping = {
+        'chatSourceMtprotoProxy': ChatSourceMtprotoProxy,
+        'chatSourcePublicServiceAnnouncement': ChatSourcePublicServiceAnnouncement,
+    }
+
+
+ChatSource = ChatSourceBuilder()
+
+
+class ChatAvailableReactionsBuilder(TDObjectBuilder):
+    """Describes reactions available in the chat"""
+
+    mapping = {
+        'chatAvailableReactionsAll': ChatAvailableReactionsAll,
+        'chatAvailableReactionsSome': ChatAvailableReactionsSome,
+    }
+
+
+ChatAvailableReactions = ChatAvailableReactionsBuilder()
+
+
+class PublicChatTypeBuilder(TDObjectBuilder):
+    """Describes a type of public chats"""
+
+    mapping = {
+        'publicChatTypeHasUsername': PublicChatTypeHasUsername,
+        'publicChatTypeIsLocationBased': PublicChatTypeIsLocationBased,
+    }
+
+
+PublicChatType = PublicChatTypeBuilder()
+
+
+class ChatActionBarBuilder(TDObjectBuilder):
+    """Describes actions which must be possible to do through a chat action bar"""
+
+    mapping = {
+        'chatActionBarReportSpam': ChatActionBarReportSpam,
+        'chatActionBarReportUnrelatedLocation': ChatActionBarReportUnrelatedLocation,
+        'chatActionBarInviteMembers': ChatActionBarInviteMembers,
+        'chatActionBarReportAddBlock': ChatActionBarReportAddBlock,
+        'chatActionBarAddContact': ChatActionBarAddContact,
+        'chatActionBarSharePhoneNumber': ChatActionBarSharePhoneNumber,
+        'chatActionBarJoinRequest': ChatActionBarJoinRequest,
+    }
+
+
+ChatActionBar = ChatActionBarBuilder()
+
+
+class KeyboardButtonTypeBuilder(TDObjectBuilder):
+    """Describes a keyboard button type"""
+
+    mapping = {
+        'keyboardButtonTypeText': KeyboardButtonTypeText,
+        'keyboardButtonTypeRequestPhoneNumber': KeyboardButtonTypeRequestPhoneNumber,
+        'keyboardButtonTypeRequestLocation': KeyboardButtonTypeRequestLocation,
+        'keyboardButtonTypeRequestPoll': KeyboardButtonTypeRequestPoll,
+        'keyboardButtonTypeRequestUsers': KeyboardButtonTypeRequestUsers,
+        'keyboardButtonTypeRequestChat': KeyboardButtonTypeRequestChat,
+        'keyboardButtonTypeWebApp': KeyboardButtonTypeWebApp,
+    }
+
+
+KeyboardButtonType = KeyboardButtonTypeBuilder()
+
+
+class InlineKeyboardButtonTypeBuilder(TDObjectBuilder):
+    """Describes the type of an inline keyboard button"""
+
+    mapping = {
+        'inlineKeyboardButtonTypeUrl': InlineKeyboardButtonTypeUrl,
+        'inlineKeyboardButtonTypeLoginUrl': InlineKeyboardButtonTypeLoginUrl,
+        'inlineKeyboardButtonTypeWebApp': InlineKeyboardButtonTypeWebApp,
+        'inlineKeyboardButtonTypeCallback': InlineKeyboardButtonTypeCallback,
+        'inlineKeyboardButtonTypeCallbackWithPassword': InlineKeyboardButtonTypeCallbackWithPassword,
+        'inlineKeyboardButtonTypeCallbackGame': InlineKeyboardButtonTypeCallbackGame,
+        'inlineKeyboardButtonTypeSwitchInline': InlineKeyboardButtonTypeSwitchInline,
+        'inlineKeyboardButtonTypeBuy': InlineKeyboardButtonTypeBuy,
+        'inlineKeyboardButtonTypeUser': InlineKeyboardButtonTypeUser,
+    }
+
+
+InlineKeyboardButtonType = InlineKeyboardButtonTypeBuilder()
+
+
+class ReplyMarkupBuilder(TDObjectBuilder):
+    """
+    Contains a description of a custom keyboard and actions that can be done with
+    it to quickly reply to bots
+    """
+
+    mapping = {
+        'replyMarkupRemoveKeyboard': ReplyMarkupRemoveKeyboard,
+        'replyMarkupForceReply': ReplyMarkupForceReply,
+        'replyMarkupShowKeyboard': ReplyMarkupShowKeyboard,
+        'replyMarkupInlineKeyboard': ReplyMarkupInlineKeyboard,
+    }
+
+
+ReplyMarkup = ReplyMarkupBuilder()
+
+
+class LoginUrlInfoBuilder(TDObjectBuilder):
+    """
+    Contains information about an inline button of type
+    inlineKeyboardButtonTypeLoginUrl
+    """
+
+    mapping = {
+        'loginUrlInfoOpen': LoginUrlInfoOpen,
+        'loginUrlInfoRequestConfirmation': LoginUrlInfoRequestConfirmation,
+    }
+
+
+LoginUrlInfo = LoginUrlInfoBuilder()
+
+
+class SavedMessagesTopicTypeBuilder(TDObjectBuilder):
+    """Describes type of a Saved Messages topic"""
+
+    mapping = {
+        'savedMessagesTopicTypeMyNotes': SavedMessagesTopicTypeMyNotes,
+        'savedMessagesTopicTypeAuthorHidden': SavedMessagesTopicTypeAuthorHidden,
+        'savedMessagesTopicTypeSavedFromChat': SavedMessagesTopicTypeSavedFromChat,
+    }
+
+
+SavedMessagesTopicType = SavedMessagesTopicTypeBuilder()
+
+
+class RichTextBuilder(TDObjectBuilder):
+    """Describes a text object inside an instant-view web page"""
+
+    mapping = {
+        'richTextPlain': RichTextPlain,
+        'richTextBold': RichTextBold,
+        'richTextItalic': RichTextItalic,
+        'richTextUnderline': RichTextUnderline,
+        'richTextStrikethrough': RichTextStrikethrough,
+        'richTextFixed': RichTextFixed,
+        'richTextUrl': RichTextUrl,
+        'richTextEmailAddress': RichTextEmailAddress,
+        'richTextSubscript': RichTextSubscript,
+        'richTextSuperscript': RichTextSuperscript,
+        'richTextMarked': RichTextMarked,
+        'richTextPhoneNumber': RichTextPhoneNumber,
+        'richTextIcon': RichTextIcon,
+        'richTextReference': RichTextReference,
+        'richTextAnchor': RichTextAnchor,
+        'richTextAnchorLink': RichTextAnchorLink,
+        'richTexts': RichTexts,
+    }
+
+
+RichText = RichTextBuilder()
+
+
+class PageBlockHorizontalAlignmentBuilder(TDObjectBuilder):
+    """Describes a horizontal alignment of a table cell content"""
+
+    mapping = {
+        'pageBlockHorizontalAlignmentLeft': PageBlockHorizontalAlignmentLeft,
+        'pageBlockHorizontalAlignmentCenter': PageBlockHorizontalAlignmentCenter,
+        'pageBlockHorizontalAlignmentRight': PageBlockHorizontalAlignmentRight,
+    }
+
+
+PageBlockHorizontalAlignment = PageBlockHorizontalAlignmentBuilder()
+
+
+class PageBlockVerticalAlignmentBuilder(TDObjectBuilder):
+    """Describes a Vertical alignment of a table cell content"""
+
+    mapping = {
+        'pageBlockVerticalAlignmentTop': PageBlockVerticalAlignmentTop,
+        'pageBlockVerticalAlignmentMiddle': PageBlockVerticalAlignmentMiddle,
+        'pageBlockVerticalAlignmentBottom': PageBlockVerticalAlignmentBottom,
+    }
+
+
+PageBlockVerticalAlignment = PageBlockVerticalAlignmentBuilder()
+
+
+class PageBlockBuilder(TDObjectBuilder):
+    """Describes a block of an instant view web page"""
+
+    mapping = {
+        'pageBlockTitle': PageBlockTitle,
+        'pageBlockSubtitle': PageBlockSubtitle,
+        'pageBlockAuthorDate': PageBlockAuthorDate,
+        'pageBlockHeader': PageBlockHeader,
+        'pageBlockSubheader': PageBlockSubheader,
+        'pageBlockKicker': PageBlockKicker,
+        'pageBlockParagraph': PageBlockParagraph,
+        'pageBlockPreformatted': PageBlockPreformatted,
+        'pageBlockFooter': PageBlockFooter,
+        'pageBlockDivider': PageBlockDivider,
+        'pageBlockAnchor': PageBlockAnchor,
+        'pageBlockList': PageBlockList,
+        'pageBlockBlockQuote': PageBlockBlockQuote,
+        'pageBlockPullQuote': PageBlockPullQuote,
+        'pageBlockAnimation': PageBlockAnimation,
+        'pageBlockAudio': PageBlockAudio,
+        'pageBlockPhoto': PageBlockPhoto,
+        'pageBlockVideo': PageBlockVideo,
+        'pageBlockVoiceNote': PageBlockVoiceNote,
+        'pageBlockCover': PageBlockCover,
+        'pageBlockEmbedded': PageBlockEmbedded,
+        'pageBlockEmbeddedPost': PageBlockEmbeddedPost,
+        'pageBlockCollage': PageBlockCollage,
+        'pageBlockSlideshow': PageBlockSlideshow,
+        'pageBlockChatLink': PageBlockChatLink,
+        'pageBlockTable': PageBlockTable,
+        'pageBlockDetails': PageBlockDetails,
+        'pageBlockRelatedArticles': PageBlockRelatedArticles,
+        'pageBlockMap': PageBlockMap,
+    }
+
+
+PageBlock = PageBlockBuilder()
+
+
+class InputCredentialsBuilder(TDObjectBuilder):
+    """Contains information about the payment method chosen by the user"""
+
+    mapping = {
+        'inputCredentialsSaved': InputCredentialsSaved,
+        'inputCredentialsNew': InputCredentialsNew,
+        'inputCredentialsApplePay': InputCredentialsApplePay,
+        'inputCredentialsGooglePay': InputCredentialsGooglePay,
+    }
+
+
+InputCredentials = InputCredentialsBuilder()
+
+
+class PaymentProviderBuilder(TDObjectBuilder):
+    """Contains information about a payment provider"""
+
+    mapping = {
+        'paymentProviderSmartGlocal': PaymentProviderSmartGlocal,
+        'paymentProviderStripe': PaymentProviderStripe,
+        'paymentProviderOther': PaymentProviderOther,
+    }
+
+
+PaymentProvider = PaymentProviderBuilder()
+
+
+class InputInvoiceBuilder(TDObjectBuilder):
+    """Describes an invoice to process"""
+
+    mapping = {
+        'inputInvoiceMessage': InputInvoiceMessage,
+        'inputInvoiceName': InputInvoiceName,
+        'inputInvoiceTelegram': InputInvoiceTelegram,
+    }
+
+
+InputInvoice = InputInvoiceBuilder()
+
+
+class MessageExtendedMediaBuilder(TDObjectBuilder):
+    """Describes a media, which is attached to an invoice"""
+
+    mapping = {
+        'messageExtendedMediaPreview': MessageExtendedMediaPreview,
+        'messageExtendedMediaPhoto': MessageExtendedMediaPhoto,
+        'messageExtendedMediaVideo': MessageExtendedMediaVideo,
+        'messageExtendedMediaUnsupported': MessageExtendedMediaUnsupported,
+    }
+
+
+MessageExtendedMedia = MessageExtendedMediaBuilder()
+
+
+class PassportElementTypeBuilder(TDObjectBuilder):
+    """Contains the type of a Telegram Passport element"""
+
+    mapping = {
+        'passportElementTypePersonalDetails': PassportElementTypePersonalDetails,
+        'passportElementTypePassport': PassportElementTypePassport,
+        'passportElementTypeDriverLicense': PassportElementTypeDriverLicense,
+        'passportElementTypeIdentityCard': PassportElementTypeIdentityCard,
+        'passportElementTypeInternalPassport': PassportElementTypeInternalPassport,
+        'passportElementTypeAddress': PassportElementTypeAddress,
+        'passportElementTypeUtilityBill': PassportElementTypeUtilityBill,
+        'passportElementTypeBankStatement': PassportElementTypeBankStatement,
+        'passportElementTypeRentalAgreement': PassportElementTypeRentalAgreement,
+        'passportElementTypePassportRegistration': PassportElementTypePassportRegistration,
+        'passportElementTypeTemporaryRegistration': PassportElementTypeTemporaryRegistration,
+        'passportElementTypePhoneNumber': PassportElementTypePhoneNumber,
+        'passportElementTypeEmailAddress': PassportElementTypeEmailAddress,
+    }
+
+
+PassportElementType = PassportElementTypeBuilder()
+
+
+class PassportElementBuilder(TDObjectBuilder):
+    """Contains information about a Telegram Passport element"""
+
+    mapping = {
+        'passportElementPersonalDetails': PassportElementPersonalDetails,
+        'passportElementPassport': PassportElementPassport,
+        'passportElementDriverLicense': PassportElementDriverLicense,
+        'passportElementIdentityCard': PassportElementIdentityCard,
+        'passportElementInternalPassport': PassportElementInternalPassport,
+        'passportElementAddress': PassportElementAddress,
+        'passportElementUtilityBill': PassportElementUtilityBill,
+        'passportElementBankStatement': PassportElementBankStatement,
+        'passportElementRentalAgreement': PassportElementRentalAgreement,
+        'passportElementPassportRegistration': PassportElementPassportRegistration,
+        'passportElementTemporaryRegistration': PassportElementTemporaryRegistration,
+        'passportElementPhoneNumber': PassportElementPhoneNumber,
+        'passportElementEmailAddress': PassportElementEmailAddress,
+    }
+
+
+PassportElement = PassportElementBuilder()
+
+
+class InputPassportElementBuilder(TDObjectBuilder):
+    """Contains information about a Telegram Passport element to be saved"""
+
+    mapping = {
+        'inputPassportElementPersonalDetails': InputPassportElementPersonalDetails,
+        'inputPassportElementPassport': InputPassportElementPassport,
+        'inputPassportElementDriverLicense': InputPassportElementDriverLicense,
+        'inputPassportElementIdentityCard': InputPassportElementIdentityCard,
+        'inputPassportElementInternalPassport': InputPassportElementInternalPassport,
+        'inputPassportElementAddress': InputPassportElementAddress,
+        'inputPassportElementUtilityBill': InputPassportElementUtilityBill,
+        'inputPassportElementBankStatement': InputPassportElementBankStatement,
+        'inputPassportElementRentalAgreement': InputPassportElementRentalAgreement,
+        'inputPassportElementPassportRegistration': InputPassportElementPassportRegistration,
+        'inputPassportElementTemporaryRegistration': InputPassportElementTemporaryRegistration,
+        'inputPassportElementPhoneNumber': InputPassportElementPhoneNumber,
+        'inputPassportElementEmailAddress': InputPassportElementEmailAddress,
+    }
+
+
+InputPassportElement = InputPassportElementBuilder()
+
+
+class PassportElementErrorSourceBuilder(TDObjectBuilder):
+    """Contains the description of an error in a Telegram Passport element"""
+
+    mapping = {
+        'passportElementErrorSourceUnspecified': PassportElementErrorSourceUnspecified,
+        'passportElementErrorSourceDataField': PassportElementErrorSourceDataField,
+        'passportElementErrorSourceFrontSide': PassportElementErrorSourceFrontSide,
+        'passportElementErrorSourceReverseSide': PassportElementErrorSourceReverseSide,
+        'passportElementErrorSourceSelfie': PassportElementErrorSourceSelfie,
+        'passportElementErrorSourceTranslationFile': PassportElementErrorSourceTranslationFile,
+        'passportElementErrorSourceTranslationFiles': PassportElementErrorSourceTranslationFiles,
+        'passportElementErrorSourceFile': PassportElementErrorSourceFile,
+        'passportElementErrorSourceFiles': PassportElementErrorSourceFiles,
+    }
+
+
+PassportElementErrorSource = PassportElementErrorSourceBuilder()
+
+
+class InputPassportElementErrorSourceBuilder(TDObjectBuilder):
+    """
+    Contains the description of an error in a Telegram Passport element; for bots
+    only
+    """
+
+    mapping = {
+        'inputPassportElementErrorSourceUnspecified': InputPassportElementErrorSourceUnspecified,
+        'inputPassportElementErrorSourceDataField': InputPassportElementErrorSourceDataField,
+        'inputPassportElementErrorSourceFrontSide': InputPassportElementErrorSourceFrontSide,
+        'inputPassportElementErrorSourceReverseSide': InputPassportElementErrorSourceReverseSide,
+        'inputPassportElementErrorSourceSelfie': InputPassportElementErrorSourceSelfie,
+        'inputPassportElementErrorSourceTranslationFile': InputPassportElementErrorSourceTranslationFile,
+        'inputPassportElementErrorSourceTranslationFiles': InputPassportElementErrorSourceTranslationFiles,
+        'inputPassportElementErrorSourceFile': InputPassportElementErrorSourceFile,
+        'inputPassportElementErrorSourceFiles': InputPassportElementErrorSourceFiles,
+    }
+
+
+InputPassportElementErrorSource = InputPassportElementErrorSourceBuilder()
+
+
+class MessageContentBuilder(TDObjectBuilder):
+    """Contains the content of a message"""
+
+    mapping = {
+        'messageText': MessageText,
+        'messageAnimation': MessageAnimation,
+        'messageAudio': MessageAudio,
+        'messageDocument': MessageDocument,
+        'messagePhoto': MessagePhoto,
+        'messageSticker': MessageSticker,
+        'messageVideo': MessageVideo,
+        'messageVideoNote': MessageVideoNote,
+        'messageVoiceNote': MessageVoiceNote,
+        'messageExpiredPhoto': MessageExpiredPhoto,
+        'messageExpiredVideo': MessageExpiredVideo,
+        'messageExpiredVideoNote': MessageExpiredVideoNote,
+        'messageExpiredVoiceNote': MessageExpiredVoiceNote,
+        'messageLocation': MessageLocation,
+        'messageVenue': MessageVenue,
+        'messageContact': MessageContact,
+        'messageAnimatedEmoji': MessageAnimatedEmoji,
+        'messageDice': MessageDice,
+        'messageGame': MessageGame,
+        'messagePoll': MessagePoll,
+        'messageStory': MessageStory,
+        'messageInvoice': MessageInvoice,
+        'messageCall': MessageCall,
+        'messageVideoChatScheduled': MessageVideoChatScheduled,
+        'messageVideoChatStarted': MessageVideoChatStarted,
+        'messageVideoChatEnded': MessageVideoChatEnded,
+        'messageInviteVideoChatParticipants': MessageInviteVideoChatParticipants,
+        'messageBasicGroupChatCreate': MessageBasicGroupChatCreate,
+        'messageSupergroupChatCreate': MessageSupergroupChatCreate,
+        'messageChatChangeTitle': MessageChatChangeTitle,
+        'messageChatChangePhoto': MessageChatChangePhoto,
+        'messageChatDeletePhoto': MessageChatDeletePhoto,
+        'messageChatAddMembers': MessageChatAddMembers,
+        'messageChatJoinByLink': MessageChatJoinByLink,
+        'messageChatJoinByRequest': MessageChatJoinByRequest,
+        'messageChatDeleteMember': MessageChatDeleteMember,
+        'messageChatUpgradeTo': MessageChatUpgradeTo,
+        'messageChatUpgradeFrom': MessageChatUpgradeFrom,
+        'messagePinMessage': MessagePinMessage,
+        'messageScreenshotTaken': MessageScreenshotTaken,
+        'messageChatSetBackground': MessageChatSetBackground,
+        'messageChatSetTheme': MessageChatSetTheme,
+        'messageChatSetMessageAutoDeleteTime': MessageChatSetMessageAutoDeleteTime,
+        'messageChatBoost': MessageChatBoost,
+        'messageForumTopicCreated': MessageForumTopicCreated,
+        'messageForumTopicEdited': MessageForumTopicEdited,
+        'messageForumTopicIsClosedToggled': MessageForumTopicIsClosedToggled,
+        'messageForumTopicIsHiddenToggled': MessageForumTopicIsHiddenToggled,
+        'messageSuggestProfilePhoto': MessageSuggestProfilePhoto,
+        'messageCustomServiceAction': MessageCustomServiceAction,
+        'messageGameScore': MessageGameScore,
+        'messagePaymentSuccessful': MessagePaymentSuccessful,
+        'messagePaymentSuccessfulBot': MessagePaymentSuccessfulBot,
+        'messageGiftedPremium': MessageGiftedPremium,
+        'messagePremiumGiftCode': MessagePremiumGiftCode,
+        'messagePremiumGiveawayCreated': MessagePremiumGiveawayCreated,
+        'messagePremiumGiveaway': MessagePremiumGiveaway,
+        'messagePremiumGiveawayCompleted': MessagePremiumGiveawayCompleted,
+        'messagePremiumGiveawayWinners': MessagePremiumGiveawayWinners,
+        'messageContactRegistered': MessageContactRegistered,
+        'messageUsersShared': MessageUsersShared,
+        'messageChatShared': MessageChatShared,
+        'messageBotWriteAccessAllowed': MessageBotWriteAccessAllowed,
+        'messageWebAppDataSent': MessageWebAppDataSent,
+        'messageWebAppDataReceived': MessageWebAppDataReceived,
+        'messagePassportDataSent': MessagePassportDataSent,
+        'messagePassportDataReceived': MessagePassportDataReceived,
+        'messageProximityAlertTriggered': MessageProximityAlertTriggered,
+        'messageUnsupported': MessageUnsupported,
+    }
+
+
+MessageContent = MessageContentBuilder()
+
+
+class TextEntityTypeBuilder(TDObjectBuilder):
+    """Represents a part of the text which must be formatted differently"""
+
+    mapping = {
+        'textEntityTypeMention': TextEntityTypeMention,
+        'textEntityTypeHashtag': TextEntityTypeHashtag,
+        'textEntityTypeCashtag': TextEntityTypeCashtag,
+        'textEntityTypeBotCommand': TextEntityTypeBotCommand,
+        'textEntityTypeUrl': TextEntityTypeUrl,
+        'textEntityTypeEmailAddress': TextEntityTypeEmailAddress,
+        'textEntityTypePhoneNumber': TextEntityTypePhoneNumber,
+        'textEntityTypeBankCardNumber': TextEntityTypeBankCardNumber,
+        'textEntityTypeBold': TextEntityTypeBold,
+        'textEntityTypeItalic': TextEntityTypeItalic,
+        'textEntityTypeUnderline': TextEntityTypeUnderline,
+        'textEntityTypeStrikethrough': TextEntityTypeStrikethrough,
+        'textEntityTypeSpoiler': TextEntityTypeSpoiler,
+        'textEntityTypeCode': TextEntityTypeCode,
+        'textEntityTypePre': TextEntityTypePre,
+        'textEntityTypePreCode': TextEntityTypePreCode,
+        'textEntityTypeBlockQuote': TextEntityTypeBlockQuote,
+        'textEntityTypeTextUrl': TextEntityTypeTextUrl,
+        'textEntityTypeMentionName': TextEntityTypeMentionName,
+        'textEntityTypeCustomEmoji': TextEntityTypeCustomEmoji,
+        'textEntityTypeMediaTimestamp': TextEntityTypeMediaTimestamp,
+    }
+
+
+TextEntityType = TextEntityTypeBuilder()
+
+
+class MessageSchedulingStateBuilder(TDObjectBuilder):
+    """Contains information about the time when a scheduled message will be sent"""
+
+    mapping = {
+        'messageSchedulingStateSendAtDate': MessageSchedulingStateSendAtDate,
+        'messageSchedulingStateSendWhenOnline': MessageSchedulingStateSendWhenOnline,
+    }
+
+
+MessageSchedulingState = MessageSchedulingStateBuilder()
+
+
+class MessageSelfDestructTypeBuilder(TDObjectBuilder):
+    """Describes when a message will be self-destructed"""
+
+    mapping = {
+        'messageSelfDestructTypeTimer': MessageSelfDestructTypeTimer,
+        'messageSelfDestructTypeImmediately': MessageSelfDestructTypeImmediately,
+    }
+
+
+MessageSelfDestructType = MessageSelfDestructTypeBuilder()
+
+
+class InputMessageContentBuilder(TDObjectBuilder):
+    """The content of a message to send"""
+
+    mapping = {
+        'inputMessageText': InputMessageText,
+        'inputMessageAnimation': InputMessageAnimation,
+        'inputMessageAudio': InputMessageAudio,
+        'inputMessageDocument': InputMessageDocument,
+        'inputMessagePhoto': InputMessagePhoto,
+        'inputMessageSticker': InputMessageSticker,
+        'inputMessageVideo': InputMessageVideo,
+        'inputMessageVideoNote': InputMessageVideoNote,
+        'inputMessageVoiceNote': InputMessageVoiceNote,
+        'inputMessageLocation': InputMessageLocation,
+        'inputMessageVenue': InputMessageVenue,
+        'inputMessageContact': InputMessageContact,
+        'inputMessageDice': InputMessageDice,
+        'inputMessageGame': InputMessageGame,
+        'inputMessageInvoice': InputMessageInvoice,
+        'inputMessagePoll': InputMessagePoll,
+        'inputMessageStory': InputMessageStory,
+        'inputMessageForwarded': InputMessageForwarded,
+    }
+
+
+InputMessageContent = InputMessageContentBuilder()
+
+
+class SearchMessagesFilterBuilder(TDObjectBuilder):
+    """Represents a filter for message search results"""
+
+    mapping = {
+        'searchMessagesFilterEmpty': SearchMessagesFilterEmpty,
+        'searchMessagesFilterAnimation': SearchMessagesFilterAnimation,
+        'searchMessagesFilterAudio': SearchMessagesFilterAudio,
+        'searchMessagesFilterDocument': SearchMessagesFilterDocument,
+        'searchMessagesFilterPhoto': SearchMessagesFilterPhoto,
+        'searchMessagesFilterVideo': SearchMessagesFilterVideo,
+        'searchMessagesFilterVoiceNote': SearchMessagesFilterVoiceNote,
+        'searchMessagesFilterPhotoAndVideo': SearchMessagesFilterPhotoAndVideo,
+        'searchMessagesFilterUrl': SearchMessagesFilterUrl,
+        'searchMessagesFilterChatPhoto': SearchMessagesFilterChatPhoto,
+        'searchMessagesFilterVideoNote': SearchMessagesFilterVideoNote,
+        'searchMessagesFilterVoiceAndVideoNote': SearchMessagesFilterVoiceAndVideoNote,
+        'searchMessagesFilterMention': SearchMessagesFilterMention,
+        'searchMessagesFilterUnreadMention': SearchMessagesFilterUnreadMention,
+        'searchMessagesFilterUnreadReaction': SearchMessagesFilterUnreadReaction,
+        'searchMessagesFilterFailedToSend': SearchMessagesFilterFailedToSend,
+        'searchMessagesFilterPinned': SearchMessagesFilterPinned,
+    }
+
+
+SearchMessagesFilter = SearchMessagesFilterBuilder()
+
+
+class ChatActionBuilder(TDObjectBuilder):
+    """Describes the different types of activity in a chat"""
+
+    mapping = {
+        'chatActionTyping': ChatActionTyping,
+        'chatActionRecordingVideo': ChatActionRecordingVideo,
+        'chatActionUploadingVideo': ChatActionUploadingVideo,
+        'chatActionRecordingVoiceNote': ChatActionRecordingVoiceNote,
+        'chatActionUploadingVoiceNote': ChatActionUploadingVoiceNote,
+        'chatActionUploadingPhoto': ChatActionUploadingPhoto,
+        'chatActionUploadingDocument': ChatActionUploadingDocument,
+        'chatActionChoosingSticker': ChatActionChoosingSticker,
+        'chatActionChoosingLocation': ChatActionChoosingLocation,
+        'chatActionChoosingContact': ChatActionChoosingContact,
+        'chatActionStartPlayingGame': ChatActionStartPlayingGame,
+        'chatActionRecordingVideoNote': ChatActionRecordingVideoNote,
+        'chatActionUploadingVideoNote': ChatActionUploadingVideoNote,
+        'chatActionWatchingAnimations': ChatActionWatchingAnimations,
+        'chatActionCancel': ChatActionCancel,
+    }
+
+
+ChatAction = ChatActionBuilder()
+
+
+class UserStatusBuilder(TDObjectBuilder):
+    """Describes the last time the user was online"""
+
+    mapping = {
+        'userStatusEmpty': UserStatusEmpty,
+        'userStatusOnline': UserStatusOnline,
+        'userStatusOffline': UserStatusOffline,
+        'userStatusRecently': UserStatusRecently,
+        'userStatusLastWeek': UserStatusLastWeek,
+        'userStatusLastMonth': UserStatusLastMonth,
+    }
+
+
+UserStatus = UserStatusBuilder()
+
+
+class EmojiCategoryTypeBuilder(TDObjectBuilder):
+    """Describes type of an emoji category"""
+
+    mapping = {
+        'emojiCategoryTypeDefault': EmojiCategoryTypeDefault,
+        'emojiCategoryTypeEmojiStatus': EmojiCategoryTypeEmojiStatus,
+        'emojiCategoryTypeChatPhoto': EmojiCategoryTypeChatPhoto,
+    }
+
+
+EmojiCategoryType = EmojiCategoryTypeBuilder()
+
+
+class StoryAreaTypeBuilder(TDObjectBuilder):
+    """Describes type of a clickable rectangle area on a story media"""
+
+    mapping = {
+        'storyAreaTypeLocation': StoryAreaTypeLocation,
+        'storyAreaTypeVenue': StoryAreaTypeVenue,
+        'storyAreaTypeSuggestedReaction': StoryAreaTypeSuggestedReaction,
+        'storyAreaTypeMessage': StoryAreaTypeMessage,
+    }
+
+
+StoryAreaType = StoryAreaTypeBuilder()
+
+
+class InputStoryAreaTypeBuilder(TDObjectBuilder):
+    """Describes type of a clickable rectangle area on a story media to be added"""
+
+    mapping = {
+        'inputStoryAreaTypeLocation': InputStoryAreaTypeLocation,
+        'inputStoryAreaTypeFoundVenue': InputStoryAreaTypeFoundVenue,
+        'inputStoryAreaTypePreviousVenue': InputStoryAreaTypePreviousVenue,
+        'inputStoryAreaTypeSuggestedReaction': InputStoryAreaTypeSuggestedReaction,
+        'inputStoryAreaTypeMessage': InputStoryAreaTypeMessage,
+    }
+
+
+InputStoryAreaType = InputStoryAreaTypeBuilder()
+
+
+class StoryContentBuilder(TDObjectBuilder):
+    """Contains the content of a story"""
+
+    mapping = {
+        'storyContentPhoto': StoryContentPhoto,
+        'storyContentVideo': StoryContentVideo,
+        'storyContentUnsupported': StoryContentUnsupported,
+    }
+
+
+StoryContent = StoryContentBuilder()
+
+
+class InputStoryContentBuilder(TDObjectBuilder):
+    """The content of a story to send"""
+
+    mapping = {
+        'inputStoryContentPhoto': InputStoryContentPhoto,
+        'inputStoryContentVideo': InputStoryContentVideo,
+    }
+
+
+InputStoryContent = InputStoryContentBuilder()
+
+
+class StoryListBuilder(TDObjectBuilder):
+    """Describes a list of stories"""
+
+    mapping = {
+        'storyListMain': StoryListMain,
+        'storyListArchive': StoryListArchive,
+    }
+
+
+StoryList = StoryListBuilder()
+
+
+class StoryOriginBuilder(TDObjectBuilder):
+    """Contains information about the origin of a story that was reposted"""
+
+    mapping = {
+        'storyOriginPublicStory': StoryOriginPublicStory,
+        'storyOriginHiddenUser': StoryOriginHiddenUser,
+    }
+
+
+StoryOrigin = StoryOriginBuilder()
+
+
+class StoryInteractionTypeBuilder(TDObjectBuilder):
+    """Describes type of interaction with a story"""
+
+    mapping = {
+        'storyInteractionTypeView': StoryInteractionTypeView,
+        'storyInteractionTypeForward': StoryInteractionTypeForward,
+        'storyInteractionTypeRepost': StoryInteractionTypeRepost,
+    }
+
+
+StoryInteractionType = StoryInteractionTypeBuilder()
+
+
+class PublicForwardBuilder(TDObjectBuilder):
+    """Describes a public forward or repost of a story"""
+
+    mapping = {
+        'publicForwardMessage': PublicForwardMessage,
+        'publicForwardStory': PublicForwardStory,
+    }
+
+
+PublicForward = PublicForwardBuilder()
+
+
+class ChatBoostSourceBuilder(TDObjectBuilder):
+    """Describes source of a chat boost"""
+
+    mapping = {
+        'chatBoostSourceGiftCode': ChatBoostSourceGiftCode,
+        'chatBoostSourceGiveaway': ChatBoostSourceGiveaway,
+        'chatBoostSourcePremium': ChatBoostSourcePremium,
+    }
+
+
+ChatBoostSource = ChatBoostSourceBuilder()
+
+
+class CallDiscardReasonBuilder(TDObjectBuilder):
+    """Describes the reason why a call was discarded"""
+
+    mapping = {
+        'callDiscardReasonEmpty': CallDiscardReasonEmpty,
+        'callDiscardReasonMissed': CallDiscardReasonMissed,
+        'callDiscardReasonDeclined': CallDiscardReasonDeclined,
+        'callDiscardReasonDisconnected': CallDiscardReasonDisconnected,
+        'callDiscardReasonHungUp': CallDiscardReasonHungUp,
+    }
+
+
+CallDiscardReason = CallDiscardReasonBuilder()
+
+
+class CallServerTypeBuilder(TDObjectBuilder):
+    """Describes the type of a call server"""
+
+    mapping = {
+        'callServerTypeTelegramReflector': CallServerTypeTelegramReflector,
+        'callServerTypeWebrtc': CallServerTypeWebrtc,
+    }
+
+
+CallServerType = CallServerTypeBuilder()
+
+
+class CallStateBuilder(TDObjectBuilder):
+    """Describes the current call state"""
+
+    mapping = {
+        'callStatePending': CallStatePending,
+        'callStateExchangingKeys': CallStateExchangingKeys,
+        'callStateReady': CallStateReady,
+        'callStateHangingUp': CallStateHangingUp,
+        'callStateDiscarded': CallStateDiscarded,
+        'callStateError': CallStateError,
+    }
+
+
+CallState = CallStateBuilder()
+
+
+class GroupCallVideoQualityBuilder(TDObjectBuilder):
+    """Describes the quality of a group call video"""
+
+    mapping = {
+        'groupCallVideoQualityThumbnail': GroupCallVideoQualityThumbnail,
+        'groupCallVideoQualityMedium': GroupCallVideoQualityMedium,
+        'groupCallVideoQualityFull': GroupCallVideoQualityFull,
+    }
+
+
+GroupCallVideoQuality = GroupCallVideoQualityBuilder()
+
+
+class CallProblemBuilder(TDObjectBuilder):
+    """Describes the exact type of a problem with a call"""
+
+    mapping = {
+        'callProblemEcho': CallProblemEcho,
+        'callProblemNoise': CallProblemNoise,
+        'callProblemInterruptions': CallProblemInterruptions,
+        'callProblemDistortedSpeech': CallProblemDistortedSpeech,
+        'callProblemSilentLocal': CallProblemSilentLocal,
+        'callProblemSilentRemote': CallProblemSilentRemote,
+        'callProblemDropped': CallProblemDropped,
+        'callProblemDistortedVideo': CallProblemDistortedVideo,
+        'callProblemPixelatedVideo': CallProblemPixelatedVideo,
+    }
+
+
+CallProblem = CallProblemBuilder()
+
+
+class FirebaseAuthenticationSettingsBuilder(TDObjectBuilder):
+    """Contains settings for Firebase Authentication in the official applications"""
+
+    mapping = {
+        'firebaseAuthenticationSettingsAndroid': FirebaseAuthenticationSettingsAndroid,
+        'firebaseAuthenticationSettingsIos': FirebaseAuthenticationSettingsIos,
+    }
+
+
+FirebaseAuthenticationSettings = FirebaseAuthenticationSettingsBuilder()
+
+
+class ReactionUnavailabilityReasonBuilder(TDObjectBuilder):
+    """
+    Describes why the current user can't add reactions to the message, despite
+    some other users can
+    """
+
+    mapping = {
+        'reactionUnavailabilityReasonAnonymousAdministrator': ReactionUnavailabilityReasonAnonymousAdministrator,
+        'reactionUnavailabilityReasonGuest': ReactionUnavailabilityReasonGuest,
+    }
+
+
+ReactionUnavailabilityReason = ReactionUnavailabilityReasonBuilder()
+
+
+class DiceStickersBuilder(TDObjectBuilder):
+    """Contains animated stickers which must be used for dice animation rendering"""
+
+    mapping = {
+        'diceStickersRegular': DiceStickersRegular,
+        'diceStickersSlotMachine': DiceStickersSlotMachine,
+    }
+
+
+DiceStickers = DiceStickersBuilder()
+
+
+class SpeechRecognitionResultBuilder(TDObjectBuilder):
+    """Describes result of speech recognition in a voice note"""
+
+    mapping = {
+        'speechRecognitionResultPending': SpeechRecognitionResultPending,
+        'speechRecognitionResultText': SpeechRecognitionResultText,
+        'speechRecognitionResultError': SpeechRecognitionResultError,
+    }
+
+
+SpeechRecognitionResult = SpeechRecognitionResultBuilder()
+
+
+class BotWriteAccessAllowReasonBuilder(TDObjectBuilder):
+    """Describes a reason why a bot was allowed to write messages to the current user"""
+
+    mapping = {
+        'botWriteAccessAllowReasonConnectedWebsite': BotWriteAccessAllowReasonConnectedWebsite,
+        'botWriteAccessAllowReasonAddedToAttachmentMenu': BotWriteAccessAllowReasonAddedToAttachmentMenu,
+        'botWriteAccessAllowReasonLaunchedWebApp': BotWriteAccessAllowReasonLaunchedWebApp,
+        'botWriteAccessAllowReasonAcceptedRequest': BotWriteAccessAllowReasonAcceptedRequest,
+    }
+
+
+BotWriteAccessAllowReason = BotWriteAccessAllowReasonBuilder()
+
+
+class InputInlineQueryResultBuilder(TDObjectBuilder):
+    """Represents a single result of an inline query; for bots only"""
+
+    mapping = {
+        'inputInlineQueryResultAnimation': InputInlineQueryResultAnimation,
+        'inputInlineQueryResultArticle': InputInlineQueryResultArticle,
+        'inputInlineQueryResultAudio': InputInlineQueryResultAudio,
+        'inputInlineQueryResultContact': InputInlineQueryResultContact,
+        'inputInlineQueryResultDocument': InputInlineQueryResultDocument,
+        'inputInlineQueryResultGame': InputInlineQueryResultGame,
+        'inputInlineQueryResultLocation': InputInlineQueryResultLocation,
+        'inputInlineQueryResultPhoto': InputInlineQueryResultPhoto,
+        'inputInlineQueryResultSticker': InputInlineQueryResultSticker,
+        'inputInlineQueryResultVenue': InputInlineQueryResultVenue,
+        'inputInlineQueryResultVideo': InputInlineQueryResultVideo,
+        'inputInlineQueryResultVoiceNote': InputInlineQueryResultVoiceNote,
+    }
+
+
+InputInlineQueryResult = InputInlineQueryResultBuilder()
+
+
+class InlineQueryResultBuilder(TDObjectBuilder):
+    """Represents a single result of an inline query"""
+
+    mapping = {
+        'inlineQueryResultArticle': InlineQueryResultArticle,
+        'inlineQueryResultContact': InlineQueryResultContact,
+        'inlineQueryResultLocation': InlineQueryResultLocation,
+        'inlineQueryResultVenue': InlineQueryResultVenue,
+        'inlineQueryResultGame': InlineQueryResultGame,
+        'inlineQueryResultAnimation': InlineQueryResultAnimation,
+        'inlineQueryResultAudio': InlineQueryResultAudio,
+        'inlineQueryResultDocument': InlineQueryResultDocument,
+        'inlineQueryResultPhoto': InlineQueryResultPhoto,
+        'inlineQueryResultSticker': InlineQueryResultSticker,
+        'inlineQueryResultVideo': InlineQueryResultVideo,
+        'inlineQueryResultVoiceNote': InlineQueryResultVoiceNote,
+    }
+
+
+InlineQueryResult = InlineQueryResultBuilder()
+
+
+class InlineQueryResultsButtonTypeBuilder(TDObjectBuilder):
+    """Represents a type of a button in results of inline query"""
+
+    mapping = {
+        'inlineQueryResultsButtonTypeStartBot': InlineQueryResultsButtonTypeStartBot,
+        'inlineQueryResultsButtonTypeWebApp': InlineQueryResultsButtonTypeWebApp,
+    }
+
+
+InlineQueryResultsButtonType = InlineQueryResultsButtonTypeBuilder()
+
+
+class CallbackQueryPayloadBuilder(TDObjectBuilder):
+    """Represents a payload of a callback query"""
+
+    mapping = {
+        'callbackQueryPayloadData': CallbackQueryPayloadData,
+        'callbackQueryPayloadDataWithPassword': CallbackQueryPayloadDataWithPassword,
+        'callbackQueryPayloadGame': CallbackQueryPayloadGame,
+    }
+
+
+CallbackQueryPayload = CallbackQueryPayloadBuilder()
+
+
+class ChatEventActionBuilder(TDObjectBuilder):
+    """Represents a chat event"""
+
+    mapping = {
+        'chatEventMessageEdited': ChatEventMessageEdited,
+        'chatEventMessageDeleted': ChatEventMessageDeleted,
+        'chatEventMessagePinned': ChatEventMessagePinned,
+        'chatEventMessageUnpinned': ChatEventMessageUnpinned,
+        'chatEventPollStopped': ChatEventPollStopped,
+        'chatEventMemberJoined': ChatEventMemberJoined,
+        'chatEventMemberJoinedByInviteLink': ChatEventMemberJoinedByInviteLink,
+        'chatEventMemberJoinedByRequest': ChatEventMemberJoinedByRequest,
+        'chatEventMemberInvited': ChatEventMemberInvited,
+        'chatEventMemberLeft': ChatEventMemberLeft,
+        'chatEventMemberPromoted': ChatEventMemberPromoted,
+        'chatEventMemberRestricted': ChatEventMemberRestricted,
+        'chatEventAvailableReactionsChanged': ChatEventAvailableReactionsChanged,
+        'chatEventBackgroundChanged': ChatEventBackgroundChanged,
+        'chatEventDescriptionChanged': ChatEventDescriptionChanged,
+        'chatEventEmojiStatusChanged': ChatEventEmojiStatusChanged,
+        'chatEventLinkedChatChanged': ChatEventLinkedChatChanged,
+        'chatEventLocationChanged': ChatEventLocationChanged,
+        'chatEventMessageAutoDeleteTimeChanged': ChatEventMessageAutoDeleteTimeChanged,
+        'chatEventPermissionsChanged': ChatEventPermissionsChanged,
+        'chatEventPhotoChanged': ChatEventPhotoChanged,
+        'chatEventSlowModeDelayChanged': ChatEventSlowModeDelayChanged,
+        'chatEventStickerSetChanged': ChatEventStickerSetChanged,
+        'chatEventCustomEmojiStickerSetChanged': ChatEventCustomEmojiStickerSetChanged,
+        'chatEventTitleChanged': ChatEventTitleChanged,
+        'chatEventUsernameChanged': ChatEventUsernameChanged,
+        'chatEventActiveUsernamesChanged': ChatEventActiveUsernamesChanged,
+        'chatEventAccentColorChanged': ChatEventAccentColorChanged,
+        'chatEventProfileAccentColorChanged': ChatEventProfileAccentColorChanged,
+        'chatEventHasProtectedContentToggled': ChatEventHasProtectedContentToggled,
+        'chatEventInvitesToggled': ChatEventInvitesToggled,
+        'chatEventIsAllHistoryAvailableToggled': ChatEventIsAllHistoryAvailableToggled,
+        'chatEventHasAggressiveAntiSpamEnabledToggled': ChatEventHasAggressiveAntiSpamEnabledToggled,
+        'chatEventSignMessagesToggled': ChatEventSignMessagesToggled,
+        'chatEventInviteLinkEdited': ChatEventInviteLinkEdited,
+        'chatEventInviteLinkRevoked': ChatEventInviteLinkRevoked,
+        'chatEventInviteLinkDeleted': ChatEventInviteLinkDeleted,
+        'chatEventVideoChatCreated': ChatEventVideoChatCreated,
+        'chatEventVideoChatEnded': ChatEventVideoChatEnded,
+        'chatEventVideoChatMuteNewParticipantsToggled': ChatEventVideoChatMuteNewParticipantsToggled,
+        'chatEventVideoChatParticipantIsMutedToggled': ChatEventVideoChatParticipantIsMutedToggled,
+        'chatEventVideoChatParticipantVolumeLevelChanged': ChatEventVideoChatParticipantVolumeLevelChanged,
+        'chatEventIsForumToggled': ChatEventIsForumToggled,
+        'chatEventForumTopicCreated': ChatEventForumTopicCreated,
+        'chatEventForumTopicEdited': ChatEventForumTopicEdited,
+        'chatEventForumTopicToggleIsClosed': ChatEventForumTopicToggleIsClosed,
+        'chatEventForumTopicToggleIsHidden': ChatEventForumTopicToggleIsHidden,
+        'chatEventForumTopicDeleted': ChatEventForumTopicDeleted,
+        'chatEventForumTopicPinned': ChatEventForumTopicPinned,
+    }
+
+
+ChatEventAction = ChatEventActionBuilder()
+
+
+class LanguagePackStringValueBuilder(TDObjectBuilder):
+    """Represents the value of a string in a language pack"""
+
+    mapping = {
+        'languagePackStringValueOrdinary': LanguagePackStringValueOrdinary,
+        'languagePackStringValuePluralized': LanguagePackStringValuePluralized,
+        'languagePackStringValueDeleted': LanguagePackStringValueDeleted,
+    }
+
+
+LanguagePackStringValue = LanguagePackStringValueBuilder()
+
+
+class PremiumLimitTypeBuilder(TDObjectBuilder):
+    """Describes type of a limit, increased for Premium users"""
+
+    mapping = {
+        'premiumLimitTypeSupergroupCount': PremiumLimitTypeSupergroupCount,
+        'premiumLimitTypePinnedChatCount': PremiumLimitTypePinnedChatCount,
+        'premiumLimitTypeCreatedPublicChatCount': PremiumLimitTypeCreatedPublicChatCount,
+        'premiumLimitTypeSavedAnimationCount': PremiumLimitTypeSavedAnimationCount,
+        'premiumLimitTypeFavoriteStickerCount': PremiumLimitTypeFavoriteStickerCount,
+        'premiumLimitTypeChatFolderCount': PremiumLimitTypeChatFolderCount,
+        'premiumLimitTypeChatFolderChosenChatCount': PremiumLimitTypeChatFolderChosenChatCount,
+        'premiumLimitTypePinnedArchivedChatCount': PremiumLimitTypePinnedArchivedChatCount,
+        'premiumLimitTypePinnedSavedMessagesTopicCount': PremiumLimitTypePinnedSavedMessagesTopicCount,
+        'premiumLimitTypeCaptionLength': PremiumLimitTypeCaptionLength,
+        'premiumLimitTypeBioLength': PremiumLimitTypeBioLength,
+        'premiumLimitTypeChatFolderInviteLinkCount': PremiumLimitTypeChatFolderInviteLinkCount,
+        'premiumLimitTypeShareableChatFolderCount': PremiumLimitTypeShareableChatFolderCount,
+        'premiumLimitTypeActiveStoryCount': PremiumLimitTypeActiveStoryCount,
+        'premiumLimitTypeWeeklySentStoryCount': PremiumLimitTypeWeeklySentStoryCount,
+        'premiumLimitTypeMonthlySentStoryCount': PremiumLimitTypeMonthlySentStoryCount,
+        'premiumLimitTypeStoryCaptionLength': PremiumLimitTypeStoryCaptionLength,
+        'premiumLimitTypeStorySuggestedReactionAreaCount': PremiumLimitTypeStorySuggestedReactionAreaCount,
+        'premiumLimitTypeSimilarChatCount': PremiumLimitTypeSimilarChatCount,
+    }
+
+
+PremiumLimitType = PremiumLimitTypeBuilder()
+
+
+class PremiumFeatureBuilder(TDObjectBuilder):
+    """Describes a feature available to Premium users"""
+
+    mapping = {
+        'premiumFeatureIncreasedLimits': PremiumFeatureIncreasedLimits,
+        'premiumFeatureIncreasedUploadFileSize': PremiumFeatureIncreasedUploadFileSize,
+        'premiumFeatureImprovedDownloadSpeed': PremiumFeatureImprovedDownloadSpeed,
+        'premiumFeatureVoiceRecognition': PremiumFeatureVoiceRecognition,
+        'premiumFeatureDisabledAds': PremiumFeatureDisabledAds,
+        'premiumFeatureUniqueReactions': PremiumFeatureUniqueReactions,
+        'premiumFeatureUniqueStickers': PremiumFeatureUniqueStickers,
+        'premiumFeatureCustomEmoji': PremiumFeatureCustomEmoji,
+        'premiumFeatureAdvancedChatManagement': PremiumFeatureAdvancedChatManagement,
+        'premiumFeatureProfileBadge': PremiumFeatureProfileBadge,
+        'premiumFeatureEmojiStatus': PremiumFeatureEmojiStatus,
+        'premiumFeatureAnimatedProfilePhoto': PremiumFeatureAnimatedProfilePhoto,
+        'premiumFeatureForumTopicIcon': PremiumFeatureForumTopicIcon,
+        'premiumFeatureAppIcons': PremiumFeatureAppIcons,
+        'premiumFeatureRealTimeChatTranslation': PremiumFeatureRealTimeChatTranslation,
+        'premiumFeatureUpgradedStories': PremiumFeatureUpgradedStories,
+        'premiumFeatureChatBoost': PremiumFeatureChatBoost,
+        'premiumFeatureAccentColor': PremiumFeatureAccentColor,
+        'premiumFeatureBackgroundForBoth': PremiumFeatureBackgroundForBoth,
+        'premiumFeatureSavedMessagesTags': PremiumFeatureSavedMessagesTags,
+        'premiumFeatureMessagePrivacy': PremiumFeatureMessagePrivacy,
+        'premiumFeatureLastSeenTimes': PremiumFeatureLastSeenTimes,
+    }
+
+
+PremiumFeature = PremiumFeatureBuilder()
+
+
+class PremiumStoryFeatureBuilder(TDObjectBuilder):
+    """Describes a story feature available to Premium users"""
+
+    mapping = {
+        'premiumStoryFeaturePriorityOrder': PremiumStoryFeaturePriorityOrder,
+        'premiumStoryFeatureStealthMode': PremiumStoryFeatureStealthMode,
+        'premiumStoryFeaturePermanentViewsHistory': PremiumStoryFeaturePermanentViewsHistory,
+        'premiumStoryFeatureCustomExpirationDuration': PremiumStoryFeatureCustomExpirationDuration,
+        'premiumStoryFeatureSaveStories': PremiumStoryFeatureSaveStories,
+        'premiumStoryFeatureLinksAndFormatting': PremiumStoryFeatureLinksAndFormatting,
+        'premiumStoryFeatureVideoQuality': PremiumStoryFeatureVideoQuality,
+    }
+
+
+PremiumStoryFeature = PremiumStoryFeatureBuilder()
+
+
+class PremiumSourceBuilder(TDObjectBuilder):
+    """Describes a source from which the Premium features screen is opened"""
+
+    mapping = {
+        'premiumSourceLimitExceeded': PremiumSourceLimitExceeded,
+        'premiumSourceFeature': PremiumSourceFeature,
+        'premiumSourceStoryFeature': PremiumSourceStoryFeature,
+        'premiumSourceLink': PremiumSourceLink,
+        'premiumSourceSettings': PremiumSourceSettings,
+    }
+
+
+PremiumSource = PremiumSourceBuilder()
+
+
+class StorePaymentPurposeBuilder(TDObjectBuilder):
+    """Describes a purpose of an in-store payment"""
+
+    mapping = {
+        'storePaymentPurposePremiumSubscription': StorePaymentPurposePremiumSubscription,
+        'storePaymentPurposeGiftedPremium': StorePaymentPurposeGiftedPremium,
+        'storePaymentPurposePremiumGiftCodes': StorePaymentPurposePremiumGiftCodes,
+        'storePaymentPurposePremiumGiveaway': StorePaymentPurposePremiumGiveaway,
+    }
+
+
+StorePaymentPurpose = StorePaymentPurposeBuilder()
+
+
+class TelegramPaymentPurposeBuilder(TDObjectBuilder):
+    """Describes a purpose of a payment toward Telegram"""
+
+    mapping = {
+        'telegramPaymentPurposePremiumGiftCodes': TelegramPaymentPurposePremiumGiftCodes,
+        'telegramPaymentPurposePremiumGiveaway': TelegramPaymentPurposePremiumGiveaway,
+    }
+
+
+TelegramPaymentPurpose = TelegramPaymentPurposeBuilder()
+
+
+class DeviceTokenBuilder(TDObjectBuilder):
+    """
+    Represents a data needed to subscribe for push notifications through
+    registerDevice method. To use specific push notification service, the correct
+    application platform must be specified and a valid server authentication data
+    must be uploaded at https://my.telegram.org
+    """
+
+    mapping = {
+        'deviceTokenFirebaseCloudMessaging': DeviceTokenFirebaseCloudMessaging,
+        'deviceTokenApplePush': DeviceTokenApplePush,
+        'deviceTokenApplePushVoIP': DeviceTokenApplePushVoIP,
+        'deviceTokenWindowsPush': DeviceTokenWindowsPush,
+        'deviceTokenMicrosoftPush': DeviceTokenMicrosoftPush,
+        'deviceTokenMicrosoftPushVoIP': DeviceTokenMicrosoftPushVoIP,
+        'deviceTokenWebPush': DeviceTokenWebPush,
+        'deviceTokenSimplePush': DeviceTokenSimplePush,
+        'deviceTokenUbuntuPush': DeviceTokenUbuntuPush,
+        'deviceTokenBlackBerryPush': DeviceTokenBlackBerryPush,
+        'deviceTokenTizenPush': DeviceTokenTizenPush,
+        'deviceTokenHuaweiPush': DeviceTokenHuaweiPush,
+    }
+
+
+DeviceToken = DeviceTokenBuilder()
+
+
+class BackgroundFillBuilder(TDObjectBuilder):
+    """Describes a fill of a background"""
+
+    mapping = {
+        'backgroundFillSolid': BackgroundFillSolid,
+        'backgroundFillGradient': BackgroundFillGradient,
+        'backgroundFillFreeformGradient': BackgroundFillFreeformGradient,
+    }
+
+
+BackgroundFill = BackgroundFillBuilder()
+
+
+class BackgroundTypeBuilder(TDObjectBuilder):
+    """Describes the type of a background"""
+
+    mapping = {
+        'backgroundTypeWallpaper': BackgroundTypeWallpaper,
+        'backgroundTypePattern': BackgroundTypePattern,
+        'backgroundTypeFill': BackgroundTypeFill,
+        'backgroundTypeChatTheme': BackgroundTypeChatTheme,
+    }
+
+
+BackgroundType = BackgroundTypeBuilder()
+
+
+class InputBackgroundBuilder(TDObjectBuilder):
+    """Contains information about background to set"""
+
+    mapping = {
+        'inputBackgroundLocal': InputBackgroundLocal,
+        'inputBackgroundRemote': InputBackgroundRemote,
+        'inputBackgroundPrevious': InputBackgroundPrevious,
+    }
+
+
+InputBackground = InputBackgroundBuilder()
+
+
+class CanSendStoryResultBuilder(TDObjectBuilder):
+    """
+    Represents result of checking whether the current user can send a story in the
+    specific chat
+    """
+
+    mapping = {
+        'canSendStoryResultOk': CanSendStoryResultOk,
+        'canSendStoryResultPremiumNeeded': CanSendStoryResultPremiumNeeded,
+        'canSendStoryResultBoostNeeded': CanSendStoryResultBoostNeeded,
+        'canSendStoryResultActiveStoryLimitExceeded': CanSendStoryResultActiveStoryLimitExceeded,
+        'canSendStoryResultWeeklyLimitExceeded': CanSendStoryResultWeeklyLimitExceeded,
+        'canSendStoryResultMonthlyLimitExceeded': CanSendStoryResultMonthlyLimitExceeded,
+    }
+
+
+CanSendStoryResult = CanSendStoryResultBuilder()
+
+
+class CanTransferOwnershipResultBuilder(TDObjectBuilder):
+    """
+    Represents result of checking whether the current session can be used to
+    transfer a chat ownership to another user
+    """
+
+    mapping = {
+        'canTransferOwnershipResultOk': CanTransferOwnershipResultOk,
+        'canTransferOwnershipResultPasswordNeeded': CanTransferOwnershipResultPasswordNeeded,
+        'canTransferOwnershipResultPasswordTooFresh': CanTransferOwnershipResultPasswordTooFresh,
+        'canTransferOwnershipResultSessionTooFresh': CanTransferOwnershipResultSessionTooFresh,
+    }
+
+
+CanTransferOwnershipResult = CanTransferOwnershipResultBuilder()
+
+
+class CheckChatUsernameResultBuilder(TDObjectBuilder):
+    """Represents result of checking whether a username can be set for a chat"""
+
+    mapping = {
+        'checkChatUsernameResultOk': CheckChatUsernameResultOk,
+        'checkChatUsernameResultUsernameInvalid': CheckChatUsernameResultUsernameInvalid,
+        'checkChatUsernameResultUsernameOccupied': CheckChatUsernameResultUsernameOccupied,
+        'checkChatUsernameResultUsernamePurchasable': CheckChatUsernameResultUsernamePurchasable,
+        'checkChatUsernameResultPublicChatsTooMany': CheckChatUsernameResultPublicChatsTooMany,
+        'checkChatUsernameResultPublicGroupsUnavailable': CheckChatUsernameResultPublicGroupsUnavailable,
+    }
+
+
+CheckChatUsernameResult = CheckChatUsernameResultBuilder()
+
+
+class CheckStickerSetNameResultBuilder(TDObjectBuilder):
+    """Represents result of checking whether a name can be used for a new sticker set"""
+
+    mapping = {
+        'checkStickerSetNameResultOk': CheckStickerSetNameResultOk,
+        'checkStickerSetNameResultNameInvalid': CheckStickerSetNameResultNameInvalid,
+        'checkStickerSetNameResultNameOccupied': CheckStickerSetNameResultNameOccupied,
+    }
+
+
+CheckStickerSetNameResult = CheckStickerSetNameResultBuilder()
+
+
+class ResetPasswordResultBuilder(TDObjectBuilder):
+    """Represents result of 2-step verification password reset"""
+
+    mapping = {
+        'resetPasswordResultOk': ResetPasswordResultOk,
+        'resetPasswordResultPending': ResetPasswordResultPending,
+        'resetPasswordResultDeclined': ResetPasswordResultDeclined,
+    }
+
+
+ResetPasswordResult = ResetPasswordResultBuilder()
+
+
+class MessageFileTypeBuilder(TDObjectBuilder):
+    """Contains information about a file with messages exported from another app"""
+
+    mapping = {
+        'messageFileTypePrivate': MessageFileTypePrivate,
+        'messageFileTypeGroup': MessageFileTypeGroup,
+        'messageFileTypeUnknown': MessageFileTypeUnknown,
+    }
+
+
+MessageFileType = MessageFileTypeBuilder()
+
+
+class PushMessageContentBuilder(TDObjectBuilder):
+    """Contains content of a push message notification"""
+
+    mapping = {
+        'pushMessageContentHidden': PushMessageContentHidden,
+        'pushMessageContentAnimation': PushMessageContentAnimation,
+        'pushMessageContentAudio': PushMessageContentAudio,
+        'pushMessageContentContact': PushMessageContentContact,
+        'pushMessageContentContactRegistered': PushMessageContentContactRegistered,
+        'pushMessageContentDocument': PushMessageContentDocument,
+        'pushMessageContentGame': PushMessageContentGame,
+        'pushMessageContentGameScore': PushMessageContentGameScore,
+        'pushMessageContentInvoice': PushMessageContentInvoice,
+        'pushMessageContentLocation': PushMessageContentLocation,
+        'pushMessageContentPhoto': PushMessageContentPhoto,
+        'pushMessageContentPoll': PushMessageContentPoll,
+        'pushMessageContentPremiumGiftCode': PushMessageContentPremiumGiftCode,
+        'pushMessageContentPremiumGiveaway': PushMessageContentPremiumGiveaway,
+        'pushMessageContentScreenshotTaken': PushMessageContentScreenshotTaken,
+        'pushMessageContentSticker': PushMessageContentSticker,
+        'pushMessageContentStory': PushMessageContentStory,
+        'pushMessageContentText': PushMessageContentText,
+        'pushMessageContentVideo': PushMessageContentVideo,
+        'pushMessageContentVideoNote': PushMessageContentVideoNote,
+        'pushMessageContentVoiceNote': PushMessageContentVoiceNote,
+        'pushMessageContentBasicGroupChatCreate': PushMessageContentBasicGroupChatCreate,
+        'pushMessageContentChatAddMembers': PushMessageContentChatAddMembers,
+        'pushMessageContentChatChangePhoto': PushMessageContentChatChangePhoto,
+        'pushMessageContentChatChangeTitle': PushMessageContentChatChangeTitle,
+        'pushMessageContentChatSetBackground': PushMessageContentChatSetBackground,
+        'pushMessageContentChatSetTheme': PushMessageContentChatSetTheme,
+        'pushMessageContentChatDeleteMember': PushMessageContentChatDeleteMember,
+        'pushMessageContentChatJoinByLink': PushMessageContentChatJoinByLink,
+        'pushMessageContentChatJoinByRequest': PushMessageContentChatJoinByRequest,
+        'pushMessageContentRecurringPayment': PushMessageContentRecurringPayment,
+        'pushMessageContentSuggestProfilePhoto': PushMessageContentSuggestProfilePhoto,
+        'pushMessageContentMessageForwards': PushMessageContentMessageForwards,
+        'pushMessageContentMediaAlbum': PushMessageContentMediaAlbum,
+    }
+
+
+PushMessageContent = PushMessageContentBuilder()
+
+
+class NotificationTypeBuilder(TDObjectBuilder):
+    """Contains detailed information about a notification"""
+
+    mapping = {
+        'notificationTypeNewMessage': NotificationTypeNewMessage,
+        'notificationTypeNewSecretChat': NotificationTypeNewSecretChat,
+        'notificationTypeNewCall': NotificationTypeNewCall,
+        'notificationTypeNewPushMessage': NotificationTypeNewPushMessage,
+    }
+
+
+NotificationType = NotificationTypeBuilder()
+
+
+class NotificationGroupTypeBuilder(TDObjectBuilder):
+    """Describes the type of notifications in a notification group"""
+
+    mapping = {
+        'notificationGroupTypeMessages': NotificationGroupTypeMessages,
+        'notificationGroupTypeMentions': NotificationGroupTypeMentions,
+        'notificationGroupTypeSecretChat': NotificationGroupTypeSecretChat,
+        'notificationGroupTypeCalls': NotificationGroupTypeCalls,
+    }
+
+
+NotificationGroupType = NotificationGroupTypeBuilder()
+
+
+class OptionValueBuilder(TDObjectBuilder):
+    """Represents the value of an option"""
+
+    mapping = {
+        'optionValueBoolean': OptionValueBoolean,
+        'optionValueEmpty': OptionValueEmpty,
+        'optionValueInteger': OptionValueInteger,
+        'optionValueString': OptionValueString,
+    }
+
+
+OptionValue = OptionValueBuilder()
+
+
+class JsonValueBuilder(TDObjectBuilder):
+    """Represents a JSON value"""
+
+    mapping = {
+        'jsonValueNull': JsonValueNull,
+        'jsonValueBoolean': JsonValueBoolean,
+        'jsonValueNumber': JsonValueNumber,
+        'jsonValueString': JsonValueString,
+        'jsonValueArray': JsonValueArray,
+        'jsonValueObject': JsonValueObject,
+    }
+
+
+JsonValue = JsonValueBuilder()
+
+
+class StoryPrivacySettingsBuilder(TDObjectBuilder):
+    """Describes privacy settings of a story"""
+
+    mapping = {
+        'storyPrivacySettingsEveryone': StoryPrivacySettingsEveryone,
+        'storyPrivacySettingsContacts': StoryPrivacySettingsContacts,
+        'storyPrivacySettingsCloseFriends': StoryPrivacySettingsCloseFriends,
+        'storyPrivacySettingsSelectedUsers': StoryPrivacySettingsSelectedUsers,
+    }
+
+
+StoryPrivacySettings = StoryPrivacySettingsBuilder()
+
+
+class UserPrivacySettingRuleBuilder(TDObjectBuilder):
+    """Represents a single rule for managing user privacy settings"""
+
+    mapping = {
+        'userPrivacySettingRuleAllowAll': UserPrivacySettingRuleAllowAll,
+        'userPrivacySettingRuleAllowContacts': UserPrivacySettingRuleAllowContacts,
+        'userPrivacySettingRuleAllowUsers': UserPrivacySettingRuleAllowUsers,
+        'userPrivacySettingRuleAllowChatMembers': UserPrivacySettingRuleAllowChatMembers,
+        'userPrivacySettingRuleRestrictAll': UserPrivacySettingRuleRestrictAll,
+        'userPrivacySettingRuleRestrictContacts': UserPrivacySettingRuleRestrictContacts,
+        'userPrivacySettingRuleRestrictUsers': UserPrivacySettingRuleRestrictUsers,
+        'userPrivacySettingRuleRestrictChatMembers': UserPrivacySettingRuleRestrictChatMembers,
+    }
+
+
+UserPrivacySettingRule = UserPrivacySettingRuleBuilder()
+
+
+class UserPrivacySettingBuilder(TDObjectBuilder):
+    """Describes available user privacy settings"""
+
+    mapping = {
+        'userPrivacySettingShowStatus': UserPrivacySettingShowStatus,
+        'userPrivacySettingShowProfilePhoto': UserPrivacySettingShowProfilePhoto,
+        'userPrivacySettingShowLinkInForwardedMessages': UserPrivacySettingShowLinkInForwardedMessages,
+        'userPrivacySettingShowPhoneNumber': UserPrivacySettingShowPhoneNumber,
+        'userPrivacySettingShowBio': UserPrivacySettingShowBio,
+        'userPrivacySettingAllowChatInvites': UserPrivacySettingAllowChatInvites,
+        'userPrivacySettingAllowCalls': UserPrivacySettingAllowCalls,
+        'userPrivacySettingAllowPeerToPeerCalls': UserPrivacySettingAllowPeerToPeerCalls,
+        'userPrivacySettingAllowFindingByPhoneNumber': UserPrivacySettingAllowFindingByPhoneNumber,
+        'userPrivacySettingAllowPrivateVoiceAndVideoNoteMessages': UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages,
+    }
+
+
+UserPrivacySetting = UserPrivacySettingBuilder()
+
+
+class CanSendMessageToUserResultBuilder(TDObjectBuilder):
+    """Describes result of canSendMessageToUser"""
+
+    mapping = {
+        'canSendMessageToUserResultOk': CanSendMessageToUserResultOk,
+        'canSendMessageToUserResultUserIsDeleted': CanSendMessageToUserResultUserIsDeleted,
+        'canSendMessageToUserResultUserRestrictsNewChats': CanSendMessageToUserResultUserRestrictsNewChats,
+    }
+
+
+CanSendMessageToUserResult = CanSendMessageToUserResultBuilder()
+
+
+class SessionTypeBuilder(TDObjectBuilder):
+    """Represents the type of a session"""
+
+    mapping = {
+        'sessionTypeAndroid': SessionTypeAndroid,
+        'sessionTypeApple': SessionTypeApple,
+        'sessionTypeBrave': SessionTypeBrave,
+        'sessionTypeChrome': SessionTypeChrome,
+        'sessionTypeEdge': SessionTypeEdge,
+        'sessionTypeFirefox': SessionTypeFirefox,
+        'sessionTypeIpad': SessionTypeIpad,
+        'sessionTypeIphone': SessionTypeIphone,
+        'sessionTypeLinux': SessionTypeLinux,
+        'sessionTypeMac': SessionTypeMac,
+        'sessionTypeOpera': SessionTypeOpera,
+        'sessionTypeSafari': SessionTypeSafari,
+        'sessionTypeUbuntu': SessionTypeUbuntu,
+        'sessionTypeUnknown': SessionTypeUnknown,
+        'sessionTypeVivaldi': SessionTypeVivaldi,
+        'sessionTypeWindows': SessionTypeWindows,
+        'sessionTypeXbox': SessionTypeXbox,
+    }
+
+
+SessionType = SessionTypeBuilder()
+
+
+class ReportReasonBuilder(TDObjectBuilder):
+    """Describes the reason why a chat is reported"""
+
+    mapping = {
+        'reportReasonSpam': ReportReasonSpam,
+        'reportReasonViolence': ReportReasonViolence,
+        'reportReasonPornography': ReportReasonPornography,
+        'reportReasonChildAbuse': ReportReasonChildAbuse,
+        'reportReasonCopyright': ReportReasonCopyright,
+        'reportReasonUnrelatedLocation': ReportReasonUnrelatedLocation,
+        'reportReasonFake': ReportReasonFake,
+        'reportReasonIllegalDrugs': ReportReasonIllegalDrugs,
+        'reportReasonPersonalDetails': ReportReasonPersonalDetails,
+        'reportReasonCustom': ReportReasonCustom,
+    }
+
+
+ReportReason = ReportReasonBuilder()
+
+
+class TargetChatBuilder(TDObjectBuilder):
+    """Describes the target chat to be opened"""
+
+    mapping = {
+        'targetChatCurrent': TargetChatCurrent,
+        'targetChatChosen': TargetChatChosen,
+        'targetChatInternalLink': TargetChatInternalLink,
+    }
+
+
+TargetChat = TargetChatBuilder()
+
+
+class InternalLinkTypeBuilder(TDObjectBuilder):
+    """
+    Describes an internal https://t.me or tg: link, which must be processed by the
+    application in a special way
+    """
+
+    mapping = {
+        'internalLinkTypeActiveSessions': InternalLinkTypeActiveSessions,
+        'internalLinkTypeAttachmentMenuBot': InternalLinkTypeAttachmentMenuBot,
+        'internalLinkTypeAuthenticationCode': InternalLinkTypeAuthenticationCode,
+        'internalLinkTypeBackground': InternalLinkTypeBackground,
+        'internalLinkTypeBotAddToChannel': InternalLinkTypeBotAddToChannel,
+        'internalLinkTypeBotStart': InternalLinkTypeBotStart,
+        'internalLinkTypeBotStartInGroup': InternalLinkTypeBotStartInGroup,
+        'internalLinkTypeChangePhoneNumber': InternalLinkTypeChangePhoneNumber,
+        'internalLinkTypeChatBoost': InternalLinkTypeChatBoost,
+        'internalLinkTypeChatFolderInvite': InternalLinkTypeChatFolderInvite,
+        'internalLinkTypeChatFolderSettings': InternalLinkTypeChatFolderSettings,
+        'internalLinkTypeChatInvite': InternalLinkTypeChatInvite,
+        'internalLinkTypeDefaultMessageAutoDeleteTimerSettings': InternalLinkTypeDefaultMessageAutoDeleteTimerSettings,
+        'internalLinkTypeEditProfileSettings': InternalLinkTypeEditProfileSettings,
+        'internalLinkTypeGame': InternalLinkTypeGame,
+        'internalLinkTypeInstantView': InternalLinkTypeInstantView,
+        'internalLinkTypeInvoice': InternalLinkTypeInvoice,
+        'internalLinkTypeLanguagePack': InternalLinkTypeLanguagePack,
+        'internalLinkTypeLanguageSettings': InternalLinkTypeLanguageSettings,
+        'internalLinkTypeMessage': InternalLinkTypeMessage,
+        'internalLinkTypeMessageDraft': InternalLinkTypeMessageDraft,
+        'internalLinkTypePassportDataRequest': InternalLinkTypePassportDataRequest,
+        'internalLinkTypePhoneNumberConfirmation': InternalLinkTypePhoneNumberConfirmation,
+        'internalLinkTypePremiumFeatures': InternalLinkTypePremiumFeatures,
+        'internalLinkTypePremiumGift': InternalLinkTypePremiumGift,
+        'internalLinkTypePremiumGiftCode': InternalLinkTypePremiumGiftCode,
+        'internalLinkTypePrivacyAndSecuritySettings': InternalLinkTypePrivacyAndSecuritySettings,
+        'internalLinkTypeProxy': InternalLinkTypeProxy,
+        'internalLinkTypePublicChat': InternalLinkTypePublicChat,
+        'internalLinkTypeQrCodeAuthentication': InternalLinkTypeQrCodeAuthentication,
+        'internalLinkTypeRestorePurchases': InternalLinkTypeRestorePurchases,
+        'internalLinkTypeSettings': InternalLinkTypeSettings,
+        'internalLinkTypeSideMenuBot': InternalLinkTypeSideMenuBot,
+        'internalLinkTypeStickerSet': InternalLinkTypeStickerSet,
+        'internalLinkTypeStory': InternalLinkTypeStory,
+        'internalLinkTypeTheme': InternalLinkTypeTheme,
+        'internalLinkTypeThemeSettings': InternalLinkTypeThemeSettings,
+        'internalLinkTypeUnknownDeepLink': InternalLinkTypeUnknownDeepLink,
+        'internalLinkTypeUnsupportedProxy': InternalLinkTypeUnsupportedProxy,
+        'internalLinkTypeUserPhoneNumber': InternalLinkTypeUserPhoneNumber,
+        'internalLinkTypeUserToken': InternalLinkTypeUserToken,
+        'internalLinkTypeVideoChat': InternalLinkTypeVideoChat,
+        'internalLinkTypeWebApp': InternalLinkTypeWebApp,
+    }
+
+
+InternalLinkType = InternalLinkTypeBuilder()
+
+
+class BlockListBuilder(TDObjectBuilder):
+    """Describes a type of a block list"""
+
+    mapping = {
+        'blockListMain': BlockListMain,
+        'blockListStories': BlockListStories,
+    }
+
+
+BlockList = BlockListBuilder()
+
+
+class FileTypeBuilder(TDObjectBuilder):
+    """Represents the type of a file"""
+
+    mapping = {
+        'fileTypeNone': FileTypeNone,
+        'fileTypeAnimation': FileTypeAnimation,
+        'fileTypeAudio': FileTypeAudio,
+        'fileTypeDocument': FileTypeDocument,
+        'fileTypeNotificationSound': FileTypeNotificationSound,
+        'fileTypePhoto': FileTypePhoto,
+        'fileTypePhotoStory': FileTypePhotoStory,
+        'fileTypeProfilePhoto': FileTypeProfilePhoto,
+        'fileTypeSecret': FileTypeSecret,
+        'fileTypeSecretThumbnail': FileTypeSecretThumbnail,
+        'fileTypeSecure': FileTypeSecure,
+        'fileTypeSticker': FileTypeSticker,
+        'fileTypeThumbnail': FileTypeThumbnail,
+        'fileTypeUnknown': FileTypeUnknown,
+        'fileTypeVideo': FileTypeVideo,
+        'fileTypeVideoNote': FileTypeVideoNote,
+        'fileTypeVideoStory': FileTypeVideoStory,
+        'fileTypeVoiceNote': FileTypeVoiceNote,
+        'fileTypeWallpaper': FileTypeWallpaper,
+    }
+
+
+FileType = FileTypeBuilder()
+
+
+class NetworkTypeBuilder(TDObjectBuilder):
+    """Represents the type of a network"""
+
+    mapping = {
+        'networkTypeNone': NetworkTypeNone,
+        'networkTypeMobile': NetworkTypeMobile,
+        'networkTypeMobileRoaming': NetworkTypeMobileRoaming,
+        'networkTypeWiFi': NetworkTypeWiFi,
+        'networkTypeOther': NetworkTypeOther,
+    }
+
+
+NetworkType = NetworkTypeBuilder()
+
+
+class NetworkStatisticsEntryBuilder(TDObjectBuilder):
+    """Contains statistics about network usage"""
+
+    mapping = {
+        'networkStatisticsEntryFile': NetworkStatisticsEntryFile,
+        'networkStatisticsEntryCall': NetworkStatisticsEntryCall,
+    }
+
+
+NetworkStatisticsEntry = NetworkStatisticsEntryBuilder()
+
+
+class AutosaveSettingsScopeBuilder(TDObjectBuilder):
+    """Describes scope of autosave settings"""
+
+    mapping = {
+        'autosaveSettingsScopePrivateChats': AutosaveSettingsScopePrivateChats,
+        'autosaveSettingsScopeGroupChats': AutosaveSettingsScopeGroupChats,
+        'autosaveSettingsScopeChannelChats': AutosaveSettingsScopeChannelChats,
+        'autosaveSettingsScopeChat': AutosaveSettingsScopeChat,
+    }
+
+
+AutosaveSettingsScope = AutosaveSettingsScopeBuilder()
+
+
+class ConnectionStateBuilder(TDObjectBuilder):
+    """Describes the current state of the connection to Telegram servers"""
+
+    mapping = {
+        'connectionStateWaitingForNetwork': ConnectionStateWaitingForNetwork,
+        'connectionStateConnectingToProxy': ConnectionStateConnectingToProxy,
+        'connectionStateConnecting': ConnectionStateConnecting,
+        'connectionStateUpdating': ConnectionStateUpdating,
+        'connectionStateReady': ConnectionStateReady,
+    }
+
+
+ConnectionState = ConnectionStateBuilder()
+
+
+class TopChatCategoryBuilder(TDObjectBuilder):
+    """
+    Represents the categories of chats for which a list of frequently used chats
+    can be retrieved
+    """
+
+    mapping = {
+        'topChatCategoryUsers': TopChatCategoryUsers,
+        'topChatCategoryBots': TopChatCategoryBots,
+        'topChatCategoryGroups': TopChatCategoryGroups,
+        'topChatCategoryChannels': TopChatCategoryChannels,
+        'topChatCategoryInlineBots': TopChatCategoryInlineBots,
+        'topChatCategoryCalls': TopChatCategoryCalls,
+        'topChatCategoryForwardChats': TopChatCategoryForwardChats,
+    }
+
+
+TopChatCategory = TopChatCategoryBuilder()
+
+
+class TMeUrlTypeBuilder(TDObjectBuilder):
+    """Describes the type of a URL linking to an internal Telegram entity"""
+
+    mapping = {
+        'tMeUrlTypeUser': TMeUrlTypeUser,
+        'tMeUrlTypeSupergroup': TMeUrlTypeSupergroup,
+        'tMeUrlTypeChatInvite': TMeUrlTypeChatInvite,
+        'tMeUrlTypeStickerSet': TMeUrlTypeStickerSet,
+    }
+
+
+TMeUrlType = TMeUrlTypeBuilder()
+
+
+class SuggestedActionBuilder(TDObjectBuilder):
+    """Describes an action suggested to the current user"""
+
+    mapping = {
+        'suggestedActionEnableArchiveAndMuteNewChats': SuggestedActionEnableArchiveAndMuteNewChats,
+        'suggestedActionCheckPassword': SuggestedActionCheckPassword,
+        'suggestedActionCheckPhoneNumber': SuggestedActionCheckPhoneNumber,
+        'suggestedActionViewChecksHint': SuggestedActionViewChecksHint,
+        'suggestedActionConvertToBroadcastGroup': SuggestedActionConvertToBroadcastGroup,
+        'suggestedActionSetPassword': SuggestedActionSetPassword,
+        'suggestedActionUpgradePremium': SuggestedActionUpgradePremium,
+        'suggestedActionRestorePremium': SuggestedActionRestorePremium,
+        'suggestedActionSubscribeToAnnualPremium': SuggestedActionSubscribeToAnnualPremium,
+        'suggestedActionGiftPremiumForChristmas': SuggestedActionGiftPremiumForChristmas,
+    }
+
+
+SuggestedAction = SuggestedActionBuilder()
+
+
+class TextParseModeBuilder(TDObjectBuilder):
+    """Describes the way the text needs to be parsed for text entities"""
+
+    mapping = {
+        'textParseModeMarkdown': TextParseModeMarkdown,
+        'textParseModeHTML': TextParseModeHTML,
+    }
+
+
+TextParseMode = TextParseModeBuilder()
+
+
+class ProxyTypeBuilder(TDObjectBuilder):
+    """Describes the type of a proxy server"""
+
+    mapping = {
+        'proxyTypeSocks5': ProxyTypeSocks5,
+        'proxyTypeHttp': ProxyTypeHttp,
+        'proxyTypeMtproto': ProxyTypeMtproto,
+    }
+
+
+ProxyType = ProxyTypeBuilder()
+
+
+class StatisticalGraphBuilder(TDObjectBuilder):
+    """Describes a statistical graph"""
+
+    mapping = {
+        'statisticalGraphData': StatisticalGraphData,
+        'statisticalGraphAsync': StatisticalGraphAsync,
+        'statisticalGraphError': StatisticalGraphError,
+    }
+
+
+StatisticalGraph = StatisticalGraphBuilder()
+
+
+class ChatStatisticsObjectTypeBuilder(TDObjectBuilder):
+    """Describes type of an object, for which statistics are provided"""
+
+    mapping = {
+        'chatStatisticsObjectTypeMessage': ChatStatisticsObjectTypeMessage,
+        'chatStatisticsObjectTypeStory': ChatStatisticsObjectTypeStory,
+    }
+
+
+ChatStatisticsObjectType = ChatStatisticsObjectTypeBuilder()
+
+
+class ChatStatisticsBuilder(TDObjectBuilder):
+    """Contains a detailed statistics about a chat"""
+
+    mapping = {
+        'chatStatisticsSupergroup': ChatStatisticsSupergroup,
+        'chatStatisticsChannel': ChatStatisticsChannel,
+    }
+
+
+ChatStatistics = ChatStatisticsBuilder()
+
+
+class VectorPathCommandBuilder(TDObjectBuilder):
+    """Represents a vector path command"""
+
+    mapping = {
+        'vectorPathCommandLine': VectorPathCommandLine,
+        'vectorPathCommandCubicBezierCurve': VectorPathCommandCubicBezierCurve,
+    }
+
+
+VectorPathCommand = VectorPathCommandBuilder()
+
+
+class BotCommandScopeBuilder(TDObjectBuilder):
+    """Represents the scope to which bot commands are relevant"""
+
+    mapping = {
+        'botCommandScopeDefault': BotCommandScopeDefault,
+        'botCommandScopeAllPrivateChats': BotCommandScopeAllPrivateChats,
+        'botCommandScopeAllGroupChats': BotCommandScopeAllGroupChats,
+        'botCommandScopeAllChatAdministrators': BotCommandScopeAllChatAdministrators,
+        'botCommandScopeChat': BotCommandScopeChat,
+        'botCommandScopeChatAdministrators': BotCommandScopeChatAdministrators,
+        'botCommandScopeChatMember': BotCommandScopeChatMember,
+    }
+
+
+BotCommandScope = BotCommandScopeBuilder()
+
+
+class UpdateBuilder(TDObjectBuilder):
+    """Contains notifications about data changes"""
+
+    mapping = {
+        'updateAuthorizationState': UpdateAuthorizationState,
+        'updateNewMessage': UpdateNewMessage,
+        'updateMessageSendAcknowledged': UpdateMessageSendAcknowledged,
+        'updateMessageSendSucceeded': UpdateMessageSendSucceeded,
+        'updateMessageSendFailed': UpdateMessageSendFailed,
+        'updateMessageContent': UpdateMessageContent,
+        'updateMessageEdited': UpdateMessageEdited,
+        'updateMessageIsPinned': UpdateMessageIsPinned,
+        'updateMessageInteractionInfo': UpdateMessageInteractionInfo,
+        'updateMessageContentOpened': UpdateMessageContentOpened,
+        'updateMessageMentionRead': UpdateMessageMentionRead,
+        'updateMessageUnreadReactions': UpdateMessageUnreadReactions,
+        'updateMessageLiveLocationViewed': UpdateMessageLiveLocationViewed,
+        'updateNewChat': UpdateNewChat,
+        'updateChatTitle': UpdateChatTitle,
+        'updateChatPhoto': UpdateChatPhoto,
+        'updateChatAccentColors': UpdateChatAccentColors,
+        'updateChatPermissions': UpdateChatPermissions,
+        'updateChatLastMessage': UpdateChatLastMessage,
+        'updateChatPosition': UpdateChatPosition,
+        'updateChatAddedToList': UpdateChatAddedToList,
+        'updateChatRemovedFromList': UpdateChatRemovedFromList,
+        'updateChatReadInbox': UpdateChatReadInbox,
+        'updateChatReadOutbox': UpdateChatReadOutbox,
+        'updateChatActionBar': UpdateChatActionBar,
+        'updateChatAvailableReactions': UpdateChatAvailableReactions,
+        'updateChatDraftMessage': UpdateChatDraftMessage,
+        'updateChatEmojiStatus': UpdateChatEmojiStatus,
+        'updateChatMessageSender': UpdateChatMessageSender,
+        'updateChatMessageAutoDeleteTime': UpdateChatMessageAutoDeleteTime,
+        'updateChatNotificationSettings': UpdateChatNotificationSettings,
+        'updateChatPendingJoinRequests': UpdateChatPendingJoinRequests,
+        'updateChatReplyMarkup': UpdateChatReplyMarkup,
+        'updateChatBackground': UpdateChatBackground,
+        'updateChatTheme': UpdateChatTheme,
+        'updateChatUnreadMentionCount': UpdateChatUnreadMentionCount,
+        'updateChatUnreadReactionCount': UpdateChatUnreadReactionCount,
+        'updateChatVideoChat': UpdateChatVideoChat,
+        'updateChatDefaultDisableNotification': UpdateChatDefaultDisableNotification,
+        'updateChatHasProtectedContent': UpdateChatHasProtectedContent,
+        'updateChatIsTranslatable': UpdateChatIsTranslatable,
+        'updateChatIsMarkedAsUnread': UpdateChatIsMarkedAsUnread,
+        'updateChatViewAsTopics': UpdateChatViewAsTopics,
+        'updateChatBlockList': UpdateChatBlockList,
+        'updateChatHasScheduledMessages': UpdateChatHasScheduledMessages,
+        'updateChatFolders': UpdateChatFolders,
+        'updateChatOnlineMemberCount': UpdateChatOnlineMemberCount,
+        'updateSavedMessagesTopic': UpdateSavedMessagesTopic,
+        'updateSavedMessagesTopicCount': UpdateSavedMessagesTopicCount,
+        'updateQuickReplyShortcut': UpdateQuickReplyShortcut,
+        'updateQuickReplyShortcutDeleted': UpdateQuickReplyShortcutDeleted,
+        'updateQuickReplyShortcuts': UpdateQuickReplyShortcuts,
+        'updateQuickReplyShortcutMessages': UpdateQuickReplyShortcutMessages,
+        'updateForumTopicInfo': UpdateForumTopicInfo,
+        'updateScopeNotificationSettings': UpdateScopeNotificationSettings,
+        'updateNotification': UpdateNotification,
+        'updateNotificationGroup': UpdateNotificationGroup,
+        'updateActiveNotifications': UpdateActiveNotifications,
+        'updateHavePendingNotifications': UpdateHavePendingNotifications,
+        'updateDeleteMessages': UpdateDeleteMessages,
+        'updateChatAction': UpdateChatAction,
+        'updateUserStatus': UpdateUserStatus,
+        'updateUser': UpdateUser,
+        'updateBasicGroup': UpdateBasicGroup,
+        'updateSupergroup': UpdateSupergroup,
+        'updateSecretChat': UpdateSecretChat,
+        'updateUserFullInfo': UpdateUserFullInfo,
+        'updateBasicGroupFullInfo': UpdateBasicGroupFullInfo,
+        'updateSupergroupFullInfo': UpdateSupergroupFullInfo,
+        'updateServiceNotification': UpdateServiceNotification,
+        'updateFile': UpdateFile,
+        'updateFileGenerationStart': UpdateFileGenerationStart,
+        'updateFileGenerationStop': UpdateFileGenerationStop,
+        'updateFileDownloads': UpdateFileDownloads,
+        'updateFileAddedToDownloads': UpdateFileAddedToDownloads,
+        'updateFileDownload': UpdateFileDownload,
+        'updateFileRemovedFromDownloads': UpdateFileRemovedFromDownloads,
+        'updateCall': UpdateCall,
+        'updateGroupCall': UpdateGroupCall,
+        'updateGroupCallParticipant': UpdateGroupCallParticipant,
+        'updateNewCallSignalingData': UpdateNewCallSignalingData,
+        'updateUserPrivacySettingRules': UpdateUserPrivacySettingRules,
+        'updateUnreadMessageCount': UpdateUnreadMessageCount,
+        'updateUnreadChatCount': UpdateUnreadChatCount,
+        'updateStory': UpdateStory,
+        'updateStoryDeleted': UpdateStoryDeleted,
+        'updateStorySendSucceeded': UpdateStorySendSucceeded,
+        'updateStorySendFailed': UpdateStorySendFailed,
+        'updateChatActiveStories': UpdateChatActiveStories,
+        'updateStoryListChatCount': UpdateStoryListChatCount,
+        'updateStoryStealthMode': UpdateStoryStealthMode,
+        'updateOption': UpdateOption,
+        'updateStickerSet': UpdateStickerSet,
+        'updateInstalledStickerSets': UpdateInstalledStickerSets,
+        'updateTrendingStickerSets': UpdateTrendingStickerSets,
+        'updateRecentStickers': UpdateRecentStickers,
+        'updateFavoriteStickers': UpdateFavoriteStickers,
+        'updateSavedAnimations': UpdateSavedAnimations,
+        'updateSavedNotificationSounds': UpdateSavedNotificationSounds,
+        'updateDefaultBackground': UpdateDefaultBackground,
+        'updateChatThemes': UpdateChatThemes,
+        'updateAccentColors': UpdateAccentColors,
+        'updateProfileAccentColors': UpdateProfileAccentColors,
+        'updateLanguagePackStrings': UpdateLanguagePackStrings,
+        'updateConnectionState': UpdateConnectionState,
+        'updateTermsOfService': UpdateTermsOfService,
+        'updateUsersNearby': UpdateUsersNearby,
+        'updateUnconfirmedSession': UpdateUnconfirmedSession,
+        'updateAttachmentMenuBots': UpdateAttachmentMenuBots,
+        'updateWebAppMessageSent': UpdateWebAppMessageSent,
+        'updateActiveEmojiReactions': UpdateActiveEmojiReactions,
+        'updateDefaultReactionType': UpdateDefaultReactionType,
+        'updateSavedMessagesTags': UpdateSavedMessagesTags,
+        'updateSpeechRecognitionTrial': UpdateSpeechRecognitionTrial,
+        'updateDiceEmojis': UpdateDiceEmojis,
+        'updateAnimatedEmojiMessageClicked': UpdateAnimatedEmojiMessageClicked,
+        'updateAnimationSearchParameters': UpdateAnimationSearchParameters,
+        'updateSuggestedActions': UpdateSuggestedActions,
+        'updateAddChatMembersPrivacyForbidden': UpdateAddChatMembersPrivacyForbidden,
+        'updateAutosaveSettings': UpdateAutosaveSettings,
+        'updateNewInlineQuery': UpdateNewInlineQuery,
+        'updateNewChosenInlineResult': UpdateNewChosenInlineResult,
+        'updateNewCallbackQuery': UpdateNewCallbackQuery,
+        'updateNewInlineCallbackQuery': UpdateNewInlineCallbackQuery,
+        'updateNewShippingQuery': UpdateNewShippingQuery,
+        'updateNewPreCheckoutQuery': UpdateNewPreCheckoutQuery,
+        'updateNewCustomEvent': UpdateNewCustomEvent,
+        'updateNewCustomQuery': UpdateNewCustomQuery,
+        'updatePoll': UpdatePoll,
+        'updatePollAnswer': UpdatePollAnswer,
+        'updateChatMember': UpdateChatMember,
+        'updateNewChatJoinRequest': UpdateNewChatJoinRequest,
+        'updateChatBoost': UpdateChatBoost,
+        'updateMessageReaction': UpdateMessageReaction,
+        'updateMessageReactions': UpdateMessageReactions,
+    }
+
+
+Update = UpdateBuilder()
+
+
+class LogStreamBuilder(TDObjectBuilder):
+    """Describes a stream to which TDLib internal log is written"""
+
+    mapping = {
+        'logStreamDefault': LogStreamDefault,
+        'logStreamFile': LogStreamFile,
+        'logStreamEmpty': LogStreamEmpty,
+    }
+
+
+LogStream = LogStreamBuilder()
+
+
+CONSTRUCTORS = {
+    'error': Error,
+    'ok': Ok,
+    'authenticationCodeTypeTelegramMessage': AuthenticationCodeTypeTelegramMessage,
+    'authenticationCodeTypeSms': AuthenticationCodeTypeSms,
+    'authenticationCodeTypeCall': AuthenticationCodeTypeCall,
+    'authenticationCodeTypeFlashCall': AuthenticationCodeTypeFlashCall,
+    'authenticationCodeTypeMissedCall': AuthenticationCodeTypeMissedCall,
+    'authenticationCodeTypeFragment': AuthenticationCodeTypeFragment,
+    'authenticationCodeTypeFirebaseAndroid': AuthenticationCodeTypeFirebaseAndroid,
+    'authenticationCodeTypeFirebaseIos': AuthenticationCodeTypeFirebaseIos,
+    'authenticationCodeInfo': AuthenticationCodeInfo,
+    'emailAddressAuthenticationCodeInfo': EmailAddressAuthenticationCodeInfo,
+    'emailAddressAuthenticationCode': EmailAddressAuthenticationCode,
+    'emailAddressAuthenticationAppleId': EmailAddressAuthenticationAppleId,
+    'emailAddressAuthenticationGoogleId': EmailAddressAuthenticationGoogleId,
+    'emailAddressResetStateAvailable': EmailAddressResetStateAvailable,
+    'emailAddressResetStatePending': EmailAddressResetStatePending,
+    'textEntity': TextEntity,
+    'textEntities': TextEntities,
+    'formattedText': FormattedText,
+    'termsOfService': TermsOfService,
+    'authorizationStateWaitTdlibParameters': AuthorizationStateWaitTdlibParameters,
+    'authorizationStateWaitPhoneNumber': AuthorizationStateWaitPhoneNumber,
+    'authorizationStateWaitEmailAddress': AuthorizationStateWaitEmailAddress,
+    'authorizationStateWaitEmailCode': AuthorizationStateWaitEmailCode,
+    'authorizationStateWaitCode': AuthorizationStateWaitCode,
+    'authorizationStateWaitOtherDeviceConfirmation': AuthorizationStateWaitOtherDeviceConfirmation,
+    'authorizationStateWaitRegistration': AuthorizationStateWaitRegistration,
+    'authorizationStateWaitPassword': AuthorizationStateWaitPassword,
+    'authorizationStateReady': AuthorizationStateReady,
+    'authorizationStateLoggingOut': AuthorizationStateLoggingOut,
+    'authorizationStateClosing': AuthorizationStateClosing,
+    'authorizationStateClosed': AuthorizationStateClosed,
+    'passwordState': PasswordState,
+    'recoveryEmailAddress': RecoveryEmailAddress,
+    'temporaryPasswordState': TemporaryPasswordState,
+    'localFile': LocalFile,
+    'remoteFile': RemoteFile,
+    'file': File,
+    'inputFileId': InputFileId,
+    'inputFileRemote': InputFileRemote,
+    'inputFileLocal': InputFileLocal,
+    'inputFileGenerated': InputFileGenerated,
+    'photoSize': PhotoSize,
+    'minithumbnail': Minithumbnail,
+    'thumbnailFormatJpeg': ThumbnailFormatJpeg,
+    'thumbnailFormatGif': ThumbnailFormatGif,
+    'thumbnailFormatMpeg4': ThumbnailFormatMpeg4,
+    'thumbnailFormatPng': ThumbnailFormatPng,
+    'thumbnailFormatTgs': ThumbnailFormatTgs,
+    'thumbnailFormatWebm': ThumbnailFormatWebm,
+    'thumbnailFormatWebp': ThumbnailFormatWebp,
+    'thumbnail': Thumbnail,
+    'maskPointForehead': MaskPointForehead,
+    'maskPointEyes': MaskPointEyes,
+    'maskPointMouth': MaskPointMouth,
+    'maskPointChin': MaskPointChin,
+    'maskPosition': MaskPosition,
+    'stickerFormatWebp': StickerFormatWebp,
+    'stickerFormatTgs': StickerFormatTgs,
+    'stickerFormatWebm': StickerFormatWebm,
+    'stickerTypeRegular': StickerTypeRegular,
+    'stickerTypeMask': StickerTypeMask,
+    'stickerTypeCustomEmoji': StickerTypeCustomEmoji,
+    'stickerFullTypeRegular': StickerFullTypeRegular,
+    'stickerFullTypeMask': StickerFullTypeMask,
+    'stickerFullTypeCustomEmoji': StickerFullTypeCustomEmoji,
+    'closedVectorPath': ClosedVectorPath,
+    'pollOption': PollOption,
+    'pollTypeRegular': PollTypeRegular,
+    'pollTypeQuiz': PollTypeQuiz,
+    'animation': Animation,
+    'audio': Audio,
+    'document': Document,
+    'photo': Photo,
+    'sticker': Sticker,
+    'video': Video,
+    'videoNote': VideoNote,
+    'voiceNote': VoiceNote,
+    'animatedEmoji': AnimatedEmoji,
+    'contact': Contact,
+    'location': Location,
+    'venue': Venue,
+    'game': Game,
+    'webApp': WebApp,
+    'poll': Poll,
+    'background': Background,
+    'backgrounds': Backgrounds,
+    'chatBackground': ChatBackground,
+    'profilePhoto': ProfilePhoto,
+    'chatPhotoInfo': ChatPhotoInfo,
+    'userTypeRegular': UserTypeRegular,
+    'userTypeDeleted': UserTypeDeleted,
+    'userTypeBot': UserTypeBot,
+    'userTypeUnknown': UserTypeUnknown,
+    'botCommand': BotCommand,
+    'botCommands': BotCommands,
+    'botMenuButton': BotMenuButton,
+    'chatLocation': ChatLocation,
+    'businessAwayMessageScheduleAlways': BusinessAwayMessageScheduleAlways,
+    'businessAwayMessageScheduleOutsideOfOpeningHours': BusinessAwayMessageScheduleOutsideOfOpeningHours,
+    'businessAwayMessageScheduleCustom': BusinessAwayMessageScheduleCustom,
+    'businessLocation': BusinessLocation,
+    'businessRecipients': BusinessRecipients,
+    'businessAwayMessageSettings': BusinessAwayMessageSettings,
+    'businessGreetingMessageSettings': BusinessGreetingMessageSettings,
+    'businessConnectedBot': BusinessConnectedBot,
+    'businessOpeningHoursInterval': BusinessOpeningHoursInterval,
+    'businessOpeningHours': BusinessOpeningHours,
+    'businessInfo': BusinessInfo,
+    'chatPhotoStickerTypeRegularOrMask': ChatPhotoStickerTypeRegularOrMask,
+    'chatPhotoStickerTypeCustomEmoji': ChatPhotoStickerTypeCustomEmoji,
+    'chatPhotoSticker': ChatPhotoSticker,
+    'animatedChatPhoto': AnimatedChatPhoto,
+    'chatPhoto': ChatPhoto,
+    'chatPhotos': ChatPhotos,
+    'inputChatPhotoPrevious': InputChatPhotoPrevious,
+    'inputChatPhotoStatic': InputChatPhotoStatic,
+    'inputChatPhotoAnimation': InputChatPhotoAnimation,
+    'inputChatPhotoSticker': InputChatPhotoSticker,
+    'chatPermissions': ChatPermissions,
+    'chatAdministratorRights': ChatAdministratorRights,
+    'premiumPaymentOption': PremiumPaymentOption,
+    'premiumStatePaymentOption': PremiumStatePaymentOption,
+    'premiumGiftCodePaymentOption': PremiumGiftCodePaymentOption,
+    'premiumGiftCodePaymentOptions': PremiumGiftCodePaymentOptions,
+    'premiumGiftCodeInfo': PremiumGiftCodeInfo,
+    'premiumGiveawayParticipantStatusEligible': PremiumGiveawayParticipantStatusEligible,
+    'premiumGiveawayParticipantStatusParticipating': PremiumGiveawayParticipantStatusParticipating,
+    'premiumGiveawayParticipantStatusAlreadyWasMember': PremiumGiveawayParticipantStatusAlreadyWasMember,
+    'premiumGiveawayParticipantStatusAdministrator': PremiumGiveawayParticipantStatusAdministrator,
+    'premiumGiveawayParticipantStatusDisallowedCountry': PremiumGiveawayParticipantStatusDisallowedCountry,
+    'premiumGiveawayInfoOngoing': PremiumGiveawayInfoOngoing,
+    'premiumGiveawayInfoCompleted': PremiumGiveawayInfoCompleted,
+    'accentColor': AccentColor,
+    'profileAccentColors': ProfileAccentColors,
+    'profileAccentColor': ProfileAccentColor,
+    'emojiStatus': EmojiStatus,
+    'emojiStatuses': EmojiStatuses,
+    'usernames': Usernames,
+    'user': User,
+    'botInfo': BotInfo,
+    'userFullInfo': UserFullInfo,
+    'users': Users,
+    'chatAdministrator': ChatAdministrator,
+    'chatAdministrators': ChatAdministrators,
+    'chatMemberStatusCreator': ChatMemberStatusCreator,
+    'chatMemberStatusAdministrator': ChatMemberStatusAdministrator,
+    'chatMemberStatusMember': ChatMemberStatusMember,
+    'chatMemberStatusRestricted': ChatMemberStatusRestricted,
+    'chatMemberStatusLeft': ChatMemberStatusLeft,
+    'chatMemberStatusBanned': ChatMemberStatusBanned,
+    'chatMember': ChatMember,
+    'chatMembers': ChatMembers,
+    'chatMembersFilterContacts': ChatMembersFilterContacts,
+    'chatMembersFilterAdministrators': ChatMembersFilterAdministrators,
+    'chatMembersFilterMembers': ChatMembersFilterMembers,
+    'chatMembersFilterMention': ChatMembersFilterMention,
+    'chatMembersFilterRestricted': ChatMembersFilterRestricted,
+    'chatMembersFilterBanned': ChatMembersFilterBanned,
+    'chatMembersFilterBots': ChatMembersFilterBots,
+    'supergroupMembersFilterRecent': SupergroupMembersFilterRecent,
+    'supergroupMembersFilterContacts': SupergroupMembersFilterContacts,
+    'supergroupMembersFilterAdministrators': SupergroupMembersFilterAdministrators,
+    'supergroupMembersFilterSearch': SupergroupMembersFilterSearch,
+    'supergroupMembersFilterRestricted': SupergroupMembersFilterRestricted,
+    'supergroupMembersFilterBanned': SupergroupMembersFilterBanned,
+    'supergroupMembersFilterMention': SupergroupMembersFilterMention,
+    'supergroupMembersFilterBots': SupergroupMembersFilterBots,
+    'chatInviteLink': ChatInviteLink,
+    'chatInviteLinks': ChatInviteLinks,
+    'chatInviteLinkCount': ChatInviteLinkCount,
+    'chatInviteLinkCounts': ChatInviteLinkCounts,
+    'chatInviteLinkMember': ChatInviteLinkMember,
+    'chatInviteLinkMembers': ChatInviteLinkMembers,
+    'inviteLinkChatTypeBasicGroup': InviteLinkChatTypeBasicGroup,
+    'inviteLinkChatTypeSupergroup': InviteLinkChatTypeSupergroup,
+    'inviteLinkChatTypeChannel': InviteLinkChatTypeChannel,
+    'chatInviteLinkInfo': ChatInviteLinkInfo,
+    'chatJoinRequest': ChatJoinRequest,
+    'chatJoinRequests': ChatJoinRequests,
+    'chatJoinRequestsInfo': ChatJoinRequestsInfo,
+    'basicGroup': BasicGroup,
+    'basicGroupFullInfo': BasicGroupFullInfo,
+    'supergroup': Supergroup,
+    'supergroupFullInfo': SupergroupFullInfo,
+    'secretChatStatePending': SecretChatStatePending,
+    'secretChatStateReady': SecretChatStateReady,
+    'secretChatStateClosed': SecretChatStateClosed,
+    'secretChat': SecretChat,
+    'messageSenderUser': MessageSenderUser,
+    'messageSenderChat': MessageSenderChat,
+    'messageSenders': MessageSenders,
+    'chatMessageSender': ChatMessageSender,
+    'chatMessageSenders': ChatMessageSenders,
+    'messageReadDateRead': MessageReadDateRead,
+    'messageReadDateUnread': MessageReadDateUnread,
+    'messageReadDateTooOld': MessageReadDateTooOld,
+    'messageReadDateUserPrivacyRestricted': MessageReadDateUserPrivacyRestricted,
+    'messageReadDateMyPrivacyRestricted': MessageReadDateMyPrivacyRestricted,
+    'messageViewer': MessageViewer,
+    'messageViewers': MessageViewers,
+    'messageOriginUser': MessageOriginUser,
+    'messageOriginHiddenUser': MessageOriginHiddenUser,
+    'messageOriginChat': MessageOriginChat,
+    'messageOriginChannel': MessageOriginChannel,
+    'forwardSource': ForwardSource,
+    'reactionTypeEmoji': ReactionTypeEmoji,
+    'reactionTypeCustomEmoji': ReactionTypeCustomEmoji,
+    'messageForwardInfo': MessageForwardInfo,
+    'messageImportInfo': MessageImportInfo,
+    'messageReplyInfo': MessageReplyInfo,
+    'messageReaction': MessageReaction,
+    'messageReactions': MessageReactions,
+    'messageInteractionInfo': MessageInteractionInfo,
+    'unreadReaction': UnreadReaction,
+    'messageSendingStatePending': MessageSendingStatePending,
+    'messageSendingStateFailed': MessageSendingStateFailed,
+    'textQuote': TextQuote,
+    'inputTextQuote': InputTextQuote,
+    'messageReplyToMessage': MessageReplyToMessage,
+    'messageReplyToStory': MessageReplyToStory,
+    'inputMessageReplyToMessage': InputMessageReplyToMessage,
+    'inputMessageReplyToStory': InputMessageReplyToStory,
+    'message': Message,
+    'messages': Messages,
+    'foundMessages': FoundMessages,
+    'foundChatMessages': FoundChatMessages,
+    'messagePosition': MessagePosition,
+    'messagePositions': MessagePositions,
+    'messageCalendarDay': MessageCalendarDay,
+    'messageCalendar': MessageCalendar,
+    'messageSourceChatHistory': MessageSourceChatHistory,
+    'messageSourceMessageThreadHistory': MessageSourceMessageThreadHistory,
+    'messageSourceForumTopicHistory': MessageSourceForumTopicHistory,
+    'messageSourceHistoryPreview': MessageSourceHistoryPreview,
+    'messageSourceChatList': MessageSourceChatList,
+    'messageSourceSearch': MessageSourceSearch,
+    'messageSourceChatEventLog': MessageSourceChatEventLog,
+    'messageSourceNotification': MessageSourceNotification,
+    'messageSourceScreenshot': MessageSourceScreenshot,
+    'messageSourceOther': MessageSourceOther,
+    'messageSponsorTypeBot': MessageSponsorTypeBot,
+    'messageSponsorTypeWebApp': MessageSponsorTypeWebApp,
+    'messageSponsorTypePublicChannel': MessageSponsorTypePublicChannel,
+    'messageSponsorTypePrivateChannel': MessageSponsorTypePrivateChannel,
+    'messageSponsorTypeWebsite': MessageSponsorTypeWebsite,
+    'messageSponsor': MessageSponsor,
+    'sponsoredMessage': SponsoredMessage,
+    'sponsoredMessages': SponsoredMessages,
+    'fileDownload': FileDownload,
+    'downloadedFileCounts': DownloadedFileCounts,
+    'foundFileDownloads': FoundFileDownloads,
+    'notificationSettingsScopePrivateChats': NotificationSettingsScopePrivateChats,
+    'notificationSettingsScopeGroupChats': NotificationSettingsScopeGroupChats,
+    'notificationSettingsScopeChannelChats': NotificationSettingsScopeChannelChats,
+    'chatNotificationSettings': ChatNotificationSettings,
+    'scopeNotificationSettings': ScopeNotificationSettings,
+    'draftMessage': DraftMessage,
+    'chatTypePrivate': ChatTypePrivate,
+    'chatTypeBasicGroup': ChatTypeBasicGroup,
+    'chatTypeSupergroup': ChatTypeSupergroup,
+    'chatTypeSecret': ChatTypeSecret,
+    'chatFolderIcon': ChatFolderIcon,
+    'chatFolder': ChatFolder,
+    'chatFolderInfo': ChatFolderInfo,
+    'chatFolderInviteLink': ChatFolderInviteLink,
+    'chatFolderInviteLinks': ChatFolderInviteLinks,
+    'chatFolderInviteLinkInfo': ChatFolderInviteLinkInfo,
+    'recommendedChatFolder': RecommendedChatFolder,
+    'recommendedChatFolders': RecommendedChatFolders,
+    'archiveChatListSettings': ArchiveChatListSettings,
+    'chatListMain': ChatListMain,
+    'chatListArchive': ChatListArchive,
+    'chatListFolder': ChatListFolder,
+    'chatLists': ChatLists,
+    'chatSourceMtprotoProxy': ChatSourceMtprotoProxy,
+    'chatSourcePublicServiceAnnouncement': ChatSourcePublicServiceAnnouncement,
+    'chatPosition': ChatPosition,
+    'chatAvailableReactionsAll': ChatAvailableReactionsAll,
+    'chatAvailableReactionsSome': ChatAvailableReactionsSome,
+    'savedMessagesTag': SavedMessagesTag,
+    'savedMessagesTags': SavedMessagesTags,
+    'videoChat': VideoChat,
+    'chat': Chat,
+    'chats': Chats,
+    'chatNearby': ChatNearby,
+    'chatsNearby': ChatsNearby,
+    'publicChatTypeHasUsername': PublicChatTypeHasUsername,
+    'publicChatTypeIsLocationBased': PublicChatTypeIsLocationBased,
+    'chatActionBarReportSpam': ChatActionBarReportSpam,
+    'chatActionBarReportUnrelatedLocation': ChatActionBarReportUnrelatedLocation,
+    'chatActionBarInviteMembers': ChatActionBarInviteMembers,
+    'chatActionBarReportAddBlock': ChatActionBarReportAddBlock,
+    'chatActionBarAddContact': ChatActionBarAddContact,
+    'chatActionBarSharePhoneNumber': ChatActionBarSharePhoneNumber,
+    'chatActionBarJoinRequest': ChatActionBarJoinRequest,
+    'keyboardButtonTypeText': KeyboardButtonTypeText,
+    'keyboardButtonTypeRequestPhoneNumber': KeyboardButtonTypeRequestPhoneNumber,
+    'keyboardButtonTypeRequestLocation': KeyboardButtonTypeRequestLocation,
+    'keyboardButtonTypeRequestPoll': KeyboardButtonTypeRequestPoll,
+    'keyboardButtonTypeRequestUsers': KeyboardButtonTypeRequestUsers,
+    'keyboardButtonTypeRequestChat': KeyboardButtonTypeRequestChat,
+    'keyboardButtonTypeWebApp': KeyboardButtonTypeWebApp,
+    'keyboardButton': KeyboardButton,
+    'inlineKeyboardButtonTypeUrl': InlineKeyboardButtonTypeUrl,
+    'inlineKeyboardButtonTypeLoginUrl': InlineKeyboardButtonTypeLoginUrl,
+    'inlineKeyboardButtonTypeWebApp': InlineKeyboardButtonTypeWebApp,
+    'inlineKeyboardButtonTypeCallback': InlineKeyboardButtonTypeCallback,
+    'inlineKeyboardButtonTypeCallbackWithPassword': InlineKeyboardButtonTypeCallbackWithPassword,
+    'inlineKeyboardButtonTypeCallbackGame': InlineKeyboardButtonTypeCallbackGame,
+    'inlineKeyboardButtonTypeSwitchInline': InlineKeyboardButtonTypeSwitchInline,
+    'inlineKeyboardButtonTypeBuy': InlineKeyboardButtonTypeBuy,
+    'inlineKeyboardButtonTypeUser': InlineKeyboardButtonTypeUser,
+    'inlineKeyboardButton': InlineKeyboardButton,
+    'replyMarkupRemoveKeyboard': ReplyMarkupRemoveKeyboard,
+    'replyMarkupForceReply': ReplyMarkupForceReply,
+    'replyMarkupShowKeyboard': ReplyMarkupShowKeyboard,
+    'replyMarkupInlineKeyboard': ReplyMarkupInlineKeyboard,
+    'loginUrlInfoOpen': LoginUrlInfoOpen,
+    'loginUrlInfoRequestConfirmation': LoginUrlInfoRequestConfirmation,
+    'foundWebApp': FoundWebApp,
+    'webAppInfo': WebAppInfo,
+    'messageThreadInfo': MessageThreadInfo,
+    'savedMessagesTopicTypeMyNotes': SavedMessagesTopicTypeMyNotes,
+    'savedMessagesTopicTypeAuthorHidden': SavedMessagesTopicTypeAuthorHidden,
+    'savedMessagesTopicTypeSavedFromChat': SavedMessagesTopicTypeSavedFromChat,
+    'savedMessagesTopic': SavedMessagesTopic,
+    'forumTopicIcon': ForumTopicIcon,
+    'forumTopicInfo': ForumTopicInfo,
+    'forumTopic': ForumTopic,
+    'forumTopics': ForumTopics,
+    'linkPreviewOptions': LinkPreviewOptions,
+    'richTextPlain': RichTextPlain,
+    'richTextBold': RichTextBold,
+    'richTextItalic': RichTextItalic,
+    'richTextUnderline': RichTextUnderline,
+    'richTextStrikethrough': RichTextStrikethrough,
+    'richTextFixed': RichTextFixed,
+    'richTextUrl': RichTextUrl,
+    'richTextEmailAddress': RichTextEmailAddress,
+    'richTextSubscript': RichTextSubscript,
+    'richTextSuperscript': RichTextSuperscript,
+    'richTextMarked': RichTextMarked,
+    'richTextPhoneNumber': RichTextPhoneNumber,
+    'richTextIcon': RichTextIcon,
+    'richTextReference': RichTextReference,
+    'richTextAnchor': RichTextAnchor,
+    'richTextAnchorLink': RichTextAnchorLink,
+    'richTexts': RichTexts,
+    'pageBlockCaption': PageBlockCaption,
+    'pageBlockListItem': PageBlockListItem,
+    'pageBlockHorizontalAlignmentLeft': PageBlockHorizontalAlignmentLeft,
+    'pageBlockHorizontalAlignmentCenter': PageBlockHorizontalAlignmentCenter,
+    'pageBlockHorizontalAlignmentRight': PageBlockHorizontalAlignmentRight,
+    'pageBlockVerticalAlignmentTop': PageBlockVerticalAlignmentTop,
+    'pageBlockVerticalAlignmentMiddle': PageBlockVerticalAlignmentMiddle,
+    'pageBlockVerticalAlignmentBottom': PageBlockVerticalAlignmentBottom,
+    'pageBlockTableCell': PageBlockTableCell,
+    'pageBlockRelatedArticle': PageBlockRelatedArticle,
+    'pageBlockTitle': PageBlockTitle,
+    'pageBlockSubtitle': PageBlockSubtitle,
+    'pageBlockAuthorDate': PageBlockAuthorDate,
+    'pageBlockHeader': PageBlockHeader,
+    'pageBlockSubheader': PageBlockSubheader,
+    'pageBlockKicker': PageBlockKicker,
+    'pageBlockParagraph': PageBlockParagraph,
+    'pageBlockPreformatted': PageBlockPreformatted,
+    'pageBlockFooter': PageBlockFooter,
+    'pageBlockDivider': PageBlockDivider,
+    'pageBlockAnchor': PageBlockAnchor,
+    'pageBlockList': PageBlockList,
+    'pageBlockBlockQuote': PageBlockBlockQuote,
+    'pageBlockPullQuote': PageBlockPullQuote,
+    'pageBlockAnimation': PageBlockAnimation,
+    'pageBlockAudio': PageBlockAudio,
+    'pageBlockPhoto': PageBlockPhoto,
+    'pageBlockVideo': PageBlockVideo,
+    'pageBlockVoiceNote': PageBlockVoiceNote,
+    'pageBlockCover': PageBlockCover,
+    'pageBlockEmbedded': PageBlockEmbedded,
+    'pageBlockEmbeddedPost': PageBlockEmbeddedPost,
+    'pageBlockCollage': PageBlockCollage,
+    'pageBlockSlideshow': PageBlockSlideshow,
+    'pageBlockChatLink': PageBlockChatLink,
+    'pageBlockTable': PageBlockTable,
+    'pageBlockDetails': PageBlockDetails,
+    'pageBlockRelatedArticles': PageBlockRelatedArticles,
+    'pageBlockMap': PageBlockMap,
+    'webPageInstantView': WebPageInstantView,
+    'webPage': WebPage,
+    'countryInfo': CountryInfo,
+    'countries': Countries,
+    'phoneNumberInfo': PhoneNumberInfo,
+    'bankCardActionOpenUrl': BankCardActionOpenUrl,
+    'bankCardInfo': BankCardInfo,
+    'address': Address,
+    'themeParameters': ThemeParameters,
+    'labeledPricePart': LabeledPricePart,
+    'invoice': Invoice,
+    'orderInfo': OrderInfo,
+    'shippingOption': ShippingOption,
+    'savedCredentials': SavedCredentials,
+    'inputCredentialsSaved': InputCredentialsSaved,
+    'inputCredentialsNew': InputCredentialsNew,
+    'inputCredentialsApplePay': InputCredentialsApplePay,
+    'inputCredentialsGooglePay': InputCredentialsGooglePay,
+    'paymentProviderSmartGlocal': PaymentProviderSmartGlocal,
+    'paymentProviderStripe': PaymentProviderStripe,
+    'paymentProviderOther': PaymentProviderOther,
+    'paymentOption': PaymentOption,
+    'paymentForm': PaymentForm,
+    'validatedOrderInfo': ValidatedOrderInfo,
+    'paymentResult': PaymentResult,
+    'paymentReceipt': PaymentReceipt,
+    'inputInvoiceMessage': InputInvoiceMessage,
+    'inputInvoiceName': InputInvoiceName,
+    'inputInvoiceTelegram': InputInvoiceTelegram,
+    'messageExtendedMediaPreview': MessageExtendedMediaPreview,
+    'messageExtendedMediaPhoto': MessageExtendedMediaPhoto,
+    'messageExtendedMediaVideo': MessageExtendedMediaVideo,
+    'messageExtendedMediaUnsupported': MessageExtendedMediaUnsupported,
+    'premiumGiveawayParameters': PremiumGiveawayParameters,
+    'datedFile': DatedFile,
+    'passportElementTypePersonalDetails': PassportElementTypePersonalDetails,
+    'passportElementTypePassport': PassportElementTypePassport,
+    'passportElementTypeDriverLicense': PassportElementTypeDriverLicense,
+    'passportElementTypeIdentityCard': PassportElementTypeIdentityCard,
+    'passportElementTypeInternalPassport': PassportElementTypeInternalPassport,
+    'passportElementTypeAddress': PassportElementTypeAddress,
+    'passportElementTypeUtilityBill': PassportElementTypeUtilityBill,
+    'passportElementTypeBankStatement': PassportElementTypeBankStatement,
+    'passportElementTypeRentalAgreement': PassportElementTypeRentalAgreement,
+    'passportElementTypePassportRegistration': PassportElementTypePassportRegistration,
+    'passportElementTypeTemporaryRegistration': PassportElementTypeTemporaryRegistration,
+    'passportElementTypePhoneNumber': PassportElementTypePhoneNumber,
+    'passportElementTypeEmailAddress': PassportElementTypeEmailAddress,
+    'date': Date,
+    'personalDetails': PersonalDetails,
+    'identityDocument': IdentityDocument,
+    'inputIdentityDocument': InputIdentityDocument,
+    'personalDocument': PersonalDocument,
+    'inputPersonalDocument': InputPersonalDocument,
+    'passportElementPersonalDetails': PassportElementPersonalDetails,
+    'passportElementPassport': PassportElementPassport,
+    'passportElementDriverLicense': PassportElementDriverLicense,
+    'passportElementIdentityCard': PassportElementIdentityCard,
+    'passportElementInternalPassport': PassportElementInternalPassport,
+    'passportElementAddress': PassportElementAddress,
+    'passportElementUtilityBill': PassportElementUtilityBill,
+    'passportElementBankStatement': PassportElementBankStatement,
+    'passportElementRentalAgreement': PassportElementRentalAgreement,
+    'passportElementPassportRegistration': PassportElementPassportRegistration,
+    'passportElementTemporaryRegistration': PassportElementTemporaryRegistration,
+    'passportElementPhoneNumber': PassportElementPhoneNumber,
+    'passportElementEmailAddress': PassportElementEmailAddress,
+    'inputPassportElementPersonalDetails': InputPassportElementPersonalDetails,
+    'inputPassportElementPassport': InputPassportElementPassport,
+    'inputPassportElementDriverLicense': InputPassportElementDriverLicense,
+    'inputPassportElementIdentityCard': InputPassportElementIdentityCard,
+    'inputPassportElementInternalPassport': InputPassportElementInternalPassport,
+    'inputPassportElementAddress': InputPassportElementAddress,
+    'inputPassportElementUtilityBill': InputPassportElementUtilityBill,
+    'inputPassportElementBankStatement': InputPassportElementBankStatement,
+    'inputPassportElementRentalAgreement': InputPassportElementRentalAgreement,
+    'inputPassportElementPassportRegistration': InputPassportElementPassportRegistration,
+    'inputPassportElementTemporaryRegistration': InputPassportElementTemporaryRegistration,
+    'inputPassportElementPhoneNumber': InputPassportElementPhoneNumber,
+    'inputPassportElementEmailAddress': InputPassportElementEmailAddress,
+    'passportElements': PassportElements,
+    'passportElementErrorSourceUnspecified': PassportElementErrorSourceUnspecified,
+    'passportElementErrorSourceDataField': PassportElementErrorSourceDataField,
+    'passportElementErrorSourceFrontSide': PassportElementErrorSourceFrontSide,
+    'passportElementErrorSourceReverseSide': PassportElementErrorSourceReverseSide,
+    'passportElementErrorSourceSelfie': PassportElementErrorSourceSelfie,
+    'passportElementErrorSourceTranslationFile': PassportElementErrorSourceTranslationFile,
+    'passportElementErrorSourceTranslationFiles': PassportElementErrorSourceTranslationFiles,
+    'passportElementErrorSourceFile': PassportElementErrorSourceFile,
+    'passportElementErrorSourceFiles': PassportElementErrorSourceFiles,
+    'passportElementError': PassportElementError,
+    'passportSuitableElement': PassportSuitableElement,
+    'passportRequiredElement': PassportRequiredElement,
+    'passportAuthorizationForm': PassportAuthorizationForm,
+    'passportElementsWithErrors': PassportElementsWithErrors,
+    'encryptedCredentials': EncryptedCredentials,
+    'encryptedPassportElement': EncryptedPassportElement,
+    'inputPassportElementErrorSourceUnspecified': InputPassportElementErrorSourceUnspecified,
+    'inputPassportElementErrorSourceDataField': InputPassportElementErrorSourceDataField,
+    'inputPassportElementErrorSourceFrontSide': InputPassportElementErrorSourceFrontSide,
+    'inputPassportElementErrorSourceReverseSide': InputPassportElementErrorSourceReverseSide,
+    'inputPassportElementErrorSourceSelfie': InputPassportElementErrorSourceSelfie,
+    'inputPassportElementErrorSourceTranslationFile': InputPassportElementErrorSourceTranslationFile,
+    'inputPassportElementErrorSourceTranslationFiles': InputPassportElementErrorSourceTranslationFiles,
+    'inputPassportElementErrorSourceFile': InputPassportElementErrorSourceFile,
+    'inputPassportElementErrorSourceFiles': InputPassportElementErrorSourceFiles,
+    'inputPassportElementError': InputPassportElementError,
+    'messageText': MessageText,
+    'messageAnimation': MessageAnimation,
+    'messageAudio': MessageAudio,
+    'messageDocument': MessageDocument,
+    'messagePhoto': MessagePhoto,
+    'messageSticker': MessageSticker,
+    'messageVideo': MessageVideo,
+    'messageVideoNote': MessageVideoNote,
+    'messageVoiceNote': MessageVoiceNote,
+    'messageExpiredPhoto': MessageExpiredPhoto,
+    'messageExpiredVideo': MessageExpiredVideo,
+    'messageExpiredVideoNote': MessageExpiredVideoNote,
+    'messageExpiredVoiceNote': MessageExpiredVoiceNote,
+    'messageLocation': MessageLocation,
+    'messageVenue': MessageVenue,
+    'messageContact': MessageContact,
+    'messageAnimatedEmoji': MessageAnimatedEmoji,
+    'messageDice': MessageDice,
+    'messageGame': MessageGame,
+    'messagePoll': MessagePoll,
+    'messageStory': MessageStory,
+    'messageInvoice': MessageInvoice,
+    'messageCall': MessageCall,
+    'messageVideoChatScheduled': MessageVideoChatScheduled,
+    'messageVideoChatStarted': MessageVideoChatStarted,
+    'messageVideoChatEnded': MessageVideoChatEnded,
+    'messageInviteVideoChatParticipants': MessageInviteVideoChatParticipants,
+    'messageBasicGroupChatCreate': MessageBasicGroupChatCreate,
+    'messageSupergroupChatCreate': MessageSupergroupChatCreate,
+    'messageChatChangeTitle': MessageChatChangeTitle,
+    'messageChatChangePhoto': MessageChatChangePhoto,
+    'messageChatDeletePhoto': MessageChatDeletePhoto,
+    'messageChatAddMembers': MessageChatAddMembers,
+    'messageChatJoinByLink': MessageChatJoinByLink,
+    'messageChatJoinByRequest': MessageChatJoinByRequest,
+    'messageChatDeleteMember': MessageChatDeleteMember,
+    'messageChatUpgradeTo': MessageChatUpgradeTo,
+    'messageChatUpgradeFrom': MessageChatUpgradeFrom,
+    'messagePinMessage': MessagePinMessage,
+    'messageScreenshotTaken': MessageScreenshotTaken,
+    'messageChatSetBackground': MessageChatSetBackground,
+    'messageChatSetTheme': MessageChatSetTheme,
+    'messageChatSetMessageAutoDeleteTime': MessageChatSetMessageAutoDeleteTime,
+    'messageChatBoost': MessageChatBoost,
+    'messageForumTopicCreated': MessageForumTopicCreated,
+    'messageForumTopicEdited': MessageForumTopicEdited,
+    'messageForumTopicIsClosedToggled': MessageForumTopicIsClosedToggled,
+    'messageForumTopicIsHiddenToggled': MessageForumTopicIsHiddenToggled,
+    'messageSuggestProfilePhoto': MessageSuggestProfilePhoto,
+    'messageCustomServiceAction': MessageCustomServiceAction,
+    'messageGameScore': MessageGameScore,
+    'messagePaymentSuccessful': MessagePaymentSuccessful,
+    'messagePaymentSuccessfulBot': MessagePaymentSuccessfulBot,
+    'messageGiftedPremium': MessageGiftedPremium,
+    'messagePremiumGiftCode': MessagePremiumGiftCode,
+    'messagePremiumGiveawayCreated': MessagePremiumGiveawayCreated,
+    'messagePremiumGiveaway': MessagePremiumGiveaway,
+    'messagePremiumGiveawayCompleted': MessagePremiumGiveawayCompleted,
+    'messagePremiumGiveawayWinners': MessagePremiumGiveawayWinners,
+    'messageContactRegistered': MessageContactRegistered,
+    'messageUsersShared': MessageUsersShared,
+    'messageChatShared': MessageChatShared,
+    'messageBotWriteAccessAllowed': MessageBotWriteAccessAllowed,
+    'messageWebAppDataSent': MessageWebAppDataSent,
+    'messageWebAppDataReceived': MessageWebAppDataReceived,
+    'messagePassportDataSent': MessagePassportDataSent,
+    'messagePassportDataReceived': MessagePassportDataReceived,
+    'messageProximityAlertTriggered': MessageProximityAlertTriggered,
+    'messageUnsupported': MessageUnsupported,
+    'textEntityTypeMention': TextEntityTypeMention,
+    'textEntityTypeHashtag': TextEntityTypeHashtag,
+    'textEntityTypeCashtag': TextEntityTypeCashtag,
+    'textEntityTypeBotCommand': TextEntityTypeBotCommand,
+    'textEntityTypeUrl': TextEntityTypeUrl,
+    'textEntityTypeEmailAddress': TextEntityTypeEmailAddress,
+    'textEntityTypePhoneNumber': TextEntityTypePhoneNumber,
+    'textEntityTypeBankCardNumber': TextEntityTypeBankCardNumber,
+    'textEntityTypeBold': TextEntityTypeBold,
+    'textEntityTypeItalic': TextEntityTypeItalic,
+    'textEntityTypeUnderline': TextEntityTypeUnderline,
+    'textEntityTypeStrikethrough': TextEntityTypeStrikethrough,
+    'textEntityTypeSpoiler': TextEntityTypeSpoiler,
+    'textEntityTypeCode': TextEntityTypeCode,
+    'textEntityTypePre': TextEntityTypePre,
+    'textEntityTypePreCode': TextEntityTypePreCode,
+    'textEntityTypeBlockQuote': TextEntityTypeBlockQuote,
+    'textEntityTypeTextUrl': TextEntityTypeTextUrl,
+    'textEntityTypeMentionName': TextEntityTypeMentionName,
+    'textEntityTypeCustomEmoji': TextEntityTypeCustomEmoji,
+    'textEntityTypeMediaTimestamp': TextEntityTypeMediaTimestamp,
+    'inputThumbnail': InputThumbnail,
+    'messageSchedulingStateSendAtDate': MessageSchedulingStateSendAtDate,
+    'messageSchedulingStateSendWhenOnline': MessageSchedulingStateSendWhenOnline,
+    'messageSelfDestructTypeTimer': MessageSelfDestructTypeTimer,
+    'messageSelfDestructTypeImmediately': MessageSelfDestructTypeImmediately,
+    'messageSendOptions': MessageSendOptions,
+    'messageCopyOptions': MessageCopyOptions,
+    'inputMessageText': InputMessageText,
+    'inputMessageAnimation': InputMessageAnimation,
+    'inputMessageAudio': InputMessageAudio,
+    'inputMessageDocument': InputMessageDocument,
+    'inputMessagePhoto': InputMessagePhoto,
+    'inputMessageSticker': InputMessageSticker,
+    'inputMessageVideo': InputMessageVideo,
+    'inputMessageVideoNote': InputMessageVideoNote,
+    'inputMessageVoiceNote': InputMessageVoiceNote,
+    'inputMessageLocation': InputMessageLocation,
+    'inputMessageVenue': InputMessageVenue,
+    'inputMessageContact': InputMessageContact,
+    'inputMessageDice': InputMessageDice,
+    'inputMessageGame': InputMessageGame,
+    'inputMessageInvoice': InputMessageInvoice,
+    'inputMessagePoll': InputMessagePoll,
+    'inputMessageStory': InputMessageStory,
+    'inputMessageForwarded': InputMessageForwarded,
+    'searchMessagesFilterEmpty': SearchMessagesFilterEmpty,
+    'searchMessagesFilterAnimation': SearchMessagesFilterAnimation,
+    'searchMessagesFilterAudio': SearchMessagesFilterAudio,
+    'searchMessagesFilterDocument': SearchMessagesFilterDocument,
+    'searchMessagesFilterPhoto': SearchMessagesFilterPhoto,
+    'searchMessagesFilterVideo': SearchMessagesFilterVideo,
+    'searchMessagesFilterVoiceNote': SearchMessagesFilterVoiceNote,
+    'searchMessagesFilterPhotoAndVideo': SearchMessagesFilterPhotoAndVideo,
+    'searchMessagesFilterUrl': SearchMessagesFilterUrl,
+    'searchMessagesFilterChatPhoto': SearchMessagesFilterChatPhoto,
+    'searchMessagesFilterVideoNote': SearchMessagesFilterVideoNote,
+    'searchMessagesFilterVoiceAndVideoNote': SearchMessagesFilterVoiceAndVideoNote,
+    'searchMessagesFilterMention': SearchMessagesFilterMention,
+    'searchMessagesFilterUnreadMention': SearchMessagesFilterUnreadMention,
+    'searchMessagesFilterUnreadReaction': SearchMessagesFilterUnreadReaction,
+    'searchMessagesFilterFailedToSend': SearchMessagesFilterFailedToSend,
+    'searchMessagesFilterPinned': SearchMessagesFilterPinned,
+    'chatActionTyping': ChatActionTyping,
+    'chatActionRecordingVideo': ChatActionRecordingVideo,
+    'chatActionUploadingVideo': ChatActionUploadingVideo,
+    'chatActionRecordingVoiceNote': ChatActionRecordingVoiceNote,
+    'chatActionUploadingVoiceNote': ChatActionUploadingVoiceNote,
+    'chatActionUploadingPhoto': ChatActionUploadingPhoto,
+    'chatActionUploadingDocument': ChatActionUploadingDocument,
+    'chatActionChoosingSticker': ChatActionChoosingSticker,
+    'chatActionChoosingLocation': ChatActionChoosingLocation,
+    'chatActionChoosingContact': ChatActionChoosingContact,
+    'chatActionStartPlayingGame': ChatActionStartPlayingGame,
+    'chatActionRecordingVideoNote': ChatActionRecordingVideoNote,
+    'chatActionUploadingVideoNote': ChatActionUploadingVideoNote,
+    'chatActionWatchingAnimations': ChatActionWatchingAnimations,
+    'chatActionCancel': ChatActionCancel,
+    'userStatusEmpty': UserStatusEmpty,
+    'userStatusOnline': UserStatusOnline,
+    'userStatusOffline': UserStatusOffline,
+    'userStatusRecently': UserStatusRecently,
+    'userStatusLastWeek': UserStatusLastWeek,
+    'userStatusLastMonth': UserStatusLastMonth,
+    'emojiKeyword': EmojiKeyword,
+    'emojiKeywords': EmojiKeywords,
+    'stickers': Stickers,
+    'emojis': Emojis,
+    'stickerSet': StickerSet,
+    'stickerSetInfo': StickerSetInfo,
+    'stickerSets': StickerSets,
+    'trendingStickerSets': TrendingStickerSets,
+    'emojiCategory': EmojiCategory,
+    'emojiCategories': EmojiCategories,
+    'emojiCategoryTypeDefault': EmojiCategoryTypeDefault,
+    'emojiCategoryTypeEmojiStatus': EmojiCategoryTypeEmojiStatus,
+    'emojiCategoryTypeChatPhoto': EmojiCategoryTypeChatPhoto,
+    'storyAreaPosition': StoryAreaPosition,
+    'storyAreaTypeLocation': StoryAreaTypeLocation,
+    'storyAreaTypeVenue': StoryAreaTypeVenue,
+    'storyAreaTypeSuggestedReaction': StoryAreaTypeSuggestedReaction,
+    'storyAreaTypeMessage': StoryAreaTypeMessage,
+    'storyArea': StoryArea,
+    'inputStoryAreaTypeLocation': InputStoryAreaTypeLocation,
+    'inputStoryAreaTypeFoundVenue': InputStoryAreaTypeFoundVenue,
+    'inputStoryAreaTypePreviousVenue': InputStoryAreaTypePreviousVenue,
+    'inputStoryAreaTypeSuggestedReaction': InputStoryAreaTypeSuggestedReaction,
+    'inputStoryAreaTypeMessage': InputStoryAreaTypeMessage,
+    'inputStoryArea': InputStoryArea,
+    'inputStoryAreas': InputStoryAreas,
+    'storyVideo': StoryVideo,
+    'storyContentPhoto': StoryContentPhoto,
+    'storyContentVideo': StoryContentVideo,
+    'storyContentUnsupported': StoryContentUnsupported,
+    'inputStoryContentPhoto': InputStoryContentPhoto,
+    'inputStoryContentVideo': InputStoryContentVideo,
+    'storyListMain': StoryListMain,
+    'storyListArchive': StoryListArchive,
+    'storyOriginPublicStory': StoryOriginPublicStory,
+    'storyOriginHiddenUser': StoryOriginHiddenUser,
+    'storyRepostInfo': StoryRepostInfo,
+    'storyInteractionInfo': StoryInteractionInfo,
+    'story': Story,
+    'stories': Stories,
+    'storyFullId': StoryFullId,
+    'storyInfo': StoryInfo,
+    'chatActiveStories': ChatActiveStories,
+    'storyInteractionTypeView': StoryInteractionTypeView,
+    'storyInteractionTypeForward': StoryInteractionTypeForward,
+    'storyInteractionTypeRepost': StoryInteractionTypeRepost,
+    'storyInteraction': StoryInteraction,
+    'storyInteractions': StoryInteractions,
+    'quickReplyMessage': QuickReplyMessage,
+    'quickReplyShortcut': QuickReplyShortcut,
+    'publicForwardMessage': PublicForwardMessage,
+    'publicForwardStory': PublicForwardStory,
+    'publicForwards': PublicForwards,
+    'chatBoostLevelFeatures': ChatBoostLevelFeatures,
+    'chatBoostFeatures': ChatBoostFeatures,
+    'chatBoostSourceGiftCode': ChatBoostSourceGiftCode,
+    'chatBoostSourceGiveaway': ChatBoostSourceGiveaway,
+    'chatBoostSourcePremium': ChatBoostSourcePremium,
+    'prepaidPremiumGiveaway': PrepaidPremiumGiveaway,
+    'chatBoostStatus': ChatBoostStatus,
+    'chatBoost': ChatBoost,
+    'foundChatBoosts': FoundChatBoosts,
+    'chatBoostSlot': ChatBoostSlot,
+    'chatBoostSlots': ChatBoostSlots,
+    'callDiscardReasonEmpty': CallDiscardReasonEmpty,
+    'callDiscardReasonMissed': CallDiscardReasonMissed,
+    'callDiscardReasonDeclined': CallDiscardReasonDeclined,
+    'callDiscardReasonDisconnected': CallDiscardReasonDisconnected,
+    'callDiscardReasonHungUp': CallDiscardReasonHungUp,
+    'callProtocol': CallProtocol,
+    'callServerTypeTelegramReflector': CallServerTypeTelegramReflector,
+    'callServerTypeWebrtc': CallServerTypeWebrtc,
+    'callServer': CallServer,
+    'callId': CallId,
+    'groupCallId': GroupCallId,
+    'callStatePending': CallStatePending,
+    'callStateExchangingKeys': CallStateExchangingKeys,
+    'callStateReady': CallStateReady,
+    'callStateHangingUp': CallStateHangingUp,
+    'callStateDiscarded': CallStateDiscarded,
+    'callStateError': CallStateError,
+    'groupCallVideoQualityThumbnail': GroupCallVideoQualityThumbnail,
+    'groupCallVideoQualityMedium': GroupCallVideoQualityMedium,
+    'groupCallVideoQualityFull': GroupCallVideoQualityFull,
+    'groupCallStream': GroupCallStream,
+    'groupCallStreams': GroupCallStreams,
+    'rtmpUrl': RtmpUrl,
+    'groupCallRecentSpeaker': GroupCallRecentSpeaker,
+    'groupCall': GroupCall,
+    'groupCallVideoSourceGroup': GroupCallVideoSourceGroup,
+    'groupCallParticipantVideoInfo': GroupCallParticipantVideoInfo,
+    'groupCallParticipant': GroupCallParticipant,
+    'callProblemEcho': CallProblemEcho,
+    'callProblemNoise': CallProblemNoise,
+    'callProblemInterruptions': CallProblemInterruptions,
+    'callProblemDistortedSpeech': CallProblemDistortedSpeech,
+    'callProblemSilentLocal': CallProblemSilentLocal,
+    'callProblemSilentRemote': CallProblemSilentRemote,
+    'callProblemDropped': CallProblemDropped,
+    'callProblemDistortedVideo': CallProblemDistortedVideo,
+    'callProblemPixelatedVideo': CallProblemPixelatedVideo,
+    'call': Call,
+    'firebaseAuthenticationSettingsAndroid': FirebaseAuthenticationSettingsAndroid,
+    'firebaseAuthenticationSettingsIos': FirebaseAuthenticationSettingsIos,
+    'phoneNumberAuthenticationSettings': PhoneNumberAuthenticationSettings,
+    'addedReaction': AddedReaction,
+    'addedReactions': AddedReactions,
+    'availableReaction': AvailableReaction,
+    'availableReactions': AvailableReactions,
+    'emojiReaction': EmojiReaction,
+    'reactionUnavailabilityReasonAnonymousAdministrator': ReactionUnavailabilityReasonAnonymousAdministrator,
+    'reactionUnavailabilityReasonGuest': ReactionUnavailabilityReasonGuest,
+    'animations': Animations,
+    'diceStickersRegular': DiceStickersRegular,
+    'diceStickersSlotMachine': DiceStickersSlotMachine,
+    'importedContacts': ImportedContacts,
+    'speechRecognitionResultPending': SpeechRecognitionResultPending,
+    'speechRecognitionResultText': SpeechRecognitionResultText,
+    'speechRecognitionResultError': SpeechRecognitionResultError,
+    'attachmentMenuBotColor': AttachmentMenuBotColor,
+    'attachmentMenuBot': AttachmentMenuBot,
+    'sentWebAppMessage': SentWebAppMessage,
+    'botWriteAccessAllowReasonConnectedWebsite': BotWriteAccessAllowReasonConnectedWebsite,
+    'botWriteAccessAllowReasonAddedToAttachmentMenu': BotWriteAccessAllowReasonAddedToAttachmentMenu,
+    'botWriteAccessAllowReasonLaunchedWebApp': BotWriteAccessAllowReasonLaunchedWebApp,
+    'botWriteAccessAllowReasonAcceptedRequest': BotWriteAccessAllowReasonAcceptedRequest,
+    'httpUrl': HttpUrl,
+    'userLink': UserLink,
+    'inputInlineQueryResultAnimation': InputInlineQueryResultAnimation,
+    'inputInlineQueryResultArticle': InputInlineQueryResultArticle,
+    'inputInlineQueryResultAudio': InputInlineQueryResultAudio,
+    'inputInlineQueryResultContact': InputInlineQueryResultContact,
+    'inputInlineQueryResultDocument': InputInlineQueryResultDocument,
+    'inputInlineQueryResultGame': InputInlineQueryResultGame,
+    'inputInlineQueryResultLocation': InputInlineQueryResultLocation,
+    'inputInlineQueryResultPhoto': InputInlineQueryResultPhoto,
+    'inputInlineQueryResultSticker': InputInlineQueryResultSticker,
+    'inputInlineQueryResultVenue': InputInlineQueryResultVenue,
+    'inputInlineQueryResultVideo': InputInlineQueryResultVideo,
+    'inputInlineQueryResultVoiceNote': InputInlineQueryResultVoiceNote,
+    'inlineQueryResultArticle': InlineQueryResultArticle,
+    'inlineQueryResultContact': InlineQueryResultContact,
+    'inlineQueryResultLocation': InlineQueryResultLocation,
+    'inlineQueryResultVenue': InlineQueryResultVenue,
+    'inlineQueryResultGame': InlineQueryResultGame,
+    'inlineQueryResultAnimation': InlineQueryResultAnimation,
+    'inlineQueryResultAudio': InlineQueryResultAudio,
+    'inlineQueryResultDocument': InlineQueryResultDocument,
+    'inlineQueryResultPhoto': InlineQueryResultPhoto,
+    'inlineQueryResultSticker': InlineQueryResultSticker,
+    'inlineQueryResultVideo': InlineQueryResultVideo,
+    'inlineQueryResultVoiceNote': InlineQueryResultVoiceNote,
+    'inlineQueryResultsButtonTypeStartBot': InlineQueryResultsButtonTypeStartBot,
+    'inlineQueryResultsButtonTypeWebApp': InlineQueryResultsButtonTypeWebApp,
+    'inlineQueryResultsButton': InlineQueryResultsButton,
+    'inlineQueryResults': InlineQueryResults,
+    'callbackQueryPayloadData': CallbackQueryPayloadData,
+    'callbackQueryPayloadDataWithPassword': CallbackQueryPayloadDataWithPassword,
+    'callbackQueryPayloadGame': CallbackQueryPayloadGame,
+    'callbackQueryAnswer': CallbackQueryAnswer,
+    'customRequestResult': CustomRequestResult,
+    'gameHighScore': GameHighScore,
+    'gameHighScores': GameHighScores,
+    'chatEventMessageEdited': ChatEventMessageEdited,
+    'chatEventMessageDeleted': ChatEventMessageDeleted,
+    'chatEventMessagePinned': ChatEventMessagePinned,
+    'chatEventMessageUnpinned': ChatEventMessageUnpinned,
+    'chatEventPollStopped': ChatEventPollStopped,
+    'chatEventMemberJoined': ChatEventMemberJoined,
+    'chatEventMemberJoinedByInviteLink': ChatEventMemberJoinedByInviteLink,
+    'chatEventMemberJoinedByRequest': ChatEventMemberJoinedByRequest,
+    'chatEventMemberInvited': ChatEventMemberInvited,
+    'chatEventMemberLeft': ChatEventMemberLeft,
+    'chatEventMemberPromoted': ChatEventMemberPromoted,
+    'chatEventMemberRestricted': ChatEventMemberRestricted,
+    'chatEventAvailableReactionsChanged': ChatEventAvailableReactionsChanged,
+    'chatEventBackgroundChanged': ChatEventBackgroundChanged,
+    'chatEventDescriptionChanged': ChatEventDescriptionChanged,
+    'chatEventEmojiStatusChanged': ChatEventEmojiStatusChanged,
+    'chatEventLinkedChatChanged': ChatEventLinkedChatChanged,
+    'chatEventLocationChanged': ChatEventLocationChanged,
+    'chatEventMessageAutoDeleteTimeChanged': ChatEventMessageAutoDeleteTimeChanged,
+    'chatEventPermissionsChanged': ChatEventPermissionsChanged,
+    'chatEventPhotoChanged': ChatEventPhotoChanged,
+    'chatEventSlowModeDelayChanged': ChatEventSlowModeDelayChanged,
+    'chatEventStickerSetChanged': ChatEventStickerSetChanged,
+    'chatEventCustomEmojiStickerSetChanged': ChatEventCustomEmojiStickerSetChanged,
+    'chatEventTitleChanged': ChatEventTitleChanged,
+    'chatEventUsernameChanged': ChatEventUsernameChanged,
+    'chatEventActiveUsernamesChanged': ChatEventActiveUsernamesChanged,
+    'chatEventAccentColorChanged': ChatEventAccentColorChanged,
+    'chatEventProfileAccentColorChanged': ChatEventProfileAccentColorChanged,
+    'chatEventHasProtectedContentToggled': ChatEventHasProtectedContentToggled,
+    'chatEventInvitesToggled': ChatEventInvitesToggled,
+    'chatEventIsAllHistoryAvailableToggled': ChatEventIsAllHistoryAvailableToggled,
+    'chatEventHasAggressiveAntiSpamEnabledToggled': ChatEventHasAggressiveAntiSpamEnabledToggled,
+    'chatEventSignMessagesToggled': ChatEventSignMessagesToggled,
+    'chatEventInviteLinkEdited': ChatEventInviteLinkEdited,
+    'chatEventInviteLinkRevoked': ChatEventInviteLinkRevoked,
+    'chatEventInviteLinkDeleted': ChatEventInviteLinkDeleted,
+    'chatEventVideoChatCreated': ChatEventVideoChatCreated,
+    'chatEventVideoChatEnded': ChatEventVideoChatEnded,
+    'chatEventVideoChatMuteNewParticipantsToggled': ChatEventVideoChatMuteNewParticipantsToggled,
+    'chatEventVideoChatParticipantIsMutedToggled': ChatEventVideoChatParticipantIsMutedToggled,
+    'chatEventVideoChatParticipantVolumeLevelChanged': ChatEventVideoChatParticipantVolumeLevelChanged,
+    'chatEventIsForumToggled': ChatEventIsForumToggled,
+    'chatEventForumTopicCreated': ChatEventForumTopicCreated,
+    'chatEventForumTopicEdited': ChatEventForumTopicEdited,
+    'chatEventForumTopicToggleIsClosed': ChatEventForumTopicToggleIsClosed,
+    'chatEventForumTopicToggleIsHidden': ChatEventForumTopicToggleIsHidden,
+    'chatEventForumTopicDeleted': ChatEventForumTopicDeleted,
+    'chatEventForumTopicPinned': ChatEventForumTopicPinned,
+    'chatEvent': ChatEvent,
+    'chatEvents': ChatEvents,
+    'chatEventLogFilters': ChatEventLogFilters,
+    'languagePackStringValueOrdinary': LanguagePackStringValueOrdinary,
+    'languagePackStringValuePluralized': LanguagePackStringValuePluralized,
+    'languagePackStringValueDeleted': LanguagePackStringValueDeleted,
+    'languagePackString': LanguagePackString,
+    'languagePackStrings': LanguagePackStrings,
+    'languagePackInfo': LanguagePackInfo,
+    'localizationTargetInfo': LocalizationTargetInfo,
+    'premiumLimitTypeSupergroupCount': PremiumLimitTypeSupergroupCount,
+    'premiumLimitTypePinnedChatCount': PremiumLimitTypePinnedChatCount,
+    'premiumLimitTypeCreatedPublicChatCount': PremiumLimitTypeCreatedPublicChatCount,
+    'premiumLimitTypeSavedAnimationCount': PremiumLimitTypeSavedAnimationCount,
+    'premiumLimitTypeFavoriteStickerCount': PremiumLimitTypeFavoriteStickerCount,
+    'premiumLimitTypeChatFolderCount': PremiumLimitTypeChatFolderCount,
+    'premiumLimitTypeChatFolderChosenChatCount': PremiumLimitTypeChatFolderChosenChatCount,
+    'premiumLimitTypePinnedArchivedChatCount': PremiumLimitTypePinnedArchivedChatCount,
+    'premiumLimitTypePinnedSavedMessagesTopicCount': PremiumLimitTypePinnedSavedMessagesTopicCount,
+    'premiumLimitTypeCaptionLength': PremiumLimitTypeCaptionLength,
+    'premiumLimitTypeBioLength': PremiumLimitTypeBioLength,
+    'premiumLimitTypeChatFolderInviteLinkCount': PremiumLimitTypeChatFolderInviteLinkCount,
+    'premiumLimitTypeShareableChatFolderCount': PremiumLimitTypeShareableChatFolderCount,
+    'premiumLimitTypeActiveStoryCount': PremiumLimitTypeActiveStoryCount,
+    'premiumLimitTypeWeeklySentStoryCount': PremiumLimitTypeWeeklySentStoryCount,
+    'premiumLimitTypeMonthlySentStoryCount': PremiumLimitTypeMonthlySentStoryCount,
+    'premiumLimitTypeStoryCaptionLength': PremiumLimitTypeStoryCaptionLength,
+    'premiumLimitTypeStorySuggestedReactionAreaCount': PremiumLimitTypeStorySuggestedReactionAreaCount,
+    'premiumLimitTypeSimilarChatCount': PremiumLimitTypeSimilarChatCount,
+    'premiumFeatureIncreasedLimits': PremiumFeatureIncreasedLimits,
+    'premiumFeatureIncreasedUploadFileSize': PremiumFeatureIncreasedUploadFileSize,
+    'premiumFeatureImprovedDownloadSpeed': PremiumFeatureImprovedDownloadSpeed,
+    'premiumFeatureVoiceRecognition': PremiumFeatureVoiceRecognition,
+    'premiumFeatureDisabledAds': PremiumFeatureDisabledAds,
+    'premiumFeatureUniqueReactions': PremiumFeatureUniqueReactions,
+    'premiumFeatureUniqueStickers': PremiumFeatureUniqueStickers,
+    'premiumFeatureCustomEmoji': PremiumFeatureCustomEmoji,
+    'premiumFeatureAdvancedChatManagement': PremiumFeatureAdvancedChatManagement,
+    'premiumFeatureProfileBadge': PremiumFeatureProfileBadge,
+    'premiumFeatureEmojiStatus': PremiumFeatureEmojiStatus,
+    'premiumFeatureAnimatedProfilePhoto': PremiumFeatureAnimatedProfilePhoto,
+    'premiumFeatureForumTopicIcon': PremiumFeatureForumTopicIcon,
+    'premiumFeatureAppIcons': PremiumFeatureAppIcons,
+    'premiumFeatureRealTimeChatTranslation': PremiumFeatureRealTimeChatTranslation,
+    'premiumFeatureUpgradedStories': PremiumFeatureUpgradedStories,
+    'premiumFeatureChatBoost': PremiumFeatureChatBoost,
+    'premiumFeatureAccentColor': PremiumFeatureAccentColor,
+    'premiumFeatureBackgroundForBoth': PremiumFeatureBackgroundForBoth,
+    'premiumFeatureSavedMessagesTags': PremiumFeatureSavedMessagesTags,
+    'premiumFeatureMessagePrivacy': PremiumFeatureMessagePrivacy,
+    'premiumFeatureLastSeenTimes': PremiumFeatureLastSeenTimes,
+    'premiumStoryFeaturePriorityOrder': PremiumStoryFeaturePriorityOrder,
+    'premiumStoryFeatureStealthMode': PremiumStoryFeatureStealthMode,
+    'premiumStoryFeaturePermanentViewsHistory': PremiumStoryFeaturePermanentViewsHistory,
+    'premiumStoryFeatureCustomExpirationDuration': PremiumStoryFeatureCustomExpirationDuration,
+    'premiumStoryFeatureSaveStories': PremiumStoryFeatureSaveStories,
+    'premiumStoryFeatureLinksAndFormatting': PremiumStoryFeatureLinksAndFormatting,
+    'premiumStoryFeatureVideoQuality': PremiumStoryFeatureVideoQuality,
+    'premiumLimit': PremiumLimit,
+    'premiumFeatures': PremiumFeatures,
+    'premiumSourceLimitExceeded': PremiumSourceLimitExceeded,
+    'premiumSourceFeature': PremiumSourceFeature,
+    'premiumSourceStoryFeature': PremiumSourceStoryFeature,
+    'premiumSourceLink': PremiumSourceLink,
+    'premiumSourceSettings': PremiumSourceSettings,
+    'premiumFeaturePromotionAnimation': PremiumFeaturePromotionAnimation,
+    'premiumState': PremiumState,
+    'storePaymentPurposePremiumSubscription': StorePaymentPurposePremiumSubscription,
+    'storePaymentPurposeGiftedPremium': StorePaymentPurposeGiftedPremium,
+    'storePaymentPurposePremiumGiftCodes': StorePaymentPurposePremiumGiftCodes,
+    'storePaymentPurposePremiumGiveaway': StorePaymentPurposePremiumGiveaway,
+    'telegramPaymentPurposePremiumGiftCodes': TelegramPaymentPurposePremiumGiftCodes,
+    'telegramPaymentPurposePremiumGiveaway': TelegramPaymentPurposePremiumGiveaway,
+    'deviceTokenFirebaseCloudMessaging': DeviceTokenFirebaseCloudMessaging,
+    'deviceTokenApplePush': DeviceTokenApplePush,
+    'deviceTokenApplePushVoIP': DeviceTokenApplePushVoIP,
+    'deviceTokenWindowsPush': DeviceTokenWindowsPush,
+    'deviceTokenMicrosoftPush': DeviceTokenMicrosoftPush,
+    'deviceTokenMicrosoftPushVoIP': DeviceTokenMicrosoftPushVoIP,
+    'deviceTokenWebPush': DeviceTokenWebPush,
+    'deviceTokenSimplePush': DeviceTokenSimplePush,
+    'deviceTokenUbuntuPush': DeviceTokenUbuntuPush,
+    'deviceTokenBlackBerryPush': DeviceTokenBlackBerryPush,
+    'deviceTokenTizenPush': DeviceTokenTizenPush,
+    'deviceTokenHuaweiPush': DeviceTokenHuaweiPush,
+    'pushReceiverId': PushReceiverId,
+    'backgroundFillSolid': BackgroundFillSolid,
+    'backgroundFillGradient': BackgroundFillGradient,
+    'backgroundFillFreeformGradient': BackgroundFillFreeformGradient,
+    'backgroundTypeWallpaper': BackgroundTypeWallpaper,
+    'backgroundTypePattern': BackgroundTypePattern,
+    'backgroundTypeFill': BackgroundTypeFill,
+    'backgroundTypeChatTheme': BackgroundTypeChatTheme,
+    'inputBackgroundLocal': InputBackgroundLocal,
+    'inputBackgroundRemote': InputBackgroundRemote,
+    'inputBackgroundPrevious': InputBackgroundPrevious,
+    'themeSettings': ThemeSettings,
+    'chatTheme': ChatTheme,
+    'timeZone': TimeZone,
+    'timeZones': TimeZones,
+    'hashtags': Hashtags,
+    'canSendStoryResultOk': CanSendStoryResultOk,
+    'canSendStoryResultPremiumNeeded': CanSendStoryResultPremiumNeeded,
+    'canSendStoryResultBoostNeeded': CanSendStoryResultBoostNeeded,
+    'canSendStoryResultActiveStoryLimitExceeded': CanSendStoryResultActiveStoryLimitExceeded,
+    'canSendStoryResultWeeklyLimitExceeded': CanSendStoryResultWeeklyLimitExceeded,
+    'canSendStoryResultMonthlyLimitExceeded': CanSendStoryResultMonthlyLimitExceeded,
+    'canTransferOwnershipResultOk': CanTransferOwnershipResultOk,
+    'canTransferOwnershipResultPasswordNeeded': CanTransferOwnershipResultPasswordNeeded,
+    'canTransferOwnershipResultPasswordTooFresh': CanTransferOwnershipResultPasswordTooFresh,
+    'canTransferOwnershipResultSessionTooFresh': CanTransferOwnershipResultSessionTooFresh,
+    'checkChatUsernameResultOk': CheckChatUsernameResultOk,
+    'checkChatUsernameResultUsernameInvalid': CheckChatUsernameResultUsernameInvalid,
+    'checkChatUsernameResultUsernameOccupied': CheckChatUsernameResultUsernameOccupied,
+    'checkChatUsernameResultUsernamePurchasable': CheckChatUsernameResultUsernamePurchasable,
+    'checkChatUsernameResultPublicChatsTooMany': CheckChatUsernameResultPublicChatsTooMany,
+    'checkChatUsernameResultPublicGroupsUnavailable': CheckChatUsernameResultPublicGroupsUnavailable,
+    'checkStickerSetNameResultOk': CheckStickerSetNameResultOk,
+    'checkStickerSetNameResultNameInvalid': CheckStickerSetNameResultNameInvalid,
+    'checkStickerSetNameResultNameOccupied': CheckStickerSetNameResultNameOccupied,
+    'resetPasswordResultOk': ResetPasswordResultOk,
+    'resetPasswordResultPending': ResetPasswordResultPending,
+    'resetPasswordResultDeclined': ResetPasswordResultDeclined,
+    'messageFileTypePrivate': MessageFileTypePrivate,
+    'messageFileTypeGroup': MessageFileTypeGroup,
+    'messageFileTypeUnknown': MessageFileTypeUnknown,
+    'pushMessageContentHidden': PushMessageContentHidden,
+    'pushMessageContentAnimation': PushMessageContentAnimation,
+    'pushMessageContentAudio': PushMessageContentAudio,
+    'pushMessageContentContact': PushMessageContentContact,
+    'pushMessageContentContactRegistered': PushMessageContentContactRegistered,
+    'pushMessageContentDocument': PushMessageContentDocument,
+    'pushMessageContentGame': PushMessageContentGame,
+    'pushMessageContentGameScore': PushMessageContentGameScore,
+    'pushMessageContentInvoice': PushMessageContentInvoice,
+    'pushMessageContentLocation': PushMessageContentLocation,
+    'pushMessageContentPhoto': PushMessageContentPhoto,
+    'pushMessageContentPoll': PushMessageContentPoll,
+    'pushMessageContentPremiumGiftCode': PushMessageContentPremiumGiftCode,
+    'pushMessageContentPremiumGiveaway': PushMessageContentPremiumGiveaway,
+    'pushMessageContentScreenshotTaken': PushMessageContentScreenshotTaken,
+    'pushMessageContentSticker': PushMessageContentSticker,
+    'pushMessageContentStory': PushMessageContentStory,
+    'pushMessageContentText': PushMessageContentText,
+    'pushMessageContentVideo': PushMessageContentVideo,
+    'pushMessageContentVideoNote': PushMessageContentVideoNote,
+    'pushMessageContentVoiceNote': PushMessageContentVoiceNote,
+    'pushMessageContentBasicGroupChatCreate': PushMessageContentBasicGroupChatCreate,
+    'pushMessageContentChatAddMembers': PushMessageContentChatAddMembers,
+    'pushMessageContentChatChangePhoto': PushMessageContentChatChangePhoto,
+    'pushMessageContentChatChangeTitle': PushMessageContentChatChangeTitle,
+    'pushMessageContentChatSetBackground': PushMessageContentChatSetBackground,
+    'pushMessageContentChatSetTheme': PushMessageContentChatSetTheme,
+    'pushMessageContentChatDeleteMember': PushMessageContentChatDeleteMember,
+    'pushMessageContentChatJoinByLink': PushMessageContentChatJoinByLink,
+    'pushMessageContentChatJoinByRequest': PushMessageContentChatJoinByRequest,
+    'pushMessageContentRecurringPayment': PushMessageContentRecurringPayment,
+    'pushMessageContentSuggestProfilePhoto': PushMessageContentSuggestProfilePhoto,
+    'pushMessageContentMessageForwards': PushMessageContentMessageForwards,
+    'pushMessageContentMediaAlbum': PushMessageContentMediaAlbum,
+    'notificationTypeNewMessage': NotificationTypeNewMessage,
+    'notificationTypeNewSecretChat': NotificationTypeNewSecretChat,
+    'notificationTypeNewCall': NotificationTypeNewCall,
+    'notificationTypeNewPushMessage': NotificationTypeNewPushMessage,
+    'notificationGroupTypeMessages': NotificationGroupTypeMessages,
+    'notificationGroupTypeMentions': NotificationGroupTypeMentions,
+    'notificationGroupTypeSecretChat': NotificationGroupTypeSecretChat,
+    'notificationGroupTypeCalls': NotificationGroupTypeCalls,
+    'notificationSound': NotificationSound,
+    'notificationSounds': NotificationSounds,
+    'notification': Notification,
+    'notificationGroup': NotificationGroup,
+    'optionValueBoolean': OptionValueBoolean,
+    'optionValueEmpty': OptionValueEmpty,
+    'optionValueInteger': OptionValueInteger,
+    'optionValueString': OptionValueString,
+    'jsonObjectMember': JsonObjectMember,
+    'jsonValueNull': JsonValueNull,
+    'jsonValueBoolean': JsonValueBoolean,
+    'jsonValueNumber': JsonValueNumber,
+    'jsonValueString': JsonValueString,
+    'jsonValueArray': JsonValueArray,
+    'jsonValueObject': JsonValueObject,
+    'storyPrivacySettingsEveryone': StoryPrivacySettingsEveryone,
+    'storyPrivacySettingsContacts': StoryPrivacySettingsContacts,
+    'storyPrivacySettingsCloseFriends': StoryPrivacySettingsCloseFriends,
+    'storyPrivacySettingsSelectedUsers': StoryPrivacySettingsSelectedUsers,
+    'userPrivacySettingRuleAllowAll': UserPrivacySettingRuleAllowAll,
+    'userPrivacySettingRuleAllowContacts': UserPrivacySettingRuleAllowContacts,
+    'userPrivacySettingRuleAllowUsers': UserPrivacySettingRuleAllowUsers,
+    'userPrivacySettingRuleAllowChatMembers': UserPrivacySettingRuleAllowChatMembers,
+    'userPrivacySettingRuleRestrictAll': UserPrivacySettingRuleRestrictAll,
+    'userPrivacySettingRuleRestrictContacts': UserPrivacySettingRuleRestrictContacts,
+    'userPrivacySettingRuleRestrictUsers': UserPrivacySettingRuleRestrictUsers,
+    'userPrivacySettingRuleRestrictChatMembers': UserPrivacySettingRuleRestrictChatMembers,
+    'userPrivacySettingRules': UserPrivacySettingRules,
+    'userPrivacySettingShowStatus': UserPrivacySettingShowStatus,
+    'userPrivacySettingShowProfilePhoto': UserPrivacySettingShowProfilePhoto,
+    'userPrivacySettingShowLinkInForwardedMessages': UserPrivacySettingShowLinkInForwardedMessages,
+    'userPrivacySettingShowPhoneNumber': UserPrivacySettingShowPhoneNumber,
+    'userPrivacySettingShowBio': UserPrivacySettingShowBio,
+    'userPrivacySettingAllowChatInvites': UserPrivacySettingAllowChatInvites,
+    'userPrivacySettingAllowCalls': UserPrivacySettingAllowCalls,
+    'userPrivacySettingAllowPeerToPeerCalls': UserPrivacySettingAllowPeerToPeerCalls,
+    'userPrivacySettingAllowFindingByPhoneNumber': UserPrivacySettingAllowFindingByPhoneNumber,
+    'userPrivacySettingAllowPrivateVoiceAndVideoNoteMessages': UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages,
+    'readDatePrivacySettings': ReadDatePrivacySettings,
+    'newChatPrivacySettings': NewChatPrivacySettings,
+    'canSendMessageToUserResultOk': CanSendMessageToUserResultOk,
+    'canSendMessageToUserResultUserIsDeleted': CanSendMessageToUserResultUserIsDeleted,
+    'canSendMessageToUserResultUserRestrictsNewChats': CanSendMessageToUserResultUserRestrictsNewChats,
+    'accountTtl': AccountTtl,
+    'messageAutoDeleteTime': MessageAutoDeleteTime,
+    'sessionTypeAndroid': SessionTypeAndroid,
+    'sessionTypeApple': SessionTypeApple,
+    'sessionTypeBrave': SessionTypeBrave,
+    'sessionTypeChrome': SessionTypeChrome,
+    'sessionTypeEdge': SessionTypeEdge,
+    'sessionTypeFirefox': SessionTypeFirefox,
+    'sessionTypeIpad': SessionTypeIpad,
+    'sessionTypeIphone': SessionTypeIphone,
+    'sessionTypeLinux': SessionTypeLinux,
+    'sessionTypeMac': SessionTypeMac,
+    'sessionTypeOpera': SessionTypeOpera,
+    'sessionTypeSafari': SessionTypeSafari,
+    'sessionTypeUbuntu': SessionTypeUbuntu,
+    'sessionTypeUnknown': SessionTypeUnknown,
+    'sessionTypeVivaldi': SessionTypeVivaldi,
+    'sessionTypeWindows': SessionTypeWindows,
+    'sessionTypeXbox': SessionTypeXbox,
+    'session': Session,
+    'sessions': Sessions,
+    'unconfirmedSession': UnconfirmedSession,
+    'connectedWebsite': ConnectedWebsite,
+    'connectedWebsites': ConnectedWebsites,
+    'reportReasonSpam': ReportReasonSpam,
+    'reportReasonViolence': ReportReasonViolence,
+    'reportReasonPornography': ReportReasonPornography,
+    'reportReasonChildAbuse': ReportReasonChildAbuse,
+    'reportReasonCopyright': ReportReasonCopyright,
+    'reportReasonUnrelatedLocation': ReportReasonUnrelatedLocation,
+    'reportReasonFake': ReportReasonFake,
+    'reportReasonIllegalDrugs': ReportReasonIllegalDrugs,
+    'reportReasonPersonalDetails': ReportReasonPersonalDetails,
+    'reportReasonCustom': ReportReasonCustom,
+    'targetChatCurrent': TargetChatCurrent,
+    'targetChatChosen': TargetChatChosen,
+    'targetChatInternalLink': TargetChatInternalLink,
+    'internalLinkTypeActiveSessions': InternalLinkTypeActiveSessions,
+    'internalLinkTypeAttachmentMenuBot': InternalLinkTypeAttachmentMenuBot,
+    'internalLinkTypeAuthenticationCode': InternalLinkTypeAuthenticationCode,
+    'internalLinkTypeBackground': InternalLinkTypeBackground,
+    'internalLinkTypeBotAddToChannel': InternalLinkTypeBotAddToChannel,
+    'internalLinkTypeBotStart': InternalLinkTypeBotStart,
+    'internalLinkTypeBotStartInGroup': InternalLinkTypeBotStartInGroup,
+    'internalLinkTypeChangePhoneNumber': InternalLinkTypeChangePhoneNumber,
+    'internalLinkTypeChatBoost': InternalLinkTypeChatBoost,
+    'internalLinkTypeChatFolderInvite': InternalLinkTypeChatFolderInvite,
+    'internalLinkTypeChatFolderSettings': InternalLinkTypeChatFolderSettings,
+    'internalLinkTypeChatInvite': InternalLinkTypeChatInvite,
+    'internalLinkTypeDefaultMessageAutoDeleteTimerSettings': InternalLinkTypeDefaultMessageAutoDeleteTimerSettings,
+    'internalLinkTypeEditProfileSettings': InternalLinkTypeEditProfileSettings,
+    'internalLinkTypeGame': InternalLinkTypeGame,
+    'internalLinkTypeInstantView': InternalLinkTypeInstantView,
+    'internalLinkTypeInvoice': InternalLinkTypeInvoice,
+    'internalLinkTypeLanguagePack': InternalLinkTypeLanguagePack,
+    'internalLinkTypeLanguageSettings': InternalLinkTypeLanguageSettings,
+    'internalLinkTypeMessage': InternalLinkTypeMessage,
+    'internalLinkTypeMessageDraft': InternalLinkTypeMessageDraft,
+    'internalLinkTypePassportDataRequest': InternalLinkTypePassportDataRequest,
+    'internalLinkTypePhoneNumberConfirmation': InternalLinkTypePhoneNumberConfirmation,
+    'internalLinkTypePremiumFeatures': InternalLinkTypePremiumFeatures,
+    'internalLinkTypePremiumGift': InternalLinkTypePremiumGift,
+    'internalLinkTypePremiumGiftCode': InternalLinkTypePremiumGiftCode,
+    'internalLinkTypePrivacyAndSecuritySettings': InternalLinkTypePrivacyAndSecuritySettings,
+    'internalLinkTypeProxy': InternalLinkTypeProxy,
+    'internalLinkTypePublicChat': InternalLinkTypePublicChat,
+    'internalLinkTypeQrCodeAuthentication': InternalLinkTypeQrCodeAuthentication,
+    'internalLinkTypeRestorePurchases': InternalLinkTypeRestorePurchases,
+    'internalLinkTypeSettings': InternalLinkTypeSettings,
+    'internalLinkTypeSideMenuBot': InternalLinkTypeSideMenuBot,
+    'internalLinkTypeStickerSet': InternalLinkTypeStickerSet,
+    'internalLinkTypeStory': InternalLinkTypeStory,
+    'internalLinkTypeTheme': InternalLinkTypeTheme,
+    'internalLinkTypeThemeSettings': InternalLinkTypeThemeSettings,
+    'internalLinkTypeUnknownDeepLink': InternalLinkTypeUnknownDeepLink,
+    'internalLinkTypeUnsupportedProxy': InternalLinkTypeUnsupportedProxy,
+    'internalLinkTypeUserPhoneNumber': InternalLinkTypeUserPhoneNumber,
+    'internalLinkTypeUserToken': InternalLinkTypeUserToken,
+    'internalLinkTypeVideoChat': InternalLinkTypeVideoChat,
+    'internalLinkTypeWebApp': InternalLinkTypeWebApp,
+    'messageLink': MessageLink,
+    'messageLinkInfo': MessageLinkInfo,
+    'chatBoostLink': ChatBoostLink,
+    'chatBoostLinkInfo': ChatBoostLinkInfo,
+    'blockListMain': BlockListMain,
+    'blockListStories': BlockListStories,
+    'filePart': FilePart,
+    'fileTypeNone': FileTypeNone,
+    'fileTypeAnimation': FileTypeAnimation,
+    'fileTypeAudio': FileTypeAudio,
+    'fileTypeDocument': FileTypeDocument,
+    'fileTypeNotificationSound': FileTypeNotificationSound,
+    'fileTypePhoto': FileTypePhoto,
+    'fileTypePhotoStory': FileTypePhotoStory,
+    'fileTypeProfilePhoto': FileTypeProfilePhoto,
+    'fileTypeSecret': FileTypeSecret,
+    'fileTypeSecretThumbnail': FileTypeSecretThumbnail,
+    'fileTypeSecure': FileTypeSecure,
+    'fileTypeSticker': FileTypeSticker,
+    'fileTypeThumbnail': FileTypeThumbnail,
+    'fileTypeUnknown': FileTypeUnknown,
+    'fileTypeVideo': FileTypeVideo,
+    'fileTypeVideoNote': FileTypeVideoNote,
+    'fileTypeVideoStory': FileTypeVideoStory,
+    'fileTypeVoiceNote': FileTypeVoiceNote,
+    'fileTypeWallpaper': FileTypeWallpaper,
+    'storageStatisticsByFileType': StorageStatisticsByFileType,
+    'storageStatisticsByChat': StorageStatisticsByChat,
+    'storageStatistics': StorageStatistics,
+    'storageStatisticsFast': StorageStatisticsFast,
+    'databaseStatistics': DatabaseStatistics,
+    'networkTypeNone': NetworkTypeNone,
+    'networkTypeMobile': NetworkTypeMobile,
+    'networkTypeMobileRoaming': NetworkTypeMobileRoaming,
+    'networkTypeWiFi': NetworkTypeWiFi,
+    'networkTypeOther': NetworkTypeOther,
+    'networkStatisticsEntryFile': NetworkStatisticsEntryFile,
+    'networkStatisticsEntryCall': NetworkStatisticsEntryCall,
+    'networkStatistics': NetworkStatistics,
+    'autoDownloadSettings': AutoDownloadSettings,
+    'autoDownloadSettingsPresets': AutoDownloadSettingsPresets,
+    'autosaveSettingsScopePrivateChats': AutosaveSettingsScopePrivateChats,
+    'autosaveSettingsScopeGroupChats': AutosaveSettingsScopeGroupChats,
+    'autosaveSettingsScopeChannelChats': AutosaveSettingsScopeChannelChats,
+    'autosaveSettingsScopeChat': AutosaveSettingsScopeChat,
+    'scopeAutosaveSettings': ScopeAutosaveSettings,
+    'autosaveSettingsException': AutosaveSettingsException,
+    'autosaveSettings': AutosaveSettings,
+    'connectionStateWaitingForNetwork': ConnectionStateWaitingForNetwork,
+    'connectionStateConnectingToProxy': ConnectionStateConnectingToProxy,
+    'connectionStateConnecting': ConnectionStateConnecting,
+    'connectionStateUpdating': ConnectionStateUpdating,
+    'connectionStateReady': ConnectionStateReady,
+    'topChatCategoryUsers': TopChatCategoryUsers,
+    'topChatCategoryBots': TopChatCategoryBots,
+    'topChatCategoryGroups': TopChatCategoryGroups,
+    'topChatCategoryChannels': TopChatCategoryChannels,
+    'topChatCategoryInlineBots': TopChatCategoryInlineBots,
+    'topChatCategoryCalls': TopChatCategoryCalls,
+    'topChatCategoryForwardChats': TopChatCategoryForwardChats,
+    'foundPosition': FoundPosition,
+    'foundPositions': FoundPositions,
+    'tMeUrlTypeUser': TMeUrlTypeUser,
+    'tMeUrlTypeSupergroup': TMeUrlTypeSupergroup,
+    'tMeUrlTypeChatInvite': TMeUrlTypeChatInvite,
+    'tMeUrlTypeStickerSet': TMeUrlTypeStickerSet,
+    'tMeUrl': TMeUrl,
+    'tMeUrls': TMeUrls,
+    'suggestedActionEnableArchiveAndMuteNewChats': SuggestedActionEnableArchiveAndMuteNewChats,
+    'suggestedActionCheckPassword': SuggestedActionCheckPassword,
+    'suggestedActionCheckPhoneNumber': SuggestedActionCheckPhoneNumber,
+    'suggestedActionViewChecksHint': SuggestedActionViewChecksHint,
+    'suggestedActionConvertToBroadcastGroup': SuggestedActionConvertToBroadcastGroup,
+    'suggestedActionSetPassword': SuggestedActionSetPassword,
+    'suggestedActionUpgradePremium': SuggestedActionUpgradePremium,
+    'suggestedActionRestorePremium': SuggestedActionRestorePremium,
+    'suggestedActionSubscribeToAnnualPremium': SuggestedActionSubscribeToAnnualPremium,
+    'suggestedActionGiftPremiumForChristmas': SuggestedActionGiftPremiumForChristmas,
+    'count': Count,
+    'text': Text,
+    'seconds': Seconds,
+    'fileDownloadedPrefixSize': FileDownloadedPrefixSize,
+    'deepLinkInfo': DeepLinkInfo,
+    'textParseModeMarkdown': TextParseModeMarkdown,
+    'textParseModeHTML': TextParseModeHTML,
+    'proxyTypeSocks5': ProxyTypeSocks5,
+    'proxyTypeHttp': ProxyTypeHttp,
+    'proxyTypeMtproto': ProxyTypeMtproto,
+    'proxy': Proxy,
+    'proxies': Proxies,
+    'inputSticker': InputSticker,
+    'dateRange': DateRange,
+    'statisticalValue': StatisticalValue,
+    'statisticalGraphData': StatisticalGraphData,
+    'statisticalGraphAsync': StatisticalGraphAsync,
+    'statisticalGraphError': StatisticalGraphError,
+    'chatStatisticsObjectTypeMessage': ChatStatisticsObjectTypeMessage,
+    'chatStatisticsObjectTypeStory': ChatStatisticsObjectTypeStory,
+    'chatStatisticsInteractionInfo': ChatStatisticsInteractionInfo,
+    'chatStatisticsMessageSenderInfo': ChatStatisticsMessageSenderInfo,
+    'chatStatisticsAdministratorActionsInfo': ChatStatisticsAdministratorActionsInfo,
+    'chatStatisticsInviterInfo': ChatStatisticsInviterInfo,
+    'chatStatisticsSupergroup': ChatStatisticsSupergroup,
+    'chatStatisticsChannel': ChatStatisticsChannel,
+    'messageStatistics': MessageStatistics,
+    'storyStatistics': StoryStatistics,
+    'point': Point,
+    'vectorPathCommandLine': VectorPathCommandLine,
+    'vectorPathCommandCubicBezierCurve': VectorPathCommandCubicBezierCurve,
+    'botCommandScopeDefault': BotCommandScopeDefault,
+    'botCommandScopeAllPrivateChats': BotCommandScopeAllPrivateChats,
+    'botCommandScopeAllGroupChats': BotCommandScopeAllGroupChats,
+    'botCommandScopeAllChatAdministrators': BotCommandScopeAllChatAdministrators,
+    'botCommandScopeChat': BotCommandScopeChat,
+    'botCommandScopeChatAdministrators': BotCommandScopeChatAdministrators,
+    'botCommandScopeChatMember': BotCommandScopeChatMember,
+    'updateAuthorizationState': UpdateAuthorizationState,
+    'updateNewMessage': UpdateNewMessage,
+    'updateMessageSendAcknowledged': UpdateMessageSendAcknowledged,
+    'updateMessageSendSucceeded': UpdateMessageSendSucceeded,
+    'updateMessageSendFailed': UpdateMessageSendFailed,
+    'updateMessageContent': UpdateMessageContent,
+    'updateMessageEdited': UpdateMessageEdited,
+    'updateMessageIsPinned': UpdateMessageIsPinned,
+    'updateMessageInteractionInfo': UpdateMessageInteractionInfo,
+    'updateMessageContentOpened': UpdateMessageContentOpened,
+    'updateMessageMentionRead': UpdateMessageMentionRead,
+    'updateMessageUnreadReactions': UpdateMessageUnreadReactions,
+    'updateMessageLiveLocationViewed': UpdateMessageLiveLocationViewed,
+    'updateNewChat': UpdateNewChat,
+    'updateChatTitle': UpdateChatTitle,
+    'updateChatPhoto': UpdateChatPhoto,
+    'updateChatAccentColors': UpdateChatAccentColors,
+    'updateChatPermissions': UpdateChatPermissions,
+    'updateChatLastMessage': UpdateChatLastMessage,
+    'updateChatPosition': UpdateChatPosition,
+    'updateChatAddedToList': UpdateChatAddedToList,
+    'updateChatRemovedFromList': UpdateChatRemovedFromList,
+    'updateChatReadInbox': UpdateChatReadInbox,
+    'updateChatReadOutbox': UpdateChatReadOutbox,
+    'updateChatActionBar': UpdateChatActionBar,
+    'updateChatAvailableReactions': UpdateChatAvailableReactions,
+    'updateChatDraftMessage': UpdateChatDraftMessage,
+    'updateChatEmojiStatus': UpdateChatEmojiStatus,
+    'updateChatMessageSender': UpdateChatMessageSender,
+    'updateChatMessageAutoDeleteTime': UpdateChatMessageAutoDeleteTime,
+    'updateChatNotificationSettings': UpdateChatNotificationSettings,
+    'updateChatPendingJoinRequests': UpdateChatPendingJoinRequests,
+    'updateChatReplyMarkup': UpdateChatReplyMarkup,
+    'updateChatBackground': UpdateChatBackground,
+    'updateChatTheme': UpdateChatTheme,
+    'updateChatUnreadMentionCount': UpdateChatUnreadMentionCount,
+    'updateChatUnreadReactionCount': UpdateChatUnreadReactionCount,
+    'updateChatVideoChat': UpdateChatVideoChat,
+    'updateChatDefaultDisableNotification': UpdateChatDefaultDisableNotification,
+    'updateChatHasProtectedContent': UpdateChatHasProtectedContent,
+    'updateChatIsTranslatable': UpdateChatIsTranslatable,
+    'updateChatIsMarkedAsUnread': UpdateChatIsMarkedAsUnread,
+    'updateChatViewAsTopics': UpdateChatViewAsTopics,
+    'updateChatBlockList': UpdateChatBlockList,
+    'updateChatHasScheduledMessages': UpdateChatHasScheduledMessages,
+    'updateChatFolders': UpdateChatFolders,
+    'updateChatOnlineMemberCount': UpdateChatOnlineMemberCount,
+    'updateSavedMessagesTopic': UpdateSavedMessagesTopic,
+    'updateSavedMessagesTopicCount': UpdateSavedMessagesTopicCount,
+    'updateQuickReplyShortcut': UpdateQuickReplyShortcut,
+    'updateQuickReplyShortcutDeleted': UpdateQuickReplyShortcutDeleted,
+    'updateQuickReplyShortcuts': UpdateQuickReplyShortcuts,
+    'updateQuickReplyShortcutMessages': UpdateQuickReplyShortcutMessages,
+    'updateForumTopicInfo': UpdateForumTopicInfo,
+    'updateScopeNotificationSettings': UpdateScopeNotificationSettings,
+    'updateNotification': UpdateNotification,
+    'updateNotificationGroup': UpdateNotificationGroup,
+    'updateActiveNotifications': UpdateActiveNotifications,
+    'updateHavePendingNotifications': UpdateHavePendingNotifications,
+    'updateDeleteMessages': UpdateDeleteMessages,
+    'updateChatAction': UpdateChatAction,
+    'updateUserStatus': UpdateUserStatus,
+    'updateUser': UpdateUser,
+    'updateBasicGroup': UpdateBasicGroup,
+    'updateSupergroup': UpdateSupergroup,
+    'updateSecretChat': UpdateSecretChat,
+    'updateUserFullInfo': UpdateUserFullInfo,
+    'updateBasicGroupFullInfo': UpdateBasicGroupFullInfo,
+    'updateSupergroupFullInfo': UpdateSupergroupFullInfo,
+    'updateServiceNotification': UpdateServiceNotification,
+    'updateFile': UpdateFile,
+    'updateFileGenerationStart': UpdateFileGenerationStart,
+    'updateFileGenerationStop': UpdateFileGenerationStop,
+    'updateFileDownloads': UpdateFileDownloads,
+    'updateFileAddedToDownloads': UpdateFileAddedToDownloads,
+    'updateFileDownload': UpdateFileDownload,
+    'updateFileRemovedFromDownloads': UpdateFileRemovedFromDownloads,
+    'updateCall': UpdateCall,
+    'updateGroupCall': UpdateGroupCall,
+    'updateGroupCallParticipant': UpdateGroupCallParticipant,
+    'updateNewCallSignalingData': UpdateNewCallSignalingData,
+    'updateUserPrivacySettingRules': UpdateUserPrivacySettingRules,
+    'updateUnreadMessageCount': UpdateUnreadMessageCount,
+    'updateUnreadChatCount': UpdateUnreadChatCount,
+    'updateStory': UpdateStory,
+    'updateStoryDeleted': UpdateStoryDeleted,
+    'updateStorySendSucceeded': UpdateStorySendSucceeded,
+    'updateStorySendFailed': UpdateStorySendFailed,
+    'updateChatActiveStories': UpdateChatActiveStories,
+    'updateStoryListChatCount': UpdateStoryListChatCount,
+    'updateStoryStealthMode': UpdateStoryStealthMode,
+    'updateOption': UpdateOption,
+    'updateStickerSet': UpdateStickerSet,
+    'updateInstalledStickerSets': UpdateInstalledStickerSets,
+    'updateTrendingStickerSets': UpdateTrendingStickerSets,
+    'updateRecentStickers': UpdateRecentStickers,
+    'updateFavoriteStickers': UpdateFavoriteStickers,
+    'updateSavedAnimations': UpdateSavedAnimations,
+    'updateSavedNotificationSounds': UpdateSavedNotificationSounds,
+    'updateDefaultBackground': UpdateDefaultBackground,
+    'updateChatThemes': UpdateChatThemes,
+    'updateAccentColors': UpdateAccentColors,
+    'updateProfileAccentColors': UpdateProfileAccentColors,
+    'updateLanguagePackStrings': UpdateLanguagePackStrings,
+    'updateConnectionState': UpdateConnectionState,
+    'updateTermsOfService': UpdateTermsOfService,
+    'updateUsersNearby': UpdateUsersNearby,
+    'updateUnconfirmedSession': UpdateUnconfirmedSession,
+    'updateAttachmentMenuBots': UpdateAttachmentMenuBots,
+    'updateWebAppMessageSent': UpdateWebAppMessageSent,
+    'updateActiveEmojiReactions': UpdateActiveEmojiReactions,
+    'updateDefaultReactionType': UpdateDefaultReactionType,
+    'updateSavedMessagesTags': UpdateSavedMessagesTags,
+    'updateSpeechRecognitionTrial': UpdateSpeechRecognitionTrial,
+    'updateDiceEmojis': UpdateDiceEmojis,
+    'updateAnimatedEmojiMessageClicked': UpdateAnimatedEmojiMessageClicked,
+    'updateAnimationSearchParameters': UpdateAnimationSearchParameters,
+    'updateSuggestedActions': UpdateSuggestedActions,
+    'updateAddChatMembersPrivacyForbidden': UpdateAddChatMembersPrivacyForbidden,
+    'updateAutosaveSettings': UpdateAutosaveSettings,
+    'updateNewInlineQuery': UpdateNewInlineQuery,
+    'updateNewChosenInlineResult': UpdateNewChosenInlineResult,
+    'updateNewCallbackQuery': UpdateNewCallbackQuery,
+    'updateNewInlineCallbackQuery': UpdateNewInlineCallbackQuery,
+    'updateNewShippingQuery': UpdateNewShippingQuery,
+    'updateNewPreCheckoutQuery': UpdateNewPreCheckoutQuery,
+    'updateNewCustomEvent': UpdateNewCustomEvent,
+    'updateNewCustomQuery': UpdateNewCustomQuery,
+    'updatePoll': UpdatePoll,
+    'updatePollAnswer': UpdatePollAnswer,
+    'updateChatMember': UpdateChatMember,
+    'updateNewChatJoinRequest': UpdateNewChatJoinRequest,
+    'updateChatBoost': UpdateChatBoost,
+    'updateMessageReaction': UpdateMessageReaction,
+    'updateMessageReactions': UpdateMessageReactions,
+    'updates': Updates,
+    'logStreamDefault': LogStreamDefault,
+    'logStreamFile': LogStreamFile,
+    'logStreamEmpty': LogStreamEmpty,
+    'logVerbosityLevel': LogVerbosityLevel,
+    'logTags': LogTags,
+    'userSupportInfo': UserSupportInfo,
+    'testInt': TestInt,
+    'testString': TestString,
+    'testBytes': TestBytes,
+    'testVectorInt': TestVectorInt,
+    'testVectorIntObject': TestVectorIntObject,
+    'testVectorString': TestVectorString,
+    'testVectorStringObject': TestVectorStringObject,
+}
@@ -0,0 +1,157 @@
+"""Скомпилированные шаблоны для форматирования объектов telegram.types
+
+Шаблон вида 'Сообщение от {message.sender.id} в чате {message.chat_id}'
+разбирается один раз: каждое поле превращается в цепочку operator.attrgetter
+/ operator.itemgetter, поэтому при форматировании для каждого обновления
+не нужно заново разбирать пути через точку.
+
+Результат совпадает с str.format(**kwargs)
+"""
+import re
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from string import Formatter
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+from telegram.types.base import RawDataclass, build_variables
+
+_formatter = Formatter()
+
+
+def _compile_accessor(field_name: str) -> Tuple[str, Callable[[Any], Any]]:
+    """Возвращает имя аргумента и функцию доступа к значению поля"""
+    first, rest = _split_field_name(field_name)
+    getters = []
+    attrs: List[str] = []
+
+    for is_attr, key in rest:
+        if is_attr:
+            attrs.append(key)
+            continue
+        if attrs:
+            getters.append(attrgetter('.'.join(attrs)))
+            attrs = []
+        getters.append(itemgetter(key))
+
+    if attrs:
+        getters.append(attrgetter('.'.join(attrs)))
+
+    if not getters:
+        return first, _identity
+    if len(getters) == 1:
+        return first, getters[0]
+    return first, _chain(getters)
+
+
+_FIELD_NAME_RE = re.compile(r'\.([^.[]+)|\[([^\]]+)\]')
+
+
+def _split_field_name(field_name: str) -> Tuple[str, List[Tuple[bool, Any]]]:
+    """Разбирает имя поля так же, как str.format:
+    'message.chat[0]' -> ('message', [(True, 'chat'), (False, 0)])
+    """
+    end = len(field_name)
+    for char in '.[':
+        index = field_name.find(char)
+        if index != -1:
+            end = min(end, index)
+    first, tail = field_name[:end], field_name[end:]
+
+    rest = []
+    position = 0
+    while position < len(tail):
+        match = _FIELD_NAME_RE.match(tail, position)
+        if match is None:
+            raise ValueError(f'Invalid format field name: {field_name!r}')
+        attr, key = match.groups()
+        if attr is not None:
+            rest.append((True, attr))
+        else:
+            rest.append((False, int(key) if key.isdigit() else key))
+        position = match.end()
+
+    return first, rest
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _chain(getters: List[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    def getter(value: Any) -> Any:
+        for get in getters:
+            value = get(value)
+        return value
+
+    return getter
+
+
+class Template:
+    """Шаблон, разобранный один раз при создании
+
+    Позиционные поля ({} и {0}) не поддерживаются, только именованные
+    """
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self._parts: List[Tuple[str, Optional[tuple]]] = []
+        self.fields: List[str] = []
+
+        for literal, field_name, format_spec, conversion in _formatter.parse(template):
+            if field_name is None:
+                self._parts.append((literal, None))
+                continue
+
+            if not field_name or field_name[0].isdigit():
+                raise ValueError(f'Positional fields are not supported: {template}')
+
+            if format_spec and '{' in format_spec:
+                raise ValueError(f'Nested fields are not supported: {template}')
+
+            name, getter = _compile_accessor(field_name)
+            self.fields.append(field_name)
+            self._parts.append((literal, (name, getter, conversion, format_spec)))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.template!r})'
+
+    def format(self, **kwargs: Any) -> str:
+        result = []
+
+        for literal, accessor in self._parts:
+            result.append(literal)
+            if accessor is None:
+                continue
+
+            name, getter, conversion, format_spec = accessor
+            value = getter(kwargs[name])
+            if conversion == 's':
+                value = str(value)
+            elif conversion == 'r':
+                value = repr(value)
+            elif conversion == 'a':
+                value = ascii(value)
+            result.append(format(value, format_spec))
+
+        return ''.join(result)
+
+    def validate(self, cls: Type[RawDataclass], base: str = None) -> List[str]:
+        """Возвращает поля шаблона, которых нет в build_variables(cls, base)"""
+        variables = set(build_variables(cls, base))
+        base = base or cls.__name__.lower()
+        return [
+            field_name
+            for field_name in self.fields
+            if field_name.split('.', 1)[0] == base and field_name not in variables
+        ]
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str) -> Template:
+    """Возвращает закешированный скомпилированный шаблон"""
+    return Template(template)
+
+
+def format_template(template: str, **kwargs: Any) -> str:
+    """Аналог template.format(**kwargs) с кешированием разбора шаблона"""
+    return compile_template(template).format(**kwargs)
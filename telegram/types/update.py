@@ -91,6 +91,23 @@ class UpdateBasicGroup(RawDataclass):
     basic_group: BasicGroup = None
 
 
+@dataclass
+class UpdateMessageSendSucceeded(RawDataclass):
+    """Сообщение отправлено. old_message_id - временный id сообщения"""
+
+    message: Message = None
+    old_message_id: int = None
+
+
+@dataclass
+class UpdateMessageSendFailed(RawDataclass):
+    """Сообщение не удалось отправить. old_message_id - временный id сообщения"""
+
+    message: Message = None
+    old_message_id: int = None
+    error: dict = None
+
+
 class UpdateBuilder(ObjectBuilder):
     """Билдер, возвращает один из типов Update"""
 
@@ -98,6 +115,8 @@ class UpdateBuilder(ObjectBuilder):
         'updateAuthorizationState': UpdateAuthorizationState,
         'updateFile': UpdateFile,
         'updateNewMessage': UpdateNewMessage,
+        'updateMessageSendSucceeded': UpdateMessageSendSucceeded,
+        'updateMessageSendFailed': UpdateMessageSendFailed,
         'updateNewChat': UpdateNewChat,
         'updateUser': UpdateUser,
         'updateUserFullInfo': UpdateUserFullInfo,
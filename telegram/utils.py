@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, Optional
 
 
 class Result:
@@ -44,3 +45,34 @@ class Result:
 
     def __str__(self) -> str:
         return f'Result <{self.id}>'
+
+
+async def bounded_as_completed(
+    aws: Iterable[Awaitable[Any]], limit: int
+) -> AsyncIterator[Any]:
+    """Выполняет awaitable из aws, не больше limit одновременно,
+    и возвращает результаты по мере завершения.
+
+    aws читается лениво, поэтому может быть генератором корутин
+    """
+    aws = iter(aws)
+    pending = set()
+    try:
+        while True:
+            while len(pending) < max(limit, 1):
+                aw = next(aws, None)
+                if aw is None:
+                    break
+                pending.add(asyncio.ensure_future(aw))
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,115 @@
+import itertools
+import json
+import queue
+import signal
+
+from telegram import tdjson
+from telegram.client import Settings
+
+# ответы на запросы авторизации -> следующее состояние
+AUTHORIZATION_STEPS = {
+    'setTdlibParameters': 'authorizationStateWaitPhoneNumber',
+    'checkAuthenticationBotToken': 'authorizationStateReady',
+}
+
+
+class FakeLibrary:
+    """Заменяет libtdjson: отвечает Ok на запросы и проводит авторизацию бота.
+
+    Подключается через кеш загруженных библиотек, поэтому TDJson,
+    TDJsonReceiver и ClientManager работают с ней как с настоящей
+    """
+
+    def __init__(self, auto_reply: bool = True):
+        self.auto_reply = auto_reply
+        self.path = f'fake-libtdjson-{id(self)}'
+        self.updates = queue.Queue()
+        self.requests = []
+        self.states = {}
+        self._client_ids = itertools.count(1)
+
+    def install(self):
+        tdjson._libraries[self.path] = self
+        return self
+
+    def uninstall(self):
+        tdjson._libraries.pop(self.path, None)
+
+    def settings(self, **kwargs):
+        kwargs.setdefault('bot_token', 'token')
+        return Settings(
+            api_id=1,
+            api_hash='hash',
+            database_encryption_key='key',
+            library_path=self.path,
+            files_directory='/tmp/fake-tdlib',
+            **kwargs,
+        )
+
+    def push(self, client_id, update):
+        update['@client_id'] = client_id
+        self.updates.put(json.dumps(update).encode())
+
+    def set_state(self, client_id, state):
+        self.states[client_id] = state
+        self.push(
+            client_id,
+            {
+                '@type': 'updateAuthorizationState',
+                'authorization_state': {'@type': state},
+            },
+        )
+
+    def requests_of(self, method):
+        return [r for _, r in self.requests if r['@type'] == method]
+
+    def td_create_client_id(self):
+        client_id = next(self._client_ids)
+        self.set_state(client_id, 'authorizationStateWaitTdlibParameters')
+        return client_id
+
+    def td_receive(self, timeout):
+        try:
+            return self.updates.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def td_send(self, client_id, data):
+        request = json.loads(data)
+        self.requests.append((client_id, request))
+        if self.auto_reply:
+            self.reply(client_id, request)
+
+    def reply(self, client_id, request, response=None):
+        if response is None:
+            response = {'@type': 'ok'}
+            if request['@type'] == 'getAuthorizationState':
+                response = {'@type': self.states[client_id]}
+        if '@extra' in request:
+            response['@extra'] = request['@extra']
+        self.push(client_id, response)
+
+        state = AUTHORIZATION_STEPS.get(request['@type'])
+        if state is not None:
+            self.set_state(client_id, state)
+
+    def td_execute(self, data):
+        return json.dumps({'@type': 'ok'}).encode()
+
+    def td_json_client_destroy(self, client_id):
+        pass
+
+
+class SignalsMixin:
+    """Восстанавливает обработчики сигналов, которые меняет клиент"""
+
+    signals = (signal.SIGINT, signal.SIGTERM, signal.SIGABRT)
+
+    def setUp(self):
+        self._handlers = {s: signal.getsignal(s) for s in self.signals}
+        self.lib = FakeLibrary().install()
+
+    def tearDown(self):
+        self.lib.uninstall()
+        for signum, handler in self._handlers.items():
+            signal.signal(signum, handler)
@@ -0,0 +1,609 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+from unittest import TestCase
+
+from telegram.api import API, BaseAPI
+from telegram.checkpoint import FileCheckpoint
+from telegram.ratelimit import RequestScheduler
+from telegram.tracker import SEND_FAILED, SEND_SUCCEEDED, MessageSendTracker
+from telegram.types.message import Message
+from telegram.types.text import TextParseMode
+from telegram.utils import Result
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class ChatHistoryAPI(API):
+    """API с историей чата из списка сообщений, новые в начале"""
+
+    def __init__(self, messages):
+        super().__init__(SimpleNamespace(store=None))
+        self.messages = messages
+        self.calls = []
+        self.empty_pages = set()
+
+    async def get_chat_history(
+        self, chat_id, limit=100, from_message_id=0, offset=0, only_local=False
+    ):
+        self.calls.append(from_message_id)
+        await asyncio.sleep(0)
+        if from_message_id in self.empty_pages:
+            # история еще не загружена
+            self.empty_pages.discard(from_message_id)
+            return Result({}, {'@type': 'messages', 'messages': []})
+        messages = [
+            m
+            for m in self.messages
+            if not from_message_id or m['id'] <= from_message_id
+        ][:limit]
+        return Result({}, {'@type': 'messages', 'messages': messages})
+
+
+class SupergroupMembersAPI(API):
+    """API с участниками супергруппы, которых больше, чем в member_count"""
+
+    def __init__(self, member_count, members, failures=None):
+        super().__init__(SimpleNamespace(store=None))
+        self.member_count = member_count
+        self.members = members
+        # offset -> сколько запросов окна завершатся ошибкой
+        self.failures = failures or {}
+        self.active = 0
+        self.max_active = 0
+
+    async def get_supergroup_full_info(self, supergroup_id):
+        info = {'@type': 'supergroupFullInfo', 'member_count': self.member_count}
+        return Result({}, info)
+
+    async def get_supergroup_members(
+        self, supergroup_id, filter_type, offset=0, limit=200, query=''
+    ):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01 if offset % 400 else 0)
+        self.active -= 1
+        if self.failures.get(offset):
+            self.failures[offset] -= 1
+            raise TimeoutError(f'result not set {offset}')
+        # окна перекрываются, как при сдвиге списка во время выгрузки
+        members = self.members[max(offset - 1, 0) : offset + limit]
+        return Result({}, {'@type': 'chatMembers', 'members': members})
+
+
+class FullInfoAPI(API):
+    """API, которое считает запросы полной информации"""
+
+    def __init__(self):
+        super().__init__(
+            SimpleNamespace(store=None), full_info_ttl={'getUserFullInfo': 60}
+        )
+        self.requests = []
+
+    async def send_data(self, method, request_id=None, timeout=None, **kwargs):
+        self.requests.append(method)
+        await asyncio.sleep(0)
+        return Result({}, {'@type': 'userFullInfo', 'bio': len(self.requests)})
+
+
+class SendMessageAPI(API):
+    """API, которое запоминает запросы вместо отправки в tdlib"""
+
+    def __init__(self):
+        super().__init__(SimpleNamespace(store=None, send_tracker=MessageSendTracker()))
+        self.sent = []
+        self.parse_threads = []
+
+    def send_data_sync(self, method, request_id=None, **kwargs):
+        self.parse_threads.append(threading.current_thread())
+        update = {'@type': 'formattedText', 'text': kwargs['text'], 'entities': []}
+        return Result(kwargs, update)
+
+    async def send_data(self, method, request_id=None, timeout=None, **kwargs):
+        self.sent.append(kwargs)
+        message = {
+            '@type': 'message',
+            'id': len(self.sent),
+            'chat_id': kwargs['chat_id'],
+            'sending_state': {'@type': 'messageSendingStatePending'},
+        }
+        return Result(kwargs, message)
+
+
+class AddChatMembersAPI(API):
+    """API, в котором пользователи с id кратным 7 не добавляются,
+    а запросы с пользователями из timeouts не получают ответа
+    """
+
+    def __init__(self, timeouts=()):
+        super().__init__(SimpleNamespace(store=None))
+        self.requests = []
+        self.timeouts = set(timeouts)
+
+    async def send_data(self, method, request_id=None, timeout=None, **kwargs):
+        user_ids = kwargs.get('user_ids') or [kwargs['user_id']]
+        self.requests.append((method, user_ids))
+        await asyncio.sleep(0)
+        if self.timeouts.intersection(user_ids):
+            raise TimeoutError('result not set')
+        if any(user_id % 7 == 0 for user_id in user_ids):
+            return Result(kwargs, {'@type': 'error', 'code': 400, 'message': 'error'})
+        return Result(kwargs, {'@type': 'ok'})
+
+
+class IterChatHistoryTestCase(TestCase):
+    """
+    Тест кейс для итерации истории чата
+    """
+
+    def setUp(self):
+        self.messages = [
+            {'@type': 'message', 'id': i, 'chat_id': 1, 'date': i}
+            for i in range(250, 0, -1)
+        ]
+        self.api = ChatHistoryAPI(self.messages)
+
+    def test_all(self):
+        messages = asyncio.run(collect(self.api.iter_chat_history(1, raw=True)))
+
+        self.assertEqual(self.messages, messages)
+        self.assertEqual([0, 151, 52, 1, 1], self.api.calls)
+
+    def test_empty_page(self):
+        """Пустая страница запрашивается повторно, а не завершает историю"""
+        self.api.empty_pages.update({0, 151})
+
+        messages = asyncio.run(collect(self.api.iter_chat_history(1, raw=True)))
+
+        self.assertEqual(self.messages, messages)
+        self.assertEqual([0, 0, 151, 151, 52, 1, 1], self.api.calls)
+
+    def test_zero_limit(self):
+        messages = asyncio.run(collect(self.api.iter_chat_history(1, limit=0)))
+
+        self.assertEqual([], messages)
+        self.assertEqual([], self.api.calls)
+
+    def test_limit(self):
+        messages = asyncio.run(collect(self.api.iter_chat_history(1, limit=120)))
+
+        self.assertEqual(120, len(messages))
+        self.assertIsInstance(messages[0], Message)
+        self.assertEqual(131, messages[-1].id)
+        self.assertEqual([0, 151], self.api.calls)
+
+    def test_min_date(self):
+        iterator = self.api.iter_chat_history(1, from_message_id=200, min_date=150)
+        messages = asyncio.run(collect(iterator))
+
+        self.assertEqual(list(range(200, 149, -1)), [m.id for m in messages])
+
+    def test_prefetch(self):
+        """Следующая страница запрашивается до обработки текущей"""
+
+        async def first_message():
+            async for message in self.api.iter_chat_history(1, page_size=10):
+                await asyncio.sleep(0.01)
+                return message, list(self.api.calls)
+
+        message, calls = asyncio.run(first_message())
+
+        self.assertEqual(250, message.id)
+        self.assertEqual([0, 241], calls)
+
+
+class IterSupergroupMembersTestCase(TestCase):
+    """
+    Тест кейс для параллельной выгрузки участников супергруппы
+    """
+
+    def test_members(self):
+        members = [
+            {
+                '@type': 'chatMember',
+                'member_id': {'@type': 'messageSenderUser', 'user_id': i},
+            }
+            for i in range(1000)
+        ]
+        api = SupergroupMembersAPI(450, members)
+
+        result = asyncio.run(
+            collect(api.iter_supergroup_members(1, concurrency=2, window=100))
+        )
+
+        self.assertEqual(
+            list(range(1000)),
+            sorted(m['member_id']['user_id'] for m in result),
+        )
+        self.assertEqual(2, api.max_active)
+
+    def _members(self, count):
+        return [
+            {
+                '@type': 'chatMember',
+                'member_id': {'@type': 'messageSenderUser', 'user_id': i},
+            }
+            for i in range(count)
+        ]
+
+    def test_retry(self):
+        """Окно, запрос которого завершился ошибкой, запрашивается повторно"""
+        api = SupergroupMembersAPI(300, self._members(300), failures={100: 2})
+
+        result = asyncio.run(collect(api.iter_supergroup_members(1, window=100)))
+
+        self.assertEqual(300, len(result))
+        self.assertEqual(0, api.failures[100])
+
+    def test_failed_window(self):
+        """Недоступное окно не прерывает выгрузку остальных"""
+        api = SupergroupMembersAPI(300, self._members(300), failures={100: 10})
+        errors = []
+
+        result = asyncio.run(
+            collect(
+                api.iter_supergroup_members(
+                    1,
+                    window=100,
+                    retries=1,
+                    on_error=lambda offset, exc: errors.append(offset),
+                )
+            )
+        )
+
+        user_ids = {m['member_id']['user_id'] for m in result}
+        self.assertEqual(set(range(100)) | set(range(199, 300)), user_ids)
+        self.assertEqual([100], errors)
+        self.assertEqual(8, api.failures[100])
+
+        api = SupergroupMembersAPI(300, self._members(300), failures={200: 10})
+        result = []
+
+        async def main():
+            async for member in api.iter_supergroup_members(1, window=100):
+                result.append(member)
+
+        with self.assertRaises(RuntimeError) as context:
+            asyncio.run(main())
+
+        self.assertIn('200', str(context.exception))
+        self.assertEqual(200, len(result))
+
+
+class FullInfoCacheTestCase(TestCase):
+    """
+    Тест кейс для кеша *_full_info
+    """
+
+    def test_cache(self):
+        api = FullInfoAPI()
+
+        async def main():
+            results = await asyncio.gather(
+                api.get_user_full_info(1), api.get_user_full_info(1)
+            )
+            results.append(await api.get_user_full_info(1))
+            api.invalidate_full_info({'@type': 'updateUserFullInfo', 'user_id': 1})
+            results.append(await api.get_user_full_info(1))
+            await api.get_basic_group_full_info(1)
+            await api.get_basic_group_full_info(1)
+            return [result.update['bio'] for result in results]
+
+        self.assertEqual([1, 1, 1, 2], asyncio.run(main()))
+        self.assertEqual(['updateUserFullInfo'], api.full_info_update_types)
+        self.assertEqual(
+            ['getUserFullInfo', 'getUserFullInfo']
+            + ['getBasicGroupFullInfo', 'getBasicGroupFullInfo'],
+            api.requests,
+        )
+
+
+class SendMessageTestCase(TestCase):
+    """
+    Тест кейс для отправки сообщений с разметкой
+    """
+
+    def test_parse_mode(self):
+        api = SendMessageAPI()
+
+        async def main():
+            for _ in range(3):
+                await api.send_message(1, '<b>text</b>', parse_mode=TextParseMode.HTML)
+            await api.send_message(1, 'plain')
+
+        asyncio.run(main())
+
+        self.assertEqual(1, len(api.parse_threads))
+        self.assertIsNot(threading.main_thread(), api.parse_threads[0])
+        self.assertEqual(4, len(api.sent))
+        content = api.sent[0]['input_message_content']
+        self.assertEqual('inputMessageText', content['@type'])
+        self.assertEqual('<b>text</b>', content['text']['text'])
+        self.assertEqual(
+            {'@type': 'formattedText', 'text': 'plain'},
+            api.sent[3]['input_message_content']['text'],
+        )
+
+        self.assertIs(
+            api.parse_text_entities('<b>text</b>', TextParseMode.HTML),
+            api.parse_text_entities('<b>text</b>', TextParseMode.HTML),
+        )
+        self.assertEqual(1, len(api.parse_threads))
+
+    def test_parse_cancel(self):
+        """Отмена одной отправки не отменяет разбор текста для остальных"""
+        api = SendMessageAPI()
+        parse = api._parse_text_entities
+
+        def slow_parse(text, parse_mode):
+            time.sleep(0.01)
+            return parse(text, parse_mode)
+
+        api._parse_text_entities = slow_parse
+
+        async def main():
+            sends = [
+                asyncio.ensure_future(
+                    api.send_message(1, '<b>text</b>', parse_mode=TextParseMode.HTML)
+                )
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            sends[0].cancel()
+            return await asyncio.gather(*sends, return_exceptions=True)
+
+        results = asyncio.run(main())
+
+        self.assertIsInstance(results[0], asyncio.CancelledError)
+        self.assertTrue(all(result.ok_received for result in results[1:]))
+        self.assertEqual(2, len(api.sent))
+        self.assertEqual(1, len(api.parse_threads))
+
+    def test_track_delivery(self):
+        api = SendMessageAPI()
+        tracker = api.client.send_tracker
+
+        async def main():
+            first = await api.send_message(1, 'first', track_delivery=True)
+            second = await api.send_message(1, 'second', track_delivery=True)
+            self.assertEqual(2, len(tracker))
+            self.assertFalse(first.done())
+            with self.assertRaises(asyncio.TimeoutError):
+                await first.wait(timeout=0.01)
+
+            tracker.process_update(
+                {
+                    '@type': SEND_FAILED,
+                    'message': {'chat_id': 1, 'id': 2},
+                    'old_message_id': 2,
+                    'error': {'@type': 'error', 'code': 403, 'message': 'blocked'},
+                }
+            )
+            tracker.process_update(
+                {
+                    '@type': SEND_SUCCEEDED,
+                    'message': {'@type': 'message', 'chat_id': 1, 'id': 100},
+                    'old_message_id': 1,
+                }
+            )
+            return await first, await second
+
+        first, second = asyncio.run(main())
+
+        self.assertTrue(first.ok_received)
+        self.assertEqual(100, first.update['id'])
+        self.assertTrue(second.error_received)
+        self.assertEqual('blocked', second.update['message'])
+        self.assertEqual(0, len(api.client.send_tracker))
+
+    def test_early_ttl(self):
+        """Результаты, которые никто не начал отслеживать, не копятся"""
+        now = [0]
+        tracker = MessageSendTracker(early_ttl=5, clock=lambda: now[0])
+
+        def update(message_id):
+            return {
+                '@type': SEND_SUCCEEDED,
+                'message': {'chat_id': 1, 'id': 100 + message_id},
+                'old_message_id': message_id,
+            }
+
+        tracker.process_update(update(1))
+        now[0] = 3
+        tracker.process_update(update(2))
+        now[0] = 6
+        tracker.process_update(update(3))
+
+        self.assertEqual([(1, 2), (1, 3)], list(tracker._early))
+
+        async def main():
+            return await tracker.wait({'chat_id': 1, 'id': 2, 'sending_state': {}})
+
+        self.assertEqual(102, asyncio.run(main())['message']['id'])
+
+
+class AddChatMembersBulkTestCase(TestCase):
+    """
+    Тест кейс для добавления большого количества пользователей в чат
+    """
+
+    def test_bulk(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'checkpoint.jsonl')
+        api = AddChatMembersAPI()
+
+        with FileCheckpoint(path) as checkpoint:
+            checkpoint.add(1)
+            iterator = api.add_chat_members_bulk(
+                1, iter(range(1, 46)), concurrency=2, checkpoint=checkpoint
+            )
+            results = dict(asyncio.run(collect(iterator)))
+            # чекпоинт закрыт и дописан в файл
+            self.assertIsNone(checkpoint._file)
+
+        self.assertEqual(set(range(2, 46)), set(results))
+        failed = sorted(u for u, result in results.items() if not result.ok_received)
+        self.assertEqual([7, 14, 21, 28, 35, 42], failed)
+
+        chunks = [user_ids for method, user_ids in api.requests]
+        self.assertEqual(list(range(2, 22)), chunks[0])
+        self.assertEqual(1, len(chunks[-1]))
+
+        checkpoint = FileCheckpoint(path)
+        self.assertEqual(45 - len(failed), len(checkpoint))
+        checkpoint.close()
+
+    def test_chunk_error(self):
+        """Исключение запроса части не прерывает добавление остальных"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'checkpoint.jsonl')
+        api = AddChatMembersAPI(timeouts=[5])
+
+        with FileCheckpoint(path) as checkpoint:
+            iterator = api.add_chat_members_bulk(
+                1,
+                [1, 2, 3, 4, 5, 6, 8, 9, 10],
+                chunk_size=3,
+                retry_individually=False,
+                checkpoint=checkpoint,
+            )
+            results = dict(asyncio.run(collect(iterator)))
+
+            self.assertEqual(9, len(results))
+            failed = {u for u, result in results.items() if result.error_received}
+            self.assertEqual({4, 5, 6}, failed)
+            self.assertEqual('result not set', results[5].update['message'])
+            self.assertNotIn(5, checkpoint)
+            self.assertEqual(6, len(checkpoint))
+
+        api = AddChatMembersAPI(timeouts=[30])
+        results = dict(asyncio.run(collect(api.add_chat_members_bulk(1, [29, 30]))))
+
+        self.assertTrue(results[29].ok_received)
+        self.assertTrue(results[30].error_received)
+
+    def test_chunk_size(self):
+        api = AddChatMembersAPI()
+        iterator = api.add_chat_members_bulk(1, [1, 2], chunk_size=0)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(collect(iterator))
+        self.assertEqual([], api.requests)
+
+
+class FloodWaitClient:
+    """Клиент, который отвечает 429 на первый запрос"""
+
+    def __init__(self):
+        self.request_ids = []
+
+    async def send_data(self, data, request_id=None, timeout=None):
+        data.setdefault('@extra', {})
+        request_id = request_id or data['@extra'].get('request_id') or 'generated'
+        data['@extra']['request_id'] = request_id
+        self.request_ids.append(request_id)
+        if len(self.request_ids) == 1:
+            error = {'@type': 'error', 'code': 429, 'message': 'retry after 0'}
+            return Result(data, error, request_id=request_id)
+        return Result(data, {'@type': 'ok'}, request_id=request_id)
+
+
+class FloodWaitRetryTestCase(TestCase):
+    """
+    Тест кейс для повтора запросов после ошибки 429
+    """
+
+    def test_new_request_id(self):
+        """Повтор отправляется с новым request_id"""
+        client = FloodWaitClient()
+        api = BaseAPI(client, scheduler=RequestScheduler(max_retries=1))
+
+        result = asyncio.run(api.send_data('getMe', request_id='first'))
+
+        self.assertTrue(result.ok_received)
+        self.assertEqual(['first', 'generated'], client.request_ids)
+
+    def test_no_retry_by_default(self):
+        client = FloodWaitClient()
+        api = BaseAPI(client, scheduler=RequestScheduler())
+
+        result = asyncio.run(api.send_data('getMe'))
+
+        self.assertTrue(result.error_received)
+        self.assertEqual(1, len(client.request_ids))
+
+
+class SingleflightClient:
+    """Клиент, который отвечает на запросы с задержкой"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def send_data(self, data, request_id=None, timeout=None):
+        self.requests.append(dict(data))
+        await asyncio.sleep(0.01)
+        return Result(data, {'@type': 'chat', 'id': data.get('chat_id')})
+
+
+class SingleflightTestCase(TestCase):
+    """
+    Тест кейс для объединения одинаковых одновременных запросов
+    """
+
+    def setUp(self):
+        self.client = SingleflightClient()
+        self.api = BaseAPI(self.client, singleflight_methods=['getChat'])
+
+    def test_shared(self):
+        async def main():
+            return await asyncio.gather(
+                self.api.send_data('getChat', chat_id=1),
+                self.api.send_data('getChat', chat_id=1),
+                self.api.send_data('getChat', chat_id=2),
+                self.api.send_data('getChat', request_id='id', chat_id=1),
+                self.api.send_data('getMe'),
+                self.api.send_data('getMe'),
+            )
+
+        results = asyncio.run(main())
+
+        self.assertIs(results[0], results[1])
+        self.assertIsNot(results[0], results[2])
+        self.assertIsNot(results[0], results[3])
+        self.assertIsNot(results[4], results[5])
+        self.assertEqual(5, len(self.client.requests))
+        self.assertEqual(1, self.api.coalesced)
+        self.assertEqual({}, self.api._inflight)
+
+    def test_sequential(self):
+        """Завершенный запрос не переиспользуется"""
+
+        async def main():
+            await self.api.send_data('getChat', chat_id=1)
+            await self.api.send_data('getChat', chat_id=1)
+
+        asyncio.run(main())
+
+        self.assertEqual(2, len(self.client.requests))
+
+    def test_cancel(self):
+        """Отмена одного из ожидающих не отменяет общий запрос"""
+
+        async def main():
+            first = asyncio.ensure_future(self.api.send_data('getChat', chat_id=1))
+            second = asyncio.ensure_future(self.api.send_data('getChat', chat_id=1))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        result = asyncio.run(main())
+
+        self.assertTrue(result.ok_received)
+        self.assertEqual(1, len(self.client.requests))
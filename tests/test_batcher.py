@@ -0,0 +1,155 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import TestCase
+
+from telegram.api import API
+from telegram.batcher import MessageBatcher
+from telegram.utils import Result
+
+
+class BatchAPI(API):
+    """API, которое запоминает запросы вместо отправки в tdlib"""
+
+    def __init__(self, **kwargs):
+        super().__init__(SimpleNamespace(store=None), **kwargs)
+        self.sent = []
+
+    async def send_data(self, method, request_id=None, timeout=None, **kwargs):
+        self.sent.append((method, kwargs))
+        return Result(kwargs, {'@type': 'ok'})
+
+
+class MessageBatcherTestCase(TestCase):
+    """
+    Тест кейс для объединения запросов со списками сообщений
+    """
+
+    def setUp(self):
+        self.sent = []
+
+    async def send(self, message_ids):
+        self.sent.append(message_ids)
+        return Result({}, {'@type': 'ok', 'ids': message_ids})
+
+    def test_window(self):
+        batcher = MessageBatcher(window=0.01, max_size=100)
+
+        async def main():
+            return await asyncio.gather(
+                batcher.add(1, [3], self.send),
+                batcher.add(1, [1, 2], self.send),
+                batcher.add(1, [2], self.send),
+                batcher.add(2, [5], self.send),
+            )
+
+        results = asyncio.run(main())
+
+        self.assertEqual([[1, 2, 3], [5]], self.sent)
+        self.assertIs(results[0], results[1])
+        self.assertEqual([1, 2, 3], results[2].update['ids'])
+        self.assertEqual(0, batcher.pending())
+
+    def test_max_size(self):
+        batcher = MessageBatcher(window=10, max_size=3)
+
+        async def main():
+            return await asyncio.gather(
+                batcher.add(1, [1, 2], self.send),
+                batcher.add(1, [3, 4], self.send),
+                batcher.add(1, [5], self.send),
+                batcher.add(1, [6, 7, 8], self.send),
+            )
+
+        asyncio.run(asyncio.wait_for(main(), 1))
+
+        self.assertEqual([[1, 2], [3, 4, 5], [6, 7, 8]], sorted(self.sent))
+
+    def test_split_large_call(self):
+        """Вызов больше max_size отправляется частями"""
+        batcher = MessageBatcher(window=10, max_size=3)
+
+        result = asyncio.run(batcher.add(1, [7, 1, 2, 3, 4, 5, 6, 1], self.send))
+
+        self.assertEqual([[1, 2, 3], [4, 5, 6], [7]], self.sent)
+        self.assertEqual([7], result.update['ids'])
+        self.assertEqual(3, batcher.requests)
+
+    def test_split_errors(self):
+        """Ошибка одной части не останавливает отправку остальных"""
+        batcher = MessageBatcher(window=10, max_size=2)
+
+        async def send(message_ids):
+            self.sent.append(message_ids)
+            if 3 in message_ids:
+                return Result({}, {'@type': 'error', 'code': 400, 'message': 'bad'})
+            if 5 in message_ids:
+                raise TimeoutError('result not set')
+            return Result({}, {'@type': 'ok'})
+
+        result = asyncio.run(batcher.add(1, [1, 2, 3, 4, 5, 6, 7], send))
+
+        self.assertEqual([[1, 2], [3, 4], [5, 6], [7]], self.sent)
+        self.assertTrue(result.error_received)
+        self.assertEqual('bad', result.update['message'])
+        self.assertEqual(
+            [([3, 4], 'bad'), ([5, 6], 'result not set')],
+            [
+                (e['message_ids'], e['error']['message'])
+                for e in result.update['errors']
+            ],
+        )
+
+    def test_split_forward(self):
+        """Пересланные сообщения всех частей собираются в один ответ"""
+        api = BatchAPI(batch_max_size=2)
+
+        async def send_data(method, request_id=None, timeout=None, **kwargs):
+            api.sent.append((method, kwargs))
+            messages = [{'id': i} for i in kwargs['message_ids']]
+            return Result(kwargs, {'@type': 'messages', 'messages': messages})
+
+        api.send_data = send_data
+        result = asyncio.run(api.batch_forward_messages(2, 1, [1, 2, 3]))
+
+        self.assertEqual(2, len(api.sent))
+        self.assertEqual([1, 2, 3], [m['id'] for m in result.update['messages']])
+        self.assertEqual(3, result.update['total_count'])
+
+    def test_error(self):
+        batcher = MessageBatcher(window=0.01)
+
+        async def fail(message_ids):
+            raise RuntimeError('error')
+
+        async def main():
+            return await asyncio.gather(
+                batcher.add(1, [1], fail),
+                batcher.add(1, [2], fail),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    def test_api(self):
+        api = BatchAPI(batch_window=0.01)
+
+        async def main():
+            await asyncio.gather(
+                *(api.batch_view_messages(1, [i]) for i in range(10)),
+                *(api.batch_delete_messages(1, [i]) for i in range(5)),
+                api.batch_forward_messages(2, 1, [2]),
+                api.batch_forward_messages(2, 1, [1]),
+                api.batch_forward_messages(2, 1, [3], send_copy=True),
+            )
+
+        asyncio.run(main())
+
+        methods = [method for method, _ in api.sent]
+        self.assertEqual(
+            ['viewMessages', 'deleteMessages', 'forwardMessages', 'forwardMessages'],
+            methods,
+        )
+        self.assertEqual(list(range(10)), api.sent[0][1]['message_ids'])
+        self.assertEqual([1, 2], api.sent[2][1]['message_ids'])
+        self.assertTrue(api.sent[3][1]['send_copy'])
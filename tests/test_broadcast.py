@@ -0,0 +1,175 @@
+import asyncio
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase
+
+from telegram.api import API
+from telegram.broadcast import FAILED, PENDING, REJECTED, SENT, Broadcast
+from telegram.checkpoint import FileCheckpoint
+from telegram.tracker import SEND_FAILED, SEND_SUCCEEDED, MessageSendTracker
+from telegram.types.text import TextParseMode
+from telegram.utils import Result
+
+
+class BroadcastAPI(API):
+    """API, которое отвечает на sendMessage как tdlib.
+
+    Результат отправки приходит обновлением после ответа на запрос:
+    в чаты, кратные 5, отправка не проходит, в чаты, кратные 7,
+    запрос отклоняется, а в чат 0 результат не приходит вовсе
+    """
+
+    def __init__(self, tracker):
+        super().__init__(SimpleNamespace(store=None, send_tracker=tracker))
+        self.tracker = tracker
+        self.sent = []
+        self.contents = []
+        # chat_id -> исключение, которое выбросит send_data
+        self.errors = {}
+
+    async def send_data(self, method, request_id=None, timeout=None, **kwargs):
+        chat_id = kwargs['chat_id']
+        self.sent.append(chat_id)
+        self.contents.append(kwargs['input_message_content'])
+        if chat_id in self.errors:
+            raise self.errors[chat_id]
+        if chat_id and chat_id % 7 == 0:
+            return Result(kwargs, {'@type': 'error', 'code': 400, 'message': 'no'})
+
+        message = {
+            '@type': 'message',
+            'id': 1,
+            'chat_id': chat_id,
+            'sending_state': {'@type': 'messageSendingStatePending'},
+            'content': kwargs['input_message_content'],
+        }
+        if chat_id:
+            update = {
+                '@type': SEND_FAILED if chat_id % 5 == 0 else SEND_SUCCEEDED,
+                'message': dict(message, id=100 + chat_id, sending_state=None),
+                'old_message_id': 1,
+                'error': {'@type': 'error', 'code': 403, 'message': 'blocked'},
+            }
+            asyncio.get_running_loop().call_soon(self.tracker.process_update, update)
+        return Result(kwargs, message)
+
+
+class BroadcastTestCase(TestCase):
+    """
+    Тест кейс для рассылки сообщений
+    """
+
+    def setUp(self):
+        self.tracker = MessageSendTracker()
+        self.api = BroadcastAPI(self.tracker)
+
+    def test_run(self):
+        broadcast = Broadcast(self.api, 'text', concurrency=3, delivery_timeout=0.05)
+        results = {}
+
+        async def main():
+            async for chat_id, status, _ in broadcast.iter_run(range(11)):
+                results[chat_id] = status
+
+        asyncio.run(main())
+
+        self.assertEqual(PENDING, results[0])
+        self.assertEqual(SENT, results[1])
+        self.assertEqual(FAILED, results[5])
+        self.assertEqual(REJECTED, results[7])
+
+        stats = broadcast.stats.asdict()
+        self.assertEqual(11, stats['total'])
+        self.assertEqual(7, stats['sent'])
+        self.assertEqual(2, stats['failed'])
+        self.assertEqual(1, stats['rejected'])
+        self.assertEqual(1, stats['pending'])
+        self.assertEqual({'blocked': 2, 'no': 1}, stats['errors'])
+        self.assertGreater(stats['throughput'], 0)
+        self.assertEqual(0, len(self.tracker))
+
+    def test_early_update(self):
+        """Результат отправки пришел раньше, чем его начали ждать"""
+        update = {
+            '@type': SEND_SUCCEEDED,
+            'message': {'chat_id': 1, 'id': 2},
+            'old_message_id': 1,
+        }
+        self.tracker.process_update(update)
+
+        async def main():
+            return await self.tracker.wait(
+                {'chat_id': 1, 'id': 1, 'sending_state': {}}, timeout=1
+            )
+
+        self.assertIs(update, asyncio.run(main()))
+
+    def test_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'broadcast.jsonl')
+
+            with FileCheckpoint(path) as checkpoint:
+                broadcast = Broadcast(self.api, 'text', checkpoint=checkpoint)
+                asyncio.run(broadcast.run([1, 2, 5, 7]))
+
+            self.api.sent.clear()
+            with FileCheckpoint(path) as checkpoint:
+                # pending и окончательный статус сжаты в одну строку
+                with open(path, encoding='utf-8') as file:
+                    self.assertEqual(3, len(file.readlines()))
+                self.assertEqual(SENT, checkpoint.get(1))
+                self.assertEqual(FAILED, checkpoint.get(5))
+                self.assertNotIn(7, checkpoint)
+                broadcast = Broadcast(self.api, 'text', checkpoint=checkpoint)
+                stats = asyncio.run(broadcast.run([1, 2, 3, 5, 7]))
+
+        # отклоненный запрос повторяется при следующем запуске
+        self.assertEqual([3, 7], self.api.sent)
+        self.assertEqual(3, stats.skipped)
+        self.assertEqual(1, stats.sent)
+        self.assertEqual(1, stats.rejected)
+
+    def test_request_errors(self):
+        """Исключения запроса не прерывают рассылку"""
+        self.api.errors = {
+            2: TimeoutError('result not set'),
+            3: RuntimeError('too many pending requests'),
+        }
+        broadcast = Broadcast(self.api, 'text')
+
+        results = {}
+
+        async def main():
+            async for chat_id, status, _ in broadcast.iter_run([1, 2, 3, 4]):
+                results[chat_id] = status
+
+        asyncio.run(main())
+
+        self.assertEqual({1: SENT, 2: REJECTED, 3: REJECTED, 4: SENT}, results)
+        self.assertEqual(4, broadcast.stats.total)
+        self.assertEqual(
+            {'result not set': 1, 'too many pending requests': 1},
+            broadcast.stats.errors,
+        )
+
+    def test_prepare(self):
+        """Разметка разбирается один раз для всех чатов"""
+        parsed = []
+
+        def send_data_sync(method, request_id=None, **kwargs):
+            parsed.append(kwargs['text'])
+            update = {'@type': 'formattedText', 'text': 'bold', 'entities': []}
+            return Result(kwargs, update)
+
+        self.api.send_data_sync = send_data_sync
+        broadcast = Broadcast(self.api, '*bold*', parse_mode=TextParseMode.MARKDOWN)
+
+        stats = asyncio.run(broadcast.run([1, 2, 3]))
+
+        self.assertEqual(3, stats.sent)
+        self.assertEqual(['*bold*'], parsed)
+        # один и тот же inputMessageText для всех чатов
+        self.assertEqual(3, len(self.api.contents))
+        self.assertTrue(all(c is self.api.contents[0] for c in self.api.contents))
+        self.assertEqual('bold', self.api.contents[0]['text']['text'])
@@ -0,0 +1,116 @@
+import asyncio
+from unittest import TestCase
+
+from telegram.cache import AsyncTTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class AsyncTTLCacheTestCase(TestCase):
+    """
+    Тест кейс для кеша AsyncTTLCache
+    """
+
+    def setUp(self):
+        self.clock = Clock()
+        self.cache = AsyncTTLCache(ttl=10, max_size=2, clock=self.clock)
+        self.loads = []
+
+    async def load(self, value, delay=0.0):
+        self.loads.append(value)
+        await asyncio.sleep(delay)
+        return value
+
+    def test_ttl(self):
+        self.cache.set('a', 1)
+        self.assertEqual(1, self.cache.get('a'))
+
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(0, len(self.cache))
+
+    def test_lru(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+
+        self.assertIn('a', self.cache)
+        self.assertNotIn('b', self.cache)
+        self.assertIn('c', self.cache)
+
+    def test_collapse_misses(self):
+        async def main():
+            loads = [
+                self.cache.get_or_load('a', lambda: self.load(1, 0.01))
+                for _ in range(5)
+            ]
+            return await asyncio.gather(*loads)
+
+        self.assertEqual([1] * 5, asyncio.run(main()))
+        self.assertEqual([1], self.loads)
+        self.assertEqual(1, self.cache.stats()['misses'])
+
+        asyncio.run(self.cache.get_or_load('a', lambda: self.load(2)))
+        self.assertEqual([1], self.loads)
+
+    def test_cache_if(self):
+        async def main():
+            await self.cache.get_or_load('a', lambda: self.load(1), cache_if=bool)
+            await self.cache.get_or_load('b', lambda: self.load(0), cache_if=bool)
+
+        asyncio.run(main())
+        self.assertIn('a', self.cache)
+        self.assertNotIn('b', self.cache)
+
+    def test_invalidate_while_loading(self):
+        async def main():
+            task = asyncio.ensure_future(
+                self.cache.get_or_load('a', lambda: self.load(1, 0.01))
+            )
+            await asyncio.sleep(0)
+            self.cache.invalidate('a')
+            return await task
+
+        self.assertEqual(1, asyncio.run(main()))
+        self.assertNotIn('a', self.cache)
+
+    def test_error(self):
+        async def fail():
+            raise ValueError('error')
+
+        async def main():
+            return await asyncio.gather(
+                self.cache.get_or_load('a', fail),
+                self.cache.get_or_load('a', fail),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertNotIn('a', self.cache)
+
+    def test_cancel(self):
+        """Отмена первого вызвавшего не отменяет загрузку для остальных"""
+
+        async def main():
+            first = asyncio.ensure_future(
+                self.cache.get_or_load('a', lambda: self.load(1, 0.01))
+            )
+            second = asyncio.ensure_future(
+                self.cache.get_or_load('a', lambda: self.load(2, 0.01))
+            )
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second, first.cancelled()
+
+        self.assertEqual((1, True), asyncio.run(main()))
+        self.assertEqual([1], self.loads)
+        self.assertIn('a', self.cache)
+        self.assertEqual(0, self.cache.stats()['loading'])
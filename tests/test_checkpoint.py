@@ -0,0 +1,47 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from telegram.checkpoint import FileCheckpoint
+
+
+class FileCheckpointTestCase(TestCase):
+    """
+    Тест кейс для чекпоинта в файле
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'checkpoint.jsonl')
+
+    def test_resume(self):
+        with FileCheckpoint(self.path) as checkpoint:
+            checkpoint.add(1)
+            checkpoint.add((2, 3), 'value')
+
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write('{"key": 4')
+
+        checkpoint = FileCheckpoint(self.path)
+        self.assertEqual(2, len(checkpoint))
+        self.assertIn(1, checkpoint)
+        self.assertIn((2, 3), checkpoint)
+        self.assertEqual('value', checkpoint.get((2, 3)))
+        self.assertNotIn(4, checkpoint)
+        checkpoint.close()
+
+    def test_compact(self):
+        """При загрузке остается одна строка с последним значением ключа"""
+        with FileCheckpoint(self.path) as checkpoint:
+            checkpoint.add(1, 'pending')
+            checkpoint.add(2, 'pending')
+            checkpoint.add(1, 'sent')
+
+        checkpoint = FileCheckpoint(self.path)
+        checkpoint.close()
+
+        self.assertEqual('sent', checkpoint.get(1))
+        self.assertEqual('pending', checkpoint.get(2))
+        with open(self.path, encoding='utf-8') as file:
+            self.assertEqual(2, len(file.readlines()))
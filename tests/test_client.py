@@ -0,0 +1,90 @@
+import asyncio
+from unittest import TestCase
+
+from telegram.client import AsyncTelegram
+from tests.fake_tdjson import SignalsMixin
+
+
+class ClientRequestsTestCase(SignalsMixin, TestCase):
+    """
+    Тест кейс для получения ответов на запросы клиента
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.lib.auto_reply = False
+        self.client = AsyncTelegram(self.lib.settings())
+        self.loop = self.client._loop
+
+    def tearDown(self):
+        self.loop.close()
+        super().tearDown()
+
+    def test_resolve(self):
+        """Ответ с @extra.request_id завершает ожидающий запрос"""
+
+        async def main():
+            task = asyncio.ensure_future(
+                self.client.send_data({'@type': 'getMe'}, request_id='me')
+            )
+            await asyncio.sleep(0)
+            self.assertIn('me', self.client._pending_requests)
+
+            await self.client._process_update(
+                {'@type': 'user', 'id': 1, '@extra': {'request_id': 'me'}}
+            )
+            return await task
+
+        result = self.loop.run_until_complete(main())
+
+        self.assertTrue(result.ok_received)
+        self.assertEqual('me', result.id)
+        self.assertEqual(1, result.update['id'])
+        self.assertEqual('getMe', self.lib.requests_of('getMe')[0]['@type'])
+        stats = self.client.pending_requests_stats()
+        self.assertEqual(0, stats['pending'])
+        self.assertEqual(1, stats['resolved'])
+
+    def test_timeout(self):
+        """Запрос без ответа завершается TimeoutError и удаляется из таблицы"""
+        with self.assertRaises(TimeoutError):
+            self.loop.run_until_complete(
+                self.client.send_data({'@type': 'getMe'}, timeout=0.01)
+            )
+
+        stats = self.client.pending_requests_stats()
+        self.assertEqual(0, stats['pending'])
+        self.assertEqual(1, stats['expired'])
+
+    def test_unknown_extra(self):
+        """Ответы на неизвестные или просроченные запросы игнорируются"""
+
+        async def main():
+            future = self.client._register_request('known', timeout=10)
+            await self.client._update_async_result(
+                {'@type': 'ok', '@extra': {'request_id': 'unknown'}}
+            )
+            await self.client._update_async_result({'@type': 'updateOption'})
+            self.assertFalse(future.done())
+
+            await self.client._update_async_result(
+                {'@type': 'ok', '@extra': {'request_id': 'known'}}
+            )
+            return await future
+
+        self.assertEqual('ok', self.loop.run_until_complete(main())['@type'])
+        self.assertEqual(0, self.client.pending_requests_stats()['pending'])
+
+    def test_worker(self):
+        """Ответ из tdlib доходит до запроса через воркер чтения"""
+        self.lib.auto_reply = True
+        self.client.start()
+        try:
+            result = self.loop.run_until_complete(
+                asyncio.wait_for(self.client.send_data({'@type': 'getMe'}), 5)
+            )
+        finally:
+            self.client.is_enabled = False
+            self.client.cancel_tasks()
+
+        self.assertTrue(result.ok_received)
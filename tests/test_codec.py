@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from telegram.codec import (
+    CODECS,
+    JSONCodec,
+    get_codec,
+    has_extra,
+    sniff_client_id,
+    sniff_request_id,
+    sniff_type,
+)
+
+update = {
+    '@type': 'updateNewMessage',
+    'message': {'id': 166121701376, 'text': 'Привет', 'entities': []},
+    '@extra': {'request_id': 'abc'},
+}
+
+
+class CodecTestCase(TestCase):
+    """
+    Тест кейс для JSON кодеков
+    """
+
+    def test_auto(self):
+        """Без имени возвращается один из доступных кодеков"""
+        codec = get_codec()
+
+        self.assertIsInstance(codec, JSONCodec)
+        self.assertIn(codec.name, CODECS)
+
+    def test_unknown(self):
+        """Неизвестное имя кодека"""
+        with self.assertRaises(ValueError):
+            get_codec('unknown')
+
+    def test_roundtrip(self):
+        """Все установленные кодеки работают с bytes"""
+        for name in CODECS:
+            try:
+                codec = get_codec(name)
+            except ImportError:
+                continue
+
+            with self.subTest(codec=name):
+                dumped = codec.dumps(update)
+                self.assertIsInstance(dumped, bytes)
+                self.assertDictEqual(update, codec.loads(dumped))
+                self.assertDictEqual(update, JSONCodec().loads(dumped))
+
+
+class SniffTestCase(TestCase):
+    """
+    Тест кейс для чтения полей из сырого JSON
+    """
+
+    raw = (
+        b'{"@type":"updateOption","name":"a \\"@extra\\":{}",'
+        b'"value":{"@type":"optionValueInteger","value":"1"},'
+        b'"@extra":{"request_id":"abc"},"@client_id":3}'
+    )
+
+    def test_sniff(self):
+        self.assertEqual('updateOption', sniff_type(self.raw))
+        self.assertTrue(has_extra(self.raw))
+        self.assertEqual('abc', sniff_request_id(self.raw))
+        self.assertEqual(3, sniff_client_id(self.raw))
+
+    def test_sniff_missing(self):
+        raw = b'{"@type":"updateUserStatus","user_id":1}'
+
+        self.assertEqual('updateUserStatus', sniff_type(raw))
+        self.assertFalse(has_extra(raw))
+        self.assertIsNone(sniff_request_id(raw))
+        self.assertIsNone(sniff_client_id(raw))
+        self.assertIsNone(sniff_type(b'[]'))
@@ -0,0 +1,52 @@
+import asyncio
+from unittest import TestCase
+
+from telegram.dispatcher import ShardedDispatcher, chat_shard_key
+
+
+class ShardedDispatcherTestCase(TestCase):
+    """
+    Тест кейс для ShardedDispatcher
+    """
+
+    def test_chat_shard_key(self):
+        self.assertEqual(1, chat_shard_key({'chat_id': 1}))
+        self.assertEqual(2, chat_shard_key({'message': {'chat_id': 2}}))
+        self.assertEqual(3, chat_shard_key({'chat': {'id': 3}}))
+        self.assertIsNone(chat_shard_key({'user_id': 4}))
+
+    def test_same_chat_same_lane(self):
+        """Обновления одного чата попадают в одну полосу"""
+        dispatcher = ShardedDispatcher(4)
+        lanes = {dispatcher.lane({'message': {'chat_id': -100123}}) for _ in range(10)}
+
+        self.assertEqual(1, len(lanes))
+
+    def test_ordering(self):
+        """Обновления одного чата обрабатываются по порядку"""
+        dispatcher = ShardedDispatcher(3)
+        processed = []
+
+        async def worker(lane):
+            while True:
+                update = await dispatcher.get(lane)
+                # медленный обработчик не должен нарушать порядок
+                await asyncio.sleep(0.001 * (update['n'] % 3))
+                processed.append((update['chat_id'], update['n']))
+                dispatcher.task_done(lane)
+
+        async def main():
+            workers = [asyncio.ensure_future(worker(i)) for i in range(3)]
+            for n in range(30):
+                update = {'chat_id': n % 5, 'n': n}
+                await dispatcher.put(update, update)
+            self.assertEqual(30, sum(dispatcher.lane_sizes()))
+            await dispatcher.join()
+            [w.cancel() for w in workers]
+
+        asyncio.run(main())
+
+        for chat_id in range(5):
+            numbers = [n for c, n in processed if c == chat_id]
+            self.assertEqual(sorted(numbers), numbers)
+        self.assertEqual([0, 0, 0], dispatcher.lane_sizes())
@@ -0,0 +1,101 @@
+import asyncio
+from unittest import TestCase
+
+from telegram.manager import ClientManager
+from tests.fake_tdjson import SignalsMixin
+
+
+class ClientManagerTestCase(SignalsMixin, TestCase):
+    """
+    Тест кейс для менеджера нескольких клиентов
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.manager = ClientManager(library_path=self.lib.path, backlog_size=3)
+
+    def tearDown(self):
+        self.manager._shutdown_receiving()
+        self.manager.loop.close()
+        super().tearDown()
+
+    def test_login(self):
+        """Клиенты авторизуются по очереди, как в README"""
+        tg1 = self.manager.create_client(self.lib.settings())
+        tg2 = self.manager.create_client(self.lib.settings())
+
+        self.assertTrue(tg1.login(timeout=5))
+        self.assertTrue(tg2.login(timeout=5))
+
+        self.assertEqual(2, len(self.lib.requests_of('checkAuthenticationBotToken')))
+
+    def test_login_timeout(self):
+        """Зависшая авторизация завершается ошибкой, а не блокирует процесс"""
+        self.lib.auto_reply = False
+        tg = self.manager.create_client(self.lib.settings())
+
+        with self.assertRaises(TimeoutError):
+            tg.login(timeout=0)
+
+        self.assertFalse(tg.is_enabled)
+
+    def test_route_backlog(self):
+        """Обновления незапущенного клиента копятся и передаются ему по порядку"""
+        tg1 = self.manager.create_client(self.lib.settings())
+        tg2 = self.manager.create_client(self.lib.settings())
+        client_id = tg2._tdjson.td_client_id
+        received = []
+
+        async def process_update(update):
+            received.append(update['n'])
+
+        tg2._process_update = process_update
+        tg1.is_enabled = True
+
+        async def main():
+            for n in range(5):
+                await self.manager._route_update({'@client_id': client_id, 'n': n})
+            await self.manager._route_update({'@client_id': 100, 'n': -1})
+            self.assertEqual([], received)
+
+            tg2.is_enabled = True
+            self.manager.start_client(tg2)
+            await self.manager._route_update({'@client_id': client_id, 'n': 5})
+            await self.manager._replay_tasks[client_id]
+            await self.manager._route_update({'@client_id': client_id, 'n': 6})
+
+        self.manager.loop.run_until_complete(main())
+
+        # в очереди остаются последние backlog_size обновлений
+        self.assertEqual([3, 4, 5, 6], received)
+        self.assertNotIn(client_id, self.manager._backlogs)
+        self.assertTrue(self.manager._should_decode(b'{"@client_id":%d}' % client_id))
+        self.assertFalse(self.manager._should_decode(b'{"@client_id":100}'))
+
+    def test_backlog_keeps_authorization_state(self):
+        """При переполнении очереди состояние авторизации не отбрасывается"""
+        tg = self.manager.create_client(self.lib.settings())
+        client_id = tg._tdjson.td_client_id
+        state = {'@client_id': client_id, '@type': 'updateAuthorizationState'}
+
+        async def main():
+            await self.manager._route_update(state)
+            for n in range(5):
+                await self.manager._route_update({'@client_id': client_id, 'n': n})
+
+        with self.assertLogs(self.manager.logger, 'WARNING'):
+            self.manager.loop.run_until_complete(main())
+
+        backlog = list(self.manager._backlogs[client_id])
+        self.assertEqual(state, backlog[0])
+        self.assertEqual([3, 4], [update['n'] for update in backlog[1:]])
+
+    def test_detach_fails_pending_requests(self):
+        """Запросы отключенного клиента не зависают"""
+        tg = self.manager.create_client(self.lib.settings())
+        future = tg._pending_requests.register('request', timeout=None)
+
+        self.manager.detach(tg)
+
+        with self.assertRaises(RuntimeError):
+            self.manager.loop.run_until_complete(future)
@@ -0,0 +1,72 @@
+import asyncio
+from unittest import TestCase
+
+from telegram.pending import PendingRequests
+
+
+class PendingRequestsTestCase(TestCase):
+    """
+    Тест кейс для таблицы PendingRequests
+    """
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_resolve(self):
+        """Ответ устанавливается только зарегистрированному запросу"""
+        pending = PendingRequests(self.loop)
+        future = pending.register('a', timeout=10)
+
+        self.assertIn('a', pending)
+        self.assertFalse(pending.resolve('b', {'@type': 'ok'}))
+        self.assertTrue(pending.resolve('a', {'@type': 'ok'}))
+        self.assertEqual({'@type': 'ok'}, self.loop.run_until_complete(future))
+        self.assertEqual(0, len(pending))
+        self.assertFalse(pending.resolve('a', {'@type': 'ok'}))
+
+    def test_expire(self):
+        """Просроченные запросы завершаются TimeoutError и удаляются"""
+        pending = PendingRequests(self.loop)
+        slow = pending.register('slow', timeout=10)
+        fast = pending.register('fast', timeout=0.01)
+
+        with self.assertRaises(TimeoutError):
+            self.loop.run_until_complete(fast)
+
+        self.assertFalse(slow.done())
+        self.assertNotIn('fast', pending)
+        self.assertEqual(1, pending.stats()['expired'])
+        self.assertEqual(1, pending.stats()['pending'])
+
+    def test_cancelled(self):
+        """Отмененный запрос удаляется из таблицы"""
+        pending = PendingRequests(self.loop)
+        pending.register('a', timeout=10).cancel()
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+        self.assertEqual(0, len(pending))
+
+    def test_max_size(self):
+        """Нельзя зарегистрировать больше max_size запросов"""
+        pending = PendingRequests(self.loop, max_size=1)
+        pending.register('a')
+
+        self.assertIs(pending.get('a'), pending.register('a'))
+        with self.assertRaises(RuntimeError):
+            pending.register('b')
+
+    def test_fail_all(self):
+        """fail_all завершает все ожидающие запросы ошибкой"""
+        pending = PendingRequests(self.loop)
+        futures = [pending.register(request_id) for request_id in 'ab']
+
+        self.assertEqual(2, pending.fail_all(RuntimeError('stopped')))
+
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                self.loop.run_until_complete(future)
+        self.assertEqual(0, pending.stats()['pending'])
+        self.assertEqual(0, pending.stats()['deadlines'])
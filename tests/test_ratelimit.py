@@ -0,0 +1,79 @@
+import asyncio
+import time
+from unittest import TestCase
+
+from telegram.ratelimit import RequestScheduler, TokenBucket, parse_retry_after
+from telegram.utils import Result
+
+
+def error(message, code=429):
+    return Result({}, {'@type': 'error', 'code': code, 'message': message})
+
+
+class RateLimitTestCase(TestCase):
+    """
+    Тест кейс для ограничения частоты запросов
+    """
+
+    def test_parse_retry_after(self):
+        result = error('Too Many Requests: retry after 7')
+        self.assertEqual(7, parse_retry_after(result))
+        self.assertEqual(3, parse_retry_after(error('FLOOD_WAIT_3', code=420)))
+        self.assertEqual(1, parse_retry_after(error('Too Many Requests')))
+        self.assertIsNone(parse_retry_after(error('Bad Request', code=400)))
+        self.assertIsNone(parse_retry_after(Result({}, {'@type': 'ok'})))
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        bucket.consume(0)
+        bucket.consume(0)
+        self.assertEqual(0.5, bucket.delay(0))
+        self.assertEqual(0, bucket.delay(0.5))
+
+        bucket.block(10)
+        self.assertEqual(9.5, bucket.delay(0.5))
+        self.assertFalse(bucket.is_idle(5))
+        self.assertTrue(bucket.is_idle(11))
+
+    def test_rate(self):
+        """Запас токенов - на одну секунду, дальше запросы ждут"""
+        scheduler = RequestScheduler(chat_rate=100)
+
+        async def main():
+            start = time.monotonic()
+            for _ in range(110):
+                await scheduler.acquire('sendMessage', 1)
+            await scheduler.acquire('sendMessage', 2)
+            return time.monotonic() - start
+
+        self.assertGreaterEqual(asyncio.run(main()), 0.09)
+        self.assertEqual(2, scheduler.stats()['chat_buckets'])
+
+    def test_retry(self):
+        scheduler = RequestScheduler(max_retries=2)
+        results = [error('retry after 0'), error('retry after 0'), Result({}, {})]
+        calls = []
+
+        async def send():
+            calls.append(1)
+            return results[len(calls) - 1]
+
+        result = asyncio.run(scheduler.send('sendMessage', 1, send))
+
+        self.assertTrue(result.ok_received)
+        self.assertEqual(3, len(calls))
+        self.assertEqual(2, scheduler.stats()['retries'])
+
+    def test_park(self):
+        scheduler = RequestScheduler(max_retries=0)
+
+        async def send():
+            return error('retry after 30')
+
+        result = asyncio.run(scheduler.send('getChats', None, send))
+
+        self.assertTrue(result.error_received)
+        now = time.monotonic()
+        self.assertGreater(scheduler._method_bucket('getChats').delay(now), 29)
+        self.assertEqual(0, scheduler._method_bucket('getMe').delay(now))
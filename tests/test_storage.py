@@ -0,0 +1,122 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import TestCase
+
+from telegram.api import API
+from telegram.storage import EntityStore
+from telegram.types.chat import ChatType
+from telegram.types.user import UserStatus
+from tests.test_types.test_message import message_base
+from tests.test_types.test_user import user_base
+
+chat_base = {
+    '@type': 'chat',
+    'id': 1,
+    'type': {'@type': 'chatTypePrivate', 'user_id': 4111111123},
+    'title': 'title',
+    'unread_count': 0,
+    'positions': [],
+}
+
+
+class EntityStoreTestCase(TestCase):
+    """
+    Тест кейс для хранилища сущностей
+    """
+
+    def setUp(self):
+        self.store = EntityStore()
+
+    def test_full_update(self):
+        self.store.process_update({'@type': 'updateUser', 'user': user_base})
+        user = self.store.get_user(user_base['id'])
+
+        self.assertEqual(UserStatus.ONLINE, user.status)
+
+        raw = {**user_base, 'first_name': 'New'}
+        del raw['last_name']
+        self.store.process_update({'@type': 'updateUser', 'user': raw})
+        self.assertIs(user, self.store.get_user(user_base['id']))
+        self.assertEqual('New', user.first_name)
+        self.assertIsNone(user.last_name)
+        self.assertEqual('User', user.class_type)
+        self.assertEqual(1, self.store.stats()['users'])
+
+    def test_response(self):
+        self.store.process_update(
+            {**chat_base, '@extra': {'request_id': '1'}, '@client_id': 1}
+        )
+        chat = self.store.get_chat(chat_base['id'])
+
+        self.assertEqual(ChatType.PRIVATE, chat.type)
+        self.assertNotIn('@extra', chat.raw)
+
+    def test_partial_update(self):
+        self.store.process_update({'@type': 'updateUser', 'user': user_base})
+        self.store.process_update({'@type': 'updateNewChat', 'chat': chat_base})
+        user = self.store.get_user(user_base['id'])
+        chat = self.store.get_chat(chat_base['id'])
+        profile_photo = user.profile_photo
+
+        self.store.process_update(
+            {
+                '@type': 'updateUserStatus',
+                'user_id': user_base['id'],
+                'status': {'@type': 'userStatusOffline', 'was_online': 1},
+            }
+        )
+        self.assertEqual(UserStatus.OFFLINE, user.status)
+        self.assertEqual('userStatusOffline', user.raw['status']['@type'])
+        self.assertEqual(profile_photo, user.profile_photo)
+
+        self.store.process_update(
+            {'@type': 'updateChatTitle', 'chat_id': chat_base['id'], 'title': 'New'}
+        )
+        self.store.process_update(
+            {
+                '@type': 'updateChatLastMessage',
+                'chat_id': chat_base['id'],
+                'last_message': message_base,
+                'positions': [],
+            }
+        )
+        self.assertEqual('New', chat.title)
+        self.assertEqual(ChatType.PRIVATE, chat.type)
+        self.assertEqual(message_base['id'], chat.last_message.id)
+
+        self.store.process_update(
+            {'@type': 'updateChatTitle', 'chat_id': 2, 'title': 'Unknown'}
+        )
+        self.assertIsNone(self.store.get_chat(2))
+
+    def test_chat_position(self):
+        self.store.process_update({'@type': 'updateNewChat', 'chat': chat_base})
+        chat = self.store.get_chat(chat_base['id'])
+        position = {
+            '@type': 'chatPosition',
+            'list': {'@type': 'chatListMain'},
+            'order': '100',
+        }
+
+        update = {'@type': 'updateChatPosition', 'chat_id': chat_base['id']}
+        self.store.process_update({**update, 'position': position})
+        self.assertEqual([position], chat.raw['positions'])
+
+        self.store.process_update({**update, 'position': {**position, 'order': '0'}})
+        self.assertEqual([], chat.raw['positions'])
+
+
+class StoredAPITestCase(TestCase):
+    """
+    Тест кейс для запросов, которые обслуживаются из хранилища
+    """
+
+    def test_get_user(self):
+        store = EntityStore()
+        store.process_update({'@type': 'updateUser', 'user': user_base})
+        api = API(SimpleNamespace(store=store))
+
+        result = asyncio.run(api.get_user(user_base['id']))
+
+        self.assertTrue(result.is_valid())
+        self.assertEqual(user_base['id'], result.update['id'])
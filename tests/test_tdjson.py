@@ -0,0 +1,109 @@
+import asyncio
+import json
+from unittest import TestCase
+
+from telegram.codec import sniff_type
+from telegram.tdjson import TDJsonReceiver
+
+
+class FakeTDJson:
+    """Отдает заранее заданные обновления, затем None"""
+
+    def __init__(self, updates):
+        self.updates = [
+            update if isinstance(update, bytes) else json.dumps(update).encode()
+            for update in updates
+        ]
+
+    def receive_raw(self, timeout=1.0):
+        if self.updates:
+            return self.updates.pop(0)
+        return None
+
+    def decode(self, raw):
+        return json.loads(raw)
+
+
+class TDJsonReceiverTestCase(TestCase):
+    """
+    Тест кейс для потока TDJsonReceiver
+    """
+
+    def _receive(self, updates, expected_count, **kwargs):
+        loop = asyncio.new_event_loop()
+        batches = []
+
+        async def callback(batch):
+            batches.append(batch)
+            if sum(map(len, batches)) == expected_count:
+                loop.stop()
+
+        receiver = TDJsonReceiver(
+            FakeTDJson(updates), loop, callback, timeout=0.01, **kwargs
+        )
+        receiver.start()
+        loop.call_later(5, loop.stop)
+        loop.run_forever()
+        receiver.stop()
+        loop.close()
+        return batches
+
+    def test_batches(self):
+        """Обновления передаются в loop пачками не больше batch_size"""
+        updates = [{'@type': 'update', 'n': i} for i in range(5)]
+
+        batches = self._receive(updates, 5, batch_size=2)
+
+        self.assertEqual([2, 2, 1], [len(batch) for batch in batches])
+        self.assertEqual(updates, [update for batch in batches for update in batch])
+
+    def test_update_filter(self):
+        """Отфильтрованные обновления не декодируются"""
+        updates = [
+            {'@type': 'updateUserStatus', 'user_id': 1},
+            {'@type': 'updateNewMessage', 'message': {}},
+            {'@type': 'updateOption', 'name': 'version'},
+        ]
+
+        batches = self._receive(
+            updates,
+            1,
+            update_filter=lambda raw: sniff_type(raw) == 'updateNewMessage',
+        )
+
+        self.assertEqual([[updates[1]]], batches)
+
+    def test_decode_error(self):
+        """Обновление, которое не удалось декодировать, пропускается"""
+        updates = [{'@type': 'updateOption', 'n': 1}, b'{broken', {'@type': 'ok'}]
+
+        with self.assertLogs('telegram.tdjson', 'ERROR'):
+            batches = self._receive(updates, 2)
+
+        self.assertEqual(
+            [updates[0], updates[2]], [update for batch in batches for update in batch]
+        )
+
+    def test_backpressure(self):
+        """Поток не читает tdlib, пока loop не примет предыдущую пачку"""
+        tdjson = FakeTDJson([{'@type': 'update', 'n': i} for i in range(10)])
+
+        async def main():
+            queue = asyncio.Queue(1)
+            receiver = TDJsonReceiver(
+                tdjson, asyncio.get_running_loop(), queue.put, batch_size=1
+            )
+            receiver.start()
+            await asyncio.sleep(0.1)
+            left = len(tdjson.updates)
+
+            received = [await queue.get() for _ in range(10)]
+            receiver.stop()
+            return receiver, left, received
+
+        receiver, left, received = asyncio.run(main())
+
+        # одна пачка в очереди, одна ждет места в ней
+        self.assertEqual(8, left)
+        self.assertEqual(list(range(10)), [batch[0]['n'] for batch in received])
+        self.assertFalse(receiver.is_alive())
@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from telegram.types.compact import CompactObject, compact_class
+from telegram.types.message import Message, MessageSenderType
+from tests.test_types.test_message import message_base
+from tests.test_types.test_message_content.test_message_text import content_message_text
+
+
+class CompactTestCase(TestCase):
+    """
+    Тест кейс для компактного представления объектов
+    """
+
+    def test_compact(self):
+        message = Message({**message_base, 'content': content_message_text})
+        compact = message.compact()
+
+        self.assertIsInstance(compact, CompactObject)
+        self.assertIs(compact_class(Message), compact.__class__)
+        self.assertFalse(hasattr(compact, '__dict__'))
+        self.assertIs(message.raw, compact.raw)
+        self.assertEqual(message.id, compact.id)
+        self.assertEqual(MessageSenderType.USER, compact.sender.type)
+        self.assertEqual(message.content.text.text, compact.content.text.text)
+        self.assertEqual(
+            len(message.content.text.entities), len(compact.content.text.entities)
+        )
+        self.assertIsInstance(compact.content.text.entities[0], CompactObject)
+        self.assertEqual(compact, message.compact())
+
+    def test_drop_raw(self):
+        compact = Message(message_base).compact(drop_raw=True)
+
+        self.assertIsNone(compact.raw)
+        self.assertIsNone(compact.sender.raw)
+        self.assertEqual(message_base['id'], compact.id)
+        self.assertEqual('Message', compact.asdict()['class_type'])
+        self.assertEqual(message_base['id'], compact.asdict()['id'])
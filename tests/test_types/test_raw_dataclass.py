@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from enum import Enum
 from unittest import TestCase
 
-from telegram.types.base import RawDataclass
+from telegram.types.base import RawDataclass, _LazyField
 
 
 class TestEnum(int, Enum):
@@ -18,6 +19,21 @@ class TestRawDataclass(RawDataclass):
     value: str = None
 
 
+@dataclass
+class TestNestedRawDataclass(RawDataclass):
+    nested: TestRawDataclass = None
+    value: str = None
+
+
+@dataclass
+class TestGetterRawDataclass(TestRawDataclass):
+    values: list = field(default=None, metadata={'getter': lambda v: v[::-1]})
+    assigned: str = None
+
+    def _assign_raw(self):
+        self.assigned = 'assigned'
+
+
 class RawDataclassTestCase(TestCase):
     """
     Тест кейс для объекта RawDataclass
@@ -38,3 +54,80 @@ class RawDataclassTestCase(TestCase):
         }
 
         self.assertDictEqual(expected, result)
+
+    def test_asdict_nested(self):
+        raw = {'nested': {'enum_value': 2, 'value': 'nested'}, 'value': 'test'}
+        instance = TestNestedRawDataclass(raw)
+
+        result = instance.asdict()
+        self.assertIs(raw, result['raw'])
+        self.assertIs(raw['nested'], result['nested']['raw'])
+        self.assertEqual('TestEnum.B', result['nested']['enum_value'])
+
+        result = instance.asdict(include_raw=False, nested_raw=False)
+        expected = {
+            'class_type': 'TestNestedRawDataclass',
+            'nested': {
+                'class_type': 'TestRawDataclass',
+                'enum_value': 'TestEnum.B',
+                'value': 'nested',
+            },
+            'value': 'test',
+        }
+        self.assertDictEqual(expected, result)
+
+    def test_to_bytes(self):
+        instance = TestNestedRawDataclass({'nested': {'value': 'nested'}})
+
+        for codec in ('json', None):
+            with self.subTest(codec=codec):
+                self.assertEqual(
+                    instance.asdict(include_raw=False, nested_raw=False),
+                    json.loads(instance.to_bytes(codec=codec)),
+                )
+
+        self.assertIn(b'"raw"', instance.to_bytes(include_raw=True))
+
+    def test_decode_plan(self):
+        """План декодирования составляется один раз на класс"""
+        instance = TestGetterRawDataclass(
+            {'value': 'test', 'values': [1, 2], 'assigned': 'raw', 'unknown': 1}
+        )
+
+        self.assertEqual('test', instance.value)
+        self.assertEqual([2, 1], instance.values)
+        self.assertEqual('assigned', instance.assigned)
+        self.assertIsNone(instance.enum_value)
+        self.assertFalse(hasattr(instance, 'unknown'))
+
+        plan = TestGetterRawDataclass._get_decode_plan()
+        self.assertIs(plan, TestGetterRawDataclass._get_decode_plan())
+        self.assertEqual(
+            ['enum_value', 'value', 'values', 'assigned'], [item[0] for item in plan]
+        )
+        self.assertIsNot(plan, TestRawDataclass._get_decode_plan())
+
+    def test_lazy(self):
+        """Вложенные объекты декодируются при первом обращении"""
+        raw = {'nested': {'value': 'nested'}, 'value': 'test'}
+
+        TestNestedRawDataclass({})
+        self.assertNotIsInstance(
+            TestNestedRawDataclass.__dict__.get('nested'), _LazyField
+        )
+
+        TestNestedRawDataclass.lazy = True
+        try:
+            instance = TestNestedRawDataclass(raw)
+        finally:
+            TestNestedRawDataclass.lazy = False
+
+        self.assertNotIn('nested', instance.__dict__)
+        self.assertEqual('test', instance.value)
+
+        nested = instance.nested
+        self.assertIsInstance(nested, TestRawDataclass)
+        self.assertEqual('nested', nested.value)
+        self.assertIs(nested, instance.nested)
+        self.assertEqual(TestNestedRawDataclass(raw), instance)
+        self.assertIsNone(TestNestedRawDataclass({}).nested)
@@ -0,0 +1,132 @@
+from unittest import TestCase
+
+from telegram.types import td_api
+from telegram.types.base import TDObject
+from telegram.types.generator import (
+    DEFAULT_OUTPUT,
+    DEFAULT_SCHEMA,
+    Generator,
+    generate,
+    parse_schema,
+)
+from tests.test_types.test_message import message_base
+from tests.test_types.test_message_content.test_message_text import content_message_text
+
+schema_text = """
+double ? = Double;
+int64 = Int64;
+boolFalse = Bool;
+
+//@description A photo size @type Thumbnail type @width Photo width
+//-in pixels
+photoSize type:string width:int32 = PhotoSize;
+
+//@class ChatType @description Describes the type of a chat
+
+//@description An ordinary chat with a user @user_id User identifier
+chatTypePrivate user_id:int53 = ChatType;
+
+//@description A secret chat @secret_chat_id Secret chat identifier
+chatTypeSecret secret_chat_id:int64 sizes:vector<photoSize> = ChatType;
+
+---functions---
+
+//@description Returns the current user
+getMe = User;
+"""
+
+
+class GeneratorTestCase(TestCase):
+    """
+    Тест кейс для генератора типов из td_api.tl
+    """
+
+    def test_parse_schema(self):
+        schema = parse_schema(schema_text)
+
+        self.assertEqual(
+            ['photoSize', 'chatTypePrivate', 'chatTypeSecret'],
+            list(schema.constructors),
+        )
+        self.assertEqual(['ChatType'], list(schema.classes))
+        self.assertEqual(
+            ['chatTypePrivate', 'chatTypeSecret'],
+            [c.name for c in schema.classes['ChatType'].constructors],
+        )
+        self.assertEqual('PhotoSize', schema.single['PhotoSize'].class_name)
+        self.assertEqual('A photo size', schema.constructors['photoSize'].description)
+        self.assertEqual(
+            ['secret_chat_id', 'sizes'],
+            [f.name for f in schema.constructors['chatTypeSecret'].fields],
+        )
+
+    def test_generate(self):
+        namespace = {}
+        exec(Generator(parse_schema(schema_text)).render(), namespace)
+
+        chat_type = namespace['ChatType'](
+            {
+                '@type': 'chatTypeSecret',
+                'secret_chat_id': '10',
+                'sizes': [{'@type': 'photoSize', 'type': 's', 'width': 90}],
+            }
+        )
+        self.assertIsInstance(chat_type, namespace['ChatTypeSecret'])
+        self.assertEqual(10, chat_type.secret_chat_id)
+        self.assertIsInstance(chat_type.sizes[0], namespace['PhotoSize'])
+        self.assertEqual(90, chat_type.sizes[0].width)
+
+    def test_generated_module_is_up_to_date(self):
+        self.assertEqual(
+            generate(DEFAULT_SCHEMA), DEFAULT_OUTPUT.read_text(encoding='utf-8')
+        )
+
+
+class TDApiTestCase(TestCase):
+    """
+    Тест кейс для сгенерированных типов
+    """
+
+    def test_update_new_message(self):
+        message = {**message_base, 'content': content_message_text}
+        update = td_api.Update({'@type': 'updateNewMessage', 'message': message})
+
+        self.assertIsInstance(update, td_api.UpdateNewMessage)
+        self.assertEqual('UpdateNewMessage', update.class_type)
+        self.assertIsInstance(update.message, td_api.Message)
+        self.assertEqual(message['id'], update.message.id)
+        self.assertIsInstance(update.message.content, td_api.MessageText)
+        self.assertEqual(
+            content_message_text['text']['text'], update.message.content.text.text
+        )
+        self.assertIs(message, update.message.raw)
+
+    def test_init(self):
+        user = td_api.User({'@type': 'user', 'id': 1, 'first_name': 'name'})
+
+        self.assertIsInstance(user, TDObject)
+        self.assertEqual(1, user.id)
+        self.assertEqual('name', user.first_name)
+        self.assertEqual(user, td_api.User.from_raw(user.raw))
+
+    def test_merge_raw(self):
+        chat = td_api.Chat.from_raw(
+            {
+                '@type': 'chat',
+                'id': 1,
+                'title': 'old',
+                'type': {'@type': 'chatTypePrivate', 'user_id': 2},
+            }
+        )
+        chat_type = chat.type
+
+        chat.merge_raw({'title': 'new'})
+
+        self.assertEqual('new', chat.title)
+        self.assertEqual('new', chat.raw['title'])
+        self.assertIsInstance(chat.type, td_api.ChatTypePrivate)
+        self.assertEqual(chat_type, chat.type)
+
+    def test_default(self):
+        update = td_api.Update({'@type': 'updateUnknown'})
+        self.assertEqual('RawDataclass', update.class_type)
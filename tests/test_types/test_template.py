@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from telegram.types.base import build_variables
+from telegram.types.message import Message
+from telegram.types.template import Template, compile_template, format_template
+from tests.test_types.test_message import message_base
+from tests.test_types.test_message_content.test_message_text import content_message_text
+
+
+class BuildVariablesTestCase(TestCase):
+    """
+    Тест кейс для build_variables
+    """
+
+    def test_build_variables(self):
+        variables = build_variables(Message)
+
+        self.assertIn('message.sender.id', variables)
+        self.assertIn('message.content.text.text', variables)
+        self.assertEqual(len(variables), len(set(variables)))
+        self.assertEqual(
+            ['msg' + v[len('message') :] for v in variables],
+            build_variables(Message, 'msg'),
+        )
+
+    def test_cached_copy(self):
+        variables = build_variables(Message)
+        variables.clear()
+        self.assertTrue(build_variables(Message))
+
+
+class TemplateTestCase(TestCase):
+    """
+    Тест кейс для скомпилированных шаблонов
+    """
+
+    def setUp(self):
+        self.message = Message({**message_base, 'content': content_message_text})
+
+    def test_format(self):
+        templates = [
+            'from {message.sender.id} in {message.chat_id}',
+            '{message.content.text.text!r:>40}',
+            '{message.content.text.entities[0].type}',
+            '{message.raw[content][@type]}',
+            '{{escaped}} {message.id:x}',
+            'no fields',
+        ]
+        for template in templates:
+            with self.subTest(template=template):
+                self.assertEqual(
+                    template.format(message=self.message),
+                    Template(template).format(message=self.message),
+                )
+
+    def test_compile_template(self):
+        template = '{message.id}'
+        self.assertIs(compile_template(template), compile_template(template))
+        self.assertEqual(
+            str(self.message.id), format_template(template, message=self.message)
+        )
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Template('{} {0}')
+
+        with self.assertRaises(AttributeError):
+            Template('{message.unknown}').format(message=self.message)
+
+    def test_validate(self):
+        template = Template('{message.sender.id} {message.unknown} {user.id}')
+        self.assertEqual(['message.unknown'], template.validate(Message))
@@ -10,6 +10,8 @@ from telegram.types.update import (
     Update,
     UpdateAuthorizationState,
     UpdateFile,
+    UpdateMessageSendFailed,
+    UpdateMessageSendSucceeded,
     UpdateNewChat,
     UpdateNewMessage,
     UpdateSupergroup,
@@ -226,3 +228,29 @@ class UpdateTestCase(TestCase):
         self.assertIsInstance(update, UpdateSupergroup)
         self.assertEqual(1, update.supergroup.id)
         self.assertEqual('test-username', update.supergroup.username)
+
+    def test_update_message_send_result(self):
+        """Обновления updateMessageSendSucceeded и updateMessageSendFailed"""
+        message = {'@type': 'message', 'id': 10, 'chat_id': 1}
+
+        succeeded = Update(
+            {
+                '@type': 'updateMessageSendSucceeded',
+                'message': message,
+                'old_message_id': 5,
+            }
+        )
+        failed = Update(
+            {
+                '@type': 'updateMessageSendFailed',
+                'message': message,
+                'old_message_id': 5,
+                'error': {'@type': 'error', 'code': 403, 'message': 'blocked'},
+            }
+        )
+
+        self.assertIsInstance(succeeded, UpdateMessageSendSucceeded)
+        self.assertEqual(10, succeeded.message.id)
+        self.assertEqual(5, succeeded.old_message_id)
+        self.assertIsInstance(failed, UpdateMessageSendFailed)
+        self.assertEqual('blocked', failed.error['message'])
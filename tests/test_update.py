@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from telegram.client import AsyncTelegram
+from telegram.types.update import UpdateNewMessage
+from tests.fake_tdjson import SignalsMixin
+
+
+class PreparedUpdateTestCase(SignalsMixin, TestCase):
+    """
+    Тест кейс для общего декодирования обновления обработчиками
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client = AsyncTelegram(self.lib.settings())
+        self.loop = self.client._loop
+
+    def tearDown(self):
+        self.loop.close()
+        super().tearDown()
+
+    def test_decode_once(self):
+        """Обновление декодируется один раз для всех обработчиков,
+        raw обработчик получает исходный словарь
+        """
+        prepared = []
+        received = []
+
+        def prepare_update(update):
+            prepared.append(update)
+            return AsyncTelegram._prepare_update(self.client, update)
+
+        async def first(update):
+            received.append(('first', update))
+
+        def second(update):
+            received.append(('second', update))
+
+        def raw(update):
+            received.append(('raw', update))
+
+        self.client._prepare_update = prepare_update
+        self.client.add_message_handler(first)
+        self.client.add_message_handler(second)
+        self.client.add_message_handler(raw, raw=True)
+        update = {'@type': 'updateNewMessage', 'message': {'id': 1, 'chat_id': 2}}
+
+        async def main():
+            await self.client._process_update(update)
+            queue = self.client.handler_workers_queue
+            while not queue.empty():
+                handler, prepared_update = queue.get_nowait()
+                await self.client._call_handler(handler, prepared_update)
+
+        self.loop.run_until_complete(main())
+
+        self.assertEqual([update], prepared)
+        handlers = dict(received)
+        self.assertEqual(['first', 'second', 'raw'], [name for name, _ in received])
+        self.assertIsInstance(handlers['first'], UpdateNewMessage)
+        self.assertIs(handlers['first'], handlers['second'])
+        self.assertIs(update, handlers['raw'])
+
+    def test_raw_only(self):
+        """Если все обработчики raw, обновление не декодируется"""
+        prepared = []
+        self.client._prepare_update = prepared.append
+        self.client.add_message_handler(lambda update: None, raw=True)
+
+        async def main():
+            await self.client._process_update({'@type': 'updateNewMessage'})
+            handler, update = self.client.handler_workers_queue.get_nowait()
+            await self.client._call_handler(handler, update)
+
+        self.loop.run_until_complete(main())
+
+        self.assertEqual([], prepared)
+
+    def test_raw_per_update_type(self):
+        """Одна функция может быть raw обработчиком только для одного типа"""
+        received = []
+        self.client.add_message_handler(received.append, raw=True)
+        self.client.add_update_handler('updateMessageEdited', received.append)
+        message = {'@type': 'updateNewMessage', 'message': {'id': 1, 'chat_id': 2}}
+        edited = {'@type': 'updateMessageEdited', 'chat_id': 2, 'message_id': 1}
+
+        async def main():
+            for update in (message, edited):
+                await self.client._process_update(update)
+                handler, prepared = self.client.handler_workers_queue.get_nowait()
+                await self.client._call_handler(handler, prepared)
+
+        self.loop.run_until_complete(main())
+
+        self.assertIs(message, received[0])
+        self.assertIsNot(edited, received[1])
+        self.assertNotIsInstance(received[1], dict)